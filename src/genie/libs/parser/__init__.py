@@ -22,4 +22,10 @@ from .base import tcl_invoke_ats_cmd,\
 from genie import abstract
 abstract.declare_package(__name__)
 
+# Parser telemetry, off unless configured in the environment
+import os as _os
+if _os.environ.get('GENIE_LIBS_PARSER_TELEMETRY'):
+    from .utils import telemetry as _telemetry
+    _telemetry.enable_from_environment()
+
 
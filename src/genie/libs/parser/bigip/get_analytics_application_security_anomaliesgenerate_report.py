@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security-anomalies/generate-report' resources
 # =============================================
@@ -16,7 +19,7 @@ class AnalyticsApplicationsecurityanomaliesGeneratereportSchema(MetaParser):
 
 
 class AnalyticsApplicationsecurityanomaliesGeneratereport(
-    AnalyticsApplicationsecurityanomaliesGeneratereportSchema
+    AnalyticsApplicationsecurityanomaliesGeneratereportSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/application-security-anomalies/generate-report
     """
@@ -24,14 +27,3 @@ class AnalyticsApplicationsecurityanomaliesGeneratereport(
     cli_command = (
         "/mgmt/tm/analytics/application-security-anomalies/generate-report"
     )
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security-anomalies/report-results' resources
 # =============================================
@@ -16,7 +19,7 @@ class AnalyticsApplicationsecurityanomaliesReportresultsSchema(MetaParser):
 
 
 class AnalyticsApplicationsecurityanomaliesReportresults(
-    AnalyticsApplicationsecurityanomaliesReportresultsSchema
+    AnalyticsApplicationsecurityanomaliesReportresultsSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/application-security-anomalies/report-results
     """
@@ -24,14 +27,3 @@ class AnalyticsApplicationsecurityanomaliesReportresults(
     cli_command = (
         "/mgmt/tm/analytics/application-security-anomalies/report-results"
     )
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security-incidents/generate-report' resources
 # =============================================
@@ -16,7 +19,7 @@ class AnalyticsApplicationsecurityincidentsGeneratereportSchema(MetaParser):
 
 
 class AnalyticsApplicationsecurityincidentsGeneratereport(
-    AnalyticsApplicationsecurityincidentsGeneratereportSchema
+    AnalyticsApplicationsecurityincidentsGeneratereportSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/application-security-incidents/generate-report
     """
@@ -24,14 +27,3 @@ class AnalyticsApplicationsecurityincidentsGeneratereport(
     cli_command = (
         "/mgmt/tm/analytics/application-security-incidents/generate-report"
     )
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security-incidents/report-results' resources
 # =============================================
@@ -16,7 +19,7 @@ class AnalyticsApplicationsecurityincidentsReportresultsSchema(MetaParser):
 
 
 class AnalyticsApplicationsecurityincidentsReportresults(
-    AnalyticsApplicationsecurityincidentsReportresultsSchema
+    AnalyticsApplicationsecurityincidentsReportresultsSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/application-security-incidents/report-results
     """
@@ -24,14 +27,3 @@ class AnalyticsApplicationsecurityincidentsReportresults(
     cli_command = (
         "/mgmt/tm/analytics/application-security-incidents/report-results"
     )
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
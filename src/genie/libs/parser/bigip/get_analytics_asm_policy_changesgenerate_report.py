@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/asm-policy-changes/generate-report' resources
 # =============================================
@@ -16,20 +19,9 @@ class AnalyticsAsmpolicychangesGeneratereportSchema(MetaParser):
 
 
 class AnalyticsAsmpolicychangesGeneratereport(
-    AnalyticsAsmpolicychangesGeneratereportSchema
+    AnalyticsAsmpolicychangesGeneratereportSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/asm-policy-changes/generate-report
     """
 
     cli_command = "/mgmt/tm/analytics/asm-policy-changes/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
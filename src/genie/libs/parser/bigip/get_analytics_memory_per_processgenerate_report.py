@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/memory-per-process/generate-report' resources
 # =============================================
@@ -16,20 +19,9 @@ class AnalyticsMemoryperprocessGeneratereportSchema(MetaParser):
 
 
 class AnalyticsMemoryperprocessGeneratereport(
-    AnalyticsMemoryperprocessGeneratereportSchema
+    AnalyticsMemoryperprocessGeneratereportSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/analytics/memory-per-process/generate-report
     """
 
     cli_command = "/mgmt/tm/analytics/memory-per-process/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/analytics/vcmp/generate-report' resources
 # =============================================
@@ -15,19 +18,8 @@ class AnalyticsVcmpGeneratereportSchema(MetaParser):
     schema = {}
 
 
-class AnalyticsVcmpGeneratereport(AnalyticsVcmpGeneratereportSchema):
+class AnalyticsVcmpGeneratereport(AnalyticsVcmpGeneratereportSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/analytics/vcmp/generate-report
     """
 
     cli_command = "/mgmt/tm/analytics/vcmp/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
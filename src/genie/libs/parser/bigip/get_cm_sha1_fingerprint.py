@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/cm/sha1-fingerprint' resources
 # =============================================
@@ -15,19 +18,8 @@ class CmSha1fingerprintSchema(MetaParser):
     schema = {}
 
 
-class CmSha1fingerprint(CmSha1fingerprintSchema):
+class CmSha1fingerprint(CmSha1fingerprintSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/cm/sha1-fingerprint
     """
 
     cli_command = "/mgmt/tm/cm/sha1-fingerprint"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/file/apm/epsec/epsec-file-object' resources
 # =============================================
@@ -15,19 +18,8 @@ class FileApmEpsecfileobjectSchema(MetaParser):
     schema = {}
 
 
-class FileApmEpsecfileobject(FileApmEpsecfileobjectSchema):
+class FileApmEpsecfileobject(FileApmEpsecfileobjectSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/file/apm/epsec/epsec-file-object
     """
 
     cli_command = "/mgmt/tm/file/apm/epsec/epsec-file-object"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
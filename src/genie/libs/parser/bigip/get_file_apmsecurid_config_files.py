@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/file/apm/aaa/securid-config-files' resources
 # =============================================
@@ -15,19 +18,8 @@ class FileApmSecuridconfigfilesSchema(MetaParser):
     schema = {}
 
 
-class FileApmSecuridconfigfiles(FileApmSecuridconfigfilesSchema):
+class FileApmSecuridconfigfiles(FileApmSecuridconfigfilesSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/file/apm/aaa/securid-config-files
     """
 
     cli_command = "/mgmt/tm/file/apm/aaa/securid-config-files"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/gtm/distributed-app' resources
 # =============================================
@@ -15,19 +18,8 @@ class GtmDistributedappSchema(MetaParser):
     schema = {}
 
 
-class GtmDistributedapp(GtmDistributedappSchema):
+class GtmDistributedapp(GtmDistributedappSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/gtm/distributed-app
     """
 
     cli_command = "/mgmt/tm/gtm/distributed-app"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/gtm/global-settings/load-balancing' resources
 # =============================================
@@ -15,19 +18,8 @@ class GtmGlobalsettingsLoadbalancingSchema(MetaParser):
     schema = {}
 
 
-class GtmGlobalsettingsLoadbalancing(GtmGlobalsettingsLoadbalancingSchema):
+class GtmGlobalsettingsLoadbalancing(GtmGlobalsettingsLoadbalancingSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/gtm/global-settings/load-balancing
     """
 
     cli_command = "/mgmt/tm/gtm/global-settings/load-balancing"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
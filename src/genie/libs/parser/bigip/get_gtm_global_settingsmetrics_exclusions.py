@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/gtm/global-settings/metrics-exclusions' resources
 # =============================================
@@ -16,20 +19,9 @@ class GtmGlobalsettingsMetricsexclusionsSchema(MetaParser):
 
 
 class GtmGlobalsettingsMetricsexclusions(
-    GtmGlobalsettingsMetricsexclusionsSchema
+    GtmGlobalsettingsMetricsexclusionsSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/gtm/global-settings/metrics-exclusions
     """
 
     cli_command = "/mgmt/tm/gtm/global-settings/metrics-exclusions"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/gtm/monitor/bigip' resources
 # =============================================
@@ -15,19 +18,8 @@ class GtmMonitorBigipSchema(MetaParser):
     schema = {}
 
 
-class GtmMonitorBigip(GtmMonitorBigipSchema):
+class GtmMonitorBigip(GtmMonitorBigipSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/gtm/monitor/bigip
     """
 
     cli_command = "/mgmt/tm/gtm/monitor/bigip"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/gtm/wideip/cname' resources
 # =============================================
@@ -15,19 +18,8 @@ class GtmWideipCnameSchema(MetaParser):
     schema = {}
 
 
-class GtmWideipCname(GtmWideipCnameSchema):
+class GtmWideipCname(GtmWideipCnameSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/gtm/wideip/cname
     """
 
     cli_command = "/mgmt/tm/gtm/wideip/cname"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
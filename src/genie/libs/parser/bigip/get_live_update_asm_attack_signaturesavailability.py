@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/asm-attack-signatures/availability' resources
 # =============================================
@@ -16,20 +19,9 @@ class Live_updateAsmattacksignaturesAvailabilitySchema(MetaParser):
 
 
 class Live_updateAsmattacksignaturesAvailability(
-    Live_updateAsmattacksignaturesAvailabilitySchema
+    Live_updateAsmattacksignaturesAvailabilitySchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/live-update/asm-attack-signatures/availability
     """
 
     cli_command = "/mgmt/tm/live-update/asm-attack-signatures/availability"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/bot-signatures' resources
 # =============================================
@@ -15,19 +18,8 @@ class Live_updateBotsignaturesSchema(MetaParser):
     schema = {}
 
 
-class Live_updateBotsignatures(Live_updateBotsignaturesSchema):
+class Live_updateBotsignatures(Live_updateBotsignaturesSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/live-update/bot-signatures
     """
 
     cli_command = "/mgmt/tm/live-update/bot-signatures"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
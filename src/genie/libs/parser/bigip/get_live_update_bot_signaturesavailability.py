@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/bot-signatures/availability' resources
 # =============================================
@@ -16,20 +19,9 @@ class Live_updateBotsignaturesAvailabilitySchema(MetaParser):
 
 
 class Live_updateBotsignaturesAvailability(
-    Live_updateBotsignaturesAvailabilitySchema
+    Live_updateBotsignaturesAvailabilitySchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/live-update/bot-signatures/availability
     """
 
     cli_command = "/mgmt/tm/live-update/bot-signatures/availability"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/browser-challenges' resources
 # =============================================
@@ -15,19 +18,8 @@ class Live_updateBrowserchallengesSchema(MetaParser):
     schema = {}
 
 
-class Live_updateBrowserchallenges(Live_updateBrowserchallengesSchema):
+class Live_updateBrowserchallenges(Live_updateBrowserchallengesSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/live-update/browser-challenges
     """
 
     cli_command = "/mgmt/tm/live-update/browser-challenges"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
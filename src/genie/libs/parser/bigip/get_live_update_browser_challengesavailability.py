@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/browser-challenges/availability' resources
 # =============================================
@@ -16,20 +19,9 @@ class Live_updateBrowserchallengesAvailabilitySchema(MetaParser):
 
 
 class Live_updateBrowserchallengesAvailability(
-    Live_updateBrowserchallengesAvailabilitySchema
+    Live_updateBrowserchallengesAvailabilitySchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/live-update/browser-challenges/availability
     """
 
     cli_command = "/mgmt/tm/live-update/browser-challenges/availability"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/threat-campaigns' resources
 # =============================================
@@ -15,19 +18,8 @@ class Live_updateThreatcampaignsSchema(MetaParser):
     schema = {}
 
 
-class Live_updateThreatcampaigns(Live_updateThreatcampaignsSchema):
+class Live_updateThreatcampaigns(Live_updateThreatcampaignsSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/live-update/threat-campaigns
     """
 
     cli_command = "/mgmt/tm/live-update/threat-campaigns"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/live-update/threat-campaigns/update-files' resources
 # =============================================
@@ -16,20 +19,9 @@ class Live_updateThreatcampaignsUpdatefilesSchema(MetaParser):
 
 
 class Live_updateThreatcampaignsUpdatefiles(
-    Live_updateThreatcampaignsUpdatefilesSchema
+    Live_updateThreatcampaignsUpdatefilesSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/live-update/threat-campaigns/update-files
     """
 
     cli_command = "/mgmt/tm/live-update/threat-campaigns/update-files"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/auth/ocsp-responder' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmAuthOcspresponderSchema(MetaParser):
     schema = {}
 
 
-class LtmAuthOcspresponder(LtmAuthOcspresponderSchema):
+class LtmAuthOcspresponder(LtmAuthOcspresponderSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/auth/ocsp-responder
     """
 
     cli_command = "/mgmt/tm/ltm/auth/ocsp-responder"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
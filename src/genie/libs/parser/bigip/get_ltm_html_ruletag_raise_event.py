@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/html-rule/tag-raise-event' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmHtmlruleTagraiseeventSchema(MetaParser):
     schema = {}
 
 
-class LtmHtmlruleTagraiseevent(LtmHtmlruleTagraiseeventSchema):
+class LtmHtmlruleTagraiseevent(LtmHtmlruleTagraiseeventSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/html-rule/tag-raise-event
     """
 
     cli_command = "/mgmt/tm/ltm/html-rule/tag-raise-event"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
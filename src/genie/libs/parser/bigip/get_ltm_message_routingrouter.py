@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/message-routing/mqtt/profile/router' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmMessageroutingRouterSchema(MetaParser):
     schema = {}
 
 
-class LtmMessageroutingRouter(LtmMessageroutingRouterSchema):
+class LtmMessageroutingRouter(LtmMessageroutingRouterSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/message-routing/mqtt/profile/router
     """
 
     cli_command = "/mgmt/tm/ltm/message-routing/mqtt/profile/router"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
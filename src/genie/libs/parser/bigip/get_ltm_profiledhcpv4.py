@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/profile/dhcpv4' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmProfileDhcpv4Schema(MetaParser):
     schema = {}
 
 
-class LtmProfileDhcpv4(LtmProfileDhcpv4Schema):
+class LtmProfileDhcpv4(LtmProfileDhcpv4Schema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/profile/dhcpv4
     """
 
     cli_command = "/mgmt/tm/ltm/profile/dhcpv4"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/profile/fastl4' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmProfileFastl4Schema(MetaParser):
     schema = {}
 
 
-class LtmProfileFastl4(LtmProfileFastl4Schema):
+class LtmProfileFastl4(LtmProfileFastl4Schema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/profile/fastl4
     """
 
     cli_command = "/mgmt/tm/ltm/profile/fastl4"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/ltm/profile/service' resources
 # =============================================
@@ -15,19 +18,8 @@ class LtmProfileServiceSchema(MetaParser):
     schema = {}
 
 
-class LtmProfileService(LtmProfileServiceSchema):
+class LtmProfileService(LtmProfileServiceSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/ltm/profile/service
     """
 
     cli_command = "/mgmt/tm/ltm/profile/service"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/net/cmetrics' resources
 # =============================================
@@ -15,19 +18,8 @@ class NetCmetricsSchema(MetaParser):
     schema = {}
 
 
-class NetCmetrics(NetCmetricsSchema):
+class NetCmetrics(NetCmetricsSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/net/cmetrics
     """
 
     cli_command = "/mgmt/tm/net/cmetrics"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/net/cos/map-8021p' resources
 # =============================================
@@ -15,19 +18,8 @@ class NetCosMap8021pSchema(MetaParser):
     schema = {}
 
 
-class NetCosMap8021p(NetCosMap8021pSchema):
+class NetCosMap8021p(NetCosMap8021pSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/net/cos/map-8021p
     """
 
     cli_command = "/mgmt/tm/net/cos/map-8021p"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
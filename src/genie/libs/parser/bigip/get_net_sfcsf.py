@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/net/sfc/sf' resources
 # =============================================
@@ -15,19 +18,8 @@ class NetSfcSfSchema(MetaParser):
     schema = {}
 
 
-class NetSfcSf(NetSfcSfSchema):
+class NetSfcSf(NetSfcSfSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/net/sfc/sf
     """
 
     cli_command = "/mgmt/tm/net/sfc/sf"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
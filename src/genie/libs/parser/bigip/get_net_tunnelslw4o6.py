@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/net/tunnels/lw4o6' resources
 # =============================================
@@ -15,19 +18,8 @@ class NetTunnelsLw4o6Schema(MetaParser):
     schema = {}
 
 
-class NetTunnelsLw4o6(NetTunnelsLw4o6Schema):
+class NetTunnelsLw4o6(NetTunnelsLw4o6Schema, BigipCollection):
     """ To F5 resource for /mgmt/tm/net/tunnels/lw4o6
     """
 
     cli_command = "/mgmt/tm/net/tunnels/lw4o6"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/security/firewall/management-ip-rules' resources
 # =============================================
@@ -16,20 +19,9 @@ class SecurityFirewallManagementiprulesSchema(MetaParser):
 
 
 class SecurityFirewallManagementiprules(
-    SecurityFirewallManagementiprulesSchema
+    SecurityFirewallManagementiprulesSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/security/firewall/management-ip-rules
     """
 
     cli_command = "/mgmt/tm/security/firewall/management-ip-rules"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/security/firewall/uuid-default-autogenerate' resources
 # =============================================
@@ -16,20 +19,9 @@ class SecurityFirewallUuiddefaultautogenerateSchema(MetaParser):
 
 
 class SecurityFirewallUuiddefaultautogenerate(
-    SecurityFirewallUuiddefaultautogenerateSchema
+    SecurityFirewallUuiddefaultautogenerateSchema, BigipCollection
 ):
     """ To F5 resource for /mgmt/tm/security/firewall/uuid-default-autogenerate
     """
 
     cli_command = "/mgmt/tm/security/firewall/uuid-default-autogenerate"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
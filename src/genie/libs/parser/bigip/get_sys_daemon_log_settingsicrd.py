@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/daemon-log-settings/icrd' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysDaemonlogsettingsIcrdSchema(MetaParser):
     schema = {}
 
 
-class SysDaemonlogsettingsIcrd(SysDaemonlogsettingsIcrdSchema):
+class SysDaemonlogsettingsIcrd(SysDaemonlogsettingsIcrdSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/daemon-log-settings/icrd
     """
 
     cli_command = "/mgmt/tm/sys/daemon-log-settings/icrd"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/daemon-log-settings/mcpd' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysDaemonlogsettingsMcpdSchema(MetaParser):
     schema = {}
 
 
-class SysDaemonlogsettingsMcpd(SysDaemonlogsettingsMcpdSchema):
+class SysDaemonlogsettingsMcpd(SysDaemonlogsettingsMcpdSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/daemon-log-settings/mcpd
     """
 
     cli_command = "/mgmt/tm/sys/daemon-log-settings/mcpd"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
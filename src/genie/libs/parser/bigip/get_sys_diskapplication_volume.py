@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/disk/application-volume' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysDiskApplicationvolumeSchema(MetaParser):
     schema = {}
 
 
-class SysDiskApplicationvolume(SysDiskApplicationvolumeSchema):
+class SysDiskApplicationvolume(SysDiskApplicationvolumeSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/disk/application-volume
     """
 
     cli_command = "/mgmt/tm/sys/disk/application-volume"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
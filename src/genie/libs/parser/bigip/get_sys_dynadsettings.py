@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/dynad/settings' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysDynadSettingsSchema(MetaParser):
     schema = {}
 
 
-class SysDynadSettings(SysDynadSettingsSchema):
+class SysDynadSettings(SysDynadSettingsSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/dynad/settings
     """
 
     cli_command = "/mgmt/tm/sys/dynad/settings"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/ecm' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysEcmSchema(MetaParser):
     schema = {}
 
 
-class SysEcm(SysEcmSchema):
+class SysEcm(SysEcmSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/ecm
     """
 
     cli_command = "/mgmt/tm/sys/ecm"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
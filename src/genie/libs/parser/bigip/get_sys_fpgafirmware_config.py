@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/fpga/firmware-config' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysFpgaFirmwareconfigSchema(MetaParser):
     schema = {}
 
 
-class SysFpgaFirmwareconfig(SysFpgaFirmwareconfigSchema):
+class SysFpgaFirmwareconfig(SysFpgaFirmwareconfigSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/fpga/firmware-config
     """
 
     cli_command = "/mgmt/tm/sys/fpga/firmware-config"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/fpga/turboflex-profile' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysFpgaTurboflexprofileSchema(MetaParser):
     schema = {}
 
 
-class SysFpgaTurboflexprofile(SysFpgaTurboflexprofileSchema):
+class SysFpgaTurboflexprofile(SysFpgaTurboflexprofileSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/fpga/turboflex-profile
     """
 
     cli_command = "/mgmt/tm/sys/fpga/turboflex-profile"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/hardware' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysHardwareSchema(MetaParser):
     schema = {}
 
 
-class SysHardware(SysHardwareSchema):
+class SysHardware(SysHardwareSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/hardware
     """
 
     cli_command = "/mgmt/tm/sys/hardware"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/icall/handler' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysIcallHandlerSchema(MetaParser):
     schema = {}
 
 
-class SysIcallHandler(SysIcallHandlerSchema):
+class SysIcallHandler(SysIcallHandlerSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/icall/handler
     """
 
     cli_command = "/mgmt/tm/sys/icall/handler"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
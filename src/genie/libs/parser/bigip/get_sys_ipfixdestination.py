@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/ipfix/destination' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysIpfixDestinationSchema(MetaParser):
     schema = {}
 
 
-class SysIpfixDestination(SysIpfixDestinationSchema):
+class SysIpfixDestination(SysIpfixDestinationSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/ipfix/destination
     """
 
     cli_command = "/mgmt/tm/sys/ipfix/destination"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
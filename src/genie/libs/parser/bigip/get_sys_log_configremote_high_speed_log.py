@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/log-config/destination/remote-high-speed-log' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysLogconfigRemotehighspeedlogSchema(MetaParser):
     schema = {}
 
 
-class SysLogconfigRemotehighspeedlog(SysLogconfigRemotehighspeedlogSchema):
+class SysLogconfigRemotehighspeedlog(SysLogconfigRemotehighspeedlogSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/log-config/destination/remote-high-speed-log
     """
 
     cli_command = "/mgmt/tm/sys/log-config/destination/remote-high-speed-log"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/management-proxy-config' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysManagementproxyconfigSchema(MetaParser):
     schema = {}
 
 
-class SysManagementproxyconfig(SysManagementproxyconfigSchema):
+class SysManagementproxyconfig(SysManagementproxyconfigSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/management-proxy-config
     """
 
     cli_command = "/mgmt/tm/sys/management-proxy-config"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/sflow/data-source/interface' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysSflowInterfaceSchema(MetaParser):
     schema = {}
 
 
-class SysSflowInterface(SysSflowInterfaceSchema):
+class SysSflowInterface(SysSflowInterfaceSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/sflow/data-source/interface
     """
 
     cli_command = "/mgmt/tm/sys/sflow/data-source/interface"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
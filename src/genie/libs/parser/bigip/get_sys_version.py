@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/sys/version' resources
 # =============================================
@@ -15,19 +18,8 @@ class SysVersionSchema(MetaParser):
     schema = {}
 
 
-class SysVersion(SysVersionSchema):
+class SysVersion(SysVersionSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/sys/version
     """
 
     cli_command = "/mgmt/tm/sys/version"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
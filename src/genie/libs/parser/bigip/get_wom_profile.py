@@ -5,6 +5,9 @@ from collections import defaultdict
 # Metaparser
 from genie.metaparser import MetaParser
 
+# Parser utils
+from genie.libs.parser.utils.bigip_collection import BigipCollection
+
 # =============================================
 # Collection for '/mgmt/tm/wom/profile' resources
 # =============================================
@@ -15,19 +18,8 @@ class WomProfileSchema(MetaParser):
     schema = {}
 
 
-class WomProfile(WomProfileSchema):
+class WomProfile(WomProfileSchema, BigipCollection):
     """ To F5 resource for /mgmt/tm/wom/profile
     """
 
     cli_command = "/mgmt/tm/wom/profile"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -12,6 +12,7 @@ import re
 import unittest
 from genie import parsergen
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from pyats.log.utils import banner
 
@@ -90,36 +91,62 @@ class Interface(InterfaceSchema):
     cli_command = ['/dna/intent/api/v1/interface', 
                    '/dna/intent/api/v1/interface/{interface}']
 
+    # Interfaces fetched by request
+    page_size = 500
+    # Fetched by pages: aparse() awaits each request as it is issued
+    paged = True
+    # Concurrent requests fetching the hostnames of the devices
+    max_workers = 8
+
     def cli(self,interface="", output=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
+                pages = [self.device.get(cmd).json()['response']]
             else:
-                cmd = self.cli_command[0]
-            out = self.device.get(cmd).json()['response']
-
+                pages = self._pages(self.cli_command[0])
         else:
-            out = output
-
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+            pages = [output]
 
         result_dict={}
         id_to_hostname = {}
-        for intf_dict in out:
-            device_id = intf_dict['deviceId']
-            if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
-
-            host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
-            # remove None values
-            host_info[intf_dict['portName']] = {k: v 
-                                                for k, v in intf_dict.items() 
-                                                if v is not None}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # the pages are parsed as they are fetched, the hostnames of the
+            # devices not seen yet fetched concurrently, once each
+            for out in pages:
+                device_ids = [device_id for device_id in dict.fromkeys(
+                                  intf_dict['deviceId'] for intf_dict in out)
+                              if device_id not in id_to_hostname]
+                # submitted rather than map()ed: all of them are requested
+                # even when one fails, aparse() collects them together
+                futures = [executor.submit(self._hostname, device_id)
+                           for device_id in device_ids]
+                id_to_hostname.update(zip(
+                    device_ids, [future.result() for future in futures]))
+
+                for intf_dict in out:
+                    hostname = id_to_hostname[intf_dict['deviceId']]
+                    host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
+                    # remove None values
+                    host_info[intf_dict['portName']] = {k: v
+                                                        for k, v in intf_dict.items()
+                                                        if v is not None}
 
         return result_dict
+
+    def _pages(self, cmd):
+        """Yield the pages of the interfaces, page_size interfaces each"""
+        offset = 1
+        while True:
+            page = self.device.get('{cmd}?offset={offset}&limit={limit}'.format(
+                cmd=cmd, offset=offset, limit=self.page_size)).json()['response']
+            yield page
+            if len(page) < self.page_size:
+                return
+            offset += len(page)
+
+    def _hostname(self, device_id):
+        """Return the hostname of a device by its id"""
+        # get device by id
+        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+        return self.device.get(cmd.format(device_id=device_id)).json()['response']['hostname']
@@ -214,6 +214,45 @@ class TestInterfaceRest(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_pages(self):
+        interfaces = [dict(self.golden_response_output1['response'][0],
+                           portName='GigabitEthernet0/0/{}'.format(index),
+                           deviceId='device{}'.format(index % 3))
+                      for index in range(5)]
+        requests = []
+
+        def get(cmd):
+            requests.append(cmd)
+            response = Mock(spec=Response)
+            if cmd.startswith('/dna/intent/api/v1/network-device/'):
+                device_id = cmd.rsplit('/', 1)[1]
+                response.json.return_value = {
+                    'response': {'hostname': 'host-' + device_id}}
+            else:
+                offset = int(cmd.split('offset=')[1].split('&')[0])
+                response.json.return_value = {
+                    'response': interfaces[offset - 1:offset + 1]}
+            return response
+
+        obj = Interface(device=Mock(get=Mock(side_effect=get)))
+        obj.page_size = 2
+        parsed_output = obj.parse()
+
+        self.assertEqual(sorted(parsed_output['hostname']),
+                         ['host-device0', 'host-device1', 'host-device2'])
+        self.assertEqual(
+            sorted(parsed_output['hostname']['host-device1']['interfaces']),
+            ['GigabitEthernet0/0/1', 'GigabitEthernet0/0/4'])
+        # 3 pages, and each device fetched once
+        self.assertEqual(sorted(requests), [
+            '/dna/intent/api/v1/interface?offset=1&limit=2',
+            '/dna/intent/api/v1/interface?offset=3&limit=2',
+            '/dna/intent/api/v1/interface?offset=5&limit=2',
+            '/dna/intent/api/v1/network-device/device0',
+            '/dna/intent/api/v1/network-device/device1',
+            '/dna/intent/api/v1/network-device/device2',
+        ])
+
 
 if __name__ == '__main__':
     unittest.main()
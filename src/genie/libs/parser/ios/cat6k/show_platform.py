@@ -477,12 +477,23 @@ class Dir(DirSchema):
             out = output
 
         dir_dict = {}
+
+        # dir
+        p1 = re.compile(
+            r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
+
+        # filename, index, permissions, size and last_modified_date
+        p2 = re.compile(r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) '
+                        r'+(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) '
+                        r'+(?P<filename>.+)$')
+
+        # bytes_total and bytes_free
+        p3 = re.compile(
+            r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # dir
-            p1 = re.compile(
-                r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
             m = p1.match(line)
             if m:
                 dir1 = m.groupdict()['dir']
@@ -493,10 +504,6 @@ class Dir(DirSchema):
                     dir_dict['dir']['dir'] = dir1
                 continue
 
-            # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) '
-                            r'+(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) '
-                            r'+(?P<filename>.+)$')
             m = p2.match(line)
             if m:
                 filename = m.groupdict()['filename']
@@ -509,9 +516,6 @@ class Dir(DirSchema):
                     dir_file_dict[k] = m.groupdict()[k]
                 continue
 
-            # bytes_total and bytes_free
-            p3 = re.compile(
-                r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
             m = p3.match(line)
             if m:
                 dir_dict['dir'][dir1]['bytes_total'] = m.groupdict()['bytes_total']
@@ -51,11 +51,19 @@ class ShowArchive(ShowArchiveSchema):
         # initial variables
         ret_dict = {}
 
+        # The maximum archive configurations allowed is 10.
+        p1 = re.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
+
+        # There are currently 1 archive configurations saved.
+        p2 = re.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
+
+        # 1        bootflash:uncfgIntfgigabitethernet0_0_0-Sep-27-15-04-18.414-PDT-0 <- Most Recent
+        p3 = re.compile(r'^(?P<num>[0-9]+) +'
+                         '(?P<file>[\w\:\-\.]+)(?P<recent> +\<\- +Most +Recent)?$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # The maximum archive configurations allowed is 10.
-            p1 = re.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
             m = p1.match(line)
             if m:
                 if 'archive' not in ret_dict:
@@ -63,8 +71,6 @@ class ShowArchive(ShowArchiveSchema):
                 ret_dict['archive']['max_archive_configurations'] = int(m.groupdict()['max'])
                 continue
 
-            # There are currently 1 archive configurations saved.
-            p2 = re.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
             m = p2.match(line)
             if m:
                 if 'archive' not in ret_dict:
@@ -73,9 +79,6 @@ class ShowArchive(ShowArchiveSchema):
                 ret_dict['archive']['total'] = int(m.groupdict()['total'])
                 continue
 
-            # 1        bootflash:uncfgIntfgigabitethernet0_0_0-Sep-27-15-04-18.414-PDT-0 <- Most Recent
-            p3 = re.compile(r'^(?P<num>[0-9]+) +'
-                             '(?P<file>[\w\:\-\.]+)(?P<recent> +\<\- +Most +Recent)?$')
             m = p3.match(line)
             if m:
                 num = m.groupdict()['num']
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 # =============================================
@@ -64,7 +65,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(ShowArpSchema, ColumnarParser):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -73,6 +74,12 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    columnar_tables = {
+        'neighbors': ('interfaces', '{interface}', 'ipv4', 'neighbors',
+                      '{ip}'),
+        'global_static_table': ('global_static_table', '{ip_address}'),
+    }
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
         if output is None:
             if not cmd:
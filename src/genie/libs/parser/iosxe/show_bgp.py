@@ -115,6 +115,13 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.stream import RecordStream, iter_lines
+from genie.libs.parser.utils.compact import compact_output
+from genie.libs.parser.utils.subcommand import subcommand_cache, \
+                                               subcommand_parse, \
+                                               subcommand_execute
+from genie.libs.parser.utils.running_config import config_section
 
 
 # ============================================
@@ -212,7 +219,51 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
         # Init dictionary
         route_dict = {}
-        af_dict = {}
+        for _ in self._iter_parse(output.splitlines(), address_family, vrf,
+                                  route_dict, RecordStream()):
+            pass
+        return route_dict
+
+    def parse_iter(self, output_stream, address_family='', vrf=''):
+        '''Parse the output line by line, without keeping the routes
+
+        Args:
+            output_stream (`str`, file object or iterable of `str`): output
+            address_family (`str`): address family of the routes when the
+                                    output does not show it
+            vrf (`str`): vrf of the routes when the output does not show it
+
+        Yields:
+            tuple: ((vrf, address_family, prefix), prefix dict), one for
+                   each prefix once all its paths are parsed
+        '''
+        return self._iter_parse(iter_lines(output_stream), address_family,
+                                vrf, {}, RecordStream(streaming=True))
+
+    def parse_compact(self, output_stream, address_family='', vrf='',
+                      validate=True):
+        '''Parse the output into compact route tables
+
+        Same output as cli(), the routes of each address family being stored
+        in a CompactTable, a read-only dict of a fraction of the memory.
+
+        Args:
+            output_stream (`str`, file object or iterable of `str`): output
+            address_family (`str`): address family of the routes when the
+                                    output does not show it
+            vrf (`str`): vrf of the routes when the output does not show it
+            validate (`bool`): validate each route against the schema
+        '''
+        route_dict = {}
+        records = self._iter_parse(iter_lines(output_stream), address_family,
+                                   vrf, route_dict,
+                                   RecordStream(streaming=True))
+        return compact_output(
+            records, route_dict, ('vrf', 0, 'address_family', 1, 'routes'),
+            schema=self.schema if validate else None)
+
+    def _iter_parse(self, lines, address_family, vrf, route_dict, records):
+
         if not vrf:
             vrf = 'default'
         if address_family:
@@ -254,6 +305,10 @@ class ShowBgpSuperParser(ShowBgpSchema):
                           r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
                           r'(?P<termination>[\s\S]+)$')
 
+        # 200 33299 51178 47751 {27016} e
+        p3_3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
+                          r' +(?P<origin_codes>(i|e|\?|\|))$')
+
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
         # *>   10.1.1.0/24     0.0.0.0                  0         32768 ?
@@ -270,6 +325,10 @@ class ShowBgpSuperParser(ShowBgpSchema):
                         r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
                         r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
 
+        # 200 33299 51178 47751 {27016} e
+        p4_1 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
+                          r' +(?P<origin_codes_inner>(i|e|\?|\|))$')
+
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
         p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
                         r' +(?P<af_private_import_to_address_family>[\s\S]+),'
@@ -283,289 +342,291 @@ class ShowBgpSuperParser(ShowBgpSchema):
                         r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                         r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
-        for line in output.splitlines():
-            line = line.rstrip()
+        # Set by the line handlers, used by the following lines
+        new_address_family = None
+        next_hop = None
 
-            # For address family: IPv4 Unicast
-            m = p1.match(line)
-            if m:
-                address_family = str(m.groupdict()['address_family']).lower()
-                original_address_family = address_family
-                continue
+        dispatcher = LineDispatcher()
 
-            # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
-            if m:
-                bgp_table_version = int(m.groupdict()['bgp_table_version'])
-                local_router_id = str(m.groupdict()['local_router_id'])
-                continue
-
-            #     Network          Next Hop            Metric LocPrf Weight Path
-            # *>   [5][65535:1][0][24][10.1.1.0]/17
-            # *>  100:2051:VEID-2:Blk-1/136
-            m = p3_1.match(line)
-            if m:
-                # Get keys
-                if m.groupdict()['status_codes']:
-                    status_codes = m.groupdict()['status_codes']
-                path_type = ''
-                if m.groupdict()['path_type']:
-                    path_type = str(m.groupdict()['path_type'])
-                if path_type:
-                    status_codes = status_codes + path_type
-                else:
-                    status_codes = status_codes.rstrip()
-
-                if m.groupdict()['prefix']:
-                    prefix = str(m.groupdict()['prefix'])
-                index = 0
-                continue
-
-            #     Network          Next Hop            Metric LocPrf Weight Path
-            # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-            #                      0.0.0.0                  0         32768 ?
-            # *>                    0.0.0.0                 0         32768 ?
-            # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p3_2.match(line)
-            if m:
-                # Get keys
-                path_type = ""
-                path_info = ""
-                if m.groupdict()['status_codes']:
-                    status_codes = m.groupdict()['status_codes']
-                if m.groupdict()['path_type']:
-                    path_type = m.groupdict()['path_type']
-
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-
-                if path_type:
-                    status_codes = status_codes + path_type
-                else:
-                    status_codes = status_codes.rstrip()
-
-                if m.groupdict()['termination']:
-                    termination = m.groupdict()['termination']
-                    m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
-                                    ' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
-                    if m3 and m3.groupdict()['path']:
-                        path_info = m3.groupdict()['path']
-                    if m3 and m3.groupdict()['origin_codes']:
-                        origin_codes_info = m3.groupdict()['origin_codes']
-
-                if m.groupdict()['metric']:
-                    metric = int(m.groupdict()['metric'])
-                if m.groupdict()['weight']:
-                    weight = int(m.groupdict()['weight'])
-                if m.groupdict()['local_prf']:
-                    localpref = int(m.groupdict()['local_prf'])
-
-                index += 1
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-
-                # Set keys
-                if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
-
-                if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
-                if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
-                if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
-                if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
-
-                if path_info:
-                     af_dict['routes'][prefix]['index'][index]['path'] = path_info
-                if origin_codes_info:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
-
-                continue
-
-            # Network            Next Hop            Metric     LocPrf     Weight Path
-            # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
-            # *>   10.1.1.0/24     0.0.0.0                  0         32768 ?
-            # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-            # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            # *>  100:2051:VEID-2:Blk-1/136
-            m = p4.match(line)
-            if m:
-                path_type = ""
-                path_data = ""
-                if m.groupdict()['prefix']:
-                    prefix = m.groupdict()['prefix']
-                    index = 1
-
-                # Get keys
-                if m.groupdict()['status_codes']:
-                    status_codes = m.groupdict()['status_codes']
-                if m.groupdict()['path_type']:
-                    path_type = m.groupdict()['path_type']
-
-                if path_type:
-                    status_codes = status_codes + path_type
-                else:
-                    status_codes = status_codes.rstrip()
-
-                if m.groupdict()['path']:
-                    path_1 = m.groupdict()['path']
-                    m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
-                                    ' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
-                    if m3:
-                        path_data = m3.groupdict()['path_inner']
-                        origin_codes_data = m3.groupdict()['origin_codes_inner']
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-
-                if m.groupdict()['metric']:
-                    metric = int(m.groupdict()['metric'])
-                if m.groupdict()['weight']:
-                    weight = int(m.groupdict()['weight'])
-                if m.groupdict()['local_prf']:
-                    localpref = int(m.groupdict()['local_prf'])
-
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
+        # For address family: IPv4 Unicast
+        @dispatcher.rule(p1)
+        def handle_p1(m):
+            nonlocal address_family, original_address_family
+            address_family = str(m.groupdict()['address_family']).lower()
+            original_address_family = address_family
 
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
+        # BGP table version is 25, Local Router ID is 10.186.101.1
+        @dispatcher.rule(p2)
+        def handle_p2(m):
+            nonlocal bgp_table_version, local_router_id
+            bgp_table_version = int(m.groupdict()['bgp_table_version'])
+            local_router_id = str(m.groupdict()['local_router_id'])
 
-                # Set keys
-                if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
-                if path_data:
-                    af_dict['routes'][prefix]['index'][index]['path'] = path_data
-                if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
-                if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
-                if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
-                if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
-                if origin_codes_data:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
-                continue
+        #     Network          Next Hop            Metric LocPrf Weight Path
+        # *>   [5][65535:1][0][24][10.1.1.0]/17
+        # *>  100:2051:VEID-2:Blk-1/136
+        @dispatcher.rule(p3_1)
+        def handle_p3_1(m):
+            nonlocal index, prefix, status_codes
+            # Get keys
+            if m.groupdict()['status_codes']:
+                status_codes = m.groupdict()['status_codes']
+            path_type = ''
+            if m.groupdict()['path_type']:
+                path_type = str(m.groupdict()['path_type'])
+            if path_type:
+                status_codes = status_codes + path_type
+            else:
+                status_codes = status_codes.rstrip()
 
-            # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-            m = p5.match(line)
-            if m:
-                af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
-                pfx_count = int(m.groupdict()['pfx_count'])
-                pfx_limit = int(m.groupdict()['pfx_limit'])
+            if m.groupdict()['prefix']:
+                prefix = str(m.groupdict()['prefix'])
+            index = 0
 
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
+        #     Network          Next Hop            Metric LocPrf Weight Path
+        # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
+        #                      0.0.0.0                  0         32768 ?
+        # *>                    0.0.0.0                 0         32768 ?
+        # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
+        @dispatcher.rule(p3_2)
+        def handle_p3_2(m):
+            nonlocal index, localpref, metric, next_hop, origin_codes_info, \
+                status_codes, weight
+            # Get keys
+            path_type = ""
+            path_info = ""
+            if m.groupdict()['status_codes']:
+                status_codes = m.groupdict()['status_codes']
+            if m.groupdict()['path_type']:
+                path_type = m.groupdict()['path_type']
+
+            if m.groupdict()['next_hop']:
+                next_hop = m.groupdict()['next_hop']
+
+            if path_type:
+                status_codes = status_codes + path_type
+            else:
+                status_codes = status_codes.rstrip()
+
+            if m.groupdict()['termination']:
+                termination = m.groupdict()['termination']
+                m3 = p3_3.match(termination)
+                if m3 and m3.groupdict()['path']:
+                    path_info = m3.groupdict()['path']
+                if m3 and m3.groupdict()['origin_codes']:
+                    origin_codes_info = m3.groupdict()['origin_codes']
+
+            if m.groupdict()['metric']:
+                metric = int(m.groupdict()['metric'])
+            if m.groupdict()['weight']:
+                weight = int(m.groupdict()['weight'])
+            if m.groupdict()['local_prf']:
+                localpref = int(m.groupdict()['local_prf'])
+
+            index += 1
+            # Init dict
+            if 'vrf' not in route_dict:
+                route_dict['vrf'] = {}
+            if vrf not in route_dict['vrf']:
+                route_dict['vrf'][vrf] = {}
+            if 'address_family' not in route_dict['vrf'][vrf]:
+                route_dict['vrf'][vrf]['address_family'] = {}
+
+            if address_family not in route_dict['vrf'][vrf]['address_family']:
+                route_dict['vrf'][vrf]['address_family'][address_family] = {}
+
+            # Set af_dict
+            af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
+
+            if 'routes' not in af_dict:
+                af_dict['routes'] = {}
+            records.start(af_dict['routes'], prefix,
+                          (vrf, address_family, prefix))
+            if 'index' not in af_dict['routes'][prefix]:
+                af_dict['routes'][prefix]['index'] = {}
+            if index not in af_dict['routes'][prefix]['index']:
+                af_dict['routes'][prefix]['index'][index] = {}
+            if index not in af_dict['routes'][prefix]['index']:
+                af_dict['routes'][prefix]['index'][index] = {}
+
+            # Set keys
+            if status_codes:
+                af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+
+            if m.groupdict()['next_hop']:
+                af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+            if m.groupdict()['local_prf']:
+                af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+            if m.groupdict()['weight']:
+                af_dict['routes'][prefix]['index'][index]['weight'] = weight
+            if m.groupdict()['metric']:
+                af_dict['routes'][prefix]['index'][index]['metric'] = metric
+
+            if path_info:
+                 af_dict['routes'][prefix]['index'][index]['path'] = path_info
+            if origin_codes_info:
+                af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
 
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
+        # Network            Next Hop            Metric     LocPrf     Weight Path
+        # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
+        # *>   10.1.1.0/24     0.0.0.0                  0         32768 ?
+        # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
+        # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
+        # *>  100:2051:VEID-2:Blk-1/136
+        @dispatcher.rule(p4)
+        def handle_p4(m):
+            nonlocal index, localpref, metric, next_hop, origin_codes_data, \
+                prefix, status_codes, weight
+            path_type = ""
+            path_data = ""
+            if m.groupdict()['prefix']:
+                prefix = m.groupdict()['prefix']
+                index = 1
 
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['af_private_import_to_address_family'] = af_private_import_to_address_family
+            # Get keys
+            if m.groupdict()['status_codes']:
+                status_codes = m.groupdict()['status_codes']
+            if m.groupdict()['path_type']:
+                path_type = m.groupdict()['path_type']
 
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['pfx_count'] = pfx_count
+            if path_type:
+                status_codes = status_codes + path_type
+            else:
+                status_codes = status_codes.rstrip()
+
+            if m.groupdict()['path']:
+                path_1 = m.groupdict()['path']
+                m3 = p4_1.match(path_1)
+                if m3:
+                    path_data = m3.groupdict()['path_inner']
+                    origin_codes_data = m3.groupdict()['origin_codes_inner']
+            if m.groupdict()['next_hop']:
+                next_hop = m.groupdict()['next_hop']
+
+            if m.groupdict()['metric']:
+                metric = int(m.groupdict()['metric'])
+            if m.groupdict()['weight']:
+                weight = int(m.groupdict()['weight'])
+            if m.groupdict()['local_prf']:
+                localpref = int(m.groupdict()['local_prf'])
+
+            # Init dict
+            if 'vrf' not in route_dict:
+                route_dict['vrf'] = {}
+            if vrf not in route_dict['vrf']:
+                route_dict['vrf'][vrf] = {}
+            if 'address_family' not in route_dict['vrf'][vrf]:
+                route_dict['vrf'][vrf]['address_family'] = {}
+
+            if address_family not in route_dict['vrf'][vrf]['address_family']:
+                route_dict['vrf'][vrf]['address_family'][address_family] = {}
+
+            # Set af_dict
+            af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
+            if 'routes' not in af_dict:
+                af_dict['routes'] = {}
+            records.start(af_dict['routes'], prefix,
+                          (vrf, address_family, prefix))
+            if 'index' not in af_dict['routes'][prefix]:
+                af_dict['routes'][prefix]['index'] = {}
+            if index not in af_dict['routes'][prefix]['index']:
+                af_dict['routes'][prefix]['index'][index] = {}
+            if index not in af_dict['routes'][prefix]['index']:
+                af_dict['routes'][prefix]['index'][index] = {}
+
+            # Set keys
+            if status_codes:
+                af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+            if path_data:
+                af_dict['routes'][prefix]['index'][index]['path'] = path_data
+            if m.groupdict()['next_hop']:
+                af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+            if m.groupdict()['local_prf']:
+                af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+            if m.groupdict()['weight']:
+                af_dict['routes'][prefix]['index'][index]['weight'] = weight
+            if m.groupdict()['metric']:
+                af_dict['routes'][prefix]['index'][index]['metric'] = metric
+            if origin_codes_data:
+                af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
 
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                        ['pfx_limit'] = pfx_limit
+        # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
+        @dispatcher.rule(p5)
+        def handle_p5(m):
+            af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
+            pfx_count = int(m.groupdict()['pfx_count'])
+            pfx_limit = int(m.groupdict()['pfx_limit'])
 
-                continue
+            if 'vrf' not in route_dict:
+                route_dict['vrf'] = {}
+            if vrf not in route_dict['vrf']:
+                route_dict['vrf'][vrf] = {}
 
-            # Route Distinguisher: 200:1
-            # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p6.match(line)
-            if m:
-                route_distinguisher = str(m.groupdict()['route_distinguisher'])
-                new_address_family = original_address_family + ' RD ' + route_distinguisher
+            if 'address_family' not in route_dict['vrf'][vrf]:
+                route_dict['vrf'][vrf]['address_family'] = {}
+            if new_address_family not in route_dict['vrf'][vrf]['address_family']:
+                route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
 
-                # Init dict
-                if m.groupdict()['default_vrf']:
-                    vrf = m.groupdict()['default_vrf']
+            route_dict['vrf'][vrf]['address_family'][new_address_family] \
+                ['af_private_import_to_address_family'] = af_private_import_to_address_family
 
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
+            route_dict['vrf'][vrf]['address_family'][new_address_family] \
+                ['pfx_count'] = pfx_count
 
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
+            route_dict['vrf'][vrf]['address_family'][new_address_family] \
+                    ['pfx_limit'] = pfx_limit
 
-                # Set keys
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['bgp_table_version'] = bgp_table_version
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_identifier'] = local_router_id
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_distinguisher'] = route_distinguisher
+        # Route Distinguisher: 200:1
+        # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
+        @dispatcher.rule(p6)
+        def handle_p6(m):
+            nonlocal address_family, new_address_family, vrf
+            route_distinguisher = str(m.groupdict()['route_distinguisher'])
+            new_address_family = original_address_family + ' RD ' + route_distinguisher
+
+            # Init dict
+            if m.groupdict()['default_vrf']:
+                vrf = m.groupdict()['default_vrf']
+
+            if 'vrf' not in route_dict:
+                route_dict['vrf'] = {}
+            if vrf not in route_dict['vrf']:
+                route_dict['vrf'][vrf] = {}
+
+            if 'address_family' not in route_dict['vrf'][vrf]:
+                route_dict['vrf'][vrf]['address_family'] = {}
+            if new_address_family not in route_dict['vrf'][vrf]['address_family']:
+                route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
+
+            # Set keys
+            route_dict['vrf'][vrf]['address_family'][new_address_family]\
+                ['bgp_table_version'] = bgp_table_version
+            route_dict['vrf'][vrf]['address_family'][new_address_family]\
+                ['route_identifier'] = local_router_id
+            route_dict['vrf'][vrf]['address_family'][new_address_family]\
+                ['route_distinguisher'] = route_distinguisher
 
-                if vrf:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['default_vrf'] = \
-                    vrf
+            if vrf:
+                route_dict['vrf'][vrf]['address_family'][new_address_family]['default_vrf'] = \
+                vrf
 
-                if m.groupdict()['vrf_router_id']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['vrf_route_identifier'] = \
-                        str(m.groupdict()['vrf_router_id'])
+            if m.groupdict()['vrf_router_id']:
+                route_dict['vrf'][vrf]['address_family'][new_address_family]['vrf_route_identifier'] = \
+                    str(m.groupdict()['vrf_router_id'])
 
 
-                # Reset address_family key and af_dict for use in other regex
-                address_family = new_address_family
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
+            # Reset address_family key for use in other regex
+            address_family = new_address_family
 
-                # Init routes dict
-                if 'routes' not in af_dict:
-                    del af_dict
+        for line in lines:
+            line = line.rstrip()
 
-                continue
+            dispatcher.dispatch(line)
+            if records.completed:
+                yield from records.pop_completed()
 
-        return route_dict
+        records.close()
+        yield from records.pop_completed()
 
 
 # ===================================
@@ -1843,6 +1904,40 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         * 'show ip bgp {address_family} all summary'
     '''
 
+    def command_plan(self, outputs, output=None, **kwargs):
+        '''Return the commands of the parse, given the outputs collected
+
+        The summary and the commands completing it are independent, all are
+        sent at once.
+        '''
+        if output is not None:
+            return []
+        cmd = self._command(**kwargs)
+        return [cmd] + self._dependent_commands(
+            cmd, kwargs.get('address_family', ''))
+
+    def _dependent_commands(self, cmd, address_family=''):
+        '''Return the commands completing the summary of cmd'''
+        commands = []
+        if 'rd' in cmd and 'summary' in cmd:
+            commands.append(ShowVrf.cli_command[0])
+        if address_family.lower() not in ['ipv4 unicast', 'ipv6 unicast'] \
+                and 'all summary' in cmd:
+            commands.extend('show run | sec {}'.format(section) for section
+                            in self._config_sections(address_family))
+        return commands
+
+    @staticmethod
+    def _config_sections(address_family):
+        '''Return the sections of the configuration holding the neighbors of
+        the vrfs of address_family'''
+        if 'vpnv4' in address_family:
+            return ['address-family ipv4 vrf']
+        if 'vpnv6' in address_family:
+            return ['address-family ipv6 vrf']
+        return ['address-family ipv4 vrf', 'address-family ipv6 vrf']
+
+    @subcommand_cache
     def cli(self, address_family='', vrf='', rd='',  cmd='', output=None):
 
         # Init vars
@@ -1858,34 +1953,26 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         show_vrf_output = None
         if ('rd' in cmd and 'summary' in cmd and
             output != '% RD does not match the default RD of any VRF'):
-            obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
-            # try:
-            #     show_vrf_output = obj.parse()
-            # except Exception:
-            #     pass
+            show_vrf_output = subcommand_parse(ShowVrf, self.device)
 
         if address_family.lower() not in ['ipv4 unicast', 'ipv6 unicast']:
            
             if ('all summary' in cmd and 
                 output != '% RD does not match the default RD of any VRF'):
 
-                if 'vpnv4' in address_family:
-                    commands_list = ['show run | sec address-family ipv4 vrf']
-                elif 'vpnv6' in address_family:
-                    commands_list = ['show run | sec address-family ipv6 vrf']
-                else:
-                    commands_list = ['show run | sec address-family ipv4 vrf',
-                                     'show run | sec address-family ipv6 vrf']
+                sections = self._config_sections(address_family)
                 
-                for command in commands_list:
-                    out_vrf = self.device.execute(command)
+                rc1 = re.compile(r'address\-family\s+(?P<address_family>'
+                                  'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
 
-                    rc1 = re.compile(r'address\-family\s+(?P<address_family>'
-                                      'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
+                rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
+                            'remote\-as\s+(?P<remote_as>\S+)')
+
+                for section in sections:
+                    out_vrf = config_section(
+                        self.device, section,
+                        'show run | sec {}'.format(section))
 
-                    rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
-                                'remote\-as\s+(?P<remote_as>\S+)')
 
                     flag_address_family = False            
 
@@ -2295,24 +2382,29 @@ class ShowBgpSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
 
+    def _command(self, address_family='', vrf='', rd=''):
+        cmd = ''
+        if vrf:
+            if address_family:
+                cmd = self.cli_command[0].format(address_family=address_family,
+                                             vrf=vrf)
+        elif rd:
+            if address_family:
+                cmd = self.cli_command[1].format(address_family=address_family,
+                                             rd=rd)
+        elif address_family:
+            cmd = self.cli_command[2].format(address_family=address_family)
+
+        else:
+            cmd = self.cli_command[3]
+        return cmd
+
     def cli(self, address_family='', vrf='', rd='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if vrf:
-                if address_family:
-                    cmd = self.cli_command[0].format(address_family=address_family,
-                                                 vrf=vrf)
-            elif rd:
-                if address_family:
-                    cmd = self.cli_command[1].format(address_family=address_family,
-                                                 rd=rd)
-            elif address_family:
-                cmd = self.cli_command[2].format(address_family=address_family)
-
-            else:
-                cmd = self.cli_command[3]
+            cmd = self._command(address_family=address_family, vrf=vrf, rd=rd)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -2346,16 +2438,22 @@ class ShowBgpAllSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
         'attribute_entries', 'dropped', 'established']
 
 
+    def _command(self, address_family='', vrf=''):
+        if address_family and not vrf:
+            return self.cli_command[0].format(address_family=address_family)
+        elif vrf and not address_family:
+            return self.cli_command[2].format(vrf=vrf)
+        return self.cli_command[1]
+
+    def _dependent_commands(self, cmd, address_family=''):
+        # The summary is parsed without its command, nothing completes it
+        return []
+
     def cli(self, address_family='', vrf='',output=None):
 
         if output is None:
             # Build command
-            if address_family and not vrf:
-                cmd = self.cli_command[0].format(address_family=address_family)
-            elif vrf and not address_family:
-                cmd = self.cli_command[2].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[1]
+            cmd = self._command(address_family=address_family, vrf=vrf)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -2389,21 +2487,23 @@ class ShowIpBgpSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
 
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
     
+    def _command(self, address_family='', vrf='', rd=''):
+        if address_family and rd:
+            return self.cli_command[0].format(address_family=address_family,
+                                              rd=rd)
+        elif address_family and vrf:
+            return self.cli_command[1].format(address_family=address_family,
+                                              vrf=vrf)
+        elif address_family:
+            return self.cli_command[2].format(address_family=address_family)
+        return self.cli_command[3]
+
     def cli(self, address_family='', vrf='', rd='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if address_family and rd:
-                cmd = self.cli_command[0].format(address_family=address_family,
-                                                 rd=rd)
-            elif address_family and vrf:
-                cmd = self.cli_command[1].format(address_family=address_family,
-                                                 vrf=vrf)
-            elif address_family:
-                cmd = self.cli_command[2].format(address_family=address_family)
-            else:   
-                cmd = self.cli_command[3]
+            cmd = self._command(address_family=address_family, vrf=vrf, rd=rd)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -2431,15 +2531,17 @@ class ShowIpBgpAllSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
 
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
+    def _command(self, address_family=''):
+        if address_family:
+            return self.cli_command[0].format(address_family=address_family)
+        return self.cli_command[1]
+
     def cli(self, address_family='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if address_family:
-                cmd = self.cli_command[0].format(address_family=address_family)
-            else:
-                cmd = self.cli_command[1]
+            cmd = self._command(address_family=address_family)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -4351,6 +4453,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor} advertised-routes'
     '''
 
+    @subcommand_cache
     def cli(self, neighbor, address_family='', output=None):
 
         # BGP neighbor is 10.225.10.253,  vrf CE1test,  remote AS 60000, external link
@@ -4397,7 +4500,8 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = subcommand_execute(self.device,
+                                     'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -5021,6 +5125,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         * 'show ip bgp {address_family} neighbors {neighbor} received-routes'
     '''
 
+    @subcommand_cache
     def cli(self, neighbor, address_family='', output=None):
         p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                         '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
@@ -5055,7 +5160,8 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = subcommand_execute(self.device,
+                                     'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -5619,11 +5725,13 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         * 'show ip bgp {address_family} neighbors {neighbor} routes'
     '''
 
+    @subcommand_cache
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
         if not vrf:
             # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-            out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+            out_vrf = subcommand_execute(
+                self.device, 'show bgp all neighbors | i BGP neighbor')
             vrf='default'
             p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                             '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
@@ -6226,11 +6334,12 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
 
     cli_command = 'show bgp all cluster-ids'
 
+    @subcommand_cache
     def cli(self, output=None):
         # find vrf names
         # show vrf detail | inc \(VRF
         cmd_vrfs = 'show vrf detail | inc \(VRF'
-        out_vrf = self.device.execute(cmd_vrfs)
+        out_vrf = subcommand_execute(self.device, cmd_vrfs)
         vrf_dict = {'0':'default'}
         p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
                         ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
@@ -3,6 +3,8 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+from genie.libs.parser.utils.columnar import ColumnarParser
+
 
 # ==================================
 # Schema for:
@@ -34,11 +36,16 @@ class ShowDeviceTrackingDatabaseSchema(MetaParser):
 # Parser for:
 #  * 'show device-tracking database'
 # ==================================
-class ShowDeviceTrackingDatabase(ShowDeviceTrackingDatabaseSchema):
+class ShowDeviceTrackingDatabase(ShowDeviceTrackingDatabaseSchema,
+                                 ColumnarParser):
     """Parser for show device-tracking database"""
 
     cli_command = 'show device-tracking database'
 
+    columnar_tables = {
+        'device': ('device', '{index}'),
+    }
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
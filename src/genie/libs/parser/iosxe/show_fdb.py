@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,12 +55,19 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ShowMacAddressTableSchema, ColumnarParser):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
+    columnar_tables = {
+        'interfaces': ('mac_table', 'vlans', '{vlan}', 'mac_addresses',
+                       '{mac_address}', 'interfaces', '{interface}'),
+        'drop': ('mac_table', 'vlans', '{vlan}', 'mac_addresses',
+                 '{mac_address}', 'drop'),
+    }
+
     def cli(self, vlan='', output=None):
         if output is None:
             # get output from device
@@ -101,12 +101,89 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
         # initial variables
         ret_dict = {}
 
+        # Global IGMP State Limit : 1 active out of 20 max
+        p1 = re.compile(r'^Global +IGMP +State +Limit *: +'
+                         '(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
+
+        # GigabitEthernet1 is up, line protocol is up
+        p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
+                         'line +protocol +is +(?P<oper_status>\w+)$')
+
+        # Internet protocol processing disabled
+        p2_2 = re.compile(r'^Internet protocol processing (?P<disabled>disabled)$')
+
+        # Internet address is 10.1.2.1/24
+        p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
+
+        # IGMP is enabled on interface
+        p4 = re.compile(r'^IGMP +is +(?P<status>\w+) +on +interface$')
+
+        # Current IGMP host version is 3
+        p5 = re.compile(r'^Current +IGMP +host +version +is +(?P<ver>\d+)$')
+
+        # Current IGMP router version is 3
+        p6 = re.compile(r'^Current +IGMP +router +version +is +(?P<ver>\d+)$')
+
+        # IGMP query interval is 133 seconds
+        p7 = re.compile(r'^IGMP +query +interval +is +(?P<query_interval>\d+) +seconds$')
+
+        # IGMP configured query interval is 133 seconds
+        p8 = re.compile(r'^IGMP +configured +query +interval +is +'
+                         '(?P<query_interval>\d+) +seconds$')
+
+        # IGMP querier timeout is 266 seconds
+        p9 = re.compile(r'^IGMP +querier +timeout +is +'
+                         '(?P<timeout>\d+) +seconds$')
+
+        # IGMP configured querier timeout is 266 seconds
+        p10 = re.compile(r'^IGMP +configured +querier +timeout +is +'
+                         '(?P<timeout>\d+) +seconds$')
+
+        # IGMP max query response time is 10 seconds
+        p11 = re.compile(r'^IGMP +max +query +response +time +is +'
+                         '(?P<time>\d+) +seconds$')
+
+        # Last member query count is 2
+        p12 = re.compile(r'^Last +member +query +count +is +(?P<count>\d+)$')
+
+        # Last member query response interval is 100 ms
+        p13 = re.compile(r'^Last +member +query +response +interval +is '
+                          '+(?P<time>\d+) +ms$')
+
+        # Inbound IGMP access group is test2
+        p14 = re.compile(r'^Inbound +IGMP +access +group +is +(?P<group_policy>\S+)$')
+
+        # IGMP activity: 13 joins, 3 leaves
+        p15 = re.compile(r'^IGMP +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
+
+        # Interface IGMP State Limit : 1 active out of 10 max
+        p16 = re.compile(r'^Interface +IGMP +State +Limit *: +'
+                          '(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
+
+        # Multicast routing is enabled on interface
+        p17 = re.compile(r'^Multicast +routing +is +enabled +on +interface$')
+
+        # Multicast TTL threshold is 0
+        p18 = re.compile(r'^Multicast +TTL +threshold +is +(?P<ttl>\d+)$')
+
+        # Multicast designated router (DR) is 10.1.2.1 (this system)
+        p19 = re.compile(r'^Multicast +designated +router +\(DR\) +'
+                          'is +(?P<ip>[\w\.\:]+)(?P<dummy> *\([\w\s]+\))?$')
+
+        # IGMP querying router is 10.1.2.1 (this system)
+        p20 = re.compile(r'^IGMP +querying +router +is +(?P<querier>[\w\.\:]+)'
+                          '(?P<dummy> *\([\w\s]+\))?$')
+
+        # Multicast groups joined by this system (number of users):
+        #   224.0.1.40(1)  239.4.4.4(1)  239.3.3.3(1)
+        p21 = re.compile(r'([\w\.\:]+)\((\d+)\)')
+
+        # Multicast Routing table VRF1
+        p22 = re.compile(r'^Multicast +Routing +table +(?P<routing_table>\S+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Global IGMP State Limit : 1 active out of 20 max
-            p1 = re.compile(r'^Global +IGMP +State +Limit *: +'
-                             '(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
             m = p1.match(line)
             if m:
                 max_groups = int(m.groupdict()['global_max_groups'])
@@ -120,9 +197,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['active'])
                 continue
 
-            # GigabitEthernet1 is up, line protocol is up
-            p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
-                             'line +protocol +is +(?P<oper_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -142,23 +216,17 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     m.groupdict()['intf_status'].lower()
                 continue
 
-            # Internet protocol processing disabled
-            p2_2 = re.compile(r'^Internet protocol processing (?P<disabled>disabled)$')
             m = p2_2.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['internet_protocol_processing'] = False
                 continue
 
-            # Internet address is 10.1.2.1/24
-            p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
             m = p3.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['interface_address'] = \
                     m.groupdict()['ip']
                 continue
 
-            # IGMP is enabled on interface
-            p4 = re.compile(r'^IGMP +is +(?P<status>\w+) +on +interface$')
             m = p4.match(line)
             if m:      
                 status = m.groupdict()['status'].lower()          
@@ -166,91 +234,64 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     'enable' in status else False
                 continue
             
-            # Current IGMP host version is 3
-            p5 = re.compile(r'^Current +IGMP +host +version +is +(?P<ver>\d+)$')
             m = p5.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['host_version'] = int(m.groupdict()['ver'])
                 continue
 
-            # Current IGMP router version is 3
-            p6 = re.compile(r'^Current +IGMP +router +version +is +(?P<ver>\d+)$')
             m = p6.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['router_version'] = int(m.groupdict()['ver'])
                 continue
 
-            # IGMP query interval is 133 seconds
-            p7 = re.compile(r'^IGMP +query +interval +is +(?P<query_interval>\d+) +seconds$')
             m = p7.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_interval'] = \
                     int(m.groupdict()['query_interval'])
                 continue
 
-            # IGMP configured query interval is 133 seconds
-            p8 = re.compile(r'^IGMP +configured +query +interval +is +'
-                             '(?P<query_interval>\d+) +seconds$')
             m = p8.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['configured_query_interval'] = \
                     int(m.groupdict()['query_interval'])
                 continue
 
-            # IGMP querier timeout is 266 seconds
-            p9 = re.compile(r'^IGMP +querier +timeout +is +'
-                             '(?P<timeout>\d+) +seconds$')
             m = p9.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['querier_timeout'] = \
                     int(m.groupdict()['timeout'])
                 continue
 
-            # IGMP configured querier timeout is 266 seconds
-            p10 = re.compile(r'^IGMP +configured +querier +timeout +is +'
-                             '(?P<timeout>\d+) +seconds$')
             m = p10.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['configured_querier_timeout'] = \
                     int(m.groupdict()['timeout'])
                 continue
 
-            # IGMP max query response time is 10 seconds
-            p11 = re.compile(r'^IGMP +max +query +response +time +is +'
-                             '(?P<time>\d+) +seconds$')
             m = p11.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_max_response_time'] = \
                     int(m.groupdict()['time'])
                 continue
 
-            # Last member query count is 2
-            p12 = re.compile(r'^Last +member +query +count +is +(?P<count>\d+)$')
             m = p12.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_count'] = \
                     int(m.groupdict()['count'])
                 continue
 
-            # Last member query response interval is 100 ms
-            p13 = re.compile(r'^Last +member +query +response +interval +is '
-                              '+(?P<time>\d+) +ms$')
             m = p13.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_interval'] = \
                     int(m.groupdict()['time'])
                 continue
 
-            # Inbound IGMP access group is test2
-            p14 = re.compile(r'^Inbound +IGMP +access +group +is +(?P<group_policy>\S+)$')
             m = p14.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['group_policy'] = \
                     m.groupdict()['group_policy']
                 continue
 
-            # IGMP activity: 13 joins, 3 leaves
-            p15 = re.compile(r'^IGMP +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
             m = p15.match(line)
             if m:
                 if 'counters' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -261,17 +302,12 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['leaves'])
                 continue
 
-            # Interface IGMP State Limit : 1 active out of 10 max
-            p16 = re.compile(r'^Interface +IGMP +State +Limit *: +'
-                              '(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
             m = p16.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['max_groups'] = int(m.groupdict()['max'])
                 ret_dict['vrf'][vrf]['interface'][intf]['active_groups'] = int(m.groupdict()['active'])
                 continue
 
-            # Multicast routing is enabled on interface
-            p17 = re.compile(r'^Multicast +routing +is +enabled +on +interface$')
             m = p17.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -279,8 +315,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 ret_dict['vrf'][vrf]['interface'][intf]['multicast']['routing_enable'] = True
                 continue
 
-            # Multicast TTL threshold is 0
-            p18 = re.compile(r'^Multicast +TTL +threshold +is +(?P<ttl>\d+)$')
             m = p18.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -289,9 +323,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['ttl'])
                 continue
 
-            # Multicast designated router (DR) is 10.1.2.1 (this system)
-            p19 = re.compile(r'^Multicast +designated +router +\(DR\) +'
-                              'is +(?P<ip>[\w\.\:]+)(?P<dummy> *\([\w\s]+\))?$')
             m = p19.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -303,9 +334,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['multicast']['dr_this_system'] = True
                 continue
 
-            # IGMP querying router is 10.1.2.1 (this system)
-            p20 = re.compile(r'^IGMP +querying +router +is +(?P<querier>[\w\.\:]+)'
-                              '(?P<dummy> *\([\w\s]+\))?$')
             m = p20.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['querier'] = \
@@ -314,9 +342,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['query_this_system'] = True
                 continue
 
-            # Multicast groups joined by this system (number of users):
-            #   224.0.1.40(1)  239.4.4.4(1)  239.3.3.3(1)
-            p21 = re.compile(r'([\w\.\:]+)\((\d+)\)')
             m = p21.findall(line)
             if m:
                 if 'joined_group' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -328,8 +353,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                         [item[0]]['number_of_users'] = int(item[1])
                 continue
 
-            # Multicast Routing table VRF1
-            p22 = re.compile(r'^Multicast +Routing +table +(?P<routing_table>\S+)$')
             m = p22.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -450,13 +473,43 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
         last_reporter = None
         flags = None
 
+        # Interface:        GigabitEthernet1
+        # Interface:\tVlan211
+        p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
+
+        # Group:                239.1.1.1
+        p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
+
+        # Flags:                L U
+        p3 = re.compile(r'^Flags:( *(?P<flags>[\w\s]+))?$')
+
+        # Uptime:                00:05:06
+        p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
+
+        # Group mode:        INCLUDE
+        # Group mode:        EXCLUDE (Expires: 00:06:06)
+        p5 = re.compile(r'^Group +mode: +(?P<group_mode>\w+)'
+                         '( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
+
+        # Last reporter:        10.1.2.1
+        p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
+
+        # Source Address   Uptime    v3 Exp   CSR Exp   Fwd  Flags
+        # 10.4.1.1         00:05:06  stopped   stopped   Yes  L
+        p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
+                         '(?P<up_time>[\w\.\:]+) +'
+                         '(?P<v3_exp>\w+) +'
+                         '(?P<csr_exp>\w+) +'
+                         '(?P<forward>\w+) +'
+                         '(?P<source_flags>\w+)$')
+
+        # Source list is empty
+        p7_1 = re.compile(r'^Source +list +is +empty$')
+
         for line in out.splitlines():
             line = line.strip()
             line = line.replace('\t', '    ')
 
-            # Interface:        GigabitEthernet1
-            # Interface:\tVlan211
-            p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
             m = p1.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -471,8 +524,6 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf] = {}
                 continue
 
-            # Group:                239.1.1.1
-            p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
@@ -482,8 +533,6 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['group'][group] = {}
                 continue
 
-            # Flags:                L U
-            p3 = re.compile(r'^Flags:( *(?P<flags>[\w\s]+))?$')
             m = p3.match(line)
             if m:
                 flags = m.groupdict()['flags']
@@ -506,18 +555,12 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                     keys = None
                 continue
 
-            # Uptime:                00:05:06
-            p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
                 ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['up_time'] = up_time
                 continue
 
-            # Group mode:        INCLUDE
-            # Group mode:        EXCLUDE (Expires: 00:06:06)
-            p5 = re.compile(r'^Group +mode: +(?P<group_mode>\w+)'
-                             '( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
             m = p5.match(line)
             if m:
                 group_mode = m.groupdict()['group_mode']
@@ -527,22 +570,12 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['expire'] = expire
                 continue
 
-            # Last reporter:        10.1.2.1
-            p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
             m = p6.match(line)
             if m:
                 last_reporter = m.groupdict()['last_reporter']
                 ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['last_reporter'] = last_reporter
                 continue
 
-            # Source Address   Uptime    v3 Exp   CSR Exp   Fwd  Flags
-            # 10.4.1.1         00:05:06  stopped   stopped   Yes  L
-            p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
-                             '(?P<up_time>[\w\.\:]+) +'
-                             '(?P<v3_exp>\w+) +'
-                             '(?P<csr_exp>\w+) +'
-                             '(?P<forward>\w+) +'
-                             '(?P<source_flags>\w+)$')
             m = p7.match(line)
             if m:
                 source = m.groupdict()['source']
@@ -596,8 +629,6 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                         ret_dict['vrf'][vrf]['interface'][intf][key][static_join_group].update(
                             self.build_pre_define_key(key_value_dict=key_value_dict))
 
-            # Source list is empty
-            p7_1 = re.compile(r'^Source +list +is +empty$')
             m = p7_1.match(line)
             if m:
                 source = '*'
@@ -672,25 +703,31 @@ class ShowIpIgmpSsmMapping(ShowIpIgmpSsmMappingSchema):
         group_address = ''
         database = None
 
+        # Group address: 224.0.1.40
+        p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
+
+        # Database     : Static
+        p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
+
+        # Source list  : 10.4.1.1
+        p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
+
+        # 10.4.1.2
+        p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Group address: 224.0.1.40
-            p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 group_address = m.groupdict()['group_address']
                 continue
 
-            # Database     : Static
-            p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
             m = p2.match(line)
             if m:
                 database = m.groupdict()['database']
                 continue
 
-            # Source list  : 10.4.1.1
-            p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -714,8 +751,6 @@ class ShowIpIgmpSsmMapping(ShowIpIgmpSsmMappingSchema):
                     ret_dict['vrf'][vrf]['ssm_map'][ssm]['database'] = database.lower()
                 continue
 
-            # 10.4.1.2
-            p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
             m = p3_1.match(line)
             if m:
                 source_addr = m.groupdict()['source_addr']
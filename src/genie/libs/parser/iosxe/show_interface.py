@@ -47,6 +47,10 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.dispatch import LineDispatcher, FALLTHROUGH, \
+                                            STOP
+from genie.libs.parser.utils.projection import project, ProjectedParser
+from genie.libs.parser.utils.blocks import BlockParser
 
 logger = logging.getLogger(__name__)
 
@@ -193,7 +197,7 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(ProjectedParser, ShowInterfacesSchema, BlockParser):
     """parser for show interfaces
                   show interfaces <interface>"""
 
@@ -208,8 +212,36 @@ class ShowInterfaces(ShowInterfacesSchema):
         'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
         'reliability']
 
+    # GigabitEthernet1 is up, line protocol is up 
+    # Port-channel12 is up, line protocol is up (connected)
+    # Vlan1 is administratively down, line protocol is down , Autostate Enabled
+    # Dialer1 is up (spoofing), line protocol is up (spoofing)
+    block_start = [
+        re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+                   r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+                   r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$'),
+        re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+                   r' +(?P<enabled>[\w\s]+),'
+                   r' +line +protocol +is +(?P<line_protocol>\w+)'
+                   r'( *, *(?P<attribute>[\w\s]+))?$'),
+    ]
+    block_marker = ' is '
+
+    def block_links(self, text):
+        links = []
+        # Members in this channel: Fo1/0/2 Fo1/0/4
+        if 'Members' in text:
+            for intfs in re.findall(r'^ *Members +in +this +channel: +(.+)$',
+                                    text, re.M):
+                links.extend(Common.convert_intf_name(intf)
+                             for intf in re.split(r'[\s,]+', intfs) if intf)
+        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+        if 'unnumbered' in text:
+            links.extend(re.findall(r'^ *Interface +is +unnumbered. +Using +'
+                                    r'address +of +(\S+)', text, re.M))
+        return links
 
-    def cli(self,interface="",output=None):
+    def cli(self,interface="",output=None,fields=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -219,17 +251,7 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # Port-channel12 is up, line protocol is up (connected)
-        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-        # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1, p1_1 = self.block_start
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
@@ -276,6 +298,22 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation(s): AAL5
         p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
                 r'(, +(?P<rest>.*))?$')
+
+        # Vlan ID 20, medium is p2p
+        p8_1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
+                          ' *medium +is +(?P<medium>[a-z0-9]+)$')
+
+        # loopback not set
+        p8_2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$')
+
+        # outer ID  10, inner ID 20
+        p8_3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
+                          'inner +ID (?P<second>[0-9]+)$')
+
+        # Vlan ID  1., loopback not set
+        # Vlan ID  105.
+        p8_4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
+                          '|(?:,(?P<rest>[\s\w]+))$')
             
         # Keepalive set (10 sec)
         p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
@@ -471,695 +509,681 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         interface_dict = {}
         unnumbered_dict = {}
-        for line in out.splitlines():
-            line = line.strip()
-            # GigabitEthernet1 is up, line protocol is up 
-            # Port-channel12 is up, line protocol is up (connected)
-            # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-            # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m = m if m else m1
-            if m:
-                interface = m.groupdict()['interface']
-                enabled = m.groupdict()['enabled']
-                line_protocol = m.groupdict()['line_protocol']
-                connected = m.groupdict()['attribute']
-                
-                if m.groupdict()['autostate']:
-                    autostate = m.groupdict()['autostate'].lower()
-                else:
-                    autostate = None
+        # Carrier delay is 10 sec
+        p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
 
-                if interface not in interface_dict:
-                    interface_dict[interface] = {}
-                    interface_dict[interface]['port_channel'] = {}
-                    interface_dict[interface]['port_channel']\
-                        ['port_channel_member'] = False
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                             ' +Timer +is +(?P<carrier_delay>\d+).*$')
 
-                if 'administratively down' in enabled or 'delete' in enabled:
-                    interface_dict[interface]['enabled'] = False
-                else:
-                    interface_dict[interface]['enabled'] = True
+        # Last clearing of "show interface" counters, not seen yet
+        last_clear = None
 
-                if line_protocol:
-                    interface_dict[interface]\
-                                ['line_protocol'] = line_protocol
-                    interface_dict[interface]\
-                                ['oper_status'] = line_protocol
+        projection = project(self, fields)
+        # Members and unnumbered interfaces are completed by the blocks of
+        # other interfaces
+        stop = projection is not None and \
+            not projection.wants(['port_channel', 'ipv4'])
 
-                if connected:
-                    interface_dict[interface]['connected'] = True if connected == 'connected' else False
+        dispatcher = LineDispatcher()
 
-                if autostate:
-                    interface_dict[interface]['autostate'] = True if autostate == 'enabled' else False
+        # GigabitEthernet1 is up, line protocol is up 
+        # Port-channel12 is up, line protocol is up (connected)
+        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
+        # Dialer1 is up (spoofing), line protocol is up (spoofing)
+        @dispatcher.rule(p1, p1_1)
+        def handle_p1(m):
+            nonlocal interface
+            interface = m.groupdict()['interface']
+            enabled = m.groupdict()['enabled']
+            line_protocol = m.groupdict()['line_protocol']
+            connected = m.groupdict()['attribute']
+
+            if m.groupdict()['autostate']:
+                autostate = m.groupdict()['autostate'].lower()
+            else:
+                autostate = None
 
-                continue
+            # The blocks of the selected interfaces are parsed
+            if stop and projection.complete(interface_dict):
+                return STOP
 
-            # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-            # Hardware is Loopback
-            m = p2.match(line)
+            if interface not in interface_dict:
+                interface_dict[interface] = {}
+                interface_dict[interface]['port_channel'] = {}
+                interface_dict[interface]['port_channel']\
+                    ['port_channel_member'] = False
 
-            # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
-                types = m.groupdict()['type']
-                mac_address = m.groupdict()['mac_address']
-                phys_address = m.groupdict()['phys_address']
-                interface_dict[interface]['type'] = types
-                if mac_address:
-                    interface_dict[interface]['mac_address'] = mac_address
-                if phys_address:
-                    interface_dict[interface]['phys_address'] = phys_address
-                continue
-            # Description: desc
-            # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
-            if m:
-                description = m.groupdict()['description']
+            if 'administratively down' in enabled or 'delete' in enabled:
+                interface_dict[interface]['enabled'] = False
+            else:
+                interface_dict[interface]['enabled'] = True
 
-                interface_dict[interface]['description'] = description
-                continue
+            if line_protocol:
+                interface_dict[interface]\
+                            ['line_protocol'] = line_protocol
+                interface_dict[interface]\
+                            ['oper_status'] = line_protocol
 
-            # Secondary address 10.2.2.2/24
-            m = p4.match(line)
-            if m:
-                ip_sec = m.groupdict()['ip']
-                prefix_length_sec = m.groupdict()['prefix_length']
-                address_sec = m.groupdict()['ipv4']
+            if connected:
+                interface_dict[interface]['connected'] = True if connected == 'connected' else False
 
-                if 'ipv4' not in interface_dict[interface]:
-                    interface_dict[interface]['ipv4'] = {}
-                if address_sec not in interface_dict[interface]['ipv4']:
-                    interface_dict[interface]['ipv4'][address_sec] = {}
-
-                interface_dict[interface]['ipv4'][address_sec]\
-                    ['ip'] = ip_sec
-                interface_dict[interface]['ipv4'][address_sec]\
-                    ['prefix_length'] = prefix_length_sec
-                interface_dict[interface]['ipv4'][address_sec]\
-                    ['secondary'] = True
-                continue
+            if autostate:
+                interface_dict[interface]['autostate'] = True if autostate == 'enabled' else False
 
-            # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
-            if m:
-                ip = m.groupdict()['ip']
-                prefix_length = m.groupdict()['prefix_length']
-                address = m.groupdict()['ipv4']
+        # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
+        # Hardware is Loopback
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+        @dispatcher.rule(p2, p2_2, keys=['type', 'mac_address',
+                                         'phys_address'])
+        def handle_p2(m):
+            types = m.groupdict()['type']
+            mac_address = m.groupdict()['mac_address']
+            phys_address = m.groupdict()['phys_address']
+            interface_dict[interface]['type'] = types
+            if mac_address:
+                interface_dict[interface]['mac_address'] = mac_address
+            if phys_address:
+                interface_dict[interface]['phys_address'] = phys_address
 
-                if 'ipv4' not in interface_dict[interface]:
-                    interface_dict[interface]['ipv4'] = {}
-                if address not in interface_dict[interface]['ipv4']:
-                    interface_dict[interface]['ipv4'][address] = {}
+        # Description: desc
+        # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
+        @dispatcher.rule(p3, keys=['description'])
+        def handle_p3(m):
+            description = m.groupdict()['description']
 
-                interface_dict[interface]['ipv4'][address]\
-                ['ip'] = ip
-                interface_dict[interface]['ipv4'][address]\
-                ['prefix_length'] = prefix_length
-                continue
-            
-            # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-            # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
-            if m:
-                mtu = m.groupdict()['mtu']
-                sub_mtu = m.groupdict().get('sub_mtu', None)
-                bandwidth = m.groupdict()['bandwidth']
-                if m.groupdict()['delay']:
-                    interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
-                if mtu:
-                    interface_dict[interface]['mtu'] = int(mtu)
-                if sub_mtu:
-                    interface_dict[interface]['sub_mtu'] = int(sub_mtu)
-                if bandwidth:
-                    interface_dict[interface]['bandwidth'] = int(bandwidth)
-                continue
+            interface_dict[interface]['description'] = description
 
-            # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
-                reliability = m.groupdict()['reliability']
-                txload = m.groupdict()['txload']
-                rxload = m.groupdict()['rxload']
-                interface_dict[interface]['reliability'] = reliability
-                interface_dict[interface]['txload'] = txload
-                interface_dict[interface]['rxload'] = rxload
-                continue
+        # Secondary address 10.2.2.2/24
+        @dispatcher.rule(p4, keys=['ipv4', 'ip', 'prefix_length', 'secondary'])
+        def handle_p4(m):
+            ip_sec = m.groupdict()['ip']
+            prefix_length_sec = m.groupdict()['prefix_length']
+            address_sec = m.groupdict()['ipv4']
+
+            if 'ipv4' not in interface_dict[interface]:
+                interface_dict[interface]['ipv4'] = {}
+            if address_sec not in interface_dict[interface]['ipv4']:
+                interface_dict[interface]['ipv4'][address_sec] = {}
+
+            interface_dict[interface]['ipv4'][address_sec]\
+                ['ip'] = ip_sec
+            interface_dict[interface]['ipv4'][address_sec]\
+                ['prefix_length'] = prefix_length_sec
+            interface_dict[interface]['ipv4'][address_sec]\
+                ['secondary'] = True
+
+        # Internet Address is 10.4.4.4/24
+        @dispatcher.rule(p5, keys=['ipv4', 'ip', 'prefix_length'])
+        def handle_p5(m):
+            ip = m.groupdict()['ip']
+            prefix_length = m.groupdict()['prefix_length']
+            address = m.groupdict()['ipv4']
+
+            if 'ipv4' not in interface_dict[interface]:
+                interface_dict[interface]['ipv4'] = {}
+            if address not in interface_dict[interface]['ipv4']:
+                interface_dict[interface]['ipv4'][address] = {}
+
+            interface_dict[interface]['ipv4'][address]\
+            ['ip'] = ip
+            interface_dict[interface]['ipv4'][address]\
+            ['prefix_length'] = prefix_length
 
-            # Encapsulation LOOPBACK, loopback not set
-            # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-            # Encapsulation ARPA, medium is broadcast
-            # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
-            # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
-            # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
-            if m:
-                encapsulation = m.groupdict()['encapsulation']
-                encapsulation = m.groupdict()['encapsulation'].lower()
-                encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
-                if 'encapsulations' not in interface_dict[interface]:
-                    interface_dict[interface]['encapsulations'] = {}
+        # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        @dispatcher.rule(p6, keys=['delay', 'mtu', 'sub_mtu', 'bandwidth'])
+        def handle_p6(m):
+            mtu = m.groupdict()['mtu']
+            sub_mtu = m.groupdict().get('sub_mtu', None)
+            bandwidth = m.groupdict()['bandwidth']
+            if m.groupdict()['delay']:
+                interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
+            if mtu:
+                interface_dict[interface]['mtu'] = int(mtu)
+            if sub_mtu:
+                interface_dict[interface]['sub_mtu'] = int(sub_mtu)
+            if bandwidth:
+                interface_dict[interface]['bandwidth'] = int(bandwidth)
 
-                interface_dict[interface]['encapsulations']\
-                    ['encapsulation'] = encapsulation
+        # reliability 255/255, txload 1/255, rxload 1/255
+        @dispatcher.rule(p7, keys=['reliability', 'txload', 'rxload'])
+        def handle_p7(m):
+            reliability = m.groupdict()['reliability']
+            txload = m.groupdict()['txload']
+            rxload = m.groupdict()['rxload']
+            interface_dict[interface]['reliability'] = reliability
+            interface_dict[interface]['txload'] = txload
+            interface_dict[interface]['rxload'] = rxload
 
-                rest = m.groupdict()['rest']
-                if not rest:
-                    continue
-                # Vlan ID 20, medium is p2p
-                m1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
-                                 ' *medium +is +(?P<medium>[a-z0-9]+)$').match(rest)
-                # will update key when output is valid
-                m2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$').match(rest)
-
-                #  outer ID  10, inner ID 20
-                m3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
-                                 'inner +ID (?P<second>[0-9]+)$').match(rest)
-
-                # Vlan ID  1., loopback not set
-                # Vlan ID  105.
-                m4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
-                                 '|(?:,(?P<rest>[\s\w]+))$').match(rest)
-
-                if m1:
-                    first_dot1q = m1.groupdict()['first_dot1q']
-                    if first_dot1q:
-                        interface_dict[interface]['encapsulations']\
-                            ['first_dot1q'] = first_dot1q
-                    interface_dict[interface]['medium'] = m.groupdict()['medium']
-                elif m3:
-                    first_dot1q = m3.groupdict()['first']
-                    second_dot1q = m3.groupdict()['second']
+        # Encapsulation LOOPBACK, loopback not set
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+        # Encapsulation ARPA, medium is broadcast
+        # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
+        @dispatcher.rule(p8, keys=['encapsulations', 'encapsulation',
+                                   'first_dot1q', 'second_dot1q', 'medium'])
+        def handle_p8(m):
+            encapsulation = m.groupdict()['encapsulation']
+            encapsulation = m.groupdict()['encapsulation'].lower()
+            encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
+            if 'encapsulations' not in interface_dict[interface]:
+                interface_dict[interface]['encapsulations'] = {}
+
+            interface_dict[interface]['encapsulations']\
+                ['encapsulation'] = encapsulation
+
+            rest = m.groupdict()['rest']
+            if not rest:
+                return
+            # Vlan ID 20, medium is p2p
+            m1 = p8_1.match(rest)
+            # will update key when output is valid
+            m2 = p8_2.match(rest)
+
+            #  outer ID  10, inner ID 20
+            m3 = p8_3.match(rest)
+
+            # Vlan ID  1., loopback not set
+            # Vlan ID  105.
+            m4 = p8_4.match(rest)
+
+            if m1:
+                first_dot1q = m1.groupdict()['first_dot1q']
+                if first_dot1q:
                     interface_dict[interface]['encapsulations']\
                         ['first_dot1q'] = first_dot1q
+                interface_dict[interface]['medium'] = m.groupdict()['medium']
+            elif m3:
+                first_dot1q = m3.groupdict()['first']
+                second_dot1q = m3.groupdict()['second']
+                interface_dict[interface]['encapsulations']\
+                    ['first_dot1q'] = first_dot1q
+                interface_dict[interface]['encapsulations']\
+                    ['second_dot1q'] = second_dot1q
+            elif m4:
+                first_dot1q = m4.groupdict()['first_dot1q']
+                if first_dot1q:
                     interface_dict[interface]['encapsulations']\
-                        ['second_dot1q'] = second_dot1q
-                elif m4:
-                    first_dot1q = m4.groupdict()['first_dot1q']
-                    if first_dot1q:
-                        interface_dict[interface]['encapsulations']\
-                            ['first_dot1q'] = first_dot1q
-
-                continue
-
-            # Keepalive set (10 sec)
-            m = p10.match(line)
-            if m:
-                keepalive = m.groupdict()['keepalive']
-                if keepalive:
-                    interface_dict[interface]['keepalive'] = int(keepalive)
-                continue
-
-            # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
-            # Full-duplex, 1000Mb/s, link type is auto, media type is
-            # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
-            # Full Duplex, Auto Speed, link type is auto, media type is RJ45
-            # Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
-            # full-duplex, 1000 Mb/s
-            # auto-duplex, auto-speed
-            # auto-duplex, 10 Gb/s, media type is 10G
-            # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
-            # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
-            if m:
-                duplex_mode = m.groupdict()['duplex_mode'].lower()
-                port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
-                link_type = m.groupdict()['link_type']
-                media_type = m.groupdict()['media_type']
-                interface_dict[interface]['duplex_mode'] = duplex_mode
-                interface_dict[interface]['port_speed'] = port_speed
-
-                if link_type:
-                    interface_dict[interface]['link_type'] = link_type
-                    if 'auto' in link_type:
-                        interface_dict[interface]['auto_negotiate'] = True
-                    else:
-                        interface_dict[interface]['auto_negotiate'] = False
-                if media_type:
-                    unknown = re.search(r'[U|u]nknown',media_type)
-                    if unknown:
-                        interface_dict[interface]['media_type'] = 'unknown'
-                    else:
-                        interface_dict[interface]['media_type'] = media_type
-                continue
-
-            # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
-            if m:
-                receive = m.groupdict()['receive'].lower()
-                send = m.groupdict()['send'].lower()
-                if 'flow_control' not in interface_dict[interface]:
-                    interface_dict[interface]['flow_control'] = {}
-                if 'on' in receive:
-                    interface_dict[interface]['flow_control']['receive'] = True
-                elif 'off' in receive or 'unsupported' in receive:
-                    interface_dict[interface]['flow_control']['receive'] = False
-
-                if 'on' in send:
-                    interface_dict[interface]['flow_control']['send'] = True
-                elif 'off' in send or 'unsupported' in send:
-                    interface_dict[interface]['flow_control']['send'] = False
-                continue
+                        ['first_dot1q'] = first_dot1q
 
-            # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
-            if m:
-                group = m.groupdict()
-                sub_dict = interface_dict.setdefault(interface, {})
-                sub_dict['carrier_delay'] = int(group['carrier_delay'])
+        # Keepalive set (10 sec)
+        @dispatcher.rule(p10, keys=['keepalive'])
+        def handle_p10(m):
+            keepalive = m.groupdict()['keepalive']
+            if keepalive:
+                interface_dict[interface]['keepalive'] = int(keepalive)
 
-            # Asymmetric Carrier-Delay Up Timer is 2 sec
-            # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
-            if m:
-                group = m.groupdict()
-                tp = group['type'].lower()
-                sub_dict = interface_dict.setdefault(interface, {})
-                if tp == 'up':
-                    sub_dict['carrier_delay_up'] = int(group['carrier_delay'])
+        # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+        # Full-duplex, 1000Mb/s, link type is auto, media type is
+        # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
+        # Full Duplex, Auto Speed, link type is auto, media type is RJ45
+        # Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
+        # full-duplex, 1000 Mb/s
+        # auto-duplex, auto-speed
+        # auto-duplex, 10 Gb/s, media type is 10G
+        # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
+        # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
+        @dispatcher.rule(p11, keys=['duplex_mode', 'port_speed', 'link_type',
+                                    'auto_negotiate', 'media_type'])
+        def handle_p11(m):
+            duplex_mode = m.groupdict()['duplex_mode'].lower()
+            port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
+            link_type = m.groupdict()['link_type']
+            media_type = m.groupdict()['media_type']
+            interface_dict[interface]['duplex_mode'] = duplex_mode
+            interface_dict[interface]['port_speed'] = port_speed
+
+            if link_type:
+                interface_dict[interface]['link_type'] = link_type
+                if 'auto' in link_type:
+                    interface_dict[interface]['auto_negotiate'] = True
                 else:
-                    sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
+                    interface_dict[interface]['auto_negotiate'] = False
+            if media_type:
+                unknown = re.search(r'[U|u]nknown',media_type)
+                if unknown:
+                    interface_dict[interface]['media_type'] = 'unknown'
+                else:
+                    interface_dict[interface]['media_type'] = media_type
 
-            # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
-            if m:
-                arp_type = m.groupdict()['arp_type'].lower()
-                arp_timeout = m.groupdict()['arp_timeout']
-                interface_dict[interface]['arp_type'] = arp_type
-                interface_dict[interface]['arp_timeout'] = arp_timeout
-                continue
+        # input flow-control is off, output flow-control is unsupported
+        @dispatcher.rule(p12, keys=['flow_control', 'receive', 'send'])
+        def handle_p12(m):
+            receive = m.groupdict()['receive'].lower()
+            send = m.groupdict()['send'].lower()
+            if 'flow_control' not in interface_dict[interface]:
+                interface_dict[interface]['flow_control'] = {}
+            if 'on' in receive:
+                interface_dict[interface]['flow_control']['receive'] = True
+            elif 'off' in receive or 'unsupported' in receive:
+                interface_dict[interface]['flow_control']['receive'] = False
+
+            if 'on' in send:
+                interface_dict[interface]['flow_control']['send'] = True
+            elif 'off' in send or 'unsupported' in send:
+                interface_dict[interface]['flow_control']['send'] = False
+
+        @dispatcher.rule(p_cd)
+        def handle_p_cd(m):
+            group = m.groupdict()
+            sub_dict = interface_dict.setdefault(interface, {})
+            sub_dict['carrier_delay'] = int(group['carrier_delay'])
+            return FALLTHROUGH
+
+        @dispatcher.rule(p_cd_2)
+        def handle_p_cd_2(m):
+            group = m.groupdict()
+            tp = group['type'].lower()
+            sub_dict = interface_dict.setdefault(interface, {})
+            if tp == 'up':
+                sub_dict['carrier_delay_up'] = int(group['carrier_delay'])
+            else:
+                sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
+            return FALLTHROUGH
 
-            # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
-            if m:
-                last_input = m.groupdict()['last_input']
-                last_output = m.groupdict()['last_output']
-                output_hang = m.groupdict()['output_hang']
-                interface_dict[interface]['last_input'] = last_input
-                interface_dict[interface]['last_output'] = last_output
-                interface_dict[interface]['output_hang'] = output_hang
-                continue
+        # ARP type: ARPA, ARP Timeout 04:00:00
+        @dispatcher.rule(p13, keys=['arp_type', 'arp_timeout'])
+        def handle_p13(m):
+            arp_type = m.groupdict()['arp_type'].lower()
+            arp_timeout = m.groupdict()['arp_timeout']
+            interface_dict[interface]['arp_type'] = arp_type
+            interface_dict[interface]['arp_timeout'] = arp_timeout
 
-            # Members in this channel: Gi1/0/2
-            # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
-            if m:
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_member'] = True
-                intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
-                intfs = [Common.convert_intf_name(i.strip()) for i in intfs]
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_member_intfs'] = intfs
+        # Last input never, output 00:01:05, output hang never
+        @dispatcher.rule(p14, keys=['last_input', 'last_output',
+                                    'output_hang'])
+        def handle_p14(m):
+            last_input = m.groupdict()['last_input']
+            last_output = m.groupdict()['last_output']
+            output_hang = m.groupdict()['output_hang']
+            interface_dict[interface]['last_input'] = last_input
+            interface_dict[interface]['last_output'] = last_output
+            interface_dict[interface]['output_hang'] = output_hang
 
-                # build connected interface port_channel
-                for intf in intfs:
-                    if intf not in interface_dict:
-                        interface_dict[intf] = {}
-                    if 'port_channel' not in interface_dict[intf]:
-                        interface_dict[intf]['port_channel'] = {}
-                    interface_dict[intf]['port_channel']['port_channel_member'] = True
-                    interface_dict[intf]['port_channel']['port_channel_int'] = interface
-                continue
+        # Members in this channel: Gi1/0/2
+        # Members in this channel: Fo1/0/2 Fo1/0/4
+        @dispatcher.rule(p15, keys=['port_channel', 'port_channel_member',
+                                    'port_channel_member_intfs',
+                                    'port_channel_int'])
+        def handle_p15(m):
+            interface_dict[interface]['port_channel']\
+                ['port_channel_member'] = True
+            intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
+            intfs = [Common.convert_intf_name(i.strip()) for i in intfs]
+            interface_dict[interface]['port_channel']\
+                ['port_channel_member_intfs'] = intfs
+
+            # build connected interface port_channel
+            for intf in intfs:
+                if intf not in interface_dict:
+                    interface_dict[intf] = {}
+                if 'port_channel' not in interface_dict[intf]:
+                    interface_dict[intf]['port_channel'] = {}
+                interface_dict[intf]['port_channel']['port_channel_member'] = True
+                interface_dict[intf]['port_channel']['port_channel_int'] = interface
 
-            # No. of active members in this channel: 12 
-            m = p15_1.match(line)
-            if m:
-                group = m.groupdict()
-                active_members = int(group['active_members'])
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_member'] = True
+        # No. of active members in this channel: 12 
+        @dispatcher.rule(p15_1, keys=['port_channel', 'port_channel_member',
+                                      'active_members'])
+        def handle_p15_1(m):
+            group = m.groupdict()
+            active_members = int(group['active_members'])
+            interface_dict[interface]['port_channel']\
+                ['port_channel_member'] = True
+            interface_dict[interface]['port_channel']\
+                ['active_members'] = active_members
+
+        # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
+        @dispatcher.rule(p15_2, keys=['port_channel',
+                                      'port_channel_member_intfs'])
+        def handle_p15_2(m):
+            group = m.groupdict()
+            intf = group['interface']
+            if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
                 interface_dict[interface]['port_channel']\
-                    ['active_members'] = active_members
-                continue
+                        ['port_channel_member_intfs'] = []
 
-            # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
-            if m:
-                group = m.groupdict()
-                intf = group['interface']
-                if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
-                    interface_dict[interface]['port_channel']\
-                            ['port_channel_member_intfs'] = []
+            interface_dict[interface]['port_channel']\
+                ['port_channel_member_intfs'].append(intf)
 
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_member_intfs'].append(intf)
-                    
-                continue
+        # No. of PF_JUMBO supported members in this channel : 0
+        @dispatcher.rule(p15_3, keys=['port_channel',
+                                      'num_of_pf_jumbo_supported_members'])
+        def handle_p15_3(m):
+            group = m.groupdict()
+            number = int(group['number'])
+            interface_dict[interface]['port_channel']\
+                ['num_of_pf_jumbo_supported_members'] = number
 
-            # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
-            if m:
-                group = m.groupdict()
-                number = int(group['number'])
-                interface_dict[interface]['port_channel']\
-                    ['num_of_pf_jumbo_supported_members'] = number
-                continue
+        # Last clearing of "show interface" counters 1d02h
+        @dispatcher.rule(p16, keys=['last_clear'])
+        def handle_p16(m):
+            nonlocal last_clear
+            last_clear = m.groupdict()['last_clear']
 
-            # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
-            if m:                
-                last_clear = m.groupdict()['last_clear']
-                continue
+        # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+        @dispatcher.rule(p17, keys=['queues', 'input_queue_size',
+                                    'input_queue_max', 'input_queue_drops',
+                                    'input_queue_flushes',
+                                    'total_output_drop'])
+        def handle_p17(m):
+            if 'queues' not in interface_dict[interface]:
+                interface_dict[interface]['queues'] = {}
+
+            interface_dict[interface]['queues']['input_queue_size'] = \
+                int(m.groupdict()['size'])
+            interface_dict[interface]['queues']['input_queue_max'] = \
+                int(m.groupdict()['max'])
+            interface_dict[interface]['queues']['input_queue_drops'] = \
+                int(m.groupdict()['drops'])
+            interface_dict[interface]['queues']['input_queue_flushes'] = \
+                int(m.groupdict()['flushes'])
+            interface_dict[interface]['queues']['total_output_drop'] = \
+                int(m.groupdict()['output_drop'])
 
-            # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
-            if m:
-                if 'queues' not in interface_dict[interface]:
-                    interface_dict[interface]['queues'] = {}
+        # Queueing strategy: fifo
+        # Queueing strategy: Class-based queueing
+        @dispatcher.rule(p18, keys=['queues', 'queue_strategy'])
+        def handle_p18(m):
+            if 'queues' not in interface_dict[interface]:
+                interface_dict[interface]['queues'] = {}
+            interface_dict[interface]['queues']['queue_strategy'] = \
+                m.groupdict()['queue_strategy']
 
-                interface_dict[interface]['queues']['input_queue_size'] = \
-                    int(m.groupdict()['size'])
-                interface_dict[interface]['queues']['input_queue_max'] = \
-                    int(m.groupdict()['max'])
-                interface_dict[interface]['queues']['input_queue_drops'] = \
+        # Output queue: 0/0 (size/max)
+        # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
+        @dispatcher.rule(p19, keys=['queues', 'output_queue_size',
+                                    'output_queue_max', 'threshold', 'drops'])
+        def handle_p19(m):
+            if 'queues' not in interface_dict[interface]:
+                interface_dict[interface]['queues'] = {}
+            interface_dict[interface]['queues']['output_queue_size'] = \
+                int(m.groupdict()['size'])
+            interface_dict[interface]['queues']['output_queue_max'] = \
+                int(m.groupdict()['max'])
+            if m.groupdict()['threshold'] and m.groupdict()['drops']:
+                interface_dict[interface]['queues']['threshold'] = \
+                    int(m.groupdict()['threshold'])
+                interface_dict[interface]['queues']['drops'] = \
                     int(m.groupdict()['drops'])
-                interface_dict[interface]['queues']['input_queue_flushes'] = \
-                    int(m.groupdict()['flushes'])
-                interface_dict[interface]['queues']['total_output_drop'] = \
-                    int(m.groupdict()['output_drop'])
-                continue
 
-            # Queueing strategy: fifo
-            # Queueing strategy: Class-based queueing
-            m = p18.match(line)
-            if m:
-                if 'queues' not in interface_dict[interface]:
-                    interface_dict[interface]['queues'] = {}
-                interface_dict[interface]['queues']['queue_strategy'] = \
-                    m.groupdict()['queue_strategy']
-                continue
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        @dispatcher.rule(p20, keys=['counters', 'rate', 'load_interval',
+                                    'in_rate', 'in_rate_pkts', 'last_clear'])
+        def handle_p20(m):
+            load_interval = int(m.groupdict()['load_interval'])
+            in_rate = int(m.groupdict()['in_rate'])
+            in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
+            unit = m.groupdict()['unit']
+            # covert minutes to seconds
+            if 'minute' in unit:
+                load_interval = load_interval * 60
+
+            if 'counters' not in interface_dict[interface]:
+                interface_dict[interface]['counters'] = {}
+
+            if 'rate' not in interface_dict[interface]['counters']:
+                interface_dict[interface]['counters']['rate'] = {}
+
+            interface_dict[interface]['counters']['rate']\
+                ['load_interval'] = load_interval
+            interface_dict[interface]['counters']['rate']\
+                ['in_rate'] = in_rate
+            interface_dict[interface]['counters']['rate']\
+                ['in_rate_pkts'] = in_rate_pkts                    
+
+            if 'last_clear' not in interface_dict[interface]['counters'] \
+                    and last_clear is not None:
+                interface_dict[interface]['counters']\
+                    ['last_clear'] = last_clear
 
-            # Output queue: 0/0 (size/max)
-            # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
-            if m:
-                if 'queues' not in interface_dict[interface]:
-                    interface_dict[interface]['queues'] = {}
-                interface_dict[interface]['queues']['output_queue_size'] = \
-                    int(m.groupdict()['size'])
-                interface_dict[interface]['queues']['output_queue_max'] = \
-                    int(m.groupdict()['max'])
-                if m.groupdict()['threshold'] and m.groupdict()['drops']:
-                    interface_dict[interface]['queues']['threshold'] = \
-                        int(m.groupdict()['threshold'])
-                    interface_dict[interface]['queues']['drops'] = \
-                        int(m.groupdict()['drops'])
-                continue
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        @dispatcher.rule(p21, keys=['rate', 'out_rate', 'out_rate_pkts'])
+        def handle_p21(m):
+            out_rate = int(m.groupdict()['out_rate'])
+            out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
 
-            # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
-            if m:
-                load_interval = int(m.groupdict()['load_interval'])
-                in_rate = int(m.groupdict()['in_rate'])
-                in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
-                unit = m.groupdict()['unit']
-                # covert minutes to seconds
-                if 'minute' in unit:
-                    load_interval = load_interval * 60
+            interface_dict[interface]['counters']['rate']\
+                ['out_rate'] = out_rate
+            interface_dict[interface]['counters']['rate']\
+                ['out_rate_pkts'] = out_rate_pkts
 
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
+        # 0 packets input, 0 bytes, 0 no buffer
+        @dispatcher.rule(p22, keys=['counters', 'in_pkts', 'in_octets',
+                                    'in_no_buffer'])
+        def handle_p22(m):
+            if 'counters' not in interface_dict[interface]:
+                interface_dict[interface]['counters'] = {}
+
+            interface_dict[interface]['counters']['in_pkts'] = \
+                int(m.groupdict()['in_pkts'])
+            interface_dict[interface]['counters']['in_octets'] = \
+                int(m.groupdict()['in_octets'])
+            if m.groupdict()['in_no_buffer']:
+                interface_dict[interface]['counters']['in_no_buffer'] = \
+                    int(m.groupdict()['in_no_buffer'])
 
-                if 'rate' not in interface_dict[interface]['counters']:
-                    interface_dict[interface]['counters']['rate'] = {}
-                
-                interface_dict[interface]['counters']['rate']\
-                    ['load_interval'] = load_interval
-                interface_dict[interface]['counters']['rate']\
-                    ['in_rate'] = in_rate
-                interface_dict[interface]['counters']['rate']\
-                    ['in_rate_pkts'] = in_rate_pkts                    
-                    
-                if 'last_clear' not in interface_dict[interface]['counters']:
-                    try:
-                        last_clear
-                    except Exception:
-                        pass
-                    else:
-                        interface_dict[interface]['counters']\
-                            ['last_clear'] = last_clear
-                continue
+        # Received 4173 broadcasts (0 IP multicasts)
+        # Received 535996 broadcasts (535961 multicasts)
+        @dispatcher.rule(p23, keys=['in_multicast_pkts', 'in_broadcast_pkts'])
+        def handle_p23(m):
+            interface_dict[interface]['counters']['in_multicast_pkts'] = \
+                int(m.groupdict()['in_broadcast_pkts'])
+            interface_dict[interface]['counters']['in_broadcast_pkts'] = \
+                int(m.groupdict()['in_multicast_pkts'])
 
-            # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
-                out_rate = int(m.groupdict()['out_rate'])
-                out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
+        # 0 runts, 0 giants, 0 throttles
+        @dispatcher.rule(p24, keys=['in_runts', 'in_giants', 'in_throttles'])
+        def handle_p24(m):
+            interface_dict[interface]['counters']['in_runts'] = \
+                int(m.groupdict()['in_runts'])
+            interface_dict[interface]['counters']['in_giants'] = \
+                int(m.groupdict()['in_giants'])
+            interface_dict[interface]['counters']['in_throttles'] = \
+                int(m.groupdict()['in_throttles'])
 
-                interface_dict[interface]['counters']['rate']\
-                    ['out_rate'] = out_rate
-                interface_dict[interface]['counters']['rate']\
-                    ['out_rate_pkts'] = out_rate_pkts
-                continue
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+        @dispatcher.rule(p25, keys=['in_errors', 'in_crc_errors', 'in_frame',
+                                    'in_overrun', 'in_ignored', 'in_abort'])
+        def handle_p25(m):
+            interface_dict[interface]['counters']['in_errors'] = \
+                int(m.groupdict()['in_errors'])
+            interface_dict[interface]['counters']['in_crc_errors'] = \
+                int(m.groupdict()['in_crc_errors'])
+            interface_dict[interface]['counters']['in_frame'] = \
+                int(m.groupdict()['in_frame'])
+            interface_dict[interface]['counters']['in_overrun'] = \
+                int(m.groupdict()['in_overrun'])
+            interface_dict[interface]['counters']['in_ignored'] = \
+                int(m.groupdict()['in_ignored'])
+            if m.groupdict()['in_abort']:
+                interface_dict[interface]['counters']['in_abort'] = \
+                    int(m.groupdict()['in_abort'])
 
-            # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
-            if m:
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
+        # 0 watchdog, 535961 multicast, 0 pause input
+        @dispatcher.rule(p26, keys=['in_watchdog', 'in_multicast_pkts',
+                                    'in_mac_pause_frames'])
+        def handle_p26(m):
+            interface_dict[interface]['counters']['in_watchdog'] = \
+                int(m.groupdict()['in_watchdog'])
+            interface_dict[interface]['counters']['in_multicast_pkts'] = \
+                int(m.groupdict()['in_multicast_pkts'])
+            interface_dict[interface]['counters']['in_mac_pause_frames'] = \
+                int(m.groupdict()['in_pause_input'])
 
-                interface_dict[interface]['counters']['in_pkts'] = \
-                    int(m.groupdict()['in_pkts'])
-                interface_dict[interface]['counters']['in_octets'] = \
-                    int(m.groupdict()['in_octets'])
-                if m.groupdict()['in_no_buffer']:
-                    interface_dict[interface]['counters']['in_no_buffer'] = \
-                        int(m.groupdict()['in_no_buffer'])
-                continue
+        # 0 input packets with dribble condition detected
+        @dispatcher.rule(p27, keys=['in_with_dribble'])
+        def handle_p27(m):
+            interface_dict[interface]['counters']['in_with_dribble'] = \
+                int(m.groupdict()['in_with_dribble'])
 
-            # Received 4173 broadcasts (0 IP multicasts)
-            # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
-            if m:
-                interface_dict[interface]['counters']['in_multicast_pkts'] = \
-                    int(m.groupdict()['in_broadcast_pkts'])
-                interface_dict[interface]['counters']['in_broadcast_pkts'] = \
-                    int(m.groupdict()['in_multicast_pkts'])
-                continue
+        # 23376 packets output, 3642296 bytes, 0 underruns
+        @dispatcher.rule(p28, keys=['out_pkts', 'out_octets', 'out_underruns'])
+        def handle_p28(m):
+            interface_dict[interface]['counters']['out_pkts'] = \
+                int(m.groupdict()['out_pkts'])
+            interface_dict[interface]['counters']['out_octets'] = \
+                int(m.groupdict()['out_octets'])
+            if m.groupdict()['out_underruns']:
+                interface_dict[interface]['counters']['out_underruns'] = \
+                    int(m.groupdict()['out_underruns'])
 
-            # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
-            if m:
-                interface_dict[interface]['counters']['in_runts'] = \
-                    int(m.groupdict()['in_runts'])
-                interface_dict[interface]['counters']['in_giants'] = \
-                    int(m.groupdict()['in_giants'])
-                interface_dict[interface]['counters']['in_throttles'] = \
-                    int(m.groupdict()['in_throttles'])
-                continue
+        # Received 4173 broadcasts (0 IP multicasts)
+        # Received 535996 broadcasts (535961 multicasts)
+        @dispatcher.rule(p29, keys=['out_broadcast_pkts',
+                                    'out_multicast_pkts'])
+        def handle_p29(m):
+            interface_dict[interface]['counters']['out_broadcast_pkts'] = \
+                int(m.groupdict()['out_broadcast_pkts'])
+            interface_dict[interface]['counters']['out_multicast_pkts'] = \
+                int(m.groupdict()['out_multicast_pkts'])
 
-            # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
-            # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
-            if m:
-                interface_dict[interface]['counters']['in_errors'] = \
-                    int(m.groupdict()['in_errors'])
-                interface_dict[interface]['counters']['in_crc_errors'] = \
-                    int(m.groupdict()['in_crc_errors'])
-                interface_dict[interface]['counters']['in_frame'] = \
-                    int(m.groupdict()['in_frame'])
-                interface_dict[interface]['counters']['in_overrun'] = \
-                    int(m.groupdict()['in_overrun'])
-                interface_dict[interface]['counters']['in_ignored'] = \
-                    int(m.groupdict()['in_ignored'])
-                if m.groupdict()['in_abort']:
-                    interface_dict[interface]['counters']['in_abort'] = \
-                        int(m.groupdict()['in_abort'])
-                continue
-
-            # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
-            if m:
-                interface_dict[interface]['counters']['in_watchdog'] = \
-                    int(m.groupdict()['in_watchdog'])
-                interface_dict[interface]['counters']['in_multicast_pkts'] = \
-                    int(m.groupdict()['in_multicast_pkts'])
-                interface_dict[interface]['counters']['in_mac_pause_frames'] = \
-                    int(m.groupdict()['in_pause_input'])
-                continue
+        # 0 output errors, 0 collisions, 2 interface resets
+        # 0 output errors, 0 interface resets
+        @dispatcher.rule(p30, keys=['out_errors', 'out_interface_resets',
+                                    'out_collision'])
+        def handle_p30(m):
+            interface_dict[interface]['counters']['out_errors'] = \
+                int(m.groupdict()['out_errors'])
+            interface_dict[interface]['counters']['out_interface_resets'] = \
+                int(m.groupdict()['out_interface_resets'])
+            if m.groupdict()['out_collision']:
+                interface_dict[interface]['counters']['out_collision'] = \
+                    int(m.groupdict()['out_collision'])
 
-            # 0 input packets with dribble condition detected
-            m = p27.match(line)
-            if m:
-                interface_dict[interface]['counters']['in_with_dribble'] = \
-                    int(m.groupdict()['in_with_dribble'])
-                continue
+        # 0 unknown protocol drops
+        @dispatcher.rule(p31, keys=['out_unknown_protocl_drops'])
+        def handle_p31(m):
+            interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
+                int(m.groupdict()['out_unknown_protocl_drops'])
 
-            # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_pkts'] = \
-                    int(m.groupdict()['out_pkts'])
-                interface_dict[interface]['counters']['out_octets'] = \
-                    int(m.groupdict()['out_octets'])
-                if m.groupdict()['out_underruns']:
-                    interface_dict[interface]['counters']['out_underruns'] = \
-                        int(m.groupdict()['out_underruns'])
-                continue
+        # 0 babbles, 0 late collision, 0 deferred
+        @dispatcher.rule(p32, keys=['out_babble', 'out_late_collision',
+                                    'out_deferred'])
+        def handle_p32(m):
+            interface_dict[interface]['counters']['out_babble'] = \
+                int(m.groupdict()['out_babble'])
+            interface_dict[interface]['counters']['out_late_collision'] = \
+                int(m.groupdict()['out_late_collision'])
+            interface_dict[interface]['counters']['out_deferred'] = \
+                int(m.groupdict()['out_deferred'])
 
-            # Received 4173 broadcasts (0 IP multicasts)
-            # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_broadcast_pkts'] = \
-                    int(m.groupdict()['out_broadcast_pkts'])
-                interface_dict[interface]['counters']['out_multicast_pkts'] = \
-                    int(m.groupdict()['out_multicast_pkts'])
-                continue
+        # 0 lost carrier, 0 no carrier, 0 pause output
+        @dispatcher.rule(p33, keys=['out_lost_carrier', 'out_no_carrier',
+                                    'out_mac_pause_frames'])
+        def handle_p33(m):
+            interface_dict[interface]['counters']['out_lost_carrier'] = \
+                int(m.groupdict()['out_lost_carrier'])
+            interface_dict[interface]['counters']['out_no_carrier'] = \
+                int(m.groupdict()['out_no_carrier'])
+            out_pause_output = m.groupdict().get('out_pause_output', None)
+            if out_pause_output:
+                interface_dict[interface]['counters']['out_mac_pause_frames'] = \
+                    int(m.groupdict()['out_pause_output'])
 
-            # 0 output errors, 0 collisions, 2 interface resets
-            # 0 output errors, 0 interface resets
-            m = p30.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_errors'] = \
-                    int(m.groupdict()['out_errors'])
-                interface_dict[interface]['counters']['out_interface_resets'] = \
-                    int(m.groupdict()['out_interface_resets'])
-                if m.groupdict()['out_collision']:
-                    interface_dict[interface]['counters']['out_collision'] = \
-                        int(m.groupdict()['out_collision'])
-                continue
+        # 0 output buffer failures, 0 output buffers swapped out
+        @dispatcher.rule(p34, keys=['out_buffer_failure',
+                                    'out_buffers_swapped'])
+        def handle_p34(m):
+            interface_dict[interface]['counters']['out_buffer_failure'] = \
+                int(m.groupdict()['out_buffer_failure'])
+            interface_dict[interface]['counters']['out_buffers_swapped'] = \
+                int(m.groupdict()['out_buffers_swapped'])
 
-            # 0 unknown protocol drops
-            m = p31.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
-                    int(m.groupdict()['out_unknown_protocl_drops'])
-                continue
+        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+        # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
+        @dispatcher.rule(p35, keys=['ipv4', 'ip', 'prefix_length',
+                                    'unnumbered', 'interface_ref'])
+        def handle_p35(m):
+            unnumbered_dict[interface] = {}
+            unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
+            unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
 
-            # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_babble'] = \
-                    int(m.groupdict()['out_babble'])
-                interface_dict[interface]['counters']['out_late_collision'] = \
-                    int(m.groupdict()['out_late_collision'])
-                interface_dict[interface]['counters']['out_deferred'] = \
-                    int(m.groupdict()['out_deferred'])
-                continue
+        # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
+        @dispatcher.rule(p36, keys=['maximum_active_vcs', 'vcs_per_vp',
+                                    'current_vccs'])
+        def handle_p36(m):
+            group = m.groupdict()
+            maximum_active_vcs = group['maximum_active_vcs']
+            vcs_per_vp = group['vcs_per_vp']
+            current_vccs = group['current_vccs']
+            interface_dict[interface].update({'maximum_active_vcs': maximum_active_vcs})
+            interface_dict[interface].update({'vcs_per_vp': vcs_per_vp})
+            interface_dict[interface].update({'current_vccs': current_vccs})
 
-            # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_lost_carrier'] = \
-                    int(m.groupdict()['out_lost_carrier'])
-                interface_dict[interface]['counters']['out_no_carrier'] = \
-                    int(m.groupdict()['out_no_carrier'])
-                out_pause_output = m.groupdict().get('out_pause_output', None)
-                if out_pause_output:
-                    interface_dict[interface]['counters']['out_mac_pause_frames'] = \
-                        int(m.groupdict()['out_pause_output'])
-                continue
+        # VC Auto Creation Disabled.
+        @dispatcher.rule(p37, keys=['vc_auto_creation'])
+        def handle_p37(m):
+            group = m.groupdict()
+            vc_auto_creation = group['vc_auto_creation']
+            interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
 
-            # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_buffer_failure'] = \
-                    int(m.groupdict()['out_buffer_failure'])
-                interface_dict[interface]['counters']['out_buffers_swapped'] = \
-                    int(m.groupdict()['out_buffers_swapped'])
-                continue
+        # VC idle disconnect time: 300 seconds
+        @dispatcher.rule(p38, keys=['vc_idle_disconnect_time'])
+        def handle_p38(m):
+            group = m.groupdict()
+            vc_idle_disconnect_time = group['vc_idle_disconnect_time']
+            interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
 
-            # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
-            # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
-            if m:
-                unnumbered_dict[interface] = {}
-                unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
-                unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
-                continue
+        # AAL5 CRC errors : 0
+        @dispatcher.rule(p39, keys=['aal5_crc_errors'])
+        def handle_p39(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
 
-            # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
-            if m:
-                group = m.groupdict()
-                maximum_active_vcs = group['maximum_active_vcs']
-                vcs_per_vp = group['vcs_per_vp']
-                current_vccs = group['current_vccs']
-                interface_dict[interface].update({'maximum_active_vcs': maximum_active_vcs})
-                interface_dict[interface].update({'vcs_per_vp': vcs_per_vp})
-                interface_dict[interface].update({'current_vccs': current_vccs})
-                continue
-            
-            # VC Auto Creation Disabled.
-            m = p37.match(line)
-            if m:
-                group = m.groupdict()
-                vc_auto_creation = group['vc_auto_creation']
-                interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
-                continue
+        # AAL5 SAR Timeouts : 0
+        @dispatcher.rule(p40, keys=['aal5_oversized_sdus'])
+        def handle_p40(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
 
-            # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
-            if m:
-                group = m.groupdict()
-                vc_idle_disconnect_time = group['vc_idle_disconnect_time']
-                interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
-                continue
+        # AAL5 Oversized SDUs : 0
+        @dispatcher.rule(p41, keys=['aal5_sar_timeouts'])
+        def handle_p41(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
 
-            # AAL5 CRC errors : 0
-            m = p39.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
-                continue
-            
-            # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
-                continue
+        # LCP Closed
+        @dispatcher.rule(p42, keys=['lcp_state', 'lcp_loopack'])
+        def handle_p42(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'lcp_state': group['state']})
+            loopback = group.get('loopback', None)
+            if loopback:
+                interface_dict[interface].update({'lcp_loopack': loopback})
 
-            # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
-                continue
+        # Base PPPoATM vaccess
+        @dispatcher.rule(p43, keys=['base_pppoatm'])
+        def handle_p43(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
 
-            # LCP Closed
-            m = p42.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'lcp_state': group['state']})
-                loopback = group.get('loopback', None)
-                if loopback:
-                    interface_dict[interface].update({'lcp_loopack': loopback})
-                continue
+        # Vaccess status 0x44, loopback not set
+        @dispatcher.rule(p44, keys=['vaccess_status', 'vaccess_loopback'])
+        def handle_p44(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'vaccess_status': group['status']})
+            interface_dict[interface].update({'vaccess_loopback': group['loopback']})
 
-            # Base PPPoATM vaccess
-            m = p43.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
-                continue
+        # DTR is pulsed for 5 seconds on reset
+        @dispatcher.rule(p45, keys=['dtr_pulsed'])
+        def handle_p45(m):
+            group = m.groupdict()
+            interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
 
-            # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'vaccess_status': group['status']})
-                interface_dict[interface].update({'vaccess_loopback': group['loopback']})
-                continue
+        dispatcher = dispatcher.project(projection)
+        for line in out.splitlines():
+            line = line.strip()
 
-            # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
-            if m:
-                group = m.groupdict()
-                interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
-                continue
+            if dispatcher.dispatch(line) is STOP:
+                break
 
         # create strucutre for unnumbered interface
-        if not unnumbered_dict:
-            return(interface_dict)
-
         for intf in unnumbered_dict:
             unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
             unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
@@ -1177,6 +1201,8 @@ class ShowInterfaces(ShowInterfacesSchema):
                             interface_dict[intf]['ipv4']['unnumbered'] = {}
                             interface_dict[intf]['ipv4']['unnumbered']\
                                 ['interface_ref'] = unnumbered_intf
+        if projection is not None:
+            return projection.prune(interface_dict)
         return(interface_dict)
 
 
@@ -1508,11 +1534,124 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
         ret_dict = {}
         private_trunk_mappings = None
         private_operational = None
+
+        # Name: Gi1/0/2
+        p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
+
+        # Switchport: Enabled
+        p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
+
+        # Administrative Mode: trunk
+        p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
+
+        # Operational Mode: trunk (member of bundle Po12)
+        # Operational Mode: down (suspended member of bundle Po12)
+        p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
+                        r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
+                        r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
+
+        # Administrative Trunking Encapsulation: dot1q
+        p5 =  re.compile(r'^Administrative +Trunking +Encapsulation: +'
+                          '(?P<encapsulation>\w+)$')
+
+        # Operational Trunking Encapsulation: dot1q
+        p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
+                          '(?P<encapsulation>\w+)$')
+
+        # Negotiation of Trunking: On
+        p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
+
+        # Access Mode VLAN: 1 (default)
+        # Access Mode VLAN: 100 (Falback-Data)
+        p8 =  re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
+                          '( *\((?P<access_vlan_name>.+)\))?$')
+
+        # Trunking Native Mode VLAN: 1 (default)
+        p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
+                          '( *\((?P<native_vlan_name>.+)\))?$')
+
+        # Administrative Native VLAN tagging: enabled
+        p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
+                           '(?P<tagging>\w+)$')
+
+        # Voice VLAN: none
+        # Voice VLAN: 100 (Fallback-Voice)
+        p11 =  re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
+                          '( *\((?P<voice_vlan_name>.+)\))?$')
+
+        # Administrative private-vlan host-association: none 
+        p12 =  re.compile(r'^Administrative +private-vlan +'
+                           'host-association: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan mapping: none 
+        p13 =  re.compile(r'^Administrative +private-vlan +'
+                           'mapping: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk native VLAN: none
+        p14 =  re.compile(r'^Administrative +private-vlan +'
+                           'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk Native VLAN tagging: enabled
+        p15 =  re.compile(r'^Administrative +private-vlan +'
+                           'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk encapsulation: dot1q
+        p16 = re.compile(r'^Administrative +private-vlan +'
+                           'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk normal VLANs: none
+        p17 = re.compile(r'^Administrative +private-vlan +'
+                           'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk associations: none
+        p18 = re.compile(r'^Administrative +private-vlan +'
+                           'trunk +associations: +(?P<ret>[\w\-]+)$')
+
+        # Administrative private-vlan trunk mappings: none
+        # Administrative private-vlan trunk mappings:
+        p19 = re.compile(r'^Administrative +private-vlan +'
+                           'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
+
+        p19_1 = re.compile(r'^(?P<mappings>[\w\(\)\s]+)$')
+
+        # Operational private-vlan: none
+        # Operational private-vlan:
+        p20 = re.compile(r'^Operational +private-vlan:'
+                           '( *(?P<private_operational>[\w\-]+))?$')
+
+        # Trunking VLANs Enabled: 200-211
+        # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
+        p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
+
+        p20_1 = re.compile(r'^(?P<private_operational>[\w\(\)\s]+)$')
+
+        # 1111,2222,3333, 500-55,
+        p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
+
+        # Pruning VLANs Enabled: 2-1001
+        p22 =  re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
+
+        # Capture Mode Disabled
+        p23 =  re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
+
+        # Capture VLANs Allowed: ALL
+        p24 =  re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
+
+        # Protected: false
+        p25 =  re.compile(r'^Protected: +(?P<protected>\w+)$')
+
+        # Unknown unicast blocked: disabled
+        p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
+
+        # Unknown multicast blocked: disabled
+        p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
+
+        # Appliance trust: none
+        p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Name: Gi1/0/2
-            p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
             m = p1.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
@@ -1520,8 +1659,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf] = {}
                 continue
 
-            # Switchport: Enabled
-            p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
             m = p2.match(line)
             if m:
                 if m.groupdict()['switchport_enable'].lower() == 'enabled':
@@ -1531,18 +1668,11 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
                 continue
 
-            # Administrative Mode: trunk
-            p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
             m = p3.match(line)
             if m:
                 ret_dict[intf]['switchport_mode'] = m.groupdict()['switchport_mode']
                 continue
 
-            # Operational Mode: trunk (member of bundle Po12)
-            # Operational Mode: down (suspended member of bundle Po12)
-            p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
-                            r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
-                            r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
             m = p4.match(line)
             if m:
                 ret_dict[intf]['operational_mode'] = m.groupdict()['operational_mode']
@@ -1573,9 +1703,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                         ret_dict[bundle_intf]['port_channel']['port_channel_member_intfs'] = [intf]
                 continue
 
-            # Administrative Trunking Encapsulation: dot1q
-            p5 =  re.compile(r'^Administrative +Trunking +Encapsulation: +'
-                              '(?P<encapsulation>\w+)$')
             m = p5.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1584,9 +1711,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     m.groupdict()['encapsulation'].lower()
                 continue
 
-            # Operational Trunking Encapsulation: dot1q
-            p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
-                              '(?P<encapsulation>\w+)$')
             m = p6.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1595,8 +1719,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     m.groupdict()['encapsulation'].lower()
                 continue
 
-            # Negotiation of Trunking: On
-            p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
             m = p7.match(line)
             if m:
                 negotiation_of_trunk = m.groupdict()['negotiation_of_trunk'].lower()
@@ -1606,10 +1728,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['negotiation_of_trunk'] = False                    
                 continue
 
-            # Access Mode VLAN: 1 (default)
-            # Access Mode VLAN: 100 (Falback-Data)
-            p8 =  re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
-                              '( *\((?P<access_vlan_name>.+)\))?$')
             m = p8.match(line)
             if m:
                 ret_dict[intf]['access_vlan'] = m.groupdict()['access_vlan']
@@ -1617,9 +1735,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['access_vlan_name'] = m.groupdict()['access_vlan_name']
                 continue
 
-            # Trunking Native Mode VLAN: 1 (default)
-            p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
-                              '( *\((?P<native_vlan_name>.+)\))?$')
             m = p9.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
@@ -1629,9 +1744,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['encapsulation']['native_vlan_name'] = m.groupdict()['native_vlan_name']
                 continue
 
-            # Administrative Native VLAN tagging: enabled
-            p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
-                               '(?P<tagging>\w+)$')
             m = p10.match(line)
             if m:
                 if 'enable' in m.groupdict()['tagging'].lower():
@@ -1640,10 +1752,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['native_vlan_tagging'] = False
                 continue
 
-            # Voice VLAN: none
-            # Voice VLAN: 100 (Fallback-Voice)
-            p11 =  re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
-                              '( *\((?P<voice_vlan_name>.+)\))?$')
             m = p11.match(line)
             if m:
                 ret_dict[intf]['voice_vlan'] = m.groupdict()['vlan']
@@ -1651,9 +1759,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['voice_vlan_name'] = m.groupdict()['voice_vlan_name']
                 continue
 
-            # Administrative private-vlan host-association: none 
-            p12 =  re.compile(r'^Administrative +private-vlan +'
-                               'host-association: +(?P<ret>[\w\-]+)$')
             m = p12.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1663,9 +1768,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['host_association'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan mapping: none 
-            p13 =  re.compile(r'^Administrative +private-vlan +'
-                               'mapping: +(?P<ret>[\w\-]+)$')
             m = p13.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1675,9 +1777,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['mapping'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan trunk native VLAN: none
-            p14 =  re.compile(r'^Administrative +private-vlan +'
-                               'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
             m = p14.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1687,9 +1786,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['native_vlan'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan trunk Native VLAN tagging: enabled
-            p15 =  re.compile(r'^Administrative +private-vlan +'
-                               'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
             m = p15.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1701,9 +1797,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['native_vlan_tagging'] = False                    
                 continue
 
-            # Administrative private-vlan trunk encapsulation: dot1q
-            p16 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
             m = p16.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1713,9 +1806,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['encapsulation'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan trunk normal VLANs: none
-            p17 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
             m = p17.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1725,9 +1815,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['normal_vlans'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan trunk associations: none
-            p18 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +associations: +(?P<ret>[\w\-]+)$')
             m = p18.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1737,10 +1824,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['private_vlan']['associations'] = m.groupdict()['ret']
                 continue
 
-            # Administrative private-vlan trunk mappings: none
-            # Administrative private-vlan trunk mappings:
-            p19 = re.compile(r'^Administrative +private-vlan +'
-                               'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
             m = p19.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1753,7 +1836,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_trunk_mappings, str):
-                p19_1 = re.compile(r'^(?P<mappings>[\w\(\)\s]+)$')
                 m = p19_1.match(line)
                 if m:
                     ret = m.groupdict()['mappings']
@@ -1763,10 +1845,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 private_trunk_mappings = None
                 continue
 
-            # Operational private-vlan: none
-            # Operational private-vlan:
-            p20 = re.compile(r'^Operational +private-vlan:'
-                               '( *(?P<private_operational>[\w\-]+))?$')
             m = p20.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
@@ -1777,9 +1855,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 private_operational = ''
                 continue
 
-            # Trunking VLANs Enabled: 200-211
-            # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
-            p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
             m = p21.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] = m.groupdict()['trunk_vlans'].lower()
@@ -1787,7 +1862,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_operational, str):
-                p20_1 = re.compile(r'^(?P<private_operational>[\w\(\)\s]+)$')
                 m = p20_1.match(line)
                 if m:
                     ret = m.groupdict()['private_operational']
@@ -1797,22 +1871,16 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 private_operational = None
                 continue
 
-            # 1111,2222,3333, 500-55,
-            p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
             m = p21_1.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] += m.groupdict()['trunk_vlans'].lower()
                 continue
 
-            # Pruning VLANs Enabled: 2-1001
-            p22 =  re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
             m = p22.match(line)
             if m:
                 ret_dict[intf]['pruning_vlans'] = m.groupdict()['pruning_vlans'].lower()
                 continue
 
-            # Capture Mode Disabled
-            p23 =  re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
             m = p23.match(line)
             if m:
                 mode = m.groupdict()['mode'].lower()
@@ -1822,15 +1890,11 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['capture_mode'] = True
                 continue
 
-            # Capture VLANs Allowed: ALL
-            p24 =  re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
             m = p24.match(line)
             if m:
                 ret_dict[intf]['capture_vlans'] = m.groupdict()['capture_vlans'].lower()
                 continue
 
-            # Protected: false
-            p25 =  re.compile(r'^Protected: +(?P<protected>\w+)$')
             m = p25.match(line)
             if m:
                 if 'false' in m.groupdict()['protected'].lower():
@@ -1839,8 +1903,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['protected'] = True
                 continue
 
-            # Unknown unicast blocked: disabled
-            p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
             m = p26.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
@@ -1849,8 +1911,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['unknown_unicast_blocked'] = True
                 continue
 
-            # Unknown multicast blocked: disabled
-            p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
             m = p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
@@ -1859,8 +1919,6 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                     ret_dict[intf]['unknown_multicast_blocked'] = True
                 continue
 
-            # Appliance trust: none
-            p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
             m = p28.match(line)
             if m:
                 if  m.groupdict()['trust'] != 'none':
@@ -1957,14 +2015,201 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
         interface_dict = {}
         unnumbered_dict = {}
+
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet2 is administratively down, line protocol is down
+        p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+                        r' +(?P<enabled>[\w\s]+),'
+                        r' +line +protocol +is +(?P<oper_status>\w+)$')
+
+        # Internet address is 192.168.76.1/24
+        p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                        r'\/(?P<prefix_length>[0-9]+))$')
+
+        # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
+        p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
+                          r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
+
+        # Secondary address 10.2.2.2/24
+        p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                          r'\/(?P<prefix_length>[0-9]+))$')
+
+        # Internet address will be negotiated using DHCP
+        # Internet address will be negotiated using IPCP
+        p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
+                          r'+using +(?P<negotiated>DHCP|IPCP)$')
+
+        # Broadcast address is 255.255.255.255
+        p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
+
+        # MTU is 1500 bytes
+        p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
+
+        # Helper address is not set
+        p5 = re.compile(r'^Helper +address +is +not +set$')
+
+        # Helper address is 10.1.1.1
+        p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
+
+        # Helper addresses are 10.1.1.1
+        p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
+
+        # 10.2.2.2
+        p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
+
+        # Directed broadcast forwarding is disabled
+        p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
+
+        # Outgoing Common access list is not set 
+        p7 = re.compile(r'^Outgoing +Common +access +list +is +'
+                        r'(?P<access_list>.+)$')
+
+        # Outgoing access list is not set
+        p8 = re.compile(r'^Outgoing +access +list +is +'
+                        r'(?P<access_list>.+)$')
+
+        # Inbound Common access list is not set
+        p9 = re.compile(r'^Inbound +Common +access +list +is +'
+                        r'(?P<access_list>.+)$')
+
+        # Inbound  access list is not set
+        p10 = re.compile(r'^Inbound +access +list +is +'
+                        r'(?P<access_list>.+)$')
+
+        # Proxy ARP is enabled
+        p11 = re.compile(r'^Proxy +ARP +is +'
+                        r'(?P<status>\w+)$')
+
+        # Local Proxy ARP is disabled
+        p12 = re.compile(r'^Local +Proxy +ARP +is +'
+                        r'(?P<status>\w+)$')
+
+        # Security level is default
+        p13 = re.compile(r'^Security +level +is +'
+                        r'(?P<level>\w+)$')
+
+        # Split horizon is enabled
+        p14 = re.compile(r'^Split +horizon +is +'
+                        r'(?P<status>\w+)$')
+
+        # ICMP redirects are always sent
+        p15 = re.compile(r'^ICMP +redirects +are +'
+                        r'(?P<sent>[\w\s]+)$')
+
+        # ICMP unreachables are always sent
+        p16 = re.compile(r'^ICMP +unreachables +are +'
+                         r'(?P<sent>[\w\s]+)$')
+
+        # ICMP mask replies are never sent
+        p17 = re.compile(r'^ICMP +mask +replies +are +'
+                         r'(?P<sent>[\w\s]+)$')
+
+        # IP fast switching is enabled
+        p18 = re.compile(r'^IP +fast +switching +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP Flow switching is disabled
+        p19 = re.compile(r'^IP +Flow +switching +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP CEF switching is enabled
+        p20 = re.compile(r'^IP +CEF +switching +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP CEF switching turbo vector
+        p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
+
+        # IP Null turbo vector
+        p22 = re.compile(r'^IP +Null +turbo +vector$')
+
+        # VPN Routing/Forwarding "Mgmt-vrf"
+        p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
+
+        # Associated unicast routing topologies:
+        #     Topology "base", operation state is UP
+        p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
+
+        p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
+                        r'operation +state +is +(?P<topo_status>\w+)$')
+
+        # IP route-cache flags are Fast, CEF
+        p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
+
+        # Router Discovery is disabled
+        p27 = re.compile(r'^Router +Discovery +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP output packet accounting is disabled
+        p28 = re.compile(r'^IP +output +packet +accounting +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP access violation accounting is disabled
+        p29 = re.compile(r'^IP +access +violation +accounting +is +'
+                         r'(?P<status>\w+)$')
+
+        # TCP/IP header compression is disabled
+        p30 = re.compile(r'^TCP\/IP +header +compression +is +'
+                         r'(?P<status>\w+)$')
+
+        # RTP/IP header compression is disabled
+        p31 = re.compile(r'^RTP\/IP +header +compression +is +'
+                         r'(?P<status>\w+)$')
+
+        # Probe proxy name replies are disabled
+        p32 = re.compile(r'^Probe +proxy +name +replies +are +'
+                         r'(?P<status>\w+)$')
+
+        # Policy routing is disabled
+        p33 = re.compile(r'^Policy +routing +is +'
+                         r'(?P<status>\w+)$')
+
+        # Network address translation is disabled
+        p34 = re.compile(r'^Network +address +translation +is +'
+                         r'(?P<status>\w+)$')
+
+        # BGP Policy Mapping is disabled
+        p35 = re.compile(r'^BGP +Policy +Mapping +is +'
+                         r'(?P<status>\w+)$')
+
+        # IPv4 WCCP Redirect outbound is disable
+        p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
+
+        # IPv4 WCCP Redirect inbound is disabled
+        p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
+
+        # IPv4 WCCP Redirect exclude is disabled
+        p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
+
+        # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+        p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
+                         r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
+                         r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+
+        # Address determined by configuration file
+        # Address determined by non-volatile memory
+        p36 = re.compile(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
+
+        # IP multicast fast switching is disabled
+        p25 = re.compile(r'^IP +multicast +fast +switching +is +'
+                         r'(?P<status>\w+)$')
+
+        # IP multicast distributed fast switching is disabled
+        p25_1 = re.compile(r'^IP +multicast +distributed +fast +switching +is +'
+                         r'(?P<status>\w+)$')
+
+        # Input features: MCI Check
+        # Input features: QoS Classification, QoS Marking, MCI Check
+        p36_1 = re.compile(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Vlan211 is up, line protocol is up
-            # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                            r' +(?P<enabled>[\w\s]+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1982,9 +2227,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 multicast_groups = []
                 continue
 
-            # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                            r'\/(?P<prefix_length>[0-9]+))$')
             m = p2.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2004,9 +2246,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
-            p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
-                              r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
             m = p2_0.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2023,9 +2262,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                              r'\/(?P<prefix_length>[0-9]+))$')
             m = p2_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2044,10 +2280,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['ipv4'][address]\
                     ['secondary'] = True
                 continue
-            # Internet address will be negotiated using DHCP
-            # Internet address will be negotiated using IPCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
-                              r'+using +(?P<negotiated>DHCP|IPCP)$')
             m = p2_2.match(line)
             if m:
                 negotiated_holder = m.groupdict()
@@ -2060,47 +2292,34 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 ipv4_dict[address]['ip'] = address
                 continue
 
-            # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 interface_dict[interface]['ipv4'][address]['broadcast_address'] = \
                     m.groupdict()['address']
                 continue
 
-            # Address determined by configuration file
-            # Address determined by non-volatile memory
-            p36 = re.compile(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
             m = p36.match(line)
             if m:
                 interface_dict[interface]['address_determined_by'] = \
                     m.groupdict()['file']
                 continue
 
-            # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
             m = p4.match(line)
             if m:
                 interface_dict[interface]['mtu'] = \
                     int(m.groupdict()['mtu'])
                 continue
 
-            # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +not +set$')
             m = p5.match(line)
             if m:
                 continue
 
-            # Helper address is 10.1.1.1
-            p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
             m = p5_0.match(line)
             if m:
                 interface_dict[interface]['helper_address'] = \
                     [m.groupdict()['address']]
                 continue
 
-            # Helper addresses are 10.1.1.1
-            p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
             m = p5_1.match(line)
             if m:
                 helper_flag = True
@@ -2111,8 +2330,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         helper_list
                 continue
             
-            # 10.2.2.2
-            p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
             m = p5_2.match(line)
             if m:
                 if helper_flag:
@@ -2121,8 +2338,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             else:
                 helper_flag = False
 
-            # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
             m = p6.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2131,8 +2346,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['directed_broadcast_forwarding'] = True                    
                 continue
 
-            # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
             m = p41.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
@@ -2144,8 +2357,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                  = sorted(multicast_groups)                              
                 continue
 
-            # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
             m = p41_1.findall(line)
             if m and multicast_groups:
                 multicast_groups.extend(m)
@@ -2153,9 +2364,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                  = sorted(multicast_groups)                              
                 continue
 
-            # Outgoing Common access list is not set 
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
             m = p7.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2163,9 +2371,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['access_list']
                 continue
 
-            # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>.+)$')
             m = p8.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2173,9 +2378,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
             m = p9.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2183,9 +2385,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound  access list is not set
-            p10 = re.compile(r'^Inbound +access +list +is +'
-                            r'(?P<access_list>.+)$')
             m = p10.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2193,9 +2392,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['access_list']
                 continue
 
-            # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
             m = p11.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2204,9 +2400,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['proxy_arp'] = True
                 continue
 
-            # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
             m = p12.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2215,17 +2408,11 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['local_proxy_arp'] = True
                 continue
 
-            # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                            r'(?P<level>\w+)$')
             m = p13.match(line)
             if m:
                 interface_dict[interface]['security_level'] = m.groupdict()['level']
                 continue
 
-            # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                            r'(?P<status>\w+)$')
             m = p14.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2234,9 +2421,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['split_horizon'] = True
                 continue
 
-            # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                            r'(?P<sent>[\w\s]+)$')
             m = p15.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2246,9 +2430,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             r'(?P<sent>[\w\s]+)$')
             m = p16.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2258,9 +2439,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             r'(?P<sent>[\w\s]+)$')
             m = p17.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2270,9 +2448,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             r'(?P<status>\w+)$')
             m = p18.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2281,9 +2456,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_fast_switching'] = True
                 continue
 
-            # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             r'(?P<status>\w+)$')
             m = p19.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2292,9 +2464,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_flow_switching'] = True
                 continue
 
-            # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             r'(?P<status>\w+)$')
             m = p20.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2303,38 +2472,27 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_cef_switching'] = True
                 continue
 
-            # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
             m = p21.match(line)
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
-            # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
             m = p22.match(line)
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
-            # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
             m = p23.match(line)
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
                 continue
 
-            # Associated unicast routing topologies:
-            #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
             m = p24.match(line)
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                            r'operation +state +is +(?P<topo_status>\w+)$')
             m = p24_1.match(line)
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
@@ -2350,9 +2508,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['topology'][topo]['status'] = m.groupdict()['topo_status'].lower()
                 continue
 
-            # IP multicast fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +fast +switching +is +'
-                             r'(?P<status>\w+)$')
             m = p25.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2361,10 +2516,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_multicast_fast_switching'] = True
                 continue
 
-            # IP multicast distributed fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +distributed +fast +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p25.match(line)
+            m = p25_1.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_multicast_distributed_fast_switching'] = False
@@ -2372,8 +2524,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_multicast_distributed_fast_switching'] = True
                 continue
 
-            # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
             m = p26.match(line)
             if m:
                 ret = m.groupdict()['flags'].split(',')
@@ -2381,9 +2531,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['ip_route_cache_flags'] = sorted(ret)                    
                 continue
 
-            # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             r'(?P<status>\w+)$')
             m = p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2392,9 +2539,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['router_discovery'] = True
                 continue
 
-            # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             r'(?P<status>\w+)$')
             m = p28.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2403,9 +2547,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_output_packet_accounting'] = True
                 continue
 
-            # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             r'(?P<status>\w+)$')
             m = p29.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2414,9 +2555,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_access_violation_accounting'] = True
                 continue
 
-            # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
             m = p30.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2425,9 +2563,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['tcp_ip_header_compression'] = True
                 continue
 
-            # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
             m = p31.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2436,9 +2571,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['rtp_ip_header_compression'] = True
                 continue
 
-            # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             r'(?P<status>\w+)$')
             m = p32.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2447,9 +2579,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['probe_proxy_name_replies'] = True
                 continue
 
-            # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             r'(?P<status>\w+)$')
             m = p33.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2458,9 +2587,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['policy_routing'] = True
                 continue
 
-            # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             r'(?P<status>\w+)$')
             m = p34.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2469,9 +2595,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['network_address_translation'] = True
                 continue
 
-            # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             r'(?P<status>\w+)$')
             m = p35.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2480,18 +2603,13 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['bgp_policy_mapping'] = True
                 continue
 
-            # Input features: MCI Check
-            # Input features: QoS Classification, QoS Marking, MCI Check
-            p36 = re.compile(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
-            m = p36.match(line)
+            m = p36_1.match(line)
             if m:
                 features = m.groupdict()['input_feature'].split(',')
                 features = [i.strip() for i in features]
                 interface_dict[interface]['input_features'] = sorted(features)
                 continue
 
-            # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
             m = p37.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2504,8 +2622,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_outbound'] = True
                 continue
 
-            # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
             m = p38.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2517,8 +2633,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_inbound'] = True
 
-            # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
             m = p39.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2530,10 +2644,6 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_exclude'] = True
 
-            # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                             r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                             r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
             m = p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
@@ -2640,14 +2750,116 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
         status_code = {'ten': 'tentative',
                        'dep': 'duplicate',
                        'pre': 'preferre'}
+
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet1/0/1 is administratively down, line protocol is down
+        p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+                         r' +(?P<enabled>[\w\s]+),'
+                         r' +line +protocol +is +(?P<oper_status>\w+)$')
+
+        # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
+        p2 = re.compile(r'^IPv6 +is +(?P<status>\w+), +'
+                         'link-local +address +is +(?P<link_local>[\w\:]+)'
+                         '( *\[(?P<type>[\w\/]+)\])?$')
+
+        # No Virtual link-local address(es):
+        # Virtual link-local address(es):
+        # FE80::5:73FF:FEA0:16 [UNA/OOD]
+        p21 = re.compile(r'^Virtual +link\-local +address\(es\)\:$')
+
+        p21_1 = re.compile(r'^(?P<ipv6>[\w\:]+)'
+                            '( *\[(?P<type>[\w\/]+)\])?$')
+
+        # Stateless address autoconfig enabled
+        p3 = re.compile(r'^Stateless +address +autoconfig +enabled$')
+
+        # Global unicast address(es):
+        #   2001:10::14:1, subnet is 2001:10::14:0/112 
+        #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
+        p4 = re.compile(r'^Global +unicast +address\(es\):$')
+
+        p4_1 = re.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
+                           '\/(?P<prefix_length>[0-9]+))'
+                           '( *\[(?P<type>[\w\/]+)\])?$')
+
+        #     valid lifetime 2591911 preferred lifetime 604711
+        p4_2 = re.compile(r'^valid +lifetime +(?P<valid>\d+) +'
+                           'preferred +lifetime +(?P<preferred>\d+)$')
+
+        # Joined group address(es):
+        #   FF02::1
+        #   FF02::1:FF14:1
+        #   FF02::1:FF28:1A71
+        p5 = re.compile(r'^Joined +group +address\(es\):$')
+
+        p5_1 = re.compile(r'^(?P<address>[\w\:]+)$')
+
+        # ICMP error messages limited to one every 100 milliseconds
+        p7 = re.compile(r'^ICMP +error +messages +limited +to +one +'
+                         'every +(?P<limited>\d+) +milliseconds$')
+
+        # ICMP redirects are enabled
+        p8 = re.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
+
+        # ICMP unreachables are sent
+        p9 = re.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
+
+        # ND DAD is enabled, number of DAD attempts: 1
+        p10 = re.compile(r'^ND +DAD +is +(?P<status>\w+), +'
+                          'number +of +DAD +attempts: +(?P<attempts>\d+)$')
+
+        # ND reachable time is 30000 milliseconds (using 30000)
+        p11 = re.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
+                          ' +\(using +(?P<use>\d+)\)$')
+
+        # ND NS retransmit interval is 1000 milliseconds
+        p12 = re.compile(r'^ND +NS +retransmit +interval +is'
+                          ' +(?P<interval>\d+) +milliseconds$')
+
+        # ND advertised reachable time is 0 (unspecified)
+        p13 = re.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
+                          ' +\((?P<dummy>\S+)\)$')
+
+        # ND advertised retransmit interval is 0 (unspecified)
+        p14 = re.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
+                          ' +\((?P<dummy>\S+)\)$')
+
+        # ND router advertisements are sent every 200 seconds
+        p15 = re.compile(r'^ND +router +advertisements +are +sent +'
+                          'every +(?P<time>\d+) +seconds$')
+
+        # ND router advertisements live for 1800 seconds
+        p16 = re.compile(r'^ND +router +advertisements +live +for +'
+                          '(?P<time>\d+) +seconds$')
+
+        # ND advertised default router preference is Medium
+        p17 = re.compile(r'^ND +advertised +default +router +preference +'
+                          'is +(?P<prefer>\w+)$')
+
+        # ND RAs are suppressed (periodic)
+        p17_1 = re.compile(r'^ND +RAs +are +suppressed.*$')
+
+        # Hosts use stateless autoconfig for addresses.
+        p18 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
+
+        # Interface is unnumbered. Using address of Loopback0
+        p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
+                          ' +(?P<unnumbered_intf>[\w\/\.]+)$')
+
+        # No global unicast address is configured
+        p20 = re.compile(r'^No +global +unicast +address +is +configured$')
+
+        # MTU is 1500 bytes
+        p6 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
+
+        # VPN Routing/Forwarding "VRF1"
+        p6_1 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Vlan211 is up, line protocol is up
-            # GigabitEthernet1/0/1 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                             r' +(?P<enabled>[\w\s]+),'
-                             r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
@@ -2666,12 +2878,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 joined_group = []
                 continue
 
-            # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
-            # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
-            # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
-            p2 = re.compile(r'^IPv6 +is +(?P<status>\w+), +'
-                             'link-local +address +is +(?P<link_local>[\w\:]+)'
-                             '( *\[(?P<type>[\w\/]+)\])?$')
             m = p2.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -2694,17 +2900,11 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6'][link_addr]['status'] = 'valid'
                 continue
 
-            # No Virtual link-local address(es):
-            # Virtual link-local address(es):
-            # FE80::5:73FF:FEA0:16 [UNA/OOD]
-            p21 = re.compile(r'^Virtual +link\-local +address\(es\)\:$')
             m = p21.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p21_1 = re.compile(r'^(?P<ipv6>[\w\:]+)'
-                                '( *\[(?P<type>[\w\/]+)\])?$')
             m = p21_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2728,25 +2928,16 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                             ret_dict[intf]['ipv6'][address]['status'] = 'valid'
                 continue
 
-            # Stateless address autoconfig enabled
-            p3 = re.compile(r'^Stateless +address +autoconfig +enabled$')
             m = p3.match(line)
             if m:
                 ret_dict[intf]['autoconf'] = True
                 continue
 
-            # Global unicast address(es):
-            #   2001:10::14:1, subnet is 2001:10::14:0/112 
-            #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
-            p4 = re.compile(r'^Global +unicast +address\(es\):$')
             m = p4.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p4_1 = re.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
-                               '\/(?P<prefix_length>[0-9]+))'
-                               '( *\[(?P<type>[\w\/]+)\])?$')
             m = p4_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2786,9 +2977,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                             ret_dict[intf]['ipv6'][address]['status'] = 'valid'
                 continue
 
-            #     valid lifetime 2591911 preferred lifetime 604711
-            p4_2 = re.compile(r'^valid +lifetime +(?P<valid>\d+) +'
-                               'preferred +lifetime +(?P<preferred>\d+)$')
             m = p4_2.match(line)
             if m and ipv6:
                 try:
@@ -2804,40 +2992,27 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                         ['preferred_lifetime'] = int(m.groupdict()['preferred'])
                 continue
 
-            # Joined group address(es):
-            #   FF02::1
-            #   FF02::1:FF14:1
-            #   FF02::1:FF28:1A71
-            p5 = re.compile(r'^Joined +group +address\(es\):$')
             m = p5.match(line)
             if m:
                 ipv6 = False
                 continue
 
-            p5_1 = re.compile(r'^(?P<address>[\w\:]+)$')
             m = p5_1.match(line)
             if m and not ipv6:
                 joined_group.append(m.groupdict()['address'])
                 ret_dict[intf]['joined_group_addresses'] = sorted(joined_group)
                 continue
 
-            # MTU is 1500 bytes
-            p6 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
             m = p6.match(line)
             if m:
                 ret_dict[intf]['mtu'] = int(m.groupdict()['mtu'])                    
                 continue
 
-            # VPN Routing/Forwarding "VRF1"
-            p6 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
-            m = p6.match(line)
+            m = p6_1.match(line)
             if m:
                 ret_dict[intf]['vrf'] = m.groupdict()['vrf']
                 continue
 
-            # ICMP error messages limited to one every 100 milliseconds
-            p7 = re.compile(r'^ICMP +error +messages +limited +to +one +'
-                             'every +(?P<limited>\d+) +milliseconds$')
             m = p7.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2848,8 +3023,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     int(m.groupdict()['limited'])                    
                 continue
 
-            # ICMP redirects are enabled
-            p8 = re.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
             m = p8.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2862,8 +3035,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6']['icmp']['redirects'] = False
                 continue
 
-            # ICMP unreachables are sent
-            p9 = re.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
             m = p9.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2874,9 +3045,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6']['icmp']['unreachables'] = m.groupdict()['status']
                 continue
 
-            # ND DAD is enabled, number of DAD attempts: 1
-            p10 = re.compile(r'^ND +DAD +is +(?P<status>\w+), +'
-                              'number +of +DAD +attempts: +(?P<attempts>\d+)$')
             m = p10.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2890,9 +3058,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['dad_attempts'] = int(m.groupdict()['attempts'])
                 continue
 
-            # ND reachable time is 30000 milliseconds (using 30000)
-            p11 = re.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
-                              ' +\(using +(?P<use>\d+)\)$')
             m = p11.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2901,9 +3066,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['using_time'] = int(m.groupdict()['use'])
                 continue
 
-            # ND NS retransmit interval is 1000 milliseconds
-            p12 = re.compile(r'^ND +NS +retransmit +interval +is'
-                              ' +(?P<interval>\d+) +milliseconds$')
             m = p12.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2911,9 +3073,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['ns_retransmit_interval'] = int(m.groupdict()['interval'])
                 continue
 
-            # ND advertised reachable time is 0 (unspecified)
-            p13 = re.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
             m = p13.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2925,9 +3084,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     nd_dict['advertised_reachable_time_unspecified'] = False
                 continue
 
-            # ND advertised retransmit interval is 0 (unspecified)
-            p14 = re.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
             m = p14.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2939,9 +3095,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     nd_dict['advertised_retransmit_interval_unspecified'] = False
                 continue
 
-            # ND router advertisements are sent every 200 seconds
-            p15 = re.compile(r'^ND +router +advertisements +are +sent +'
-                              'every +(?P<time>\d+) +seconds$')
             m = p15.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2949,9 +3102,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['router_advertisements_interval'] = int(m.groupdict()['time'])
                 continue
 
-            # ND router advertisements live for 1800 seconds
-            p16 = re.compile(r'^ND +router +advertisements +live +for +'
-                              '(?P<time>\d+) +seconds$')
             m = p16.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2959,9 +3109,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['router_advertisements_live'] = int(m.groupdict()['time'])
                 continue
 
-            # ND advertised default router preference is Medium
-            p17 = re.compile(r'^ND +advertised +default +router +preference +'
-                              'is +(?P<prefer>\w+)$')
             m = p17.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -2969,25 +3116,18 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['advertised_default_router_preference'] = m.groupdict()['prefer']
                 continue
 
-            # ND RAs are suppressed (periodic)
-            p17_1 = re.compile(r'^ND +RAs +are +suppressed.*$')
             m = p17_1.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.update({'suppress': True})
                 continue
 
-            # Hosts use stateless autoconfig for addresses.
-            p18 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
             m = p18.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
                     m.groupdict()['addr_conf_method']
                 continue
 
-            # Interface is unnumbered. Using address of Loopback0
-            p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
-                              ' +(?P<unnumbered_intf>[\w\/\.]+)$')
             m = p19.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -2998,8 +3138,6 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     Common.convert_intf_name(m.groupdict()['unnumbered_intf'])
                 continue
 
-            # No global unicast address is configured
-            p20 = re.compile(r'^No +global +unicast +address +is +configured$')
             m = p20.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -16,6 +16,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.running_config import config_section
 
 
 class ShowIsisNeighborsSchema(MetaParser):
@@ -58,11 +59,18 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
         # initial return dictionary
         ret_dict = {}
         tag_null = True
+
+        # Tag isis_net:
+        p1 = re.compile(r'^Tag +(?P<isis_name>\S+)\s*:$')
+
+        # LAB-9001-2      L1   Te0/0/26      10.239.7.29     UP    27       00
+        p2 = re.compile(r'^(?P<system_id>\S+)\s+(?P<type>\S+)\s+(?P<interface>\S+)\s+'
+                         '(?P<ip_address>\S+)\s+(?P<state>(UP|DOWN|INIT|NONE)+)\s+'
+                         '(?P<holdtime>\S+)\s+(?P<circuit_id>\S+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Tag isis_net:
-            p1 = re.compile(r'^Tag +(?P<isis_name>\S+)\s*:$')
             m = p1.match(line)
             if m:
                 isis_name = m.groupdict()['isis_name']
@@ -70,10 +78,6 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
                 tag_null = False
                 continue
 
-            # LAB-9001-2      L1   Te0/0/26      10.239.7.29     UP    27       00
-            p2 = re.compile(r'^(?P<system_id>\S+)\s+(?P<type>\S+)\s+(?P<interface>\S+)\s+'
-                             '(?P<ip_address>\S+)\s+(?P<state>(UP|DOWN|INIT|NONE)+)\s+'
-                             '(?P<holdtime>\S+)\s+(?P<circuit_id>\S+)$')
             m = p2.match(line)
             if m:
                 system_id = m.groupdict()['system_id']
@@ -553,7 +557,7 @@ class ShowRunSectionIsis(ShowRunSectionIsisSchema):
 
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            out = config_section(self.device, 'isis', self.cli_command)
         else:
             out = output
 
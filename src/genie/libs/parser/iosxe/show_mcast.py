@@ -103,13 +103,55 @@ class ShowIpMroute(ShowIpMrouteSchema):
         sub_dict = {}
         outgoing = False
 
+        # IP Multicast Routing Table
+        # Multicast Routing Table
+        p1 = re.compile(r'^(?P<address_family>[\w\W]+)? *[mM]ulticast'
+                         ' +[rR]outing +[tT]able$')
+
+        # (*, 239.1.1.1), 00:00:03/stopped, RP 10.4.1.1, flags: SPF
+        # (10.4.1.1, 239.1.1.1), 00:00:03/00:02:57, flags: PFT
+        # (*, FF07::1), 00:04:45/00:02:47, RP 2001:DB8:6::6, flags:S
+        # (2001:DB8:999::99, FF07::1), 00:02:06/00:01:23, flags:SFT
+        p2 = re.compile(r'^\((?P<source_address>[\w\:\.\*\/]+),'
+                         ' +(?P<multicast_group>[\w\:\.\/]+)\),'
+                         ' +(?P<uptime>[\w\:\.]+)\/'
+                         '(?P<expires>[\w\:\.]+),'
+                         '( +RP +(?P<rendezvous_point>[\w\:\.]+),)?'
+                         ' +flags: *(?P<flags>[A-Z]+)$')
+
+        # Incoming interface: Null, RPF nbr 224.0.0.0224.0.0.0
+        # Incoming interface: Loopback0, RPF nbr 0.0.0.0, Registering
+        p3 = re.compile(r'^Incoming +interface:'
+                         ' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
+                         ' +RPF +nbr +(?P<rpf_nbr>[\w\:\.]+)'
+                         '(, *(?P<status>\w+))?$')
+
+        # Incoming interface:Tunnel5
+        p3_1 = re.compile(r'^Incoming +interface:'
+                         ' *(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+)$')
+
+        # RPF nbr:2001:db8:90:24::6
+        p3_2 = re.compile(r'^RPF +nbr: *(?P<rpf_nbr>[\w\:\.]+)$')
+
+        # Outgoing interface list: Null
+        # Outgoing interface list:
+        p4 =  re.compile(r'^Outgoing +interface +list:'
+                          '( *(?P<intf>\w+))?$')
+
+        # Vlan5, Forward/Dense, 00:03:25/00:00:00, H
+        # Vlan5, Forward/Dense, 00:04:35/00:02:30
+        # ATM0/0, VCD 14, Forward/Sparse, 00:03:57/00:02:53
+        # POS4/0, Forward, 00:02:06/00:03:27
+        p5 = re.compile(r'^(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
+                         '( +VCD +(?P<vcd>\d+),)?'
+                         ' +(?P<state_mode>[\w\/]+),'
+                         ' +(?P<uptime>[a-zA-Z0-9\:]+)\/'
+                         '(?P<expire>[\w\:]+)'
+                         '(, *(?P<flags>\w+))?$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # IP Multicast Routing Table
-            # Multicast Routing Table
-            p1 = re.compile(r'^(?P<address_family>[\w\W]+)? *[mM]ulticast'
-                             ' +[rR]outing +[tT]able$')
             m = p1.match(line)
             if m:
                 address_family = m.groupdict()['address_family']
@@ -129,16 +171,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
                     mroute_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
 
-            # (*, 239.1.1.1), 00:00:03/stopped, RP 10.4.1.1, flags: SPF
-            # (10.4.1.1, 239.1.1.1), 00:00:03/00:02:57, flags: PFT
-            # (*, FF07::1), 00:04:45/00:02:47, RP 2001:DB8:6::6, flags:S
-            # (2001:DB8:999::99, FF07::1), 00:02:06/00:01:23, flags:SFT
-            p2 = re.compile(r'^\((?P<source_address>[\w\:\.\*\/]+),'
-                             ' +(?P<multicast_group>[\w\:\.\/]+)\),'
-                             ' +(?P<uptime>[\w\:\.]+)\/'
-                             '(?P<expires>[\w\:\.]+),'
-                             '( +RP +(?P<rendezvous_point>[\w\:\.]+),)?'
-                             ' +flags: *(?P<flags>[A-Z]+)$')
             m = p2.match(line)
             if m:
                 source_address = m.groupdict()['source_address']
@@ -181,12 +213,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
 
                 continue
 
-            # Incoming interface: Null, RPF nbr 224.0.0.0224.0.0.0
-            # Incoming interface: Loopback0, RPF nbr 0.0.0.0, Registering
-            p3 = re.compile(r'^Incoming +interface:'
-                             ' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
-                             ' +RPF +nbr +(?P<rpf_nbr>[\w\:\.]+)'
-                             '(, *(?P<status>\w+))?$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
@@ -213,9 +239,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
                         ['rpf_info'] = rpf_info.lower()
                 continue
 
-            # Incoming interface:Tunnel5
-            p3_1 = re.compile(r'^Incoming +interface:'
-                             ' *(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+)$')
             m = p3_1.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
@@ -229,8 +252,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
                     sub_dict['incoming_interface_list'][incoming_interface] = {}
                 continue
 
-            # RPF nbr:2001:db8:90:24::6
-            p3_2 = re.compile(r'^RPF +nbr: *(?P<rpf_nbr>[\w\:\.]+)$')
             m = p3_2.match(line)
             if m:
                 rpf_nbr = m.groupdict()['rpf_nbr']
@@ -241,10 +262,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
                     sub_dict['rpf_nbr'] = rpf_nbr
                 continue
 
-            # Outgoing interface list: Null
-            # Outgoing interface list:
-            p4 =  re.compile(r'^Outgoing +interface +list:'
-                              '( *(?P<intf>\w+))?$')
             m = p4.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -254,16 +271,6 @@ class ShowIpMroute(ShowIpMrouteSchema):
                     outgoing = True
                 continue
 
-            # Vlan5, Forward/Dense, 00:03:25/00:00:00, H
-            # Vlan5, Forward/Dense, 00:04:35/00:02:30
-            # ATM0/0, VCD 14, Forward/Sparse, 00:03:57/00:02:53
-            # POS4/0, Forward, 00:02:06/00:03:27
-            p5 = re.compile(r'^(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
-                             '( +VCD +(?P<vcd>\d+),)?'
-                             ' +(?P<state_mode>[\w\/]+),'
-                             ' +(?P<uptime>[a-zA-Z0-9\:]+)\/'
-                             '(?P<expire>[\w\:]+)'
-                             '(, *(?P<flags>\w+))?$')
             m = p5.match(line)
             if m and outgoing:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -365,12 +372,13 @@ class ShowIpMrouteStatic(ShowIpMrouteStaticSchema):
 
         ret_dict = {}
 
+        # Mroute: 172.16.0.0/16, RPF neighbor: 172.30.10.13, distance: 1
+        p1 = re.compile(r'^Mroute: +(?P<mroute>[\w\:\.\/]+),'
+                         ' RPF +neighbor: +(?P<rpf_nbr>[\w\.\:]+),'
+                         ' distance: +(?P<distance>\d+)$')
+
         for line in out.splitlines():
             line = line.strip()
-            # Mroute: 172.16.0.0/16, RPF neighbor: 172.30.10.13, distance: 1
-            p1 = re.compile(r'^Mroute: +(?P<mroute>[\w\:\.\/]+),'
-                             ' RPF +neighbor: +(?P<rpf_nbr>[\w\.\:]+),'
-                             ' distance: +(?P<distance>\d+)$')
                               
             m = p1.match(line)
             if m:
@@ -454,12 +462,28 @@ class ShowIpMulticast(ShowIpMulticastSchema):
 
         ret_dict = {}
 
+        # Multicast Routing: enabled
+        p1 = re.compile(r'^Multicast +Routing: +(?P<status>\w+)$')
+
+        # Multicast Route limit: No limit
+        p3 = re.compile(r'^Multicast +Route +limit: +(?P<status>[\w\s]+)$')
+
+        # Multicast Fallback group mode: Sparse
+        p4 = re.compile(r'^Multicast +Fallback +group +mode: +(?P<mode>[\w\s]+)$')
+
+        # Number of multicast boundaries configured with filter-autorp option: 0
+        p5 = re.compile(r'^Number +of +multicast +boundaries +configured +'
+                         'with +filter\-autorp +option: +(?P<num>\d+)$')
+
+        # Multicast Multipath: enabled
+        p2 = re.compile(r'^Multicast +Multipath: +(?P<status>\w+)$')
+
+        # MoFRR: Disabled
+        p2_1 = re.compile(r'^MoFRR: +(?P<status>\w+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Multicast Routing: enabled
-            p1 = re.compile(r'^Multicast +Routing: +(?P<status>\w+)$')
-                              
             m = p1.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
@@ -474,9 +498,6 @@ class ShowIpMulticast(ShowIpMulticastSchema):
                     ret_dict['vrf'][vrf]['enable'] = False
                 continue
 
-            # Multicast Multipath: enabled
-            p2 = re.compile(r'^Multicast +Multipath: +(?P<status>\w+)$')
-                              
             m = p2.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
@@ -486,38 +507,25 @@ class ShowIpMulticast(ShowIpMulticastSchema):
                     ret_dict['vrf'][vrf]['multipath'] = False
                 continue
 
-            # Multicast Route limit: No limit
-            p3 = re.compile(r'^Multicast +Route +limit: +(?P<status>[\w\s]+)$')
-                              
             m = p3.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
                 ret_dict['vrf'][vrf]['route_limit'] = status
                 continue
 
-            # Multicast Fallback group mode: Sparse
-            p4 = re.compile(r'^Multicast +Fallback +group +mode: +(?P<mode>[\w\s]+)$')
-                              
             m = p4.match(line)
             if m:
                 mode = m.groupdict()['mode'].lower()
                 ret_dict['vrf'][vrf]['fallback_group_mode'] = mode
                 continue
 
-            # Number of multicast boundaries configured with filter-autorp option: 0
-            p5 = re.compile(r'^Number +of +multicast +boundaries +configured +'
-                             'with +filter\-autorp +option: +(?P<num>\d+)$')
-                              
             m = p5.match(line)
             if m:
                 num = m.groupdict()['num']
                 ret_dict['vrf'][vrf]['multicast_bound_with_filter_autorp'] = int(num)
                 continue
 
-            # MoFRR: Disabled
-            p2 = re.compile(r'^MoFRR: +(?P<status>\w+)$')
-                              
-            m = p2.match(line)
+            m = p2_1.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
                 if 'enabled' in status:
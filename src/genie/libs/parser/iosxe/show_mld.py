@@ -80,12 +80,55 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
         # initial variables
         ret_dict = {}
 
+        # Global State Limit : 0 active out of 64000 max
+        p1 = re.compile(r'^Global +State +Limit *: +'
+                         '(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
+
+        # GigabitEthernet1 is up, line protocol is up
+        p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
+                         'line +protocol +is +(?P<oper_status>\w+)$')
+
+        # Internet address is FE80::5054:FF:FE7C:DC70/10
+        p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
+
+        # MLD is enabled on interface
+        p4 = re.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
+
+        # Current MLD version is 2
+        p5 = re.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
+
+        # MLD query interval is 366 seconds
+        p7 = re.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
+
+        # MLD querier timeout is 740 seconds
+        p9 = re.compile(r'^MLD +querier +timeout +is +'
+                         '(?P<timeout>\d+) +seconds$')
+
+        # MLD max query response time is 16 seconds
+        p11 = re.compile(r'^MLD +max +query +response +time +is +'
+                         '(?P<time>\d+) +seconds$')
+
+        # Last member query response interval is 1 seconds
+        p13 = re.compile(r'^Last +member +query +response +interval +is '
+                          '+(?P<time>\d+) +(seconds|ms)$')
+
+        # Inbound MLD access group is: test
+        p14 = re.compile(r'^Inbound +MLD +access +group +is *: +(?P<group_policy>\S+)$')
+
+        # MLD activity: 11 joins, 2 leaves
+        p15 = re.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
+
+        # Interface State Limit : 0 active out of 6400 max
+        p16 = re.compile(r'^Interface +State +Limit *: +'
+                          '(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
+
+        # MLD querying router is FE80::5054:FF:FE7C:DC70 (this system)
+        p20 = re.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)'
+                          '(?P<dummy> *\([\w\s]+\))?$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Global State Limit : 0 active out of 64000 max
-            p1 = re.compile(r'^Global +State +Limit *: +'
-                             '(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
             m = p1.match(line)
             if m:
                 max_groups = int(m.groupdict()['global_max_groups'])
@@ -98,9 +141,6 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 ret_dict['vrf'][vrf]['active_groups'] = int(m.groupdict()['active'])
                 continue
 
-            # GigabitEthernet1 is up, line protocol is up
-            p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
-                             'line +protocol +is +(?P<oper_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -120,16 +160,12 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                     m.groupdict()['intf_status'].lower()
                 continue
 
-            # Internet address is FE80::5054:FF:FE7C:DC70/10
-            p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
             m = p3.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['interface_adress'] = \
                     m.groupdict()['ip']
                 continue
 
-            # MLD is enabled on interface
-            p4 = re.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
             m = p4.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
@@ -137,58 +173,41 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                     'enable' in status else False
                 continue
             
-            # Current MLD version is 2
-            p5 = re.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
             m = p5.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['version'] = int(m.groupdict()['ver'])
                 continue
 
-            # MLD query interval is 366 seconds
-            p7 = re.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
             m = p7.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_interval'] = \
                     int(m.groupdict()['query_interval'])
                 continue
 
-            # MLD querier timeout is 740 seconds
-            p9 = re.compile(r'^MLD +querier +timeout +is +'
-                             '(?P<timeout>\d+) +seconds$')
             m = p9.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['querier_timeout'] = \
                     int(m.groupdict()['timeout'])
                 continue
 
-            # MLD max query response time is 16 seconds
-            p11 = re.compile(r'^MLD +max +query +response +time +is +'
-                             '(?P<time>\d+) +seconds$')
             m = p11.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_max_response_time'] = \
                     int(m.groupdict()['time'])
                 continue
 
-            # Last member query response interval is 1 seconds
-            p13 = re.compile(r'^Last +member +query +response +interval +is '
-                              '+(?P<time>\d+) +(seconds|ms)$')
             m = p13.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_interval'] = \
                     int(m.groupdict()['time'])
                 continue
 
-            # Inbound MLD access group is: test
-            p14 = re.compile(r'^Inbound +MLD +access +group +is *: +(?P<group_policy>\S+)$')
             m = p14.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['group_policy'] = \
                     m.groupdict()['group_policy']
                 continue
 
-            # MLD activity: 11 joins, 2 leaves
-            p15 = re.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
             m = p15.match(line)
             if m:
                 if 'counters' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -199,18 +218,12 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                     int(m.groupdict()['leaves'])
                 continue
 
-            # Interface State Limit : 0 active out of 6400 max
-            p16 = re.compile(r'^Interface +State +Limit *: +'
-                              '(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
             m = p16.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['max_groups'] = int(m.groupdict()['max'])
                 ret_dict['vrf'][vrf]['interface'][intf]['active_groups'] = int(m.groupdict()['active'])
                 continue
 
-            # MLD querying router is FE80::5054:FF:FE7C:DC70 (this system)
-            p20 = re.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)'
-                              '(?P<dummy> *\([\w\s]+\))?$')
             m = p20.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['querier'] = \
@@ -295,14 +308,42 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
         # initial variables
         ret_dict = {}
 
+        # Interface:        GigabitEthernet1
+        p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
+
+        # Group:                239.1.1.1
+        p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
+
+        # Host mode:        INCLUDE
+        p3 = re.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
+
+        # Uptime:                00:05:06
+        p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
+
+        # Router mode:        INCLUDE
+        # Router mode:        EXCLUDE (Expires: 00:06:06)
+        p5 = re.compile(r'^Router +mode: +(?P<filter_mode>\w+)'
+                         '( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
+
+        # Last reporter:        10.1.2.1
+        p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
+
+        # Source Address                          Uptime    Expires   Fwd  Flags
+        p7_1 = re.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
+
+        # 2001:DB8:2:2::2                         08:13:22  00:06:42  Yes  Remote Local 2D
+        p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
+                         '(?P<up_time>[\w\.\:]+) +'
+                         '(?P<expire>[\w\.\:]+) +'
+                         '(?P<forward>\w+) +'
+                         '(?P<flags>[\w\s]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
             # Interface:\tVlan211
             line = line.replace('\t', '    ')
 
-            # Interface:        GigabitEthernet1
-            p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
             m = p1.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -317,8 +358,6 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf] = {}
                 continue
 
-            # Group:                239.1.1.1
-            p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
@@ -328,26 +367,18 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['group'][group] = {}
                 continue
 
-            # Host mode:        INCLUDE
-            p3 = re.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
             m = p3.match(line)
             if m:
                 host_mode = m.groupdict()['host_mode']
                 ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['host_mode'] = host_mode.lower()
                 continue
 
-            # Uptime:                00:05:06
-            p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
                 ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['up_time'] = up_time
                 continue
 
-            # Router mode:        INCLUDE
-            # Router mode:        EXCLUDE (Expires: 00:06:06)
-            p5 = re.compile(r'^Router +mode: +(?P<filter_mode>\w+)'
-                             '( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
             m = p5.match(line)
             if m:
                 filter_mode = m.groupdict()['filter_mode']
@@ -357,26 +388,16 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['expire'] = expire
                 continue
 
-            # Last reporter:        10.1.2.1
-            p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
             m = p6.match(line)
             if m:
                 last_reporter = m.groupdict()['last_reporter']
                 ret_dict['vrf'][vrf]['interface'][intf]['group'][group]['last_reporter'] = last_reporter
                 continue
 
-            # Source Address                          Uptime    Expires   Fwd  Flags
-            p7_1 = re.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
             m = p7_1.match(line)
             if m:
                 continue
 
-            # 2001:DB8:2:2::2                         08:13:22  00:06:42  Yes  Remote Local 2D
-            p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
-                             '(?P<up_time>[\w\.\:]+) +'
-                             '(?P<expire>[\w\.\:]+) +'
-                             '(?P<forward>\w+) +'
-                             '(?P<flags>[\w\s]+)$')
             m = p7.match(line)
             if m:
                 source = m.groupdict()['source']
@@ -475,32 +496,39 @@ class ShowIpv6MldSsmMap(ShowIpv6MldSsmMapSchema):
         group_address = ''
         mode = database = None
 
+        # Group address: FF35:1::1
+        p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
+
+        # Database     : STATIC
+        p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
+
+        # Group mode ssm : FALSE
+        p4 = re.compile(r'^Group +mode +ssm *: +(?P<mode>\w+)$')
+
+        # Source list  : 2001:DB8:1:1::1
+        p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
+
+        # 2001:DB8::3
+        p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Group address: FF35:1::1
-            p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 group_address = m.groupdict()['group_address']
                 continue
 
-            # Database     : STATIC
-            p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
             m = p2.match(line)
             if m:
                 database = m.groupdict()['database'].lower()
                 continue
 
-            # Group mode ssm : FALSE
-            p4 = re.compile(r'^Group +mode +ssm *: +(?P<mode>\w+)$')
             m = p4.match(line)
             if m:
                 mode = False if 'false' in m.groupdict()['mode'].lower() else True
                 continue
 
-            # Source list  : 2001:DB8:1:1::1
-            p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -527,8 +555,6 @@ class ShowIpv6MldSsmMap(ShowIpv6MldSsmMapSchema):
                     ret_dict['vrf'][vrf]['ssm_map'][ssm]['group_mode_ssm'] = mode
                 continue
 
-            # 2001:DB8::3
-            p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
             m = p3_1.match(line)
             if m:
                 source_addr = m.groupdict()['source_addr']
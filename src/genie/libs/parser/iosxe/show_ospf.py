@@ -40,6 +40,8 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.dispatch import LineDispatcher, FALLTHROUGH
+from genie.libs.parser.utils.running_config import config_section
 
 # ===========================================================
 # Schema for:
@@ -1919,6 +1921,12 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         # TE Opaque LSA: Source of link information OSPF
         p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
+        # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
+        #             0       1          no          no               Base
+        p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                         ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                         ' +(?P<topo_name>(\S+))$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -2070,7 +2078,8 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
                 # Get VRF information based on OSPF instance
                 cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = config_section(self.device,
+                                     'router ospf {}'.format(instance), cmd)
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -2176,11 +2185,6 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     pass
                 continue
 
-            # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
-            #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -3004,6 +3008,12 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
         # TE Opaque LSA: Source of link information OSPF
         p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
+        # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
+        #             0       1          no          no               Base
+        p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                         ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                         ' +(?P<topo_name>(\S+))$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -3149,11 +3159,6 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     pass
                 continue
 
-            # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
-            #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -3629,7 +3634,8 @@ class ShowIpOspfLinksParser(MetaParser):
                 # Get VRF information using the ospf instance
                 if instance is not None:
                     cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = config_section(self.device,
+                                         'router ospf {}'.format(instance), cmd)
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -4334,7 +4340,8 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 # Get VRF information using the ospf instance
                 if instance is not None:
                     cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = config_section(self.device,
+                                         'router ospf {}'.format(instance), cmd)
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -5323,961 +5330,920 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         # Sub-type: Node Max Sid Depth, Value: 13
         p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
 
-        for line in out.splitlines():
-            line = line.strip()
-
-            # OSPF Router with ID (10.36.3.3) (Process ID 1)
-            # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
-            if m:
-                router_id = str(m.groupdict()['router_id'])
-                instance = str(m.groupdict()['instance'])
-                if m.groupdict()['vrf']:
-                    vrf = str(m.groupdict()['vrf'])
-                else:
-                    vrf = 'default'
-                if 'vrf' not in ret_dict:
-                    ret_dict['vrf'] = {}
-                if vrf not in ret_dict['vrf']:
-                    ret_dict['vrf'][vrf] = {}
-                if 'address_family' not in ret_dict['vrf'][vrf]:
-                    ret_dict['vrf'][vrf]['address_family'] = {}
-                if af not in ret_dict['vrf'][vrf]['address_family']:
-                    ret_dict['vrf'][vrf]['address_family'][af] = {}
-                if 'instance' not in ret_dict['vrf'][vrf]['address_family'][af]:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance'] = {}
-                if instance not in ret_dict['vrf'][vrf]['address_family'][af]\
-                        ['instance']:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance] = {}
-                continue
-
-            # Router Link States (Area 0)
-            # Net Link States (Area 1)
-            # Summary Net Link States (Area 0.0.0.0)
-            # Type-5 AS External Link States
-            # Type-10 Opaque Link Area Link States (Area 0)
-            m = p2.match(line)
-            if m:
-                lsa_type = lsa_type_mapping[db_type]
-                
-                # Set area
-                if m.groupdict()['area']:
-                    try:
-                        int(m.groupdict()['area'])
-                        area = str(IPAddress(str(m.groupdict()['area'])))
-                    except Exception:
-                        area = str(m.groupdict()['area'])
-                else:
-                    area = '0.0.0.0'
-
-                # Create dict structure
-                if 'areas' not in ret_dict['vrf'][vrf]['address_family'][af]\
-                        ['instance'][instance]:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance]['areas'] = {}
-                if area not in ret_dict['vrf'][vrf]['address_family'][af]\
-                        ['instance'][instance]['areas']:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance]['areas'][area] = {}
-                if 'database' not in ret_dict['vrf'][vrf]['address_family'][af]\
-                        ['instance'][instance]['areas'][area]:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance]['areas'][area]['database'] = {}
-                if 'lsa_types' not in ret_dict['vrf'][vrf]['address_family']\
-                        [af]['instance'][instance]['areas'][area]['database']:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance]['areas'][area]['database']['lsa_types'] = {}
-                if lsa_type not in ret_dict['vrf'][vrf]['address_family'][af]\
-                        ['instance'][instance]['areas'][area]['database']\
-                        ['lsa_types']:
-                    ret_dict['vrf'][vrf]['address_family'][af]['instance']\
-                        [instance]['areas'][area]['database']['lsa_types']\
-                        [lsa_type] = {}
-
-                # Set sub_dict
-                sub_dict = ret_dict['vrf'][vrf]['address_family'][af]\
-                            ['instance'][instance]['areas'][area]['database']\
-                            ['lsa_types'][lsa_type]
-
-                # Set lsa_type
-                sub_dict['lsa_type'] = lsa_type
-                continue
-
-            # Routing Bit Set on this LSA
-            m = p3_1.match(line)
-            if m:
-                routing_bit_enable = True
-                continue
-
-            # LS age: 1565
-            m = p3_2.match(line)
-            if m:
-                tlv_type_flag = False
-                sub_tlv_type_flag = False
-                age = int(m.groupdict()['age'])
-                continue
-
-            # LS age: MAXAGE(3601)
-            m = p3_2_1.match(line)
-            if m:
-                tlv_type_flag = False
-                sub_tlv_type_flag = False
-                age = int(m.groupdict()['age'])
-                continue
-
-            # Options: 0x20 (No TOS-capability, DC)
-            # Options: (No TOS-capability, DC)
-            m = p4.match(line)
-            if m:
-                option = str(m.groupdict()['option'])
-                option_desc = str(m.groupdict()['option_desc'])
-                continue
-
-            # LS Type: Type-5 AS-External
-            m = p5_1.match(line)
-            if m:
-                lsa_type = lsa_type_mapping[db_type]
-                continue
-
-            # Link State ID: 10.4.1.1
-            # Link State ID: 10.94.44.44 (Network address)
-            # Link State ID: 10.1.2.1 (Designated Router address)
-            # Link State ID: 10.1.2.1 (address of Designated Router)
-            m = p5_2.match(line)
-            if m:
-                lsa_id = str(m.groupdict()['lsa_id'])
-                continue
-
-            # Advertising Router: 10.64.4.4
-            m = p6.match(line)
-            if m:
-                adv_router = str(m.groupdict()['adv_router'])
-                lsa = '{} {}'.format(lsa_id, adv_router)
-                
-                # Reset counters for this lsa
-                link_tlv_counter = 0
-                unknown_tlvs_counter = 0
-
-                # Create schema structure
-                if 'lsas' not in sub_dict:
-                    sub_dict['lsas'] = {}
-                if lsa not in sub_dict['lsas']:
-                    sub_dict['lsas'][lsa] = {}
-                
-                # Set keys under 'lsa'
-                sub_dict['lsas'][lsa]['adv_router'] = adv_router
-                try:
-                    sub_dict['lsas'][lsa]['lsa_id'] = lsa_id
-                except Exception:
-                    pass
-
-                # Set db_dict
-                if 'ospfv2' not in sub_dict['lsas'][lsa]:
-                    sub_dict['lsas'][lsa]['ospfv2'] = {}
-                if 'body' not in sub_dict['lsas'][lsa]['ospfv2']:
-                    sub_dict['lsas'][lsa]['ospfv2']['body'] = {}
-                if db_type not in sub_dict['lsas'][lsa]['ospfv2']['body']:
-                    sub_dict['lsas'][lsa]['ospfv2']['body'][db_type] = {}
-                db_dict = sub_dict['lsas'][lsa]['ospfv2']['body'][db_type]
-
-                # Create 'topologies' sub_dict if 'summary' or 'database'
-                if db_type in ['summary', 'external']:
-                    if 'topologies' not in db_dict:
-                        db_dict['topologies'] = {}
-                    if default_mt_id not in db_dict['topologies']:
-                        db_dict['topologies'][default_mt_id] = {}
-                    db_topo_dict = db_dict['topologies'][default_mt_id]
-                    db_topo_dict['mt_id'] = default_mt_id
-
-                # Set header dict
-                if 'header' not in sub_dict['lsas'][lsa]['ospfv2']:
-                    sub_dict['lsas'][lsa]['ospfv2']['header'] = {}
-                header_dict = sub_dict['lsas'][lsa]['ospfv2']['header']
-
-                # Set previously parsed values
-                try:
-                    header_dict['routing_bit_enable'] = routing_bit_enable
-                    del routing_bit_enable
-                except Exception:
-                    pass
-                try:
-                    header_dict['age'] = age
-                    del age
-                except Exception:
-                    pass
-                try:
-                    header_dict['option'] = option
-                    del option
-                except Exception:
-                    pass
-                try:
-                    header_dict['option_desc'] = option_desc
-                    del option_desc
-                except Exception:
-                    pass
-                try:
-                    header_dict['type'] = lsa_type
-                    del lsa_type
-                except Exception:
-                    pass
-                try:
-                    header_dict['lsa_id'] = lsa_id
-                    del lsa_id
-                except Exception:
-                    pass
-                try:
-                    header_dict['adv_router'] = adv_router
-                    del adv_router
-                except Exception:
-                    pass
-                try:
-                    header_dict['opaque_type'] = opaque_type
-                    del opaque_type
-                except Exception:
-                    pass
-                try:
-                    header_dict['opaque_id'] = opaque_id
-                    del opaque_id
-                except Exception:
-                    pass
-
-            # LS Seq Number: 0x80000002
-            m = p7.match(line)
-            if m:
-                header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
-                continue
-
-            # Checksum: 0x7d61
-            m = p8.match(line)
-            if m:
-                header_dict['checksum'] = str(m.groupdict()['checksum'])
-                continue
-
-            # Length: 36
-            # Length : 36
-            m = p9.match(line)
-            if m:
-                length = int(m.groupdict()['length'])
-                if sub_tlv_type_flag:
-                    sub_tlv_types_dict['length'] = length
-                elif tlv_type_flag:
-                    tlv_type_dict['length'] = length
-                else:
-                    header_dict['length'] = length
-                continue
-
-            # Network Mask: /32
-            m = p10.match(line)
-            if m:
-                dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
-                db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
-                continue
-
-            # Metric Type: 2 (Larger than any link state path)
-            # Metric Type: 2 (Larger than any link state path)
-            m = p11_1.match(line)
-            if m:
-                db_topo_dict['flags'] = "E"
-                continue
-
-            # Metric Type: 1 (Comparable directly to link state metric)
-            m = p11_2.match(line)
-            if m:
-                # Do nothing
-                continue
-
-            # TOS: 0
-            # TOS: 0 Metric: 1
-            m = p12.match(line)
-            if m:
-                if db_type == 'router':
-                    if m.groupdict()['tos']:
-                        db_dict['links'][link_id]['topologies'][default_mt_id]\
-                                ['tos'] = int(m.groupdict()['tos'])
-                    if m.groupdict()['metric']:
-                        db_dict['links'][link_id]['topologies'][default_mt_id]\
-                                ['metric'] = int(m.groupdict()['metric'])
-                        continue
-                else:
-                    db_topo_dict['tos'] = int(m.groupdict()['tos'])
-                    if m.groupdict()['metric']:
-                        db_topo_dict['metric'] = int(m.groupdict()['metric'])
-                        continue
-
-            # Metric: 20
-            m = p13.match(line)
-            if m:
-                db_topo_dict['metric'] = int(m.groupdict()['metric'])
-                continue
-
-            # Forward Address: 0.0.0.0
-            m = p14.match(line)
-            if m:
-                db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
-                continue
-
-            # External Route Tag: 0
-            m = p15.match(line)
-            if m:
-                db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
-                continue
-
-            # Attached Router: 10.84.66.66
-            m = p16.match(line)
-            if m:
-                attached_router = str(m.groupdict()['att_router'])
-                if 'attached_routers' not in db_dict:
-                    db_dict['attached_routers'] = {}
-                if attached_router not in db_dict['attached_routers']:
-                    db_dict['attached_routers'][attached_router] = {}
-                continue
-
-            # Number of links: 3
-            # Number of Links: 3
-            m = p17.match(line)
-            if m:
-                db_dict['num_of_links'] = int(m.groupdict()['num'])
-                continue
-
-            # Link connected to: a Stub Network
-            m = p18.match(line)
-            if m:
-                link_type = str(m.groupdict()['type']).lower()
-                continue
-
-            # Link connected to: another Router (point-to-point)
-            m = p18_1.match(line)
-            if m:
-                if tlv_type_flag:                    
-                    sub_link_type = str(m.groupdict()['type']).lower()
-                    if 'another router' in sub_link_type:
-                        opaque_link_type = 1
-                    tlv_type_dict['link_name'] = sub_link_type
-                    tlv_type_dict['link_type'] = opaque_link_type
-                    continue
-
-                link_type = str(m.groupdict()['type']).lower()
-                continue
-
-            # (Link ID) Network/subnet number: 10.4.1.1
-            m = p19_1.match(line)
-            if m:
-                link_id = str(m.groupdict()['link_id'])
-
-                # Create dict structures
-                if 'links' not in db_dict:
-                    db_dict['links'] = {}
-                if link_id not in db_dict['links']:
-                    db_dict['links'][link_id] = {}
-                db_dict['links'][link_id]['link_id'] = link_id
-
-                # Set previously parsed values
-                try:
-                    db_dict['links'][link_id]['type'] = link_type
-                except Exception:
-                    pass
-                
-                # Create topology dict under link_id
-                if 'topologies' not in db_dict['links'][link_id]:
-                    db_dict['links'][link_id]['topologies'] = {}
-                if default_mt_id not in db_dict['links'][link_id]['topologies']:
-                    db_dict['links'][link_id]['topologies'][default_mt_id] = {}
-                db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
-                continue
-
-            # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
-            if m:
-                link_id = str(m.groupdict()['link_id'])
-
-                # If 'TLV Type' found in output this flag is set to true
-                if tlv_type_flag:
-                    tlv_type_dict['link_id'] = link_id
-                    continue
-
-                # Create dict structures
-                if 'links' not in db_dict:
-                    db_dict['links'] = {}
-                if link_id not in db_dict['links']:
-                    db_dict['links'][link_id] = {}
-                db_dict['links'][link_id]['link_id'] = link_id
-
-                # Set previously parsed values
-                try:
-                    db_dict['links'][link_id]['type'] = link_type
-                except Exception:
-                    pass
-                
-                # Create topology dict under link_id
-                if 'topologies' not in db_dict['links'][link_id]:
-                    db_dict['links'][link_id]['topologies'] = {}
-                if default_mt_id not in db_dict['links'][link_id]['topologies']:
-                    db_dict['links'][link_id]['topologies'][default_mt_id] = {}
-                db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
-                continue
-
-            # (Link ID) Neighboring Router ID: 10.151.22.22
-            m = p19_3.match(line)
-            if m:
-                link_id = str(m.groupdict()['link_id'])
-
-                if tlv_type_flag:
-                    tlv_type_dict['link_id'] = link_id
-                    continue
-
-                # Create dict structures
-                if 'links' not in db_dict:
-                    db_dict['links'] = {}
-                if link_id not in db_dict['links']:
-                    db_dict['links'][link_id] = {}
-                db_dict['links'][link_id]['link_id'] = link_id
+        # Number of TOS metrics: 0
+        p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+
+        # Set by the line handlers, used by the following lines
+        age = None
+        area = None
+        db_dict = None
+        db_topo_dict = None
+        header_dict = None
+        instance = None
+        link_id = None
+        link_tlv_counter = None
+        link_type = None
+        lsa_id = None
+        lsa_type = None
+        opaque_id = None
+        opaque_link_type = None
+        opaque_type = None
+        option = None
+        option_desc = None
+        routing_bit_enable = None
+        sub_dict = None
+        sub_tlv_types_dict = None
+        tlv_type_dict = None
+        tlv_type_field = None
+        unknown_tlvs_counter = None
+        vrf = None
+
+        dispatcher = LineDispatcher()
+
+        # OSPF Router with ID (10.36.3.3) (Process ID 1)
+        # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
+        @dispatcher.rule(p1)
+        def handle_p1(m):
+            nonlocal instance, vrf
+            router_id = str(m.groupdict()['router_id'])
+            instance = str(m.groupdict()['instance'])
+            if m.groupdict()['vrf']:
+                vrf = str(m.groupdict()['vrf'])
+            else:
+                vrf = 'default'
+            if 'vrf' not in ret_dict:
+                ret_dict['vrf'] = {}
+            if vrf not in ret_dict['vrf']:
+                ret_dict['vrf'][vrf] = {}
+            if 'address_family' not in ret_dict['vrf'][vrf]:
+                ret_dict['vrf'][vrf]['address_family'] = {}
+            if af not in ret_dict['vrf'][vrf]['address_family']:
+                ret_dict['vrf'][vrf]['address_family'][af] = {}
+            if 'instance' not in ret_dict['vrf'][vrf]['address_family'][af]:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance'] = {}
+            if instance not in ret_dict['vrf'][vrf]['address_family'][af]\
+                    ['instance']:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance] = {}
 
-                # Set previously parsed values
+        # Router Link States (Area 0)
+        # Net Link States (Area 1)
+        # Summary Net Link States (Area 0.0.0.0)
+        # Type-5 AS External Link States
+        # Type-10 Opaque Link Area Link States (Area 0)
+        @dispatcher.rule(p2)
+        def handle_p2(m):
+            nonlocal area, lsa_type, sub_dict
+            lsa_type = lsa_type_mapping[db_type]
+
+            # Set area
+            if m.groupdict()['area']:
                 try:
-                    db_dict['links'][link_id]['type'] = link_type
+                    int(m.groupdict()['area'])
+                    area = str(IPAddress(str(m.groupdict()['area'])))
                 except Exception:
-                    pass
-                
-                # Create topology dict under link_id
-                if 'topologies' not in db_dict['links'][link_id]:
-                    db_dict['links'][link_id]['topologies'] = {}
-                if default_mt_id not in db_dict['links'][link_id]['topologies']:
-                    db_dict['links'][link_id]['topologies'][default_mt_id] = {}
-                db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
-                continue
-
-            # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
-            if m:
-                db_dict['links'][link_id]['link_data'] = \
-                    str(m.groupdict()['link_data'])
-                continue
-
-            # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
-            if m:
-                db_dict['links'][link_id]['link_data'] = \
-                    str(m.groupdict()['link_data'])
-                continue
-
-            # MTID 32 Metrics: 1
-            # MTID   : 0
-            m = p21.match(line)
-            if m:
-                mtid = int(m.groupdict()['mtid'])
+                    area = str(m.groupdict()['area'])
+            else:
+                area = '0.0.0.0'
 
-                if sub_tlv_type_flag:
-                    sub_tlv_types_dict['mt_id'] = int(mtid)
-                    continue
+            # Create dict structure
+            if 'areas' not in ret_dict['vrf'][vrf]['address_family'][af]\
+                    ['instance'][instance]:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance]['areas'] = {}
+            if area not in ret_dict['vrf'][vrf]['address_family'][af]\
+                    ['instance'][instance]['areas']:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance]['areas'][area] = {}
+            if 'database' not in ret_dict['vrf'][vrf]['address_family'][af]\
+                    ['instance'][instance]['areas'][area]:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance]['areas'][area]['database'] = {}
+            if 'lsa_types' not in ret_dict['vrf'][vrf]['address_family']\
+                    [af]['instance'][instance]['areas'][area]['database']:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance]['areas'][area]['database']['lsa_types'] = {}
+            if lsa_type not in ret_dict['vrf'][vrf]['address_family'][af]\
+                    ['instance'][instance]['areas'][area]['database']\
+                    ['lsa_types']:
+                ret_dict['vrf'][vrf]['address_family'][af]['instance']\
+                    [instance]['areas'][area]['database']['lsa_types']\
+                    [lsa_type] = {}
 
-                if db_type == 'router':
-                    if mtid not in db_dict['links'][link_id]['topologies']:
-                        db_dict['links'][link_id]['topologies'][mtid] = {}
-                    db_dict['links'][link_id]['topologies'][mtid]['mt_id'] = mtid
-                    db_dict['links'][link_id]['topologies'][mtid]['metric'] = \
-                        int(m.groupdict()['metric'])
-                elif db_type == 'summary':
-                    if 'topologies' not in db_dict:
-                        db_dict['topologies'] = {}
-                    if mtid not in db_dict['topologies']:
-                        db_dict['topologies'][mtid] = {}
-                    db_topo_dict = db_dict['topologies'][mtid]
-                    db_topo_dict['mt_id'] = mtid
+            # Set sub_dict
+            sub_dict = ret_dict['vrf'][vrf]['address_family'][af]\
+                        ['instance'][instance]['areas'][area]['database']\
+                        ['lsa_types'][lsa_type]
+
+            # Set lsa_type
+            sub_dict['lsa_type'] = lsa_type
+
+        # Routing Bit Set on this LSA
+        @dispatcher.rule(p3_1)
+        def handle_p3_1(m):
+            nonlocal routing_bit_enable
+            routing_bit_enable = True
+
+        # LS age: 1565
+        @dispatcher.rule(p3_2)
+        def handle_p3_2(m):
+            nonlocal age, sub_tlv_type_flag, tlv_type_flag
+            tlv_type_flag = False
+            sub_tlv_type_flag = False
+            age = int(m.groupdict()['age'])
+
+        # LS age: MAXAGE(3601)
+        @dispatcher.rule(p3_2_1)
+        def handle_p3_2_1(m):
+            nonlocal age, sub_tlv_type_flag, tlv_type_flag
+            tlv_type_flag = False
+            sub_tlv_type_flag = False
+            age = int(m.groupdict()['age'])
+
+        # Options: 0x20 (No TOS-capability, DC)
+        # Options: (No TOS-capability, DC)
+        @dispatcher.rule(p4)
+        def handle_p4(m):
+            nonlocal option, option_desc
+            option = str(m.groupdict()['option'])
+            option_desc = str(m.groupdict()['option_desc'])
+
+        # LS Type: Type-5 AS-External
+        @dispatcher.rule(p5_1)
+        def handle_p5_1(m):
+            nonlocal lsa_type
+            lsa_type = lsa_type_mapping[db_type]
+
+        # Link State ID: 10.4.1.1
+        # Link State ID: 10.94.44.44 (Network address)
+        # Link State ID: 10.1.2.1 (Designated Router address)
+        # Link State ID: 10.1.2.1 (address of Designated Router)
+        @dispatcher.rule(p5_2)
+        def handle_p5_2(m):
+            nonlocal lsa_id
+            lsa_id = str(m.groupdict()['lsa_id'])
+
+        # Advertising Router: 10.64.4.4
+        @dispatcher.rule(p6)
+        def handle_p6(m):
+            nonlocal age, db_dict, db_topo_dict, header_dict, \
+                link_tlv_counter, lsa_id, lsa_type, opaque_id, opaque_type, \
+                option, option_desc, routing_bit_enable, unknown_tlvs_counter
+            adv_router = str(m.groupdict()['adv_router'])
+            lsa = '{} {}'.format(lsa_id, adv_router)
+
+            # Reset counters for this lsa
+            link_tlv_counter = 0
+            unknown_tlvs_counter = 0
+
+            # Create schema structure
+            if 'lsas' not in sub_dict:
+                sub_dict['lsas'] = {}
+            if lsa not in sub_dict['lsas']:
+                sub_dict['lsas'][lsa] = {}
+
+            # Set keys under 'lsa'
+            sub_dict['lsas'][lsa]['adv_router'] = adv_router
+            if lsa_id is not None:
+                sub_dict['lsas'][lsa]['lsa_id'] = lsa_id
+
+            # Set db_dict
+            if 'ospfv2' not in sub_dict['lsas'][lsa]:
+                sub_dict['lsas'][lsa]['ospfv2'] = {}
+            if 'body' not in sub_dict['lsas'][lsa]['ospfv2']:
+                sub_dict['lsas'][lsa]['ospfv2']['body'] = {}
+            if db_type not in sub_dict['lsas'][lsa]['ospfv2']['body']:
+                sub_dict['lsas'][lsa]['ospfv2']['body'][db_type] = {}
+            db_dict = sub_dict['lsas'][lsa]['ospfv2']['body'][db_type]
+
+            # Create 'topologies' sub_dict if 'summary' or 'database'
+            if db_type in ['summary', 'external']:
+                if 'topologies' not in db_dict:
+                    db_dict['topologies'] = {}
+                if default_mt_id not in db_dict['topologies']:
+                    db_dict['topologies'][default_mt_id] = {}
+                db_topo_dict = db_dict['topologies'][default_mt_id]
+                db_topo_dict['mt_id'] = default_mt_id
+
+            # Set header dict
+            if 'header' not in sub_dict['lsas'][lsa]['ospfv2']:
+                sub_dict['lsas'][lsa]['ospfv2']['header'] = {}
+            header_dict = sub_dict['lsas'][lsa]['ospfv2']['header']
+
+            # Set previously parsed values
+            if routing_bit_enable is not None:
+                header_dict['routing_bit_enable'] = routing_bit_enable
+                routing_bit_enable = None
+            if age is not None:
+                header_dict['age'] = age
+                age = None
+            if option is not None:
+                header_dict['option'] = option
+                option = None
+            if option_desc is not None:
+                header_dict['option_desc'] = option_desc
+                option_desc = None
+            if lsa_type is not None:
+                header_dict['type'] = lsa_type
+                lsa_type = None
+            if lsa_id is not None:
+                header_dict['lsa_id'] = lsa_id
+                lsa_id = None
+            header_dict['adv_router'] = adv_router
+            if opaque_type is not None:
+                header_dict['opaque_type'] = opaque_type
+                opaque_type = None
+            if opaque_id is not None:
+                header_dict['opaque_id'] = opaque_id
+                opaque_id = None
+            return FALLTHROUGH
+
+        # LS Seq Number: 0x80000002
+        @dispatcher.rule(p7)
+        def handle_p7(m):
+            header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
+
+        # Checksum: 0x7d61
+        @dispatcher.rule(p8)
+        def handle_p8(m):
+            header_dict['checksum'] = str(m.groupdict()['checksum'])
+
+        # Length: 36
+        # Length : 36
+        @dispatcher.rule(p9)
+        def handle_p9(m):
+            length = int(m.groupdict()['length'])
+            if sub_tlv_type_flag:
+                sub_tlv_types_dict['length'] = length
+            elif tlv_type_flag:
+                tlv_type_dict['length'] = length
+            else:
+                header_dict['length'] = length
+
+        # Network Mask: /32
+        @dispatcher.rule(p10)
+        def handle_p10(m):
+            dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
+            db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
+
+        # Metric Type: 2 (Larger than any link state path)
+        # Metric Type: 2 (Larger than any link state path)
+        @dispatcher.rule(p11_1)
+        def handle_p11_1(m):
+            db_topo_dict['flags'] = "E"
+
+        # Metric Type: 1 (Comparable directly to link state metric)
+        @dispatcher.rule(p11_2)
+        def handle_p11_2(m):
+            # Do nothing
+            pass
+
+        # TOS: 0
+        # TOS: 0 Metric: 1
+        @dispatcher.rule(p12)
+        def handle_p12(m):
+            if db_type == 'router':
+                if m.groupdict()['tos']:
+                    db_dict['links'][link_id]['topologies'][default_mt_id]\
+                            ['tos'] = int(m.groupdict()['tos'])
+                if m.groupdict()['metric']:
+                    db_dict['links'][link_id]['topologies'][default_mt_id]\
+                            ['metric'] = int(m.groupdict()['metric'])
+                    return
+            else:
+                db_topo_dict['tos'] = int(m.groupdict()['tos'])
+                if m.groupdict()['metric']:
                     db_topo_dict['metric'] = int(m.groupdict()['metric'])
-                continue
-
-            # Number of MTID metrics: 0
-            m = p21_1.match(line)
-            if m:
-                db_dict['links'][link_id]['num_mtid_metrics'] = \
-                    int(m.groupdict()['num'])
-                continue
-                
-            # Number of TOS metrics: 0
-            p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-            m = p21_2.match(line)
-            if m:
-                db_dict['links'][link_id]['num_tos_metrics'] = \
-                    int(m.groupdict()['num'])
-                continue
-
-            # Opaque Type: 1
-            m = p22.match(line)
-            if m:
-                opaque_type = int(m.groupdict()['type'])
-                continue
-            
-            # Opaque ID: 38
-            m = p23.match(line)
-            if m:
-                opaque_id = int(m.groupdict()['id'])
-                continue
-
-            # Fragment number: 0
-            m = p24.match(line)
-            if m:
-                header_dict['fragment_number'] = int(m.groupdict()['num'])
-                continue
-
-            # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
-            if m:
-                db_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
-                continue
-
-            # AS Boundary Router
-            m = p26_1.match(line)
-            if m:
-                header_dict['as_boundary_router'] = True
-                continue
-
-            # Area Border Router
-            m = p26_2.match(line)
-            if m:
-                header_dict['area_border_router'] = True
-                continue
-
-            # Link connected to Broadcast network
-            m = p27.match(line)
-            if m:
-                link_tlv_counter += 1
-                if 'link_tlvs' not in db_dict:
-                    db_dict['link_tlvs'] = {}
-                if link_tlv_counter not in db_dict['link_tlvs']:
-                    db_dict['link_tlvs'][link_tlv_counter] = {}
-
-                # Set link type
-                opaque_link = str(m.groupdict()['link']).lower()
-                if opaque_link == 'broadcast network':
-                    opaque_link_type = 2
-                else:
+                    return
+            return FALLTHROUGH
+
+        # Metric: 20
+        @dispatcher.rule(p13)
+        def handle_p13(m):
+            db_topo_dict['metric'] = int(m.groupdict()['metric'])
+
+        # Forward Address: 0.0.0.0
+        @dispatcher.rule(p14)
+        def handle_p14(m):
+            db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
+
+        # External Route Tag: 0
+        @dispatcher.rule(p15)
+        def handle_p15(m):
+            db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
+
+        # Attached Router: 10.84.66.66
+        @dispatcher.rule(p16)
+        def handle_p16(m):
+            attached_router = str(m.groupdict()['att_router'])
+            if 'attached_routers' not in db_dict:
+                db_dict['attached_routers'] = {}
+            if attached_router not in db_dict['attached_routers']:
+                db_dict['attached_routers'][attached_router] = {}
+
+        # Number of links: 3
+        # Number of Links: 3
+        @dispatcher.rule(p17)
+        def handle_p17(m):
+            db_dict['num_of_links'] = int(m.groupdict()['num'])
+
+        # Link connected to: a Stub Network
+        @dispatcher.rule(p18)
+        def handle_p18(m):
+            nonlocal link_type
+            link_type = str(m.groupdict()['type']).lower()
+
+        # Link connected to: another Router (point-to-point)
+        @dispatcher.rule(p18_1)
+        def handle_p18_1(m):
+            nonlocal link_type, opaque_link_type
+            if tlv_type_flag:                    
+                sub_link_type = str(m.groupdict()['type']).lower()
+                if 'another router' in sub_link_type:
                     opaque_link_type = 1
-                db_dict['link_tlvs'][link_tlv_counter]\
-                    ['link_type'] = opaque_link_type
-                db_dict['link_tlvs'][link_tlv_counter]\
-                    ['link_name'] = opaque_link
-                
-                # Set remote_if_ipv4_addrs (if needed)
-                if opaque_link_type == 2:
-                    if 'remote_if_ipv4_addrs' not in db_dict['link_tlvs']\
-                            [link_tlv_counter]:
-                        db_dict['link_tlvs'][link_tlv_counter]\
-                            ['remote_if_ipv4_addrs'] = {}
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['remote_if_ipv4_addrs']['0.0.0.0'] = {}
-                continue
+                tlv_type_dict['link_name'] = sub_link_type
+                tlv_type_dict['link_type'] = opaque_link_type
+                return
+
+            link_type = str(m.groupdict()['type']).lower()
+
+        # (Link ID) Network/subnet number: 10.4.1.1
+        @dispatcher.rule(p19_1)
+        def handle_p19_1(m):
+            nonlocal link_id
+            link_id = str(m.groupdict()['link_id'])
+
+            # Create dict structures
+            if 'links' not in db_dict:
+                db_dict['links'] = {}
+            if link_id not in db_dict['links']:
+                db_dict['links'][link_id] = {}
+            db_dict['links'][link_id]['link_id'] = link_id
+
+            # Set previously parsed values
+            if link_type is not None:
+                db_dict['links'][link_id]['type'] = link_type
+
+            # Create topology dict under link_id
+            if 'topologies' not in db_dict['links'][link_id]:
+                db_dict['links'][link_id]['topologies'] = {}
+            if default_mt_id not in db_dict['links'][link_id]['topologies']:
+                db_dict['links'][link_id]['topologies'][default_mt_id] = {}
+            db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
+
+        # (Link ID) Designated Router address: 10.166.7.6
+        @dispatcher.rule(p19_2)
+        def handle_p19_2(m):
+            nonlocal link_id
+            link_id = str(m.groupdict()['link_id'])
+
+            # If 'TLV Type' found in output this flag is set to true
+            if tlv_type_flag:
+                tlv_type_dict['link_id'] = link_id
+                return
+
+            # Create dict structures
+            if 'links' not in db_dict:
+                db_dict['links'] = {}
+            if link_id not in db_dict['links']:
+                db_dict['links'][link_id] = {}
+            db_dict['links'][link_id]['link_id'] = link_id
+
+            # Set previously parsed values
+            if link_type is not None:
+                db_dict['links'][link_id]['type'] = link_type
+
+            # Create topology dict under link_id
+            if 'topologies' not in db_dict['links'][link_id]:
+                db_dict['links'][link_id]['topologies'] = {}
+            if default_mt_id not in db_dict['links'][link_id]['topologies']:
+                db_dict['links'][link_id]['topologies'][default_mt_id] = {}
+            db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
+
+        # (Link ID) Neighboring Router ID: 10.151.22.22
+        @dispatcher.rule(p19_3)
+        def handle_p19_3(m):
+            nonlocal link_id
+            link_id = str(m.groupdict()['link_id'])
+
+            if tlv_type_flag:
+                tlv_type_dict['link_id'] = link_id
+                return
+
+            # Create dict structures
+            if 'links' not in db_dict:
+                db_dict['links'] = {}
+            if link_id not in db_dict['links']:
+                db_dict['links'][link_id] = {}
+            db_dict['links'][link_id]['link_id'] = link_id
+
+            # Set previously parsed values
+            if link_type is not None:
+                db_dict['links'][link_id]['type'] = link_type
+
+            # Create topology dict under link_id
+            if 'topologies' not in db_dict['links'][link_id]:
+                db_dict['links'][link_id]['topologies'] = {}
+            if default_mt_id not in db_dict['links'][link_id]['topologies']:
+                db_dict['links'][link_id]['topologies'][default_mt_id] = {}
+            db_dict['links'][link_id]['topologies'][default_mt_id]['mt_id'] = default_mt_id
+
+        # (Link Data) Network Mask: 255.255.255.255
+        @dispatcher.rule(p20_1)
+        def handle_p20_1(m):
+            db_dict['links'][link_id]['link_data'] = \
+                str(m.groupdict()['link_data'])
+
+        # (Link Data) Router Interface address: 10.166.7.6
+        @dispatcher.rule(p20_2)
+        def handle_p20_2(m):
+            db_dict['links'][link_id]['link_data'] = \
+                str(m.groupdict()['link_data'])
 
-            # Link ID : 10.1.4.4
-            m = p28.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
-                    str(m.groupdict()['id'])
-                continue
+        # MTID 32 Metrics: 1
+        # MTID   : 0
+        @dispatcher.rule(p21)
+        def handle_p21(m):
+            nonlocal db_topo_dict
+            mtid = int(m.groupdict()['mtid'])
+
+            if sub_tlv_type_flag:
+                sub_tlv_types_dict['mt_id'] = int(mtid)
+                return
+
+            if db_type == 'router':
+                if mtid not in db_dict['links'][link_id]['topologies']:
+                    db_dict['links'][link_id]['topologies'][mtid] = {}
+                db_dict['links'][link_id]['topologies'][mtid]['mt_id'] = mtid
+                db_dict['links'][link_id]['topologies'][mtid]['metric'] = \
+                    int(m.groupdict()['metric'])
+            elif db_type == 'summary':
+                if 'topologies' not in db_dict:
+                    db_dict['topologies'] = {}
+                if mtid not in db_dict['topologies']:
+                    db_dict['topologies'][mtid] = {}
+                db_topo_dict = db_dict['topologies'][mtid]
+                db_topo_dict['mt_id'] = mtid
+                db_topo_dict['metric'] = int(m.groupdict()['metric'])
 
-            # Interface Address : 10.1.4.1
-            m = p29.match(line)
-            if m:
-                addr = str(m.groupdict()['addr'])
-                if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
+        # Number of MTID metrics: 0
+        @dispatcher.rule(p21_1)
+        def handle_p21_1(m):
+            db_dict['links'][link_id]['num_mtid_metrics'] = \
+                int(m.groupdict()['num'])
+
+        @dispatcher.rule(p21_2)
+        def handle_p21_2(m):
+            db_dict['links'][link_id]['num_tos_metrics'] = \
+                int(m.groupdict()['num'])
+
+        # Opaque Type: 1
+        @dispatcher.rule(p22)
+        def handle_p22(m):
+            nonlocal opaque_type
+            opaque_type = int(m.groupdict()['type'])
+
+        # Opaque ID: 38
+        @dispatcher.rule(p23)
+        def handle_p23(m):
+            nonlocal opaque_id
+            opaque_id = int(m.groupdict()['id'])
+
+        # Fragment number: 0
+        @dispatcher.rule(p24)
+        def handle_p24(m):
+            header_dict['fragment_number'] = int(m.groupdict()['num'])
+
+        # MPLS TE router ID : 10.4.1.1
+        @dispatcher.rule(p25)
+        def handle_p25(m):
+            db_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
+
+        # AS Boundary Router
+        @dispatcher.rule(p26_1)
+        def handle_p26_1(m):
+            header_dict['as_boundary_router'] = True
+
+        # Area Border Router
+        @dispatcher.rule(p26_2)
+        def handle_p26_2(m):
+            header_dict['area_border_router'] = True
+
+        # Link connected to Broadcast network
+        @dispatcher.rule(p27)
+        def handle_p27(m):
+            nonlocal link_tlv_counter, opaque_link_type
+            link_tlv_counter += 1
+            if 'link_tlvs' not in db_dict:
+                db_dict['link_tlvs'] = {}
+            if link_tlv_counter not in db_dict['link_tlvs']:
+                db_dict['link_tlvs'][link_tlv_counter] = {}
+
+            # Set link type
+            opaque_link = str(m.groupdict()['link']).lower()
+            if opaque_link == 'broadcast network':
+                opaque_link_type = 2
+            else:
+                opaque_link_type = 1
+            db_dict['link_tlvs'][link_tlv_counter]\
+                ['link_type'] = opaque_link_type
+            db_dict['link_tlvs'][link_tlv_counter]\
+                ['link_name'] = opaque_link
+
+            # Set remote_if_ipv4_addrs (if needed)
+            if opaque_link_type == 2:
+                if 'remote_if_ipv4_addrs' not in db_dict['link_tlvs']\
                         [link_tlv_counter]:
                     db_dict['link_tlvs'][link_tlv_counter]\
-                        ['local_if_ipv4_addrs'] = {}
-                if addr not in db_dict['link_tlvs'][link_tlv_counter]\
-                        ['local_if_ipv4_addrs']:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['local_if_ipv4_addrs'][addr] = {}
-                    continue
-
-            # Admin Metric : 1
-            m = p30.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
-                    int(m.groupdict()['te_metric'])
-                continue
-
-            # Maximum Bandwidth : 125000000
-            # Maximum bandwidth : 125000000
-            m = p31.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
-                    int(m.groupdict()['max_band'])
-                continue
-
-            # Maximum reservable bandwidth : 93750000
-            # Maximum reservable bandwidth global: 93750000
-            m = p32.match(line)
-            if m:
+                        ['remote_if_ipv4_addrs'] = {}
                 db_dict['link_tlvs'][link_tlv_counter]\
-                    ['max_reservable_bandwidth'] = \
-                    int(m.groupdict()['max_res_band'])
-                continue
-
-            # Affinity Bit : 0x0
-            m = p33.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
-                    str(m.groupdict()['admin_group'])
-                continue
-
-            # IGP Metric : 1
-            m = p33_1.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['igp_metric'] = \
-                    int(m.groupdict()['igp_metric'])
-                continue
-
-            # Number of Priority : 8
-            m = p33_2.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['total_priority'] = \
-                    int(m.groupdict()['num'])
-                continue
-            
-            # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
-            if m:
-                value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
-                value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
-                if 'unreserved_bandwidths' not in db_dict['link_tlvs']\
-                        [link_tlv_counter]:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'] = {}
-                if value1 not in db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths']:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value1] = {}
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value1]['priority'] = \
-                        int(m.groupdict()['num1'])
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value1]\
-                        ['unreserved_bandwidth'] = int(m.groupdict()['band1'])
-                if value2 not in db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths']:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value2] = {}
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value2]['priority'] = \
-                            int(m.groupdict()['num2'])
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['unreserved_bandwidths'][value2]\
-                        ['unreserved_bandwidth'] = int(m.groupdict()['band2'])
-                    continue
-
-            # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
-            if m:
-                unknown_tlvs_counter += 1
-                if 'unknown_tlvs' not in db_dict['link_tlvs'][link_tlv_counter]:
-                    db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs'] = {}
-                if unknown_tlvs_counter not in db_dict['link_tlvs']\
-                        [link_tlv_counter]['unknown_tlvs']:
-                    db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
-                        [unknown_tlvs_counter] = {}
-                db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
-                    [unknown_tlvs_counter]['type'] = int(m.groupdict()['type'])
-                db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
-                    [unknown_tlvs_counter]['length'] = int(m.groupdict()['length'])
+                    ['remote_if_ipv4_addrs']['0.0.0.0'] = {}
+
+        # Link ID : 10.1.4.4
+        @dispatcher.rule(p28)
+        def handle_p28(m):
+            db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
+                str(m.groupdict()['id'])
+
+        # Interface Address : 10.1.4.1
+        @dispatcher.rule(p29)
+        def handle_p29(m):
+            addr = str(m.groupdict()['addr'])
+            if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
+                    [link_tlv_counter]:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['local_if_ipv4_addrs'] = {}
+            if addr not in db_dict['link_tlvs'][link_tlv_counter]\
+                    ['local_if_ipv4_addrs']:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['local_if_ipv4_addrs'][addr] = {}
+                return
+            return FALLTHROUGH
+
+        # Admin Metric : 1
+        @dispatcher.rule(p30)
+        def handle_p30(m):
+            db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
+                int(m.groupdict()['te_metric'])
+
+        # Maximum Bandwidth : 125000000
+        # Maximum bandwidth : 125000000
+        @dispatcher.rule(p31)
+        def handle_p31(m):
+            db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
+                int(m.groupdict()['max_band'])
+
+        # Maximum reservable bandwidth : 93750000
+        # Maximum reservable bandwidth global: 93750000
+        @dispatcher.rule(p32)
+        def handle_p32(m):
+            db_dict['link_tlvs'][link_tlv_counter]\
+                ['max_reservable_bandwidth'] = \
+                int(m.groupdict()['max_res_band'])
+
+        # Affinity Bit : 0x0
+        @dispatcher.rule(p33)
+        def handle_p33(m):
+            db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
+                str(m.groupdict()['admin_group'])
+
+        # IGP Metric : 1
+        @dispatcher.rule(p33_1)
+        def handle_p33_1(m):
+            db_dict['link_tlvs'][link_tlv_counter]['igp_metric'] = \
+                int(m.groupdict()['igp_metric'])
+
+        # Number of Priority : 8
+        @dispatcher.rule(p33_2)
+        def handle_p33_2(m):
+            db_dict['link_tlvs'][link_tlv_counter]['total_priority'] = \
+                int(m.groupdict()['num'])
+
+        # Priority 0 : 93750000    Priority 1 : 93750000
+        @dispatcher.rule(p34)
+        def handle_p34(m):
+            value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
+            value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
+            if 'unreserved_bandwidths' not in db_dict['link_tlvs']\
+                    [link_tlv_counter]:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'] = {}
+            if value1 not in db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths']:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value1] = {}
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value1]['priority'] = \
+                    int(m.groupdict()['num1'])
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value1]\
+                    ['unreserved_bandwidth'] = int(m.groupdict()['band1'])
+            if value2 not in db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths']:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value2] = {}
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value2]['priority'] = \
+                        int(m.groupdict()['num2'])
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['unreserved_bandwidths'][value2]\
+                    ['unreserved_bandwidth'] = int(m.groupdict()['band2'])
+                return
+            return FALLTHROUGH
+
+        # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
+        @dispatcher.rule(p35)
+        def handle_p35(m):
+            nonlocal unknown_tlvs_counter
+            unknown_tlvs_counter += 1
+            if 'unknown_tlvs' not in db_dict['link_tlvs'][link_tlv_counter]:
+                db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs'] = {}
+            if unknown_tlvs_counter not in db_dict['link_tlvs']\
+                    [link_tlv_counter]['unknown_tlvs']:
                 db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
-                    [unknown_tlvs_counter]['value'] = str(m.groupdict()['value'])
-                continue
-
-            # Extended Administrative Group : Length: 8
-            m = p36.match(line)
-            if m:
-                if 'extended_admin_group' not in db_dict['link_tlvs']\
-                        [link_tlv_counter]:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['extended_admin_group'] = {}
-                db_dict['link_tlvs'][link_tlv_counter]['extended_admin_group']\
-                    ['length'] = int(m.groupdict()['eag_length'])
-                continue
-
-            # EAG[0]: 0
-            m = p37.match(line)
-            if m:
-                group_num = int(m.groupdict()['group_num'])
-                if 'groups' not in db_dict['link_tlvs'][link_tlv_counter]\
-                        ['extended_admin_group']:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['extended_admin_group']['groups'] = {}
-                if group_num not in db_dict['link_tlvs'][link_tlv_counter]\
-                    ['extended_admin_group']['groups']:
-                    db_dict['link_tlvs'][link_tlv_counter]\
-                        ['extended_admin_group']['groups'][group_num] = {}
-                db_dict['link_tlvs'][link_tlv_counter]['extended_admin_group']\
-                    ['groups'][group_num]['value'] = int(m.groupdict()['val'])
-                continue
-
-            # Neighbor Address : 192.168.220.2
-            m = p38.match(line)
-            if m:
-                db_dict['link_tlvs'][link_tlv_counter]['remote_if_ipv4_addrs'] = {m.groupdict()['neighbor_address']: {}}
-                
-                continue
-
-            # TLV Type: Extended Link
-            # TLV Type: Segment Routing Node MSD
-            m = p39.match(line)
-            if m:
-                tlv_type_flag = True
-                sub_tlv_type_flag = False
-
-                group = m.groupdict()
-                tlv_type = group['tlv_type']
-                
-                # Router Information
-                if p39_1.match(tlv_type):
-                    tlv_type_field = 'router_capabilities_tlv'
-
-                # Segment Routing Algorithm
-                elif p39_2.match(tlv_type):
-                    tlv_type_field = 'sr_algorithm_tlv'
-
-                # Segment Routing Range
-                elif p39_3.match(tlv_type):
-                    tlv_type_field = 'sid_range_tlvs'
-
-                # Segment Routing Node MSD
-                elif p39_4.match(tlv_type):
-                    tlv_type_field = 'node_msd_tlvs'
-
-                # Segment Routing Local Block
-                elif p39_5.match(tlv_type):
-                    tlv_type_field = 'local_block_tlvs'
-
-                # Extended Prefix
-                elif p39_6.match(tlv_type):
-                    tlv_type_field = 'extended_prefix_tlvs'
-
-                # Extended Link
-                elif p39_7.match(tlv_type):
-                    tlv_type_field = 'extended_link_tlvs'
-                
-                tlv_types_index = db_dict.get(tlv_type_field, {}).keys()
-
-                if tlv_types_index:
-                    index = max(tlv_types_index) + 1
-                else:
-                    index = 1
-                
-                tlv_type_dict = db_dict\
-                    .setdefault(tlv_type_field, {})\
-                    .setdefault(index, {})
-
-                tlv_type_dict['tlv_type'] = tlv_type
-
-                continue
-
-            if 'Capabilities' in line:                
-                capabilities_flag = True
-                continue
-
-            if capabilities_flag:
-
-                if not line:
-                    capabilities_flag = False
-                    continue
-                capability_field = None
-
-                # Graceful Restart Helper
-                if p55.match(line):
-                    capability_field = 'graceful_restart_helper'
-
-                # Stub Router Support
-                elif p56.match(line):
-                    capability_field = 'stub_router'
-
-                if not capability_field:
-                    continue
+                    [unknown_tlvs_counter] = {}
+            db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
+                [unknown_tlvs_counter]['type'] = int(m.groupdict()['type'])
+            db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
+                [unknown_tlvs_counter]['length'] = int(m.groupdict()['length'])
+            db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
+                [unknown_tlvs_counter]['value'] = str(m.groupdict()['value'])
+
+        # Extended Administrative Group : Length: 8
+        @dispatcher.rule(p36)
+        def handle_p36(m):
+            if 'extended_admin_group' not in db_dict['link_tlvs']\
+                    [link_tlv_counter]:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['extended_admin_group'] = {}
+            db_dict['link_tlvs'][link_tlv_counter]['extended_admin_group']\
+                ['length'] = int(m.groupdict()['eag_length'])
+
+        # EAG[0]: 0
+        @dispatcher.rule(p37)
+        def handle_p37(m):
+            group_num = int(m.groupdict()['group_num'])
+            if 'groups' not in db_dict['link_tlvs'][link_tlv_counter]\
+                    ['extended_admin_group']:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['extended_admin_group']['groups'] = {}
+            if group_num not in db_dict['link_tlvs'][link_tlv_counter]\
+                ['extended_admin_group']['groups']:
+                db_dict['link_tlvs'][link_tlv_counter]\
+                    ['extended_admin_group']['groups'][group_num] = {}
+            db_dict['link_tlvs'][link_tlv_counter]['extended_admin_group']\
+                ['groups'][group_num]['value'] = int(m.groupdict()['val'])
 
-                capabilities_dict = tlv_type_dict\
-                    .setdefault('information_capabilities', {})                    
+        # Neighbor Address : 192.168.220.2
+        @dispatcher.rule(p38)
+        def handle_p38(m):
+            db_dict['link_tlvs'][link_tlv_counter]['remote_if_ipv4_addrs'] = {m.groupdict()['neighbor_address']: {}}
+
+        # TLV Type: Extended Link
+        # TLV Type: Segment Routing Node MSD
+        @dispatcher.rule(p39)
+        def handle_p39(m):
+            nonlocal sub_tlv_type_flag, tlv_type_dict, tlv_type_field, \
+                tlv_type_flag
+            tlv_type_flag = True
+            sub_tlv_type_flag = False
+
+            group = m.groupdict()
+            tlv_type = group['tlv_type']
+
+            # Router Information
+            if p39_1.match(tlv_type):
+                tlv_type_field = 'router_capabilities_tlv'
+
+            # Segment Routing Algorithm
+            elif p39_2.match(tlv_type):
+                tlv_type_field = 'sr_algorithm_tlv'
+
+            # Segment Routing Range
+            elif p39_3.match(tlv_type):
+                tlv_type_field = 'sid_range_tlvs'
+
+            # Segment Routing Node MSD
+            elif p39_4.match(tlv_type):
+                tlv_type_field = 'node_msd_tlvs'
+
+            # Segment Routing Local Block
+            elif p39_5.match(tlv_type):
+                tlv_type_field = 'local_block_tlvs'
+
+            # Extended Prefix
+            elif p39_6.match(tlv_type):
+                tlv_type_field = 'extended_prefix_tlvs'
+
+            # Extended Link
+            elif p39_7.match(tlv_type):
+                tlv_type_field = 'extended_link_tlvs'
+
+            tlv_types_index = db_dict.get(tlv_type_field, {}).keys()
+
+            if tlv_types_index:
+                index = max(tlv_types_index) + 1
+            else:
+                index = 1
 
-                capabilities_dict[capability_field] = True
+            tlv_type_dict = db_dict\
+                .setdefault(tlv_type_field, {})\
+                .setdefault(index, {})
 
-                continue
+            tlv_type_dict['tlv_type'] = tlv_type
 
-            # Algorithm: SPF
-            # Algorithm: Strict SPF
-            m = p40.match(line)
-            if m:
-                group = m.groupdict()
-                algorithm = group['algorithm']
-                algorithm = algorithm.strip()
+        # Router Information Capabilities:
+        @dispatcher.rule(lambda line: 'Capabilities' in line)
+        def handle_capabilities(m):
+            nonlocal capabilities_flag
+            capabilities_flag = True
 
-                if sub_tlv_type_flag:
-                    sub_tlv_types_dict['algo'] = algorithm
-                    continue
+        # Capability lines, until the first empty line
+        @dispatcher.rule(lambda line: capabilities_flag)
+        def handle_capability(m):
+            nonlocal capabilities_flag
 
-                algo_field = None
+            if not line:
+                capabilities_flag = False
+                return
+            capability_field = None
 
-                # SPF
-                if p57.match(algorithm):
-                    algo_field = 'spf'
+            # Graceful Restart Helper
+            if p55.match(line):
+                capability_field = 'graceful_restart_helper'
 
-                # Strict SPF
-                if p58.match(algorithm):
-                    algo_field = 'strict_spf'
+            # Stub Router Support
+            elif p56.match(line):
+                capability_field = 'stub_router'
 
-                if not algo_field:
-                    continue
+            if not capability_field:
+                return
 
-                algorithm_dict = tlv_type_dict.setdefault('algorithm', {})
-                algorithm_dict[algo_field] = True
+            capabilities_dict = tlv_type_dict\
+                .setdefault('information_capabilities', {})                    
 
-                continue
+            capabilities_dict[capability_field] = True
 
-            # Range Size: 1000
-            m = p41.match(line)
-            if m:
-                group = m.groupdict()
-                range_size = group['range_size']
-                tlv_type_dict['range_size'] = int(range_size)
-
-                continue
-
-            # Flags  : L-Bit, V-bit
-            m = p42.match(line)
-            if m:
-                group = m.groupdict()
-                flags = group['flags']
+        # Algorithm: SPF
+        # Algorithm: Strict SPF
+        @dispatcher.rule(p40)
+        def handle_p40(m):
+            group = m.groupdict()
+            algorithm = group['algorithm']
+            algorithm = algorithm.strip()
 
-                if sub_tlv_type_flag:
-                    sub_tlv_types_dict['flags'] = flags
-                    continue 
+            if sub_tlv_type_flag:
+                sub_tlv_types_dict['algo'] = algorithm
+                return
 
-                tlv_type_dict['flags'] = flags
+            algo_field = None
 
-                continue
+            # SPF
+            if p57.match(algorithm):
+                algo_field = 'spf'
 
-            # Weight : 0
-            m = p44.match(line)
-            if m:                
-                group = m.groupdict()
-                weight = int(group['weight'])
+            # Strict SPF
+            if p58.match(algorithm):
+                algo_field = 'strict_spf'
 
-                if sub_tlv_type_flag:
-                    sub_tlv_types_dict['weight'] = weight
-                    continue
+            if not algo_field:
+                return
 
-                tlv_type_dict['weight'] = weight
+            algorithm_dict = tlv_type_dict.setdefault('algorithm', {})
+            algorithm_dict[algo_field] = True
 
-                continue
+        # Range Size: 1000
+        @dispatcher.rule(p41)
+        def handle_p41(m):
+            group = m.groupdict()
+            range_size = group['range_size']
+            tlv_type_dict['range_size'] = int(range_size)
 
-            # Label  : 19
-            m = p45.match(line)
-            if m:
-                group = m.groupdict()
-                label = group['label']
+        # Flags  : L-Bit, V-bit
+        @dispatcher.rule(p42)
+        def handle_p42(m):
+            group = m.groupdict()
+            flags = group['flags']
 
-                sub_tlv_types_dict['label'] = int(label)                                
+            if sub_tlv_type_flag:
+                sub_tlv_types_dict['flags'] = flags
+                return 
 
-                continue
+            tlv_type_dict['flags'] = flags
 
-            # (Link Data) Interface IP address: 192.168.220.1
-            m = p46.match(line)
-            if m:
-                group = m.groupdict()
-                tlv_type_dict['link_data'] = group['link_data']
+        # Weight : 0
+        @dispatcher.rule(p44)
+        def handle_p44(m):
+            group = m.groupdict()
+            weight = int(group['weight'])
 
-                continue
+            if sub_tlv_type_flag:
+                sub_tlv_types_dict['weight'] = weight
+                return
 
-            # Prefix    : 10.4.1.1/32
-            m = p47.match(line)
-            if m:
-                group = m.groupdict()
-                prefix = group['prefix']
+            tlv_type_dict['weight'] = weight
 
-                tlv_type_dict['prefix'] = prefix
+        # Label  : 19
+        @dispatcher.rule(p45)
+        def handle_p45(m):
+            group = m.groupdict()
+            label = group['label']
 
-                continue
+            sub_tlv_types_dict['label'] = int(label)                                
 
-            # AF        : 0
-            m = p48.match(line)
-            if m:
-                group = m.groupdict()
-                af = int(group['af'])
+        # (Link Data) Interface IP address: 192.168.220.1
+        @dispatcher.rule(p46)
+        def handle_p46(m):
+            group = m.groupdict()
+            tlv_type_dict['link_data'] = group['link_data']
 
-                tlv_type_dict['af'] = af
+        # Prefix    : 10.4.1.1/32
+        @dispatcher.rule(p47)
+        def handle_p47(m):
+            group = m.groupdict()
+            prefix = group['prefix']
 
-                continue
+            tlv_type_dict['prefix'] = prefix
 
-            # Route-type: Intra
-            m = p49.match(line)
-            if m:
-                group = m.groupdict()
-                route_type = group['route_type']            
+        # AF        : 0
+        @dispatcher.rule(p48)
+        def handle_p48(m):
+            nonlocal af
+            group = m.groupdict()
+            af = int(group['af'])
 
-                tlv_type_dict['route_type'] = route_type
+            tlv_type_dict['af'] = af
 
-                continue
+        # Route-type: Intra
+        @dispatcher.rule(p49)
+        def handle_p49(m):
+            group = m.groupdict()
+            route_type = group['route_type']            
 
-            # Sub-TLV Type: Remote Intf Addr
-            # Sub-TLV Type: Local / Remote Intf ID
-            m = p50.match(line)
-            if m:
-                tlv_type_flag = False
-                sub_tlv_type_flag = True
-                group = m.groupdict()
-                sub_tlv_type = group['sub_tlv_type']
+            tlv_type_dict['route_type'] = route_type
 
-                sub_tlv_types_index = tlv_type_dict.get('sub_tlvs', {}).keys()
-                if sub_tlv_types_index:
-                    index = max(sub_tlv_types_index) + 1
-                else:
-                    index = 1
+        # Sub-TLV Type: Remote Intf Addr
+        # Sub-TLV Type: Local / Remote Intf ID
+        @dispatcher.rule(p50)
+        def handle_p50(m):
+            nonlocal sub_tlv_type_flag, sub_tlv_types_dict, tlv_type_flag
+            tlv_type_flag = False
+            sub_tlv_type_flag = True
+            group = m.groupdict()
+            sub_tlv_type = group['sub_tlv_type']
+
+            sub_tlv_types_index = tlv_type_dict.get('sub_tlvs', {}).keys()
+            if sub_tlv_types_index:
+                index = max(sub_tlv_types_index) + 1
+            else:
+                index = 1
 
-                sub_tlv_types_dict = tlv_type_dict.setdefault('sub_tlvs', {}).setdefault(index, {})
+            sub_tlv_types_dict = tlv_type_dict.setdefault('sub_tlvs', {}).setdefault(index, {})
 
-                sub_tlv_types_dict['type'] = sub_tlv_type
+            sub_tlv_types_dict['type'] = sub_tlv_type
 
-                continue
+        # Remote Interface Address   : 192.168.0.1
+        @dispatcher.rule(p51)
+        def handle_p51(m):
+            group = m.groupdict()
+            remote_interface_address = group['remote_interface_address']
+            sub_tlv_types_dict['remote_interface_address'] = remote_interface_address
 
-            # Remote Interface Address   : 192.168.0.1
-            m = p51.match(line)
-            if m:
-                group = m.groupdict()
-                remote_interface_address = group['remote_interface_address']
-                sub_tlv_types_dict['remote_interface_address'] = remote_interface_address
-                continue
+        # Local Interface ID   : 20
+        @dispatcher.rule(p52)
+        def handle_p52(m):
+            group = m.groupdict()
+            local_interface_id = int(group['local_interface_id'])
+            sub_tlv_types_dict['local_interface_id'] = local_interface_id
 
-            # Local Interface ID   : 20
-            m = p52.match(line)
-            if m:
-                group = m.groupdict()
-                local_interface_id = int(group['local_interface_id'])
-                sub_tlv_types_dict['local_interface_id'] = local_interface_id
-                continue            
+        # Remote Interface ID   : 20
+        @dispatcher.rule(p53)
+        def handle_p53(m):
+            group = m.groupdict()
+            remote_interface_id = int(group['remote_interface_id'])
+            sub_tlv_types_dict['remote_interface_id'] = remote_interface_id
 
-            # Remote Interface ID   : 20
-            m = p53.match(line)
-            if m:
-                group = m.groupdict()
-                remote_interface_id = int(group['remote_interface_id'])
-                sub_tlv_types_dict['remote_interface_id'] = remote_interface_id
-                continue
+        # SID   : 1
+        @dispatcher.rule(p54)
+        def handle_p54(m):
+            group = m.groupdict()
+            sid = int(group['sid'])
 
-            # SID   : 1
-            m = p54.match(line)                        
-            if m:
-                group = m.groupdict()
-                sid = int(group['sid'])
+            sub_tlv_types_dict['sid'] = sid
 
-                sub_tlv_types_dict['sid'] = sid
-                continue
+        # Sub-type: Node Max Sid Depth, Value: 13
+        @dispatcher.rule(p59)
+        def handle_p59(m):
+            group = m.groupdict()
+            sub_type_value = int(group['value'])
 
-            # Sub-type: Node Max Sid Depth, Value: 13
-            m = p59.match(line)
-            if m:
-                group = m.groupdict()
-                sub_type_value = int(group['value'])
+            sub_type_dict = tlv_type_dict.setdefault('sub_type', {})
+            sub_type_dict['node_max_sid_depth_value'] = sub_type_value
 
-                sub_type_dict = tlv_type_dict.setdefault('sub_type', {})
-                sub_type_dict['node_max_sid_depth_value'] = sub_type_value
+        for line in out.splitlines():
+            line = line.strip()
 
-                continue
+            dispatcher.dispatch(line)
 
         return ret_dict
 
@@ -6981,6 +6947,11 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         p6 = re.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
 
 
+        # LDP-IGP Synchronization : Not required
+        # LDP-IGP Synchronization : Required
+        p4 = re.compile(r'^LDP-IGP +Synchronization *:'
+                          ' +(?P<igp_sync>(Not required|Required))$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -7099,10 +7070,6 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     mpls_ldp_dict['autoconfig'] = False
                     continue
             
-            # LDP-IGP Synchronization : Not required
-            # LDP-IGP Synchronization : Required
-            p4 = re.compile(r'^LDP-IGP +Synchronization *:'
-                              ' +(?P<igp_sync>(Not required|Required))$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['igp_sync'] == 'Required':
@@ -7269,7 +7236,8 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 instance = str(m.groupdict()['instance'])
                 # Get VRF information using the ospf instance
                 cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = config_section(self.device,
+                                     'router ospf {}'.format(instance), cmd)
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -87,12 +87,21 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
         # initial variables
         ret_dict = {}
 
+        # GigabitEthernet1   on    1     30     1
+        p1 = re.compile(r'^(?P<intf>[\w\-\/\.]+) +(?P<status>(on|off))'
+                         ' +(?P<nbr_count>\d+) +(?P<hello_int>\d+) +(?P<dr_pri>\d+)$')
+
+        # Address: FE80::5054:FF:FE2C:6CDF
+        # Address: ::
+        p2 = re.compile(r'^Address *: +(?P<address>[\s\w\:\.]+)$')
+
+        # DR     : FE80::5054:FF:FEAC:64B3
+        # DR     : not elected
+        p3 = re.compile(r'^DR *: +(?P<dr_address>[\w\:\.]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # GigabitEthernet1   on    1     30     1
-            p1 = re.compile(r'^(?P<intf>[\w\-\/\.]+) +(?P<status>(on|off))'
-                             ' +(?P<nbr_count>\d+) +(?P<hello_int>\d+) +(?P<dr_pri>\d+)$')
             m = p1.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
@@ -121,9 +130,6 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                     int(m.groupdict()['nbr_count'])
                 continue
 
-            # Address: FE80::5054:FF:FE2C:6CDF
-            # Address: ::
-            p2 = re.compile(r'^Address *: +(?P<address>[\s\w\:\.]+)$')
             m = p2.match(line)
             if m:
                 address = m.groupdict()['address']
@@ -131,9 +137,6 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                     ret_dict['vrf'][vrf]['interface'][intf]['address'] = address.split()
                 continue
 
-            # DR     : FE80::5054:FF:FEAC:64B3
-            # DR     : not elected
-            p3 = re.compile(r'^DR *: +(?P<dr_address>[\w\:\.]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['dr_address'] = \
@@ -209,12 +212,32 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
         ret_dict = {}
         af_name = 'ipv6'
 
+        # BSR Election Information
+        #  Scope Range List: ff00::/8
+        p1 = re.compile(r'^\s*Scope +Range +List: +(?P<scope_range_list>[\w\:\.//]+)$')
+
+        # BSR Address: 2001:1:1:1::1
+        p2 = re.compile(r'^\s*BSR +Address: +(?P<bsr_address>[\w\:\.]+)$')
+
+        # Uptime: 00:00:07, BSR Priority: 0, Hash mask length: 126
+        p3 = re.compile(r'^\s*Uptime: +(?P<up_time>[\d\:]+),'
+                        ' +BSR +Priority: +(?P<priority>\d+),'
+                        ' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
+
+        # RPF: FE80::21E:F6FF:FE2D:3600,Loopback0
+        p4 = re.compile(r'^\s*RPF: +(?P<rpf>[\w\:\.]+),(?P<interface>[\w\d\S]+)$')
+
+        # BS Timer: 00:00:52
+        p5 = re.compile(r'^\s*BS +Timer: +(?P<bs_timer>[\d\:]+)$')
+
+        # Candidate BSR address: 2001:1:1:1::1, priority: 0, hash mask length: 126
+        p6 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
+                        ' +priority: +(?P<can_priority>\d+),'
+                        ' +hash +mask +length: +(?P<can_hash_mask_lenght>\d+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # BSR Election Information
-            #  Scope Range List: ff00::/8
-            p1 = re.compile(r'^\s*Scope +Range +List: +(?P<scope_range_list>[\w\:\.//]+)$')
             m = p1.match(line)
             if m:
                 scope_range_list = m.groupdict()['scope_range_list']
@@ -242,8 +265,6 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                     ['rp']['bsr']['bsr']['scope_range_list'] = scope_range_list
                 continue
 
-            # BSR Address: 2001:1:1:1::1
-            p2 = re.compile(r'^\s*BSR +Address: +(?P<bsr_address>[\w\:\.]+)$')
             m = p2.match(line)
             if m:
                 address = m.groupdict()['bsr_address']
@@ -251,10 +272,6 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                     ['rp']['bsr']['bsr']['address'] = address
                 continue
 
-            # Uptime: 00:00:07, BSR Priority: 0, Hash mask length: 126
-            p3 = re.compile(r'^\s*Uptime: +(?P<up_time>[\d\:]+),'
-                            ' +BSR +Priority: +(?P<priority>\d+),'
-                            ' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
             m = p3.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
@@ -268,9 +285,6 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                     ['bsr']['priority'] = priority
                 continue
 
-            # RPF: FE80::21E:F6FF:FE2D:3600,Loopback0
-            p4 = re.compile(r'^\s*RPF: +(?P<rpf>[\w\:\.]+),(?P<interface>[\w\d\S]+)$')
-
             m = p4.match(line)
             if m:
                 rpf_address = m.groupdict()['rpf']
@@ -281,8 +295,6 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                     ['bsr']['rpf_interface'] = rpf_interface
                 continue
 
-            # BS Timer: 00:00:52
-            p5 = re.compile(r'^\s*BS +Timer: +(?P<bs_timer>[\d\:]+)$')
             m = p5.match(line)
             if m:
                 bs_timer = m.groupdict()['bs_timer']
@@ -290,10 +302,6 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                     ['bsr']['expires'] = bs_timer
                 continue
 
-            # Candidate BSR address: 2001:1:1:1::1, priority: 0, hash mask length: 126
-            p6 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
-                            ' +priority: +(?P<can_priority>\d+),'
-                            ' +hash +mask +length: +(?P<can_hash_mask_lenght>\d+)$')
             m = p6.match(line)
             if m:
                 can_address = m.groupdict()['can_address']
@@ -379,24 +387,32 @@ class ShowIpv6PimBsrCandidateRp(ShowIpv6PimBsrCandidateRpSchema):
         address = priority = holdtime = interval = mode = ""
         next_advertisement = scope =""
 
+        # PIMv2 C-RP information
+        # Candidate RP: 2001:3:3:3::3 SM
+        # Candidate RP: 2001:db8:100::1:1:3
+        p1 = re.compile(r'^\s*Candidate RP: +(?P<candidate_rp_address>[\w\:\.]+)'
+                        '( +(?P<mode>\w+))?$')
+
+        # Priority 5, Holdtime 150
+        # All Learnt Scoped Zones, Priority 192, Holdtime 150
+        p2 = re.compile(r'^\s*((?P<scope>[\S\s]+), )?Priority +(?P<priority>\d+)'
+                        ', +Holdtime +(?P<holdtime>\d+)$')
+
+        # Advertisement interval 60 seconds
+        p3 = re.compile(r'^\s*Advertisement +interval +(?P<interval>\d+) +seconds$')
+
+        # Next advertisement in 00:00:48
+        p4 = re.compile(r'^\s*Next +advertisement +in +(?P<next_advertisement>[\d\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # PIMv2 C-RP information
-            # Candidate RP: 2001:3:3:3::3 SM
-            # Candidate RP: 2001:db8:100::1:1:3
-            p1 = re.compile(r'^\s*Candidate RP: +(?P<candidate_rp_address>[\w\:\.]+)'
-                            '( +(?P<mode>\w+))?$')
             m = p1.match(line)
             if m:
                 address = m.groupdict()['candidate_rp_address']
                 mode = m.groupdict()['mode']
                 continue
 
-            # Priority 5, Holdtime 150
-            # All Learnt Scoped Zones, Priority 192, Holdtime 150
-            p2 = re.compile(r'^\s*((?P<scope>[\S\s]+), )?Priority +(?P<priority>\d+)'
-                            ', +Holdtime +(?P<holdtime>\d+)$')
             m = p2.match(line)
             if m:
                 priority = int(m.groupdict()['priority'])
@@ -405,15 +421,11 @@ class ShowIpv6PimBsrCandidateRp(ShowIpv6PimBsrCandidateRpSchema):
                     scope = m.groupdict()['scope']
                 continue
 
-            # Advertisement interval 60 seconds
-            p3 = re.compile(r'^\s*Advertisement +interval +(?P<interval>\d+) +seconds$')
             m = p3.match(line)
             if m:
                 interval = int(m.groupdict()['interval'])
                 continue
 
-            # Next advertisement in 00:00:48
-            p4 = re.compile(r'^\s*Next +advertisement +in +(?P<next_advertisement>[\d\:]+)$')
             m = p4.match(line)
             if m:
                 next_advertisement = m.groupdict()['next_advertisement']
@@ -529,17 +541,18 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
         # initial variables
         ret_dict = {}
 
+        # Address          Interface                Ver/   Nbr    Query  DR         DR
+        #                              Mode   Count  Intvl  Prior
+        # 10.1.2.1         GigabitEthernet1         v2/S   1      30     1          10.1.2.2
+        p1 = re.compile(r'^\s*(?P<address>[\w\:\.]+) +(?P<interface>[\w\d\S]+)'
+                        ' +v(?P<version>[\d]+)\/(?P<mode>[\w]+)'
+                        ' +(?P<nbr_count>[\d]+)'
+                        ' +(?P<query_interval>[\d]+)'
+                        ' +(?P<dr_priority>[\d]+)'
+                        ' +(?P<dr_address>[\w\d\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
-            # Address          Interface                Ver/   Nbr    Query  DR         DR
-            #                              Mode   Count  Intvl  Prior
-            # 10.1.2.1         GigabitEthernet1         v2/S   1      30     1          10.1.2.2
-            p1 = re.compile(r'^\s*(?P<address>[\w\:\.]+) +(?P<interface>[\w\d\S]+)'
-                            ' +v(?P<version>[\d]+)\/(?P<mode>[\w]+)'
-                            ' +(?P<nbr_count>[\d]+)'
-                            ' +(?P<query_interval>[\d]+)'
-                            ' +(?P<dr_priority>[\d]+)'
-                            ' +(?P<dr_address>[\w\d\.\:]+)$')
             m = p1.match(line)
             if m:
                 new_mode = ""
@@ -668,12 +681,50 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
         # initial variables
         ret_dict = {}
 
+        # PIMv2 Bootstrap information
+        # BSR address: 10.64.4.4 (?)
+        p1 = re.compile(r'^\s*BSR +address: +(?P<address>[\w\:\.]+) +\((?P<address_host>[\w\d\S]+)\)$')
+
+        # Uptime:      00:01:23, BSR Priority: 0, Hash mask length: 0
+        p2 = re.compile(r'^\s*Uptime: +(?P<up_time>[\w\d\:]+),'
+                        ' +BSR +Priority: +(?P<priority>\d+),'
+                        ' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
+
+        # Expires:     00:01:46
+        p3 = re.compile(r'^\s*Expires: +(?P<expires>[\d\:]+)$')
+
+        # Next bootstrap message in 00:00:06
+        p10 = re.compile(r'^\s*Next +bootstrap +message +in'
+                         ' +(?P<next_bsr_message>[\w\d\S]+)$')
+
+        # Candidate BSR address: 10.4.1.1, priority: 0, hash mask length: 0
+        p4 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
+                        ' +priority: +(?P<can_priority>\d+),'
+                        ' +hash +mask +length: +(?P<can_hash_mask_length>\d+)$')
+
+        # Candidate RP: 10.1.5.1(GigabitEthernet3)
+        p5 = re.compile(r'^\s*Candidate +RP:'
+                        ' +(?P<rp_can_address>[\w\d\.\:]+)\((?P<rp_can_interface>[\w\d\S]+)\)$')
+
+        # Holdtime 150 seconds
+        p6 = re.compile(r'^\s*Holdtime'
+                        ' +(?P<holdtime>\d+) +seconds$')
+
+        # Advertisement interval 60 seconds
+        p7 = re.compile(r'^\s*Advertisement +interval'
+                        ' +(?P<interval>\d+) +seconds$')
+
+        # Next advertisement in 00:00:27
+        p8 = re.compile(r'^\s*Next +advertisement +in'
+                        ' +(?P<next_advertisment>[\d\:]+)$')
+
+        # Candidate RP priority : 5
+        p9 = re.compile(r'^\s*Candidate +RP +priority +:'
+                        ' +(?P<rp_can_priority>[\d]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # PIMv2 Bootstrap information
-            # BSR address: 10.64.4.4 (?)
-            p1 = re.compile(r'^\s*BSR +address: +(?P<address>[\w\:\.]+) +\((?P<address_host>[\w\d\S]+)\)$')
             m = p1.match(line)
             if m:
                 address = m.groupdict()['address']
@@ -704,10 +755,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr']['bsr']['address_host'] = address_host
                 continue
 
-            # Uptime:      00:01:23, BSR Priority: 0, Hash mask length: 0
-            p2 = re.compile(r'^\s*Uptime: +(?P<up_time>[\w\d\:]+),'
-                            ' +BSR +Priority: +(?P<priority>\d+),'
-                            ' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
             m = p2.match(line)
             if m:
                 bsr_up_time = m.groupdict()['up_time']
@@ -744,9 +791,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr']['bsr']['hash_mask_length'] = bsr_hash_mask
                 continue
 
-            # Expires:     00:01:46
-            p3 = re.compile(r'^\s*Expires: +(?P<expires>[\d\:]+)$')
-
             m = p3.match(line)
             if m:
                 bsr_expiration = m.groupdict()['expires']
@@ -754,9 +798,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr']['bsr']['expires'] = bsr_expiration
                 continue
 
-            # Next bootstrap message in 00:00:06
-            p10 = re.compile(r'^\s*Next +bootstrap +message +in'
-                             ' +(?P<next_bsr_message>[\w\d\S]+)$')
             m = p10.match(line)
             if m:
                 next_bsr_meaasge = m.groupdict()['next_bsr_message']
@@ -764,10 +805,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr']['bsr_next_bootstrap'] = next_bsr_meaasge
                 continue
 
-            # Candidate BSR address: 10.4.1.1, priority: 0, hash mask length: 0
-            p4 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
-                            ' +priority: +(?P<can_priority>\d+),'
-                            ' +hash +mask +length: +(?P<can_hash_mask_length>\d+)$')
             m = p4.match(line)
             if m:
                 can_address = m.groupdict()['can_address']
@@ -793,10 +830,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr']['bsr_candidate']['hash_mask_length'] = can_hash_mask
                 continue
 
-            # Candidate RP: 10.1.5.1(GigabitEthernet3)
-            p5 = re.compile(r'^\s*Candidate +RP:'
-                            ' +(?P<rp_can_address>[\w\d\.\:]+)\((?P<rp_can_interface>[\w\d\S]+)\)$')
-
             m = p5.match(line)
             if m:
                 rp_can_address = m.groupdict()['rp_can_address']
@@ -829,9 +862,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                         ['rp']['bsr'][key]['interface'] = rp_can_interface
                 continue
 
-            # Holdtime 150 seconds
-            p6 = re.compile(r'^\s*Holdtime'
-                            ' +(?P<holdtime>\d+) +seconds$')
             m = p6.match(line)
             if m:
                 rp_can_holdtime = int(m.groupdict()['holdtime'])
@@ -839,9 +869,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr'][key]['holdtime'] = rp_can_holdtime
                 continue
 
-            # Advertisement interval 60 seconds
-            p7 = re.compile(r'^\s*Advertisement +interval'
-                            ' +(?P<interval>\d+) +seconds$')
             m = p7.match(line)
             if m:
                 rp_can_interval = int(m.groupdict()['interval'])
@@ -849,9 +876,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr'][key]['interval'] = rp_can_interval
                 continue
 
-            # Next advertisement in 00:00:27
-            p8 = re.compile(r'^\s*Next +advertisement +in'
-                            ' +(?P<next_advertisment>[\d\:]+)$')
             m = p8.match(line)
             if m:
                 rp_can_next_advertisment = m.groupdict()['next_advertisment']
@@ -859,9 +883,6 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                     ['rp']['bsr'][key]['next_advertisment'] = rp_can_next_advertisment
                 continue
 
-            # Candidate RP priority : 5
-            p9 = re.compile(r'^\s*Candidate +RP +priority +:'
-                            ' +(?P<rp_can_priority>[\d]+)$')
             m = p9.match(line)
             if m:
                 rp_can_priority = int(m.groupdict()['rp_can_priority'])
@@ -961,15 +982,39 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
         # initial variables
         ret_dict = {}
 
+        # Group(s) 224.0.0.0/4
+        # Group(s) 224.0.0.0/4, Static
+        # Group(s): 224.0.0.0/4, Static, Bidir Mode
+        p1 = re.compile(r'^\s*Group\(s\)\:? +(?P<group>[0-9a-zA-Z\:\.\/]+)'
+                         '(, +(?P<protocol>\S+))?'
+                         '(, +(?P<mode>[\w\s]+))?$')
+
+        # Acl: STATIC_RP_V4, Static-Override
+        p1_1 = re.compile(r'^\s*Acl: +(?P<group>\S+)'
+                         '(, +(?P<protocol>\S+))?'
+                         '(, +(?P<mode>[\w\s]+))?$')
+
+        # RP 10.36.3.3 (?), v2
+        p2 = re.compile(r'^\s*RP\:? +(?P<rp_address>[\s\w\:\.]+)'
+                        ' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
+                        '(, +(?P<rp_version>[\w\d]+))?$')
+
+        # Info source: 10.64.4.4 (?), via bootstrap, priority 5, holdtime 150
+        # Info source: 192.168.246.1 (?), elected via Auto-RP, via bootstrap, priority 0, holdtime 181
+        p3 = re.compile(r'^\s*Info +source: +(?P<info_source>[\w\:\.]+)'
+                        ' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
+                        '(, +elected +via +(?P<elected>\S+))?'
+                        '(, +via +(?P<protocol>[\w\S\-]+))?'
+                        '(, +priority +(?P<priority>[\d]+))?'
+                        '(, +holdtime +(?P<holdtime>[\d]+))?$')
+
+        # Uptime: 00:00:19, expires: 00:02:19
+        p4 = re.compile(r'^\s*Uptime: +(?P<uptime>[\w\d\S\:]+),'
+                        ' +expires: +(?P<expires>[\w\d\S\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Group(s) 224.0.0.0/4
-            # Group(s) 224.0.0.0/4, Static
-            # Group(s): 224.0.0.0/4, Static, Bidir Mode
-            p1 = re.compile(r'^\s*Group\(s\)\:? +(?P<group>[0-9a-zA-Z\:\.\/]+)'
-                             '(, +(?P<protocol>\S+))?'
-                             '(, +(?P<mode>[\w\s]+))?$')
             m = p1.match(line)
             if m:
                 rp_group_protocol = ""
@@ -988,10 +1033,6 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                     mode = 'SM'
                 continue
 
-            # Acl: STATIC_RP_V4, Static-Override
-            p1_1 = re.compile(r'^\s*Acl: +(?P<group>\S+)'
-                             '(, +(?P<protocol>\S+))?'
-                             '(, +(?P<mode>[\w\s]+))?$')
             m = p1_1.match(line)
             if m:
                 rp_group_protocol = ""
@@ -1012,10 +1053,6 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                 acl = True
                 continue
 
-            # RP 10.36.3.3 (?), v2
-            p2 = re.compile(r'^\s*RP\:? +(?P<rp_address>[\s\w\:\.]+)'
-                            ' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
-                            '(, +(?P<rp_version>[\w\d]+))?$')
             m = p2.match(line)
             if m:
                 rp_group_protocol = ""
@@ -1128,14 +1165,6 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                             ['rp_mappings'][rp_group_protocol]['rp_address_host'] = rp_address_host
                 continue
 
-            # Info source: 10.64.4.4 (?), via bootstrap, priority 5, holdtime 150
-            # Info source: 192.168.246.1 (?), elected via Auto-RP, via bootstrap, priority 0, holdtime 181
-            p3 = re.compile(r'^\s*Info +source: +(?P<info_source>[\w\:\.]+)'
-                            ' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
-                            '(, +elected +via +(?P<elected>\S+))?'
-                            '(, +via +(?P<protocol>[\w\S\-]+))?'
-                            '(, +priority +(?P<priority>[\d]+))?'
-                            '(, +holdtime +(?P<holdtime>[\d]+))?$')
             m = p3.match(line)
             if m:
                 info_source_address = m.groupdict()['info_source']
@@ -1230,9 +1259,6 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                             ['rp_mappings'][rp_group_protocol]['rp_address_host'] = rp_address_host
                 continue
 
-            # Uptime: 00:00:19, expires: 00:02:19
-            p4 = re.compile(r'^\s*Uptime: +(?P<uptime>[\w\d\S\:]+),'
-                            ' +expires: +(?P<expires>[\w\d\S\:]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['uptime']
@@ -1374,12 +1400,98 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
         # initial variables
         ret_dict = {}
 
+        # GigabitEthernet3 is up, line protocol is up
+        p1 = re.compile(r'^\s*(?P<intf_name>[\w\d\S]+) +is +(?P<enable>\S+),'
+                        ' +line +protocol +is +(?P<oper_status>\w+)$')
+
+        # Internet protocol processing: disabled
+        p23 = re.compile(r'^Internet protocol processing: (?P<disabled>\S+)$')
+
+        # Internet address is 10.1.2.1/24
+        p2 = re.compile(r'^\s*Internet +address +is +(?P<address>[\w\d\S]+)$')
+
+        # Multicast switching: fast
+        p3 = re.compile(r'^\s*Multicast +switching: +(?P<multi_switching>\w+)$')
+
+        # Multicast packets in/out: 5/0
+        p4 = re.compile(r'^\s*Multicast +packets +in/out:'
+                        ' +(?P<in>\d+)/(?P<out>\d+)$')
+
+        # Multicast TTL threshold: 0
+        p5 = re.compile(r'^\s*Multicast +TTL +threshold:'
+                        ' +(?P<ttl_threshold>\d+)$')
+
+        # PIM: enabled
+        p6 = re.compile(r'^\s*PIM:'
+                        ' +(?P<status>\w+)$')
+
+        # PIM version: 2, mode: sparse
+        p7 = re.compile(r'^\s*PIM +version:'
+                        ' +(?P<version>\d+), +mode: +(?P<mode>\w+)$')
+
+        # PIM DR: 10.1.2.2
+        # PIM DR: 10.4.1.1 (this system)
+        p8 = re.compile(r'^\s*PIM +DR:'
+                        ' +(?P<dr_address>[\w\d\S]+)(\s+(?P<info>[\w\S\s]+))?$')
+
+        # PIM neighbor count: 1
+        p9 = re.compile(r'^\s*PIM +neighbor +count:'
+                        ' +(?P<nbr_count>\d+)$')
+
+        # PIM Hello/Query interval: 30 seconds
+        p10 = re.compile(r'^\s*PIM +[h|H]ello/[q|Q]uery +interval:'
+                        ' +(?P<hello_interval>\d+) +seconds$')
+
+        # PIM Hello packets in/out: 8/10
+        p11 = re.compile(r'^\s*PIM +Hello +packets +in/out:'
+                         ' +(?P<h_in>\d+)/(?P<h_out>\d+)$')
+
+        # PIM J/P interval: 60 seconds
+        p12 = re.compile(r'^\s*PIM +J/P +interval:'
+                         ' +(?P<jp_interval>\d+) +seconds$')
+
+        # PIM State-Refresh processing: enabled
+        p13 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +processing:'
+                         ' +(?P<state_refresh_processing>\w+)$')
+
+        # PIM State-Refresh origination: disabled
+        p14 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +origination:'
+                         ' +(?P<state_refresh_origination>\w+)$')
+
+        # PIM NBMA mode: disabled
+        p15 = re.compile(r'^\s*PIM +NBMA +mode:'
+                         ' +(?P<nbma_mode>\w+)$')
+
+        # PIM ATM multipoint signalling: disabled
+        p16 = re.compile(r'^\s*PIM +ATM +multipoint +signalling:'
+                         ' +(?P<atm_multipoint>\w+)$')
+
+        # PIM domain border: disabled
+        p17 = re.compile(r'^\s*PIM +domain +border:'
+                         ' +(?P<domain_border>\w+)$')
+
+        # PIM neighbors rpf proxy capable: TRUE
+        p18 = re.compile(r'^\s*PIM +neighbors +rpf +proxy +capable:'
+                         ' +(?P<neighbors_rpf_proxy_capable>\w+)$')
+
+        # PIM BFD: disabled
+        p19 = re.compile(r'^\s*PIM +BFD:'
+                         ' +(?P<bfd>\w+)$')
+
+        # PIM Non-DR-Join: FALSE
+        p20 = re.compile(r'^\s*PIM +Non-DR-Join:'
+                         ' +(?P<non_dr_join>\w+)$')
+
+        # Multicast Tagswitching: disabled
+        p21 = re.compile(r'^\s*Multicast +Tagswitching:'
+                         ' +(?P<tagswitching>\w+)$')
+
+        # PIM neighbor filter: 7
+        p22 = re.compile(r'^\s*PIM +neighbor +filter: +(?P<nei_filter>\d+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # GigabitEthernet3 is up, line protocol is up
-            p1 = re.compile(r'^\s*(?P<intf_name>[\w\d\S]+) +is +(?P<enable>\S+),'
-                            ' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 intf_name = m.groupdict()['intf_name']
@@ -1407,8 +1519,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['enable'] = enable
                 continue
 
-            # Internet protocol processing: disabled
-            p23 = re.compile(r'^Internet protocol processing: (?P<disabled>\S+)$')
             m = p23.match(line)
             if m:
 
@@ -1418,16 +1528,12 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['internet_protocol_processing'] = able_bool
                 continue
 
-            # Internet address is 10.1.2.1/24
-            p2 = re.compile(r'^\s*Internet +address +is +(?P<address>[\w\d\S]+)$')
             m = p2.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf_name]['address_family']\
                     [af_name]['address'] = m.groupdict()['address'].split()
                 continue
 
-            # Multicast switching: fast
-            p3 = re.compile(r'^\s*Multicast +switching: +(?P<multi_switching>\w+)$')
             m = p3.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interfaces']\
@@ -1438,9 +1544,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['multicast']['switching'] = m.groupdict()['multi_switching']
                 continue
 
-            # Multicast packets in/out: 5/0
-            p4 = re.compile(r'^\s*Multicast +packets +in/out:'
-                            ' +(?P<in>\d+)/(?P<out>\d+)$')
             m = p4.match(line)
             if m:
                 multi_packet_in = int(m.groupdict()['in'])
@@ -1458,9 +1561,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['multicast']['packets_out'] = multi_packet_out
                 continue
 
-            # Multicast TTL threshold: 0
-            p5 = re.compile(r'^\s*Multicast +TTL +threshold:'
-                            ' +(?P<ttl_threshold>\d+)$')
             m = p5.match(line)
             if m:
                 ttl_threshold = int(m.groupdict()['ttl_threshold'])
@@ -1472,9 +1572,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['multicast']['ttl_threshold'] = ttl_threshold
                 continue
 
-            # PIM: enabled
-            p6 = re.compile(r'^\s*PIM:'
-                            ' +(?P<status>\w+)$')
             m = p6.match(line)
             if m:
                 pim_status = m.groupdict()['status']
@@ -1482,9 +1579,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['pim_status'] = pim_status
                 continue
 
-            # PIM version: 2, mode: sparse
-            p7 = re.compile(r'^\s*PIM +version:'
-                            ' +(?P<version>\d+), +mode: +(?P<mode>\w+)$')
             m = p7.match(line)
             if m:
                 version = int(m.groupdict()['version'])
@@ -1509,10 +1603,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['sm']['passive'] = True
                 continue
 
-            # PIM DR: 10.1.2.2
-            # PIM DR: 10.4.1.1 (this system)
-            p8 = re.compile(r'^\s*PIM +DR:'
-                            ' +(?P<dr_address>[\w\d\S]+)(\s+(?P<info>[\w\S\s]+))?$')
             m = p8.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
@@ -1520,9 +1610,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['dr_address'] = dr_address
                 continue
 
-            # PIM neighbor count: 1
-            p9 = re.compile(r'^\s*PIM +neighbor +count:'
-                            ' +(?P<nbr_count>\d+)$')
             m = p9.match(line)
             if m:
                 nbr_count = int(m.groupdict()['nbr_count'])
@@ -1530,9 +1617,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['neighbor_count'] = nbr_count
                 continue
 
-            # PIM Hello/Query interval: 30 seconds
-            p10 = re.compile(r'^\s*PIM +[h|H]ello/[q|Q]uery +interval:'
-                            ' +(?P<hello_interval>\d+) +seconds$')
             m = p10.match(line)
             if m:
                 hello_interval = int(m.groupdict()['hello_interval'])
@@ -1540,9 +1624,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['hello_interval'] = hello_interval
                 continue
 
-            # PIM Hello packets in/out: 8/10
-            p11 = re.compile(r'^\s*PIM +Hello +packets +in/out:'
-                             ' +(?P<h_in>\d+)/(?P<h_out>\d+)$')
             m = p11.match(line)
             if m:
                 hello_packet_in = int(m.groupdict()['h_in'])
@@ -1553,9 +1634,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['hello_packets_out'] = hello_packet_out
                 continue
 
-            # PIM J/P interval: 60 seconds
-            p12 = re.compile(r'^\s*PIM +J/P +interval:'
-                             ' +(?P<jp_interval>\d+) +seconds$')
             m = p12.match(line)
             if m:
                 jp_interval = int(m.groupdict()['jp_interval'])
@@ -1563,9 +1641,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['jp_interval'] = jp_interval
                 continue
 
-            # PIM State-Refresh processing: enabled
-            p13 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +processing:'
-                             ' +(?P<state_refresh_processing>\w+)$')
             m = p13.match(line)
             if m:
                 state_refresh_processing = m.groupdict()['state_refresh_processing']
@@ -1573,9 +1648,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['state_refresh_processing'] = state_refresh_processing
                 continue
 
-            # PIM State-Refresh origination: disabled
-            p14 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +origination:'
-                             ' +(?P<state_refresh_origination>\w+)$')
             m = p14.match(line)
             if m:
                 state_refresh_origination = m.groupdict()['state_refresh_origination']
@@ -1583,9 +1655,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['state_refresh_origination'] = state_refresh_origination
                 continue
 
-            # PIM NBMA mode: disabled
-            p15 = re.compile(r'^\s*PIM +NBMA +mode:'
-                             ' +(?P<nbma_mode>\w+)$')
             m = p15.match(line)
             if m:
                 nbma_mode = m.groupdict()['nbma_mode']
@@ -1593,9 +1662,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['nbma_mode'] = nbma_mode
                 continue
 
-            # PIM ATM multipoint signalling: disabled
-            p16 = re.compile(r'^\s*PIM +ATM +multipoint +signalling:'
-                             ' +(?P<atm_multipoint>\w+)$')
             m = p16.match(line)
             if m:
                 atm_multipoint = m.groupdict()['atm_multipoint']
@@ -1603,9 +1669,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['atm_multipoint_signalling'] = atm_multipoint
                 continue
 
-            # PIM domain border: disabled
-            p17 = re.compile(r'^\s*PIM +domain +border:'
-                             ' +(?P<domain_border>\w+)$')
             m = p17.match(line)
             if m:
                 bsr_border = m.groupdict()['domain_border']
@@ -1613,9 +1676,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['bsr_border'] = False if 'disabled' in bsr_border else True
                 continue
 
-            # PIM neighbors rpf proxy capable: TRUE
-            p18 = re.compile(r'^\s*PIM +neighbors +rpf +proxy +capable:'
-                             ' +(?P<neighbors_rpf_proxy_capable>\w+)$')
             m = p18.match(line)
             if m:
                 nbr_val = m.groupdict()['neighbors_rpf_proxy_capable']
@@ -1624,9 +1684,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                                                                else False
                 continue
 
-            # PIM BFD: disabled
-            p19 = re.compile(r'^\s*PIM +BFD:'
-                             ' +(?P<bfd>\w+)$')
             m = p19.match(line)
             if m:
                 bfd = m.groupdict()['bfd']
@@ -1639,9 +1696,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 ret_dict['vrf'][vrf]['interfaces'][intf_name]['address_family'] \
                         [af_name]['bfd']['enable'] = enable
 
-            # PIM Non-DR-Join: FALSE
-            p20 = re.compile(r'^\s*PIM +Non-DR-Join:'
-                             ' +(?P<non_dr_join>\w+)$')
             m = p20.match(line)
             if m:
                 non_dr_join = m.groupdict()['non_dr_join']
@@ -1653,9 +1707,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                     [af_name]['none_dr_join'] = dr_join_val
                 continue
 
-            # Multicast Tagswitching: disabled
-            p21 = re.compile(r'^\s*Multicast +Tagswitching:'
-                             ' +(?P<tagswitching>\w+)$')
             m = p21.match(line)
             if m:
                 tagswitching = m.groupdict()['tagswitching']
@@ -1668,8 +1719,6 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                                                               in tagswitching else True
                 continue
 
-            # PIM neighbor filter: 7
-            p22 = re.compile(r'^\s*PIM +neighbor +filter: +(?P<nei_filter>\d+)$')
             m = p22.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf_name]['address_family'] \
@@ -1755,28 +1804,34 @@ class ShowPimNeighbor(ShowPimNeighborSchema):
                     'S': 'state_refresh_capable',
                     'G': 'genid_capable',
                     'L': 'dr_load_balancing_capable'}
+
+        # Neighbor          Interface                Uptime/Expires    Ver   DR
+        # Address                                                            Prio/Mode
+        # 192.168.154.1      Port-channel2.100       1d09h/00:01:39    v2    1 / S P G
+        p1 = re.compile(r'^(?P<nei_address>[\d\.]+) +'
+                         '(?P<intf>[\w\.\/\-]+) +'
+                         '(?P<uptime>[\w\.\:]+)/(?P<expires>[\w\.\:]+) +'
+                         '(?P<ver>\w+) +'
+                         '(?P<dr_prio>\d+) */ *(?P<mode>[\w\s]+)$')
+
+        # Neighbor Address           Interface          Uptime    Expires  Mode DR pri
+        # FE80::21A:30FF:FE47:6EC1   Port-channel2.100  1d09h     00:01:17 B G     1
+        p2 = re.compile(r'^(?P<nei_address>[\w\:]+) +'
+                         '(?P<intf>[\w\.\/\-]+) +'
+                         '(?P<uptime>[\w\.\:]+) +'
+                         '(?P<expires>[\w\.\:]+) +'
+                         '(?P<mode>[\w\s]+) +'
+                         '(?P<dr_prio>\d+)$')
+
+        # 2001::2:1
+        p3 = re.compile(r'^(?P<secondary_address>[\w\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Neighbor          Interface                Uptime/Expires    Ver   DR
-            # Address                                                            Prio/Mode
-            # 192.168.154.1      Port-channel2.100       1d09h/00:01:39    v2    1 / S P G
-            p1 = re.compile(r'^(?P<nei_address>[\d\.]+) +'
-                             '(?P<intf>[\w\.\/\-]+) +'
-                             '(?P<uptime>[\w\.\:]+)/(?P<expires>[\w\.\:]+) +'
-                             '(?P<ver>\w+) +'
-                             '(?P<dr_prio>\d+) */ *(?P<mode>[\w\s]+)$')
             m1 = p1.match(line)
 
 
-            # Neighbor Address           Interface          Uptime    Expires  Mode DR pri
-            # FE80::21A:30FF:FE47:6EC1   Port-channel2.100  1d09h     00:01:17 B G     1
-            p2 = re.compile(r'^(?P<nei_address>[\w\:]+) +'
-                             '(?P<intf>[\w\.\/\-]+) +'
-                             '(?P<uptime>[\w\.\:]+) +'
-                             '(?P<expires>[\w\.\:]+) +'
-                             '(?P<mode>[\w\s]+) +'
-                             '(?P<dr_prio>\d+)$')
             m2 = p2.match(line)
 
             if m1:
@@ -1827,8 +1882,6 @@ class ShowPimNeighbor(ShowPimNeighborSchema):
                         sub_dict[mode_tbl[mode]] = True
                 continue
 
-            # 2001::2:1
-            p3 = re.compile(r'^(?P<secondary_address>[\w\:]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf]['address_family'\
@@ -1963,18 +2016,19 @@ class ShowIpPimInterfaceDf(ShowIpPimInterfaceDfSchema):
 
         intf = None
 
+        # Interface          RP               DF Winner        Metric          Uptime
+        # Ethernet3/3        10.10.0.2        10.4.0.2         0               00:03:49
+        #                    10.10.0.3        10.4.0.3         0               00:01:49
+        # Ethernet0/1        10.186.0.1      *10.4.0.4         20              00:00:39
+        p1 = re.compile(r'^((?P<intf>[\w\.\/\-]+) +)?'
+                         '(?P<address>[\w\.\:]+) +'
+                         '(?P<df>\*)?(?P<df_address>[\w\.\:]+) +'
+                         '(?P<metric>\d+) +'
+                         '(?P<uptime>[\w\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Interface          RP               DF Winner        Metric          Uptime
-            # Ethernet3/3        10.10.0.2        10.4.0.2         0               00:03:49
-            #                    10.10.0.3        10.4.0.3         0               00:01:49
-            # Ethernet0/1        10.186.0.1      *10.4.0.4         20              00:00:39
-            p1 = re.compile(r'^((?P<intf>[\w\.\/\-]+) +)?'
-                             '(?P<address>[\w\.\:]+) +'
-                             '(?P<df>\*)?(?P<df_address>[\w\.\:]+) +'
-                             '(?P<metric>\d+) +'
-                             '(?P<uptime>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 if m.groupdict()['intf']:
@@ -586,6 +586,10 @@ class ShowVersion(ShowVersionSchema):
         # hb_rev_num
         p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
 
+        # entservices   Type: Permanent
+        p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: '
+                           r'+(?P<license_type>\S+)')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -733,9 +737,6 @@ class ShowVersion(ShowVersionSchema):
             if m:
                 group = m.groupdict()
                 if 'Type:' in group['license_level']:
-                    # entservices   Type: Permanent
-                    p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: '
-                                       r'+(?P<license_type>\S+)')
                     lic_type = group['license_level'].strip()
                     m_1 = p16_1.match(lic_type)
                     group = m_1.groupdict()
@@ -1266,11 +1267,13 @@ class ShowVersion(ShowVersionSchema):
 
         if tmp2.entries:
             res2 = tmp2
+
+            p = re.compile(r'\**\ *(?P<new_key>\d)')
+
             for key in res2.entries.keys():
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
-                    p = re.compile(r'\**\ *(?P<new_key>\d)')
                     m = p.match(key)
                     switch_no = m.groupdict()['new_key']
                     if m:
@@ -1348,12 +1351,21 @@ class Dir(DirSchema):
             out = output
 
         dir_dict = {}
+
+        # dir
+        p1 = re.compile(
+            r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
+
+        # filename, index, permissions, size and last_modified_date
+        p2 = re.compile(
+            r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$')
+
+        # bytes_total and bytes_free
+        p3 = re.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # dir
-            p1 = re.compile(
-                r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
             m = p1.match(line)
             if m:
                 dir1 = m.groupdict()['dir']
@@ -1364,9 +1376,6 @@ class Dir(DirSchema):
                     dir_dict['dir']['dir'] = dir1
                 continue
 
-            # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(
-                r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$')
             m = p2.match(line)
             if m:
                 filename = m.groupdict()['filename']
@@ -1380,8 +1389,6 @@ class Dir(DirSchema):
                 dir_dict['dir'][dir1]['files'][filename]['last_modified_date'] = m.groupdict()['last_modified_date']
                 continue
 
-            # bytes_total and bytes_free
-            p3 = re.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
             m = p3.match(line)
             if m:
                 dir_dict['dir'][dir1]['bytes_total'] = m.groupdict()['bytes_total']
@@ -1447,11 +1454,64 @@ class ShowRedundancy(ShowRedundancySchema):
             out = output
 
         redundancy_dict = {}
+
+        # available_system_uptime
+        p1 = re.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
+
+        # switchovers_system_experienced
+        p2 = re.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
+
+        # standby_failures
+        p3 = re.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
+
+        # last_switchover_reason
+        p4 = re.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
+
+        # hw_mode
+        p5 = re.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
+
+        # conf_red_mode
+        p6 = re.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
+
+        # slot number
+        p9 = re.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
+
+        # curr_sw_state
+        p10 = re.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
+
+        # uptime_in_curr_state
+        p11 = re.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
+
+        # image_ver
+        p12 = re.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
+
+        # boot
+        p13 = re.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
+
+        # config_file
+        p14 = re.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
+
+        # bootldr
+        p15 = re.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
+
+        # config_register
+        p16 = re.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
+
+        # oper_red_mode
+        p7 = re.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
+
+        # maint_mode
+        p7_1 = re.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
+
+        # communications
+        p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
+
+        # communications_reason
+        p8_1 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # available_system_uptime
-            p1 = re.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
             m = p1.match(line)
             if m:
                 redundancy_dict.setdefault('red_sys_info', {})
@@ -1459,72 +1519,54 @@ class ShowRedundancy(ShowRedundancySchema):
                     m.groupdict()['available_system_uptime']
                 continue
 
-            # switchovers_system_experienced
-            p2 = re.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
             m = p2.match(line)
             if m:
                 redundancy_dict['red_sys_info']['switchovers_system_experienced'] = \
                     m.groupdict()['switchovers_system_experienced']
                 continue
 
-            # standby_failures
-            p3 = re.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
             m = p3.match(line)
             if m:
                 redundancy_dict['red_sys_info']['standby_failures'] = \
                     m.groupdict()['standby_failures']
                 continue
 
-            # last_switchover_reason
-            p4 = re.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
             m = p4.match(line)
             if m:
                 redundancy_dict['red_sys_info']['last_switchover_reason'] = \
                     m.groupdict()['last_switchover_reason']
                 continue
 
-            # hw_mode
-            p5 = re.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
             m = p5.match(line)
             if m:
                 redundancy_dict['red_sys_info']['hw_mode'] = \
                     m.groupdict()['hw_mode']
                 continue
 
-            # conf_red_mode
-            p6 = re.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict['red_sys_info']['conf_red_mode'] = \
                     m.groupdict()['conf_red_mode']
                 continue
 
-            # oper_red_mode
-            p7 = re.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict['red_sys_info']['oper_red_mode'] = \
                     m.groupdict()['oper_red_mode']
                 continue
 
-            # maint_mode
-            p7 = re.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
-            m = p7.match(line)
+            m = p7_1.match(line)
             if m:
                 redundancy_dict['red_sys_info']['maint_mode'] = \
                     m.groupdict()['maint_mode']
                 continue
 
-            # communications
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
                     m.groupdict()['communications']
 
-            # communications_reason
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
-            m = p8.match(line)
+            m = p8_1.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
                     m.groupdict()['communications']
@@ -1532,8 +1574,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     m.groupdict()['communications_reason']
                 continue
 
-            # slot number
-            p9 = re.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
             m = p9.match(line)
             if m:
                 slot = m.groupdict()['slot']
@@ -1543,8 +1583,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     redundancy_dict['slot'][slot] = {}
                 continue
 
-            # curr_sw_state
-            p10 = re.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
             m = p10.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1552,8 +1590,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['curr_sw_state']
                 continue
 
-            # uptime_in_curr_state
-            p11 = re.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
             m = p11.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1561,8 +1597,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['uptime_in_curr_state']
                 continue
 
-            # image_ver
-            p12 = re.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
             m = p12.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1570,8 +1604,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['image_ver']
                 continue
 
-            # boot
-            p13 = re.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
             m = p13.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1579,8 +1611,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['boot']
                 continue
 
-            # config_file
-            p14 = re.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
             m = p14.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1588,8 +1618,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['config_file']
                 continue
 
-            # bootldr
-            p15 = re.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
             m = p15.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1597,8 +1625,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         m.groupdict()['bootldr']
                 continue
 
-            # config_register
-            p16 = re.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
             m = p16.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -2567,29 +2593,83 @@ class ShowBoot(ShowBootSchema):
         boot_variable = None
         switch_number = 0
 
+        # Current Boot Variables:
+        p1 = re.compile(r'Current +Boot +Variables:$')
+
+        # Boot Variables on next reload:
+        p1_2 = re.compile(r'Boot +Variables +on +next +reload:$')
+
+        # BOOT variable = bootflash:/asr1000rpx.bin,12;
+        # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;
+        #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
+        # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
+        # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
+        p1_1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+
+        # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
+        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+
+        # Configuration register is 0x2002
+        # Configuration Register is 0x102
+        p3 = re.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
+
+        # Standby Configuration register is 0x2002
+        p4 = re.compile(r'^Standby +Configuration +register'
+                        ' +is +(?P<var>\w+)$')
+
+        # BOOT path-list      : flash:/c2960x-universalk9-mz.152-4.E8.bin
+        # HELPER path-list    :
+        p7 = re.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
+                        r'+(?P<value>[\w\:\/\-\.]+)?)$')
+
+        # Config file         : flash:/config.text
+        # Private Config file : flash:/private-config.text
+        # Enable Break        : yes
+        # Manual Boot         : no
+        # Allow Dev Key         : yes
+        # Auto upgrade        : no
+        # Auto upgrade path   :
+        p8 = re.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
+
+        # buffer size:   524288
+        p9 = re.compile(r'buffer +size\: +(?P<value>\d+)$')
+
+        # Download:    0 seconds
+        p10 = re.compile(r'Download\: +(?P<value>\d+ +\w+)$')
+
+        # via DHCP:       disabled (next boot: disabled)
+        p11 = re.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
+                         r'+(?P<next_boot>\w+)\)$')
+
+        # Switch 2
+        # switch 3
+        p12 = re.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
+
+        # Manual Boot = yes
+        p6 = re.compile(r'^Manual +Boot += +(?P<var>\w+)$')
+
+        # Enable Break = yes
+        p6_1 = re.compile(r'^Enable +Break += +(?P<var>\w+)$')
+
+        # Boot Mode = DEVICE
+        p6_2 = re.compile(r'^Boot +Mode += +(?P<var>\w+)$')
+
+        # iPXE Timeout = 0
+        p6_3 = re.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Current Boot Variables:
-            p1 = re.compile(r'Current +Boot +Variables:$')
             m = p1.match(line)
             if m:
                 boot_variable = 'current'
                 continue
 
-            # Boot Variables on next reload:
-            p1_2 = re.compile(r'Boot +Variables +on +next +reload:$')
             m = p1_2.match(line)
             if m:
                 boot_variable = 'next'
                 continue
 
-            # BOOT variable = bootflash:/asr1000rpx.bin,12;
-            # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;
-            #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
-            # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
-            # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
-            p1_1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
             m = p1_1.match(line)
             if m:
                 boot = m.groupdict()['var']
@@ -2604,8 +2684,6 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['active']['boot_variable'] = boot
                 continue
 
-            # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-            p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
             m = p2.match(line)
             if m:
                 if m.groupdict()['var']:
@@ -2614,9 +2692,6 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['standby']['boot_variable'] = m.groupdict()['var']
                 continue
 
-            # Configuration register is 0x2002
-            # Configuration Register is 0x102
-            p3 = re.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
             m = p3.match(line)
             if m:
                 if 'active' not in boot_dict:
@@ -2624,9 +2699,6 @@ class ShowBoot(ShowBootSchema):
                 boot_dict['active']['configuration_register'] = m.groupdict()['var']
                 continue
 
-            # Standby Configuration register is 0x2002
-            p4 = re.compile(r'^Standby +Configuration +register'
-                            ' +is +(?P<var>\w+)$')
             m = p4.match(line)
             if m:
                 if 'standby' not in boot_dict:
@@ -2634,8 +2706,6 @@ class ShowBoot(ShowBootSchema):
                 boot_dict['standby']['configuration_register'] = m.groupdict()['var']
                 continue
 
-            # Manual Boot = yes
-            p6 = re.compile(r'^Manual +Boot += +(?P<var>\w+)$')
             m = p6.match(line)
             if m:
                 boot_dict['manual_boot'] = True if \
@@ -2643,33 +2713,23 @@ class ShowBoot(ShowBootSchema):
                     False
                 continue
 
-            # Enable Break = yes
-            p6 = re.compile(r'^Enable +Break += +(?P<var>\w+)$')
-            m = p6.match(line)
+            m = p6_1.match(line)
             if m:
                 boot_dict['enable_break'] = True if \
                     m.groupdict()['var'].lower() == 'yes' else\
                     False
                 continue
 
-            # Boot Mode = DEVICE
-            p6 = re.compile(r'^Boot +Mode += +(?P<var>\w+)$')
-            m = p6.match(line)
+            m = p6_2.match(line)
             if m:
                 boot_dict['boot_mode'] = m.groupdict()['var'].lower()
                 continue
 
-            # iPXE Timeout = 0
-            p6 = re.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
-            m = p6.match(line)
+            m = p6_3.match(line)
             if m:
                 boot_dict['ipxe_timeout'] = int(m.groupdict()['var'])
                 continue
 
-            # BOOT path-list      : flash:/c2960x-universalk9-mz.152-4.E8.bin
-            # HELPER path-list    :
-            p7 = re.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
-                            r'+(?P<value>[\w\:\/\-\.]+)?)$')
             m7 = p7.match(line)
             if m7:
                 group = m7.groupdict()
@@ -2689,14 +2749,6 @@ class ShowBoot(ShowBootSchema):
 
                 continue
 
-            # Config file         : flash:/config.text
-            # Private Config file : flash:/private-config.text
-            # Enable Break        : yes
-            # Manual Boot         : no
-            # Allow Dev Key         : yes
-            # Auto upgrade        : no
-            # Auto upgrade path   :
-            p8 = re.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
             m8 = p8.match(line)
             if m8:
                 group = m8.groupdict()
@@ -2711,25 +2763,18 @@ class ShowBoot(ShowBootSchema):
 
                 continue
 
-            # buffer size:   524288
-            p9 = re.compile(r'buffer +size\: +(?P<value>\d+)$')
             m9 = p9.match(line)
             if m9:
                 index_dict.update({'nvram_buffer_size': int(m9.groupdict()['value'])})
 
                 continue
 
-            # Download:    0 seconds
-            p10 = re.compile(r'Download\: +(?P<value>\d+ +\w+)$')
             m10 = p10.match(line)
             if m10:
                 index_dict.update({'timeout_config_download': m10.groupdict()['value']})
 
                 continue
 
-            # via DHCP:       disabled (next boot: disabled)
-            p11 = re.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
-                             r'+(?P<next_boot>\w+)\)$')
             m11 = p11.match(line)
             if m11:
                 group = m11.groupdict()
@@ -2740,9 +2785,6 @@ class ShowBoot(ShowBootSchema):
 
                 continue
 
-            # Switch 2
-            # switch 3
-            p12 = re.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
             m12 = p12.match(line)
             if m12:
                 switch_number = int(m12.groupdict()['switch_number'])
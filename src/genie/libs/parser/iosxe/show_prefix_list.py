@@ -68,12 +68,29 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
         # initial variables
         ret_dict = {}
 
+        # ip prefix-list test:
+        # ipv6 prefix-list test6:
+        p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\:$')
+
+        # count: 5, range entries: 4, sequences: 5 - 25, refcount: 2
+        # count: 0, range entries: 0, refcount: 1
+        p2 = re.compile(r'^count: +(?P<count>\d+), +'
+                         'range entries: +(?P<entries>\d+),( +'
+                         'sequences: +(?P<sequences>[\d\-\s]+),)? +'
+                         'refcount: +(?P<refcount>\d+)$')
+
+        # seq 5 permit 10.205.0.0/8 (hit count: 0, refcount: 1)
+        # seq 5 permit 2001:DB8:1::/64 (hit count: 0, refcount: 1)
+        # seq 20 permit 10.94.0.0/8 ge 24 (hit count: 0, refcount: 2)
+        # seq 25 permit 10.169.0.0/8 ge 16 le 24 (hit count: 0, refcount: 3)
+        p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
+                         '(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
+                         '( *(?P<range>[lge\d\s]+))?'
+                         ' +\(hit +count: +(?P<hit_count>\d+), +refcount: +(?P<refcount>\d+)\)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # ip prefix-list test:
-            # ipv6 prefix-list test6:
-            p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\:$')
             m = p1.match(line)
             if m:
                 name = m.groupdict()['name']
@@ -86,12 +103,6 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
                 ret_dict['prefix_set_name'][name]['prefix_set_name'] = name
                 continue
 
-            # count: 5, range entries: 4, sequences: 5 - 25, refcount: 2
-            # count: 0, range entries: 0, refcount: 1
-            p2 = re.compile(r'^count: +(?P<count>\d+), +'
-                             'range entries: +(?P<entries>\d+),( +'
-                             'sequences: +(?P<sequences>[\d\-\s]+),)? +'
-                             'refcount: +(?P<refcount>\d+)$')
             m = p2.match(line)
             if m:
                 ret_dict['prefix_set_name'][name]['count'] = int(m.groupdict()['count'])
@@ -102,14 +113,6 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
                 ret_dict['prefix_set_name'][name]['protocol'] = protocol
                 continue
 
-            # seq 5 permit 10.205.0.0/8 (hit count: 0, refcount: 1)
-            # seq 5 permit 2001:DB8:1::/64 (hit count: 0, refcount: 1)
-            # seq 20 permit 10.94.0.0/8 ge 24 (hit count: 0, refcount: 2)
-            # seq 25 permit 10.169.0.0/8 ge 16 le 24 (hit count: 0, refcount: 3)
-            p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
-                             '(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
-                             '( *(?P<range>[lge\d\s]+))?'
-                             ' +\(hit +count: +(?P<hit_count>\d+), +refcount: +(?P<refcount>\d+)\)$')
             m = p3.match(line)
             if m:
                 prefixes = m.groupdict()['prefixes']
@@ -13,6 +13,7 @@ from netaddr import IPAddress
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.running_config import config_section
 
 
 # ==============================
@@ -535,8 +536,10 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
 
                 if protocol == 'ospf':
                     # Get VRF information based on OSPF instance
-                    out = self.device.execute("show running-config | section "
-                                              "router ospf {}".format(instance))
+                    section = 'router ospf {}'.format(instance)
+                    out = config_section(
+                        self.device, section,
+                        'show running-config | section {}'.format(section))
                     # Parse for VRF
                     for line in out.splitlines():
                         line = line.strip()
@@ -8,6 +8,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.stream import RecordStream, iter_lines
+from genie.libs.parser.utils.compact import compact_output
 
 # ====================================================
 #  distributor class for show ip route
@@ -201,6 +204,45 @@ class ShowIpRoute(ShowIpRouteSchema):
         else:
             out = output
 
+        result_dict = {}
+        for _ in self._iter_parse(out.splitlines(), vrf, result_dict,
+                                  RecordStream()):
+            pass
+        return result_dict
+
+    def parse_iter(self, output_stream, vrf=None):
+        """Parse the output line by line, without keeping the routes
+
+        Args:
+            output_stream (`str`, file object or iterable of `str`): output
+            vrf (`str`): vrf of the routes when the output does not show it
+
+        Yields:
+            tuple: ((vrf, address_family, route), route dict), one for each
+                   route once all its lines are parsed
+        """
+        return self._iter_parse(iter_lines(output_stream), vrf, {},
+                                RecordStream(streaming=True))
+
+    def parse_compact(self, output_stream, vrf=None, validate=True):
+        """Parse the output into compact route tables
+
+        Same output as cli(), the routes of each address family being stored
+        in a CompactTable, a read-only dict of a fraction of the memory.
+
+        Args:
+            output_stream (`str`, file object or iterable of `str`): output
+            vrf (`str`): vrf of the routes when the output does not show it
+            validate (`bool`): validate each route against the schema
+        """
+        result_dict = {}
+        records = self._iter_parse(iter_lines(output_stream), vrf,
+                                   result_dict, RecordStream(streaming=True))
+        return compact_output(
+            records, result_dict, ('vrf', 0, 'address_family', 1, 'routes'),
+            schema=self.schema if validate else None)
+
+    def _iter_parse(self, lines, vrf, result_dict, records):
         af = self.IP_VER
         route = ""
         if not vrf:
@@ -221,8 +263,6 @@ class ShowIpRoute(ShowIpRouteSchema):
         source_protocol_dict['local_connected'] = ['LC']
         source_protocol_dict['bgp'] = ['B']
 
-        result_dict = {}
-
         # initial regexp pattern
         p100 = re.compile(r'^Routing +entry +for +'
                         '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
@@ -254,369 +294,381 @@ class ShowIpRoute(ShowIpRouteSchema):
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
-            if line:
-                line = line.strip()
-            else:
-                continue
-
-            next_hop = interface = updated = metrics = route_preference = ""
-            # Routing Table: VRF1
-            # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
-            if m:
-                vrf = m.groupdict()['vrf']
-                continue
-
-            # 10.1.0.0/32 is subnetted, 1 subnets
-            # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
-            if m:
-                # if you see the issue by "show ip route", it means that active is True.
-                # it means all routes in the output should be active=True
-                active = True
-                netmask = number_of_masks= ""
-                number_of_subnets = m.groupdict()['number_of_subnets']
-                if m.groupdict()['number_of_masks']:
-                    number_of_masks = m.groupdict()['number_of_masks']
-
-                if m.groupdict()['subnetted_ip']:
-                    subnetted_ip = m.groupdict()['subnetted_ip']
-                    if '/' in subnetted_ip:
-                        netmask = subnetted_ip.split('/')[1]
-                continue
-
-            # C        10.4.1.1 is directly connected, Loopback0
-            # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
-            # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
-            # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
-            # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
-            # D        192.168.205.1
-            # S*       0.0.0.0/0 [1/0] via 10.50.15.1
-            # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            m = p3.match(line)
-            if m:
-                active = True
-                if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
-                    for key,val in source_protocol_dict.items():
-                        source_protocol_replaced = source_protocol_codes.split('*')[0]
-                        if source_protocol_replaced in val:
-                            source_protocol = key
-
-                if m.groupdict()['code1']:
-                    source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
-
-                if m.groupdict()['network']:
-                    network = m.groupdict()['network']
-                    if '/' in network:
-                        route = network
-                    else:
-                        route = '{}/{}'.format(network,netmask)
-
-                if not m.groupdict()['network']:
-                    route = route
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
-
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                    index = 1
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
+
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+                        r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # L        FF00::/8 [0/0]
+        if self.IP_VER == 'ipv4':
+            p3 = re.compile(
+                r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+                r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
+        else:
+            p3 = re.compile(
+                r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+                r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
+
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+                        r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
+
+        #       is directly connected, GigabitEthernet0/2
+        p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+                        r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+                        r'( +(?P<interface>[\S]+))?$')
+
+        #      via 2001:DB8:1:1::2
+        #      via 10.4.1.1%default, indirectly connected
+        #      via 2001:DB8:4:6::6
+        #      via 2001:DB8:20:4:6::6%VRF2
+        #      via Null0, receive
+        p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+                        r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+                        r'( +directly connected)?( +indirectly connected)?$')
+
+        # Set by the line handlers, used by the following lines
+        active = None
+        netmask = None
+        path_dict = None
+        route_dict = None
+        source_protocol = None
+        source_protocol_codes = None
+
+        def route_entry(route):
+            routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                     .setdefault('address_family', {}).setdefault(af, {})\
+                                     .setdefault('routes', {})
+            return records.start(routes_dict, route, (vrf, af, route))
+
+        dispatcher = LineDispatcher()
+
+        @dispatcher.rule(p1)
+        def handle_p1(m):
+            nonlocal vrf
+            vrf = m.groupdict()['vrf']
+
+        @dispatcher.rule(p2)
+        def handle_p2(m):
+            nonlocal active, netmask
+            # if you see the issue by "show ip route", it means that active is True.
+            # it means all routes in the output should be active=True
+            active = True
+            netmask = number_of_masks= ""
+            number_of_subnets = m.groupdict()['number_of_subnets']
+            if m.groupdict()['number_of_masks']:
+                number_of_masks = m.groupdict()['number_of_masks']
+
+            if m.groupdict()['subnetted_ip']:
+                subnetted_ip = m.groupdict()['subnetted_ip']
+                if '/' in subnetted_ip:
+                    netmask = subnetted_ip.split('/')[1]
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+        # D        192.168.205.1
+        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+        # L        FF00::/8 [0/0]
+        @dispatcher.rule(p3)
+        def handle_p3(m):
+            nonlocal active, index, interface, metrics, next_hop, route, \
+                route_dict, route_preference, source_protocol, \
+                source_protocol_codes, updated
+            active = True
+            if m.groupdict()['code']:
+                source_protocol_codes = m.groupdict()['code'].strip()
+                for key,val in source_protocol_dict.items():
+                    source_protocol_replaced = source_protocol_codes.split('*')[0]
+                    if source_protocol_replaced in val:
+                        source_protocol = key
+
+            if m.groupdict()['code1']:
+                source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
+
+            if m.groupdict()['network']:
+                network = m.groupdict()['network']
+                if '/' in network:
+                    route = network
                 else:
-                    index = 0
-
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-                route_dict['active'] = active
+                    route = '{}/{}'.format(network,netmask)
 
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
+            if not m.groupdict()['network']:
+                route = route
 
-                continue
-
-            #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
-            if m:
+            if m.groupdict()['route_preference']:
                 routepreference = m.groupdict()['route_preference']
-                if routepreference and '/' in routepreference:
+                if '/' in routepreference:
                     route_preference = routepreference.split('/')[0]
                     metrics = routepreference.split('/')[1]
 
+            if m.groupdict()['next_hop']:
                 next_hop = m.groupdict()['next_hop']
-                index +=1
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                index = 1
+            else:
+                index = 0
 
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+            if m.groupdict()['interface']:
+                interface = m.groupdict()['interface']
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+            if m.groupdict()['date']:
+                updated = m.groupdict()['date']
 
-                route_dict['route'] = route
-                route_dict['active'] = active
+            route_dict = route_entry(route)
 
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
+            route_dict['route'] = route
+            route_dict['active'] = active
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+            if metrics:
+                route_dict['metric'] = int(metrics)
+            if route_preference:
+                route_dict['route_preference'] = int(route_preference)
+            if source_protocol_codes:
+                route_dict['source_protocol_codes'] = source_protocol_codes
+                route_dict['source_protocol'] = source_protocol
 
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+            next_hop_dict = route_dict.setdefault('next_hop', {})
 
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
+            if not next_hop and interface:
+                intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
 
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
+            elif next_hop:
+                idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                idx_dict['index'] = index
+                idx_dict['next_hop'] = next_hop
 
-                continue
+                if updated:
+                    idx_dict['updated'] = updated
+                if interface:
+                    idx_dict['outgoing_interface'] = interface
 
-            #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
-            if m:
+        @dispatcher.rule(p4)
+        def handle_p4(m):
+            nonlocal index, interface, metrics, next_hop, route_dict, route_preference, updated
+            routepreference = m.groupdict()['route_preference']
+            if routepreference and '/' in routepreference:
+                route_preference = routepreference.split('/')[0]
+                metrics = routepreference.split('/')[1]
 
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
+            next_hop = m.groupdict()['next_hop']
+            index +=1
+            if m.groupdict()['interface']:
+                interface = m.groupdict()['interface']
 
-                index += 1
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+            if m.groupdict()['date']:
+                updated = m.groupdict()['date']
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+            route_dict = route_entry(route)
 
-                route_dict['route'] = route
+            route_dict['route'] = route
+            route_dict['active'] = active
 
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
+            if metrics:
+                route_dict['metric'] = int(metrics)
+            if route_preference:
+                route_dict['route_preference'] = int(route_preference)
+            if source_protocol_codes:
+                route_dict['source_protocol_codes'] = source_protocol_codes
+                route_dict['source_protocol'] = source_protocol
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+            next_hop_dict = route_dict.setdefault('next_hop', {})
 
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+            if not next_hop and interface:
+                intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
 
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
+            elif next_hop:
+                idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                idx_dict['index'] = index
+                idx_dict['next_hop'] = next_hop
 
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
+                if updated:
+                    idx_dict['updated'] = updated
+                if interface:
+                    idx_dict['outgoing_interface'] = interface
 
-                continue
+        @dispatcher.rule(p5)
+        def handle_p5(m):
+            nonlocal index, interface, metrics, next_hop, route_dict, route_preference, updated
 
-            #      via 2001:DB8:1:1::2
-            #      via 10.4.1.1%default, indirectly connected
-            #      via 2001:DB8:4:6::6
-            #      via 2001:DB8:20:4:6::6%VRF2
-            #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
-            if m:
-                vrf_val = ''
-                tmp_next_hop = m.groupdict()['next_hop']
-                if tmp_next_hop:
-                    if '%' in  tmp_next_hop:
-                        next_hop = tmp_next_hop.split('%')[0]
-                        vrf_val = tmp_next_hop.split('%')[1]
-                    else:
-                        next_hop = tmp_next_hop
+            if m.groupdict()['route_preference']:
+                routepreference = m.groupdict()['route_preference']
+                if '/' in routepreference:
+                    route_preference = routepreference.split('/')[0]
+                    metrics = routepreference.split('/')[1]
 
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+            index += 1
+            if m.groupdict()['next_hop']:
+                next_hop = m.groupdict()['next_hop']
+            if m.groupdict()['interface']:
+                interface = m.groupdict()['interface']
+            if m.groupdict()['date']:
+                updated = m.groupdict()['date']
+
+            route_dict = route_entry(route)
+
+            route_dict['route'] = route
+
+            if metrics:
+                route_dict['metric'] = int(metrics)
+            if route_preference:
+                route_dict['route_preference'] = int(route_preference)
+
+            next_hop_dict = route_dict.setdefault('next_hop', {})
+
+            if not next_hop and interface:
+                intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+
+            elif next_hop:
+                idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                idx_dict['index'] = index
+                idx_dict['next_hop'] = next_hop
+
+                if updated:
+                    idx_dict['updated'] = updated
+                if interface:
+                    idx_dict['outgoing_interface'] = interface
+
+        @dispatcher.rule(p6)
+        def handle_p6(m):
+            nonlocal index, interface, next_hop, route_dict
+            vrf_val = ''
+            tmp_next_hop = m.groupdict()['next_hop']
+            if tmp_next_hop:
+                if '%' in  tmp_next_hop:
+                    next_hop = tmp_next_hop.split('%')[0]
+                    vrf_val = tmp_next_hop.split('%')[1]
+                else:
+                    next_hop = tmp_next_hop
 
-                index += 1
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+            if m.groupdict()['interface']:
+                interface = m.groupdict()['interface']
 
-                route_dict['route'] = route
-                route_dict['active'] = active
+            index += 1
+            route_dict = route_entry(route)
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+            route_dict['route'] = route
+            route_dict['active'] = active
 
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+            next_hop_dict = route_dict.setdefault('next_hop', {})
 
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
+            if not next_hop and interface:
+                intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
 
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-                    if vrf_val:
-                        idx_dict['vrf'] = vrf_val
+            elif next_hop:
+                idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                idx_dict['index'] = index
+                idx_dict['next_hop'] = next_hop
 
-                continue
+                if updated:
+                    idx_dict['updated'] = updated
+                if interface:
+                    idx_dict['outgoing_interface'] = interface
+                if vrf_val:
+                    idx_dict['vrf'] = vrf_val
 
-            # Routing entry for 10.151.0.0/24, 1 known subnets
-            # Routing entry for 0.0.0.0/0, supernet
-            # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
-                group = m.groupdict()
-                entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
-                                                                                              {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
-                route_dict.update({'route': group['ip']})
-                route_dict.update({'mask': group['mask']})
-                route_dict.update({'active': True})
-                continue
-
-            # Known via "eigrp 1", distance 130, metric 10880, type internal
-            # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
-                group = m.groupdict()
-                route_dict.update({'distance': int(group['distance'])})
-                route_dict.update({'metric': int(group['metric'])})
-                if group['type']:
-                    route_dict.update({'type': group['type']})
-                continue
-
-            # Redistributing via rip
-            # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
-                group = m.groupdict()
-                route_dict.update({k: v for k, v in group.items() if v})
-                continue
+        # Routing entry for 10.151.0.0/24, 1 known subnets
+        # Routing entry for 0.0.0.0/0, supernet
+        # Routing entry for 192.168.154.0/24
+        @dispatcher.rule(p100)
+        def handle_p100(m):
+            nonlocal route_dict
+            group = m.groupdict()
+            route_dict = route_entry(route)
+            route_dict.update({'route': group['ip']})
+            route_dict.update({'mask': group['mask']})
+            route_dict.update({'active': True})
 
-            # Last update from 192.168.151.2 on Vlan101, 2w3d ago
-            # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
-                group = m.groupdict()
-                update_dict = route_dict.setdefault('update', {})
-                update_dict.update({k: v for k, v in group.items() if v})
-                continue
+        # Known via "eigrp 1", distance 130, metric 10880, type internal
+        # Known via "rip", distance 120, metric 2
+        @dispatcher.rule(p200)
+        def handle_p200(m):
+            group = m.groupdict()
+            route_dict.update({'distance': int(group['distance'])})
+            route_dict.update({'metric': int(group['metric'])})
+            if group['type']:
+                route_dict.update({'type': group['type']})
 
-            # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
-            # * 10.69.1.2
-            m = p500.match(line)
-            if m:
-                group = m.groupdict()
-                index += 1
-                path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
-                path_dict.update({'index': index})
-                path_dict.update({'next_hop': group['nexthop']})
-                path_dict.update({'age': group['age']})
-                path_dict.update({'from': group['from']})
-                path_dict.update({'outgoing_interface': group['interface']})
-                continue
+        # Redistributing via rip
+        # Redistributing via eigrp 1
+        @dispatcher.rule(p300)
+        def handle_p300(m):
+            group = m.groupdict()
+            route_dict.update({k: v for k, v in group.items() if v})
 
-            # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
+        # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+        # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
+        @dispatcher.rule(p400)
+        def handle_p400(m):
+            group = m.groupdict()
+            update_dict = route_dict.setdefault('update', {})
+            update_dict.update({k: v for k, v in group.items() if v})
+
+        # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+        # * 10.69.1.2
+        @dispatcher.rule(p500)
+        def handle_p500(m):
+            nonlocal index, path_dict
+            group = m.groupdict()
+            index += 1
+            path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
+            path_dict.update({'index': index})
+            path_dict.update({'next_hop': group['nexthop']})
+            path_dict.update({'age': group['age']})
+            path_dict.update({'from': group['from']})
+            path_dict.update({'outgoing_interface': group['interface']})
 
-            # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
+        # Route metric is 10880, traffic share count is 1
+        @dispatcher.rule(p600)
+        def handle_p600(m):
+            group = m.groupdict()
+            path_dict.update({k: v for k, v in group.items() if v})
+
+        # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+        @dispatcher.rule(p700)
+        def handle_p700(m):
+            group = m.groupdict()
+            path_dict.update({k: v for k, v in group.items() if v})
+
+        # Reliability 255/255, minimum MTU 1500 bytes
+        @dispatcher.rule(p800)
+        def handle_p800(m):
+            group = m.groupdict()
+            path_dict.update({k: v for k, v in group.items() if v})
+
+        # Loading 1/255, Hops 1
+        @dispatcher.rule(p900)
+        def handle_p900(m):
+            group = m.groupdict()
+            path_dict.update({k: v for k, v in group.items() if v})
+
+        for line in lines:
+            if line:
+                line = line.strip()
+            else:
                 continue
 
-            # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
+            next_hop = interface = updated = metrics = route_preference = ""
 
-            # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
+            dispatcher.dispatch(line)
+            if records.completed:
+                yield from records.pop_completed()
 
-        return result_dict
+        records.close()
+        yield from records.pop_completed()
 
 class ShowIpv6Route(ShowIpRoute):
     """Parser for:
@@ -740,23 +792,40 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
         source_protocol_dict['redirect'] = ['NDr']
 
         result_dict = {}
+
+        # IPv6 Routing Table - default - 23 entries
+        # IPv6 Routing Table - VRF1 - 104 entries
+        p1 = re.compile(r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$')
+
+        # LC  2001:1:1:1::1/128 [0/0]
+        p2 = re.compile(r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
+                        ' +\[(?P<route_preference>[\d\/]+)\]$')
+
+        #   via Loopback0, receive
+        #   via 2001:10:1:2::2, GigabitEthernet0/0
+        #   via GigabitEthernet0/2, directly connected
+        #   via 192.168.51.1%default, indirectly connected
+        p3 = re.compile(r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
+                        '( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$')
+
+        #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
+        p4 = re.compile(r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
+                        ' +(?P<interface>[\S]+)$')
+
+        #      Last updated 14:15:23 06 December 2017
+        p5 = re.compile(r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # IPv6 Routing Table - default - 23 entries
-            # IPv6 Routing Table - VRF1 - 104 entries
-            p1 = re.compile(r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 continue
 
-            # LC  2001:1:1:1::1/128 [0/0]
-            p2 = re.compile(r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
-                            ' +\[(?P<route_preference>[\d\/]+)\]$')
             m = p2.match(line)
             if m:
                 active = True
@@ -820,12 +889,6 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
                             ['source_protocol'] = source_protocol
                 continue
 
-            #   via Loopback0, receive
-            #   via 2001:10:1:2::2, GigabitEthernet0/0
-            #   via GigabitEthernet0/2, directly connected
-            #   via 192.168.51.1%default, indirectly connected
-            p3 = re.compile(r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
-                            '( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$')
             m = p3.match(line)
             if m:
                 if m.groupdict()['next_hop']:
@@ -885,9 +948,6 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
 
                 continue
 
-            #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
-            p4 = re.compile(r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
-                            ' +(?P<interface>[\S]+)$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['next_hop']:
@@ -947,8 +1007,6 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
                             ['next_hop_list'][index]['outgoing_interface'] = interface
 
                 continue
-            #      Last updated 14:15:23 06 December 2017
-            p5 = re.compile(r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$')
             m = p5.match(line)
             if m:
 
@@ -171,6 +171,10 @@ class ShowUsers(ShowUsersSchema):
         #               'location': '1212321',
         #               'user': ''}}
 
+        # handle ios sample output:
+        # 'line': '*  0 con 0',
+        line_pattern = re.compile(r'\*\s+(?P<line>[\s\S]+)')
+
         for k in pg_entries.keys():
 
             curr_dict = pg_entries[k]
@@ -196,9 +200,6 @@ class ShowUsers(ShowUsersSchema):
             # Build the parsed output
             # ----------------------------
 
-            # handle ios sample output:
-            # 'line': '*  0 con 0',
-            line_pattern = re.compile(r'\*\s+(?P<line>[\s\S]+)')
             m = line_pattern.match(curr_dict['line'])
             if m:
                 line_val = m.groupdict()['line']
@@ -71,21 +71,59 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
         # Init vars
         standby_internal_dict = {}
         
+        # HSRP common process running
+        p1 = re.compile(r'\s*HSRP +common +process'
+                         ' +(?P<hsrp_common_process_state>[a-zA-Z\s]+)$')
+
+        # MsgQ size 0, max 2
+        p2 = re.compile(r'\s*MsgQ +size +(?P<msgQ_size>[0-9]+),'
+                         ' +max +(?P<msgQ_max_size>[0-9]+)$')
+
+        # HSRP IPv4 process running
+        p3 = re.compile(r'\s*HSRP +IPv4 +process'
+                         ' +(?P<hsrp_ipv4_process_state>[a-zA-Z\s]+)$')
+
+        # HSRP IPv6 process not running
+        p4 = re.compile(r'\s*HSRP +IPv6 +process'
+                         ' +(?P<hsrp_ipv6_process_state>[a-zA-Z\s]+)$')
+
+        # HSRP Timer wheel running
+        p5 = re.compile(r'\s*HSRP +Timer +wheel'
+                         ' +(?P<hsrp_timer_wheel_state>[a-zA-Z\s]+)$')
+
+        # HSRP HA capable, v3 to v4 transform disabled
+        p6 = re.compile(r'\s*HSRP +HA +(?P<hsrp_ha_state>[a-zA-Z\s]+),'
+                         ' +v3 +to +v4 +transform'
+                         ' +(?P<v3_to_v4_transform>[a-zA-Z\s]+)$')
+
+        # HSRP virtual IP Hash Table (global)
+        # 103 192.168.1.254                    Gi1/0/1    Grp 0
+        # HSRP virtual IPv6 Hash Table (global)
+        # 78  2001:DB8:10:1:1::254             Gi1        Grp 20
+        p7 = re.compile(r'\s*(?P<hsrp>[0-9]+) +(?P<ip>[0-9a-zA-Z\.\:]+)'
+                         ' +(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +Grp +(?P<group>[0-9]+)$')
+
+        # HSRP MAC Address Table
+        # 240 Gi1/0/1 0000.0cff.909f
+        p8 = re.compile(r'\s*(?P<hsrp_number>[0-9]+)'
+                         ' +(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
+
+        # HSRP MAC Address Table
+        # Gi1/0/1 Grp 0
+        p8_1 = re.compile(r'\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                           ' +Grp +(?P<group>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
             
-            # HSRP common process running
-            p1 = re.compile(r'\s*HSRP +common +process'
-                             ' +(?P<hsrp_common_process_state>[a-zA-Z\s]+)$')
             m = p1.match(line)
             if m:
                 stby_internal = standby_internal_dict
                 stby_internal['hsrp_common_process_state'] = \
                     m.groupdict()['hsrp_common_process_state']
 
-            # MsgQ size 0, max 2
-            p2 = re.compile(r'\s*MsgQ +size +(?P<msgQ_size>[0-9]+),'
-                             ' +max +(?P<msgQ_max_size>[0-9]+)$')
             m = p2.match(line)
             if m:
                 stby_internal['msgQ_size'] = int(m.groupdict()['msgQ_size'])
@@ -93,37 +131,24 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
                     int(m.groupdict()['msgQ_max_size'])
                 continue
 
-            # HSRP IPv4 process running
-            p3 = re.compile(r'\s*HSRP +IPv4 +process'
-                             ' +(?P<hsrp_ipv4_process_state>[a-zA-Z\s]+)$')
             m = p3.match(line)
             if m:
                 stby_internal['hsrp_ipv4_process_state'] = \
                     m.groupdict()['hsrp_ipv4_process_state']
                 continue
 
-            # HSRP IPv6 process not running
-            p4 = re.compile(r'\s*HSRP +IPv6 +process'
-                             ' +(?P<hsrp_ipv6_process_state>[a-zA-Z\s]+)$')
             m = p4.match(line)
             if m:
                 stby_internal['hsrp_ipv6_process_state'] = \
                     m.groupdict()['hsrp_ipv6_process_state']
                 continue
 
-            # HSRP Timer wheel running
-            p5 = re.compile(r'\s*HSRP +Timer +wheel'
-                             ' +(?P<hsrp_timer_wheel_state>[a-zA-Z\s]+)$')
             m = p5.match(line)
             if m:
                 stby_internal['hsrp_timer_wheel_state'] = \
                     m.groupdict()['hsrp_timer_wheel_state']
                 continue
 
-            # HSRP HA capable, v3 to v4 transform disabled
-            p6 = re.compile(r'\s*HSRP +HA +(?P<hsrp_ha_state>[a-zA-Z\s]+),'
-                             ' +v3 +to +v4 +transform'
-                             ' +(?P<v3_to_v4_transform>[a-zA-Z\s]+)$')
             m = p6.match(line)
             if m:
                 stby_internal['hsrp_ha_state'] = m.groupdict()['hsrp_ha_state']
@@ -131,13 +156,6 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
                     m.groupdict()['v3_to_v4_transform']
                 continue
 
-            # HSRP virtual IP Hash Table (global)
-            # 103 192.168.1.254                    Gi1/0/1    Grp 0
-            # HSRP virtual IPv6 Hash Table (global)
-            # 78  2001:DB8:10:1:1::254             Gi1        Grp 20
-            p7 = re.compile(r'\s*(?P<hsrp>[0-9]+) +(?P<ip>[0-9a-zA-Z\.\:]+)'
-                             ' +(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +Grp +(?P<group>[0-9]+)$')
             m = p7.match(line)
             if m:
                 hsrp = int(m.groupdict()['hsrp'])
@@ -162,11 +180,6 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
                         ['group']= int(m.groupdict()['group'])
                     continue
 
-            # HSRP MAC Address Table
-            # 240 Gi1/0/1 0000.0cff.909f
-            p8 = re.compile(r'\s*(?P<hsrp_number>[0-9]+)'
-                             ' +(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
             m = p8.match(line)
             if m:
                 # Save last interface
@@ -184,10 +197,6 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
                         ['mac_address'] = m.groupdict()['mac_address']
                     continue
 
-            # HSRP MAC Address Table
-            # Gi1/0/1 Grp 0
-            p8_1 = re.compile(r'\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                               ' +Grp +(?P<group>[0-9]+)$')
             m = p8_1.match(line)
             if m:
                 interface = m.groupdict()['interface'].lower()
@@ -395,13 +404,135 @@ class ShowStandbyAll(ShowStandbyAllSchema):
         standby_all_dict = {}
         group_key = {}
         
+        # Ethernet4/1 - Group 0 (version 2)
+        p1 = re.compile(r'\s*(?P<intf>[a-zA-Z0-9\/\.]+) +\- +Group'
+                         ' +(?P<group>[0-9]+)'
+                         ' *(?:\(version +(?P<version>[0-9]+)\))?$')
+
+        # State is Active
+        # State is Disabled
+        # State is Init (protocol not cfgd)
+        p2 = re.compile(r'\s*[sS]tate +is +(?P<hsrp_router_state>\S+)'
+            '( +\((?P<hsrp_router_state_reason>.+)\))?')
+
+        # 8 state changes, last state change 1w0d
+        p3 = re.compile(r'\s*(?P<num_state_changes>[0-9]+) +state'
+                         ' +changes, +last +state +change'
+                         ' +(?P<last_state_change>[a-zA-Z0-9]+)$')
+
+        # Virtual IP address is 192.168.1.254
+        # Virtual IP address is unknown
+        # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:14 (conf auto EUI64)
+        # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:A (impl auto EUI64)
+        # Virtual IPv6 address 2001:DB8:10:1:1::254/64
+        p5 = re.compile(r'\s*(?P<v6_type>\S+)? *Virtual +'
+            '(?P<address_family>\S+) +address( +is)? +(?P<vip>\S+) ?'
+            '(\((?P<vip_conf>.*)\))?$')
+
+        # Active virtual MAC address is 0000.0cff.909f (MAC In Use)
+        # Active virtual MAC address is unknown (MAC Not In Use)
+        p6 = re.compile(r'\s*Active +virtual +MAC +address +is'
+                         ' +(?P<virtual_mac_address>[a-zA-Z0-9\.]+)'
+                         ' +\((?P<virtual_mac_address_mac_in_use>'
+                         '[a-zA-Z\s]+)\)$')
+
+        # Local virtual MAC address is 0000.0cff.909f (v2 default)
+        # Local virtual MAC address is 5254.00ff.afbf (bia)
+        # Local virtual MAC address is aaaa.aaff.5555 (cfgd)
+        p7 = re.compile(r'\s*Local +virtual +MAC +address +is'
+                         ' +(?P<local_virtual_mac_address>[a-zA-Z0-9\.]+)'
+                         ' +\((?P<local_virtual_mac_address_conf>'
+                         '[a-zA-Z0-9\s]+)\)$')
+
+        # Hellotime 1 sec, holdtime 3 sec
+        # Hello time 3 sec, hold time 10 sec
+        # Hello time 999 msec, hold time 10 sec
+        # Hello time 999 msec, hold time 2999 msec
+        # Hello time 9 sec (cfgd 999 msec), hold time 27 sec (cfgd 2999 msec)
+        p8 = re.compile(r'\s*Hello ?time +(?P<hellotime>[0-9]+) '
+            '(?P<hello_unit>\S+)( \(cfgd (?P<cfgd_hello_msec>\d)+ msec\))?'
+            ', +hold ?time +(?P<holdtime>[0-9]+) +(?P<hold_unit>\S+)'
+            '( \(cfgd (?P<cfgd_hold_msec>\d+) msec\))?$')
+
+        # Next hello sent in 2.848 secs
+        p9 = re.compile(r'\s*Next +hello +sent +in'
+                         ' +(?P<next_hello_sent>[0-9\.]+) secs$')
+
+        # Preemption enabled, delay min 5 secs, reload 10 secs, sync 20 secs
+        # Preemption enabled
+        p11 = re.compile(r'\s*Preemption +(?P<preempt>[a-zA-Z]+)(?:, +delay'
+                          ' +min +(?P<preempt_min_delay>[0-9]+) +secs,)?'
+                          '(?: +reload +(?P<preempt_reload_delay>[0-9]+)'
+                          ' +secs,)?(?: +sync'
+                          ' +(?P<preempt_sync_delay>[0-9]+) +secs)?$')
+
+        # Active router is unknown
+        p12 = re.compile(r'\s*Active +router +is'
+                          ' +(?P<active_router>[a-zA-Z\s]+)$')
+
+        # Active router is 10.1.2.1, priority 120 (expires in 0.816 sec)
+        p12_1 = re.compile(r'\s*Active +router +is'
+                          ' +(?P<active_router>\S+),'
+                          ' +priority +(?P<ar_priority>[0-9]+)'
+                          ' +\(expires in (?P<active_expires_in>'
+                          '[a-zA-Z0-9\.\s]+) sec\)$')
+
+        # Standby router is unknown 
+        # Standby router is 10.1.1.2, priority 100 (expires in 10.624 sec)
+        p13 = re.compile(r'\s*Standby +router +is +(?P<standby_router>'
+                          '[a-zA-Z0-9\.]+)(, +priority +'
+                          '(?P<standby_priority>\d+) +\(expires +in +'
+                          '(?P<standby_expires_in>\S+) +sec\))?')
+
+        # Priority 100 (default 100)
+        p14 = re.compile(r'\s*Priority +(?P<priority>[0-9]+)'
+                          ' +\(default +(?P<default_priority>[0-9]+)\)$')
+
+        # Priority 100 (configured 100)
+        p15 = re.compile(r'\s*Priority +(?P<priority>[0-9]+)'
+                          ' +\(configured'
+                          ' +(?P<configured_priority>[0-9]+)\)$')
+
+        # Secondary virtual IP address 10.1.1.253
+        p4 = re.compile(r'\s*[sS]econdary +virtual +IP +address +'
+            '(?P<secondary_ipv4_address>\S+)$')
+
+        # Track object 1 (unknown)
+        p4_1 = re.compile(r'\s*Track +object +(?P<tracked_object>[0-9]+)'
+                         ' +\((?P<tracked_status>\S+)\)$')
+
+        # Authentication MD5, key-string "cisco123"
+        # Authentication MD5, key-chain "cisco123"
+        # Authentication text "cisco123"
+        # Authentication "cisco123"
+        # Authentication text, string "cisco123"
+        p10 = re.compile(r'\s*[aA]uthentication +(?P<authentication_type>'
+            '[a-zA-Z0-9]+)?(, +)?(key-string|key-chain|string)?( +)?'
+            '\"(?P<authentication>\S+)\"$')
+
+        # MAC refresh 222 secs (next refresh 0 secs)
+        p10_1 = re.compile(r'\s*MAC refresh (?P<mac_refresh>\d+) secs '
+            '\(next refresh (?P<mac_next_refresh>\d+) secs\)$')
+
+        # Group name is "hsrp-Gi1/0/1-0" (default)
+        p16 = re.compile(r'\s*Group +name +is'
+                          ' +\"(?P<session_name>[a-zA-Z0-9\/\-]+)\"'
+                          ' +\(default\)$')
+
+        # Group name is "gandalf" (cfgd)
+        p16_1 = re.compile(r'\s*Group +name +is'
+                          ' +\"(?P<session_name>[a-zA-Z0-9\/\-]+)\"'
+                          ' +\(cfgd\)$')
+
+        # Following "group10"
+        p17 = re.compile(r'\s*[fF]ollowing +\"(?P<follow>\S+)\"$')
+
+        # HSRP ICMP redirects disabled
+        p17_1 = re.compile(r'HSRP ICMP redirects disabled')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # Ethernet4/1 - Group 0 (version 2)
-            p1 = re.compile(r'\s*(?P<intf>[a-zA-Z0-9\/\.]+) +\- +Group'
-                             ' +(?P<group>[0-9]+)'
-                             ' *(?:\(version +(?P<version>[0-9]+)\))?$')
             m = p1.match(line)
             if m:
                 num_state_changes = last_state_change = None
@@ -413,11 +544,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     version = 1
                 continue
 
-            # State is Active
-            # State is Disabled
-            # State is Init (protocol not cfgd)
-            p2 = re.compile(r'\s*[sS]tate +is +(?P<hsrp_router_state>\S+)'
-                '( +\((?P<hsrp_router_state_reason>.+)\))?')
             m = p2.match(line)
             if m:
                 hsrp_router_state = m.groupdict()['hsrp_router_state'].lower()
@@ -426,24 +552,12 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         m.groupdict()['hsrp_router_state_reason']
                 continue
 
-            # 8 state changes, last state change 1w0d
-            p3 = re.compile(r'\s*(?P<num_state_changes>[0-9]+) +state'
-                             ' +changes, +last +state +change'
-                             ' +(?P<last_state_change>[a-zA-Z0-9]+)$')
             m = p3.match(line)
             if m:
                 num_state_changes = int(m.groupdict()['num_state_changes'])
                 last_state_change = m.groupdict()['last_state_change']
                 continue
 
-            # Virtual IP address is 192.168.1.254
-            # Virtual IP address is unknown
-            # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:14 (conf auto EUI64)
-            # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:A (impl auto EUI64)
-            # Virtual IPv6 address 2001:DB8:10:1:1::254/64
-            p5 = re.compile(r'\s*(?P<v6_type>\S+)? *Virtual +'
-                '(?P<address_family>\S+) +address( +is)? +(?P<vip>\S+) ?'
-                '(\((?P<vip_conf>.*)\))?$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['v6_type']:
@@ -526,9 +640,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
 
                 continue
 
-            # Secondary virtual IP address 10.1.1.253
-            p4 = re.compile(r'\s*[sS]econdary +virtual +IP +address +'
-                '(?P<secondary_ipv4_address>\S+)$')
             m = p4.match(line)
             if m:
                 if 'secondary_ipv4_addresses' not in group_key:
@@ -540,10 +651,7 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                 group_key['secondary_ipv4_addresses'][secondary_ipv4_address]\
                     ['address'] = secondary_ipv4_address
 
-            # Track object 1 (unknown)
-            p4 = re.compile(r'\s*Track +object +(?P<tracked_object>[0-9]+)'
-                             ' +\((?P<tracked_status>\S+)\)$')
-            m = p4.match(line)
+            m = p4_1.match(line)
             if m:
                 tracked_object = int(m.groupdict()['tracked_object'])
                 if 'tracked_objects' not in group_key:
@@ -554,12 +662,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     = tracked_object
                 continue
 
-            # Active virtual MAC address is 0000.0cff.909f (MAC In Use)
-            # Active virtual MAC address is unknown (MAC Not In Use)
-            p6 = re.compile(r'\s*Active +virtual +MAC +address +is'
-                             ' +(?P<virtual_mac_address>[a-zA-Z0-9\.]+)'
-                             ' +\((?P<virtual_mac_address_mac_in_use>'
-                             '[a-zA-Z\s]+)\)$')
             m = p6.match(line)
             if m:
                 group_key['virtual_mac_address'] = m.groupdict()\
@@ -571,13 +673,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     group_key['virtual_mac_address_mac_in_use'] = False
                 continue
 
-            # Local virtual MAC address is 0000.0cff.909f (v2 default)
-            # Local virtual MAC address is 5254.00ff.afbf (bia)
-            # Local virtual MAC address is aaaa.aaff.5555 (cfgd)
-            p7 = re.compile(r'\s*Local +virtual +MAC +address +is'
-                             ' +(?P<local_virtual_mac_address>[a-zA-Z0-9\.]+)'
-                             ' +\((?P<local_virtual_mac_address_conf>'
-                             '[a-zA-Z0-9\s]+)\)$')
             m = p7.match(line)
             if m:
                 group_key['local_virtual_mac_address'] \
@@ -592,15 +687,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     standby_all_dict[interface]['use_bia'] = False
                 continue
 
-            # Hellotime 1 sec, holdtime 3 sec
-            # Hello time 3 sec, hold time 10 sec
-            # Hello time 999 msec, hold time 10 sec
-            # Hello time 999 msec, hold time 2999 msec
-            # Hello time 9 sec (cfgd 999 msec), hold time 27 sec (cfgd 2999 msec)
-            p8 = re.compile(r'\s*Hello ?time +(?P<hellotime>[0-9]+) '
-                '(?P<hello_unit>\S+)( \(cfgd (?P<cfgd_hello_msec>\d)+ msec\))?'
-                ', +hold ?time +(?P<holdtime>[0-9]+) +(?P<hold_unit>\S+)'
-                '( \(cfgd (?P<cfgd_hold_msec>\d+) msec\))?$')
             m = p8.match(line)
             if m:
                 if 'timers' not in group_key:
@@ -627,23 +713,12 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         = int(m.groupdict()['cfgd_hold_msec'])
                 continue
 
-            # Next hello sent in 2.848 secs
-            p9 = re.compile(r'\s*Next +hello +sent +in'
-                             ' +(?P<next_hello_sent>[0-9\.]+) secs$')
             m = p9.match(line)
             if m:
                 group_key['timers']['next_hello_sent'] = \
                     float(m.groupdict()['next_hello_sent'])
                 continue
 
-            # Authentication MD5, key-string "cisco123"
-            # Authentication MD5, key-chain "cisco123"
-            # Authentication text "cisco123"
-            # Authentication "cisco123"
-            # Authentication text, string "cisco123"
-            p10 = re.compile(r'\s*[aA]uthentication +(?P<authentication_type>'
-                '[a-zA-Z0-9]+)?(, +)?(key-string|key-chain|string)?( +)?'
-                '\"(?P<authentication>\S+)\"$')
             m = p10.match(line)
             if m:
                 group_key['authentication'] = m.groupdict()['authentication']
@@ -651,10 +726,7 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     = m.groupdict()['authentication_type']
                 continue
 
-            # MAC refresh 222 secs (next refresh 0 secs)
-            p10 = re.compile(r'\s*MAC refresh (?P<mac_refresh>\d+) secs '
-                '\(next refresh (?P<mac_next_refresh>\d+) secs\)$')
-            m = p10.match(line)
+            m = p10_1.match(line)
             if m:
                 if m.groupdict()['mac_refresh']:
                     standby_all_dict[interface]['mac_refresh'] \
@@ -664,13 +736,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         = int(m.groupdict()['mac_next_refresh'])
                 continue
 
-            # Preemption enabled, delay min 5 secs, reload 10 secs, sync 20 secs
-            # Preemption enabled
-            p11 = re.compile(r'\s*Preemption +(?P<preempt>[a-zA-Z]+)(?:, +delay'
-                              ' +min +(?P<preempt_min_delay>[0-9]+) +secs,)?'
-                              '(?: +reload +(?P<preempt_reload_delay>[0-9]+)'
-                              ' +secs,)?(?: +sync'
-                              ' +(?P<preempt_sync_delay>[0-9]+) +secs)?$')
             m = p11.match(line)
             if m:
                 if m.groupdict()['preempt'] is not None:
@@ -686,20 +751,11 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         int(m.groupdict()['preempt_sync_delay'])
                 continue
 
-            # Active router is unknown
-            p12 = re.compile(r'\s*Active +router +is'
-                              ' +(?P<active_router>[a-zA-Z\s]+)$')
             m = p12.match(line)
             if m:
                 group_key['active_router'] = m.groupdict()['active_router']
                 continue
 
-            # Active router is 10.1.2.1, priority 120 (expires in 0.816 sec)
-            p12_1 = re.compile(r'\s*Active +router +is'
-                              ' +(?P<active_router>\S+),'
-                              ' +priority +(?P<ar_priority>[0-9]+)'
-                              ' +\(expires in (?P<active_expires_in>'
-                              '[a-zA-Z0-9\.\s]+) sec\)$')
             m = p12_1.match(line)
             if m:
                 active_router = m.groupdict()['active_router']
@@ -716,12 +772,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         float(m.groupdict()['active_expires_in'])
                 continue
 
-            # Standby router is unknown 
-            # Standby router is 10.1.1.2, priority 100 (expires in 10.624 sec)
-            p13 = re.compile(r'\s*Standby +router +is +(?P<standby_router>'
-                              '[a-zA-Z0-9\.]+)(, +priority +'
-                              '(?P<standby_priority>\d+) +\(expires +in +'
-                              '(?P<standby_expires_in>\S+) +sec\))?')
             m = p13.match(line)
             if m:
                 standby_router = m.groupdict()['standby_router']
@@ -739,9 +789,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         group_key['standby_ipv6_address'] = standby_router
                 continue
 
-            # Priority 100 (default 100)
-            p14 = re.compile(r'\s*Priority +(?P<priority>[0-9]+)'
-                              ' +\(default +(?P<default_priority>[0-9]+)\)$')
             m = p14.match(line)
             if m:
                 group_key['priority'] = int(m.groupdict()['priority'])
@@ -749,10 +796,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                     int(m.groupdict()['default_priority'])
                 continue
 
-            # Priority 100 (configured 100)
-            p15 = re.compile(r'\s*Priority +(?P<priority>[0-9]+)'
-                              ' +\(configured'
-                              ' +(?P<configured_priority>[0-9]+)\)$')
             m = p15.match(line)
             if m:
                 group_key['priority'] = int(m.groupdict()['priority'])
@@ -789,10 +832,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         [group_number] = group_key
                 continue
 
-            # Group name is "hsrp-Gi1/0/1-0" (default)
-            p16 = re.compile(r'\s*Group +name +is'
-                              ' +\"(?P<session_name>[a-zA-Z0-9\/\-]+)\"'
-                              ' +\(default\)$')
             m = p16.match(line)
             if m:
                 group_key['session_name'] = m.groupdict()['session_name']
@@ -827,11 +866,7 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         [group_number] = group_key
                 continue
             
-            # Group name is "gandalf" (cfgd)
-            p16 = re.compile(r'\s*Group +name +is'
-                              ' +\"(?P<session_name>[a-zA-Z0-9\/\-]+)\"'
-                              ' +\(cfgd\)$')
-            m = p16.match(line)
+            m = p16_1.match(line)
             if m:
                 group_key['session_name'] = \
                     m.groupdict()['session_name']
@@ -866,8 +901,6 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         [group_number] = group_key
                 continue
 
-            # Following "group10"
-            p17 = re.compile(r'\s*[fF]ollowing +\"(?P<follow>\S+)\"$')
             m = p17.match(line)
             if m:
                 group_key['follow'] = m.groupdict()['follow']
@@ -902,9 +935,7 @@ class ShowStandbyAll(ShowStandbyAllSchema):
                         [group_number] = group_key
                 continue            
 
-            # HSRP ICMP redirects disabled
-            p17 = re.compile(r'HSRP ICMP redirects disabled')
-            m = p17.match(line)
+            m = p17_1.match(line)
             if m:
                 standby_all_dict[interface]['redirects_disable'] = True
                 if 'follow' in group_key:
@@ -989,15 +1020,16 @@ class ShowStandbyDelay(ShowStandbyDelaySchema):
         # Init vars
         hsrp_delay_dict = {}
 
+        # GigabitEthernet1   99      888
+        p1 = re.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
+            '(?P<reload_delay>\d+)')
+
         for line in out.splitlines():
             line = line.rstrip()
 
             # Interface          Minimum Reload
             # (no need to parse above because it's just header)
 
-            # GigabitEthernet1   99      888
-            p1 = re.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
-                '(?P<reload_delay>\d+)')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
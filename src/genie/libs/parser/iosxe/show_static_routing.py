@@ -75,28 +75,31 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
         vrf = route = next_hop = ""
 
         result_dict = {}
+
+        # Static local RIB for default
+        p1 = re.compile(r'^\s*Static +local +RIB +for +(?P<vrf>[\w]+)$')
+
+        # M  10.16.2.2/32 [1/0] via GigabitEthernet0/0 10.1.2.2 [A]
+        # M             [2/0] via GigabitEthernet0/1 10.186.2.2 [N]
+        # M             [3/0] via 10.186.2.2 [N]
+        # M  10.36.3.3/32 [1/0] via GigabitEthernet0/2 [A]
+        # M             [1/0] via GigabitEthernet0/3 [A]
+        p2 = re.compile(r'^\s*(?P<code>[A-Z]+) +(?P<route>[\w\/\.]+)?'
+                        ' +\[(?P<if_preference>[\d]+)\/(?P<if_preference2>[\d]+)\]'
+                        ' +via +(?P<interface>[a-zA-Z][\w\/\.]+)?(?P<nexthop>[\d\s\.]+)?'
+                        ' +\[(?P<code_in_bracket>[\w])]$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
-            # Static local RIB for default
-            p1 = re.compile(r'^\s*Static +local +RIB +for +(?P<vrf>[\w]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
 
                 continue
 
-            # M  10.16.2.2/32 [1/0] via GigabitEthernet0/0 10.1.2.2 [A]
-            # M             [2/0] via GigabitEthernet0/1 10.186.2.2 [N]
-            # M             [3/0] via 10.186.2.2 [N]
-            # M  10.36.3.3/32 [1/0] via GigabitEthernet0/2 [A]
-            # M             [1/0] via GigabitEthernet0/3 [A]
-            p2 = re.compile(r'^\s*(?P<code>[A-Z]+) +(?P<route>[\w\/\.]+)?'
-                            ' +\[(?P<if_preference>[\d]+)\/(?P<if_preference2>[\d]+)\]'
-                            ' +via +(?P<interface>[a-zA-Z][\w\/\.]+)?(?P<nexthop>[\d\s\.]+)?'
-                            ' +\[(?P<code_in_bracket>[\w])]$')
             m = p2.match(line)
             if m:
                 code = m.groupdict()['code']
@@ -259,14 +262,39 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
         vrf = route = interface = next_hop = ""
 
         result_dict = {}
+
+        # IPv6 Static routes Table - default
+        p1 = re.compile(r'^\s*IPv6 +Static +routes +Table -+ (?P<vrf>[\w]+)$')
+
+        # 2001:2:2:2::2/128 via 2001:10:1:2::2, distance 3
+        # *   2001:2:2:2::2/128 via 2001:20:1:2::2, GigabitEthernet0/1, distance 1
+        # 2001:2:2:2::2/128 via 2001:10:1:2::2, GigabitEthernet0/0, distance 11, tag 100
+        # *   2001:3:3:3::3/128 via GigabitEthernet0/3, distance 1
+        p2 = re.compile(r'^\s*((?P<star>[*]+)  +)?(?P<route>[\w\/\:]+)?'
+                        ' +via +((?P<nexthop>[0-9a-fA-F\:]+), )?'
+                        '((?P<interface>[a-zA-Z][\w\.\/]+), )?'
+                        '(distance (?P<distance>[\d]+))?'
+                        '(, +tag +(?P<tag>[\d]+))?$')
+
+        # Resolves to 1 paths (max depth 1)
+        p3 = re.compile(r'^\s*Resolves +to +(?P<no_paths>[\d]+)? +paths'
+                        ' +\(max +depth +(?P<max_depth>[\d]+)\)$')
+
+        # via GigabitEthernet0/0
+        p4 = re.compile(r'^\s*via +(?P<resolved_interface>[\w\/\.]+)$')
+
+        # Rejected by routing table
+        p6 = re.compile(r'^\s*Rejected +by +(?P<rejected_by>[\w\s]+)$')
+
+        # Tracked object 1 is Up
+        p7 = re.compile(r'^\s*Tracked +object +(?P<tracked_no>\d+) +is +(?P<interface_status>[\w]+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # IPv6 Static routes Table - default
-            p1 = re.compile(r'^\s*IPv6 +Static +routes +Table -+ (?P<vrf>[\w]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -284,15 +312,6 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                         result_dict['vrf'][vrf]['address_family'][af] = {}
                 continue
 
-            # 2001:2:2:2::2/128 via 2001:10:1:2::2, distance 3
-            # *   2001:2:2:2::2/128 via 2001:20:1:2::2, GigabitEthernet0/1, distance 1
-            # 2001:2:2:2::2/128 via 2001:10:1:2::2, GigabitEthernet0/0, distance 11, tag 100
-            # *   2001:3:3:3::3/128 via GigabitEthernet0/3, distance 1
-            p2 = re.compile(r'^\s*((?P<star>[*]+)  +)?(?P<route>[\w\/\:]+)?'
-                            ' +via +((?P<nexthop>[0-9a-fA-F\:]+), )?'
-                            '((?P<interface>[a-zA-Z][\w\.\/]+), )?'
-                            '(distance (?P<distance>[\d]+))?'
-                            '(, +tag +(?P<tag>[\d]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -381,9 +400,6 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
 
                 continue
 
-            # Resolves to 1 paths (max depth 1)
-            p3 = re.compile(r'^\s*Resolves +to +(?P<no_paths>[\d]+)? +paths'
-                            ' +\(max +depth +(?P<max_depth>[\d]+)\)$')
             m = p3.match(line)
             if m:
                 resolved_interface = True
@@ -396,8 +412,6 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                     ['next_hop_list'][index]['max_depth'] = int(max_depth)
                 continue
 
-            # via GigabitEthernet0/0
-            p4 = re.compile(r'^\s*via +(?P<resolved_interface>[\w\/\.]+)$')
             m = p4.match(line)
             if m:
                 if resolved_interface:
@@ -407,8 +421,6 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                     resolved_interface = False
                 continue
 
-            # Rejected by routing table
-            p6 = re.compile(r'^\s*Rejected +by +(?P<rejected_by>[\w\s]+)$')
             m = p6.match(line)
             if m:
                 rejected_by = m.groupdict()['rejected_by']
@@ -416,8 +428,6 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                     ['next_hop_list'][index]['rejected_by'] = rejected_by
                 continue
 
-            # Tracked object 1 is Up
-            p7 = re.compile(r'^\s*Tracked +object +(?P<tracked_no>\d+) +is +(?P<interface_status>[\w]+)$')
             m = p7.match(line)
             if m:
                 track = m.groupdict()['tracked_no']
@@ -369,14 +369,17 @@ class ShowVlanMtu(ShowVlanMtuSchema):
             out = output
         vlan_list = []
         vlan_mtu_dict = {}
+
+        p1 = re.compile(r'^\s*VLAN\s +SVI_MTU\s +interface\s +MinMTU(port)\s +MaxMTU(port)\s +MTU_Mismatch$')
+
+        p2 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_mtu>[0-9\-]+) +(?P<vlan_min_mtu>[0-9]+) +(?P<vlan_max_mtu>[0-9]+) +(?P<mtu_mismatch>[a-zA-Z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN\s +SVI_MTU\s +interface\s +MinMTU(port)\s +MaxMTU(port)\s +MTU_Mismatch$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_mtu>[0-9\-]+) +(?P<vlan_min_mtu>[0-9]+) +(?P<vlan_max_mtu>[0-9]+) +(?P<mtu_mismatch>[a-zA-Z]+)$')
             m = p2.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -429,9 +432,15 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
         else:
             out = output
         access_map_dict = {}
+
+        p1 = re.compile(r'^\s*Vlan +access-map +\"(?P<access_map_id>[a-zA-Z0-9]+)\" +(?P<access_map_sequence>[0-9]+)$')
+
+        p2 = re.compile(r'^\s*(?P<access_map_match_protocol>[a-zA-Z0-9]+) +address: +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
+
+        p3 = re.compile(r'^\s*(?P<access_map_action_value>[a-zA-Z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Vlan +access-map +\"(?P<access_map_id>[a-zA-Z0-9]+)\" +(?P<access_map_sequence>[0-9]+)$')
             m = p1.match(line)
             if m:
                 access_map_id = m.groupdict()['access_map_id']
@@ -447,7 +456,6 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     access_map_dict['access_map_id'][map_id]['access_map_sequence'][access_map_sequence] = {}
                 continue
 
-            p2 = re.compile(r'^\s*(?P<access_map_match_protocol>[a-zA-Z0-9]+) +address: +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
             m = p2.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]\
@@ -458,7 +466,6 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                         m.groupdict()['access_map_match_protocol_value']
                 continue
 
-            p3 = re.compile(r'^\s*(?P<access_map_action_value>[a-zA-Z]+)$')
             m = p3.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]\
@@ -494,14 +501,17 @@ class ShowVlanRemoteSpan(ShowVlanRemoteSpanSchema):
             out = output
 
         remote_span_vlan_dict = {}
+
+        p1 = re.compile(r'^\s*Remote +SPAN +VLANs$')
+
+        p2 = re.compile(r'^\s*(?P<remote_span_vlan_ids>[0-9\,]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Remote +SPAN +VLANs$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<remote_span_vlan_ids>[0-9\,]+)$')
             m = p2.match(line)
             if m:
                 if 'vlan_id' not in remote_span_vlan_dict:
@@ -542,9 +552,13 @@ class ShowVlanFilter(ShowVlanFilterSchema):
             out = output
 
         vlan_dict = {}
+
+        p1 = re.compile(r'^\s*VLAN +Map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+) +is +filtering +VLANs:$')
+
+        p2 = re.compile(r'^\s*(?P<access_map_vlan_ids>[0-9\,\-]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN +Map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+) +is +filtering +VLANs:$')
             m = p1.match(line)
             if m:
                 if 'vlan_id' not in vlan_dict:
@@ -552,7 +566,6 @@ class ShowVlanFilter(ShowVlanFilterSchema):
                 tag = m.groupdict()['vlan_access_map_tag']
                 continue
 
-            p2 = re.compile(r'^\s*(?P<access_map_vlan_ids>[0-9\,\-]+)$')
             m = p2.match(line)
             if m:
                 access_map_vlan_ids = m.groupdict()['access_map_vlan_ids']
@@ -208,9 +208,13 @@ class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
             out = output
 
         trunk_dict = {}
+
+        p1 = re.compile(r'^\s*(?P<interface_name>[A-Z][a-z])([A-Za-z]+)(?P<interface_number>[0-9\/]+) +is +(?P<status>[a-z]+)$')
+
+        p2 = re.compile(r'^\s*Dot1Q +Tunneling +Ethertype +is +(?P<dot1q_tunneling_ethertype>[a-z0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<interface_name>[A-Z][a-z])([A-Za-z]+)(?P<interface_number>[0-9\/]+) +is +(?P<status>[a-z]+)$')
             m = p1.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -222,7 +226,6 @@ class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
                     trunk_dict['interface'][interface] = {}
                     continue
 
-            p2 = re.compile(r'^\s*Dot1Q +Tunneling +Ethertype +is +(?P<dot1q_tunneling_ethertype>[a-z0-9]+)$')
             m = p2.match(line)
             if m:
                 trunk_dict['interface'][interface]['dot1q_tunneling_ethertype'] = \
@@ -281,14 +284,17 @@ class ShowEthernetTags(ShowEthernetTagsSchema):
 
         intf_dict = {}
         stage = ''
+
+        p1 = re.compile(r'^\s*Interface\s +St\s +MTU\s +Ly\s +Outer\s +Inner\s +Xtra\s +-,+$')
+
+        p2 = re.compile(r'^\s*(?P<sub_interface>[A-Za-z0-9\/\.]+) +(?P<status>[A-Za-z]+) +(?P<mtu>[0-9]+) +(?P<layer>[A-Z0-9]+) +(\.)(?P<outer_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<outer_encapsulation_value>[0-9]+) +((\.)(?P<inner_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<inner_encapsulation_value>[0-9]+))?')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Interface\s +St\s +MTU\s +Ly\s +Outer\s +Inner\s +Xtra\s +-,+$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<sub_interface>[A-Za-z0-9\/\.]+) +(?P<status>[A-Za-z]+) +(?P<mtu>[0-9]+) +(?P<layer>[A-Z0-9]+) +(\.)(?P<outer_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<outer_encapsulation_value>[0-9]+) +((\.)(?P<inner_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<inner_encapsulation_value>[0-9]+))?')
             m = p2.match(line)
             if m:
                 sub_interface = m.groupdict()['sub_interface']
@@ -76,14 +76,46 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
         ipv4_set = False
         ipv6_set = False
         
+        # ALL            2      0     2         0      0     0
+        p1 = re.compile(r'\s*(?P<state_name>[a-zA-Z]+)'
+                         ' +(?P<v4_sessions>[0-9]+) +(?P<v4_slaves>[0-9]+)'
+                         ' +(?P<v4_total>[0-9]+) +(?P<v6_sessions>[0-9]+)'
+                         ' +(?P<v6_slaves>[0-9]+) +(?P<v6_total>[0-9]+)$')
+
+        # 2    HSRP IPv4 interfaces    (1    up, 1    down)
+        p2 = re.compile(r'\s*(?P<num_intf>[0-9]+) +HSRP +IPv4 +interfaces'
+                         ' +\(+(?P<intf_up>[0-9]+) +up,'
+                         ' +(?P<intf_down>[0-9]+) +down\)$')
+
+        # 0    HSRP IPv6 interfaces    (0    up, 0    down)
+        p3 = re.compile(r'\s*(?P<num_intf>[0-9]+) +HSRP +IPv6 +interfaces'
+                         ' +\(+(?P<intf_up>[0-9]+) +up,'
+                         ' +(?P<intf_down>[0-9]+) +down\)$')
+
+        # 2    Virtual IPv4 addresses  (1    active, 1    inactive)
+        p4 = re.compile(r'\s*(?P<num_addresses>[0-9]+) +Virtual +IPv4'
+                         ' +addresses +\((?P<active>[0-9]+) +active,'
+                         ' +(?P<inactive>[0-9]+) +inactive\)$')
+
+        # 0    Virtual IPv6 addresses  (0    active, 0    inactive)
+        p5 = re.compile(r'\s*(?P<num_addresses>[0-9]+) +Virtual +IPv6'
+                         ' +addresses +\((?P<active>[0-9]+) +active,'
+                         ' +(?P<inactive>[0-9]+) +inactive\)$')
+
+        # 3    Tracked Objects    (1    up, 2    down)
+        p6 = re.compile(r'\s*(?P<num_tracked_objects>[0-9]+) +Tracked'
+                         ' +Objects +\((?P<tracked_objects_up>[0-9]+) +up,'
+                         ' +(?P<tracked_objects_down>[0-9]+) +down\)$')
+
+        # 0    BFD sessions       (0    up, 0    down, 0    inactive)
+        p7 = re.compile(r'\s*(?P<num_bfd_sessions>[0-9]+) +BFD +sessions'
+                         ' +\((?P<bfd_sessions_up>[0-9]+) +up,'
+                         ' +(?P<bfd_sessions_down>[0-9]+) +down,'
+                         ' +(?P<bfd_sessions_inactive>[0-9]+) +inactive\)$')
+
         for line in out.splitlines():
             line = line.rstrip()
             
-            # ALL            2      0     2         0      0     0
-            p1 = re.compile(r'\s*(?P<state_name>[a-zA-Z]+)'
-                             ' +(?P<v4_sessions>[0-9]+) +(?P<v4_slaves>[0-9]+)'
-                             ' +(?P<v4_total>[0-9]+) +(?P<v6_sessions>[0-9]+)'
-                             ' +(?P<v6_slaves>[0-9]+) +(?P<v6_total>[0-9]+)$')
             m = p1.match(line)
             if m:
                 if 'address_family' not in hsrp_summary_dict:
@@ -124,10 +156,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     ipv6['state'][state_name]['total'] = int(v6_total)
                     continue
 
-            # 2    HSRP IPv4 interfaces    (1    up, 1    down)
-            p2 = re.compile(r'\s*(?P<num_intf>[0-9]+) +HSRP +IPv4 +interfaces'
-                             ' +\(+(?P<intf_up>[0-9]+) +up,'
-                             ' +(?P<intf_down>[0-9]+) +down\)$')
             m = p2.match(line)
             if m:
                 if ipv4_set:
@@ -136,10 +164,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     ipv4['intf_down'] = int(m.groupdict()['intf_down'])
                     continue
 
-            # 0    HSRP IPv6 interfaces    (0    up, 0    down)
-            p3 = re.compile(r'\s*(?P<num_intf>[0-9]+) +HSRP +IPv6 +interfaces'
-                             ' +\(+(?P<intf_up>[0-9]+) +up,'
-                             ' +(?P<intf_down>[0-9]+) +down\)$')
             m = p3.match(line)
             if m:
                 if ipv6_set:
@@ -148,10 +172,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     ipv6['intf_down'] = int(m.groupdict()['intf_down'])
                     continue
 
-            # 2    Virtual IPv4 addresses  (1    active, 1    inactive)
-            p4 = re.compile(r'\s*(?P<num_addresses>[0-9]+) +Virtual +IPv4'
-                             ' +addresses +\((?P<active>[0-9]+) +active,'
-                             ' +(?P<inactive>[0-9]+) +inactive\)$')
             m = p4.match(line)
             if m:
                 if ipv4_set:
@@ -163,10 +183,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                         int(m.groupdict()['inactive'])
                     continue
 
-            # 0    Virtual IPv6 addresses  (0    active, 0    inactive)
-            p5 = re.compile(r'\s*(?P<num_addresses>[0-9]+) +Virtual +IPv6'
-                             ' +addresses +\((?P<active>[0-9]+) +active,'
-                             ' +(?P<inactive>[0-9]+) +inactive\)$')
             m = p5.match(line)
             if m:
                 if ipv6_set:
@@ -178,10 +194,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                         int(m.groupdict()['inactive'])
                     continue
 
-            # 3    Tracked Objects    (1    up, 2    down)
-            p6 = re.compile(r'\s*(?P<num_tracked_objects>[0-9]+) +Tracked'
-                             ' +Objects +\((?P<tracked_objects_up>[0-9]+) +up,'
-                             ' +(?P<tracked_objects_down>[0-9]+) +down\)$')
             m = p6.match(line)
             if m:
                 hsrp_summary_dict['num_tracked_objects'] = \
@@ -192,11 +204,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     int(m.groupdict()['tracked_objects_down'])
                 continue
 
-            # 0    BFD sessions       (0    up, 0    down, 0    inactive)
-            p7 = re.compile(r'\s*(?P<num_bfd_sessions>[0-9]+) +BFD +sessions'
-                             ' +\((?P<bfd_sessions_up>[0-9]+) +up,'
-                             ' +(?P<bfd_sessions_down>[0-9]+) +down,'
-                             ' +(?P<bfd_sessions_inactive>[0-9]+) +inactive\)$')
             m = p7.match(line)
             if m:
                 hsrp_summary_dict['num_bfd_sessions'] = \
@@ -398,14 +405,127 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
         # Init vars
         hsrp_detail_dict = {}
         
+        # GigabitEthernet0/0/0/1 - IPv4 Group 5 (version 1)
+        p1 = re.compile(r'\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
+                         ' +\- +(?P<address_family>[a-zA-Z0-9]+)'
+                         ' +Group +(?P<group_number>[0-9]+)'
+                         ' +\(version +(?P<version>[0-9]+)\)$')
+
+        # Preemption delay for at least 10 secs
+        p3 = re.compile(r'\s*Preemption +delay +for +at +least'
+                         ' +(?P<preempt_delay>[0-9]+) +secs$')
+
+        # Hellotime 1000 msec holdtime 3000 msec
+        p4 = re.compile(r'\s*Hellotime +(?P<hello_msec>[0-9]+) +msec'
+                         ' +holdtime +(?P<hold_msec>[0-9]+) +msec$')
+
+        # Configured hellotime 1000 msec holdtime 3000 msec
+        p5 = re.compile(r'\s*Configured +hellotime'
+                         ' +(?P<cfgd_hello_msec>[0-9]+) msec +holdtime'
+                         ' +(?P<cfgd_hold_msec>[0-9]+) +msec$')
+
+        # Minimum delay 5 sec, reload delay 10 sec
+        p6 = re.compile(r'\s*Minimum +delay +(?P<minimum_delay>[0-9]+)'
+            ' +sec, +reload +delay +(?P<reload_delay>[0-9]+) +sec$')
+
+        # Active router is 
+        # Active router is 192.168.1.2 expires in 00:00:02
+        # Active router is 192.168.1.2, priority 90 expires in 00:00:02
+        p8 = re.compile(r'\s*Active +router +is'
+                         ' +(?P<active_router>([\w\:\.]+)(, *[\w\.\:]+)?)'
+                         '(, *priority (?P<priority>\d+))?'
+                         '( *(expired|expires +in +'
+                         '(?P<expire>[\w\:\.]+)))?$')
+
+        # Standby router is unknown expired
+        # Standby router is 192.168.1.2 expires in 00:00:02
+        # Standby router is fe80::5000:1cff:feff:a0b, 5200.1cff.0a0b expires in 00:00:02
+        p9 = re.compile(r'\s*Standby +router +is'
+                         ' +(?P<standby_router>([\w\:\.]+)(, *[\w\.\:]+)?)'
+                         '( *(expired|expires +in +(?P<expire>'
+                         '[\w\:\.]+)))?$')
+
+        # Standby virtual mac address is 0000.0cff.b30c, state is active
+        p10 = re.compile(r'\s*Standby +virtual +mac +address +is'
+                          ' +(?P<virtual_mac_address>[a-zA-Z0-9\.]+),'
+                          ' +state +is +(?P<standby_state>[a-zA-Z ]+)$')
+
+        # Authentication text, string "cisco123"
+        p11 = re.compile(r'\s*Authentication +text, +string'
+                          ' +\"(?P<authentication>[a-zA-Z0-9]+)\"$')
+
+        # 4 state changes, last state change 2d03h
+        # 2 state changes, last state change 01:18:43
+        p12 = re.compile(r'\s*(?P<num_state_changes>[0-9]+) +state'
+                          ' +changes, +last +state +change'
+                          ' +(?P<last_state_change>[a-zA-Z0-9\:\.]+)$')
+
+        # Last coup received:   Never
+        p14 = re.compile(r'\s*Last +coup +received:'
+                          ' +(?P<last_coup_received>[\w\s\:\.]+)$')
+
+        # Last resign sent:     Never
+        p15 = re.compile(r'\s*Last +resign +sent:'
+                          ' +(?P<last_resign_sent>[\w\s\:\.]+)$')
+
+        # Last resign received: Never
+        # Last resign received: Aug 11 08:26:25.272 UTC
+        p16 = re.compile(r'\s*Last +resign +received:'
+                          ' +(?P<last_resign_received>[\w\s\:\.]+)$')
+
+        # Tracking states for 1 object, 1 up:
+        # Tracking states for 1 objects, 1 up:
+        p17 = re.compile(r'\s*Tracking +states +for'
+                          ' +(?P<num_tracked_objects>[0-9]+) +object(?:s)?,'
+                          ' +(?P<num_tracked_objects_up>[0-9]+) up:$')
+
+        # Up   banana               Priority decrement: 20
+        # Down   apple               Priority decrement: 50
+        # Up   GigabitEthernet0/0/0/1 Priority decrement: 123
+        p18 = re.compile(r'\s*(?P<tracked_status>\S+) +'
+            '((?P<tracked_object>[a-zA-Z0-9]+)|'
+            '(?P<tracked_interface>[a-zA-Z0-9\/\.\-]+)) +'
+            'Priority +decrement: +'
+            '(?P<tracked_object_priority_decrement>[0-9]+)$')
+
+        # Label group10 (1 slaves)
+        p2 = re.compile(r'\s*[lL]abel +(?P<session_name>\S+) +'
+            '\((?P<num_of_slaves>\d+) slaves\)')
+
+        # Slave to group10
+        p2_1 = re.compile(r'\s*[sS]lave +to +(?P<follow>\S+)$')
+
+        # Local state is Active, priority 110, may preempt
+        # Local state is Init, priority 100, use bia
+        # Local state is Init, priority 100, may preempt, use bia
+        # Local state is Init
+        p2_2 = re.compile(r'\s*Local +state +is +(?P<hsrp_router_state>'
+            '[a-zA-Z]+)(, +priority +(?P<priority>[0-9]+))?(?P<preempt>, '
+            'may preempt)?(?P<use_bia>, use bia)?$')
+
+        # BFD enabled (GigabitEthernet0/0/0/1, 10.1.1.1): state inactive, interval 15 ms multiplier 3
+        # BFD enabled (Unknown, 0.0.0.0): state inactive, interval 0 ms multiplier 0
+        p7 = re.compile(r'\s*BFD enabled \((?P<bfd_interface_name>\S+), '
+            '(?P<bfd_address>\S+)\): state (?P<bfd_state>\S+), interval '
+            '(?P<bfd_interval>\d+) ms multiplier '
+            '(?P<bfd_detection_multiplier>\d+)$')
+
+        # Hot standby IP address is 192.168.1.254 configured
+        # Hot standby IP address is fe80::205:73ff:fea0:1 configured
+        p7_1 = re.compile(r'\s*Hot +standby +IP +address +is'
+                         ' +(?P<vip>[\w\:\.]+) +configured$')
+
+        # Standby ICMP redirects disabled
+        p13 = re.compile(r'\s*Standby ICMP redirects disabled')
+
+        # Last coup sent:       Never
+        # Last coup sent:       Aug 11 08:26:25.272 UTC
+        p13_1 = re.compile(r'\s*Last +coup +sent:'
+                          ' +(?P<last_coup_sent>[\w\s\:\.]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # GigabitEthernet0/0/0/1 - IPv4 Group 5 (version 1)
-            p1 = re.compile(r'\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
-                             ' +\- +(?P<address_family>[a-zA-Z0-9]+)'
-                             ' +Group +(?P<group_number>[0-9]+)'
-                             ' +\(version +(?P<version>[0-9]+)\)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -446,30 +566,18 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     group_key['group_number'] = group_number
                 continue
 
-            # Label group10 (1 slaves)
-            p2 = re.compile(r'\s*[lL]abel +(?P<session_name>\S+) +'
-                '\((?P<num_of_slaves>\d+) slaves\)')
             m = p2.match(line)
             if m:
                 group_key['session_name'] = m.groupdict()['session_name']
                 group_key['num_of_slaves'] = int(m.groupdict()['num_of_slaves'])
                 continue            
 
-            # Slave to group10
-            p2 = re.compile(r'\s*[sS]lave +to +(?P<follow>\S+)$')
-            m = p2.match(line)
+            m = p2_1.match(line)
             if m:
                 group_key['follow'] = m.groupdict()['follow']
                 continue
 
-            # Local state is Active, priority 110, may preempt
-            # Local state is Init, priority 100, use bia
-            # Local state is Init, priority 100, may preempt, use bia
-            # Local state is Init
-            p2 = re.compile(r'\s*Local +state +is +(?P<hsrp_router_state>'
-                '[a-zA-Z]+)(, +priority +(?P<priority>[0-9]+))?(?P<preempt>, '
-                'may preempt)?(?P<use_bia>, use bia)?$')
-            m = p2.match(line)
+            m = p2_2.match(line)
             if m:
                 group_key['hsrp_router_state'] \
                     = m.groupdict()['hsrp_router_state'].lower()
@@ -484,17 +592,11 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     hsrp_detail_dict[interface]['use_bia'] = False
                 continue
 
-            # Preemption delay for at least 10 secs
-            p3 = re.compile(r'\s*Preemption +delay +for +at +least'
-                             ' +(?P<preempt_delay>[0-9]+) +secs$')
             m = p3.match(line)
             if m:
                 group_key['preempt_delay'] = int(m.groupdict()['preempt_delay'])
                 continue
 
-            # Hellotime 1000 msec holdtime 3000 msec
-            p4 = re.compile(r'\s*Hellotime +(?P<hello_msec>[0-9]+) +msec'
-                             ' +holdtime +(?P<hold_msec>[0-9]+) +msec$')
             m = p4.match(line)
             if m:
                 if 'timers' not in group_key:
@@ -507,10 +609,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                 group_key['timers']['hold_msec_flag'] = True
                 continue
 
-            # Configured hellotime 1000 msec holdtime 3000 msec
-            p5 = re.compile(r'\s*Configured +hellotime'
-                             ' +(?P<cfgd_hello_msec>[0-9]+) msec +holdtime'
-                             ' +(?P<cfgd_hold_msec>[0-9]+) +msec$')
             m = p5.match(line)
             if m:
                 if 'timers' not in group_key:
@@ -521,9 +619,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     int(m.groupdict()['cfgd_hold_msec'])
                 continue
 
-            # Minimum delay 5 sec, reload delay 10 sec
-            p6 = re.compile(r'\s*Minimum +delay +(?P<minimum_delay>[0-9]+)'
-                ' +sec, +reload +delay +(?P<reload_delay>[0-9]+) +sec$')
             m = p6.match(line)
             if m:
                 if 'delay' not in hsrp_detail_dict[interface]:
@@ -534,12 +629,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     = int(m.groupdict()['reload_delay'])
                 continue
 
-            # BFD enabled (GigabitEthernet0/0/0/1, 10.1.1.1): state inactive, interval 15 ms multiplier 3
-            # BFD enabled (Unknown, 0.0.0.0): state inactive, interval 0 ms multiplier 0
-            p7 = re.compile(r'\s*BFD enabled \((?P<bfd_interface_name>\S+), '
-                '(?P<bfd_address>\S+)\): state (?P<bfd_state>\S+), interval '
-                '(?P<bfd_interval>\d+) ms multiplier '
-                '(?P<bfd_detection_multiplier>\d+)$')
             m = p7.match(line)
             if m:
                 if 'bfd' not in hsrp_detail_dict[interface]:
@@ -558,11 +647,7 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     group_key['bfd']['state'] = m.groupdict()['bfd_state']
                 continue
 
-            # Hot standby IP address is 192.168.1.254 configured
-            # Hot standby IP address is fe80::205:73ff:fea0:1 configured
-            p7 = re.compile(r'\s*Hot +standby +IP +address +is'
-                             ' +(?P<vip>[\w\:\.]+) +configured$')
-            m = p7.match(line)
+            m = p7_1.match(line)
             if m:
                 vip = m.groupdict()['vip'].lower()
                 if ':' not in vip:
@@ -583,14 +668,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                 
                 continue
 
-            # Active router is 
-            # Active router is 192.168.1.2 expires in 00:00:02
-            # Active router is 192.168.1.2, priority 90 expires in 00:00:02
-            p8 = re.compile(r'\s*Active +router +is'
-                             ' +(?P<active_router>([\w\:\.]+)(, *[\w\.\:]+)?)'
-                             '(, *priority (?P<priority>\d+))?'
-                             '( *(expired|expires +in +'
-                             '(?P<expire>[\w\:\.]+)))?$')
             m = p8.match(line)
             if m:
                 role = m.groupdict()['active_router']
@@ -613,13 +690,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     group_key['active_expire'] = m.groupdict()['expire']
                 continue
 
-            # Standby router is unknown expired
-            # Standby router is 192.168.1.2 expires in 00:00:02
-            # Standby router is fe80::5000:1cff:feff:a0b, 5200.1cff.0a0b expires in 00:00:02
-            p9 = re.compile(r'\s*Standby +router +is'
-                             ' +(?P<standby_router>([\w\:\.]+)(, *[\w\.\:]+)?)'
-                             '( *(expired|expires +in +(?P<expire>'
-                             '[\w\:\.]+)))?$')
             m = p9.match(line)
             if m:
                 role = m.groupdict()['standby_router']
@@ -642,10 +712,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     group_key['standby_expire'] = m.groupdict()['expire']
                 continue
 
-            # Standby virtual mac address is 0000.0cff.b30c, state is active
-            p10 = re.compile(r'\s*Standby +virtual +mac +address +is'
-                              ' +(?P<virtual_mac_address>[a-zA-Z0-9\.]+),'
-                              ' +state +is +(?P<standby_state>[a-zA-Z ]+)$')
             m = p10.match(line)
             if m:
                 group_key['virtual_mac_address'] = \
@@ -673,20 +739,12 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                         [group_number]
                 continue
 
-            # Authentication text, string "cisco123"
-            p11 = re.compile(r'\s*Authentication +text, +string'
-                              ' +\"(?P<authentication>[a-zA-Z0-9]+)\"$')
             m = p11.match(line)
             if m:
                 group_key['authentication'] = \
                     m.groupdict()['authentication']
                 continue
 
-            # 4 state changes, last state change 2d03h
-            # 2 state changes, last state change 01:18:43
-            p12 = re.compile(r'\s*(?P<num_state_changes>[0-9]+) +state'
-                              ' +changes, +last +state +change'
-                              ' +(?P<last_state_change>[a-zA-Z0-9\:\.]+)$')
             m = p12.match(line)
             if m:
                 if 'statistics' not in group_key:
@@ -697,18 +755,12 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     m.groupdict()['last_state_change']
                 continue
 
-            # Standby ICMP redirects disabled
-            p13 = re.compile(r'\s*Standby ICMP redirects disabled')
             m = p13.match(line)
             if m:
                 hsrp_detail_dict[interface]['redirects_disable'] = True
                 continue
 
-            # Last coup sent:       Never
-            # Last coup sent:       Aug 11 08:26:25.272 UTC
-            p13 = re.compile(r'\s*Last +coup +sent:'
-                              ' +(?P<last_coup_sent>[\w\s\:\.]+)$')
-            m = p13.match(line)
+            m = p13_1.match(line)
             if m:
                 if 'redirects_disable' not in hsrp_detail_dict[interface]:
                     hsrp_detail_dict[interface]['redirects_disable'] = False
@@ -718,9 +770,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     = m.groupdict()['last_coup_sent']
                 continue
 
-            # Last coup received:   Never
-            p14 = re.compile(r'\s*Last +coup +received:'
-                              ' +(?P<last_coup_received>[\w\s\:\.]+)$')
             m = p14.match(line)
             if m:
                 if 'statistics' not in group_key:
@@ -729,9 +778,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     m.groupdict()['last_coup_received']
                 continue
 
-            # Last resign sent:     Never
-            p15 = re.compile(r'\s*Last +resign +sent:'
-                              ' +(?P<last_resign_sent>[\w\s\:\.]+)$')
             m = p15.match(line)
             if m:
                 if 'statistics' not in group_key:
@@ -740,10 +786,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     = m.groupdict()['last_resign_sent']
                 continue
 
-            # Last resign received: Never
-            # Last resign received: Aug 11 08:26:25.272 UTC
-            p16 = re.compile(r'\s*Last +resign +received:'
-                              ' +(?P<last_resign_received>[\w\s\:\.]+)$')
             m = p16.match(line)
             if m:
                 if 'statistics' not in group_key:
@@ -754,11 +796,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     ['version'][version]['groups'][group_number] = group_key
                 continue
 
-            # Tracking states for 1 object, 1 up:
-            # Tracking states for 1 objects, 1 up:
-            p17 = re.compile(r'\s*Tracking +states +for'
-                              ' +(?P<num_tracked_objects>[0-9]+) +object(?:s)?,'
-                              ' +(?P<num_tracked_objects_up>[0-9]+) up:$')
             m = p17.match(line)
             if m:
                 if 'tracked_objects' not in group_key:
@@ -772,14 +809,6 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
                     ['version'][version]['groups'][group_number] = group_key
                 continue
 
-            # Up   banana               Priority decrement: 20
-            # Down   apple               Priority decrement: 50
-            # Up   GigabitEthernet0/0/0/1 Priority decrement: 123
-            p18 = re.compile(r'\s*(?P<tracked_status>\S+) +'
-                '((?P<tracked_object>[a-zA-Z0-9]+)|'
-                '(?P<tracked_interface>[a-zA-Z0-9\/\.\-]+)) +'
-                'Priority +decrement: +'
-                '(?P<tracked_object_priority_decrement>[0-9]+)$')
             m = p18.match(line)
             if m:
                 # if track_found:
@@ -33,6 +33,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.blocks import BlockParser
 
 logger = logging.getLogger(__name__)
 
@@ -216,9 +217,49 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
             out = output
 
         interface_dict = {}
+
+        p1 = re.compile(r'^\s*Port +VRF +Status +IP Address +Speed +MTU$')
+
+        p2 = re.compile(r'^\s*(?P<port>[a-zA-Z0-9\/\.]+)'
+                         ' +(?P<vrf>[a-zA-Z0-9\-]+)'
+                         ' +(?P<status>[a-zA-Z\-]+) +(?P<ip_address>[0-9\.]+)'
+                         ' +(?P<speed>[0-9]+) +(?P<mtu>[0-9]+)$')
+
+        p3 = re.compile(r'^\s*Ethernet +VLAN +Type +Mode +Status'
+                         ' +Reason +Speed +Port$')
+
+        p4 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +(?P<vlan>[a-zA-Z0-9\-]+)'
+                         ' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
+                         ' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
+                         ' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
+                         ' +(?P<port>[0-9\-]+)$')
+
+        p5 = re.compile(r'^\s*Port-channel +VLAN +Type +Mode +Status'
+                         ' +Reason +Speed +Protocol$')
+
+        p6 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +(?P<vlan>[a-zA-Z0-9\-]+)'
+                         ' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
+                         ' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
+                         ' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
+                         ' +(?P<protocol>[a-zA-Z0-9\-]+)$')
+
+        p7 = re.compile(r'^\s*Interface +Status +Description$')
+
+        p8 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +(?P<status>[a-z]+)'
+                         ' +(?P<description>[a-zA-Z\s\-]+)$')
+
+        p9 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                         ' +(?P<intf_state>[a-zA-Z0-9\-]+)'
+                         ' +(?P<line_state>[a-zA-Z0-9\-]+)'
+                         ' +(?P<type>[a-zA-Z]+)'
+                         ' +(?P<mtu>\d+)'
+                         ' +(?P<bw>\d+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Port +VRF +Status +IP Address +Speed +MTU$')
             m = p1.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -227,10 +268,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['port'] = {}
                 continue
 
-            p2 = re.compile(r'^\s*(?P<port>[a-zA-Z0-9\/\.]+)'
-                             ' +(?P<vrf>[a-zA-Z0-9\-]+)'
-                             ' +(?P<status>[a-zA-Z\-]+) +(?P<ip_address>[0-9\.]+)'
-                             ' +(?P<speed>[0-9]+) +(?P<mtu>[0-9]+)$')
             m = p2.match(line)
             if m:
                 port = m.groupdict()['port']
@@ -248,8 +285,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     m.groupdict()['mtu']
                 continue
 
-            p3 = re.compile(r'^\s*Ethernet +VLAN +Type +Mode +Status'
-                             ' +Reason +Speed +Port$')
             m = p3.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -258,12 +293,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['ethernet'] = {}
                 continue
 
-            p4 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +(?P<vlan>[a-zA-Z0-9\-]+)'
-                             ' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
-                             ' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
-                             ' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
-                             ' +(?P<port>[0-9\-]+)$')
             m = p4.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -285,8 +314,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     m.groupdict()['port']
                 continue
 
-            p5 = re.compile(r'^\s*Port-channel +VLAN +Type +Mode +Status'
-                             ' +Reason +Speed +Protocol$')
             m = p5.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -295,12 +322,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['port_channel'] = {}
                 continue
 
-            p6 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +(?P<vlan>[a-zA-Z0-9\-]+)'
-                             ' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
-                             ' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
-                             ' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
-                             ' +(?P<protocol>[a-zA-Z0-9\-]+)$')
             m = p6.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -323,7 +344,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                 continue
 
 
-            p7 = re.compile(r'^\s*Interface +Status +Description$')
             m = p7.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -332,9 +352,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['loopback'] = {}
                 continue
 
-            p8 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +(?P<status>[a-z]+)'
-                             ' +(?P<description>[a-zA-Z\s\-]+)$')
             m = p8.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -347,12 +364,6 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                 continue
 
 
-            p9 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             ' +(?P<intf_state>[a-zA-Z0-9\-]+)'
-                             ' +(?P<line_state>[a-zA-Z0-9\-]+)'
-                             ' +(?P<type>[a-zA-Z]+)'
-                             ' +(?P<mtu>\d+)'
-                             ' +(?P<bw>\d+)$')
             m = p9.match(line)
             if m:
                 group = m.groupdict()
@@ -469,7 +480,7 @@ class ShowInterfacesDetailSchema(MetaParser):
         }
 
 
-class ShowInterfacesDetail(ShowInterfacesDetailSchema):
+class ShowInterfacesDetail(ShowInterfacesDetailSchema, BlockParser):
     """Parser for show interface detail
                     show interface <interface> detail
     """
@@ -481,6 +492,16 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         'reliability', 'in_discards', 'in_broadcast_pkts', 'out_broadcast_pkts', 'rxload', 'txload', 
         'interface_state', 'in_unknown_protos', 'last_clear', 'carrier_transitions', 'in_giants']
 
+    # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
+    block_start = [re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                              ' +(?P<enabled>(administratively down|down))(?:,'
+                              ' +line +protocol +is +(?P<line_protocol>'
+                              '(administratively down|down)))?$'),
+                   re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                              ' +(?P<enabled>(administratively up|up))(?:,'
+                              ' +line +protocol +is +(?P<line_protocol>'
+                              '(administratively up|up)))?$')]
+    block_marker = ' is '
 
     def cli(self, interface='', output=None):
         if output is None:
@@ -501,14 +522,167 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         elif "b'" in out:
             out = out.split("b'")[1]
 
+        p1, p1_1 = self.block_start
+
+        # Interface state transitions: 1
+        p2 = re.compile(r'^\s*Interface +state +transitions:'
+                         ' +(?P<interface_state>[0-9]+)$')
+
+        p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
+                         ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
+                         ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
+
+        # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
+        p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
+                           ' +is +(?P<mac_address>[a-z0-9\.]+)$')
+
+        #Description: desc
+        p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
+
+        # Internet address is 10.1.1.1/24
+        p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
+                         '(\/(?P<prefix_length>[0-9]+))?$')
+
+        # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
+        # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
+        p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+                         ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
+                         ' +Kbit\))?$')
+
+        # reliability 255/255, txload Unknown, rxload Unknown
+        p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
+                         ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
+                         ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
+
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+        p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                         ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
+                         ' +Id +(?P<second_dot1q>[0-9]+),$')
+
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
+        p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                           ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
+                           ' +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+        p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                           ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
+                           ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
+                           ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
+
+        # Encapsulation ARPA,
+        p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
+
+        # Encapsulation Null,  loopback not set,
+        p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                           ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+        # loopback not set,
+        p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+        # Last input never, output never
+        p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
+                         ' +output +(?P<last_output>[\w\W]+)$')
+
+        # ARP type ARPA, ARP timeout 04:00:00
+        p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
+                           ' +(?P<arp_timeout>\S+)')
+
+        p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
+
+        # Last clearing of "show interface" counters never
+        p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
+                           ' +counters +(?P<last_clear>[\w\W]+)$')
+
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                         ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
+                         ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
+
+        # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
+        # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
+        p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
+                           ' +(?P<location>\S+), +link +type +is'
+                           ' +(?P<auto_negotiate>(autonegotiation))$')
+
+        p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
+                           ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
+
+        # output flow control is off, input flow control is off
+        p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                           ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+
+        p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                           ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+
+        p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                           ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+
+        p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                           ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+
+        # Carrier delay (up) is 10 msec
+        p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
+                           ' +(?P<carrier_delay>[0-9]+) +msec$')
+
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                          ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
+                          ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
+
+        # 0 packets input, 0 bytes, 0 total input drops
+        p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
+                          ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
+                          ' +total +input +drops$')
+
+        # 0 drops for unrecognized upper-level protocol
+        p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
+                          ' +upper-level +protocol$')
+
+        # Received 0 broadcast packets, 0 multicast packets
+        p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
+                          ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
+                          ' +multicast +packets$')
+
+        # 0 runts, 0 giants, 0 throttles, 0 parity
+        p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
+                          ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
+                          ' +(?P<in_parity>[0-9]+) parity$')
+
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+        p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
+                          ' +(?P<in_crc_errors>[0-9]+) +CRC,'
+                          ' +(?P<in_frame>[0-9]+)'
+                          ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
+                          ' +(?P<in_ignored>[0-9]+) +ignored,'
+                          ' +(?P<in_abort>[0-9]+) +abort$')
+
+        # 0 packets output, 0 bytes, 0 total output drops 
+        p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
+                          ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
+                          ' +total +output +drops$')
+
+        # Output 0 broadcast packets, 0 multicast packets
+        p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
+                          ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
+                          ' +multicast +packets$')
+
+        # 0 output errors, 0 underruns, 0 applique, 0 resets
+        p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
+                          ' +(?P<out_underruns>[0-9]+) +underruns,'
+                          ' +(?P<out_applique>[0-9]+) +applique,'
+                          ' +(?P<out_resets>[0-9]+) +resets$')
+
+        # 0 output buffer failures, 0 output buffers swapped out
+        p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
+                          ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
+                          ' +output +buffers +swapped +out$')
+
+        # 0 carrier transitions
+        p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                             ' +(?P<enabled>(administratively down|down))(?:,'
-                             ' +line +protocol +is +(?P<line_protocol>'
-                             '(administratively down|down)))?$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -522,10 +696,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['enabled'] = False
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                               ' +(?P<enabled>(administratively up|up))(?:,'
-                               ' +line +protocol +is +(?P<line_protocol>'
-                               '(administratively up|up)))?$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -539,9 +709,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['enabled'] = True
                 continue
 
-            # Interface state transitions: 1
-            p2 = re.compile(r'^\s*Interface +state +transitions:'
-                             ' +(?P<interface_state>[0-9]+)$')
             m = p2.match(line)
             if m:
                 interface_state = int(m.groupdict()['interface_state'])
@@ -551,9 +718,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             # Hardware is Null interface
             # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
 
-            p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
-                             ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
-                             ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
             m = p3.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
@@ -570,9 +734,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     interface_detail_dict[interface]['phys_address'] = str(m.groupdict()['phys_address'])
                 continue
 
-            # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
-            p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
-                               ' +is +(?P<mac_address>[a-z0-9\.]+)$')
             m = p3_1.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
@@ -585,17 +746,12 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     interface_detail_dict[interface]['mac_address'] = str(m.groupdict()['mac_address'])
                 continue
 
-            #Description: desc
-            p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
             m = p3_2.match(line)
             if m:
                 interface_detail_dict[interface]['description']\
                 = str(m.groupdict()['description'])
                 continue
 
-            # Internet address is 10.1.1.1/24
-            p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
-                             '(\/(?P<prefix_length>[0-9]+))?$')
             m = p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -612,11 +768,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['prefix_length'] = prefix_length
                 continue
 
-            # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
-            # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
-            p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
-                             ' +Kbit\))?$')
             m = p5.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
@@ -626,10 +777,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['bandwidth'] = bandwidth
                 continue
 
-            # reliability 255/255, txload Unknown, rxload Unknown
-            p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
-                             ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
-                             ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
             m = p6.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
@@ -641,10 +788,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['rxload'] = rxload
                 continue
             
-            # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
-                             ' +Id +(?P<second_dot1q>[0-9]+),$')
             m = p7.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -660,10 +803,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['second_dot1q'] = str(m.groupdict()['second_dot1q'])
                 continue
 
-            # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
-            p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_1.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -682,10 +821,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
             
-            p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
-                               ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
             m = p7_2.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -706,8 +841,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
 
-            # Encapsulation ARPA,
-            p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
             m = p7_3.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -719,9 +852,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['encapsulation'] = encapsulation
                 continue
 
-            # Encapsulation Null,  loopback not set,
-            p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_4.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -739,8 +869,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
 
-            # loopback not set,
-            p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_5.match(line)
             if m:
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -750,9 +878,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
 
-            # Last input never, output never
-            p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
-                             ' +output +(?P<last_output>[\w\W]+)$')
             m = p8.match(line)
             if m:
                 interface_detail_dict[interface]['last_input']\
@@ -761,9 +886,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                  = m.groupdict()['last_output']
                 continue
 
-            # ARP type ARPA, ARP timeout 04:00:00
-            p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
-                               ' +(?P<arp_timeout>\S+)')
             m = p8_1.match(line)
             if m:
                 arp_type = str(m.groupdict()['arp_type']).lower()
@@ -774,25 +896,17 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                  = m.groupdict()['arp_timeout']
                 continue
 
-            p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
             m = p8_2.match(line)
             if m:
                 interface_detail_dict[interface]['last_link_flapped']\
                  = m.groupdict()['last_link_flapped']
                 continue
 
-            # Last clearing of "show interface" counters never
-            p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
-                               ' +counters +(?P<last_clear>[\w\W]+)$')
             m = p8_3.match(line)
             if m:
                 last_clear = str(m.groupdict()['last_clear'])
                 continue
 
-            # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                             ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
-                             ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
             m = p9.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
@@ -818,11 +932,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['last_clear'] = last_clear
                 continue
 
-            # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
-            # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
-            p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
-                               ' +(?P<location>\S+), +link +type +is'
-                               ' +(?P<auto_negotiate>(autonegotiation))$')
             m = p9_1.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
@@ -835,8 +944,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['auto_negotiate'] = True
                 continue
 
-            p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
-                               ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
             m = p9_2.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
@@ -849,9 +956,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['auto_negotiate'] = False
                 continue
 
-            # output flow control is off, input flow control is off
-            p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
             m = p9_3.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -864,8 +968,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
             m = p9_4.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -878,8 +980,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
                 continue
 
-            p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
             m = p9_5.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -892,8 +992,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
             m = p9_6.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -906,9 +1004,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
                 continue
 
-            # Carrier delay (up) is 10 msec
-            p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
-                               ' +(?P<carrier_delay>[0-9]+) +msec$')
             m = p9_7.match(line)
             if m:
                 carrier_delay = m.groupdict()['carrier_delay']
@@ -916,10 +1011,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['carrier_delay'] = carrier_delay
                 continue
 
-            # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                              ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
-                              ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
             m = p10.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
@@ -943,10 +1034,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['out_rate_pkts'] = out_rate_pkts
                 continue
 
-            # 0 packets input, 0 bytes, 0 total input drops
-            p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
-                              ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
-                              ' +total +input +drops$')
             m = p11.match(line)
             if m:
                 in_pkts = int(m.groupdict()['in_pkts'])
@@ -961,19 +1048,12 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['in_discards'] = in_discards
                 continue
 
-            # 0 drops for unrecognized upper-level protocol
-            p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
-                              ' +upper-level +protocol$')
             m = p12.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
-            # Received 0 broadcast packets, 0 multicast packets
-            p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
             m = p13.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -982,10 +1062,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['in_multicast_pkts'] = int(m.groupdict()['in_multicast_pkts'])
                 continue
 
-            # 0 runts, 0 giants, 0 throttles, 0 parity
-            p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
-                              ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
-                              ' +(?P<in_parity>[0-9]+) parity$')
             m = p14.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -998,13 +1074,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['in_parity'] = int(m.groupdict()['in_parity'])
                 continue
 
-            # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
-                              ' +(?P<in_crc_errors>[0-9]+) +CRC,'
-                              ' +(?P<in_frame>[0-9]+)'
-                              ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
-                              ' +(?P<in_ignored>[0-9]+) +ignored,'
-                              ' +(?P<in_abort>[0-9]+) +abort$')
             m = p15.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1021,10 +1090,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['in_abort'] = int(m.groupdict()['in_abort'])
                 continue
 
-            # 0 packets output, 0 bytes, 0 total output drops 
-            p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
-                              ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
-                              ' +total +output +drops$')
             m = p16.match(line)
             if m:
                 interface_detail_dict[interface].setdefault('counters', {})
@@ -1036,10 +1101,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['out_discards'] = int(m.groupdict()['out_discards'])
                 continue
     
-            # Output 0 broadcast packets, 0 multicast packets
-            p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
             m = p17.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1048,11 +1109,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
                 continue
 
-            # 0 output errors, 0 underruns, 0 applique, 0 resets
-            p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
-                              ' +(?P<out_underruns>[0-9]+) +underruns,'
-                              ' +(?P<out_applique>[0-9]+) +applique,'
-                              ' +(?P<out_resets>[0-9]+) +resets$')
             m = p18.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1065,10 +1121,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['out_resets'] = int(m.groupdict()['out_resets'])
                 continue
 
-            # 0 output buffer failures, 0 output buffers swapped out
-            p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
-                              ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
-                              ' +output +buffers +swapped +out$')
             m = p19.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1077,8 +1129,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 ['out_buffer_swapped_out'] = int(m.groupdict()['out_buffer_swapped_out'])
                 continue
 
-            # 0 carrier transitions
-            p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
             m = p20.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1118,13 +1168,20 @@ class ShowVlanInterface(ShowVlanInterfaceSchema):
 
         vlan_interface_dict = {}
 
+        p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
+                         ' +(?P<encapsulation>[A-Z0-9\.]+)'
+                         ' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
+                         ' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
+                         ' +(?P<linep_state>\S+)$')
+
+        p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
+                           ' +(?P<encapsulation>[a-zA-Z]+ [A-Z0-9\.]+)'
+                           ' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
+                           ' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
+                           ' +(?P<linep_state>\S+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
-                             ' +(?P<encapsulation>[A-Z0-9\.]+)'
-                             ' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
-                             ' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
-                             ' +(?P<linep_state>\S+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1146,11 +1203,6 @@ class ShowVlanInterface(ShowVlanInterfaceSchema):
                 vlan_interface_dict[interface]['linep_state'] = linep_state
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
-                               ' +(?P<encapsulation>[a-zA-Z]+ [A-Z0-9\.]+)'
-                               ' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
-                               ' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
-                               ' +(?P<linep_state>\S+)$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1238,12 +1290,78 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
 
         ipv4_vrf_all_interface_dict = {}
 
+        # GigabitEthernet0/0/0/0 is Shutdown, ipv4 protocol is Down
+        p1 = re.compile(r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
+                         ' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$')
+
+        # Vrf is VRF1 (vrfid 0x60000002)
+        p2 = re.compile(r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$')
+
+        # Interface is unnumbered.  Using address of Loopback11 (10.69.111.111/32)
+        p2_1 = re.compile(r'^\s*Interface is unnumbered. +Using +address'
+                           ' +of +(?P<unnumbered_intf_ref>\S+)'
+                           ' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$')
+
+        # Internet address is 10.1.1.1/24 with route-tag 50
+        p3 = re.compile(r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
+                         '(?P<prefix_length>[0-9]+)(?: +with +route-tag'
+                         ' +(?P<route_tag>[0-9]+))?$')
+
+        # Secondary address 10.2.2.2/24
+        p4 = re.compile(r'^\s*(?P<secondary>(Secondary)) +address'
+                         ' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
+                         ' +with +route-tag +(?P<route_tag>[0-9]+))?$')
+
+        # MTU is 1600 (1586 is available to IP)
+        p5 = re.compile(r'^\s*MTU is +(?P<mtu>[0-9]+)'
+                         ' +\((?P<mtu_available>[0-9]+) +is +available +to'
+                         ' +IP\)$')
+
+        # Helper address is not set
+        p6 = re.compile(r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$')
+
+        # Multicast reserved groups joined: 224.0.0.2 224.0.0.1 224.0.0.2
+        p6_1 = re.compile(r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+
+        # 224.0.0.5 224.0.0.6
+        p6_2 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+
+        # Directed broadcast forwarding is disabled
+        p7 = re.compile(r'^\s*Directed +broadcast +forwarding +is'
+                         ' +(?P<broadcast_forwarding>[a-zA-Z]+)$')
+
+        # Outgoing access list is not set
+        p8 = re.compile(r'^\s*Outgoing +access +list +is'
+                         ' +(?P<out_access_list>[a-zA-Z\s]+)$')
+
+        # Inbound  access list is not set
+        p9 = re.compile(r'^\s*Inbound +access +list +is'
+                         ' +(?P<in_access_list>[a-zA-Z\s]+)$')
+
+        # Inbound  common access list is not set, access list is not set
+        p9_1 = re.compile(r'^\s*Inbound +common +access +list +is'
+                           ' +(?P<in_common_access_list>[a-zA-Z\s]+), '
+                           '+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
+
+        # Proxy ARP is disabled
+        p10 = re.compile(r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$')
+
+        # ICMP redirects are never sent
+        p11 = re.compile(r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$')
+
+        # ICMP unreachables are always sent
+        p12 = re.compile(r'^\s*ICMP +unreachables +(are|is)'
+                          ' +(?P<icmp_unreachables>[a-zA-Z\s]+)$')
+
+        # ICMP mask replies are never sent
+        p13 = re.compile(r'^\s*ICMP +mask +replies +(are|is) +(?P<icmp_replies>[a-zA-Z\s]+)$')
+
+        # Table Id is 0xe0000011
+        p13_1 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # GigabitEthernet0/0/0/0 is Shutdown, ipv4 protocol is Down
-            p1 = re.compile(r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
-                             ' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1259,8 +1377,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 multicast_groups = []
                 continue
 
-            # Vrf is VRF1 (vrfid 0x60000002)
-            p2 = re.compile(r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$')
             m = p2.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
@@ -1270,10 +1386,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['vrf_id'] = vrf_id
                 continue
 
-            # Interface is unnumbered.  Using address of Loopback11 (10.69.111.111/32)
-            p2_1 = re.compile(r'^\s*Interface is unnumbered. +Using +address'
-                               ' +of +(?P<unnumbered_intf_ref>\S+)'
-                               ' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$')
             m = p2_1.match(line)
             if m:
                 unnumbered_intf_ref = m.groupdict()['unnumbered_intf_ref']
@@ -1302,10 +1414,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ipv4_vrf_all_interface_dict[interface]['ipv4']['unnumbered']['unnumbered_intf_ref'] = unnumbered_intf_ref  
                 continue
 
-            # Internet address is 10.1.1.1/24 with route-tag 50
-            p3 = re.compile(r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
-                             '(?P<prefix_length>[0-9]+)(?: +with +route-tag'
-                             ' +(?P<route_tag>[0-9]+))?$')
             m = p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1326,10 +1434,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ['prefix_length'] = prefix_length
                 continue
 
-            # Secondary address 10.2.2.2/24
-            p4 = re.compile(r'^\s*(?P<secondary>(Secondary)) +address'
-                             ' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
-                             ' +with +route-tag +(?P<route_tag>[0-9]+))?$')
             m = p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1353,10 +1457,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ['secondary'] = True
                 continue
 
-            # MTU is 1600 (1586 is available to IP)
-            p5 = re.compile(r'^\s*MTU is +(?P<mtu>[0-9]+)'
-                             ' +\((?P<mtu_available>[0-9]+) +is +available +to'
-                             ' +IP\)$')
             m = p5.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
@@ -1370,8 +1470,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ['mtu_available'] = int(m.groupdict()['mtu_available'])
                 continue
 
-            # Helper address is not set
-            p6 = re.compile(r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$')
             m = p6.match(line)
             if m:
                 helper_address = str(m.groupdict()['helper_address'])
@@ -1381,8 +1479,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ['helper_address'] = helper_address
                 continue
 
-            # Multicast reserved groups joined: 224.0.0.2 224.0.0.1 224.0.0.2
-            p6_1 = re.compile(r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
             m = p6_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1397,8 +1493,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['multicast_groups'] = multicast_groups
                 continue
 
-            # 224.0.0.5 224.0.0.6
-            p6_2 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
             m = p6_2.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1413,9 +1507,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['multicast_groups'] = multicast_groups
                 continue
 
-            # Directed broadcast forwarding is disabled
-            p7 = re.compile(r'^\s*Directed +broadcast +forwarding +is'
-                             ' +(?P<broadcast_forwarding>[a-zA-Z]+)$')
             m = p7.match(line)
             if m:
                 broadcast_forwarding = str(m.groupdict()['broadcast_forwarding'])
@@ -1424,9 +1515,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ['broadcast_forwarding'] = broadcast_forwarding
                 continue
 
-            # Outgoing access list is not set
-            p8 = re.compile(r'^\s*Outgoing +access +list +is'
-                             ' +(?P<out_access_list>[a-zA-Z\s]+)$')
             m = p8.match(line)
             if m:
                 out_access_list = str(m.groupdict()['out_access_list'])
@@ -1436,9 +1524,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ['out_access_list'] = out_access_list
                 continue
 
-            # Inbound  access list is not set
-            p9 = re.compile(r'^\s*Inbound +access +list +is'
-                             ' +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p9.match(line)
             if m:
                 in_access_list = str(m.groupdict()['in_access_list'])
@@ -1448,10 +1533,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ['in_access_list'] = in_access_list
                 continue
 
-            # Inbound  common access list is not set, access list is not set
-            p9_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                               ' +(?P<in_common_access_list>[a-zA-Z\s]+), '
-                               '+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p9_1.match(line)
             if m:
                 in_common_access_list = str(m.groupdict()['in_common_access_list'])
@@ -1466,8 +1547,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                     ['in_access_list'] = in_access_list
                 continue
 
-            # Proxy ARP is disabled
-            p10 = re.compile(r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$')
             m = p10.match(line)
             if m:
                 proxy_arp = str(m.groupdict()['proxy_arp'])
@@ -1475,8 +1554,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['ipv4']['proxy_arp'] = proxy_arp
                 continue
 
-            # ICMP redirects are never sent
-            p11 = re.compile(r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$')
             m = p11.match(line)
             if m:
                 icmp_redirects = str(m.groupdict()['icmp_redirects'])
@@ -1484,9 +1561,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['ipv4']['icmp_redirects'] = icmp_redirects
                 continue
 
-            # ICMP unreachables are always sent
-            p12 = re.compile(r'^\s*ICMP +unreachables +(are|is)'
-                              ' +(?P<icmp_unreachables>[a-zA-Z\s]+)$')
             m = p12.match(line)
             if m:
                 icmp_unreachables = str(m.groupdict()['icmp_unreachables'])
@@ -1495,8 +1569,6 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ['icmp_unreachables'] = icmp_unreachables
                 continue
 
-            # ICMP mask replies are never sent
-            p13 = re.compile(r'^\s*ICMP +mask +replies +(are|is) +(?P<icmp_replies>[a-zA-Z\s]+)$')
             m = p13.match(line)
             if m:
                 icmp_replies = str(m.groupdict()['icmp_replies'])
@@ -1504,9 +1576,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 ipv4_vrf_all_interface_dict[interface]['ipv4']['icmp_replies'] = icmp_replies
                 continue
 
-            # Table Id is 0xe0000011
-            p13 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
-            m = p13.match(line)
+            m = p13_1.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
 
@@ -1594,21 +1664,150 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
         ipv6_vrf_all_interface_dict = {}
 
+        # show ipv6 vrf {vrf} interface {interface}
+        # show ipv6 vrf {vrf} interface', 'show ipv6 vrf all interface
+        p1 = re.compile(r'^show +[\S\s]+$')
+
+        # GigabitEthernet0/0/0/0 is Shutdown, ipv6 protocol is Down, Vrfid is VRF1 (0x60000002)
+        # nve100 is Up, ipv6 protocol is Unknown, Vrfid is default (0x60000000)
+        p1_1 = re.compile(r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
+                         ' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
+                         ' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$')
+
+        # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888 [TENTATIVE]
+        p2 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+                         ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
+                         ' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$')
+
+        # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888
+        p2_1 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+                           ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$')
+
+        # IPv6 is disabled, link-local address unassigned
+        p2_2 = re.compile(r'^\s*(?P<enabled>(IPv6 is disabled)),'
+                           ' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$')
+
+        # Global unicast address(es):
+        # 2001:db8:3:3:a8aa:bbff:feff:8888, subnet is 2001:db8:3:3::/64 [TENTATIVE]
+        p3 = re.compile(r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
+                         ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
+                         ' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
+                         ' +(?P<ipv6_route_tag>[0-9]+))?$')
+
+        # Global unicast address(es):
+        # 2001:db8:4:4::4, subnet is 2001:db8:4:4::/64 [TENTATIVE] with route-tag 10
+        p3_1 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                           ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                           '(?P<ipv6_prefix_length>[0-9]+)'
+                           ' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
+                           ' +(?P<ipv6_route_tag>[0-9]+)$')
+
+        # Global unicast address(es):
+        # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64 [TENTATIVE]
+        p3_2 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                           ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                           '(?P<ipv6_prefix_length>[0-9]+)'
+                           ' +\[(?P<ipv6_status>[A-Z]+)\]?$')
+
+        # Global unicast address(es):
+        # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64
+        p3_3 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                           ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                           '(?P<ipv6_prefix_length>[0-9]+)$')
+
+        # Joined group address(es): ff02::1:ff00:1 ff02::1:ffa6:78c5 ff02::2
+        #ff02::1
+        p4 = re.compile(r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
+
+        p4_1 = re.compile(r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
+
+        # MTU is 1600 (1586 is available to IPv6)
+        p5 = re.compile(r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
+                         ' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
+                         ' +to +IPv6\)$')
+
+        # ICMP redirects are disabled
+        p6 = re.compile(r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$')
+
+        # ICMP unreachables are enabled
+        p7 = re.compile(r'^\s*ICMP +unreachables +are'
+                         ' +(?P<icmp_unreachables>[a-z]+)$')
+
+        # ND DAD is enabled, number of DAD attempts 1
+        p8 = re.compile(r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
+                         ' +attempts +(?P<dad_attempts>[0-9]+)$')
+
+        # ND reachable time is 0 milliseconds
+        p9 = re.compile(r'^\s*ND +reachable +time +is'
+                         ' +(?P<nd_reachable_time>[0-9]+) +milliseconds$')
+
+        # ND cache entry limit is 1000000000
+        p10 = re.compile(r'^\s*ND +cache +entry +limit +is'
+                          ' +(?P<nd_cache_limit>[0-9]+)$')
+
+        # ND advertised retransmit interval is 0 milliseconds
+        p11 = re.compile(r'^\s*ND +advertised +retransmit +interval +is'
+                          ' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$')
+
+        # ND router advertisements are sent every 160 to 240 seconds
+        p11_1 = re.compile(r'^\s*ND +router +advertisements +are +sent'
+                            ' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$')
+
+        # ND router advertisements live for 1800 seconds
+        p11_2 = re.compile(r'^\s*ND +router +advertisements +live +for'
+                            ' +(?P<nd_router_adv>[0-9]+) +seconds$')
+
+        # Hosts use stateless autoconfig for addresses.
+        p12 = re.compile(r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
+                          ' +autoconfig +for +addresses.$')
+
+        # Outgoing access list is not set
+        p13 = re.compile(r'^\s*Outgoing +access +list +is'
+                          ' +(?P<out_access_list>[a-zA-Z\s]+)$')
+
+        # Inbound  access list is not set
+        p14 = re.compile(r'^\s*Inbound +access +list +is'
+                          ' +(?P<in_access_list>[a-zA-Z\s]+)$')
+
+        # Inbound  common access list is not set, access list is not set
+        p14_1 = re.compile(r'^\s*Inbound +common +access +list +is'
+                            ' +(?P<in_common_access_list>[a-zA-Z\s]+),'
+                            ' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
+
+        # Table Id is 0xe0800011
+        p15 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
+
+        # Complete protocol adjacency: 0
+        p16 = re.compile(r'^\s*Complete +protocol +adjacency:'
+                          ' +(?P<complete_protocol_adj>[0-9]+)$')
+
+        #Complete glean adjacency: 0
+        p17 = re.compile(r'^\s*Complete +glean +adjacency:'
+                          ' +(?P<complete_glean_adj>[0-9]+)$')
+
+        # Incomplete protocol adjacency: 0
+        p18 = re.compile(r'^\s*Incomplete +protocol +adjacency:'
+                          ' +(?P<incomplete_protocol_adj>[0-9]+)$')
+
+        # Incomplete glean adjacency: 0
+        p19 = re.compile(r'^\s*Incomplete +glean +adjacency:'
+                          ' +(?P<incomplete_glean_adj>[0-9]+)$')
+
+        # Dropped protocol request: 0
+        p20 = re.compile(r'^\s*Dropped +protocol +request:'
+                          ' +(?P<dropped_protocol_req>[0-9]+)$')
+
+        # Dropped glean request: 0
+        p21 = re.compile(r'^\s*Dropped +glean +request:'
+                          ' +(?P<dropped_glean_req>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.strip()
             
-            # show ipv6 vrf {vrf} interface {interface}
-            # show ipv6 vrf {vrf} interface', 'show ipv6 vrf all interface
-            p1 = re.compile(r'^show +[\S\s]+$')
             m = p1.match(line)
             if m:
                 continue
             
-            # GigabitEthernet0/0/0/0 is Shutdown, ipv6 protocol is Down, Vrfid is VRF1 (0x60000002)
-            # nve100 is Up, ipv6 protocol is Unknown, Vrfid is default (0x60000000)
-            p1_1 = re.compile(r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
-                             ' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
-                             ' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1634,10 +1833,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_groups = []
                 continue
 
-            # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888 [TENTATIVE]
-            p2 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                             ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
-                             ' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$')
             m = p2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1647,9 +1842,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['enabled'] = True
                 continue
 
-            # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888
-            p2_1 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                               ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$')
             m = p2_1.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1657,9 +1849,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['enabled'] = True
                 continue
 
-            # IPv6 is disabled, link-local address unassigned
-            p2_2 = re.compile(r'^\s*(?P<enabled>(IPv6 is disabled)),'
-                               ' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$')
             m = p2_2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1667,12 +1856,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['enabled'] = False
                 continue
 
-            # Global unicast address(es):
-            # 2001:db8:3:3:a8aa:bbff:feff:8888, subnet is 2001:db8:3:3::/64 [TENTATIVE]
-            p3 = re.compile(r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
-                             ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
-                             ' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
-                             ' +(?P<ipv6_route_tag>[0-9]+))?$')
             m = p3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1710,13 +1893,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 except Exception:
                     pass
 
-            # Global unicast address(es):
-            # 2001:db8:4:4::4, subnet is 2001:db8:4:4::/64 [TENTATIVE] with route-tag 10
-            p3_1 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)'
-                               ' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
-                               ' +(?P<ipv6_route_tag>[0-9]+)$')
             m = p3_1.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1751,12 +1927,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 except Exception:
                     pass
 
-            # Global unicast address(es):
-            # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64 [TENTATIVE]
-            p3_2 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)'
-                               ' +\[(?P<ipv6_status>[A-Z]+)\]?$')
             m = p3_2.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1788,11 +1958,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 except Exception:
                     pass
 
-            # Global unicast address(es):
-            # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64
-            p3_3 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)$')
             m = p3_3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1819,9 +1984,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 except Exception:
                     pass
 
-            # Joined group address(es): ff02::1:ff00:1 ff02::1:ffa6:78c5 ff02::2
-            #ff02::1
-            p4 = re.compile(r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
             m = p4.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
@@ -1837,7 +1999,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['ipv6']['ipv6_groups'] = ipv6_groups
                 continue
 
-            p4_1 = re.compile(r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
             m = p4_1.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
@@ -1852,10 +2013,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['ipv6']['ipv6_groups'] = ipv6_groups
                 continue
 
-            # MTU is 1600 (1586 is available to IPv6)
-            p5 = re.compile(r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
-                             ' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
-                             ' +to +IPv6\)$')
             m = p5.match(line)
             if m:
                 ipv6_mtu = m.groupdict()['ipv6_mtu']
@@ -1867,8 +2024,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['ipv6_mtu_available'] = ipv6_mtu_available
                 continue
 
-            # ICMP redirects are disabled
-            p6 = re.compile(r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$')
             m = p6.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
@@ -1877,9 +2032,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['icmp_redirects'] = icmp_redirects
                 continue
 
-            # ICMP unreachables are enabled
-            p7 = re.compile(r'^\s*ICMP +unreachables +are'
-                             ' +(?P<icmp_unreachables>[a-z]+)$')
             m = p7.match(line)
             if m:
                 icmp_unreachables = m.groupdict()['icmp_unreachables']
@@ -1888,9 +2040,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['icmp_unreachables'] = icmp_unreachables
                 continue
 
-            # ND DAD is enabled, number of DAD attempts 1
-            p8 = re.compile(r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
-                             ' +attempts +(?P<dad_attempts>[0-9]+)$')
             m = p8.match(line)
             if m:
                 nd_dad = m.groupdict()['nd_dad']
@@ -1902,9 +2051,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['dad_attempts'] = dad_attempts
                 continue
 
-            # ND reachable time is 0 milliseconds
-            p9 = re.compile(r'^\s*ND +reachable +time +is'
-                             ' +(?P<nd_reachable_time>[0-9]+) +milliseconds$')
             m = p9.match(line)
             if m:
                 nd_reachable_time = m.groupdict()['nd_reachable_time']
@@ -1913,9 +2059,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['nd_reachable_time'] = nd_reachable_time
                 continue
 
-            # ND cache entry limit is 1000000000
-            p10 = re.compile(r'^\s*ND +cache +entry +limit +is'
-                              ' +(?P<nd_cache_limit>[0-9]+)$')
             m = p10.match(line)
             if m:
                 nd_cache_limit = m.groupdict()['nd_cache_limit']
@@ -1924,9 +2067,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['nd_cache_limit'] = nd_cache_limit
                 continue
 
-            # ND advertised retransmit interval is 0 milliseconds
-            p11 = re.compile(r'^\s*ND +advertised +retransmit +interval +is'
-                              ' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$')
             m = p11.match(line)
             if m:
                 nd_adv_retrans_int = m.groupdict()['nd_adv_retrans_int']
@@ -1935,9 +2075,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['nd_adv_retrans_int'] = nd_adv_retrans_int
                 continue
 
-            # ND router advertisements are sent every 160 to 240 seconds
-            p11_1 = re.compile(r'^\s*ND +router +advertisements +are +sent'
-                                ' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$')
             m = p11_1.match(line)
             if m:
                 nd_adv_duration = m.groupdict()['nd_adv_duration']
@@ -1948,9 +2085,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['nd_adv_duration'] = nd_adv_duration
                 continue
 
-            # ND router advertisements live for 1800 seconds
-            p11_2 = re.compile(r'^\s*ND +router +advertisements +live +for'
-                                ' +(?P<nd_router_adv>[0-9]+) +seconds$')
             m = p11_2.match(line)
             if m:
                 nd_router_adv = m.groupdict()['nd_router_adv']
@@ -1958,9 +2092,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                  = nd_router_adv
                 continue
 
-            # Hosts use stateless autoconfig for addresses.
-            p12 = re.compile(r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
-                              ' +autoconfig +for +addresses.$')
             m = p12.match(line)
             if m:
                 stateless_autoconfig = m.groupdict()['stateless_autoconfig']
@@ -1969,9 +2100,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['stateless_autoconfig'] = True
                 continue
 
-            # Outgoing access list is not set
-            p13 = re.compile(r'^\s*Outgoing +access +list +is'
-                              ' +(?P<out_access_list>[a-zA-Z\s]+)$')
             m = p13.match(line)
             if m:
                 out_access_list = m.groupdict()['out_access_list']
@@ -1981,9 +2109,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                     ['out_access_list'] = out_access_list
                 continue
 
-            # Inbound  access list is not set
-            p14 = re.compile(r'^\s*Inbound +access +list +is'
-                              ' +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p14.match(line)
             if m:
                 in_access_list = m.groupdict()['in_access_list']
@@ -1992,10 +2117,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                     ipv6_vrf_all_interface_dict[interface]['ipv6']['in_access_list'] = in_access_list
                 continue
 
-            # Inbound  common access list is not set, access list is not set
-            p14_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                                ' +(?P<in_common_access_list>[a-zA-Z\s]+),'
-                                ' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p14_1.match(line)
             if m:
                 in_common_access_list = m.groupdict()['in_common_access_list']
@@ -2008,8 +2129,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                     ipv6_vrf_all_interface_dict[interface]['ipv6']['in_access_list'] = in_access_list
                 continue
 
-            # Table Id is 0xe0800011
-            p15 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
             m = p15.match(line)
             if m:
                 table_id = m.groupdict()['table_id']
@@ -2018,9 +2137,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['table_id'] = table_id
                 continue
 
-            # Complete protocol adjacency: 0
-            p16 = re.compile(r'^\s*Complete +protocol +adjacency:'
-                              ' +(?P<complete_protocol_adj>[0-9]+)$')
             m = p16.match(line)
             if m:
                 complete_protocol_adj = m.groupdict()['complete_protocol_adj']
@@ -2029,9 +2145,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['complete_protocol_adj'] = complete_protocol_adj
                 continue
             
-            #Complete glean adjacency: 0
-            p17 = re.compile(r'^\s*Complete +glean +adjacency:'
-                              ' +(?P<complete_glean_adj>[0-9]+)$')
             m = p17.match(line)
             if m:
                 complete_glean_adj = m.groupdict()['complete_glean_adj']
@@ -2040,9 +2153,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['complete_glean_adj'] = complete_glean_adj
                 continue
 
-            # Incomplete protocol adjacency: 0
-            p18 = re.compile(r'^\s*Incomplete +protocol +adjacency:'
-                              ' +(?P<incomplete_protocol_adj>[0-9]+)$')
             m = p18.match(line)
             if m:
                 incomplete_protocol_adj = m.groupdict()['incomplete_protocol_adj']
@@ -2051,9 +2161,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['incomplete_protocol_adj'] = incomplete_protocol_adj
                 continue
 
-            # Incomplete glean adjacency: 0
-            p19 = re.compile(r'^\s*Incomplete +glean +adjacency:'
-                              ' +(?P<incomplete_glean_adj>[0-9]+)$')
             m = p19.match(line)
             if m:
                 incomplete_glean_adj = m.groupdict()['incomplete_glean_adj']
@@ -2062,9 +2169,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['incomplete_glean_adj'] = incomplete_glean_adj
                 continue
 
-            # Dropped protocol request: 0
-            p20 = re.compile(r'^\s*Dropped +protocol +request:'
-                              ' +(?P<dropped_protocol_req>[0-9]+)$')
             m = p20.match(line)
             if m:
                 dropped_protocol_req = m.groupdict()['dropped_protocol_req']
@@ -2073,9 +2177,6 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ['dropped_protocol_req'] = dropped_protocol_req
                 continue
 
-            # Dropped glean request: 0
-            p21 = re.compile(r'^\s*Dropped +glean +request:'
-                              ' +(?P<dropped_glean_req>[0-9]+)$')
             m = p21.match(line)
             if m:
                 dropped_glean_req = m.groupdict()['dropped_glean_req']
@@ -2125,19 +2226,20 @@ class ShowEthernetTags(ShowEthernetTagsSchema):
 
         ret_dict = {}
 
+        # Interface               St  MTU  Ly Outer            Inner            Xtra -,+
+        # Gi0/0/0/0.501           Up  1518 L3 .1Q:501          -                -    1 0
+        p1 = re.compile(r'^(?P<interface>[\w\/\.]+)'
+                         ' +(?P<status>\w+)'
+                         ' +(?P<mtu>\d+)'
+                         ' +(?P<layer>\w+)'
+                         ' +(?P<outer_vlan>\S+)'
+                         ' +(?P<inner_vlan>\S+)'
+                         ' +(?P<xtra>\S+)'
+                         ' +(?P<rewrite_num_of_tags_pop>\d+)'
+                         ' +(?P<rewrite_num_of_tags_push>\d+)$')
+
         for line in out.splitlines():
             line = line.strip()
-            # Interface               St  MTU  Ly Outer            Inner            Xtra -,+
-            # Gi0/0/0/0.501           Up  1518 L3 .1Q:501          -                -    1 0
-            p1 = re.compile(r'^(?P<interface>[\w\/\.]+)'
-                             ' +(?P<status>\w+)'
-                             ' +(?P<mtu>\d+)'
-                             ' +(?P<layer>\w+)'
-                             ' +(?P<outer_vlan>\S+)'
-                             ' +(?P<inner_vlan>\S+)'
-                             ' +(?P<xtra>\S+)'
-                             ' +(?P<rewrite_num_of_tags_pop>\d+)'
-                             ' +(?P<rewrite_num_of_tags_push>\d+)$')
             m = p1.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'])
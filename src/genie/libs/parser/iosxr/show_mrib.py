@@ -82,16 +82,59 @@ class ShowMribVrfRoute(ShowMribVrfRouteSchema):
         parsed_dict = {}
         rpf_nbr = ''
 
+        # (192.168.0.12,227.1.1.1) RPF nbr: 192.168.0.12 Flags: RPF ME MH
+        # (*,ff00::/8)
+        # (2001:db8:1:0:1:1:1:2,ff15::1:1)
+        p1 = re.compile(r'^\s*\((?P<source_address>(\S+))\,'
+                         '(?P<multicast_group>(\S+))\)'
+                         '(?: *RPF +nbr: +(?P<rpf_nbr>(\S+)))?'
+                         '(?: *Flags: +(?P<flags>[a-zA-Z\s]+))?$')
+
+        # RPF nbr: 2001:db8:b901:0:150:150:150:150 Flags: L C RPF P
+        p2 = re.compile(r'^\s*RPF +nbr: +(?P<rpf_nbr>(\S+))'
+                         ' +Flags: (?P<flags>[a-zA-Z\s]+)$')
+
+        # Flags: D P
+        p3 = re.compile(r'^\s*Flags: (?P<flags>[a-zA-Z\s]+)$')
+
+        # Up: 00:00:54
+        p4 = re.compile(r'^\s*Up: +(?P<uptime>(\S+))$')
+
+        # MT Slot: 0/2/CPU0
+        p5 = re.compile(r'^\s*MT +Slot: +(?P<mt_slot>(\S+))$')
+
+        # MVPN TID: 0xe000001f
+        p6 = re.compile(r'^\s*MVPN +TID: +(?P<mvpn_tid>(\S+))$')
+
+        # MVPN Remote TID: 0x0
+        p7 = re.compile(r'^\s*MVPN +Remote +TID:'
+                         ' +(?P<mvpn_remote_tid>(\S+))$')
+
+        # MVPN Payload: IPv4
+        p8 = re.compile(r'^\s*MVPN +Payload: +(?P<mvpn_payload>(\S+))$')
+
+        # MDT IFH: 0x803380
+        p9 = re.compile(r'^\s*MDT +IFH: +(?P<mdt_ifh>(\S+))$')
+
+        # Incoming Interface List
+        p10 = re.compile(r'^\s*Incoming Interface List$')
+
+        # Outgoing Interface List
+        p11 = re.compile(r'^\s*Outgoing Interface List$')
+
+        # Loopback0 Flags: F A, Up: 00:00:54
+        # GigabitEthernet0/1/0/1 Flags: NS, Up: 00:00:01
+        # Decaps6tunnel0 Flags: NS DI, Up: 00:04:40
+        # mdtvpn1 Flags: F NS MI MT MA, Up: 00:02:53
+        # Bundle-Ether1.100 (0/12/CPU0) Flags: F NS, Up: 5d22h
+        p12 = re.compile(r'^\s*(?P<interface>(\S+))'
+                          '( *\((?P<location>[\S\s]+)\))?'
+                          ' +Flags: +(?P<flags>[a-zA-Z\s]+), +Up:'
+                          ' +(?P<uptime>(\S+))$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # (192.168.0.12,227.1.1.1) RPF nbr: 192.168.0.12 Flags: RPF ME MH
-            # (*,ff00::/8)
-            # (2001:db8:1:0:1:1:1:2,ff15::1:1)
-            p1 = re.compile(r'^\s*\((?P<source_address>(\S+))\,'
-                             '(?P<multicast_group>(\S+))\)'
-                             '(?: *RPF +nbr: +(?P<rpf_nbr>(\S+)))?'
-                             '(?: *Flags: +(?P<flags>[a-zA-Z\s]+))?$')
             m = p1.match(line)
             if m:
                 # Get values
@@ -138,9 +181,6 @@ class ShowMribVrfRoute(ShowMribVrfRouteSchema):
                     sub_dict['flags'] = flags
                 continue
 
-            # RPF nbr: 2001:db8:b901:0:150:150:150:150 Flags: L C RPF P
-            p2 = re.compile(r'^\s*RPF +nbr: +(?P<rpf_nbr>(\S+))'
-                             ' +Flags: (?P<flags>[a-zA-Z\s]+)$')
             m = p2.match(line)
             if m:
                 rpf_nbr = m.groupdict()['rpf_nbr']
@@ -148,59 +188,42 @@ class ShowMribVrfRoute(ShowMribVrfRouteSchema):
                 sub_dict['flags'] = m.groupdict()['flags']
                 continue
 
-            # Flags: D P
-            p3 = re.compile(r'^\s*Flags: (?P<flags>[a-zA-Z\s]+)$')
             m = p3.match(line)
             if m:
                 sub_dict['flags'] = m.groupdict()['flags']
                 continue
 
-            # Up: 00:00:54
-            p4 = re.compile(r'^\s*Up: +(?P<uptime>(\S+))$')
             m = p4.match(line)
             if m:
                 sub_dict['uptime'] = m.groupdict()['uptime']
                 continue
 
-            # MT Slot: 0/2/CPU0
-            p5 = re.compile(r'^\s*MT +Slot: +(?P<mt_slot>(\S+))$')
             m = p5.match(line)
             if m:
                 sub_dict['mt_slot'] = m.groupdict()['mt_slot']
                 continue
 
-            # MVPN TID: 0xe000001f
-            p6 = re.compile(r'^\s*MVPN +TID: +(?P<mvpn_tid>(\S+))$')
             m = p6.match(line)
             if m:
                 sub_dict['mvpn_tid'] = m.groupdict()['mvpn_tid']
                 continue
 
-            # MVPN Remote TID: 0x0
-            p7 = re.compile(r'^\s*MVPN +Remote +TID:'
-                             ' +(?P<mvpn_remote_tid>(\S+))$')
             m = p7.match(line)
             if m:
                 sub_dict['mvpn_remote_tid'] = m.groupdict()['mvpn_remote_tid']
                 continue
 
-            # MVPN Payload: IPv4
-            p8 = re.compile(r'^\s*MVPN +Payload: +(?P<mvpn_payload>(\S+))$')
             m = p8.match(line)
             if m:
                 sub_dict['mvpn_payload'] = \
                     str(m.groupdict()['mvpn_payload']).lower()
                 continue
 
-            # MDT IFH: 0x803380
-            p9 = re.compile(r'^\s*MDT +IFH: +(?P<mdt_ifh>(\S+))$')
             m = p9.match(line)
             if m:
                 sub_dict['mdt_ifh'] = m.groupdict()['mdt_ifh']
                 continue
 
-            # Incoming Interface List
-            p10 = re.compile(r'^\s*Incoming Interface List$')
             m = p10.match(line)
             if m:
                 intf_list_type = 'incoming_interface_list'
@@ -208,8 +231,6 @@ class ShowMribVrfRoute(ShowMribVrfRouteSchema):
                     sub_dict[intf_list_type] = {}
                     continue
 
-            # Outgoing Interface List
-            p11 = re.compile(r'^\s*Outgoing Interface List$')
             m = p11.match(line)
             if m:
                 intf_list_type = 'outgoing_interface_list'
@@ -217,15 +238,6 @@ class ShowMribVrfRoute(ShowMribVrfRouteSchema):
                     sub_dict[intf_list_type] = {}
                     continue
 
-            # Loopback0 Flags: F A, Up: 00:00:54
-            # GigabitEthernet0/1/0/1 Flags: NS, Up: 00:00:01
-            # Decaps6tunnel0 Flags: NS DI, Up: 00:04:40
-            # mdtvpn1 Flags: F NS MI MT MA, Up: 00:02:53
-            # Bundle-Ether1.100 (0/12/CPU0) Flags: F NS, Up: 5d22h
-            p12 = re.compile(r'^\s*(?P<interface>(\S+))'
-                              '( *\((?P<location>[\S\s]+)\))?'
-                              ' +Flags: +(?P<flags>[a-zA-Z\s]+), +Up:'
-                              ' +(?P<uptime>(\S+))$')
             m = p12.match(line)
             if m:
                 # Get values
@@ -305,47 +317,53 @@ class ShowMribVrfRouteSummary(ShowMribVrfRouteSummarySchema):
         parsed_dict = {}
         vrf = ''
 
+        # MRIB Route Summary for VRF default
+        p1 = re.compile(r'^\s*MRIB +Route +Summary +for +VRF +(?P<vrf>(\S+))\s*$')
+
+        # No. of group ranges = 5
+        p2 = re.compile(r'^\s*No\. +of +group +ranges +=\s+(?P<no_group_ranges>[0-9]+)\s*$')
+
+        # No. of (*,G) routes = 1
+        p3 = re.compile(r'^\s*No\. +of +\(\*,G\) +routes +=\s+(?P<no_g_routes>[0-9]+)\s*$')
+
+        # No. of (S,G) routes = 0
+        p4 = re.compile(r'^\s*No\. +of +\(S,G\) +routes +=\s+(?P<no_s_g_routes>[0-9]+)\s*$')
+
+        # No. of Route x Interfaces (RxI) = 0
+        p5 = re.compile(r'^\s*No\. +of +Route +x +Interfaces +\(RxI\) +=\s+(?P<no_route_x_interfaces>[0-9]+)\s*$')
+
+        # Total No. of Interfaces in all routes = 1
+        p6 = re.compile(r'^\s*Total +No\. +of +Interfaces +in +all +routes +=\s+(?P<total_no_interfaces>[0-9]+)\s*$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # MRIB Route Summary for VRF default
-            p1 = re.compile(r'^\s*MRIB +Route +Summary +for +VRF +(?P<vrf>(\S+))\s*$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 parsed_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family', {}).setdefault(af, {})
                 continue
 
-            # No. of group ranges = 5
-            p2 = re.compile(r'^\s*No\. +of +group +ranges +=\s+(?P<no_group_ranges>[0-9]+)\s*$')
             m = p2.match(line)
             if m:
                 parsed_dict['vrf'][vrf]['address_family'][af]['no_group_ranges'] = int(m.groupdict()['no_group_ranges'])
                 continue
 
-            # No. of (*,G) routes = 1
-            p3 = re.compile(r'^\s*No\. +of +\(\*,G\) +routes +=\s+(?P<no_g_routes>[0-9]+)\s*$')
             m = p3.match(line)
             if m:
                 parsed_dict['vrf'][vrf]['address_family'][af]['no_g_routes'] = int(m.groupdict()['no_g_routes'])
                 continue
 
-            # No. of (S,G) routes = 0
-            p4 = re.compile(r'^\s*No\. +of +\(S,G\) +routes +=\s+(?P<no_s_g_routes>[0-9]+)\s*$')
             m = p4.match(line)
             if m:
                 parsed_dict['vrf'][vrf]['address_family'][af]['no_s_g_routes'] = int(m.groupdict()['no_s_g_routes'])
                 continue
 
-            # No. of Route x Interfaces (RxI) = 0
-            p5 = re.compile(r'^\s*No\. +of +Route +x +Interfaces +\(RxI\) +=\s+(?P<no_route_x_interfaces>[0-9]+)\s*$')
             m = p5.match(line)
             if m:
                 parsed_dict['vrf'][vrf]['address_family'][af]['no_route_x_interfaces'] = int(m.groupdict()['no_route_x_interfaces'])
                 continue
 
-            # Total No. of Interfaces in all routes = 1
-            p6 = re.compile(r'^\s*Total +No\. +of +Interfaces +in +all +routes +=\s+(?P<total_no_interfaces>[0-9]+)\s*$')
             m = p6.match(line)
             if m:
                 parsed_dict['vrf'][vrf]['address_family'][af]['total_no_interfaces'] = int(m.groupdict()['total_no_interfaces'])
@@ -22,6 +22,11 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# Parser
+from genie.libs.parser.utils.subcommand import subcommand_cache, \
+                                               subcommand_parse, \
+                                               subcommand_execute
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -270,22 +275,35 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         "high_water_mark",
     ]
 
+    # OSPF_VL0 is unknown, line protocol is up
+    virtual_link = re.compile(r"^\s*\S+_VL\d+ +is ", re.M)
+
+    def command_plan(self, outputs, vrf="", interface="", output=None):
+        """Return the commands of the parse, given the outputs collected"""
+        if output is None:
+            command = self._command(vrf=vrf, interface=interface)
+            if command not in outputs:
+                return [command]
+            output = outputs[command]
+        # The transit areas of the virtual links
+        if isinstance(output, str) and self.virtual_link.search(output):
+            return [ShowOspfVrfAllInclusiveVirtualLinks.cli_command[0]]
+        return []
+
+    def _command(self, vrf="", interface=""):
+        if interface:
+            if vrf:
+                return self.cli_command[2].format(interface=interface, vrf=vrf)
+            return self.cli_command[1].format(interface=interface)
+        if vrf:
+            return self.cli_command[3].format(vrf=vrf)
+        return self.cli_command[0]
+
+    @subcommand_cache
     def cli(self, vrf="", interface="", output=None):
         if output is None:
-            if interface:
-                if vrf:
-                    out = self.device.execute(
-                        self.cli_command[2].format(interface=interface, vrf=vrf)
-                    )
-                else:
-                    out = self.device.execute(
-                        self.cli_command[1].format(interface=interface)
-                    )
-            else:
-                if vrf:
-                    out = self.device.execute(self.cli_command[3].format(vrf=vrf))
-                else:
-                    out = self.device.execute(self.cli_command[0])
+            out = self.device.execute(
+                self._command(vrf=vrf, interface=interface))
         else:
             out = output
 
@@ -498,9 +516,9 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     # Init
                     vl_transit_area_id = None
 
-                    # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    # Parse 'show ospf vrf all-inclusive virtual-links', once per parse, to get the vl_transit_area_id
+                    vl_out = subcommand_parse(
+                        ShowOspfVrfAllInclusiveVirtualLinks, self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -550,7 +568,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     cmd = "show ospf vrf all-inclusive sham-links | i {interface}".format(
                         interface=interface
                     )
-                    out = self.device.execute(cmd)
+                    out = subcommand_execute(self.device, cmd)
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -570,7 +588,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                         cmd = "show run formal router ospf | i sham | i {remote}".format(
                             remote=sl_remote_id
                         )
-                        out = self.device.execute(cmd)
+                        out = subcommand_execute(self.device, cmd)
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -1011,6 +1029,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 
     exclude = ["dead_timer", "neighbor_uptime", "hello_timer", "total_dbd_retrans"]
 
+    @subcommand_cache
     def cli(self, vrf="", neighbor="", interface="", output=None):
         if output is None:
             if vrf:
@@ -1158,9 +1177,9 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
                         intf_type = "virtual_links"
                         name = "VL" + str(n.groupdict()["num"])
 
-                    # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    # Parse 'show ospf vrf all-inclusive virtual-links', once per parse, to get the vl_transit_area_id
+                    vl_out = subcommand_parse(
+                        ShowOspfVrfAllInclusiveVirtualLinks, self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -1820,6 +1839,9 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
         # Post Convergence Path   0
         p53 = re.compile(r"^Post +Convergence +Path +(?P<post_convergence_path>\S+)$")
 
+        # SNMP trap is enabled
+        p24 = re.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -2237,8 +2259,6 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 sub_dict["external_flood_list_length"] = int(m.groupdict()["num"])
                 continue
 
-            # SNMP trap is enabled
-            p24 = re.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
             m = p24.match(line)
             if m:
                 if "enabled" in m.groupdict()["snmp"]:
@@ -2665,16 +2685,88 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
         # crypo_algorithm dict
         crypto_dict = {"message digest": "md5", "clear text": "simple"}
 
+        # Virtual Links for OSPF 1
+        # Sham Links for OSPF 1, VRF VRF1
+        p1 = re.compile(
+            r"^(Virtual|Sham) +Links +for +OSPF"
+            " +(?P<instance>([a-zA-Z0-9\s]+))"
+            "(?:, +VRF +(?P<vrf>(\S+)))?$"
+        )
+
+        # Sham Link OSPF_SL0 to address 10.151.22.22 is up
+        # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
+        p2 = re.compile(
+            r"^(Virtual|Sham) +Link +(?P<link>(\S+)) +to"
+            " +(address|router) +(?P<address>(\S+)) +is"
+            " +(?P<link_state>(up|down))$"
+        )
+
+        # Area 1, source address 10.21.33.33
+        p3_1 = re.compile(
+            r"^Area +(?P<area>(\S+)), +source +address"
+            " +(?P<source_address>(\S+))$"
+        )
+
+        # Transit area 1, via interface GigabitEthernet0/0/0/3, Cost of using 65535
+        p3_2 = re.compile(
+            r"^Transit +area +(?P<area>(\S+)),"
+            "(?: +via +interface +(?P<intf>(\S+)),)?"
+            " +Cost +of +using +(?P<cost>(\d+))$"
+        )
+
+        # IfIndex = 2
+        p4 = re.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
+
+        # Run as demand circuit
+        p5 = re.compile(r"^Run +as +demand +circuit$")
+
+        # DoNotAge LSA not allowed (Number of DCbitless LSA is 1)., Cost of using 111
+        # DoNotAge LSA not allowed Run as demand circuit (Number of DCbitless LSA is 1).
+        p6 = re.compile(
+            r"^DoNotAge +LSA +not +allowed"
+            "(?: +(?P<demand>(Run +as +demand +circuit)))?"
+            " +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).,?"
+            "(?: +Cost +of +using +(?P<cost>(\d+)))?$"
+        )
+
+        # Transmit Delay is 7 sec, State POINT_TO_POINT,
+        # Transmit Delay is 5 sec, State POINT_TO_POINT,
+        p7 = re.compile(
+            r"^Transmit +Delay +is +(?P<transmit_delay>(\d+))"
+            " +sec, +State +(?P<state>(\S+)),?$"
+        )
+
+        # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
+        # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
+        p8 = re.compile(
+            r"^Timer +intervals +configured,"
+            " +Hello +(?P<hello>(\d+)),"
+            " +Dead +(?P<dead>(\d+)),"
+            " +Wait +(?P<wait>(\d+)),"
+            " +Retransmit +(?P<retransmit>(\d+))$"
+        )
+
+        # Hello due in 00:00:00:772
+        # Hello due in 00:00:03:179
+        p9 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+
+        # Non-Stop Forwarding (NSF) enabled, last NSF restart 00:18:16 ago
+        p10 = re.compile(
+            r"^Non-Stop +Forwarding +\(NSF\)"
+            " +(?P<state>(enabled|disabled)), +last +NSF"
+            " +restart +(?P<restart>(\S+)) +ago$"
+        )
+
+        # Clear text authentication enabled
+        # Message digest authentication enabled
+        p11 = re.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
+
+        # Youngest key id is 1
+        p12 = re.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Virtual Links for OSPF 1
-            # Sham Links for OSPF 1, VRF VRF1
-            p1 = re.compile(
-                r"^(Virtual|Sham) +Links +for +OSPF"
-                " +(?P<instance>([a-zA-Z0-9\s]+))"
-                "(?:, +VRF +(?P<vrf>(\S+)))?$"
-            )
             m = p1.match(line)
             if m:
                 instance = str(m.groupdict()["instance"])
@@ -2703,13 +2795,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     ] = {}
                     continue
 
-            # Sham Link OSPF_SL0 to address 10.151.22.22 is up
-            # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            p2 = re.compile(
-                r"^(Virtual|Sham) +Link +(?P<link>(\S+)) +to"
-                " +(address|router) +(?P<address>(\S+)) +is"
-                " +(?P<link_state>(up|down))$"
-            )
             m = p2.match(line)
             if m:
                 address = str(m.groupdict()["address"])
@@ -2723,11 +2808,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     real_link_name = link
                     continue
 
-            # Area 1, source address 10.21.33.33
-            p3_1 = re.compile(
-                r"^Area +(?P<area>(\S+)), +source +address"
-                " +(?P<source_address>(\S+))$"
-            )
             m = p3_1.match(line)
             if m:
                 area = str(m.groupdict()["area"])
@@ -2795,12 +2875,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     pass
                 continue
 
-            # Transit area 1, via interface GigabitEthernet0/0/0/3, Cost of using 65535
-            p3_2 = re.compile(
-                r"^Transit +area +(?P<area>(\S+)),"
-                "(?: +via +interface +(?P<intf>(\S+)),)?"
-                " +Cost +of +using +(?P<cost>(\d+))$"
-            )
             m = p3_2.match(line)
             if m:
                 area = str(m.groupdict()["area"])
@@ -2872,15 +2946,11 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     pass
                 continue
 
-            # IfIndex = 2
-            p4 = re.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
             m = p4.match(line)
             if m:
                 sub_dict["if_index"] = int(m.groupdict()["if_index"])
                 continue
 
-            # Run as demand circuit
-            p5 = re.compile(r"^Run +as +demand +circuit$")
             m = p5.match(line)
             if m:
                 if link_type == "sham_links":
@@ -2889,14 +2959,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     demand_circuit = True
                 continue
 
-            # DoNotAge LSA not allowed (Number of DCbitless LSA is 1)., Cost of using 111
-            # DoNotAge LSA not allowed Run as demand circuit (Number of DCbitless LSA is 1).
-            p6 = re.compile(
-                r"^DoNotAge +LSA +not +allowed"
-                "(?: +(?P<demand>(Run +as +demand +circuit)))?"
-                " +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).,?"
-                "(?: +Cost +of +using +(?P<cost>(\d+)))?$"
-            )
             m = p6.match(line)
             if m:
                 dcbitless_lsa_count = int(m.groupdict()["dcbitless"])
@@ -2911,12 +2973,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                         sub_dict["cost"] = int(m.groupdict()["cost"])
                         continue
 
-            # Transmit Delay is 7 sec, State POINT_TO_POINT,
-            # Transmit Delay is 5 sec, State POINT_TO_POINT,
-            p7 = re.compile(
-                r"^Transmit +Delay +is +(?P<transmit_delay>(\d+))"
-                " +sec, +State +(?P<state>(\S+)),?$"
-            )
             m = p7.match(line)
             if m:
                 sub_dict["transmit_delay"] = int(m.groupdict()["transmit_delay"])
@@ -2925,15 +2981,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 sub_dict["state"] = state
                 continue
 
-            # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
-            # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
-            p8 = re.compile(
-                r"^Timer +intervals +configured,"
-                " +Hello +(?P<hello>(\d+)),"
-                " +Dead +(?P<dead>(\d+)),"
-                " +Wait +(?P<wait>(\d+)),"
-                " +Retransmit +(?P<retransmit>(\d+))$"
-            )
             m = p8.match(line)
             if m:
                 sub_dict["hello_interval"] = int(m.groupdict()["hello"])
@@ -2942,20 +2989,11 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 sub_dict["retransmit_interval"] = int(m.groupdict()["retransmit"])
                 continue
 
-            # Hello due in 00:00:00:772
-            # Hello due in 00:00:03:179
-            p9 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
             m = p9.match(line)
             if m:
                 sub_dict["hello_timer"] = str(m.groupdict()["hello_timer"])
                 continue
 
-            # Non-Stop Forwarding (NSF) enabled, last NSF restart 00:18:16 ago
-            p10 = re.compile(
-                r"^Non-Stop +Forwarding +\(NSF\)"
-                " +(?P<state>(enabled|disabled)), +last +NSF"
-                " +restart +(?P<restart>(\S+)) +ago$"
-            )
             m = p10.match(line)
             if m:
                 if "nsf" not in sub_dict:
@@ -2967,9 +3005,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 sub_dict["nsf"]["last_restart"] = str(m.groupdict()["restart"])
                 continue
 
-            # Clear text authentication enabled
-            # Message digest authentication enabled
-            p11 = re.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
             m = p11.match(line)
             if m:
                 auth = str(m.groupdict()["auth"]).lower()
@@ -2982,8 +3017,6 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 ] = crypto_dict[auth]
                 continue
 
-            # Youngest key id is 1
-            p12 = re.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
             m = p12.match(line)
             if m:
                 if "authentication" not in sub_dict:
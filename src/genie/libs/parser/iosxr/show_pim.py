@@ -64,16 +64,17 @@ class ShowPimVrfMstatic(ShowPimVrfMstaticSchema):
         # Init vars
         parsed_dict = {}
 
+        # * 10.10.10.10/32 via GigabitEthernet0/0/0/0 with nexthop 192.168.1.1 and distance 0
+        p1 = re.compile(r'^\s*(?P<var>(\*))'
+                         ' *(?P<address>(\S+))'
+                         '\/(?P<prefix_mask>[0-9]+) +via'
+                         ' +(?P<interface_name>(\S+)) +with +nexthop'
+                         ' +(?P<neighbor_address>(\S+)) +and +distance'
+                         ' +(?P<admin_distance>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # * 10.10.10.10/32 via GigabitEthernet0/0/0/0 with nexthop 192.168.1.1 and distance 0
-            p1 = re.compile(r'^\s*(?P<var>(\*))'
-                             ' *(?P<address>(\S+))'
-                             '\/(?P<prefix_mask>[0-9]+) +via'
-                             ' +(?P<interface_name>(\S+)) +with +nexthop'
-                             ' +(?P<neighbor_address>(\S+)) +and +distance'
-                             ' +(?P<admin_distance>[0-9]+)$')
             m = p1.match(line)
             if m:
                 # Get values
@@ -179,12 +180,56 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
         # Init vars
         parsed_dict = {}
 
+        # PIM interfaces in VRF default
+        p1 = re.compile(r'^PIM +interfaces +in +VRF'
+                         ' +(?P<vrf_name>[a-zA-Z0-9\-]+)$')
+
+        # IP PIM Multicast Interface State
+        p2 = re.compile(r'^IP +PIM +Multicast +Interface +State$')
+
+        # Loopback0                   on   1     30     1
+        # Loopback0off                  1     30     1
+        p3 = re.compile(r'^(?P<interface>(\S+)) *(?P<oper_status>(on|off)) +'
+                         '(?P<nbr_count>[0-9]+) +(?P<hello_interval>[0-9]+) +'
+                         '(?P<dr_priority>[0-9]+)$')
+
+        # Primary Address : fe80::85c6:bdff:fe62:61e
+        p4 = re.compile(r'^Primary +Address *:'
+                         ' +(?P<primary_address>(\S+))$')
+
+        # Address : 2001:db8:2:2::2
+        p5 = re.compile(r'^Address *: +(?P<address>(\S+))$')
+
+        # Flags : B P NA V
+        p6 = re.compile(r'^Flags *: +(?P<flags>[a-zA-Z\s]+)$')
+
+        # BFD : Off/150 ms/3
+        p7 = re.compile(r'^BFD *: (?P<enable>(Off|On))'
+                         '\/(?P<interval>[0-9]+)'
+                         ' *ms\/(?P<dmultiplier>[0-9]+)$')
+
+        # DR : 10.0.0.2
+        # DR : this system
+        p8 = re.compile(r'^DR *: (?P<dr>[\s\w\.\:]+)$')
+
+        # Propagation delay : 500
+        p9 = re.compile(r'^Propagation +delay *:'
+                         ' +(?P<propagation_delay>[0-9]+)$')
+
+        # Override Interval : 2500
+        p10 = re.compile(r'^Override +Interval *:'
+                          ' +(?P<override_interval>[0-9]+)$')
+
+        # Hello Timer : 00:00:19
+        p11 = re.compile(r'^Hello +Timer *: +(?P<hello_expiration>(\S+))$')
+
+        # Neighbor Filter : -
+        p12 = re.compile(r'^Neighbor +Filter *:'
+                          ' +(?P<neighbor_filter>(\S+))$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # PIM interfaces in VRF default
-            p1 = re.compile(r'^PIM +interfaces +in +VRF'
-                             ' +(?P<vrf_name>[a-zA-Z0-9\-]+)$')
             m = p1.match(line)
             if m:
                 vrf_name = str(m.groupdict()['vrf_name'])
@@ -194,8 +239,6 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                     parsed_dict['vrf'][vrf_name] = {}
                 continue
 
-            # IP PIM Multicast Interface State
-            p2 = re.compile(r'^IP +PIM +Multicast +Interface +State$')
             m = p2.match(line)
             if m:
                 continue
@@ -207,11 +250,6 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
             # Interface                  PIM  Nbr   Hello  DR
             #                                 Count Intvl  Prior
 
-            # Loopback0                   on   1     30     1
-            # Loopback0off                  1     30     1
-            p3 = re.compile(r'^(?P<interface>(\S+)) *(?P<oper_status>(on|off)) +'
-                             '(?P<nbr_count>[0-9]+) +(?P<hello_interval>[0-9]+) +'
-                             '(?P<dr_priority>[0-9]+)$')
             m = p3.match(line)
             if m:
                 # Get values
@@ -242,9 +280,6 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 sub_dict['dr_priority'] = dr_priority
                 continue
 
-            # Primary Address : fe80::85c6:bdff:fe62:61e
-            p4 = re.compile(r'^Primary +Address *:'
-                             ' +(?P<primary_address>(\S+))$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['primary_address']:
@@ -253,8 +288,6 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 sub_dict['address'] = address_list
                 continue
 
-            # Address : 2001:db8:2:2::2
-            p5 = re.compile(r'^Address *: +(?P<address>(\S+))$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['address']:
@@ -262,17 +295,11 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 sub_dict['address'] = address_list
                 continue
 
-            # Flags : B P NA V
-            p6 = re.compile(r'^Flags *: +(?P<flags>[a-zA-Z\s]+)$')
             m = p6.match(line)
             if m:
                 sub_dict['flags'] = m.groupdict()['flags']
                 continue
 
-            # BFD : Off/150 ms/3
-            p7 = re.compile(r'^BFD *: (?P<enable>(Off|On))'
-                             '\/(?P<interval>[0-9]+)'
-                             ' *ms\/(?P<dmultiplier>[0-9]+)$')
             m = p7.match(line)
             if m:
                 # Get values
@@ -290,42 +317,28 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                     sub_dict['bfd']['detection_multiplier'] = dmultiplier
                     continue
 
-            # DR : 10.0.0.2
-            # DR : this system
-            p8 = re.compile(r'^DR *: (?P<dr>[\s\w\.\:]+)$')
             m = p8.match(line)
             if m:
                 sub_dict['dr'] = m.groupdict()['dr']
                 continue
 
-            # Propagation delay : 500
-            p9 = re.compile(r'^Propagation +delay *:'
-                             ' +(?P<propagation_delay>[0-9]+)$')
             m = p9.match(line)
             if m:
                 sub_dict['propagation_delay'] = \
                     int(m.groupdict()['propagation_delay'])
                 continue
 
-            # Override Interval : 2500
-            p10 = re.compile(r'^Override +Interval *:'
-                              ' +(?P<override_interval>[0-9]+)$')
             m = p10.match(line)
             if m:
                 sub_dict['override_interval'] = \
                     int(m.groupdict()['override_interval'])
                 continue
 
-            # Hello Timer : 00:00:19
-            p11 = re.compile(r'^Hello +Timer *: +(?P<hello_expiration>(\S+))$')
             m = p11.match(line)
             if m:
                 sub_dict['hello_expiration'] = m.groupdict()['hello_expiration']
                 continue
 
-            # Neighbor Filter : -
-            p12 = re.compile(r'^Neighbor +Filter *:'
-                              ' +(?P<neighbor_filter>(\S+))$')
             m = p12.match(line)
             if m:
                 sub_dict['neighbor_filter'] = m.groupdict()['neighbor_filter']
@@ -389,6 +402,50 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
         parsed_dict = {}
         created = False
 
+        # ISIS Mcast Topology Not configured
+        p1 = re.compile(r'^\s*ISIS +Mcast +Topology'
+                         ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # MoFRR Flow-based    Not configured
+        p2 = re.compile(r'^\s*MoFRR +Flow-based'
+                         ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # MoFRR RIB           Not configured
+        p3 = re.compile(r'^\s*MoFRR +RIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # RUMP MuRIB          Not enabled
+        p4 = re.compile(r'^\s*RUMP +MuRIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # PIM RPFs registered with Unicast RIB table
+        p5 = re.compile(r'^\s*PIM +RPFs +registered +with'
+                         ' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+
+        # Default RPF Table: IPv4-Unicast-default
+        p6 = re.compile(r'^\s*Default +RPF +Table:'
+                         ' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+
+        # RIB Convergence Timeout Value: 00:30:00
+        p7 = re.compile(r'^\s*RIB +Convergence +Timeout +Value:'
+                         ' +(?P<time>(\S+))$')
+
+        # RIB Convergence Time Left:     00:00:00
+        p8 = re.compile(r'^\s*RIB +Convergence +Time Left:'
+                         ' +(?P<time>(\S+))$')
+
+        # Multipath RPF Selection is Enabled
+        p9 = re.compile(r'^\s*Multipath +RPF +Selection +is'
+                         ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # RIB Table converged
+        p11 = re.compile(r'^\s*RIB +Table'
+                          ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+
+        # Table: IPv6-Unicast-default
+        p10 = re.compile(r'^\s*Table: +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+
+        # PIM RPF Registrations = 0
+        p10_1 = re.compile(r'^\s*PIM +RPF +Registrations += (?P<var>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
@@ -404,9 +461,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict = parsed_dict['vrf'][vrf]['address_family'][af]
                 created = True
 
-            # ISIS Mcast Topology Not configured
-            p1 = re.compile(r'^\s*ISIS +Mcast +Topology'
-                             ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p1.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -416,9 +470,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict['isis_mcast_topology'] = True
                 continue
 
-            # MoFRR Flow-based    Not configured
-            p2 = re.compile(r'^\s*MoFRR +Flow-based'
-                             ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p2.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -428,8 +479,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict['mo_frr_flow_based'] = True
                 continue
 
-            # MoFRR RIB           Not configured
-            p3 = re.compile(r'^\s*MoFRR +RIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p3.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -439,8 +488,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict['mo_frr_rib'] = True
                 continue
 
-            # RUMP MuRIB          Not enabled
-            p4 = re.compile(r'^\s*RUMP +MuRIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p4.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -450,9 +497,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict['rump_mu_rib'] = True
                 continue
 
-            # PIM RPFs registered with Unicast RIB table
-            p5 = re.compile(r'^\s*PIM +RPFs +registered +with'
-                             ' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['table']:
@@ -460,18 +504,12 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                         str(m.groupdict()['table'])
                 continue
 
-            # Default RPF Table: IPv4-Unicast-default
-            p6 = re.compile(r'^\s*Default +RPF +Table:'
-                             ' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p6.match(line)
             if m:
                 if m.groupdict()['table']:
                     sub_dict['default_rpf_table'] = str(m.groupdict()['table'])
                 continue
 
-            # RIB Convergence Timeout Value: 00:30:00
-            p7 = re.compile(r'^\s*RIB +Convergence +Timeout +Value:'
-                             ' +(?P<time>(\S+))$')
             m = p7.match(line)
             if m:
                 if m.groupdict()['time']:
@@ -479,9 +517,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                         str(m.groupdict()['time'])
                 continue
 
-            # RIB Convergence Time Left:     00:00:00
-            p8 = re.compile(r'^\s*RIB +Convergence +Time Left:'
-                             ' +(?P<time>(\S+))$')
             m = p8.match(line)
             if m:
                 if m.groupdict()['time']:
@@ -489,9 +524,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                         str(m.groupdict()['time'])
                 continue
 
-            # Multipath RPF Selection is Enabled
-            p9 = re.compile(r'^\s*Multipath +RPF +Selection +is'
-                             ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p9.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -501,8 +533,6 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     sub_dict['multipath'] = False
                 continue
 
-            # Table: IPv6-Unicast-default
-            p10 = re.compile(r'^\s*Table: +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p10.match(line)
             if m:
                 if m.groupdict()['table']:
@@ -513,17 +543,12 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                         sub_dict['table'][table] = {}
                     continue
 
-            # PIM RPF Registrations = 0
-            p10 = re.compile(r'^\s*PIM +RPF +Registrations += (?P<var>[0-9]+)$')
-            m = p10.match(line)
+            m = p10_1.match(line)
             if m:
                 sub_dict['table'][table]['pim_rpf_registrations'] = \
                     int(m.groupdict()['var'])
                 continue
 
-            # RIB Table converged
-            p11 = re.compile(r'^\s*RIB +Table'
-                              ' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p11.match(line)
             if m:
                 status = m.groupdict()['status']
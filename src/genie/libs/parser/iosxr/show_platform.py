@@ -197,12 +197,49 @@ class ShowSdrDetail(ShowSdrDetailSchema):
         # Init vars
         sdr_detail = {}
 
+        # SDR_id               : 0
+        # SDR ID             : 2
+        p1 = re.compile(r'\s*(SDR_id|SDR ID) *: +(?P<sdr_id>[0-9]+)$')
+
+        # SDR_name             : Owner
+        # SDR name           : default-sdr
+        p2 = re.compile(r'\s*(SDR_name|SDR name) *:'
+                         ' +(?P<sdr_name>[a-zA-Z\-]+)$')
+
+        # dSDRsc node          : 0/0/CPU0
+        p3 = re.compile(r'\s*dSDRsc +node *:'
+                         ' +(?P<dsdrsc_node>[a-zA-Z0-9\/]+)$')
+
+        # dSDRsc partner node  : NONE
+        p4 = re.compile(r'\s*dSDRsc +partner +node *:'
+                         ' +(?P<dsdrsc_partner_node>[a-zA-Z0-9\/]+)$')
+
+        # primary node1        : 0/0/CPU0
+        # SDR lead (Primary) : 0x1000
+        p5 = re.compile(r'\s*(primary +node1|SDR +lead +\(Primary\)) *:'
+                         ' +(?P<primary_node1>[a-zA-Z0-9\/]+)$')
+
+        # primary node2        : NONE
+        # SDR lead (Backup)  : 0xffffffff
+        p6 = re.compile(r'\s*(primary +node2|SDR +lead +\(Backup\)) *:'
+                         ' +(?P<primary_node2>[a-zA-Z0-9\/]+)$')
+
+        # mac addr             : 025e.eaff.fb57
+        p7 = re.compile(r'\s*mac +addr *:'
+                         ' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
+
+        # RP         0/0/CPU0      IOS XR RUN        Primary    NONE
+        # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
+        # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
+        p8 = re.compile(r'\s*(?P<type>[a-zA-Z0-9\-]+)'
+                         ' +(?P<node_name>[a-zA-Z0-9\/]+)'
+                         ' +(?P<node_status>[IOS XR RUN|OPERATIONAL]+)'
+                         ' +(?P<red_state>[a-zA-Z\/\-]+)?'
+                         ' +(?P<partner_name>[a-zA-Z0-9\/]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # SDR_id               : 0
-            # SDR ID             : 2
-            p1 = re.compile(r'\s*(SDR_id|SDR ID) *: +(?P<sdr_id>[0-9]+)$')
             m = p1.match(line)
             if m:
                 if 'sdr_id' not in sdr_detail:
@@ -212,71 +249,42 @@ class ShowSdrDetail(ShowSdrDetailSchema):
                     sdr_detail['sdr_id'][sdr_id] = {}
                 continue
 
-            # SDR_name             : Owner
-            # SDR name           : default-sdr
-            p2 = re.compile(r'\s*(SDR_name|SDR name) *:'
-                             ' +(?P<sdr_name>[a-zA-Z\-]+)$')
             m = p2.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['sdr_name'] = \
                     str(m.groupdict()['sdr_name'])
                 continue
 
-            # dSDRsc node          : 0/0/CPU0
-            p3 = re.compile(r'\s*dSDRsc +node *:'
-                             ' +(?P<dsdrsc_node>[a-zA-Z0-9\/]+)$')
             m = p3.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['dsdrsc_node'] \
                     = str(m.groupdict()['dsdrsc_node'])
                 continue
 
-            # dSDRsc partner node  : NONE
-            p4 = re.compile(r'\s*dSDRsc +partner +node *:'
-                             ' +(?P<dsdrsc_partner_node>[a-zA-Z0-9\/]+)$')
             m = p4.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['dsdrsc_partner_node'] = \
                     str(m.groupdict()['dsdrsc_partner_node'])
                 continue
 
-            # primary node1        : 0/0/CPU0
-            # SDR lead (Primary) : 0x1000
-            p5 = re.compile(r'\s*(primary +node1|SDR +lead +\(Primary\)) *:'
-                             ' +(?P<primary_node1>[a-zA-Z0-9\/]+)$')
             m = p5.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['primary_node1'] = \
                     str(m.groupdict()['primary_node1'])
                 continue
 
-            # primary node2        : NONE
-            # SDR lead (Backup)  : 0xffffffff
-            p6 = re.compile(r'\s*(primary +node2|SDR +lead +\(Backup\)) *:'
-                             ' +(?P<primary_node2>[a-zA-Z0-9\/]+)$')
             m = p6.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['primary_node2'] = \
                     str(m.groupdict()['primary_node2'])
                 continue
 
-            # mac addr             : 025e.eaff.fb57
-            p7 = re.compile(r'\s*mac +addr *:'
-                             ' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
             m = p7.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['mac_address'] = \
                     str(m.groupdict()['mac_address'])
                 continue
 
-            # RP         0/0/CPU0      IOS XR RUN        Primary    NONE
-            # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
-            # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
-            p8 = re.compile(r'\s*(?P<type>[a-zA-Z0-9\-]+)'
-                             ' +(?P<node_name>[a-zA-Z0-9\/]+)'
-                             ' +(?P<node_status>[IOS XR RUN|OPERATIONAL]+)'
-                             ' +(?P<red_state>[a-zA-Z\/\-]+)?'
-                             ' +(?P<partner_name>[a-zA-Z0-9\/]+)$')
             m = p8.match(line)
             if m:
                 if 'membership' not in sdr_detail['sdr_id'][sdr_id]:
@@ -343,20 +351,21 @@ class ShowPlatform(ShowPlatformSchema):
         show_platform = {}
         daughtercard_dict = {}
 
+        # 0/RSP0/CPU0     A9K-RSP440-TR(Active)     IOS XR RUN       PWR,NSHUT,MON
+        # 0/0/CPU0        RP(Active)      N/A             IOS XR RUN      PWR,NSHUT,MON
+        # 0/0/CPU0        RP(Active)      N/A             OPERATIONAL      PWR,NSHUT,MON
+        # 0/0/CPU0        RP(Active)      N/A             POWERED_ON      PWR,NSHUT,MON
+        p1 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/]+)'
+                         ' +(?P<name>[a-zA-Z0-9\-]+)'
+                         '(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
+                         '(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
+                         ' +(?P<state>(IOS XR RUN|OK|OPERATIONAL|POWERED_ON)+)'
+                         ' +(?P<config_state>[a-zA-Z\,]+)$')
+
         for line in out.splitlines():
             entry_is_daughter = False
             line = line.rstrip()
 
-            # 0/RSP0/CPU0     A9K-RSP440-TR(Active)     IOS XR RUN       PWR,NSHUT,MON
-            # 0/0/CPU0        RP(Active)      N/A             IOS XR RUN      PWR,NSHUT,MON
-            # 0/0/CPU0        RP(Active)      N/A             OPERATIONAL      PWR,NSHUT,MON
-            # 0/0/CPU0        RP(Active)      N/A             POWERED_ON      PWR,NSHUT,MON
-            p1 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/]+)'
-                             ' +(?P<name>[a-zA-Z0-9\-]+)'
-                             '(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
-                             '(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
-                             ' +(?P<state>(IOS XR RUN|OK|OPERATIONAL|POWERED_ON)+)'
-                             ' +(?P<config_state>[a-zA-Z\,]+)$')
             m = p1.match(line)
             if m:
                 # Parse regexp
@@ -471,6 +480,10 @@ class ShowPlatformVm(ShowPlatformVmSchema):
         # Init vars
         show_platform_vm = {}
 
+        p1 = re.compile(r'^(?P<node>[\S\/]+) +(?P<type>[(RP|LC)\s*\((ACTIVE|STANDBY)\)]+)'
+                         ' +(?P<partner_name>[NONE|(?:\S)]+) +(?P<sw_status>[a-zA-Z\s]+)'
+                         ' +(?P<ip_address>[\S]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -479,10 +492,6 @@ class ShowPlatformVm(ShowPlatformVmSchema):
             # 0/RSP0/CPU0     RP(ACTIVE)     0/RSP1/CPU0     FINAL Band      192.0.0.4
             # 0/RSP1/CPU0     RP(STANDBY)    0/RSP0/CPU0     FINAL Band      192.168.166.4
 
-            p1 = re.compile(r'^(?P<node>[\S\/]+) +(?P<type>[(RP|LC)\s*\((ACTIVE|STANDBY)\)]+)'
-                             ' +(?P<partner_name>[NONE|(?:\S)]+) +(?P<sw_status>[a-zA-Z\s]+)'
-                             ' +(?P<ip_address>[\S]+)$')
-
             m = p1.match(line)
             if m:
                 if 'node' not in show_platform_vm:
@@ -529,10 +538,17 @@ class ShowInstallActiveSummary(ShowInstallActiveSummarySchema):
         previous_line_sdr = False
         previous_line_active_packages = False
 
+        p1 = re.compile(r'\s*SDRs:*$')
+
+        # disk0:xrvr-full-x-6.2.1.23I
+        # disk0:asr9k-mini-px-6.1.21.15I
+        # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
+        p2 = re.compile(r'\s*Active +Packages:'
+                         ' *(?P<num_active_packages>[0-9]+)?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'\s*SDRs:*$')
             m = p1.match(line)
             if m:
                 previous_line_sdr = True
@@ -544,11 +560,6 @@ class ShowInstallActiveSummary(ShowInstallActiveSummarySchema):
                 continue
 
 
-            # disk0:xrvr-full-x-6.2.1.23I
-            # disk0:asr9k-mini-px-6.1.21.15I
-            # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-            p2 = re.compile(r'\s*Active +Packages:'
-                             ' *(?P<num_active_packages>[0-9]+)?$')
             m = p2.match(line)
             if m:
                 previous_line_active_packages = True
@@ -593,10 +604,17 @@ class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
         previous_line_sdr = False
         previous_line_inactive_packages = False
 
+        p1 = re.compile(r'\s*SDRs:*$')
+
+        # disk0:xrvr-full-x-6.2.1.23I
+        # disk0:asr9k-mini-px-6.1.21.15I
+        # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
+        p2 = re.compile(r'\s*Inactive +Packages:'
+                         ' *(?P<num_inactive_packages>[0-9]+)?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'\s*SDRs:*$')
             m = p1.match(line)
             if m:
                 previous_line_sdr = True
@@ -608,11 +626,6 @@ class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
                 continue
 
 
-            # disk0:xrvr-full-x-6.2.1.23I
-            # disk0:asr9k-mini-px-6.1.21.15I
-            # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-            p2 = re.compile(r'\s*Inactive +Packages:'
-                             ' *(?P<num_inactive_packages>[0-9]+)?$')
             m = p2.match(line)
             if m:
                 previous_line_inactive_packages = True
@@ -659,10 +672,23 @@ class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
         previous_line_committed_packages = False
         previous_line_active_packages = False
 
+        p1 = re.compile(r'\s*SDRs:*$')
+
+        # disk0:xrvr-full-x-6.2.1.23I
+        # disk0:asr9k-mini-px-6.1.21.15I
+        # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
+        p2 = re.compile(r'\s*Committed +Packages:'
+                         ' *(?P<num_committed_packages>[0-9]+)?$')
+
+        # disk0:xrvr-full-x-6.2.1.23I
+        # disk0:asr9k-mini-px-6.1.21.15I
+        # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
+        p2_1 = re.compile(r'\s*Active +Packages:'
+                        ' *(?P<num_active_packages>[0-9]+)?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'\s*SDRs:*$')
             m = p1.match(line)
             if m:
                 previous_line_sdr = True
@@ -674,11 +700,6 @@ class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
                 continue
 
 
-            # disk0:xrvr-full-x-6.2.1.23I
-            # disk0:asr9k-mini-px-6.1.21.15I
-            # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-            p2 = re.compile(r'\s*Committed +Packages:'
-                             ' *(?P<num_committed_packages>[0-9]+)?$')
             m = p2.match(line)
             if m:
                 previous_line_committed_packages = True
@@ -695,12 +716,7 @@ class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
                     install_commit_dict['committed_packages'].append(clean_line)
                     continue
 
-            # disk0:xrvr-full-x-6.2.1.23I
-            # disk0:asr9k-mini-px-6.1.21.15I
-            # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-            p2 = re.compile(r'\s*Active +Packages:'
-                            ' *(?P<num_active_packages>[0-9]+)?$')
-            m = p2.match(line)
+            m = p2_1.match(line)
             if m:
                 previous_line_active_packages = True
                 if 'active_packages' not in install_commit_dict:
@@ -851,19 +867,101 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
         top_assembly_flag = False
         main_flag = False
 
+        # Rack 0 - ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
+        # Rack 0 - Cisco CRS Series 16 Slots Line Card Chassis
+        # Rack 0 - CRS 16 Slots Line Card Chassis for CRS-16/S-B
+        p1 = re.compile(r'Rack +(?P<rack_num>\d+) +-'
+                        r' +(?P<device_group>[a-zA-Z0-9\s]+)'
+                        r' +(?P<num_line_cards>\d+)'
+                        r' +((Line +Card +Slot +Chassis +with *)|'
+                        r'Slots +Line +Card +Chassis(?:( +for))? *)'
+                        r'(?P<chassis_feature>[\S ]+)?$')
+
+        # RACK NUM: 0
+        p2 = re.compile(r'RACK NUM\: *(?P<rack_num>[0-9]+)$')
+
+        # S/N:   FOX1810G8LR
+        # Serial Number   : FOC23158L99
+        # Chassis Serial Number    : FOC23158L99
+        # PCB Serial Number        : CAT2311B0AK
+        p3 = re.compile(r'^(S\/N|((Chassis|PCB) +)?Serial +Number)(\s+)?(\:)? +(?P<serial_number>\S+)$')
+
+        # PID:   ASR-9006-AC-V2
+        # Product ID      : NCS-5501
+        p4 = re.compile(r'(PID|Product ID)(\s+)?\: '
+                        r'+(?P<pid>[a-zA-Z0-9\-]+)$')
+
+        # VID:   V02
+        # VID             : V01
+        # Version Identifier       : V01
+        p5 = re.compile(r'(?:VID|Version +Identifier)(\s+)?\: +(?P<vid>[a-zA-Z0-9\-]+)$')
+
+        # Desc:  ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
+        # UDI Description          : Network Convergence System 1004 4 line card slots
+        p6 = re.compile(r'^(Desc\:|UDI Description\s+:) *(?P<desc>[\S\s]+)$')
+
+        # CLEI:  IPMUP00BRB
+        # CLEI Code       : INM1J10ARA
+        p7 = re.compile(r'CLEI( +Code\s+)?: +(?P<clei>[a-zA-Z0-9\-]+)$')
+
+        # Top Assy. Number:   68-4235-02
+        p8 = re.compile(r'Top +Assy. +Number\:'
+                        r' *(?P<top_assy_num>[a-zA-Z0-9\-\s]+)$')
+
+        # PCA:   73-7806-01 rev B0
+        p9 = re.compile(r'^PCA\: +(?P<pca>[\S ]+)$')
+
+        # ECI:   459651
+        p10 = re.compile(r'^ECI\: +(?P<eci>[\S ]+)$')
+
+        # MAIN: board type 500060
+        p11 = re.compile(r'^MAIN\: +board +type +(?P<board_type>[\S ]+)$')
+
+        # 800-25021-05 rev B0
+        p12 = re.compile(r'^\S+ +rev +\S+')
+
+        # dev 080366, 080181
+        p13 = re.compile(r'\s*dev +(?P<dev>[\S ]+)')
+
+        # 0 Rack 0-IDPROM Info
+        # Rack 0-IDPROM Info
+        # Rack 0-Chassis IDPROM Info
+        p15 = re.compile(r'^(?:[0-9]+ +)?Rack +(?P<rack_num>[0-9]+)-(Chassis )?IDPROM +Info$')
+
+        # Top +Assembly +Block\:$
+        p16 = re.compile(r'Top +Assembly +Block\:$')
+
+        # Part Number     : 73-101057-02
+        p17 = re.compile(r'^Part +(n|N)umber(\s+)?\: +(?P<part_number>\S+)$')
+
+        # Top Assy. Part Number    : 73-101057-02
+        p17_1 = re.compile(r'^Top +Assy\. +Part +Number +: +(?P<part_number>\S+)$')
+
+        # Top Assy. Revision       : A0
+        p17_2 = re.compile(r'^Top +Assy\. +Revision\s+: *(?P<revision>[\S\s]+)$')
+
+        # Part Revision   : D0
+        p18 = re.compile(r'^Part +(r|R)evision(\s+)?\: +(?P<part_revision>\S+)$')
+
+        # H/W Version     : 1.0
+        p19 = re.compile(r'^H\/W +[v|V]ersion(\s+)?\: +(?P<hw_version>\S+)$')
+
+        # Mfg Deviation   : 0
+        p20 = re.compile(r'^[M|m]fg +[D|d]eviation(\s+)?\: '
+                         r'+(?P<mfg_deviation>\S+)$')
+
+        # Mfg Bits        : 1
+        p21 = re.compile(r'^[M|m]fg +Bits(\s+)?\: +(?P<mfg_bits>\S+)$')
+
+        # Controller Family        : 0009
+        p22 = re.compile(r'^Controller\s+Family\s+:\s+(?P<controller_family>\S+)$')
+
+        # Controller Type          : 09d2
+        p23 = re.compile(r'^Controller\s+Type\s+:\s+(?P<controller_type>\S+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Rack 0 - ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
-            # Rack 0 - Cisco CRS Series 16 Slots Line Card Chassis
-            # Rack 0 - CRS 16 Slots Line Card Chassis for CRS-16/S-B
-            p1 = re.compile(r'Rack +(?P<rack_num>\d+) +-'
-                            r' +(?P<device_group>[a-zA-Z0-9\s]+)'
-                            r' +(?P<num_line_cards>\d+)'
-                            r' +((Line +Card +Slot +Chassis +with *)|'
-                            r'Slots +Line +Card +Chassis(?:( +for))? *)'
-                            r'(?P<chassis_feature>[\S ]+)?$')
-
             m = p1.match(line)
             if m:
                 admin_show_diag_dict['rack_num'] = \
@@ -892,8 +990,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 admin_show_diag_dict['desc'] = description
                 continue
 
-            # RACK NUM: 0
-            p2 = re.compile(r'RACK NUM\: *(?P<rack_num>[0-9]+)$')
             m = p2.match(line)
             if m:
                 admin_show_diag_dict['rack_num'] = \
@@ -901,11 +997,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
 
-            # S/N:   FOX1810G8LR
-            # Serial Number   : FOC23158L99
-            # Chassis Serial Number    : FOC23158L99
-            # PCB Serial Number        : CAT2311B0AK
-            p3 = re.compile(r'^(S\/N|((Chassis|PCB) +)?Serial +Number)(\s+)?(\:)? +(?P<serial_number>\S+)$')
             m = p3.match(line)
             if m:
                 serial_num = str(m.groupdict()['serial_number'])
@@ -918,71 +1009,48 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
                 continue
 
-            # PID:   ASR-9006-AC-V2
-            # Product ID      : NCS-5501
-            p4 = re.compile(r'(PID|Product ID)(\s+)?\: '
-                            r'+(?P<pid>[a-zA-Z0-9\-]+)$')
             m = p4.match(line)
             if m:
                 admin_show_diag_dict['pid'] = \
                     str(m.groupdict()['pid'])
                 continue
 
-            # VID:   V02
-            # VID             : V01
-            # Version Identifier       : V01
-            p5 = re.compile(r'(?:VID|Version +Identifier)(\s+)?\: +(?P<vid>[a-zA-Z0-9\-]+)$')
             m = p5.match(line)
             if m:
                 admin_show_diag_dict['vid'] = \
                     str(m.groupdict()['vid'])
                 continue
 
-            # Desc:  ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
-            # UDI Description          : Network Convergence System 1004 4 line card slots
-            p6 = re.compile(r'^(Desc\:|UDI Description\s+:) *(?P<desc>[\S\s]+)$')
             m = p6.match(line)
             if m:
                 admin_show_diag_dict['desc'] = \
                     str(m.groupdict()['desc'])
                 continue
 
-            # CLEI:  IPMUP00BRB
-            # CLEI Code       : INM1J10ARA
-            p7 = re.compile(r'CLEI( +Code\s+)?: +(?P<clei>[a-zA-Z0-9\-]+)$')
             m = p7.match(line)
             if m:
                 admin_show_diag_dict['clei'] = \
                     str(m.groupdict()['clei'])
                 continue
 
-            # Top Assy. Number:   68-4235-02
-            p8 = re.compile(r'Top +Assy. +Number\:'
-                            r' *(?P<top_assy_num>[a-zA-Z0-9\-\s]+)$')
             m = p8.match(line)
             if m:
                 admin_show_diag_dict['top_assy_num'] = \
                     str(m.groupdict()['top_assy_num'])
                 continue
 
-            # PCA:   73-7806-01 rev B0
-            p9 = re.compile(r'^PCA\: +(?P<pca>[\S ]+)$')
             m = p9.match(line)
             if m:
                 admin_show_diag_dict['pca'] = \
                     str(m.groupdict()['pca'])
                 continue
 
-            # ECI:   459651
-            p10 = re.compile(r'^ECI\: +(?P<eci>[\S ]+)$')
             m = p10.match(line)
             if m:
                 admin_show_diag_dict['eci'] = \
                     str(m.groupdict()['eci'])
                 continue
 
-            # MAIN: board type 500060
-            p11 = re.compile(r'^MAIN\: +board +type +(?P<board_type>[\S ]+)$')
             m = p11.match(line)
             if m:
                 main_dict = admin_show_diag_dict.setdefault('main', {})
@@ -990,16 +1058,12 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                     str(m.groupdict()['board_type'])
                 continue
 
-            # 800-25021-05 rev B0
-            p12 = re.compile(r'^\S+ +rev +\S+')
             m = p12.match(line)
             if m:
                 main_dict = admin_show_diag_dict.setdefault('main', {})
                 main_dict['part'] = line.strip()
                 continue
 
-            # dev 080366, 080181
-            p13 = re.compile(r'\s*dev +(?P<dev>[\S ]+)')
             m = p13.match(line)
             if m:
                 dev = m.groupdict()['dev']
@@ -1008,18 +1072,12 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 main_dict['dev'] = dev
                 continue
 
-            # 0 Rack 0-IDPROM Info
-            # Rack 0-IDPROM Info
-            # Rack 0-Chassis IDPROM Info
-            p15 = re.compile(r'^(?:[0-9]+ +)?Rack +(?P<rack_num>[0-9]+)-(Chassis )?IDPROM +Info$')
             m15 = p15.match(line)
             if m15:
                 admin_show_diag_dict['rack_num'] = \
                     int(m15.groupdict()['rack_num'])
                 continue
 
-            # Top +Assembly +Block\:$
-            p16 = re.compile(r'Top +Assembly +Block\:$')
             m16 = p16.match(line)
             if m16:
                 top_assembly_flag = True
@@ -1027,8 +1085,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
                 continue
 
-            # Part Number     : 73-101057-02
-            p17 = re.compile(r'^Part +(n|N)umber(\s+)?\: +(?P<part_number>\S+)$')
             m17 = p17.match(line)
             if m17:
                 part_num = str(m17.groupdict()['part_number'])
@@ -1039,16 +1095,12 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
                 continue
 
-            # Top Assy. Part Number    : 73-101057-02
-            p17_1 = re.compile(r'^Top +Assy\. +Part +Number +: +(?P<part_number>\S+)$')
             m = p17_1.match(line)
             if m:
                 part_num = str(m.groupdict()['part_number'])
                 top_assembly_dict = admin_show_diag_dict.setdefault('top_assembly_block', {})
                 top_assembly_dict.update({'part_number': part_num})
 
-            # Top Assy. Revision       : A0
-            p17_2 = re.compile(r'^Top +Assy\. +Revision\s+: *(?P<revision>[\S\s]+)$')
             m = p17_2.match(line)
             if m:
                 revision = m.groupdict()['revision']
@@ -1056,8 +1108,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 top_assembly_dict.update({'revision': revision})
                 continue
 
-            # Part Revision   : D0
-            p18 = re.compile(r'^Part +(r|R)evision(\s+)?\: +(?P<part_revision>\S+)$')
             m18 = p18.match(line)
             if m18:
                 part_rev = str(m18.groupdict()['part_revision'])
@@ -1068,8 +1118,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
                 continue
 
-            # H/W Version     : 1.0
-            p19 = re.compile(r'^H\/W +[v|V]ersion(\s+)?\: +(?P<hw_version>\S+)$')
             m19 = p19.match(line)
             if m19:
                 hw_ver = str(m19.groupdict()['hw_version'])
@@ -1078,9 +1126,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 else:
                     admin_show_diag_dict['hw_version'] = hw_ver
 
-            # Mfg Deviation   : 0
-            p20 = re.compile(r'^[M|m]fg +[D|d]eviation(\s+)?\: '
-                             r'+(?P<mfg_deviation>\S+)$')
             m20 = p20.match(line)
             if m20:
                 mfg_dev = str(m20.groupdict()['mfg_deviation'])
@@ -1088,8 +1133,6 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
                 continue
 
-            # Mfg Bits        : 1
-            p21 = re.compile(r'^[M|m]fg +Bits(\s+)?\: +(?P<mfg_bits>\S+)$')
             m21 = p21.match(line)
 
             if m21:
@@ -1098,16 +1141,12 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 top_assembly_flag = False
                 continue
 
-            # Controller Family        : 0009
-            p22 = re.compile(r'^Controller\s+Family\s+:\s+(?P<controller_family>\S+)$')
             m = p22.match(line)
             if m:
                 controller_family = m.groupdict()['controller_family']
                 admin_show_diag_dict['controller_family'] = controller_family
                 continue
 
-            # Controller Type          : 09d2
-            p23 = re.compile(r'^Controller\s+Type\s+:\s+(?P<controller_type>\S+)$')
             m = p23.match(line)
             if m:
                 controller_type = m.groupdict()['controller_type']
@@ -1147,18 +1186,24 @@ class ShowRedundancySummary(ShowRedundancySummarySchema):
         redundancy_summary = {}
         redundancy_communication = False
 
+        p0 = re.compile(r'\s*Active.*$')
+
+        # 0/RSP0/CPU0(A)   0/RSP1/CPU0(S) (Node Not Ready, NSR: Not Configured)
+        p1 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
+                         ' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)'
+                         ' +\((?P<node_detail>[a-zA-Z\,\:\s]+)\)$')
+
+        # 0/0/CPU0             N/A
+        p2 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
+                         ' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            p0 = re.compile(r'\s*Active.*$')
             m = p0.match(line)
             if m:
                 continue
 
-            # 0/RSP0/CPU0(A)   0/RSP1/CPU0(S) (Node Not Ready, NSR: Not Configured)
-            p1 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
-                             ' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)'
-                             ' +\((?P<node_detail>[a-zA-Z\,\:\s]+)\)$')
             m = p1.match(line)
             if m:
                 if 'node' not in redundancy_summary:
@@ -1195,9 +1240,6 @@ class ShowRedundancySummary(ShowRedundancySummarySchema):
                         backup_node
                     continue
 
-            # 0/0/CPU0             N/A
-            p2 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
-                             ' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)$')
             m = p2.match(line)
             if m:
                 if 'node' not in redundancy_summary:
@@ -1288,12 +1330,83 @@ class ShowRedundancy(ShowRedundancySchema):
         # Init vars
         redundancy_dict = {}
 
+        # Redundancy information for node 0/RP0/CPU0
+        p1 = re.compile(r'\s*Redundancy +information +for +node'
+                         ' +(?P<node>[a-zA-Z0-9\/]+):$')
+
+        # Node 0/RSP0/CPU0 is in ACTIVE role
+        p2 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +is +in'
+                         ' +(?P<role>[a-zA-Z]+) +role$')
+
+        # Node Redundancy Partner (0/RSP1/CPU0) is in STANDBY role
+        p3_1 =  re.compile(r'\s*Node *Redundancy *Partner'
+                            ' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                            ' *(?P<role>[a-zA-Z]+) *role$')
+
+        # Process Redundancy Partner (0/RSP0/CPU0) is in BACKUP role
+        p3_3 =  re.compile(r'\s*Process *Redundancy *Partner'
+                            ' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                            ' *(?P<role>[a-zA-Z]+) *role$')
+
+        # Standby node in 0/RSP1/CPU0 is ready
+        # Standby node in 0/RSP1/CPU0 is NSR-ready
+        p3_2 = re.compile(r'\s*Standby *node *in *([a-zA-Z0-9\/]+)'
+                           ' *is *(?P<ready>[a-zA-Z\-]+)$')
+
+        # Node 0/RP0/CPU0 has no valid partner
+        p3 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +has +(?P<valid_partner>\S+)'
+                         ' +valid +partner$')
+
+        # v6-routing       0/RSP0/CPU0     N/A             Not Ready
+        p4 = re.compile(r'\s*(?P<group>[a-zA-Z0-9\-]+)'
+                         ' +(?P<primary>[A-Z0-9\/]+)'
+                         ' +(?P<backup>[A-Z0-9\/]+)'
+                         ' +(?P<status>[a-zA-Z\-\s]+)$')
+
+        # NSR not ready since Backup is not Present
+        p5 = re.compile(r'\s*NSR +(?P<primary_rmf_state>[a-zA-Z\s]+) +since'
+                         ' +(?P<primary_rmf_state_reason>[a-zA-Z\s]+)$')
+
+        # A9K-RSP440-TR reloaded Thu Apr 27 02:14:12 2017: 1 hour, 16 minutes ago
+        p6 = re.compile(r'\s*(?P<node_name>[a-zA-Z0-9\-]+) +reloaded'
+                         ' +(?P<last_reload_timestamp>[a-zA-Z0-9\:\s]+):'
+                         ' +(?P<time_since_last_reload>[a-zA-Z0-9\,\s]+)$')
+
+        # Active node booted Thu Apr 27 03:22:37 2017: 8 minutes ago
+        # Active node booted Thu Jan 11 12:31:59 2018: 5 days, 23 hours,  ago
+        # Active node booted Tue Jan  2 07:32:33 2018: 1 day, 1 hour, 6 minutes ago
+        # Active node booted Thu Jan 11 12:32:03 2018: 1 week, 4 days, 20 hours, 19 minutes ago
+        p7 = re.compile(r'\s*Active +node +booted'
+                        ' +(?P<node_uptime_timestamp>[a-zA-Z0-9\:\s]+):'
+                        ' +(?P<node_uptime>((?P<ignore>\d+ \w+, *)?((?P<week>\d+) +(week|weeks), )?'
+                        '(((?P<day>\d+) +(day|days))?, )?)?(((?P<hour>\d+) +(hour|hours))?, )?'
+                        '(((?P<minute>\d+) +(minute|minutes))|((?P<second>\d+) +(seconds|seconds)))?) +ago$')
+
+        # Standby node boot Thu Aug 10 08:29:18 2017: 1 day, 32 minutes ago
+        p7_1 = re.compile(r'\s*Standby +node +boot'
+                           ' +(?P<standby_node_timestamp>[a-zA-Z0-9\:\s]+):'
+                           ' +(?P<time_since_standby_boot>[a-zA-Z0-9\,\s]+)$')
+
+        p7_2 = re.compile(r'\s*Standby *node *last *went *not *ready'
+                           ' *(?P<standby_node_not_ready>[a-zA-Z0-9\:\s]+):'
+                           ' *(?P<time_since_standby_node_not_ready>[a-zA-Z0-9\,\s]+)$')
+
+        p7_3 = re.compile(r'\s*Standby *node *last *went *ready'
+                           ' *(?P<standby_node_ready>[a-zA-Z0-9\:\s]+):'
+                           ' *(?P<time_since_standby_node_ready>[a-zA-Z0-9\,\s]+)$')
+
+        # Last switch-over Thu Apr 27 03:29:57 2017: 1 minute ago
+        p8 = re.compile(r'\s*Last +switch-over'
+                    ' +(?P<last_switchover_timepstamp>[a-zA-Z0-9\:\s]+):'
+                    ' +(?P<time_since_last_switchover>[a-zA-Z0-9\,\s]+)$')
+
+        # Active node reload  Cause: Initiating switch-over.
+        p9 = re.compile(r'\s*Active +node +reload *(?:Cause)?:'
+                         ' +(?P<reload_cause>[a-zA-Z\-\s]+).$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # Redundancy information for node 0/RP0/CPU0
-            p1 = re.compile(r'\s*Redundancy +information +for +node'
-                             ' +(?P<node>[a-zA-Z0-9\/]+):$')
             m = p1.match(line)
             if m:
                 if 'node' not in redundancy_dict:
@@ -1303,59 +1416,36 @@ class ShowRedundancy(ShowRedundancySchema):
                     redundancy_dict['node'][node] = {}
                     continue
 
-            # Node 0/RSP0/CPU0 is in ACTIVE role
-            p2 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +is +in'
-                             ' +(?P<role>[a-zA-Z]+) +role$')
             m = p2.match(line)
             if m:
                 redundancy_dict['node'][node]['role'] = \
                     str(m.groupdict()['role'])
                 continue
 
-            # Node Redundancy Partner (0/RSP1/CPU0) is in STANDBY role
-            p3_1 =  re.compile(r'\s*Node *Redundancy *Partner'
-                                ' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
-                                ' *(?P<role>[a-zA-Z]+) *role$')
             m = p3_1.match(line)
             if m:
                 if 'standby' in str(m.groupdict()['role']).lower():
                     redundancy_dict['node'][node]['standby_node'] = str(m.groupdict()['node'])
                 continue
 
-            # Process Redundancy Partner (0/RSP0/CPU0) is in BACKUP role
-            p3_3 =  re.compile(r'\s*Process *Redundancy *Partner'
-                                ' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
-                                ' *(?P<role>[a-zA-Z]+) *role$')
             m = p3_3.match(line)
             if m:
                 if 'backup' in str(m.groupdict()['role']).lower():
                     redundancy_dict['node'][node]['backup_process'] = str(m.groupdict()['node'])
                 continue
 
-            # Standby node in 0/RSP1/CPU0 is ready
-            # Standby node in 0/RSP1/CPU0 is NSR-ready
-            p3_2 = re.compile(r'\s*Standby *node *in *([a-zA-Z0-9\/]+)'
-                               ' *is *(?P<ready>[a-zA-Z\-]+)$')
             m = p3_2.match(line)
             if m:
                 redundancy_dict['node'][node]['ready'] = \
                     str(m.groupdict()['ready'])
                 continue
 
-            # Node 0/RP0/CPU0 has no valid partner
-            p3 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +has +(?P<valid_partner>\S+)'
-                             ' +valid +partner$')
             m = p3.match(line)
             if m:
                 redundancy_dict['node'][node]['valid_partner'] = \
                 str(m.groupdict()['valid_partner'])
                 continue
 
-            # v6-routing       0/RSP0/CPU0     N/A             Not Ready
-            p4 = re.compile(r'\s*(?P<group>[a-zA-Z0-9\-]+)'
-                             ' +(?P<primary>[A-Z0-9\/]+)'
-                             ' +(?P<backup>[A-Z0-9\/]+)'
-                             ' +(?P<status>[a-zA-Z\-\s]+)$')
             m = p4.match(line)
             if m:
                 if 'group' not in redundancy_dict['node'][node]:
@@ -1372,9 +1462,6 @@ class ShowRedundancy(ShowRedundancySchema):
                         str(m.groupdict()['status'])
                     continue
 
-            # NSR not ready since Backup is not Present
-            p5 = re.compile(r'\s*NSR +(?P<primary_rmf_state>[a-zA-Z\s]+) +since'
-                             ' +(?P<primary_rmf_state_reason>[a-zA-Z\s]+)$')
             m = p5.match(line)
             if m:
                 redundancy_dict['node'][node]['primary_rmf_state'] = \
@@ -1384,10 +1471,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     str(m.groupdict()['primary_rmf_state_reason'])
                 continue
 
-            # A9K-RSP440-TR reloaded Thu Apr 27 02:14:12 2017: 1 hour, 16 minutes ago
-            p6 = re.compile(r'\s*(?P<node_name>[a-zA-Z0-9\-]+) +reloaded'
-                             ' +(?P<last_reload_timestamp>[a-zA-Z0-9\:\s]+):'
-                             ' +(?P<time_since_last_reload>[a-zA-Z0-9\,\s]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict['node'][node]['last_reload_timestamp'] =\
@@ -1396,15 +1479,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     str(m.groupdict()['time_since_last_reload'])
                 continue
 
-            # Active node booted Thu Apr 27 03:22:37 2017: 8 minutes ago
-            # Active node booted Thu Jan 11 12:31:59 2018: 5 days, 23 hours,  ago
-            # Active node booted Tue Jan  2 07:32:33 2018: 1 day, 1 hour, 6 minutes ago
-            # Active node booted Thu Jan 11 12:32:03 2018: 1 week, 4 days, 20 hours, 19 minutes ago
-            p7 = re.compile(r'\s*Active +node +booted'
-                            ' +(?P<node_uptime_timestamp>[a-zA-Z0-9\:\s]+):'
-                            ' +(?P<node_uptime>((?P<ignore>\d+ \w+, *)?((?P<week>\d+) +(week|weeks), )?'
-                            '(((?P<day>\d+) +(day|days))?, )?)?(((?P<hour>\d+) +(hour|hours))?, )?'
-                            '(((?P<minute>\d+) +(minute|minutes))|((?P<second>\d+) +(seconds|seconds)))?) +ago$')
             m = p7.match(line)
             if m:
                 redundancy_dict['node'][node]['node_uptime_timestamp'] = \
@@ -1426,10 +1500,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     time_in_seconds
                 continue
 
-            # Standby node boot Thu Aug 10 08:29:18 2017: 1 day, 32 minutes ago
-            p7_1 = re.compile(r'\s*Standby +node +boot'
-                               ' +(?P<standby_node_timestamp>[a-zA-Z0-9\:\s]+):'
-                               ' +(?P<time_since_standby_boot>[a-zA-Z0-9\,\s]+)$')
             m = p7_1.match(line)
             if m:
                 standby_node_timestamp = str(m.groupdict()['standby_node_timestamp'])
@@ -1444,9 +1514,6 @@ class ShowRedundancy(ShowRedundancySchema):
             # Standby node last went not ready Fri Aug 11 07:13:26 2017: 1 hour, 48 minutes ago
             # Standby node last went ready Fri Aug 11 07:13:26 2017: 1 hour, 48 minutes ago
 
-            p7_2 = re.compile(r'\s*Standby *node *last *went *not *ready'
-                               ' *(?P<standby_node_not_ready>[a-zA-Z0-9\:\s]+):'
-                               ' *(?P<time_since_standby_node_not_ready>[a-zA-Z0-9\,\s]+)$')
             m = p7_2.match(line)
             if m:
                 standby_node_not_ready = str(m.groupdict()['standby_node_not_ready'])
@@ -1458,9 +1525,6 @@ class ShowRedundancy(ShowRedundancySchema):
                 time_since_standby_node_not_ready
                 continue
 
-            p7_3 = re.compile(r'\s*Standby *node *last *went *ready'
-                               ' *(?P<standby_node_ready>[a-zA-Z0-9\:\s]+):'
-                               ' *(?P<time_since_standby_node_ready>[a-zA-Z0-9\,\s]+)$')
             m = p7_3.match(line)
             if m:
                 standby_node_ready = str(m.groupdict()['standby_node_ready'])
@@ -1472,10 +1536,6 @@ class ShowRedundancy(ShowRedundancySchema):
                 time_since_standby_node_ready
                 continue
 
-            # Last switch-over Thu Apr 27 03:29:57 2017: 1 minute ago
-            p8 = re.compile(r'\s*Last +switch-over'
-                        ' +(?P<last_switchover_timepstamp>[a-zA-Z0-9\:\s]+):'
-                        ' +(?P<time_since_last_switchover>[a-zA-Z0-9\,\s]+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['node'][node]['last_switchover_timepstamp'] = \
@@ -1484,9 +1544,6 @@ class ShowRedundancy(ShowRedundancySchema):
                     str(m.groupdict()['time_since_last_switchover'])
                 continue
 
-            # Active node reload  Cause: Initiating switch-over.
-            p9 = re.compile(r'\s*Active +node +reload *(?:Cause)?:'
-                             ' +(?P<reload_cause>[a-zA-Z\-\s]+).$')
             m = p9.match(line)
             if m:
                 redundancy_dict['node'][node]['reload_cause'] = \
@@ -1534,13 +1591,25 @@ class Dir(DirSchema):
         # Init vars
         dir_dict = {}
 
+        # Directory of /misc/scratch
+        # Directory of disk0a:/usr
+        p1 = re.compile(r'\s*Directory +of'
+                         ' +(?P<dir_name>[a-zA-Z0-9\:\/]+)$')
+
+        # 1012660 kbytes total (939092 kbytes free)
+        # 2562719744 bytes total (1918621184 bytes free)
+        p2 = re.compile(r'\s*(?P<total_bytes>[0-9]+ +(kbytes|bytes))'
+                         ' +total +\((?P<total_free_bytes>[0-9]+'
+                         ' +(kbytes|bytes)) +free\)$')
+
+        p3 = re.compile(r'^\s*(?P<index>[0-9]+) +(?P<permission>[a-z\-]+)(\.)?('
+                        ' +(?P<unknown>[0-9]+))? +(?P<size>[0-9]+)( +(?P<date>[a-zA-Z]{3}))? '
+                        '+(?P<month>[a-zA-Z]{3}) +(?P<day>[0-9]{,3})( +(?P<time>[\d\:]+))?( '
+                        '+(?P<year>[0-9]{4}))? +(?P<file>[a-zA-Z0-9\.\/\_\-\+\>\s]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # Directory of /misc/scratch
-            # Directory of disk0a:/usr
-            p1 = re.compile(r'\s*Directory +of'
-                             ' +(?P<dir_name>[a-zA-Z0-9\:\/]+)$')
             m = p1.match(line)
             if m:
                 if 'dir' not in dir_dict:
@@ -1548,11 +1617,6 @@ class Dir(DirSchema):
                     dir_dict['dir']['dir_name'] = str(m.groupdict()['dir_name'])
                 continue
 
-            # 1012660 kbytes total (939092 kbytes free)
-            # 2562719744 bytes total (1918621184 bytes free)
-            p2 = re.compile(r'\s*(?P<total_bytes>[0-9]+ +(kbytes|bytes))'
-                             ' +total +\((?P<total_free_bytes>[0-9]+'
-                             ' +(kbytes|bytes)) +free\)$')
             m = p2.match(line)
             if m:
                 dir_dict['dir']['total_bytes'] = \
@@ -1567,10 +1631,6 @@ class Dir(DirSchema):
             # 14 -rw-r--r--. 1 10429 Oct 26 16:17 pnet_cfg.log
             # 10541310    -rwx  6142        Mon May 18 19:16:01 2020  prod2_vxlan_config
 
-            p3 = re.compile(r'^\s*(?P<index>[0-9]+) +(?P<permission>[a-z\-]+)(\.)?('
-                            ' +(?P<unknown>[0-9]+))? +(?P<size>[0-9]+)( +(?P<date>[a-zA-Z]{3}))? '
-                            '+(?P<month>[a-zA-Z]{3}) +(?P<day>[0-9]{,3})( +(?P<time>[\d\:]+))?( '
-                            '+(?P<year>[0-9]{4}))? +(?P<file>[a-zA-Z0-9\.\/\_\-\+\>\s]+)$')
             m = p3.match(line)
             if m:
                 file = m.groupdict()['file']
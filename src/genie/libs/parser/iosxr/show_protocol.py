@@ -170,11 +170,90 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
         # Init vars
         ret_dict = {}
 
+        # Routing Protocol OSPF 1
+        p1 = re.compile(r'^Routing +Protocol +(?P<pro>OSPF|OSPFv3) +(?P<pid>\S+)$')
+
+        # Router Id: 10.36.3.3
+        p2 = re.compile(r'^Router +Id: +(?P<router_id>\S+)$')
+
+        # Distance: 110
+        p3_1 = re.compile(r'^Distance: +(?P<distance>\d+)$')
+
+        # Distance: IntraArea 112 InterArea 113 External/NSSA 114
+        p3_2 = re.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
+                           ' +InterArea +(?P<inter>\d+) +External\/NSSA'
+                           ' +(?P<external>\d+)$')
+
+        # Non-Stop Forwarding: Disabled
+        p4 = re.compile(r'^Non-Stop +Forwarding:'
+                         ' +(?P<nsf>(Disabled|Enabled))$')
+
+        # Redistribution:
+        #   connected
+        #   connected with metric 10
+        #   static
+        #   static with metric 10
+        p14 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
+                           ' +(?P<metric>\d+))?$')
+
+        # Redistribution:
+        #   bgp 100 with metric 111
+        #   isis 10 with metric 3333
+        #   ospf 99
+        p15 = re.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
+                           ' +metric +(?P<metric>\d+))?$')
+
+        # Area 0
+        p5 = re.compile(r'^Area +(?P<area>\S+)$')
+
+        # Graceful restart is not enabled
+        p9 = re.compile(r'^Graceful restart is not +enabled$')
+
+        # Current BGP NSR state - Active Ready
+        p10 = re.compile(r'^Current +BGP +NSR +state +\-'
+                          ' +(?P<state>([\w\s]+))$')
+
+        # Address Family VPNv4 Unicast:
+        # Address Family VPNv6 Unicast:
+        p11 = re.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
+
+        # Distance: external 20 internal 200 local 200
+        p12 = re.compile(r'^Distance: +external +(?P<external>\d+) +internal'
+                          ' +(?P<internal>\d+) +local +(?P<local>\d+)$')
+
+        # Sourced Networks:
+        p_sn = re.compile(r'(?i)^Sourced +Networks:$')
+
+        # 10.10.10.0/30
+        # 2001:db8:7000:8::/64
+        p_sn2 = re.compile(r'^(?P<src>[\d\.\:\/]+)$')
+
+        # Neighbor      State/Last update received  NSR-State  GR-Enabled
+        # 10.64.4.4       08:05:59                    None       No
+        # 10.64.4.4       08:05:59                    None       No
+        # 172.25.12.17    1w0d                        None       Yes
+        # 2001:db8:7000:13::1   1w0d                 None       Yes
+        p13 = re.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
+                          ' +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes)$')
+
+        # MPLS/TE enabled
+        p6 = re.compile(r'^MPLS\/TE +(?P<te>(enabled|disabled))$')
+
+        # Loopback0
+        # GigabitEthernet0/0/0/0
+        # GigabitEthernet0/0/0/2
+        # TenGigabitEthernet0/0/0/2
+        p6_1 = re.compile(r'^(?P<intf>(Lo|Gi|Te|Bu)[\w\/\.\-]+)$')
+
+        # Routing Protocol "BGP 100"
+        p8 = re.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
+
+        # Non-stop routing is enabled
+        p8_1 = re.compile(r'^Non-stop +routing +is +(?P<nsr>(enabled|disabled))$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Routing Protocol OSPF 1
-            p1 = re.compile(r'^Routing +Protocol +(?P<pro>OSPF|OSPFv3) +(?P<pid>\S+)$')
             m = p1.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
@@ -186,15 +265,11 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                             .setdefault('instance', {}).setdefault(instance, {})
                 continue
 
-            # Router Id: 10.36.3.3
-            p2 = re.compile(r'^Router +Id: +(?P<router_id>\S+)$')
             m = p2.match(line)
             if m:
                 ospf_dict['router_id'] = str(m.groupdict()['router_id'])
                 continue
 
-            # Distance: 110
-            p3_1 = re.compile(r'^Distance: +(?P<distance>\d+)$')
             m = p3_1.match(line)
             if m:
                 try:
@@ -207,10 +282,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 sub_dict['all'] = int(m.groupdict()['distance'])
                 continue
 
-            # Distance: IntraArea 112 InterArea 113 External/NSSA 114
-            p3_2 = re.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
-                               ' +InterArea +(?P<inter>\d+) +External\/NSSA'
-                               ' +(?P<external>\d+)$')
             m = p3_2.match(line)
             if m:
                 sub_dict = ospf_dict.setdefault('preference', {}) \
@@ -223,9 +294,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     int(m.groupdict()['external'])
                 continue
 
-            # Non-Stop Forwarding: Disabled
-            p4 = re.compile(r'^Non-Stop +Forwarding:'
-                             ' +(?P<nsf>(Disabled|Enabled))$')
             m = p4.match(line)
             if m:
                 if 'Disabled' in m.groupdict()['nsf']:
@@ -234,13 +302,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     ospf_dict['nsf'] = True
                 continue
 
-            # Redistribution:
-            #   connected
-            #   connected with metric 10
-            #   static
-            #   static with metric 10
-            p14 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                               ' +(?P<metric>\d+))?$')
             m = p14.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
@@ -250,12 +311,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     sub_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
-            # Redistribution:
-            #   bgp 100 with metric 111
-            #   isis 10 with metric 3333
-            #   ospf 99
-            p15 = re.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
-                               ' +metric +(?P<metric>\d+))?$')
             m = p15.match(line)
             if m:
                 group = m.groupdict()
@@ -269,8 +324,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     sub_dict['metric'] = int(group['metric'])
                 continue
 
-            # Area 0
-            p5 = re.compile(r'^Area +(?P<area>\S+)$')
             m = p5.match(line)
             if m:
                 area = str(IPAddress(m.groupdict()['area']))
@@ -279,8 +332,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 area_dict['interfaces'] = area_interfaces
                 continue
 
-            # MPLS/TE enabled
-            p6 = re.compile(r'^MPLS\/TE +(?P<te>(enabled|disabled))$')
             m = p6.match(line)
             if m:
                 sub_dict = area_dict.setdefault('mpls', {}).setdefault('te', {})
@@ -290,18 +341,11 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     sub_dict['enable'] = False
                 continue
 
-            # Loopback0
-            # GigabitEthernet0/0/0/0
-            # GigabitEthernet0/0/0/2
-            # TenGigabitEthernet0/0/0/2
-            p6 = re.compile(r'^(?P<intf>(Lo|Gi|Te|Bu)[\w\/\.\-]+)$')
-            m = p6.match(line)
+            m = p6_1.match(line)
             if m:
                 area_interfaces.append(m.groupdict()['intf'])
                 continue
 
-            # Routing Protocol "BGP 100"
-            p8 = re.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
             m = p8.match(line)
             if m:
                 # Set sub_dict
@@ -309,9 +353,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 bgp_dict['bgp_pid'] = int(m.groupdict()['bgp_pid'])
                 continue
 
-            # Non-stop routing is enabled
-            p8 = re.compile(r'^Non-stop +routing +is +(?P<nsr>(enabled|disabled))$')
-            m = p8.match(line)
+            m = p8_1.match(line)
             if m:
                 nsr_dict = bgp_dict.setdefault('nsr', {})
                 if 'enabled' in m.groupdict()['nsr']:
@@ -320,17 +362,12 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     nsr_dict['enable'] = False
                 continue
 
-            # Graceful restart is not enabled
-            p9 = re.compile(r'^Graceful restart is not +enabled$')
             m = p9.match(line)
             if m:
                 sub_dict = bgp_dict.setdefault('graceful_restart', {})
                 sub_dict['enable'] = False
                 continue
 
-            # Current BGP NSR state - Active Ready
-            p10 = re.compile(r'^Current +BGP +NSR +state +\-'
-                              ' +(?P<state>([\w\s]+))$')
             m = p10.match(line)
             if m:
                 nsr_dict = bgp_dict.setdefault('nsr', {})
@@ -338,18 +375,12 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 nsr_dict['current_state'] = m.groupdict()['state'].lower()
                 continue
 
-            # Address Family VPNv4 Unicast:
-            # Address Family VPNv6 Unicast:
-            p11 = re.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
             m = p11.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
                 af_dict = bgp_dict.setdefault('address_family', {}).setdefault(af, {})
                 continue
 
-            # Distance: external 20 internal 200 local 200
-            p12 = re.compile(r'^Distance: +external +(?P<external>\d+) +internal'
-                              ' +(?P<internal>\d+) +local +(?P<local>\d+)$')
             m = p12.match(line)
             if m:
                 group = m.groupdict()
@@ -357,17 +388,12 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 dist_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            # Sourced Networks:
-            p_sn = re.compile(r'(?i)^Sourced +Networks:$')
             m = p_sn.match(line)
             if m:
                 src_networks = []
                 sn_dict = af_dict.setdefault('sourced_networks', src_networks)
                 continue
 
-            # 10.10.10.0/30
-            # 2001:db8:7000:8::/64
-            p_sn2 = re.compile(r'^(?P<src>[\d\.\:\/]+)$')
             m = p_sn2.match(line)
             if m:
                 try:
@@ -377,13 +403,6 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                     
                 continue
 
-            # Neighbor      State/Last update received  NSR-State  GR-Enabled
-            # 10.64.4.4       08:05:59                    None       No
-            # 10.64.4.4       08:05:59                    None       No
-            # 172.25.12.17    1w0d                        None       Yes
-            # 2001:db8:7000:13::1   1w0d                 None       Yes
-            p13 = re.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
-                              ' +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes)$')
             m = p13.match(line)
             if m:
                 group = m.groupdict()
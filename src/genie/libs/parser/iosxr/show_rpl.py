@@ -83,12 +83,126 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
 
         rpl_route_policy_dict = {}
 
+        p1 = re.compile(r'^\s*route-policy +(?P<name>[\w\W\s]+)$')
+
+        # test
+        p1_1 = re.compile(r'^\s*# *(?P<description>[a-zA-Z\W]+)$')
+
+        #36
+        p1_2 = re.compile(r'^\s*# *(?P<statements>[0-9]+)$')
+
+        # set med 113
+        p2 = re.compile(r'^\s*set +med +(?P<set_med>[0-9]+)$')
+
+        # set origin egp
+        p3 = re.compile(r'^\s*set +origin +(?P<set_route_origin>[a-z]+)$')
+
+        # set local-preference 100
+        p4 = re.compile(r'^\s*set +local-preference +(?P<set_local_pref>[0-9]+)$')
+
+        # set next-hop 10.4.1.1
+        p5 = re.compile(r'^\s*set +next-hop +(?P<set_next_hop>[0-9\.]+)$')
+
+        # set next-hop self
+        p5_1 = re.compile(r'^\s*(?P<set_next_hop_self>(self))$')
+
+        # prepend as-path 100 10
+        p6 = re.compile(r'\s*prepend +as-path +(?P<set_as_path_prepend>[0-9]+)'
+                         ' *(?P<set_as_path_prepend_repeat_n>[0-9]+)$')
+
+        # set community test
+        p7 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)$')
+
+        # set community test additive
+        p7_1 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)'
+                         ' *(?P<set_community_additive>(additive))$')
+
+        # set community (100:100, no-export, no-advertise) additive
+        p8 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                         ' *(?P<set_community_no_export>(no-export)),'
+                         ' *(?P<set_community_no_advertise>(no-advertise))\)'
+                         ' *(?P<set_community_additive>(additive))$')
+
+        #  set community (111:1, 222:1, no-advertise) additive
+        p8_1 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                         ' *(?P<set_community_no_advertise>(no-advertise))\)'
+                         '(?: *(?P<set_community_additive>(additive)))?$')
+
+        # set community (100:100, no-export) additive
+        p8_2 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                         ' *(?P<set_community_no_export>(no-export))\)'
+                         '(?: *(?P<set_community_additive>(additive)))?$')
+
+        # set community (100:1, 200:1, 300:1, no-export, no-advertise)
+        p8_3 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                         ' *(?P<set_community_no_export>(no-export)),'
+                         ' *(?P<set_community_no_advertise>(no-advertise))\)$')
+
+        # set community (100:100, no-export, no-advertise) additive
+        p8_4 = re.compile(r'^\s*set +community +\((?:(?P<set_community>[0-9\:\s\,]+),)?'
+                         '(?: *(?P<set_community_no_export>(no-export)),)?'
+                         '(?: *(?P<set_community_no_advertise>(no-advertise)))?\)'
+                         '(?: *(?P<set_community_additive>(additive)))?$')
+
+        # delete community in test
+        p9 = re.compile(r'^\s*delete +community *in'
+                         ' *(?P<set_community_delete>[a-zA-Z]+)$')
+
+        # set extcommunity rt (100:100, 200:200) additive
+        # set extcommunity rt (300:1, 300:2) additive
+        p10 = re.compile(r'^\s*set +extcommunity +rt'
+                          ' *\((?P<set_ext_community_rt>[0-9\:\,\s]+)\)(?:'
+                          ' *(?P<set_ext_community_rt_additive>(additive)))?$')
+
+        # set extcommunity soo (100:100) additive
+        p11 = re.compile(r'^\s*set extcommunity +soo'
+                          ' +\((?P<set_ext_community_soo>[0-9\:]+)\)(?:'
+                          ' *(?P<set_ext_community_soo_additive>(additive)))?$')
+
+        # delete extcommunity rt in test
+        p12 = re.compile(r'^\s*delete +extcommunity +rt *in'
+                          ' +(?P<set_ext_community_delete>[a-z]+)$')
+
+        # set level level-1
+        # set level level-2
+        # set level level-1-2
+        p13 = re.compile(r'^\s*set +level +(?P<set_level>[a-z0-9\-]+)$')
+
+        # set metric-type internal
+        # set metric-type external
+        p14 = re.compile(r'^\s*set +metric-type +(?P<set_metric_type>[a-z0-9\-]+)$')
+
+        # set isis-metric 100
+        p15 = re.compile(r'^\s*set +isis-metric +(?P<set_metric>[0-9]+)$')
+
+        # set ospf-metric 100
+        p16 = re.compile(r'^\s*set +ospf-metric +(?P<set_ospf_metric>[0-9]+)$')
+
+        #set weight 111
+        p16_1 = re.compile(r'^\s*set +weight +(?P<set_weight>[0-9\s]+)$')
+
+        # set tag 111
+        p17 = re.compile(r'^\s*set +tag +(?P<set_tag>[0-9\s]+)$')
+
+        # set spf-priority medium
+        p20 = re.compile(r'^\s*set +spf-priority +(?P<spf_priority>[a-z]+)$')
+
+        #pass|done|drop
+        p18 = re.compile(r'^\s*(?P<actions>(pass|done|drop))$')
+
+        # if med eq 100 and local-preference eq 100 and ospf-area is 0 then
+        # m.groupdict()[cond] == None - set to none if there is no parsed condition
+        p19 = re.compile(r'^\s*(if|elseif|else) *(?P<condition1>\S+ \S+ \S+)'
+                          '( *and)?(?: *(?P<condition2>\S+ \S+ \S+))?( *and)?'
+                          '(?: *(?P<condition3>\S+ \S+ \S+))?( *and)?(?:'
+                          ' *(?P<condition4>\S+ \S+ \S+))?( *and)?(?:'
+                          ' *(?P<condition5>\S+ \S+ \S+))? *then$')
+
         for line in out.splitlines():
             line = line.strip()
 
             # route-policy test
 
-            p1 = re.compile(r'^\s*route-policy +(?P<name>[\w\W\s]+)$')
             m = p1.match(line)
             if m:
                 name = str(m.groupdict()['name'])
@@ -117,8 +231,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 if 'conditions' not in rpl_route_policy_dict[name]:
                     rpl_route_policy_dict[name]['statements'][statements]['conditions'] = {}
 
-            # test
-            p1_1 = re.compile(r'^\s*# *(?P<description>[a-zA-Z\W]+)$')
             m = p1_1.match(line)
             if m:
                 description = str(m.groupdict()['description'])
@@ -126,8 +238,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 rpl_route_policy_dict[name]['description'] = description
                 continue
 
-            #36
-            p1_2 = re.compile(r'^\s*# *(?P<statements>[0-9]+)$')
             m = p1_2.match(line)
             if m:
 
@@ -145,32 +255,24 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                     rpl_route_policy_dict[name]['statements'][statements]['conditions'] = {}
                 continue
 
-            # set med 113
-            p2 = re.compile(r'^\s*set +med +(?P<set_med>[0-9]+)$')
             m = p2.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_med'] = int(m.groupdict()['set_med'])
                 continue
 
-            # set origin egp
-            p3 = re.compile(r'^\s*set +origin +(?P<set_route_origin>[a-z]+)$')
             m = p3.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_route_origin'] = str(m.groupdict()['set_route_origin'])
                 continue
 
-            # set local-preference 100
-            p4 = re.compile(r'^\s*set +local-preference +(?P<set_local_pref>[0-9]+)$')
             m = p4.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_local_pref'] = int(m.groupdict()['set_local_pref'])
                 continue
 
-            # set next-hop 10.4.1.1
-            p5 = re.compile(r'^\s*set +next-hop +(?P<set_next_hop>[0-9\.]+)$')
             m = p5.match(line)
             if m:
                 set_next_hop = m.groupdict()['set_next_hop']
@@ -178,8 +280,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_next_hop'] = str(m.groupdict()['set_next_hop'])
                 continue
 
-            # set next-hop self
-            p5_1 = re.compile(r'^\s*(?P<set_next_hop_self>(self))$')
             m = p5_1.match(line)
             if m:
                 set_next_hop_self = m.groupdict()['set_next_hop_self']
@@ -187,9 +287,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_next_hop_self'] = True
                 continue
 
-            # prepend as-path 100 10
-            p6 = re.compile(r'\s*prepend +as-path +(?P<set_as_path_prepend>[0-9]+)'
-                             ' *(?P<set_as_path_prepend_repeat_n>[0-9]+)$')
             m = p6.match(line)
             if m:
                 set_as_path_prepend = int(m.groupdict()['set_as_path_prepend'])
@@ -201,8 +298,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_as_path_prepend_repeat_n'] = set_as_path_prepend_repeat_n
                 continue
 
-            # set community test
-            p7 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)$')
             m = p7.match(line)
             if m:
                 set_community_list = m.groupdict()['set_community_list']
@@ -213,9 +308,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_list'] = set_community_list
                 continue
 
-            # set community test additive
-            p7_1 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)'
-                             ' *(?P<set_community_additive>(additive))$')
             m = p7_1.match(line)
             if m:
                 set_community_list = m.groupdict()['set_community_list']
@@ -229,11 +321,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_additive'] = True
                 continue
 
-            # set community (100:100, no-export, no-advertise) additive
-            p8 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                             ' *(?P<set_community_no_export>(no-export)),'
-                             ' *(?P<set_community_no_advertise>(no-advertise))\)'
-                             ' *(?P<set_community_additive>(additive))$')
             m = p8.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -253,10 +340,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_additive'] = True
                 continue
 
-            #  set community (111:1, 222:1, no-advertise) additive
-            p8_1 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                             ' *(?P<set_community_no_advertise>(no-advertise))\)'
-                             '(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_1.match(line)
             if m:
                 set_community_no_advertise = m.groupdict()['set_community_no_advertise']
@@ -273,10 +356,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_additive'] = True
                 continue
 
-            # set community (100:100, no-export) additive
-            p8_2 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                             ' *(?P<set_community_no_export>(no-export))\)'
-                             '(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_2.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -293,10 +372,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_additive'] = True
                 continue
 
-            # set community (100:1, 200:1, 300:1, no-export, no-advertise)
-            p8_3 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                             ' *(?P<set_community_no_export>(no-export)),'
-                             ' *(?P<set_community_no_advertise>(no-advertise))\)$')
             m = p8_3.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -313,11 +388,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_no_advertise'] = True
                 continue
 
-            # set community (100:100, no-export, no-advertise) additive
-            p8_4 = re.compile(r'^\s*set +community +\((?:(?P<set_community>[0-9\:\s\,]+),)?'
-                             '(?: *(?P<set_community_no_export>(no-export)),)?'
-                             '(?: *(?P<set_community_no_advertise>(no-advertise)))?\)'
-                             '(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_4.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -337,9 +407,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_additive'] = True
                 continue
 
-            # delete community in test
-            p9 = re.compile(r'^\s*delete +community *in'
-                             ' *(?P<set_community_delete>[a-zA-Z]+)$')
             m = p9.match(line)
             if m:
 
@@ -347,11 +414,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_community_delete'] = str(m.groupdict()['set_community_delete'])
                 continue
 
-            # set extcommunity rt (100:100, 200:200) additive
-            # set extcommunity rt (300:1, 300:2) additive
-            p10 = re.compile(r'^\s*set +extcommunity +rt'
-                              ' *\((?P<set_ext_community_rt>[0-9\:\,\s]+)\)(?:'
-                              ' *(?P<set_ext_community_rt_additive>(additive)))?$')
             m = p10.match(line)
             if m:
                 set_ext_community_rt_additive = m.groupdict()['set_ext_community_rt_additive']
@@ -365,10 +427,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_ext_community_rt_additive'] = True
                 continue
 
-            # set extcommunity soo (100:100) additive
-            p11 = re.compile(r'^\s*set extcommunity +soo'
-                              ' +\((?P<set_ext_community_soo>[0-9\:]+)\)(?:'
-                              ' *(?P<set_ext_community_soo_additive>(additive)))?$')
             m = p11.match(line)
             if m:
                 set_ext_community_soo_additive = m.groupdict()['set_ext_community_soo_additive']
@@ -379,76 +437,54 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['set_ext_community_soo_additive'] = True
                 continue
 
-            # delete extcommunity rt in test
-            p12 = re.compile(r'^\s*delete +extcommunity +rt *in'
-                              ' +(?P<set_ext_community_delete>[a-z]+)$')
             m = p12.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_ext_community_delete'] = str(m.groupdict()['set_ext_community_delete'])
                 continue
 
-            # set level level-1
-            # set level level-2
-            # set level level-1-2
-            p13 = re.compile(r'^\s*set +level +(?P<set_level>[a-z0-9\-]+)$')
             m = p13.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_level'] = str(m.groupdict()['set_level'])
                 continue
 
-            # set metric-type internal
-            # set metric-type external
-            p14 = re.compile(r'^\s*set +metric-type +(?P<set_metric_type>[a-z0-9\-]+)$')
             m = p14.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_metric_type'] = str(m.groupdict()['set_metric_type'])
                 continue
 
-            # set isis-metric 100
-            p15 = re.compile(r'^\s*set +isis-metric +(?P<set_metric>[0-9]+)$')
             m = p15.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_metric'] = str(m.groupdict()['set_metric'])
                 continue
 
-            # set ospf-metric 100
-            p16 = re.compile(r'^\s*set +ospf-metric +(?P<set_ospf_metric>[0-9]+)$')
             m = p16.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_ospf_metric'] = str(m.groupdict()['set_ospf_metric'])
                 continue
 
-            #set weight 111
-            p16_1 = re.compile(r'^\s*set +weight +(?P<set_weight>[0-9\s]+)$')
             m = p16_1.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_weight'] = str(m.groupdict()['set_weight'])
                 continue
 
-            # set tag 111
-            p17 = re.compile(r'^\s*set +tag +(?P<set_tag>[0-9\s]+)$')
             m = p17.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_tag'] = str(m.groupdict()['set_tag'])
                 continue
 
-            # set spf-priority medium
-            p20 = re.compile(r'^\s*set +spf-priority +(?P<spf_priority>[a-z]+)$')
             m = p20.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions']\
                 ['set_spf_priority'] = str(m.groupdict()['spf_priority'])
                 continue
 
-            #pass|done|drop
-            p18 = re.compile(r'^\s*(?P<actions>(pass|done|drop))$')
             m = p18.match(line)
             if m:
                 actions = m.groupdict()['actions']
@@ -457,13 +493,6 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 ['actions'] = actions
                 continue
 
-            # if med eq 100 and local-preference eq 100 and ospf-area is 0 then
-            # m.groupdict()[cond] == None - set to none if there is no parsed condition
-            p19 = re.compile(r'^\s*(if|elseif|else) *(?P<condition1>\S+ \S+ \S+)'
-                              '( *and)?(?: *(?P<condition2>\S+ \S+ \S+))?( *and)?'
-                              '(?: *(?P<condition3>\S+ \S+ \S+))?( *and)?(?:'
-                              ' *(?P<condition4>\S+ \S+ \S+))?( *and)?(?:'
-                              ' *(?P<condition5>\S+ \S+ \S+))? *then$')
             m = p19.match(line)
             if m:
                 for cond in m.groupdict().keys():
@@ -201,19 +201,62 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
         is_interface = False
         is_address_family = False
         isis_name = None
+
+        p0 = re.compile(r'^\s*!+\s*$')
+
+        # fast-reroute per-prefix tiebreaker srlg-disjoint index 255
+        # fast-reroute per-prefix tiebreaker node-protecting index 100
+        a1 = re.compile(r'^\s*fast-reroute\sper-prefix\stiebreaker\s+(?P<key>\S+)\s+(?P<value>.+)$')
+
+        # mpls traffic-eng level-2-only
+        a2 = re.compile(r'^\s*mpls\straffic-eng\s+(?P<mpls_traffic_eng>.+)$')
+
+        # segment-routing mpls sr-prefer
+        a3 = re.compile(r'^\s*segment-routing\s+(?P<segment_key>\S+)\s+(?P<segment_value>.+)$')
+
+        # spf prefix-priority critical tag 1000
+        a4 = re.compile(r'^\s*spf\sprefix-priority\s+(?P<tag_key>\S+\stag+)\s+(?P<tag_value>.+)$')
+
+        # spf-interval maximum-wait 8000 initial-wait 300 secondary-wait 500
+        a5 = re.compile(r'^\s*spf-interval\s+(?P<spf_interval>.+)$')
+
+        # Generic, catch all key/value
+        a9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
+
+        # router isis 65109
+        p1 = re.compile(r'^\s*router\sisis\s+(?P<isis_name>.+)$')
+
+        # segment-routing global-block 160000 167999
+        p2 = re.compile(r'^\s*segment-routing\s+(?P<segment_routing_key>\S+)\s+(?P<segment_routing_value>.+)$')
+
+        # lsp-gen-interval maximum-wait 8000 initial-wait 1 secondary-wait 250
+        p3 = re.compile(r'^\s*lsp-gen-interval\s+(?P<lsp_gen_interval>.+)$')
+
+        # address-family ipv4 unicast 
+        p4 = re.compile(r'^\s*address-family\s+(?P<address_family>.+)$')
+
+        # interface Bundle-Ether2
+        p5 = re.compile(r'^\s*interface\s+(?P<interface>\S+)\s*$')
+
+        p9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
+
+        pattern = re.compile('(\S+-wait)\s([0-9]+)')
+
+        # interface Bundle-Ether2
+        i1 = re.compile(r'^\s*bfd\s+(?P<bfd_key>\S+)\s+(?P<bfd_value>.+)$')
+
+        # passive
+        i1_1 = re.compile(r'^\s*(?P<other>[^\s!]+)\s*$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            p0 = re.compile(r'^\s*!+\s*$')
             m = p0.match(line)
             if m:
                 is_address_family = False
             
             # Parsers for ISIS Address Family
             if is_address_family:
-                # fast-reroute per-prefix tiebreaker srlg-disjoint index 255
-                # fast-reroute per-prefix tiebreaker node-protecting index 100
-                a1 = re.compile(r'^\s*fast-reroute\sper-prefix\stiebreaker\s+(?P<key>\S+)\s+(?P<value>.+)$')
                 m = a1.match(line)
                 if m:
                     if is_interface:
@@ -232,8 +275,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                             ['tiebreaker'][m.groupdict()['key'].replace('-', '_')] = m.groupdict()['value']
                     continue
                 
-                # mpls traffic-eng level-2-only
-                a2 = re.compile(r'^\s*mpls\straffic-eng\s+(?P<mpls_traffic_eng>.+)$')
                 m = a2.match(line)
                 if m:
                     if is_interface:
@@ -249,8 +290,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                             m.groupdict()['mpls_traffic_eng'])
                     continue
                 
-                # segment-routing mpls sr-prefer
-                a3 = re.compile(r'^\s*segment-routing\s+(?P<segment_key>\S+)\s+(?P<segment_value>.+)$')
                 m = a3.match(line)
                 if m:
                     if not 'segment_routing' in router_isis_dict['isis'][isis_name]['address_family'][address_family]:
@@ -259,8 +298,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                         ['segment_key'].replace('-', '_')] = m.groupdict()['segment_value']
                     continue
                 
-                # spf prefix-priority critical tag 1000
-                a4 = re.compile(r'^\s*spf\sprefix-priority\s+(?P<tag_key>\S+\stag+)\s+(?P<tag_value>.+)$')
                 m = a4.match(line)
                 if m:
                     if not 'spf_prefix_priority' in router_isis_dict['isis'][isis_name]['address_family'][address_family]:
@@ -269,20 +306,15 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                         ['tag_key'].replace(' ', '_')] = m.groupdict()['tag_value']
                     continue
                 
-                # spf-interval maximum-wait 8000 initial-wait 300 secondary-wait 500
-                a5 = re.compile(r'^\s*spf-interval\s+(?P<spf_interval>.+)$')
                 m = a5.match(line)
                 if m:
                     spf_interval = m.groupdict()['spf_interval']
-                    pattern = re.compile('(\S+-wait)\s([0-9]+)')
                     matches = pattern.findall(spf_interval)
                     spf_interval_pairs = {key.replace('-', '_'):val for key,val in matches}
                     router_isis_dict['isis'][isis_name]['address_family'][address_family]['spf_interval'] = spf_interval_pairs
                     continue
                 
                    
-                # Generic, catch all key/value
-                a9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
                 m = a9.match(line)
                 if m:
                     if is_interface:
@@ -300,8 +332,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 continue
             
             
-            # router isis 65109
-            p1 = re.compile(r'^\s*router\sisis\s+(?P<isis_name>.+)$')
             m = p1.match(line)
             if m:
                 router_isis_dict.setdefault('isis', {})
@@ -312,27 +342,20 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 router_isis_dict['isis'][isis_name]['interfaces'] = {}
                 continue
             
-            # segment-routing global-block 160000 167999
-            p2 = re.compile(r'^\s*segment-routing\s+(?P<segment_routing_key>\S+)\s+(?P<segment_routing_value>.+)$')
             m = p2.match(line)
             if m:
                 router_isis_dict['isis'][isis_name]['segment_routing'][m.groupdict()['segment_routing_key'].replace('-', '_')] = \
                     m.groupdict()['segment_routing_value']
                 continue
             
-            # lsp-gen-interval maximum-wait 8000 initial-wait 1 secondary-wait 250
-            p3 = re.compile(r'^\s*lsp-gen-interval\s+(?P<lsp_gen_interval>.+)$')
             m = p3.match(line)
             if m:
                 lsp_gen_interval = m.groupdict()['lsp_gen_interval']
-                pattern = re.compile('(\S+-wait)\s([0-9]+)')
                 matches = pattern.findall(lsp_gen_interval)
                 lsp_gen_pairs = {key.replace('-', '_'):val for key,val in matches}
                 router_isis_dict['isis'][isis_name]['lsp_gen_interval'] = lsp_gen_pairs
                 continue
             
-            # address-family ipv4 unicast 
-            p4 = re.compile(r'^\s*address-family\s+(?P<address_family>.+)$')
             m = p4.match(line)
             if m:
                 is_address_family = True
@@ -343,8 +366,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     router_isis_dict['isis'][isis_name]['interfaces'][interface]['address_family'] = {address_family: {}}
                 continue
             
-            # interface Bundle-Ether2
-            p5 = re.compile(r'^\s*interface\s+(?P<interface>\S+)\s*$')
             m = p5.match(line)
             if m:
                 is_interface = True
@@ -354,8 +375,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             
             # Parsers for Interface Only
             if is_interface:
-                # interface Bundle-Ether2
-                i1 = re.compile(r'^\s*bfd\s+(?P<bfd_key>\S+)\s+(?P<bfd_value>.+)$')
                 m = i1.match(line)
                 if m:
                     if not 'bfd' in router_isis_dict['isis'][isis_name]['interfaces'][interface]:
@@ -363,9 +382,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     router_isis_dict['isis'][isis_name]['interfaces'][interface]['bfd'][m.groupdict()['bfd_key'].replace('-', '_')] = \
                         m.groupdict()['bfd_value']
                     continue
-                # passive
-                i1 = re.compile(r'^\s*(?P<other>[^\s!]+)\s*$')
-                m = i1.match(line)
+                m = i1_1.match(line)
                 if m:
                     if not 'other' in router_isis_dict['isis'][isis_name]['interfaces'][interface]:
                         router_isis_dict['isis'][isis_name]['interfaces'][interface]['other'] = []
@@ -376,7 +393,6 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             # Generic, catch all key/value
             # Skip if isis_name has not been found yet - skip timestamp value
             if not isis_name == None:
-                p9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
                 m = p9.match(line)
                 if m:
                     if not is_interface:
@@ -62,15 +62,58 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
         af_dict = {}
         rt_type = None
 
+        # VRF VRF1; RD 200:1; VPN ID not set
+        # RD 172.16.94.0:1000
+        p1 = re.compile(r'^VRF +(?P<vrf>[\w\-]+); +'
+                         'RD +(?P<rd>[\w\s\:\<\>\.]+); +'
+                         'VPN +ID +(?P<vpn_id>[\w\s\:]+)$')
+
+        # VRF mode: Regular
+        p2 = re.compile(r'^VRF +mode: +(?P<mode>[\w\-]+)$')
+
+        # Description not set
+        p3 = re.compile(r'^Description *(?P<desc>[\w\:\s\-]+)$')
+
+        # Interfaces:
+        #     GigabitEthernet0/0/0/1
+        p4 = re.compile(r'^Interfaces:$')
+
+        #   GigabitEthernet0/0/0/0.390
+        #   Bundle-Ether15.514
+        p4_1 = re.compile(r'^(?P<intf>([G|g]i.*|[B|b]un.*|'
+                          r'[T|t]en.*|[P|p]o.*|[V|v]lan.*|'
+                          r'[L|l]o.*))$')
+
+        # Address family IPV4 Unicast
+        p5 = re.compile(r'^Address +family +(?P<af>[\w\s]+)$')
+
+        # No Export VPN route-target communities
+        # Export VPN route-target communities:
+        p6 = re.compile(r'^Export +VPN +route\-target communities:$')
+
+        # No import route policy
+        p7 = re.compile(r'^No +import +route +policy$')
+
+        # Import route policy: all-pass
+        p7_1 = re.compile(r'^Import +route +policy: +(?P<route_map>[\w\-]+)$')
+
+        # No export route policy
+        p8 = re.compile(r'^No +export +route +policy$')
+
+        # Export route policy: allpass
+        p8_1 = re.compile(r'^Export +route +policy: +(?P<route_map>[\w\-]+)$')
+
+        # No import VPN route-target communities
+        # Import VPN route-target communities:
+        p6_1 = re.compile(r'^Import +VPN +route\-target +communities:$')
+
+        #     RT:100:1
+        p6_1_1 = re.compile(r'RT: *(?P<rt>[\w\:\.]+)$')
+
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
 
-            # VRF VRF1; RD 200:1; VPN ID not set
-            # RD 172.16.94.0:1000
-            p1 = re.compile(r'^VRF +(?P<vrf>[\w\-]+); +'
-                             'RD +(?P<rd>[\w\s\:\<\>\.]+); +'
-                             'VPN +ID +(?P<vpn_id>[\w\s\:]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -86,32 +129,20 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
 
                 continue
 
-            # VRF mode: Regular
-            p2 = re.compile(r'^VRF +mode: +(?P<mode>[\w\-]+)$')
             m = p2.match(line)
             if m:
                 vrf_dict[vrf]['vrf_mode'] = m.groupdict()['mode'].lower()
                 continue
 
-            # Description not set
-            p3 = re.compile(r'^Description *(?P<desc>[\w\:\s\-]+)$')
             m = p3.match(line)
             if m:
                 vrf_dict[vrf]['description'] = m.groupdict()['desc']
                 continue
 
-            # Interfaces:
-            #     GigabitEthernet0/0/0/1
-            p4 = re.compile(r'^Interfaces:$')
             m = p4.match(line)
             if m:
                 vrf_dict[vrf]['interfaces'] = []
                 continue
-            #   GigabitEthernet0/0/0/0.390
-            #   Bundle-Ether15.514
-            p4_1 = re.compile(r'^(?P<intf>([G|g]i.*|[B|b]un.*|'
-                              r'[T|t]en.*|[P|p]o.*|[V|v]lan.*|'
-                              r'[L|l]o.*))$')
 
             m = p4_1.match(line)
             if m:
@@ -119,8 +150,6 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 vrf_dict[vrf]['interfaces'].append(intf)
                 continue
 
-            # Address family IPV4 Unicast
-            p5 = re.compile(r'^Address +family +(?P<af>[\w\s]+)$')
             m = p5.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
@@ -132,9 +161,6 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 af_dict = vrf_dict[vrf]['address_family'][af]
                 continue
 
-            # No Export VPN route-target communities
-            # Export VPN route-target communities:
-            p6 = re.compile(r'^Export +VPN +route\-target communities:$')
             m = p6.match(line)
             if m:
                 rt_type = 'export'
@@ -142,9 +168,6 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                     af_dict['route_target'] = {}
                 continue
 
-            # No import VPN route-target communities
-            # Import VPN route-target communities:
-            p6_1 = re.compile(r'^Import +VPN +route\-target +communities:$')
             m = p6_1.match(line)
             if m:
                 rt_type = 'import'
@@ -152,9 +175,7 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                     af_dict['route_target'] = {}
                 continue
 
-            #     RT:100:1
-            p6_1 = re.compile(r'RT: *(?P<rt>[\w\:\.]+)$')
-            m = p6_1.match(line)
+            m = p6_1_1.match(line)
             if m and rt_type:
                 rt = m.groupdict()['rt']
                 if rt not in af_dict['route_target']:
@@ -166,15 +187,11 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                     af_dict['route_target'][rt]['rt_type'] = rt_type.strip()
                 continue
 
-            # No import route policy
-            p7 = re.compile(r'^No +import +route +policy$')
             m = p7.match(line)
             if m:
                 rt_type = None
                 continue
 
-            # Import route policy: all-pass
-            p7_1 = re.compile(r'^Import +route +policy: +(?P<route_map>[\w\-]+)$')
             m = p7_1.match(line)
             if m:
                 rt_type = None
@@ -184,15 +201,11 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 continue
 
 
-            # No export route policy
-            p8 = re.compile(r'^No +export +route +policy$')
             m = p8.match(line)
             if m:
                 rt_type = None
                 continue
 
-            # Export route policy: allpass
-            p8_1 = re.compile(r'^Export +route +policy: +(?P<route_map>[\w\-]+)$')
             m = p8_1.match(line)
             if m:
                 rt_type = None
@@ -1004,6 +1004,8 @@ class ShowBgpSummary(ShowBgpSummarySchema):
         parsed_dict = {}
         bgp_info_dict = {'bgp-information': {}}
 
+        special_case_state = re.compile(r'([\d\/]+\s+[\d\/]+)')
+
         for line in out.splitlines():
             line = line.strip()
                 
@@ -1102,8 +1104,6 @@ class ShowBgpSummary(ShowBgpSummarySchema):
                 group = m.groupdict()
                 bgp_peer_dict = {}
 
-                special_case_state = re.compile(r'([\d\/]+\s+[\d\/]+)')
-
                 for key, value in group.items():
                     if key == 'text':
                         bgp_peer_dict['elapsed-time'] = {'#text': value}
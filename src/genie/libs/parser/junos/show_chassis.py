@@ -32,6 +32,10 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, Or)
 
+# Parser
+from genie.libs.parser.utils.validation import ListValidator
+from genie.libs.parser.utils.junos_structured import JunosStructured
+
 class ShowChassisFpcDetailSchema(MetaParser):
 
     schema = {
@@ -64,7 +68,7 @@ class ShowChassisFpcDetailSchema(MetaParser):
 }
 
 
-class ShowChassisFpcDetail(ShowChassisFpcDetailSchema):
+class ShowChassisFpcDetail(ShowChassisFpcDetailSchema, JunosStructured):
     """ Parser for:
     * show chassis fpc detail
     """
@@ -207,7 +211,7 @@ class ShowChassisEnvironmentRoutingEngineSchema(MetaParser):
 }
 
 
-class ShowChassisEnvironmentRoutingEngine(ShowChassisEnvironmentRoutingEngineSchema):
+class ShowChassisEnvironmentRoutingEngine(ShowChassisEnvironmentRoutingEngineSchema, JunosStructured):
     """ Parser for:
     * show chassis environment routing-engine
     """
@@ -273,18 +277,10 @@ class ShowChassisFirmwareSchema(MetaParser):
     }
 } """
 
-    def validate_chassis_firmware_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('firmware is not a list')
-        chassis_firmware_schema = Schema({
-            "firmware-version": str,
-                        "type": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_firmware_schema.validate(item)
-        return value
+    validate_chassis_firmware_list = ListValidator({
+        "firmware-version": str,
+                    "type": str
+    }, 'firmware is not a list')
 
     schema = {
         "firmware-information": {
@@ -299,7 +295,7 @@ class ShowChassisFirmwareSchema(MetaParser):
         }
     }
 
-class ShowChassisFirmware(ShowChassisFirmwareSchema):
+class ShowChassisFirmware(ShowChassisFirmwareSchema, JunosStructured):
     """ Parser for:
     * show chassis firmware
     """
@@ -528,7 +524,7 @@ class ShowChassisHardwareSchema(MetaParser):
         }
     }
 
-class ShowChassisHardware(ShowChassisHardwareSchema):
+class ShowChassisHardware(ShowChassisHardwareSchema, JunosStructured):
     """ Parser for:
     * show chassis hardware
     """
@@ -822,162 +818,81 @@ class ShowChassisHardwareDetailSchema(MetaParser):
     # ------------------------------------------------------
     # Optional("chassis-re-dimm-module")
     # ------------------------------------------------------
-    def validate_chassis_re_dimm_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('chassis re dimm is not a list')
-
-        chassis_re_dimm_schema = Schema(
-           {"die-rev": str,
-            "mfr-id": str,
-            "name": str,
-            "part-number": str,
-            "pcb-rev": str,}
-        )
-
-        # Validate each dictionary in list
-        for item in value:
-            chassis_re_dimm_schema.validate(item)
-        return value
+    validate_chassis_re_dimm_list = ListValidator({
+        "die-rev": str,
+        "mfr-id": str,
+        "name": str,
+        "part-number": str,
+        "pcb-rev": str,
+    }, 'chassis re dimm is not a list')
 
     # ------------------------------------------------------
     # Optional("chassis-re-disk-module")
     # ------------------------------------------------------
-    def validate_chassis_re_disk_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('chassis re disk is not a list')
-
-        chassis_re_disk_schema = Schema(
-            {
-                "description": str,
-                "disk-size": str,
-                "model": str,
-                "name": str,
-                "serial-number": str
-            }
-        )
-
-        # Validate each dictionary in list
-        for item in value:
-            chassis_re_disk_schema.validate(item)
-        return value        
+    validate_chassis_re_disk_list = ListValidator({
+        "description": str,
+        "disk-size": str,
+        "model": str,
+        "name": str,
+        "serial-number": str
+    }, 'chassis re disk is not a list')
 
     # ------------------------------------------------------
     # Optional("chassis-re-usb-module")
     # ------------------------------------------------------
-    def validate_chassis_re_usb_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('chassis re usb is not a list')
+    validate_chassis_re_usb_list = ListValidator({
+        Optional("description"): str,
+        "name": str,
+        "product": str,
+        "product-number": str,
+        "vendor": str,
+    }, 'chassis re usb is not a list')
 
-        chassis_re_usb_schema = Schema(
-            {
-                Optional("description"): str,
-                "name": str,
-                "product": str,
-                "product-number": str,
-                "vendor": str,
-            }
-        )
+    # ------------------------------------------------------
+    # Optional("chassis-sub-sub-sub-module")
+    # ------------------------------------------------------
+    validate_chassis_sub_sub_sub_module_list = ListValidator({
+        Optional("description"): str,
+        Optional("name"): str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("version"): str
+    }, 'inner chassis sub sub sub module is not a list')
 
-        # Validate each dictionary in list
-        for item in value:
-            chassis_re_usb_schema.validate(item)
-        return value         
+    # ------------------------------------------------------
+    # Optional("chassis-sub-sub-module")
+    # ------------------------------------------------------
+    validate_chassis_sub_sub_module_list = ListValidator({
+        Optional("description"): str,
+        Optional("name"): str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("chassis-sub-sub-sub-module"): Use(validate_chassis_sub_sub_sub_module_list)
+    }, 'inner chassis sub sub module is not a list')
 
     # ------------------------------------------------------
     # Optional("chassis-sub-module")
     # ------------------------------------------------------
-    def validate_chassis_sub_module_list(value):
-        
-        # ------------------------------------------------------
-        # Optional("chassis-sub-sub-sub-module")
-        # ------------------------------------------------------
-        def validate_chassis_sub_sub_sub_module_list(value):
-            # Pass list as value
-            if not isinstance(value, list):
-                raise SchemaError('inner chassis sub sub sub module is not a list')
-
-            chassis_sub_sub_sub_module_schema = Schema(
-                            {
-                                Optional("description"): str,
-                                Optional("name"): str,
-                                Optional("part-number"): str,
-                                Optional("serial-number"): str,
-                                Optional("version"): str
-                            }
-                        )
-            # Validate each dictionary in list
-            for item in value:
-                chassis_sub_sub_sub_module_schema.validate(item)
-            return value
-        
-
-        # Pass list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis sub sub sub module is not a list')
-
-        # ------------------------------------------------------
-        # Optional("chassis-sub-sub-module")
-        # ------------------------------------------------------
-        def validate_chassis_sub_sub_module_list(value):
-            # Pass list as value
-            if not isinstance(value, list):
-                raise SchemaError('inner chassis sub sub module is not a list')
-
-            chassis_sub_sub_module_schema = Schema(
-                            {
-                                Optional("description"): str,
-                                Optional("name"): str,
-                                Optional("part-number"): str,
-                                Optional("serial-number"): str,
-                                Optional("chassis-sub-sub-sub-module"): Use(validate_chassis_sub_sub_sub_module_list)
-                            },
-                        )
-            # Validate each dictionary in list
-            for item in value:
-                chassis_sub_sub_module_schema.validate(item)
-            return value
-        
-
-        # Pass list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis sub sub module is not a list')
-
-        chassis_sub_module_schema = Schema(
-                        {
-                            Optional("chassis-sub-sub-module"): Use(validate_chassis_sub_sub_module_list),
-                            Optional("description"): str,
-                            Optional("name"): str,
-                            Optional("part-number"): str,
-                            Optional("serial-number"): str,
-                            Optional("version"): str
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            chassis_sub_module_schema.validate(item)
-        return value
-
-
-    def validate_chassis_hardware_detail_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('chassis module is not a list')
-        chassis_hardware_detail_schema = Schema({
-            Optional("chassis-re-dimm-module"): Use(ShowChassisHardwareDetail.validate_chassis_re_dimm_list),
-            Optional("chassis-re-disk-module"): Use(ShowChassisHardwareDetail.validate_chassis_re_disk_list),
-            Optional("chassis-re-usb-module"): Use(ShowChassisHardwareDetail.validate_chassis_re_usb_list),
-            Optional("chassis-sub-module"): Use(ShowChassisHardwareDetail.validate_chassis_sub_module_list),
-            Optional("description"): str,
-            Optional("name"): str,
-            Optional("part-number"): str,
-            Optional("serial-number"): str,
-            Optional("version"): str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_hardware_detail_schema.validate(item)
-        return value
+    validate_chassis_sub_module_list = ListValidator({
+        Optional("chassis-sub-sub-module"): Use(validate_chassis_sub_sub_module_list),
+        Optional("description"): str,
+        Optional("name"): str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("version"): str
+    }, 'inner chassis sub sub sub module is not a list')
+
+    validate_chassis_hardware_detail_list = ListValidator({
+        Optional("chassis-re-dimm-module"): Use(validate_chassis_re_dimm_list),
+        Optional("chassis-re-disk-module"): Use(validate_chassis_re_disk_list),
+        Optional("chassis-re-usb-module"): Use(validate_chassis_re_usb_list),
+        Optional("chassis-sub-module"): Use(validate_chassis_sub_module_list),
+        Optional("description"): str,
+        Optional("name"): str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("version"): str,
+    }, 'chassis module is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -993,7 +908,7 @@ class ShowChassisHardwareDetailSchema(MetaParser):
         }
     }
 
-class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
+class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema, JunosStructured):
     """ Parser for:
     * show chassis hardware detail
     """
@@ -1386,81 +1301,62 @@ class ShowChassisHardwareExtensiveSchema(MetaParser):
     }
 }"""
 
-    def validate_inner_chassis_hardware_detail_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis module is not a list')
-        chassis_inner_hardware_schema = Schema(
-                        {
-                            Optional("chassis-sub-sub-module"): {
-                                "description": str,
-                                "name": str,
-                                "part-number": str,
-                                "serial-number": str
-                            },
-                            Optional("description"): str,
-                            Optional("i2c-information"): {
-                            "assembly-flags": str,
-                            "assembly-identifier": str,
-                            "assembly-version": str,
-                            "board-information-record": str,
-                            "eeprom-version": str,
-                            Optional("i2c-data"): list,
-                            Optional("i2c-identifier"): Or(str, None),
-                            "i2c-version": Or(str, None),
-                            "jedec-code": str,
-                            "manufacture-date": str,
-                            "part-number": Or(str, None),
-                            Optional("serial-number"): Or(str,None)
-                        },
-                            "name": str,
-                            Optional("part-number"): str,
-                            Optional("serial-number"): str,
-                            Optional("version"): str
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            chassis_inner_hardware_schema.validate(item)
-        return value
-
-
-    def validate_chassis_hardware_extensive_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('chassis module is not a list')
-        chassis_hardware_detail_schema = Schema({
-            Optional("chassis-re-disk-module"): {
-                        "description": str,
-                        "disk-size": str,
-                        "model": str,
-                        "name": str,
-                        "serial-number": str
-                    },
-            Optional("chassis-sub-module"): Use(ShowChassisHardwareExtensive.validate_inner_chassis_hardware_detail_list),
+    validate_inner_chassis_hardware_detail_list = ListValidator({
+            Optional("chassis-sub-sub-module"): {
+                "description": str,
+                "name": str,
+                "part-number": str,
+                "serial-number": str
+            },
             Optional("description"): str,
             Optional("i2c-information"): {
-                "assembly-flags": str,
-                "assembly-identifier": str,
-                "assembly-version": str,
-                "board-information-record": str,
-                "eeprom-version": str,
-                Optional("i2c-data"): list,
-                Optional("i2c-identifier"): Or(str, None),
-                "i2c-version": Or(str, None),
-                "jedec-code": str,
-                "manufacture-date": str,
-                "part-number": Or(str, None),
-                Optional("serial-number"): Or(str,None)
-            },
+            "assembly-flags": str,
+            "assembly-identifier": str,
+            "assembly-version": str,
+            "board-information-record": str,
+            "eeprom-version": str,
+            Optional("i2c-data"): list,
+            Optional("i2c-identifier"): Or(str, None),
+            "i2c-version": Or(str, None),
+            "jedec-code": str,
+            "manufacture-date": str,
+            "part-number": Or(str, None),
+            Optional("serial-number"): Or(str,None)
+        },
             "name": str,
-            Optional("serial-number"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_hardware_detail_schema.validate(item)
-        return value
+            Optional("part-number"): str,
+            Optional("serial-number"): str,
+            Optional("version"): str
+    }, 'inner chassis module is not a list')
+
+
+    validate_chassis_hardware_extensive_list = ListValidator({
+        Optional("chassis-re-disk-module"): {
+                    "description": str,
+                    "disk-size": str,
+                    "model": str,
+                    "name": str,
+                    "serial-number": str
+                },
+        Optional("chassis-sub-module"): Use(validate_inner_chassis_hardware_detail_list),
+        Optional("description"): str,
+        Optional("i2c-information"): {
+            "assembly-flags": str,
+            "assembly-identifier": str,
+            "assembly-version": str,
+            "board-information-record": str,
+            "eeprom-version": str,
+            Optional("i2c-data"): list,
+            Optional("i2c-identifier"): Or(str, None),
+            "i2c-version": Or(str, None),
+            "jedec-code": str,
+            "manufacture-date": str,
+            "part-number": Or(str, None),
+            Optional("serial-number"): Or(str,None)
+        },
+        "name": str,
+        Optional("serial-number"): str
+    }, 'chassis module is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -1490,7 +1386,7 @@ class ShowChassisHardwareExtensiveSchema(MetaParser):
         }
     }
 
-class ShowChassisHardwareExtensive(ShowChassisHardwareExtensiveSchema):
+class ShowChassisHardwareExtensive(ShowChassisHardwareExtensiveSchema, JunosStructured):
     """ Parser for:
     * show chassis hardware extensive
     """
@@ -1926,31 +1822,23 @@ class ShowChassisFpcSchema(MetaParser):
     """
     
 
-    def validate_chassis_fpc_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('fpc is not a list')
-        chassis_fpc_schema = Schema({
-                Optional("cpu-15min-avg"): str,
-                Optional("cpu-1min-avg"): str,
-                Optional("cpu-5min-avg"): str,
-                Optional("cpu-interrupt"): str,
-                Optional("cpu-total"): str,
-                Optional("memory-buffer-utilization"): str,
-                Optional("memory-dram-size"): str,
-                Optional("memory-heap-utilization"): str,
-                Optional("comment"): str,
-                "slot": str,
-                "state": str,
-                Optional("temperature"): {
-                    "#text": str,
-                    Optional("@junos:celsius"): str
-                }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_fpc_schema.validate(item)
-        return value
+    validate_chassis_fpc_list = ListValidator({
+        Optional("cpu-15min-avg"): str,
+        Optional("cpu-1min-avg"): str,
+        Optional("cpu-5min-avg"): str,
+        Optional("cpu-interrupt"): str,
+        Optional("cpu-total"): str,
+        Optional("memory-buffer-utilization"): str,
+        Optional("memory-dram-size"): str,
+        Optional("memory-heap-utilization"): str,
+        Optional("comment"): str,
+        "slot": str,
+        "state": str,
+        Optional("temperature"): {
+            "#text": str,
+            Optional("@junos:celsius"): str
+        }
+    }, 'fpc is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -1961,7 +1849,7 @@ class ShowChassisFpcSchema(MetaParser):
         }
     }
 
-class ShowChassisFpc(ShowChassisFpcSchema):
+class ShowChassisFpc(ShowChassisFpcSchema, JunosStructured):
     """ Parser for:
     * show chassis fpc
     """
@@ -2115,68 +2003,60 @@ class ShowChassisRoutingEngineSchema(MetaParser):
     }
 
 
-    def validate_chassis_routing_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('routing engine is not a list')
-        chassis_routing_schema = Schema({
-                Optional("cpu-background"): str,
-                Optional("cpu-background-5sec"): str,
-                Optional("cpu-background-1min"): str,
-                Optional("cpu-background-5min"): str,
-                Optional("cpu-background-15min"): str,
-                Optional("cpu-idle"): str,
-                Optional("cpu-idle-5sec"): str,
-                Optional("cpu-idle-1min"): str,
-                Optional("cpu-idle-5min"): str,
-                Optional("cpu-idle-15min"): str,
-                Optional("cpu-interrupt"): str,
-                Optional("cpu-interrupt-5sec"): str,
-                Optional("cpu-interrupt-1min"): str,
-                Optional("cpu-interrupt-5min"): str,
-                Optional("cpu-interrupt-15min"): str,
-                Optional("cpu-system"): str,
-                Optional("cpu-system-5sec"): str,
-                Optional("cpu-system-1min"): str,
-                Optional("cpu-system-5min"): str,
-                Optional("cpu-system-15min"): str,
-                Optional("cpu-temperature"):{
-                    "#text": str
-                },
-                Optional("cpu-user"): str,
-                Optional("cpu-user-5sec"): str,
-                Optional("cpu-user-1min"): str,
-                Optional("cpu-user-5min"): str,
-                Optional("cpu-user-15min"): str,
-                Optional("last-reboot-reason"): str,
-                Optional("load-average-fifteen"): str,
-                Optional("load-average-five"): str,
-                Optional("load-average-one"): str,
-                Optional("mastership-priority"): str,
-                "mastership-state": str,
-                Optional("memory-buffer-utilization"): str,
-                Optional("memory-dram-size"): str,
-                Optional("memory-installed-size"): str,
-                Optional("model"): str,
-                Optional("serial-number"): str,
-                "slot": str,
-                Optional("start-time"): {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                Optional("status"): str,
-                Optional("temperature"):{
-                    "#text": str
-                },
-                Optional("up-time"): {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                    }
-            })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_routing_schema.validate(item)
-        return value
+    validate_chassis_routing_list = ListValidator({
+        Optional("cpu-background"): str,
+        Optional("cpu-background-5sec"): str,
+        Optional("cpu-background-1min"): str,
+        Optional("cpu-background-5min"): str,
+        Optional("cpu-background-15min"): str,
+        Optional("cpu-idle"): str,
+        Optional("cpu-idle-5sec"): str,
+        Optional("cpu-idle-1min"): str,
+        Optional("cpu-idle-5min"): str,
+        Optional("cpu-idle-15min"): str,
+        Optional("cpu-interrupt"): str,
+        Optional("cpu-interrupt-5sec"): str,
+        Optional("cpu-interrupt-1min"): str,
+        Optional("cpu-interrupt-5min"): str,
+        Optional("cpu-interrupt-15min"): str,
+        Optional("cpu-system"): str,
+        Optional("cpu-system-5sec"): str,
+        Optional("cpu-system-1min"): str,
+        Optional("cpu-system-5min"): str,
+        Optional("cpu-system-15min"): str,
+        Optional("cpu-temperature"):{
+            "#text": str
+        },
+        Optional("cpu-user"): str,
+        Optional("cpu-user-5sec"): str,
+        Optional("cpu-user-1min"): str,
+        Optional("cpu-user-5min"): str,
+        Optional("cpu-user-15min"): str,
+        Optional("last-reboot-reason"): str,
+        Optional("load-average-fifteen"): str,
+        Optional("load-average-five"): str,
+        Optional("load-average-one"): str,
+        Optional("mastership-priority"): str,
+        "mastership-state": str,
+        Optional("memory-buffer-utilization"): str,
+        Optional("memory-dram-size"): str,
+        Optional("memory-installed-size"): str,
+        Optional("model"): str,
+        Optional("serial-number"): str,
+        "slot": str,
+        Optional("start-time"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("status"): str,
+        Optional("temperature"):{
+            "#text": str
+        },
+        Optional("up-time"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+            }
+    }, 'routing engine is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -2188,7 +2068,7 @@ class ShowChassisRoutingEngineSchema(MetaParser):
     }
    
 
-class ShowChassisRoutingEngine(ShowChassisRoutingEngineSchema):
+class ShowChassisRoutingEngine(ShowChassisRoutingEngineSchema, JunosStructured):
     """ Parser for:
     * show chassis routing-engine
     """
@@ -2451,24 +2331,16 @@ class ShowChassisRoutingEngineNoForwarding(ShowChassisRoutingEngine):
         
 class ShowChassisEnvironmentSchema(MetaParser):
 
-    def validate_environment_item_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('environment-item is not a list')        
-        
-        environment_item_schema = Schema({
-            Optional('class'): str,
-            Optional('comment'): str,
-            'name': str,
-            'status': str,
-            Optional('temperature'): {
-                '#text': str,
-                '@junos:celsius': str,
-            }
-        })
-
-        for item in value:
-            environment_item_schema.validate(item)
-        return value
+    validate_environment_item_list = ListValidator({
+        Optional('class'): str,
+        Optional('comment'): str,
+        'name': str,
+        'status': str,
+        Optional('temperature'): {
+            '#text': str,
+            '@junos:celsius': str,
+        }
+    }, 'environment-item is not a list')
 
     schema = {
         'environment-information': {
@@ -2476,7 +2348,7 @@ class ShowChassisEnvironmentSchema(MetaParser):
         }
     }
 
-class ShowChassisEnvironment(ShowChassisEnvironmentSchema):
+class ShowChassisEnvironment(ShowChassisEnvironmentSchema, JunosStructured):
     """Parser for show chassis environment"""
 
     cli_command = 'show chassis environment'
@@ -2594,59 +2466,31 @@ class ShowChassisEnvironmentFpcSchema(MetaParser):
     }
     '''
 
-    def validate_environment_item_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('environment-item is not a list')        
-        
-        def validate_voltage_list(value):
-            if not isinstance(value, list):
-                raise SchemaError("voltage is not a list")
-
-            voltage_schema = Schema(
-                {
-                    "actual-voltage": str,
-                    "reference-voltage": str,
-                }
-            )
-
-            for item in value:
-                voltage_schema.validate(item)    
-            return value
-
-        def valivalidate_temp_reading_list(value):
-            if not isinstance(value, list):
-                raise SchemaError("temperature reading is not a list")
-
-            temp_reading_schema = Schema(
-                {
-                    "temperature": {
-                        "#text": str,
-                        "@junos:celsius": str,
-                    },
-                    "temperature-name": str,
-                }
-            )
-
-            for item in value:
-                temp_reading_schema.validate(item)    
-            return value
+    validate_voltage_list = ListValidator({
+        "actual-voltage": str,
+        "reference-voltage": str,
+    }, 'voltage is not a list')
 
-        environment_item_schema = Schema({
-            "name": str,
-            Optional("power-information"): {
-                "power-title": {
-                    "power-type": str
-                },
-                "voltage": Use(validate_voltage_list),
+    valivalidate_temp_reading_list = ListValidator({
+        "temperature": {
+            "#text": str,
+            "@junos:celsius": str,
+        },
+        "temperature-name": str,
+    }, 'temperature reading is not a list')
+
+    validate_environment_item_list = ListValidator({
+        "name": str,
+        Optional("power-information"): {
+            "power-title": {
+                "power-type": str
             },
-            Optional("slave-revision"): str,
-            "state": str,
-            "temperature-reading": Use(valivalidate_temp_reading_list),
-        })
-
-        for item in value:
-            environment_item_schema.validate(item)
-        return value
+            "voltage": Use(validate_voltage_list),
+        },
+        Optional("slave-revision"): str,
+        "state": str,
+        "temperature-reading": Use(valivalidate_temp_reading_list),
+    }, 'environment-item is not a list')
 
     schema = {
         'environment-component-information': {
@@ -2655,7 +2499,7 @@ class ShowChassisEnvironmentFpcSchema(MetaParser):
     }
 
 
-class ShowChassisEnvironmentFpc(ShowChassisEnvironmentFpcSchema):
+class ShowChassisEnvironmentFpc(ShowChassisEnvironmentFpcSchema, JunosStructured):
     '''Parser for show chassis environment fpc'''
 
     cli_command = 'show chassis environment fpc'
@@ -2803,22 +2647,15 @@ class ShowChassisAlarmsSchema(MetaParser):
     #     },
     # }
 
-    def validate_alarm_detail(value):
-        if not isinstance(value, list):
-            raise SchemaError('alarm-detail is not a list')
-        alarm_detail_schema = Schema({
-                "alarm-class": str,
-                "alarm-description": str,
-                "alarm-short-description": str,
-                "alarm-time": {
-                    "#text": str,
-                },
-                "alarm-type": str
-            })
-
-        for item in value:
-            alarm_detail_schema.validate(item)
-        return value
+    validate_alarm_detail = ListValidator({
+        "alarm-class": str,
+        "alarm-description": str,
+        "alarm-short-description": str,
+        "alarm-time": {
+            "#text": str,
+        },
+        "alarm-type": str
+    }, 'alarm-detail is not a list')
 
     schema = {
         "alarm-information": {
@@ -2830,7 +2667,7 @@ class ShowChassisAlarmsSchema(MetaParser):
         },
     }
 
-class ShowChassisAlarms(ShowChassisAlarmsSchema):
+class ShowChassisAlarms(ShowChassisAlarmsSchema, JunosStructured):
     """Parser for show chassis alarms"""
     cli_command = 'show chassis alarms'
 
@@ -2937,19 +2774,11 @@ class ShowChassisFabricSummarySchema(MetaParser):
             }
         }"""
 
-    def validate_chassis_fm_state(value):
-        # Pass fm-state-item
-        if not isinstance(value, list):
-            raise SchemaError('fm-state-item is not a list')
-        chassis_routing_schema = Schema({
-                "plane-slot": str,
-                "state": str,
-                Optional("up-time"): str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_routing_schema.validate(item)
-        return value
+    validate_chassis_fm_state = ListValidator({
+        "plane-slot": str,
+        "state": str,
+        Optional("up-time"): str
+    }, 'fm-state-item is not a list')
 
     schema = {
     "fm-state-information": {
@@ -2957,7 +2786,7 @@ class ShowChassisFabricSummarySchema(MetaParser):
         }
     }
 
-class ShowChassisFabricSummary(ShowChassisFabricSummarySchema):
+class ShowChassisFabricSummary(ShowChassisFabricSummarySchema, JunosStructured):
     """ Parser for:
     * show chassis fabric summary
     """
@@ -3017,22 +2846,14 @@ class ShowChassisFabricPlaneSchema(MetaParser):
         }
     }"""
 
-    def validate_chassis_fm_state(value):
-        # Pass fm-state-item
-        if not isinstance(value, list):
-            raise SchemaError('routing engine is not a list')
-        chassis_routing_schema = Schema({
-                "fru-name": list,
-                "fru-slot": list,
-                "pfe-link-status": list,
-                "pfe-slot": list,
-                "slot": str,
-                "state": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_routing_schema.validate(item)
-        return value
+    validate_chassis_fm_state = ListValidator({
+        "fru-name": list,
+        "fru-slot": list,
+        "pfe-link-status": list,
+        "pfe-slot": list,
+        "slot": str,
+        "state": str
+    }, 'routing engine is not a list')
 
     schema = {
     "fm-plane-state-information": {
@@ -3040,7 +2861,7 @@ class ShowChassisFabricPlaneSchema(MetaParser):
         }
     }
 
-class ShowChassisFabricPlane(ShowChassisFabricPlaneSchema):
+class ShowChassisFabricPlane(ShowChassisFabricPlaneSchema, JunosStructured):
     """ Parser for:
     * show chassis fabric plane
     """
@@ -3123,51 +2944,35 @@ class ShowChassisFabricPlane(ShowChassisFabricPlaneSchema):
     * show chassis power
 """
 class ShowChassisPowerSchema(MetaParser):
-    def validate_power_usage_item(value):
-        if not isinstance(value, list):
-            raise SchemaError('power-usage-item is not a list')        
-        
-        power_usage_item_schema = Schema({
-            "dc-input-detail2": {
-                Optional("dc-input-status"): str,
-                Optional("str-dc-actual-feed"): str,
-                Optional("str-dc-expect-feed"): str
-            },
-            "dc-output-detail2": {
-                "str-dc-current": str,
-                "str-dc-load": str,
-                "str-dc-power": str,
-                "str-dc-voltage": str,
-                "str-zone": str
-            },
-            "name": str,
-            "pem-capacity-detail": {
-                "capacity-actual": str,
-                "capacity-max": str
-            },
-            "state": str
-        })
-
-        for item in value:
-            power_usage_item_schema.validate(item)
-        return value
-    
-    def validate_power_usage_zone_information_item(value):
-        if not isinstance(value, list):
-            raise SchemaError('power-usage-zone-information is not a list')        
-        
-        power_usage_zone_information_schema = Schema({
-            "capacity-actual": str,
-            "capacity-actual-usage": str,
-            "capacity-allocated": str,
-            "capacity-max": str,
-            "capacity-remaining": str,
+    validate_power_usage_item = ListValidator({
+        "dc-input-detail2": {
+            Optional("dc-input-status"): str,
+            Optional("str-dc-actual-feed"): str,
+            Optional("str-dc-expect-feed"): str
+        },
+        "dc-output-detail2": {
+            "str-dc-current": str,
+            "str-dc-load": str,
+            "str-dc-power": str,
+            "str-dc-voltage": str,
             "str-zone": str
-        })
-
-        for item in value:
-            power_usage_zone_information_schema.validate(item)
-        return value
+        },
+        "name": str,
+        "pem-capacity-detail": {
+            "capacity-actual": str,
+            "capacity-max": str
+        },
+        "state": str
+    }, 'power-usage-item is not a list')
+    
+    validate_power_usage_zone_information_item = ListValidator({
+        "capacity-actual": str,
+        "capacity-actual-usage": str,
+        "capacity-allocated": str,
+        "capacity-max": str,
+        "capacity-remaining": str,
+        "str-zone": str
+    }, 'power-usage-zone-information is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -3182,7 +2987,7 @@ class ShowChassisPowerSchema(MetaParser):
         }
     }
 
-class ShowChassisPower(ShowChassisPowerSchema):
+class ShowChassisPower(ShowChassisPowerSchema, JunosStructured):
     """ Parser for:
     * show chassis power
     """
@@ -3351,38 +3156,18 @@ class ShowChassisFpcPicStatusSchema(MetaParser):
     """
 
     # Validate fpc
-    def validate_fpc(value):
-
-        if not isinstance(value, list):
-            raise SchemaError('fpc is not a list')
-        
-        # Validate pic 
-        def validate_pic(value):
-            if not isinstance(value, list):
-                raise SchemaError('pic is not a list')
-
-            pic_schema = Schema({
-                "pic-slot": str,
-                "pic-state": str,
-                "pic-type": str,
-            })
-
-            for item in value:
-                pic_schema.validate(item)
-            return value
-
-        fpc_schema = Schema(
-            {
-                    "description": str,
-                    "slot": str,
-                    "state": str,
-                    "pic": Use(validate_pic)
-                }
-        )
-
-        for item in value:
-            fpc_schema.validate(item)
-        return value
+    validate_pic = ListValidator({
+        "pic-slot": str,
+        "pic-state": str,
+        "pic-type": str,
+    }, 'pic is not a list')
+
+    validate_fpc = ListValidator({
+        "description": str,
+        "slot": str,
+        "state": str,
+        "pic": Use(validate_pic)
+    }, 'fpc is not a list')
 
     schema = {
         "fpc-information": {
@@ -3394,7 +3179,7 @@ class ShowChassisFpcPicStatusSchema(MetaParser):
 Parser for:
     * show chassis fpc pic-status
 """
-class ShowChassisFpcPicStatus(ShowChassisFpcPicStatusSchema):
+class ShowChassisFpcPicStatus(ShowChassisFpcPicStatusSchema, JunosStructured):
     cli_command = 'show chassis fpc pic-status'
 
     def cli(self, output=None):
@@ -3467,71 +3252,47 @@ class ShowChassisEnvironmentComponentSchema(MetaParser):
     """ Schema for:
             * show chassis environment {component}
     """
-    def validate_temperature_reading_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('environment-component-item is not a list')
-        env_schema = Schema({
-                        "temperature": {
-                            "#text": str,
-                            Optional("@junos:celsius"): str
-                        },
-                        "temperature-name": str
-                    })
-        # Validate each dictionary in list
-        for item in value:
-            env_schema.validate(item)
-        return value
+    validate_temperature_reading_list = ListValidator({
+        "temperature": {
+            "#text": str,
+            Optional("@junos:celsius"): str
+        },
+        "temperature-name": str
+    }, 'environment-component-item is not a list')
     
-    def validate_voltage_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('environment-component-item is not a list')
-        env_schema = Schema({
-                            "actual-voltage": str,
-                            "reference-voltage": str
-                        })
-        # Validate each dictionary in list
-        for item in value:
-            env_schema.validate(item)
-        return value
+    validate_voltage_list = ListValidator({
+        "actual-voltage": str,
+        "reference-voltage": str
+    }, 'environment-component-item is not a list')
     
-    def validate_environment_component_item_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('environment-component-item is not a list')
-        env_schema = Schema({
-                "name": str,
-                "state": str,
-                Optional("bus-revision"): str,
-                Optional("fpga-revision"): str,
-                Optional("power-information"): {
-                    Optional("power-title"): {
-                        "power-type": str
-                    },
-                    Optional("psm-hours-used"): str,
-                    Optional("voltage"): Use(ShowChassisEnvironmentComponentSchema.validate_voltage_list)
-                },
-                Optional("dc-information"): {
-                    "dc-detail": {
-                        "str-dc-current": str,
-                        "str-dc-load": str,
-                        "str-dc-power": str,
-                        "str-dc-voltage": str
-                    },
-                    "dc-feed0-current": str,
-                    "dc-feed0-power": str,
-                    "dc-feed0-voltage": str,
-                    "dc-feed1-current": str,
-                    "dc-feed1-power": str,
-                    "dc-feed1-voltage": str
-                },
-                Optional("temperature-reading"): Use(ShowChassisEnvironmentComponentSchema.validate_temperature_reading_list)
-            })
-        # Validate each dictionary in list
-        for item in value:
-            env_schema.validate(item)
-        return value
+    validate_environment_component_item_list = ListValidator({
+        "name": str,
+        "state": str,
+        Optional("bus-revision"): str,
+        Optional("fpga-revision"): str,
+        Optional("power-information"): {
+            Optional("power-title"): {
+                "power-type": str
+            },
+            Optional("psm-hours-used"): str,
+            Optional("voltage"): Use(validate_voltage_list)
+        },
+        Optional("dc-information"): {
+            "dc-detail": {
+                "str-dc-current": str,
+                "str-dc-load": str,
+                "str-dc-power": str,
+                "str-dc-voltage": str
+            },
+            "dc-feed0-current": str,
+            "dc-feed0-power": str,
+            "dc-feed0-voltage": str,
+            "dc-feed1-current": str,
+            "dc-feed1-power": str,
+            "dc-feed1-voltage": str
+        },
+        Optional("temperature-reading"): Use(validate_temperature_reading_list)
+    }, 'environment-component-item is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -3543,7 +3304,7 @@ class ShowChassisEnvironmentComponentSchema(MetaParser):
     }
 
 
-class ShowChassisEnvironmentComponent(ShowChassisEnvironmentComponentSchema):
+class ShowChassisEnvironmentComponent(ShowChassisEnvironmentComponentSchema, JunosStructured):
     """ Parser for:
             * show chassis environment {component}
     """
@@ -3751,21 +3512,15 @@ class ShowChassisPicFpcSlotPicSlotSchema(MetaParser):
     '''
 
     # validate 'port'
-    def validate_port(value):
-        if not isinstance(value, list):
-            raise SchemaError('Port is not a list')
-        port_schema = Schema({
-                        "cable-type": str,
-                        "fiber-mode": str,
-                        "port-number": str,
-                        "sfp-vendor-fw-ver": str,
-                        "sfp-vendor-name": str,
-                        "sfp-vendor-pno": str,
-                        "wavelength": str,
-                    })
-        for item in value:
-            port_schema.validate(item)
-        return value
+    validate_port = ListValidator({
+        "cable-type": str,
+        "fiber-mode": str,
+        "port-number": str,
+        "sfp-vendor-fw-ver": str,
+        "sfp-vendor-name": str,
+        "sfp-vendor-pno": str,
+        "wavelength": str,
+    }, 'Port is not a list')
 
     # main schema
     schema = {
@@ -3791,7 +3546,7 @@ class ShowChassisPicFpcSlotPicSlotSchema(MetaParser):
 
 
 # Parser for show chassis pic fpc-slot {fpc-slot} pic-slot {pic-slot}        
-class ShowChassisPicFpcSlotPicSlot(ShowChassisPicFpcSlotPicSlotSchema):
+class ShowChassisPicFpcSlotPicSlot(ShowChassisPicFpcSlotPicSlotSchema, JunosStructured):
     """
     Parser for 
         * show chassis pic fpc-slot {fpc-slot} pic-slot {pic-slot}        
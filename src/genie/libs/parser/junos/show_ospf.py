@@ -42,6 +42,10 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or)
 
+# Parser
+from genie.libs.parser.utils.validation import ListValidator
+from genie.libs.parser.utils.junos_structured import JunosStructured
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -412,20 +416,14 @@ class ShowOspfNeighborSchema(MetaParser):
         }
     }
     '''
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            'neighbor-address': str,
-            'interface-name': str,
-            'ospf-neighbor-state': str,
-            'neighbor-id': str,
-            'neighbor-priority': str,
-            'activity-timer': str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_list = ListValidator({
+        'neighbor-address': str,
+        'interface-name': str,
+        'ospf-neighbor-state': str,
+        'neighbor-id': str,
+        'neighbor-priority': str,
+        'activity-timer': str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-neighbor-information': {
@@ -440,7 +438,7 @@ Parser for:
 '''
 
 
-class ShowOspfNeighbor(ShowOspfNeighborSchema):
+class ShowOspfNeighbor(ShowOspfNeighborSchema, JunosStructured):
     cli_command = ['show ospf neighbor', 'show ospf neighbor instance {name}']
 
     def cli(self, name=None, output=None):
@@ -530,20 +528,14 @@ class ShowOspfNeighborInstanceAllSchema(MetaParser):
     }
     '''
 
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            'neighbor-address': str,
-            'interface-name': str,
-            'ospf-neighbor-state': str,
-            'neighbor-id': str,
-            'neighbor-priority': str,
-            'activity-timer': str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_list = ListValidator({
+        'neighbor-address': str,
+        'interface-name': str,
+        'ospf-neighbor-state': str,
+        'neighbor-id': str,
+        'neighbor-priority': str,
+        'activity-timer': str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-neighbor-information-all': {
@@ -561,7 +553,7 @@ Parser for:
 '''
 
 
-class ShowOspfNeighborInstanceAll(ShowOspfNeighborInstanceAllSchema):
+class ShowOspfNeighborInstanceAll(ShowOspfNeighborInstanceAllSchema, JunosStructured):
     cli_command = 'show ospf neighbor instance all'
 
     def cli(self, output=None):
@@ -639,23 +631,17 @@ class ShowOspfDatabaseSchema(MetaParser):
     }
 }
     '''
-    def validate_neighbor_database_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional('our-entry'): bool,
-            "sequence-number": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_database_list = ListValidator({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional('our-entry'): bool,
+        "sequence-number": str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-database-information': {
@@ -673,7 +659,7 @@ Parser for:
 '''
 
 
-class ShowOspfDatabase(ShowOspfDatabaseSchema):
+class ShowOspfDatabase(ShowOspfDatabaseSchema, JunosStructured):
     cli_command = 'show ospf database'
 
     def cli(self, output=None):
@@ -752,19 +738,13 @@ class ShowOspfDatabaseSummarySchema(MetaParser):
         ]
     }
     '''
-    def validate_neighbor_database_summary_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database-summary is not a list')
-        neighbor_schema = Schema({
-            Optional("@external-heading"): str,
-            Optional("ospf-area"): Or(list, str),
-            Optional("ospf-intf"): list,
-            Optional("ospf-lsa-count"): Or(list, str),
-            Optional("ospf-lsa-type"): Or(list, str)
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_database_summary_list = ListValidator({
+        Optional("@external-heading"): str,
+        Optional("ospf-area"): Or(list, str),
+        Optional("ospf-intf"): list,
+        Optional("ospf-lsa-count"): Or(list, str),
+        Optional("ospf-lsa-type"): Or(list, str)
+    }, 'ospf-database-summary is not a list')
 
     schema = {
         'ospf-database-information': {
@@ -780,7 +760,7 @@ Parser for:
 '''
 
 
-class ShowOspfDatabaseSummary(ShowOspfDatabaseSummarySchema):
+class ShowOspfDatabaseSummary(ShowOspfDatabaseSummarySchema, JunosStructured):
     cli_command = 'show ospf database summary'
 
     def cli(self, output=None):
@@ -946,58 +926,52 @@ class ShowOspfDatabaseExternalExtensiveSchema(MetaParser):
         ]
     }
 } """
-    def validate_neighbor_database_external_extensive_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-        neighbor_schema = Schema({
-            Optional("@external-heading"): str,
-            Optional("@heading"): str,
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "expiration-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "installation-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "lsa-change-count": str,
-                "lsa-changed-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "send-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                }
+    validate_neighbor_database_external_extensive_list = ListValidator({
+        Optional("@external-heading"): str,
+        Optional("@heading"): str,
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str,
+                Optional("@junos:seconds"): str
             },
-            "ospf-external-lsa": {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
+            "expiration-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
             },
-            "sequence-number": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+            "installation-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            "lsa-change-count": str,
+            "lsa-changed-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            "send-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            }
+        },
+        "ospf-external-lsa": {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1016,8 +990,8 @@ Parser for:
 '''
 
 
-class ShowOspfDatabaseExternalExtensive(ShowOspfDatabaseExternalExtensiveSchema
-                                        ):
+class ShowOspfDatabaseExternalExtensive(ShowOspfDatabaseExternalExtensiveSchema,
+                                        JunosStructured):
     cli_command = 'show ospf database external extensive'
 
     def cli(self, output=None):
@@ -1267,7 +1241,7 @@ Parser for:
 '''
 
 
-class ShowOspfOverview(ShowOspfOverviewSchema):
+class ShowOspfOverview(ShowOspfOverviewSchema, JunosStructured):
     cli_command = 'show ospf overview'
 
     def cli(self, output=None):
@@ -1686,117 +1660,92 @@ class ShowOspfDatabaseAdvertisingRouterSelfDetailSchema(MetaParser):
             ]
         }
     }'''
-    def validate_ospf_database(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-
-        def validate_ospf_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-link is not a list')
-            ospf_link_schema = Schema({
-                "link-data": str,
-                "link-id": str,
-                "link-type-name": str,
-                "link-type-value": str,
-                "metric": str,
-                "ospf-topology-count": str
-            })
-            for item in value:
-                ospf_link_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa-topology-link is not a list')
-            ospf_lsa_topology_ink_schema = Schema({
-                "link-type-name":
-                str,
-                "ospf-lsa-topology-link-metric":
-                str,
-                "ospf-lsa-topology-link-node-id":
+    validate_ospf_link = ListValidator({
+        "link-data": str,
+        "link-id": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "metric": str,
+        "ospf-topology-count": str
+    }, 'ospf-link is not a list')
+
+    validate_ospf_lsa_topology_link = ListValidator({
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str
+    }, 'ospf-lsa-topology-link is not a list')
+
+    validate_ospf_lsa_topology_list = ListValidator({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf-lsa is not a list')
+
+    validate_ospf_database = ListValidator({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional("ospf-router-lsa"): {
+            "bits": str,
+            "link-count": str,
+            "ospf-link": Use(validate_ospf_link),
+            Optional("ospf-lsa-topology"): {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        Optional("ospf-opaque-area-lsa"): {
+            "tlv-block": {
+                "formatted-tlv-data": str,
+                "tlv-length": str,
+                "tlv-type-name": str,
+                "tlv-type-value": str
+            },
+            Optional("te-subtlv"): {
+                "formatted-tlv-data": list,
+                "tlv-length": list,
+                "tlv-type-name": list,
+                "tlv-type-value": list
+            }
+        },
+        Optional("ospf-external-lsa"): {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        Optional("ospf-network-lsa"): {
+            "address-mask": str,
+            "attached-router": list,
+            "ospf-lsa-topology": {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_list),
+                "ospf-topology-id":
                 str,
-                "ospf-lsa-topology-link-state":
+                "ospf-topology-name":
                 str
-            })
-            for item in value:
-                ospf_lsa_topology_ink_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa is not a list')
-            ospf_lsa_schema = Schema({
-                "link-type-name": str,
-                "ospf-lsa-topology-link-metric": str,
-                "ospf-lsa-topology-link-node-id": str,
-                "ospf-lsa-topology-link-state": str
-            })
-            for item in value:
-                ospf_lsa_schema.validate(item)
-            return value
-
-        ospf_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional("ospf-router-lsa"): {
-                "bits": str,
-                "link-count": str,
-                "ospf-link": Use(validate_ospf_link),
-                Optional("ospf-lsa-topology"): {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
-            },
-            Optional("ospf-opaque-area-lsa"): {
-                "tlv-block": {
-                    "formatted-tlv-data": str,
-                    "tlv-length": str,
-                    "tlv-type-name": str,
-                    "tlv-type-value": str
-                },
-                Optional("te-subtlv"): {
-                    "formatted-tlv-data": list,
-                    "tlv-length": list,
-                    "tlv-type-name": list,
-                    "tlv-type-value": list
-                }
-            },
-            Optional("ospf-external-lsa"): {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
-            },
-            Optional("ospf-network-lsa"): {
-                "address-mask": str,
-                "attached-router": list,
-                "ospf-lsa-topology": {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_list),
-                    "ospf-topology-id":
-                    str,
-                    "ospf-topology-name":
-                    str
-                }
-            },
-            "sequence-number": str
-        })
-        for item in value:
-            ospf_database_schema.validate(item)
-        return value
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -1809,7 +1758,7 @@ class ShowOspfDatabaseAdvertisingRouterSelfDetailSchema(MetaParser):
 
 
 class ShowOspfDatabaseAdvertisingRouterSelfDetail(
-        ShowOspfDatabaseAdvertisingRouterSelfDetailSchema):
+        ShowOspfDatabaseAdvertisingRouterSelfDetailSchema, JunosStructured):
     """ Parser for:
             * show ospf database advertising-router self detail
     """
@@ -2365,132 +2314,113 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
             ]
         }
     }'''
-    def validate_ospf_database(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-
-        def validate_ospf_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-link is not a list')
-            ospf_link_schema = Schema({
-                "link-data": str,
-                "link-id": str,
-                "link-type-name": str,
-                "link-type-value": str,
-                "metric": str,
-                "ospf-topology-count": str
-            })
-            for item in value:
-                ospf_link_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa-topology-link is not a list')
-            ospf_lsa_topology_ink_schema = Schema({
-                "link-type-name":
-                str,
-                "ospf-lsa-topology-link-metric":
-                str,
-                "ospf-lsa-topology-link-node-id":
-                str,
-                "ospf-lsa-topology-link-state":
-                str
-            })
-            for item in value:
-                ospf_lsa_topology_ink_schema.validate(item)
-            return value
-
-        ospf_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional("ospf-network-lsa"): {
-                "address-mask": str,
-                "attached-router": list,
-                "ospf-lsa-topology": {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+    validate_ospf_link = ListValidator({
+        "link-data": str,
+        "link-id": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "metric": str,
+        "ospf-topology-count": str
+    }, 'ospf-link is not a list')
+
+    validate_ospf_lsa_topology_link = ListValidator({
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str
+    }, 'ospf-lsa-topology-link is not a list')
+
+    validate_ospf_database = ListValidator({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional("ospf-network-lsa"): {
+            "address-mask": str,
+            "attached-router": list,
+            "ospf-lsa-topology": {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str
             },
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str
-                },
-                Optional("expiration-time"): {
-                    "#text": str
-                },
-                Optional("installation-time"): {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                Optional("lsa-change-count"): str,
-                Optional("lsa-changed-time"): {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    Optional("#text"): str
-                },
-                Optional("database-entry-state"): str
+            Optional("expiration-time"): {
+                "#text": str
             },
-            Optional("ospf-router-lsa"): {
-                "bits": str,
-                "link-count": str,
-                "ospf-link": Use(validate_ospf_link),
-                Optional("ospf-lsa-topology"): {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+            Optional("installation-time"): {
+                "#text": str
             },
-            Optional("ospf-opaque-area-lsa"): {
-                "tlv-block": {
-                    "formatted-tlv-data": str,
-                    "tlv-length": str,
-                    "tlv-type-name": str,
-                    "tlv-type-value": str
-                },
-                Optional("te-subtlv"): {
-                    "formatted-tlv-data": list,
-                    "tlv-length": list,
-                    "tlv-type-name": list,
-                    "tlv-type-value": list
-                }
+            Optional("generation-timer"): {
+                "#text": str
             },
-            Optional("ospf-external-lsa"): {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
+            Optional("lsa-change-count"): str,
+            Optional("lsa-changed-time"): {
+                "#text": str
             },
-            Optional("ospf-summary-lsa"): {
-                "address-mask": str,
-                "ospf-summary-lsa-topology": {
-                    "ospf-topology-name": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                }
+            Optional("send-time"): {
+                Optional("#text"): str
             },
-            "sequence-number": str
-        })
-        for item in value:
-            ospf_database_schema.validate(item)
-        return value
+            Optional("database-entry-state"): str
+        },
+        Optional("ospf-router-lsa"): {
+            "bits": str,
+            "link-count": str,
+            "ospf-link": Use(validate_ospf_link),
+            Optional("ospf-lsa-topology"): {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        Optional("ospf-opaque-area-lsa"): {
+            "tlv-block": {
+                "formatted-tlv-data": str,
+                "tlv-length": str,
+                "tlv-type-name": str,
+                "tlv-type-value": str
+            },
+            Optional("te-subtlv"): {
+                "formatted-tlv-data": list,
+                "tlv-length": list,
+                "tlv-type-name": list,
+                "tlv-type-value": list
+            }
+        },
+        Optional("ospf-external-lsa"): {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        Optional("ospf-summary-lsa"): {
+            "address-mask": str,
+            "ospf-summary-lsa-topology": {
+                "ospf-topology-name": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -2502,7 +2432,7 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
     }
 
 
-class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
+class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema, JunosStructured):
     """ Parser for:
             * show ospf database extensive
             * show ospf database {data_type} extensive
@@ -3416,52 +3346,39 @@ class ShowOspfNeighborExtensiveSchema(MetaParser):
     """ Schema for:
             * show ospf neighbor extensive
     """
-    def validate_ospf_neighbor_list(value):
-        def validate_adjacency_labels_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('adjacency labels is not a list')
-            adjacency_labels_schema = Schema(
-                {
-                    'label': str,
-                    'flags': str,
-                    'adj-sid-type': str
-                }, )
-            for item in value:
-                adjacency_labels_schema.validate(item)
-            return value
-
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        ospf_lsa_topology_ink_schema = Schema({
-            "activity-timer": str,
-            Optional("adj-sid-list"): {
-                'spring-adjacency-labels': Use(validate_adjacency_labels_list)
-            },
-            "bdr-address": str,
-            "dr-address": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            Optional("neighbor-adjacency-time"): {
-                "#text": str
-            },
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            Optional("neighbor-up-time"): {
-                "#text": str,
-                Optional("junos:seconds"): str,
-            },
-            "options": str,
-            "ospf-area": str,
-            "ospf-neighbor-state": str,
-            Optional("ospf-neighbor-topology"): {
-                "ospf-neighbor-topology-state": str,
-                "ospf-topology-id": str,
-                "ospf-topology-name": str
-            }
-        })
-        for item in value:
-            ospf_lsa_topology_ink_schema.validate(item)
-        return value
+    validate_adjacency_labels_list = ListValidator({
+        'label': str,
+        'flags': str,
+        'adj-sid-type': str
+    }, 'adjacency labels is not a list')
+
+    validate_ospf_neighbor_list = ListValidator({
+        "activity-timer": str,
+        Optional("adj-sid-list"): {
+            'spring-adjacency-labels': Use(validate_adjacency_labels_list)
+        },
+        "bdr-address": str,
+        "dr-address": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        Optional("neighbor-adjacency-time"): {
+            "#text": str
+        },
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        Optional("neighbor-up-time"): {
+            "#text": str,
+            Optional("junos:seconds"): str,
+        },
+        "options": str,
+        "ospf-area": str,
+        "ospf-neighbor-state": str,
+        Optional("ospf-neighbor-topology"): {
+            "ospf-neighbor-topology-state": str,
+            "ospf-topology-id": str,
+            "ospf-topology-name": str
+        }
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         "ospf-neighbor-information": {
@@ -3470,7 +3387,7 @@ class ShowOspfNeighborExtensiveSchema(MetaParser):
     }
 
 
-class ShowOspfNeighborExtensive(ShowOspfNeighborExtensiveSchema):
+class ShowOspfNeighborExtensive(ShowOspfNeighborExtensiveSchema, JunosStructured):
     """ Parser for:
             * show ospf neighbor extensive
     """
@@ -3594,45 +3511,39 @@ class ShowOspfInterfaceExtensiveSchema(MetaParser):
     """ Schema for:
             * show ospf interface extensive
     """
-    def validate_ospf_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        neighbor_schema = Schema({
-            "address-mask": str,
-            "adj-count": str,
-            "authentication-type": str,
-            "bdr-id": str,
-            "dead-interval": str,
-            "dr-id": str,
-            "hello-interval": str,
-            "interface-address": str,
-            "interface-cost": str,
-            "interface-name": str,
-            "interface-type": str,
-            "mtu": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-protection-type": str,
-            "ospf-interface-state": str,
-            Optional("ospf-interface-tilfa-prot-fate"): str,
-            Optional("ospf-interface-tilfa-prot-link"): str,
-            Optional("ospf-interface-tilfa-prot-node"): str,
-            Optional("ospf-interface-tilfa-prot-srlg"): str,
-            Optional("passive"): str,
-            Optional("dr-address"): str,
-            Optional("router-priority"): str,
-            "ospf-interface-topology": {
-                "ospf-topology-id": str,
-                "ospf-topology-metric": str,
-                "ospf-topology-name": str,
-                Optional("ospf-topology-passive"): bool,
-            },
-            "ospf-stub-type": str,
-            "retransmit-interval": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_ospf_interface_list = ListValidator({
+        "address-mask": str,
+        "adj-count": str,
+        "authentication-type": str,
+        "bdr-id": str,
+        "dead-interval": str,
+        "dr-id": str,
+        "hello-interval": str,
+        "interface-address": str,
+        "interface-cost": str,
+        "interface-name": str,
+        "interface-type": str,
+        "mtu": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-protection-type": str,
+        "ospf-interface-state": str,
+        Optional("ospf-interface-tilfa-prot-fate"): str,
+        Optional("ospf-interface-tilfa-prot-link"): str,
+        Optional("ospf-interface-tilfa-prot-node"): str,
+        Optional("ospf-interface-tilfa-prot-srlg"): str,
+        Optional("passive"): str,
+        Optional("dr-address"): str,
+        Optional("router-priority"): str,
+        "ospf-interface-topology": {
+            "ospf-topology-id": str,
+            "ospf-topology-metric": str,
+            "ospf-topology-name": str,
+            Optional("ospf-topology-passive"): bool,
+        },
+        "ospf-stub-type": str,
+        "retransmit-interval": str
+    }, 'ospf-interface is not a list')
 
     schema = {
         "ospf-interface-information": {
@@ -3641,7 +3552,7 @@ class ShowOspfInterfaceExtensiveSchema(MetaParser):
     }
 
 
-class ShowOspfInterfaceExtensive(ShowOspfInterfaceExtensiveSchema):
+class ShowOspfInterfaceExtensive(ShowOspfInterfaceExtensiveSchema, JunosStructured):
     """ Parser for:
             * show ospf interface extensive
     """
@@ -3885,43 +3796,31 @@ class ShowOspfRouteBriefSchema(MetaParser):
         }
     }
     """
-    def validate_ospf_route_entry_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route-entry is not a list')
-        ospf_route_schema = Schema({
-            "address-prefix": str,
-            "interface-cost": str,
-            "next-hop-type": str,
-            "ospf-next-hop": {
-                Optional("next-hop-address"): {
-                    "interface-address": str
-                },
-                "next-hop-name": {
-                    "interface-name": str
-                }
+    validate_ospf_route_entry_list = ListValidator({
+        "address-prefix": str,
+        "interface-cost": str,
+        "next-hop-type": str,
+        "ospf-next-hop": {
+            Optional("next-hop-address"): {
+                "interface-address": str
             },
-            "route-path-type": str,
-            "route-type": str,
-            Optional("ospf-backup-next-hop"): {
-                "ospf-backup-next-hop-type": str,
-                "ospf-backup-next-hop-address": str,
-                "ospf-backup-next-hop-interface": str
+            "next-hop-name": {
+                "interface-name": str
             }
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
-
-    def validate_ospf_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf_route_schema = Schema({
-            "ospf-route-entry":
-            Use(ShowOspfRouteBriefSchema.validate_ospf_route_entry_list)
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
+        },
+        "route-path-type": str,
+        "route-type": str,
+        Optional("ospf-backup-next-hop"): {
+            "ospf-backup-next-hop-type": str,
+            "ospf-backup-next-hop-address": str,
+            "ospf-backup-next-hop-interface": str
+        }
+    }, 'ospf-route-entry is not a list')
+
+    validate_ospf_route_list = ListValidator({
+        "ospf-route-entry":
+        Use(validate_ospf_route_entry_list)
+    }, 'ospf-route is not a list')
 
     schema = {
         "ospf-route-information": {
@@ -3933,7 +3832,7 @@ class ShowOspfRouteBriefSchema(MetaParser):
     }
 
 
-class ShowOspfRouteBrief(ShowOspfRouteBriefSchema):
+class ShowOspfRouteBrief(ShowOspfRouteBriefSchema, JunosStructured):
     """ Parser for:
             * show ospf route brief
     """
@@ -4078,18 +3977,12 @@ class ShowOspfDatabaseNetworkLsaidDetailSchema(MetaParser):
             }
         }
     } """
-    def validate_ospf_lsa_topology_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-lsa is not a list')
-        ospf_lsa_schema = Schema({
-            "link-type-name": str,
-            "ospf-lsa-topology-link-metric": str,
-            "ospf-lsa-topology-link-node-id": str,
-            "ospf-lsa-topology-link-state": str
-        })
-        for item in value:
-            ospf_lsa_schema.validate(item)
-        return value
+    validate_ospf_lsa_topology_list = ListValidator({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf-lsa is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -4127,7 +4020,7 @@ class ShowOspfDatabaseNetworkLsaidDetailSchema(MetaParser):
 
 
 class ShowOspfDatabaseNetworkLsaidDetail(
-        ShowOspfDatabaseNetworkLsaidDetailSchema):
+        ShowOspfDatabaseNetworkLsaidDetailSchema, JunosStructured):
     """ Parser for:
             * show ospf database network lsa-id {ipaddress} detail
     """
@@ -4318,32 +4211,26 @@ class ShowOspfRouteNetworkExtensiveSchema(MetaParser):
 }
     '''
 
-    def validate_ospf_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf_route_schema = Schema({
-            "ospf-route-entry": {
-                "address-prefix": str,
-                "interface-cost": str,
-                "next-hop-type": str,
-                "ospf-area": str,
-                "ospf-next-hop": {
-                    Optional("next-hop-address"): {
-                        Optional("interface-address"): str
-                    },
-                    "next-hop-name": {
-                        "interface-name": str
-                    }
+    validate_ospf_route_list = ListValidator({
+        "ospf-route-entry": {
+            "address-prefix": str,
+            "interface-cost": str,
+            "next-hop-type": str,
+            "ospf-area": str,
+            "ospf-next-hop": {
+                Optional("next-hop-address"): {
+                    Optional("interface-address"): str
                 },
-                "route-origin": str,
-                "route-path-type": str,
-                "route-priority": str,
-                "route-type": str
-            }
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
+                "next-hop-name": {
+                    "interface-name": str
+                }
+            },
+            "route-origin": str,
+            "route-path-type": str,
+            "route-priority": str,
+            "route-type": str
+        }
+    }, 'ospf-route is not a list')
 
     schema = {
         "ospf-route-information": {
@@ -4362,7 +4249,7 @@ Parser for:
 '''
 
 
-class ShowOspfRouteNetworkExtensive(ShowOspfRouteNetworkExtensiveSchema):
+class ShowOspfRouteNetworkExtensive(ShowOspfRouteNetworkExtensiveSchema, JunosStructured):
     cli_command = 'show ospf route network extensive'
 
     def cli(self, output=None):
@@ -4470,27 +4357,18 @@ class ShowOspfDatabaseOpaqueAreaSchema(MetaParser):
     }
     """
     
-    def validate_ospf_database_entry(ospf_db_list):
-        ''' Validates each entry in ospf-database '''
-        if not isinstance(ospf_db_list, list):
-            raise SchemaError('ospf-database is not a list')
-        
-        ospf_db_entry_schema = Schema({
-            Optional("@heading"): str,
-                "advertising-router": str,
-                "age": str,
-                "checksum": str,
-                "lsa-id": str,
-                "lsa-length": str,
-                "lsa-type": str,
-                "options": str,
-                Optional("our-entry"): bool,
-                "sequence-number": str
-        })
-
-        for entry in ospf_db_list:
-            ospf_db_entry_schema.validate(entry)    
-        return ospf_db_list
+    validate_ospf_database_entry = ListValidator({
+        Optional("@heading"): str,
+            "advertising-router": str,
+            "age": str,
+            "checksum": str,
+            "lsa-id": str,
+            "lsa-length": str,
+            "lsa-type": str,
+            "options": str,
+            Optional("our-entry"): bool,
+            "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -4501,7 +4379,7 @@ class ShowOspfDatabaseOpaqueAreaSchema(MetaParser):
         }
     }
 
-class ShowOspfDatabaseOpaqueArea(ShowOspfDatabaseOpaqueAreaSchema):
+class ShowOspfDatabaseOpaqueArea(ShowOspfDatabaseOpaqueAreaSchema, JunosStructured):
     """ Parser for:
             * show ospf database opaque-area
     """
@@ -4595,23 +4473,14 @@ class ShowOspfRoutePrefixSchema(MetaParser):
     #     }
     # }
 
-    def validate_ospf_next_hop_list(value):
-        ''' Validates each entry in ospf-next-hop '''
-        if not isinstance(value, list):
-            raise SchemaError('ospf-next-hop is not a list')
-        
-        ospf_next_hop_schema = Schema({
-            "next-hop-address": {
-                "interface-address": str,
-            },
-            "next-hop-name": {
-                "interface-name": str,
-            }
-        })
-
-        for entry in value:
-            ospf_next_hop_schema.validate(entry)    
-        return value
+    validate_ospf_next_hop_list = ListValidator({
+        "next-hop-address": {
+            "interface-address": str,
+        },
+        "next-hop-name": {
+            "interface-name": str,
+        }
+    }, 'ospf-next-hop is not a list')
 
 
     schema = {
@@ -4640,7 +4509,7 @@ Parser for:
 '''
 
 
-class ShowOspfRoutePrefix(ShowOspfRoutePrefixSchema):
+class ShowOspfRoutePrefix(ShowOspfRoutePrefixSchema, JunosStructured):
     cli_command = 'show ospf route {prefix}'
 
     def cli(self,prefix, output=None):
@@ -4779,19 +4648,13 @@ class ShowOspfStatisticsSchema(MetaParser):
     }
 }'''
 
-    def validate_packet_statistic_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('packet_statistic is not a list')
-        packet_schema = Schema({
-            "ospf-packet-type": str,
-            "packets-received": str,
-            "packets-received-5seconds": str,
-            "packets-sent": str,
-            "packets-sent-5seconds": str
-        })
-        for item in value:
-            packet_schema.validate(item)
-        return value
+    validate_packet_statistic_list = ListValidator({
+        "ospf-packet-type": str,
+        "packets-received": str,
+        "packets-received-5seconds": str,
+        "packets-sent": str,
+        "packets-sent-5seconds": str
+    }, 'packet_statistic is not a list')
     schema = {
         Optional("@xmlns:junos"): str,
         "ospf-statistics-information": {
@@ -4824,7 +4687,7 @@ class ShowOspfStatisticsSchema(MetaParser):
     }
 
 
-class ShowOspfStatistics(ShowOspfStatisticsSchema):
+class ShowOspfStatistics(ShowOspfStatisticsSchema, JunosStructured):
     """ Parser for:
             * show ospf statistics
     """
@@ -29,6 +29,11 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# Parser
+from genie.libs.parser.utils.stream import RecordStream, APPEND, iter_lines
+from genie.libs.parser.utils.validation import ListValidator
+from genie.libs.parser.utils.junos_structured import JunosStructured
 '''
 Schema for:
     * show route table {table}
@@ -292,82 +297,52 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("peer-id"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            route_entry_schema.validate(item)
-        return value
+    validate_nh_list = ListValidator({
+        Optional("mpls-label"): str,
+        Optional("selected-next-hop"): str,
+        Optional("nh-local-interface"): str,
+        Optional("nh-table"): str,
+        Optional("to"): str,
+        Optional("via"): str
+    }, 'nh list is not a list')
+
+    validate_rt_list = ListValidator({
+        Optional("@junos:style"): str,
+        Optional("rt-destination"): str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "age": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            Optional('as-path'): str,
+            Optional("current-active"): str,
+            Optional("last-active"): str,
+            Optional("learned-from"): str,
+            Optional("local-preference"): str,
+            Optional("peer-id"): str,
+            Optional("med"): str,
+            Optional("metric"): str,
+            Optional("metric2"): str,
+            Optional("nh"): Use(validate_nh_list),
+            Optional('nh-type'): str,
+            "preference": str,
+            Optional("preference2"): str,
+            "protocol-name": str,
+            Optional('rt-tag'): str,
+            Optional("validation-state"): str
+        }
+    }, 'rt list is not a list')
+
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -378,7 +353,7 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+class ShowRoute(ShowRouteSchema, JunosStructured):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -421,6 +396,24 @@ class ShowRoute(ShowRouteSchema):
             out = output
 
         ret_dict = {}
+        for _ in self._iter_parse(out.splitlines(), ret_dict, RecordStream()):
+            pass
+        return ret_dict
+
+    def parse_iter(self, output_stream):
+        """ Parse the output line by line, without keeping the routes
+
+            Args:
+                output_stream (`str`, file object or iterable of `str`): output
+
+            Yields:
+                tuple: ((table-name,), rt dict), one for each route entry
+                       once all its lines are parsed
+        """
+        return self._iter_parse(iter_lines(output_stream), {},
+                                RecordStream(streaming=True))
+
+    def _iter_parse(self, lines, ret_dict, records):
         rt_destination = None
 
 
@@ -460,8 +453,10 @@ class ShowRoute(ShowRouteSchema):
         # 2001:db8:eb18:ca45::1/128
         pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
 
-        for line in out.splitlines():
+        for line in lines:
             line = line.strip()
+            if records.completed:
+                yield from records.pop_completed()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
             m = p1.match(line)
@@ -504,8 +499,7 @@ class ShowRoute(ShowRouteSchema):
                 local_preference = group['local_preference']
                 med = group['med']
                 rt_list = route_table_dict.setdefault('rt', [])
-                rt_dict = {}
-                rt_list.append(rt_dict)
+                rt_dict = records.start(rt_list, APPEND, (table_name,))
                 rt_entry_dict = {}
                 if active_tag:
                     rt_entry_dict.update({'active-tag': active_tag})
@@ -583,7 +577,9 @@ class ShowRoute(ShowRouteSchema):
                 group = m.groupdict()
                 rt_destination = group['rt_destination']
                 continue
-        return ret_dict
+
+        records.close()
+        yield from records.pop_completed()
 
 class ShowRouteLogicalSystem(ShowRoute):
     """ Parser for:
@@ -712,181 +708,128 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("label-element"): str,
-                        Optional("label-element-childcount"): str,
-                        Optional("label-element-lspid"): str,
-                        Optional("label-element-parent"): str,
-                        Optional("label-element-refcount"): str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh-string"): str,
-                        Optional("selected-next-hop"): str,
-                        Optional("session"): str,
-                        Optional("to"): str,
-                        Optional("via"): str,
-                        Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            Optional("nh-string"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            Optional("via"): str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("accepted"): str,
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-rt-flag"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("local-preference"): str,
-                    Optional("peer-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    Optional("nh-address"): str,
-                    Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    Optional("nh-reference-count"): str,
-                    Optional("gateway"): str,
-                    Optional("nh-type"): str,
-                    Optional("preference"): str,
-                    Optional("preference2"): str,
-                    Optional("protocol-name"): str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    Optional("rt-entry-state"): str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    Optional("peer-id"): str,
-                    Optional("task-name"): str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_nh_list = ListValidator({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list')
+
+    validate_protocol_nh_nh_list = ListValidator({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list', allow_dict=True)
+
+    validate_protocol_nh_list = ListValidator({
+        Optional("@junos:indent"): str,
+        Optional("forwarding-nh-count"): str,
+        "indirect-nh": str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("metric"): str,
+        Optional("mpls-label"): str,
+        Optional("nh"): Use(validate_protocol_nh_nh_list),
+        Optional("nh-index"): str,
+        Optional("nh-type"): str,
+        Optional("output"): str,
+        "to": str
+    }, 'protocol-nh is not a list', allow_dict=True)
+
+    validate_rt_entry_list = ListValidator({
+        Optional("accepted"): str,
+        Optional("active-tag"): str,
+        Optional("age"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("announce-bits"): str,
+        Optional("announce-tasks"): str,
+        Optional("as-path"): str,
+        Optional("cluster-list"): str,
+        Optional("bgp-rt-flag"): str,
+        Optional("bgp-path-attributes"): {
+            "attr-as-path-effective": {
+                "aspath-effective-string": str,
+                "attr-value": str
+            }
+        },
+        Optional("current-active"): str,
+        Optional("inactive-reason"): str,
+        Optional("last-active"): str,
+        Optional("local-as"): str,
+        Optional("local-preference"): str,
+        Optional("peer-as"): str,
+        Optional("metric"): str,
+        Optional("metric2"): str,
+        Optional("nh"): Use(validate_nh_list),
+        Optional("nh-address"): str,
+        Optional("nh-index"): str,
+        Optional("nh-kernel-id"): str,
+        Optional("nh-reference-count"): str,
+        Optional("gateway"): str,
+        Optional("nh-type"): str,
+        Optional("preference"): str,
+        Optional("preference2"): str,
+        Optional("protocol-name"): str,
+        Optional("protocol-nh"): Use(validate_protocol_nh_list),
+        Optional("rt-entry-state"): str,
+        Optional("rt-ospf-area"): str,
+        Optional("rt-tag"): str,
+        Optional("peer-id"): str,
+        Optional("task-name"): str,
+        Optional("validation-state"): str
+    }, 'rt-entry is not a list', allow_dict=True)
+
+    validate_rt_list = ListValidator({
+        Optional("@junos:style"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): Use(validate_rt_entry_list),
+        "rt-entry-count": {
+            "#text": str,
+            Optional("@junos:format"): str
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+        Optional("tsi"): {
+            "#text": str,
+            Optional("@junos:indent"): str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -897,7 +840,7 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
         }
     }
 
-class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
+class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema, JunosStructured):
     """ Parser for:
             * show route protocol {protocol} extensive
             * show route protocol {protocol} table {table} extensive
@@ -1596,34 +1539,17 @@ class ShowRouteForwardingTableSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_route_table_summary_list(value):
-            # Pass route-table-summary list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('route-table-summary is not a list')
-            # Create route-table-summary Schema
-            route_table_summary_schema = Schema({
-                "route-count": str,
-                "route-table-type": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                route_table_summary_schema.validate(item)
-            return value
-        # Create route-table-summary Schema
-        route_table_schema = Schema({
-            "address-family": str,
-            Optional("enabled-protocols"): str,
-            "route-table-summary": Use(validate_route_table_summary_list),
-            "table-name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_summary_list = ListValidator({
+        "route-count": str,
+        "route-table-type": str
+    }, 'route-table-summary is not a list')
+
+    validate_route_table_list = ListValidator({
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "route-table-summary": Use(validate_route_table_summary_list),
+        "table-name": str
+    }, 'route-table is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1633,7 +1559,7 @@ class ShowRouteForwardingTableSummarySchema(MetaParser):
         }
     }
 
-class ShowRouteForwardingTableSummary(ShowRouteForwardingTableSummarySchema):
+class ShowRouteForwardingTableSummary(ShowRouteForwardingTableSummarySchema, JunosStructured):
     """ Parser for:
             * show route forwarding-table summary
     """
@@ -1737,49 +1663,30 @@ class ShowRouteReceiveProtocolSchema(MetaParser):
         }
     """
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-destination": str,
-                "rt-entry": {
-                    Optional("active-tag"): str,
-                    "as-path": str,
-                    Optional("local-preference"): str,
-                    Optional("med"): str,
-                    "nh": {
-                        "to": str
-                    },
-                    "protocol-name": str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-
-        # Create route-table entry Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = ListValidator({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
     
     # Main Schema
     schema = {
@@ -1790,7 +1697,7 @@ class ShowRouteReceiveProtocolSchema(MetaParser):
         }
     }
 
-class ShowRouteReceiveProtocol(ShowRouteReceiveProtocolSchema):
+class ShowRouteReceiveProtocol(ShowRouteReceiveProtocolSchema, JunosStructured):
     """ Parser for:
             * show route receive-protocol {protocol} {peer}
             * show route receive-protocol {protocol} {peer} {target}
@@ -1935,30 +1842,21 @@ class ShowRouteAdvertisingProtocolSchema(MetaParser):
         }
     """
 
-    def validate_rt_list(value):
-        # Pass rt list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('rt is not a list')
-        # Create rt entry Schema
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "rt-destination": str,
-            "rt-entry": {
-                Optional("active-tag"): str,
-                "as-path": str,
-                "bgp-metric-flags": str,
-                Optional("local-preference"): str,
-                Optional("med"): str,
-                "nh": {
-                    "to": str
-                },
-                "protocol-name": str
-            }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListValidator({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            "bgp-metric-flags": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
     
     # Main schema
     schema = {
@@ -1978,7 +1876,7 @@ class ShowRouteAdvertisingProtocolSchema(MetaParser):
     }
 
 
-class ShowRouteAdvertisingProtocol(ShowRouteAdvertisingProtocolSchema):
+class ShowRouteAdvertisingProtocol(ShowRouteAdvertisingProtocolSchema, JunosStructured):
     """ Parser for:
             * show route advertising-protocol {protocol} {neighbor}
             * show route advertising-protocol {protocol} {neighbor} {route}
@@ -2120,38 +2018,21 @@ class ShowRouteSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_protocols_list(value):
-            # Pass protocols list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('protocols is not a list')
-            # Create protocols Schema
-            protocols_schema = Schema({
-                "active-route-count": str,
-                "protocol-name": str,
-                "protocol-route-count": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                protocols_schema.validate(item)
-            return value
-        # Create route-table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            "protocols": Use(validate_protocols_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_protocols_list = ListValidator({
+        "active-route-count": str,
+        "protocol-name": str,
+        "protocol-route-count": str
+    }, 'protocols is not a list')
+
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        "protocols": Use(validate_protocols_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -2164,7 +2045,7 @@ class ShowRouteSummarySchema(MetaParser):
         }
     }
 
-class ShowRouteSummary(ShowRouteSummarySchema):
+class ShowRouteSummary(ShowRouteSummarySchema, JunosStructured):
     """ Parser for:
             * show route summary
     """
@@ -2270,45 +2151,26 @@ class ShowRouteInstanceDetailSchema(MetaParser):
     #     }
     # }
 
-    def validate_instance_core_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('instance-core is not a list')
-        def validate_instance_rib_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('instance-rib is not a list')
-            instance_rib_schema = Schema({
-                        "irib-active-count": str,
-                        "irib-hidden-count": str,
-                        "irib-holddown-count": str,
-                        "irib-name": str,
-                        "irib-route-count": str
-                    })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        def validate_interface_name_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('interface-name is not a list')
-            instance_rib_schema = Schema({
-                    "interface-name": str
-                })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        instance_core_schema = Schema({
-            Optional("instance-interface"): Use(validate_interface_name_list),
-            "instance-name": str,
-            Optional("instance-rib"): Use(validate_instance_rib_list),
-            Optional("instance-state"): str,
-            Optional("instance-type"): str,
-            Optional("router-id"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            instance_core_schema.validate(item)
-        return value
+    validate_instance_rib_list = ListValidator({
+        "irib-active-count": str,
+        "irib-hidden-count": str,
+        "irib-holddown-count": str,
+        "irib-name": str,
+        "irib-route-count": str
+    }, 'instance-rib is not a list')
+
+    validate_interface_name_list = ListValidator({
+        "interface-name": str
+    }, 'interface-name is not a list')
+
+    validate_instance_core_list = ListValidator({
+        Optional("instance-interface"): Use(validate_interface_name_list),
+        "instance-name": str,
+        Optional("instance-rib"): Use(validate_instance_rib_list),
+        Optional("instance-state"): str,
+        Optional("instance-type"): str,
+        Optional("router-id"): str
+    }, 'instance-core is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2319,7 +2181,7 @@ class ShowRouteInstanceDetailSchema(MetaParser):
         }
     }
 
-class ShowRouteInstanceDetail(ShowRouteInstanceDetailSchema):
+class ShowRouteInstanceDetail(ShowRouteInstanceDetailSchema, JunosStructured):
     """ Parser for:
             * show route instance detail
     """
@@ -2454,43 +2316,35 @@ class ShowRouteAdvertisingProtocolDetailSchema(MetaParser):
     #     },
     # }
 
-    def validate_rt_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('protocol information is not a list')
-
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "table-name": str,
-            "destination-count": str,
-            "total-route-count": str,
-            "active-route-count": str,
-            "holddown-route-count": str,
-            "hidden-route-count": str,
-            "rt-entry": {
-                Optional('active-tag'): str,
-                "rt-destination": str,
-                "rt-prefix-length": str,
-                "rt-entry-count": str,
-                "rt-announced-count": str,
-                Optional('route-label'): str,
-                Optional("bgp-group"): {
-                    "bgp-group-name": str,
-                    "bgp-group-type": str,
-                },
-                "nh": {
-                    "to": str,
-                },
-                Optional("med"): str,
-                Optional("local-preference"): str,
-                'as-path': str,
-                Optional("communities"): str,
-                Optional("flags"): str,
-            }
-        })
-
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListValidator({
+        Optional("@junos:style"): str,
+        "table-name": str,
+        "destination-count": str,
+        "total-route-count": str,
+        "active-route-count": str,
+        "holddown-route-count": str,
+        "hidden-route-count": str,
+        "rt-entry": {
+            Optional('active-tag'): str,
+            "rt-destination": str,
+            "rt-prefix-length": str,
+            "rt-entry-count": str,
+            "rt-announced-count": str,
+            Optional('route-label'): str,
+            Optional("bgp-group"): {
+                "bgp-group-name": str,
+                "bgp-group-type": str,
+            },
+            "nh": {
+                "to": str,
+            },
+            Optional("med"): str,
+            Optional("local-preference"): str,
+            'as-path': str,
+            Optional("communities"): str,
+            Optional("flags"): str,
+        }
+    }, 'protocol information is not a list')
 
     # Main schema
     schema = {
@@ -2501,7 +2355,7 @@ class ShowRouteAdvertisingProtocolDetailSchema(MetaParser):
         },
     }
 
-class ShowRouteAdvertisingProtocolDetail(ShowRouteAdvertisingProtocolDetailSchema):
+class ShowRouteAdvertisingProtocolDetail(ShowRouteAdvertisingProtocolDetailSchema, JunosStructured):
     """ Schema for:
         * show route advertising-protocol {protocol} {ip_address} {route} detail
     """
@@ -2647,43 +2501,26 @@ class ShowRouteForwardingTableLabelSchema(MetaParser):
     """
 
 
-    def validate_rt_table_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('Route table is not a list')
-
-        def validate_rt_entry_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('Route entry is not a list')
-
-            rt_entry = Schema({
-                                "rt-destination": str,
-                                "destination-type": str,
-                                "route-reference-count": str,
-                                "nh":{
-                                    Optional("to"): str,
-                                    "nh-type": str,
-                                    "nh-index": str,
-                                    "nh-reference-count": str,
-                                    Optional("nh-lb-label"): str,
-                                    Optional("via"): str,
-                                }
-                            })
-            
-            for item in value:
-                rt_entry.validate(item)
-            return value
-
-
-        rt_table = Schema({
-                        "table-name": str,
-                        "address-family": str,
-                        Optional("enabled-protocols"): str,
-                        "rt-entry": Use(validate_rt_entry_list)
-                    })
+    validate_rt_entry_list = ListValidator({
+        "rt-destination": str,
+        "destination-type": str,
+        "route-reference-count": str,
+        "nh":{
+            Optional("to"): str,
+            "nh-type": str,
+            "nh-index": str,
+            "nh-reference-count": str,
+            Optional("nh-lb-label"): str,
+            Optional("via"): str,
+        }
+    }, 'Route entry is not a list')
 
-        for item in value:
-            rt_table.validate(item)
-        return value
+    validate_rt_table_list = ListValidator({
+        "table-name": str,
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "rt-entry": Use(validate_rt_entry_list)
+    }, 'Route table is not a list')
 
     # Main schema
     schema = {
@@ -2692,7 +2529,7 @@ class ShowRouteForwardingTableLabelSchema(MetaParser):
             }
         }
 
-class ShowRouteForwardingTableLabel(ShowRouteForwardingTableLabelSchema):
+class ShowRouteForwardingTableLabel(ShowRouteForwardingTableLabelSchema, JunosStructured):
     """ Schema for:
         * show route forwarding-table label {label}
     """
@@ -2782,56 +2619,32 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
         * show route table {table} label-switched-path {name}
     """
 
-    def validate_rt_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('rt schema is not a list')
-
-        def validate_rt_entry_schema(value):
-            if not isinstance(value, list):
-                raise SchemaError('rt entry schema is not a list')
+    validate_nh_schema = ListValidator({
+        Optional("selected-next-hop"): bool,
+        "to": str,
+        "via": str,
+        "lsp-name": str,
+    }, 'nh schema is not a list')
+
+    validate_rt_entry_schema = ListValidator({
+        Optional("active-tag"): str,
+        Optional("current-active"): str,
+        Optional("last-active"): str,
+        "protocol-name": str,
+        "preference": str,
+        "preference2": str,
+        "age": {
+            '#text': str,
+            Optional('@junos:seconds'): str,
+        },
+        "metric": str,
+        "nh": Use(validate_nh_schema)
+    }, 'rt entry schema is not a list')
 
-            def validate_nh_schema(value):
-                if not isinstance(value, list):
-                    raise SchemaError('nh schema is not a list')
-            
-                nh_schema = Schema({
-                            Optional("selected-next-hop"): bool,
-                            "to": str,
-                            "via": str,
-                            "lsp-name": str,
-                        })
-            
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-        
-            rt_entry_schema = Schema({
-                        Optional("active-tag"): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        "protocol-name": str,
-                        "preference": str,
-                        "preference2": str,
-                        "age": {
-                            '#text': str,
-                            Optional('@junos:seconds'): str,
-                        },
-                        "metric": str,
-                        "nh": Use(validate_nh_schema)
-                    })
-        
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-    
-        rt_schema = Schema({
-                    "rt-destination": str,
-                    "rt-entry": Use(validate_rt_entry_schema)
-                })
-    
-        for item in value:
-            rt_schema.validate(item)
-        return value
+    validate_rt_schema = ListValidator({
+        "rt-destination": str,
+        "rt-entry": Use(validate_rt_entry_schema)
+    }, 'rt schema is not a list')
 
     schema = {
             "route-information": {
@@ -2847,7 +2660,7 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
             }
         }
 
-class ShowRouteTableLabelSwitchedName(ShowRouteTableLabelSwitchedNameSchema):
+class ShowRouteTableLabelSwitchedName(ShowRouteTableLabelSwitchedNameSchema, JunosStructured):
     """ Parser for:
         * show route table {table} label-switched-path {name}
     """
@@ -2998,7 +2811,7 @@ class ShowRouteProtocolProtocolExtensiveIpaddressSchema(MetaParser):
     }
 
 
-class ShowRouteProtocolProtocolExtensiveIpaddress(ShowRouteProtocolProtocolExtensiveIpaddressSchema):
+class ShowRouteProtocolProtocolExtensiveIpaddress(ShowRouteProtocolProtocolExtensiveIpaddressSchema, JunosStructured):
     """ Parser for:
         * show route protocol {protocol} extensive {ipaddress}
     """
@@ -3323,49 +3136,39 @@ class ShowRouteReceiveProtocolExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} {target_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): {
-                    Optional("@junos:style"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("active-tag"): str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): {
+                Optional("@junos:style"): str,
+                "rt-announced-count": str,
+                "rt-destination": str,
+                Optional("active-tag"): str,
+                Optional("rt-entry"): {
+                    Optional("as-path"): str,
+                    Optional("bgp-rt-flag"): str,
+                    Optional("bgp-path-attributes"): {
+                        "attr-as-path-effective": {
+                            "aspath-effective-string": str,
+                            "attr-value": str
                         }
                     },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,
+                    Optional("local-preference"): str,
+                    Optional("nh"): {
+                        'to': str,
+                    }
                 },
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+                "rt-entry-count": {
+                    "#text": str,
+                },
+                Optional("rt-prefix-length"): str,
+                Optional("rt-state"): str,
+            },
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -3376,7 +3179,7 @@ class ShowRouteReceiveProtocolExtensiveSchema(MetaParser):
     }
 
 # Parser for 'show route receive-protocol bgp {peer_address} {target_address} extensive'
-class ShowRouteReceiveProtocolExtensive(ShowRouteReceiveProtocolExtensiveSchema):
+class ShowRouteReceiveProtocolExtensive(ShowRouteReceiveProtocolExtensiveSchema, JunosStructured):
     cli_command = ['show route receive-protocol {protocol} {peer_address} {target_address} extensive']
 
     def cli(self, peer_address, target_address, protocol='bgp', output=None):
@@ -3499,59 +3302,39 @@ class ShowRouteReceiveProtocolPeerAddressExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value): 
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema(
-                    {Optional("@junos:style"): str,
-                    Optional("active-tag"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
-                        }
-                    },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,}
-            )
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = ListValidator({Optional("@junos:style"): str,
+        Optional("active-tag"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): {
+            Optional("as-path"): str,
+            Optional("bgp-rt-flag"): str,
+            Optional("bgp-path-attributes"): {
+                "attr-as-path-effective": {
+                    "aspath-effective-string": str,
+                    "attr-value": str
+                }
+            },
+            Optional("local-preference"): str,
+            Optional("nh"): {
+                'to': str,
+            }
+        },
+        "rt-entry-count": {
+            "#text": str,
+        },
+        Optional("rt-prefix-length"): str,
+    Optional("rt-state"): str,}, 'rt is not a list')
+
+    validate_route_table_list = ListValidator({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -3562,7 +3345,7 @@ class ShowRouteReceiveProtocolPeerAddressExtensiveSchema(MetaParser):
     }        
 
 # Parser for 'show route receive-protocol bgp {peer_address} extensive'
-class ShowRouteReceiveProtocolPeerAddressExtensive(ShowRouteReceiveProtocolPeerAddressExtensiveSchema):
+class ShowRouteReceiveProtocolPeerAddressExtensive(ShowRouteReceiveProtocolPeerAddressExtensiveSchema, JunosStructured):
     cli_command = 'show route receive-protocol {protocol} {peer_address} extensive'
 
     def cli(self, peer_address, protocol='bgp', output=None):
@@ -3688,20 +3471,12 @@ class ShowRouteInstanceNameSchema(MetaParser):
             * show route instance {name}
     """
     
-    def validate_instance_rib(value):
-        if not isinstance(value, list):
-            raise SchemaError('Instance rib is not a list')
-    
-        instance_rib = Schema({
-            "irib-name": str,
-            "irib-active-count": str,
-            "irib-holddown-count": str,
-            "irib-hidden-count": str,
-        })
-    
-        for item in value:
-            instance_rib.validate(item)
-        return value
+    validate_instance_rib = ListValidator({
+        "irib-name": str,
+        "irib-active-count": str,
+        "irib-holddown-count": str,
+        "irib-hidden-count": str,
+    }, 'Instance rib is not a list')
 
     # Main Schema
     schema = {
@@ -3714,7 +3489,7 @@ class ShowRouteInstanceNameSchema(MetaParser):
         }
     }        
 
-class ShowRouteInstanceName(ShowRouteInstanceNameSchema):
+class ShowRouteInstanceName(ShowRouteInstanceNameSchema, JunosStructured):
     """Parser for
         * show route instance {name}
     """
@@ -63,6 +63,11 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.running_config import config_include
+from genie.libs.parser.utils.dispatch import LineDispatcher, FALLTHROUGH
+from genie.libs.parser.utils.projection import project, ProjectedParser
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, \
+                                                    Key, Index, integer
 
 
 # =====================================
@@ -1142,7 +1147,7 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
 
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            out = config_include(self.device, 'peer-session', self.cli_command)
         else:
             out = output
 
@@ -1333,7 +1338,7 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
 
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            out = config_include(self.device, 'peer-policy', self.cli_command)
         else:
             out = output
         
@@ -1523,7 +1528,7 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
 
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            out = config_include(self.device, 'peer', self.cli_command)
         else:
             out = output
 
@@ -1722,7 +1727,29 @@ class ShowBgpVrfAllAllSchema(MetaParser):
 # =================================
 # Parser for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+def _bgp_prefixes():
+    """Prefixes of 'show bgp vrf all all | json', with their paths"""
+    return Table('prefix', path=[
+        'prefixes', Key(lambda row: row.get('ipprefix',
+                                            row.get('ipv6prefix')))], tables=[
+        Table('path', path=['index', Index()], fields={
+            'next_hop': lambda row: row.get('ipnexthop',
+                                            row.get('ipv6nexthop')),
+            # * and >
+            'status_codes': lambda row: (row.get('statuscode', '') +
+                                         row.get('bestcode', '')).strip() \
+                                        or None,
+            'path_type': 'typecode',
+            'metric': ('metric', integer),
+            'localprf': ('localpref', integer),
+            'weight': ('weight', integer),
+            'path': ('aspath', lambda path: path.strip() or None),
+            'origin_codes': 'origin',
+        }),
+    ])
+
+
+class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema, NxosStructured):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
@@ -1733,6 +1760,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'path_type',
       'weight']
 
+    json_mapping = [
+        Table('vrf', path=['vrf', Key('vrf-name-out'), 'address_family'], tables=[
+            Table('afi', tables=[
+                Table('safi', path=[Key('af-name', str.lower)], fields={
+                    'bgp_table_version': ('table-version', integer),
+                    'local_router_id': 'vrf-router-id',
+                }, tables=[
+                    # The prefixes of the vpn address families are by route
+                    # distinguisher
+                    Table('rd', fields={
+                        'route_distinguisher': 'rd_val',
+                        'default_vrf': 'rd_vrf',
+                    }, tables=[_bgp_prefixes()]),
+                    _bgp_prefixes(),
+                ]),
+            ]),
+        ]),
+    ]
+
     def cli(self, vrf='all', address_family='all', output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(vrf=vrf,
@@ -2336,7 +2382,7 @@ class ShowBgpVrfAllNeighborsSchema(MetaParser):
 # ==============================================
 # Parser for 'show bgp vrf <vrf> all neighbors'
 # ==============================================
-class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
+class ShowBgpVrfAllNeighbors(ProjectedParser, ShowBgpVrfAllNeighborsSchema):
     """Parser for:
         show bgp vrf <vrf> all neighbors
         parser class - implements detail parsing mechanisms for cli and yang output.
@@ -2365,7 +2411,8 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
       'tbl_ver',
       'msg_rcvd']
 
-    def cli(self, vrf='all', address_family='all', neighbor='', output=None):
+    def cli(self, vrf='all', address_family='all', neighbor='', output=None,
+            fields=None):
         if output is None:
             if neighbor:
                 out = self.device.execute(self.cli_command[1].format(vrf=vrf,
@@ -2383,6 +2430,8 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
         # Init vars
         parsed_dict = {}
         standard_send_community = False
+        neighbor_id = None
+        session_state = None
 
         p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
                             ' +remote +AS +(?P<remote_as>[0-9]+),'
@@ -2508,694 +2557,659 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                             ' +port *: +(?P<foreign_port>[0-9]+)$')
         p51 = re.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
         p52 = re.compile(r'^\s*Route reflector client$')
-            
-        for line in out.splitlines():
-            line = line.rstrip()
-
-            # BGP neighbor is 10.16.2.2,  remote AS 100, ibgp link,  Peer index 1
-            # BGP neighbor is 10.16.2.5,  remote AS 200, local AS 333, ebgp link,  Peer index 2
-            # BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index 2
-            m = p1.match(line)
-            if m:
-                standard_send_community = False
-                if 'neighbor' not in parsed_dict:
-                    parsed_dict['neighbor'] = {}
-                neighbor_id = str(m.groupdict()['neighbor_id'])
-                if neighbor_id not in parsed_dict['neighbor']:
-                    parsed_dict['neighbor'][neighbor_id] = {}
-                    remote_as = m.groupdict()['remote_as']
-                    peer_fab_type = m.groupdict()['peer_fab_type']
-                    if remote_as != None:
-                        parsed_dict['neighbor'][neighbor_id]['remote_as'] = \
-                            int(m.groupdict()['remote_as'])
-                    if peer_fab_type != None:
-                        parsed_dict['neighbor'][neighbor_id]['peer_fab_type'] = \
-                            peer_fab_type
-                    parsed_dict['neighbor'][neighbor_id]['local_as'] = \
-                        str(m.groupdict()['local_as'])
-                    parsed_dict['neighbor'][neighbor_id]['link'] = \
-                        str(m.groupdict()['link'])
-                    parsed_dict['neighbor'][neighbor_id]['peer_index'] = \
-                        int(m.groupdict()['peer_index'])
-                    continue
-
-            # Description: nei_desc
-            m = p2.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['description'] = \
-                        str(m.groupdict()['description'])
-                continue
-
-            # BGP version 4, remote router ID 10.16.2.2
-            m = p3.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['bgp_version'] = \
-                        int(m.groupdict()['bgp_version'])
-                parsed_dict['neighbor'][neighbor_id]['router_id'] = \
-                        str(m.groupdict()['router_id'])
-                continue
 
-            # BGP state = Established, up for 5w0d
-            # BGP state = Idle, down for 4w6d, retry in 0.000000
-            # BGP state = Shut (Admin), down for 5w0d
-            m = p4.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['session_state'] = \
-                        str(m.groupdict()['session_state']).lower()
-                if m.groupdict()['reason']:
-                    parsed_dict['neighbor'][neighbor_id]['state_reason'] = \
-                        str(m.groupdict()['reason']).lower()
-                parsed_dict['neighbor'][neighbor_id]['up_time'] = \
-                        str(m.groupdict()['up_time'])
-                parsed_dict['neighbor'][neighbor_id]['retry_time'] = \
-                        str(m.groupdict()['retry_time'])
-                session_state = str(m.groupdict()['session_state'])
-                if 'Shut' in session_state or 'shut' in session_state:
-                    parsed_dict['neighbor'][neighbor_id]['shutdown'] = True
-                else:
-                    parsed_dict['neighbor'][neighbor_id]['shutdown'] = False
-                    continue
-
-            # Using loopback0 as update source for this peer
-            m = p5.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['update_source'] = \
-                        str(m.groupdict()['update_source'])
-                continue
-
-            # BFD live-detection is configured
-            # BFD live-detection is configured and enabled, state is Up
-            m = p6.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['bfd_live_detection'] = \
-                    True
-                if m.groupdict()['bfd_enabled'] and \
-                   m.groupdict()['bfd_enabled'].lower() == 'enabled':
-                    parsed_dict['neighbor'][neighbor_id]['bfd_enabled'] = True
-                if m.groupdict()['bfd_state']:
-                    parsed_dict['neighbor'][neighbor_id]['bfd_state'] = \
-                        m.groupdict()['bfd_state'].lower()
-                continue
-
-            # Neighbor local-as command not active
-            m = p7.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['nbr_local_as_cmd'] = \
-                        str(m.groupdict()['nbr_local_as_cmd'])
-                continue
+        projection = project(self, fields)
+
+        dispatcher = LineDispatcher()
+
+        # BGP neighbor is 10.16.2.2,  remote AS 100, ibgp link,  Peer index 1
+        # BGP neighbor is 10.16.2.5,  remote AS 200, local AS 333, ebgp link,  Peer index 2
+        # BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index 2
+        @dispatcher.rule(p1)
+        def handle_p1(m):
+            nonlocal neighbor_id, standard_send_community
+            standard_send_community = False
+            if 'neighbor' not in parsed_dict:
+                parsed_dict['neighbor'] = {}
+            neighbor_id = str(m.groupdict()['neighbor_id'])
+            if neighbor_id not in parsed_dict['neighbor']:
+                parsed_dict['neighbor'][neighbor_id] = {}
+                remote_as = m.groupdict()['remote_as']
+                peer_fab_type = m.groupdict()['peer_fab_type']
+                if remote_as != None:
+                    parsed_dict['neighbor'][neighbor_id]['remote_as'] = \
+                        int(m.groupdict()['remote_as'])
+                if peer_fab_type != None:
+                    parsed_dict['neighbor'][neighbor_id]['peer_fab_type'] = \
+                        peer_fab_type
+                parsed_dict['neighbor'][neighbor_id]['local_as'] = \
+                    str(m.groupdict()['local_as'])
+                parsed_dict['neighbor'][neighbor_id]['link'] = \
+                    str(m.groupdict()['link'])
+                parsed_dict['neighbor'][neighbor_id]['peer_index'] = \
+                    int(m.groupdict()['peer_index'])
+                return
+            return FALLTHROUGH
+
+        # Description: nei_desc
+        @dispatcher.rule(p2, keys=['description'])
+        def handle_p2(m):
+            parsed_dict['neighbor'][neighbor_id]['description'] = \
+                    str(m.groupdict()['description'])
+
+        # BGP version 4, remote router ID 10.16.2.2
+        @dispatcher.rule(p3, keys=['bgp_version', 'router_id'])
+        def handle_p3(m):
+            parsed_dict['neighbor'][neighbor_id]['bgp_version'] = \
+                    int(m.groupdict()['bgp_version'])
+            parsed_dict['neighbor'][neighbor_id]['router_id'] = \
+                    str(m.groupdict()['router_id'])
 
-            # Last read 00:00:24, hold time = 99, keepalive interval is 33 seconds
-            # Last read never, hold time = 180, keepalive interval is 60 seconds
-            # Last read never, hold time = 45, keepalive interval is 15 seconds
-            m = p8.match(line)
-            if m:
-                if 'bgp_negotiated_keepalive_timers' not in \
-                    parsed_dict['neighbor'][neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_negotiated_keepalive_timers'] = {}
+        # BGP state = Established, up for 5w0d
+        # BGP state = Idle, down for 4w6d, retry in 0.000000
+        # BGP state = Shut (Admin), down for 5w0d
+        @dispatcher.rule(p4)
+        def handle_p4(m):
+            nonlocal session_state
+            parsed_dict['neighbor'][neighbor_id]['session_state'] = \
+                    str(m.groupdict()['session_state']).lower()
+            if m.groupdict()['reason']:
+                parsed_dict['neighbor'][neighbor_id]['state_reason'] = \
+                    str(m.groupdict()['reason']).lower()
+            parsed_dict['neighbor'][neighbor_id]['up_time'] = \
+                    str(m.groupdict()['up_time'])
+            parsed_dict['neighbor'][neighbor_id]['retry_time'] = \
+                    str(m.groupdict()['retry_time'])
+            session_state = str(m.groupdict()['session_state'])
+            if 'Shut' in session_state or 'shut' in session_state:
+                parsed_dict['neighbor'][neighbor_id]['shutdown'] = True
+                return FALLTHROUGH
+            parsed_dict['neighbor'][neighbor_id]['shutdown'] = False
+
+        # Using loopback0 as update source for this peer
+        @dispatcher.rule(p5, keys=['update_source'])
+        def handle_p5(m):
+            parsed_dict['neighbor'][neighbor_id]['update_source'] = \
+                    str(m.groupdict()['update_source'])
+
+        # BFD live-detection is configured
+        # BFD live-detection is configured and enabled, state is Up
+        @dispatcher.rule(p6, keys=['bfd_live_detection', 'bfd_enabled',
+                                   'bfd_state'])
+        def handle_p6(m):
+            parsed_dict['neighbor'][neighbor_id]['bfd_live_detection'] = \
+                True
+            if m.groupdict()['bfd_enabled'] and \
+               m.groupdict()['bfd_enabled'].lower() == 'enabled':
+                parsed_dict['neighbor'][neighbor_id]['bfd_enabled'] = True
+            if m.groupdict()['bfd_state']:
+                parsed_dict['neighbor'][neighbor_id]['bfd_state'] = \
+                    m.groupdict()['bfd_state'].lower()
+
+        # Neighbor local-as command not active
+        @dispatcher.rule(p7, keys=['nbr_local_as_cmd'])
+        def handle_p7(m):
+            parsed_dict['neighbor'][neighbor_id]['nbr_local_as_cmd'] = \
+                    str(m.groupdict()['nbr_local_as_cmd'])
+
+        # Last read 00:00:24, hold time = 99, keepalive interval is 33 seconds
+        # Last read never, hold time = 180, keepalive interval is 60 seconds
+        # Last read never, hold time = 45, keepalive interval is 15 seconds
+        @dispatcher.rule(p8, keys=['bgp_negotiated_keepalive_timers',
+                                   'last_read', 'keepalive_interval',
+                                   'hold_time'])
+        def handle_p8(m):
+            if 'bgp_negotiated_keepalive_timers' not in \
+                parsed_dict['neighbor'][neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_keepalive_timers']['last_read'] = \
-                        str(m.groupdict()['last_read'])
+                    ['bgp_negotiated_keepalive_timers'] = {}
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_keepalive_timers']['last_read'] = \
+                    str(m.groupdict()['last_read'])
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_keepalive_timers']['keepalive_interval'] = \
+                    int(m.groupdict()['keepalive_interval'])
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_keepalive_timers']['hold_time'] = \
+                    int(m.groupdict()['holdtime'])
+
+        # Last written 00:00:02, keepalive timer expiry due 00:00:30
+        # Last written never, keepalive timer not running
+        @dispatcher.rule(p9, keys=['bgp_negotiated_keepalive_timers',
+                                   'last_written', 'keepalive_timer'])
+        def handle_p9(m):
+            if 'bgp_negotiated_keepalive_timers' not in \
+                parsed_dict['neighbor'][neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_keepalive_timers']['keepalive_interval'] = \
-                        int(m.groupdict()['keepalive_interval'])
+                    ['bgp_negotiated_keepalive_timers'] = {}
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_keepalive_timers']['last_written'] = \
+                    str(m.groupdict()['last_written'])
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_keepalive_timers']['keepalive_timer'] = \
+                    str(m.groupdict()['keepalive_timer'])
+
+        # Inherits session configuration from session-template PEER-SESSION
+        @dispatcher.rule(p10, keys=['inherit_peer_session'])
+        def handle_p10(m):
+            parsed_dict['neighbor'][neighbor_id]['inherit_peer_session'] = \
+                str(m.groupdict()['template'])
+
+        # Connected check is disabled
+        @dispatcher.rule(p11, keys=['disable_connected_check'])
+        def handle_p11(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['disable_connected_check'] = True
+
+        # Private AS numbers removed from updates sent to this neighbor
+        @dispatcher.rule(p11_2, keys=['remove_private_as'])
+        def handle_p11_2(m):
+            parsed_dict['neighbor'][neighbor_id]['remove_private_as'] = True
+
+        # External BGP peer might be upto 255 hops away
+        # External BGP peer might be up to 5 hops away
+        @dispatcher.rule(p12_1, p12_2, keys=['ebgp_multihop',
+                                             'ebgp_multihop_max_hop'])
+        def handle_p12(m):
+            parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
+            parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
+                int(m.groupdict()['ebgp_multihop_max_hop'])
+
+        # TCP MD5 authentication is enabled
+        # TCP MD5 authentication is set (disabled)
+        @dispatcher.rule(p13, keys=['tcp_md5_auth', 'tcp_md5_auth_config'])
+        def handle_p13(m):
+            parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth'] = \
+                str(m.groupdict()['tcp_md5_auth'])
+            parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth_config'] = \
+                str(m.string).strip()
+
+        # Only passive connection setup allowed
+        @dispatcher.rule(p14, keys=['bgp_session_transport', 'connection',
+                                    'mode'])
+        def handle_p14(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_keepalive_timers']['hold_time'] = \
-                        int(m.groupdict()['holdtime'])
-                continue
-
-            # Last written 00:00:02, keepalive timer expiry due 00:00:30
-            # Last written never, keepalive timer not running
-            m = p9.match(line)
-            if m:
-                if 'bgp_negotiated_keepalive_timers' not in \
-                    parsed_dict['neighbor'][neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_negotiated_keepalive_timers'] = {}
+                    ['bgp_session_transport'] = {}
+            if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_keepalive_timers']['last_written'] = \
-                        str(m.groupdict()['last_written'])
+                    ['bgp_session_transport']['connection'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['mode'] = 'passive'
+
+        # Received 92717 messages, 3 notifications, 0 bytes in queue
+        @dispatcher.rule(p15, keys=['received_messages',
+                                    'received_notifications',
+                                    'received_bytes_queue'])
+        def handle_p15(m):
+            parsed_dict['neighbor'][neighbor_id]['received_messages'] = \
+                int(m.groupdict()['received_messages'])
+            parsed_dict['neighbor'][neighbor_id]['received_notifications'] = \
+                int(m.groupdict()['received_notifications'])
+            parsed_dict['neighbor'][neighbor_id]['received_bytes_queue'] = \
+                int(m.groupdict()['received_bytes'])
+
+        # Sent 92730 messages, 5 notifications, 0 bytes in queue
+        @dispatcher.rule(p16, keys=['sent_messages', 'sent_notifications',
+                                    'sent_bytes_queue'])
+        def handle_p16(m):
+            parsed_dict['neighbor'][neighbor_id]['sent_messages'] = \
+                int(m.groupdict()['sent_messages'])
+            parsed_dict['neighbor'][neighbor_id]['sent_notifications'] = \
+                int(m.groupdict()['sent_notifications'])
+            parsed_dict['neighbor'][neighbor_id]['sent_bytes_queue'] = \
+                int(m.groupdict()['sent_bytes_queue'])
+
+        # Connections established 9, dropped 8
+        @dispatcher.rule(p17, keys=['bgp_session_transport', 'connection',
+                                    'established', 'dropped'])
+        def handle_p17(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_keepalive_timers']['keepalive_timer'] = \
-                        str(m.groupdict()['keepalive_timer'])
-                continue
-
-            # Inherits session configuration from session-template PEER-SESSION
-            m = p10.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['inherit_peer_session'] = \
-                    str(m.groupdict()['template'])
-                continue
-
-            # Connected check is disabled
-            m = p11.match(line)
-            if m:
+                    ['bgp_session_transport'] = {}
+            if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['disable_connected_check'] = True
-                continue
-
-            # Private AS numbers removed from updates sent to this neighbor
-            m = p11_2.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['remove_private_as'] = True
-                continue
-
-            # External BGP peer might be upto 255 hops away
-            m = p12_1.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
-                parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
-                    int(m.groupdict()['ebgp_multihop_max_hop'])
-                continue
-
-            # External BGP peer might be up to 5 hops away
-            m = p12_2.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
-                parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
-                    int(m.groupdict()['ebgp_multihop_max_hop'])
-                continue
-
-            # TCP MD5 authentication is enabled
-            # TCP MD5 authentication is set (disabled)
-            m = p13.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth'] = \
-                    str(m.groupdict()['tcp_md5_auth'])
-                parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth_config'] = \
-                    str(line).strip()
-                continue
-            
-            # Only passive connection setup allowed
-            m = p14.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['connection'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['mode'] = 'passive'
-                continue
-
-            # Received 92717 messages, 3 notifications, 0 bytes in queue
-            m = p15.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['received_messages'] = \
-                    int(m.groupdict()['received_messages'])
-                parsed_dict['neighbor'][neighbor_id]['received_notifications'] = \
-                    int(m.groupdict()['received_notifications'])
-                parsed_dict['neighbor'][neighbor_id]['received_bytes_queue'] = \
-                    int(m.groupdict()['received_bytes'])
-                continue
-
-            # Sent 92730 messages, 5 notifications, 0 bytes in queue
-            m = p16.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['sent_messages'] = \
-                    int(m.groupdict()['sent_messages'])
-                parsed_dict['neighbor'][neighbor_id]['sent_notifications'] = \
-                    int(m.groupdict()['sent_notifications'])
-                parsed_dict['neighbor'][neighbor_id]['sent_bytes_queue'] = \
-                    int(m.groupdict()['sent_bytes_queue'])
-                continue
-
-            # Connections established 9, dropped 8
-            m = p17.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['connection'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['established'] = \
-                        int(m.groupdict()['esablished'])
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['dropped'] = int(m.groupdict()['dropped'])
-                continue
-
-            # Connections attempts 0
-            m = p17.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['connection'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['attemps'] = int(m.groupdict()['attemps'])
-                continue
-
-            # Last reset by us 5w0d, due to session cleared
-            # Last reset by peer 5w0d, due to session cleared
-            # Last reset by us never, due to No error
-            m = p18.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['connection'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['last_reset'] = \
-                        str(m.groupdict()['last_reset']).lower()
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['reset_reason'] = \
-                        str(m.groupdict()['reset_reason']).lower()
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['connection']['reset_by'] = \
-                        str(m.groupdict()['reset_by']).lower()
-                continue
-
-            # Neighbor capabilities:
-            m = p19.match(line)
-            if m:
-                if 'bgp_negotiated_capabilities' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_negotiated_capabilities'] = {}
-                continue
-
-            # Dynamic capability: advertised (mp, refresh, gr) received (mp, refresh, gr)
-            m = p20_1.match(line)
-            if m:
+                    ['bgp_session_transport']['connection'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['established'] = \
+                    int(m.groupdict()['esablished'])
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['dropped'] = int(m.groupdict()['dropped'])
+
+        # Last reset by us 5w0d, due to session cleared
+        # Last reset by peer 5w0d, due to session cleared
+        # Last reset by us never, due to No error
+        @dispatcher.rule(p18, keys=['bgp_session_transport', 'connection',
+                                    'last_reset', 'reset_reason',
+                                    'reset_by'])
+        def handle_p18(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['dynamic_capability'] = \
-                        str(m.groupdict()['dynamic_capability'])
-                continue
-
-            # Dynamic capability (old): advertised received
-            m = p20_2.match(line)
-            if m:
+                    ['bgp_session_transport'] = {}
+            if 'connection' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['dynamic_capability_old'] = \
-                        str(m.groupdict()['dynamic_capability_old'])
-                continue
+                    ['bgp_session_transport']['connection'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['last_reset'] = \
+                    str(m.groupdict()['last_reset']).lower()
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['reset_reason'] = \
+                    str(m.groupdict()['reset_reason']).lower()
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['connection']['reset_by'] = \
+                    str(m.groupdict()['reset_by']).lower()
 
-            # Route refresh capability (new): advertised received
-            m = p21.match(line)
-            if m:
+        # Neighbor capabilities:
+        # The capabilities are set in the dict created here
+        @dispatcher.rule(p19, keys=['bgp_negotiated_capabilities',
+                                    'dynamic_capability',
+                                    'dynamic_capability_old',
+                                    'route_refresh', 'route_refresh_old',
+                                    'vpnv4_unicast', 'vpnv6_unicast',
+                                    'ipv4_mvpn', 'graceful_restart'])
+        def handle_p19(m):
+            if 'bgp_negotiated_capabilities' not in parsed_dict['neighbor']\
+                [neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['route_refresh'] = \
-                        str(m.groupdict()['route_refresh'])
-                continue
+                    ['bgp_negotiated_capabilities'] = {}
 
-            # Route refresh capability (old): advertised received 
-            m = p21_1.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['route_refresh_old'] = \
-                        str(m.groupdict()['route_refresh_old'])
-                continue
+        # Dynamic capability: advertised (mp, refresh, gr) received (mp, refresh, gr)
+        @dispatcher.rule(p20_1, keys=['dynamic_capability'])
+        def handle_p20_1(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['dynamic_capability'] = \
+                    str(m.groupdict()['dynamic_capability'])
 
-            # 4-Byte AS capability: disabled
-            # 4-Byte AS capability: disabled received
-            m = p22.match(line)
-            if m:
-                if 'disabled' in m.groupdict()['capability']:
-                    parsed_dict['neighbor'][neighbor_id]['suppress_four_byte_as_capability'] = True
-                continue
+        # Dynamic capability (old): advertised received
+        @dispatcher.rule(p20_2, keys=['dynamic_capability_old'])
+        def handle_p20_2(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['dynamic_capability_old'] = \
+                    str(m.groupdict()['dynamic_capability_old'])
 
-            # Address family VPNv4 Unicast: advertised received
-            m = p23.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['vpnv4_unicast'] = \
-                        str(m.groupdict()['vpnv4_unicast'])
-                continue
+        # Route refresh capability (new): advertised received
+        @dispatcher.rule(p21, keys=['route_refresh'])
+        def handle_p21(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['route_refresh'] = \
+                    str(m.groupdict()['route_refresh'])
 
-            # Address family VPNv6 Unicast: advertised received 
-            m = p24.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['vpnv6_unicast'] = \
-                        str(m.groupdict()['vpnv6_unicast'])
-                continue
+        # Route refresh capability (old): advertised received
+        @dispatcher.rule(p21_1, keys=['route_refresh_old'])
+        def handle_p21_1(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['route_refresh_old'] = \
+                    str(m.groupdict()['route_refresh_old'])
+
+        # 4-Byte AS capability: disabled
+        # 4-Byte AS capability: disabled received
+        @dispatcher.rule(p22, keys=['suppress_four_byte_as_capability'])
+        def handle_p22(m):
+            if 'disabled' in m.groupdict()['capability']:
+                parsed_dict['neighbor'][neighbor_id]['suppress_four_byte_as_capability'] = True
+
+        # Address family VPNv4 Unicast: advertised received
+        @dispatcher.rule(p23, keys=['vpnv4_unicast'])
+        def handle_p23(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['vpnv4_unicast'] = \
+                    str(m.groupdict()['vpnv4_unicast'])
+
+        # Address family VPNv6 Unicast: advertised received
+        @dispatcher.rule(p24, keys=['vpnv6_unicast'])
+        def handle_p24(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['vpnv6_unicast'] = \
+                    str(m.groupdict()['vpnv6_unicast'])
+
+        # Address family IPv4 MVPN: advertised received
+        @dispatcher.rule(p24_1, keys=['ipv4_mvpn'])
+        def handle_p24_1(m):
+            parsed_dict['neighbor'][neighbor_id] \
+                ['bgp_negotiated_capabilities']['ipv4_mvpn'] = \
+                str(m.groupdict()['ipv4_mvpn'])
 
-            # Address family IPv4 MVPN: advertised received
-            m = p24_1.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id] \
-                    ['bgp_negotiated_capabilities']['ipv4_mvpn'] = \
-                    str(m.groupdict()['ipv4_mvpn'])
-                continue
+        # Graceful Restart capability: advertised received
+        @dispatcher.rule(p25, keys=['graceful_restart'])
+        def handle_p25(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_negotiated_capabilities']['graceful_restart'] = \
+                    str(m.groupdict()['graceful_restart'])
 
-            # Graceful Restart capability: advertised received
-            m = p25.match(line)
-            if m:
+        # Graceful Restart Parameters:
+        @dispatcher.rule(p26)
+        def handle_p26(m):
+            if 'graceful_restart_paramters' not in \
+                parsed_dict['neighbor'][neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_negotiated_capabilities']['graceful_restart'] = \
-                        str(m.groupdict()['graceful_restart'])
-                continue
+                    ['graceful_restart_paramters'] = {}
+                return
+            return FALLTHROUGH
 
-            # Graceful Restart Parameters:
-            m = p26.match(line)
-            if m:
-                if 'graceful_restart_paramters' not in \
-                    parsed_dict['neighbor'][neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['graceful_restart_paramters'] = {}
-                    continue
+        # Address families advertised to peer:
+        # VPNv4 Unicast  VPNv6 Unicast
+        # Address families received from peer:
+        # VPNv4 Unicast  VPNv6 Unicast
+        @dispatcher.rule(p27_1, p27_2)
+        def handle_p27(m):
+            pass
 
-            # Address families advertised to peer:
-            # VPNv4 Unicast  VPNv6 Unicast 
-            m = p27_1.match(line)
-            if m:
-                continue
+        # Forwarding state preserved by peer for:
+        # Restart time advertised to peer: 240 seconds
+        @dispatcher.rule(p28_1, keys=['graceful_restart_paramters',
+                                      'restart_time_advertised_to_peer_seconds'])
+        def handle_p28_1(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['graceful_restart_paramters']\
+                    ['restart_time_advertised_to_peer_seconds'] = \
+                        int(m.groupdict()['time'])
 
-            # Address families received from peer:
-            # VPNv4 Unicast  VPNv6 Unicast  
-            m = p27_2.match(line)
-            if m:
-                continue
+        # Restart time advertised by peer: 120 seconds
+        @dispatcher.rule(p28_2, keys=['graceful_restart_paramters',
+                                      'restart_time_advertised_by_peer_seconds'])
+        def handle_p28_2(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['graceful_restart_paramters']\
+                    ['restart_time_advertised_by_peer_seconds'] = \
+                        int(m.groupdict()['time'])
+
+        # Stale time for routes advertised by peer: 600 seconds
+        @dispatcher.rule(p28, keys=['graceful_restart_paramters',
+                                    'stale_time_advertised_by_peer_seconds'])
+        def handle_p28(m):
+            parsed_dict['neighbor'][neighbor_id]\
+                ['graceful_restart_paramters']\
+                    ['stale_time_advertised_by_peer_seconds'] = \
+                        int(m.groupdict()['time'])
 
-            # Forwarding state preserved by peer for:
-            # Restart time advertised to peer: 240 seconds
-            m = p28_1.match(line)
-            if m:
+        # Message statistics:
+        #                         Sent               Rcvd
+        # Opens:                         9                  9
+        # Notifications:                 5                  3
+        # Updates:                      50                 38
+        # Keepalives:                92663              92661
+        # Route Refresh:                 2                  5
+        # Capability:                    1                  1
+        # Total:                     92730              92717
+        # Total bytes:             1763812            1763099
+        # Bytes in queue:                0                  0
+        @dispatcher.rule(p30, keys=['bgp_neighbor_counters', 'messages',
+                                    'sent', 'received'])
+        def handle_p30(m):
+            if 'bgp_neighbor_counters' not in parsed_dict['neighbor']\
+                [neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['graceful_restart_paramters']\
-                        ['restart_time_advertised_to_peer_seconds'] = \
-                            int(m.groupdict()['time'])
-                continue
-
-            # Restart time advertised by peer: 120 seconds
-            m = p28_2.match(line)
-            if m:
+                    ['bgp_neighbor_counters'] = {}
+            if 'messages' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_neighbor_counters']:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['graceful_restart_paramters']\
-                        ['restart_time_advertised_by_peer_seconds'] = \
-                            int(m.groupdict()['time'])
-                continue
-
-            # Stale time for routes advertised by peer: 600 seconds
-            m = p28.match(line)
-            if m:
+                    ['bgp_neighbor_counters']['messages'] = {}
+            if 'sent' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_neighbor_counters']['messages']:
                 parsed_dict['neighbor'][neighbor_id]\
-                    ['graceful_restart_paramters']\
-                        ['stale_time_advertised_by_peer_seconds'] = \
-                            int(m.groupdict()['time'])
-                continue
-
-            # Message statistics:
-            #                         Sent               Rcvd
-            # Opens:                         9                  9  
-            # Notifications:                 5                  3  
-            # Updates:                      50                 38  
-            # Keepalives:                92663              92661  
-            # Route Refresh:                 2                  5  
-            # Capability:                    1                  1  
-            # Total:                     92730              92717  
-            # Total bytes:             1763812            1763099  
-            # Bytes in queue:                0                  0
-            m = p30.match(line)
-            if m:
-                if 'bgp_neighbor_counters' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters'] = {}
-                if 'messages' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_neighbor_counters']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters']['messages'] = {}
-                if 'sent' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_neighbor_counters']['messages']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters']['messages']['sent'] = {}
-                if 'received' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_neighbor_counters']['messages']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters']['messages']['received'] = {}
-                message_stat = str(m.groupdict()['message_stat']).lower()
-                message_stat = message_stat.replace(" ", "_")
-                sent = int(m.groupdict()['sent'])
-                received = int(m.groupdict()['received'])
-                if message_stat not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_neighbor_counters']['messages']['sent']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters']['messages']['sent']\
-                        [message_stat] = sent
-                if message_stat not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_neighbor_counters']['messages']['received']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_neighbor_counters']['messages']['received']\
-                        [message_stat] = received
-                continue
-
-            # For address family: VPNv4 Unicast
-            m = p31.match(line)
-            if m:
-                if 'address_family' not in  parsed_dict['neighbor'][neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]['address_family'] = {}
-                address_family = str(m.groupdict()['af']).lower()
-                
-                if address_family not in parsed_dict['neighbor'][neighbor_id]\
-                    ['address_family']:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family] = {}
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['session_state'] = session_state.lower()
-                if 'state_reason' in parsed_dict['neighbor'][neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['state_reason'] = \
-                        parsed_dict['neighbor'][neighbor_id]['state_reason']
-                continue
-
-            # BGP table version 48, neighbor version 48
-            m = p32.match(line)
-            if m:
-                standard_send_community = False
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['bgp_table_version'] = \
-                        int(m.groupdict()['af_bgp_table_version'])
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['neighbor_version'] = \
-                        int(m.groupdict()['nbr_version'])
-                continue
-
-            # 1 accepted paths consume 48 bytes of memory
-            m = p33.match(line)
-            if m:
-                if 'path' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['address_family'][address_family]:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['path'] = {}
-                accepted_paths = int(m.groupdict()['accepted_paths'])
-                memory_usage = int(m.groupdict()['bytes_consumed'])
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['path']['accepted_paths'] = accepted_paths
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['path']['memory_usage'] = memory_usage
-                continue
-
-            # 2 sent paths
-            m = p34.match(line)
-            if m:
-                if 'path' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['address_family'][address_family]:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['path'] = {}
-                total_entries = int(m.groupdict()['num_sent_paths'])
+                    ['bgp_neighbor_counters']['messages']['sent'] = {}
+            if 'received' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_neighbor_counters']['messages']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_neighbor_counters']['messages']['received'] = {}
+            message_stat = str(m.groupdict()['message_stat']).lower()
+            message_stat = message_stat.replace(" ", "_")
+            sent = int(m.groupdict()['sent'])
+            received = int(m.groupdict()['received'])
+            if message_stat not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_neighbor_counters']['messages']['sent']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_neighbor_counters']['messages']['sent']\
+                    [message_stat] = sent
+            if message_stat not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_neighbor_counters']['messages']['received']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_neighbor_counters']['messages']['received']\
+                    [message_stat] = received
+
+        # For address family: VPNv4 Unicast
+        @dispatcher.rule(p31)
+        def handle_p31(m):
+            nonlocal address_family
+            if 'address_family' not in  parsed_dict['neighbor'][neighbor_id]:
+                parsed_dict['neighbor'][neighbor_id]['address_family'] = {}
+            address_family = str(m.groupdict()['af']).lower()
+
+            if address_family not in parsed_dict['neighbor'][neighbor_id]\
+                ['address_family']:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['path']['total_entries'] = total_entries
-                continue
-            
-            # Community attribute sent to this neighbor
-            m = p35.match(line)
-            if m:
-                standard_send_community = True
-                parsed_dict['neighbor'][neighbor_id]['address_family'] \
-                    [address_family]['send_community'] = 'standard'
-                continue
-
-            # Extended community attribute sent to this neighbor
-            m = p36.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['address_family'] \
-                    [address_family]['send_community'] = 'extended'
-
-                if standard_send_community:
-                    parsed_dict['neighbor'][neighbor_id]['address_family'] \
-                        [address_family]['send_community'] = 'both'
-                continue
-
-            # Maximum prefixes allowed 300000
-            m = p37.match(line)
-            if m:
+                    [address_family] = {}
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['session_state'] = session_state.lower()
+            if 'state_reason' in parsed_dict['neighbor'][neighbor_id]:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['maximum_prefix_max_prefix_no'] = \
-                        int(m.groupdict()['num'])
-                continue
-
-            # Inbound route-map configured is genie_redistribution, handle obtained
-            m = p38.match(line)
-            if m:
+                [address_family]['state_reason'] = \
+                    parsed_dict['neighbor'][neighbor_id]['state_reason']
+
+        # BGP table version 48, neighbor version 48
+        # The community flag is reset for send_community
+        @dispatcher.rule(p32, keys=['bgp_table_version', 'neighbor_version',
+                                    'send_community'])
+        def handle_p32(m):
+            nonlocal standard_send_community
+            standard_send_community = False
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['bgp_table_version'] = \
+                    int(m.groupdict()['af_bgp_table_version'])
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['neighbor_version'] = \
+                    int(m.groupdict()['nbr_version'])
+
+        # 1 accepted paths consume 48 bytes of memory
+        @dispatcher.rule(p33, keys=['path', 'accepted_paths', 'memory_usage'])
+        def handle_p33(m):
+            if 'path' not in parsed_dict['neighbor'][neighbor_id]\
+                ['address_family'][address_family]:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['route_map_name_in'] = \
-                        str(m.groupdict()['route_map_name_in'])
-                continue
-
-            # Outbound route-map configured is genie_redistribution, handle obtained
-            m = p39.match(line)
-            if m:
+                    [address_family]['path'] = {}
+            accepted_paths = int(m.groupdict()['accepted_paths'])
+            memory_usage = int(m.groupdict()['bytes_consumed'])
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['path']['accepted_paths'] = accepted_paths
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['path']['memory_usage'] = memory_usage
+
+        # 2 sent paths
+        @dispatcher.rule(p34, keys=['path', 'total_entries'])
+        def handle_p34(m):
+            if 'path' not in parsed_dict['neighbor'][neighbor_id]\
+                ['address_family'][address_family]:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['route_map_name_out'] = \
-                        str(m.groupdict()['route_map_name_out'])
-                continue
+                    [address_family]['path'] = {}
+            total_entries = int(m.groupdict()['num_sent_paths'])
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['path']['total_entries'] = total_entries
 
-            # Third-party Nexthop will not be computed.
-            m = p40.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['third_party_nexthop'] = True
-                continue
-            
-            # SOO Extcommunity: SOO:100:100
-            m = p41.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['soo'] = str(m.groupdict()['soo'])
-                continue
+        # Community attribute sent to this neighbor
+        @dispatcher.rule(p35, keys=['send_community'])
+        def handle_p35(m):
+            nonlocal standard_send_community
+            standard_send_community = True
+            parsed_dict['neighbor'][neighbor_id]['address_family'] \
+                [address_family]['send_community'] = 'standard'
 
-            # Inbound soft reconfiguration allowed
-            m = p42.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['soft_configuration'] = True
-                continue
+        # Extended community attribute sent to this neighbor
+        @dispatcher.rule(p36, keys=['send_community'])
+        def handle_p36(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family'] \
+                [address_family]['send_community'] = 'extended'
 
-            # Nexthop always set to local peering address, 0.0.0.0
-            # Nexthop set to local peering address, 0.0.0.0
-            m = p43.match(line)
-            if m:
+            if standard_send_community:
+                parsed_dict['neighbor'][neighbor_id]['address_family'] \
+                    [address_family]['send_community'] = 'both'
+
+        # Maximum prefixes allowed 300000
+        @dispatcher.rule(p37, keys=['maximum_prefix_max_prefix_no'])
+        def handle_p37(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['maximum_prefix_max_prefix_no'] = \
+                    int(m.groupdict()['num'])
+
+        # Inbound route-map configured is genie_redistribution, handle obtained
+        @dispatcher.rule(p38, keys=['route_map_name_in'])
+        def handle_p38(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['route_map_name_in'] = \
+                    str(m.groupdict()['route_map_name_in'])
+
+        # Outbound route-map configured is genie_redistribution, handle obtained
+        @dispatcher.rule(p39, keys=['route_map_name_out'])
+        def handle_p39(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['route_map_name_out'] = \
+                    str(m.groupdict()['route_map_name_out'])
+
+        # Third-party Nexthop will not be computed.
+        @dispatcher.rule(p40, keys=['third_party_nexthop'])
+        def handle_p40(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['third_party_nexthop'] = True
+
+        # SOO Extcommunity: SOO:100:100
+        @dispatcher.rule(p41, keys=['soo'])
+        def handle_p41(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['soo'] = str(m.groupdict()['soo'])
+
+        # Inbound soft reconfiguration allowed
+        @dispatcher.rule(p42, keys=['soft_configuration'])
+        def handle_p42(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['soft_configuration'] = True
+
+        # Nexthop always set to local peering address, 0.0.0.0
+        # Nexthop set to local peering address, 0.0.0.0
+        @dispatcher.rule(p43, keys=['next_hop_self'])
+        def handle_p43(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['next_hop_self'] = True
+
+        # Allow my ASN 9 times
+        @dispatcher.rule(p44, keys=['as_override_count'])
+        def handle_p44(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['as_override_count'] = \
+                    int(m.groupdict()['num'])
+
+        # ASN override is enabled
+        @dispatcher.rule(p45, keys=['as_override'])
+        def handle_p45(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['as_override'] = True
+
+        # Default information originate, default not sent
+        # Default information originate, default sent
+        # Default information originate, route-map SOMENAME, default not sent
+        @dispatcher.rule(p46, keys=['default_originate',
+                                    'default_originate_route_map'])
+        def handle_p46(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['default_originate'] = True
+            if m.groupdict()['route_map']:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['next_hop_self'] = True
-                continue
-
-            # Allow my ASN 9 times
-            m = p44.match(line)
-            if m:
+                    [address_family]['default_originate_route_map'] = \
+                        m.groupdict()['route_map']
+
+        # Inherited policy-templates:
+        # Preference    Name
+        #         10    PEER-POLICY
+        #         20    PEER-POLICY2
+        @dispatcher.rule(p48)
+        def handle_p48(m):
+            policy_name = str(m.groupdict()['policy_name'])
+            inherit_peer_seq = int(m.groupdict()['inherit_peer_seq'])
+            if 'inherit_peer_policy' not in parsed_dict['neighbor']\
+                [neighbor_id]['address_family'][address_family]:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['as_override_count'] = \
-                        int(m.groupdict()['num'])
-                continue
-
-            # ASN override is enabled
-            m = p45.match(line)
-            if m:
+                    [address_family]['inherit_peer_policy'] = {}
+            if policy_name not in parsed_dict['neighbor'][neighbor_id]\
+                ['address_family'][address_family]\
+                    ['inherit_peer_policy']:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['as_override'] = True
-                continue
-
-            # Default information originate, default not sent
-            # Default information originate, default sent
-            # Default information originate, route-map SOMENAME, default not sent
-            m = p46.match(line)
-            if m:
+                    [address_family]['inherit_peer_policy']\
+                    [policy_name] = {}
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['default_originate'] = True
-                if m.groupdict()['route_map']:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['default_originate_route_map'] = \
-                            m.groupdict()['route_map']
-                continue
-
-            # Inherited policy-templates:
-            # Preference    Name
-            #         10    PEER-POLICY                                                 
-            #         20    PEER-POLICY2
-            m = p48.match(line)
-            if m:
-                policy_name = str(m.groupdict()['policy_name'])
-                inherit_peer_seq = int(m.groupdict()['inherit_peer_seq'])
-                if 'inherit_peer_policy' not in parsed_dict['neighbor']\
-                    [neighbor_id]['address_family'][address_family]:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['inherit_peer_policy'] = {}
-                if policy_name not in parsed_dict['neighbor'][neighbor_id]\
-                    ['address_family'][address_family]\
-                        ['inherit_peer_policy']:
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['inherit_peer_policy']\
-                        [policy_name] = {}
-                    parsed_dict['neighbor'][neighbor_id]['address_family']\
-                        [address_family]['inherit_peer_policy']\
-                        [policy_name]['inherit_peer_seq'] = inherit_peer_seq
-                    continue
+                    [address_family]['inherit_peer_policy']\
+                    [policy_name]['inherit_peer_seq'] = inherit_peer_seq
+                return
+            return FALLTHROUGH
+
+        # Local host: 10.4.1.1, Local port: 179
+        @dispatcher.rule(p49, keys=['bgp_session_transport', 'transport',
+                                    'local_host', 'local_port'])
+        def handle_p49(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport'] = {}
+            if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport']['transport'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['transport']['local_host'] = \
+                    str(m.groupdict()['local_host'])
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['transport']['local_port'] = \
+                    str(m.groupdict()['local_port'])
+
+        # Foreign host: 10.16.2.2, Foreign port: 4466
+        @dispatcher.rule(p50, keys=['bgp_session_transport', 'transport',
+                                    'foreign_host', 'foreign_port'])
+        def handle_p50(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport'] = {}
+            if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport']['transport'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['transport']['foreign_host'] = \
+                    str(m.groupdict()['foreign_host'])
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['transport']['foreign_port'] = \
+                    str(m.groupdict()['foreign_port'])
+
+        # fd = 44
+        @dispatcher.rule(p51, keys=['bgp_session_transport', 'transport',
+                                    'fd'])
+        def handle_p51(m):
+            if 'bgp_session_transport' not in parsed_dict['neighbor']\
+                [neighbor_id]:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport'] = {}
+            if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
+                ['bgp_session_transport']:
+                parsed_dict['neighbor'][neighbor_id]\
+                    ['bgp_session_transport']['transport'] = {}
+            parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
+                ['transport']['fd'] = str(m.groupdict()['fd'])
 
-            # Local host: 10.4.1.1, Local port: 179
-            m = p49.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['transport'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['transport']['local_host'] = \
-                        str(m.groupdict()['local_host'])
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['transport']['local_port'] = \
-                        str(m.groupdict()['local_port'])
-                continue
-
-            # Foreign host: 10.16.2.2, Foreign port: 4466
-            m = p50.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['transport'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['transport']['foreign_host'] = \
-                        str(m.groupdict()['foreign_host'])
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['transport']['foreign_port'] = \
-                        str(m.groupdict()['foreign_port'])
-                continue
-            
-            # fd = 44
-            m = p51.match(line)
-            if m:
-                if 'bgp_session_transport' not in parsed_dict['neighbor']\
-                    [neighbor_id]:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport'] = {}
-                if 'transport' not in parsed_dict['neighbor'][neighbor_id]\
-                    ['bgp_session_transport']:
-                    parsed_dict['neighbor'][neighbor_id]\
-                        ['bgp_session_transport']['transport'] = {}
-                parsed_dict['neighbor'][neighbor_id]['bgp_session_transport']\
-                    ['transport']['fd'] = str(m.groupdict()['fd'])
-                continue
+        # Route reflector client
+        @dispatcher.rule(p52, keys=['route_reflector_client'])
+        def handle_p52(m):
+            parsed_dict['neighbor'][neighbor_id]['address_family']\
+                [address_family]['route_reflector_client'] = True
 
-            # Route reflector client
-            m = p52.match(line)
-            if m:
-                parsed_dict['neighbor'][neighbor_id]['address_family']\
-                    [address_family]['route_reflector_client'] = True
-                continue
+        dispatcher = dispatcher.project(projection)
+        for line in out.splitlines():
+            dispatcher.dispatch(line.rstrip())
 
+        if projection is not None:
+            return projection.prune(parsed_dict)
         return parsed_dict
 
     def yang(self, vrf, address_family='', neighbor=''):
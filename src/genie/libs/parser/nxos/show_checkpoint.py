@@ -43,10 +43,23 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
             out = output
         ck_dict = {}
 
+        # 1) checkpoint1:
+        p1 = re.compile(r'^\d+\) +(?P<id>[\s\w\.\-]+):$')
+
+        # Created by admin
+        p2 = re.compile(r'^Created +by +(?P<user>[\s\w\.\-\:]+)$')
+
+        # Created at Tue, 22:13:49 20 Nov 2017
+        p3 = re.compile(r'^Created +at +(?P<time>[\s\w\.\-\:\,]+)$')
+
+        # Size is 25,671 bytes
+        p4 = re.compile(r'^Size +is +(?P<size>[,\d]+) +bytes$')
+
+        # Description: Created by Feature Manager.
+        p5 = re.compile(r'^Description: +(?P<desc>[\s\w\.\-\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
-            # 1) checkpoint1:
-            p1 = re.compile(r'^\d+\) +(?P<id>[\s\w\.\-]+):$')
             m = p1.match(line)
             if m:
                 if 'checkpoint' not in ck_dict:
@@ -57,31 +70,23 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
                     ck_dict['checkpoint'][id] = {}
                 continue
 
-            # Created by admin
-            p2 = re.compile(r'^Created +by +(?P<user>[\s\w\.\-\:]+)$')
             m = p2.match(line)
             if m:
                 ck_dict['checkpoint'][id]['created_by'] = m.groupdict()['user']
                 continue
 
-            # Created at Tue, 22:13:49 20 Nov 2017
-            p3 = re.compile(r'^Created +at +(?P<time>[\s\w\.\-\:\,]+)$')
             m = p3.match(line)
             if m:
                 ck_dict['checkpoint'][id]['created_time'] = \
                     m.groupdict()['time']
                 continue
 
-            # Size is 25,671 bytes
-            p4 = re.compile(r'^Size +is +(?P<size>[,\d]+) +bytes$')
             m = p4.match(line)
             if m:
                 ck_dict['checkpoint'][id]['size'] = \
                     int(m.groupdict()['size'].replace(',', ''))
                 continue
 
-            # Description: Created by Feature Manager.
-            p5 = re.compile(r'^Description: +(?P<desc>[\s\w\.\-\:]+)$')
             m = p5.match(line)
             if m:
                 ck_dict['checkpoint'][id]['description'] = \
@@ -28,6 +28,10 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, \
+                                                    Key, boolean, \
+                                                    interface_name
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -157,9 +161,53 @@ class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableBaseSch
         return ret_dict
 
 
-class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
+def _mac_entry_path(*path):
+    """Path of the entries of 'show mac address-table | json', to path"""
+    def flag(field):
+        return lambda row: 'T' if boolean(row[field]) else 'F'
+
+    return ['mac_table', 'vlans',
+            Key('disp_vlan', str, name='vlan'),
+            'mac_addresses',
+            Key('disp_mac_addr', name='mac_address', fields={
+                'entry': lambda row: row.get('disp_type', '').strip() or None,
+                'secure': flag('disp_is_secure'),
+                'ntfy': flag('disp_is_ntfy')})] + list(path)
+
+
+# Type and age of the entries, on a port or dropped
+_mac_entry_fields = {
+    'mac_type': lambda row: 'static' if boolean(row['disp_is_static'])
+                            else 'dynamic',
+    'age': ('disp_age', str),
+}
+
+
+class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema,
+                          NxosStructured, ColumnarParser):
     """Parser for show mac address-table"""
 
+    columnar_tables = {
+        'interfaces': ('mac_table', 'vlans', '{vlan}', 'mac_addresses',
+                       '{mac_address}', 'interfaces', '{interface}'),
+        'drop': ('mac_table', 'vlans', '{vlan}', 'mac_addresses',
+                 '{mac_address}', 'drop'),
+    }
+
+    json_mapping = [
+        Table('mac_address',
+              path=_mac_entry_path(
+                  'interfaces',
+                  Key('disp_port', interface_name,
+                      name='interface')),
+              fields=_mac_entry_fields,
+              when=lambda row: row.get('disp_port', '').lower() != 'drop'),
+        Table('mac_address',
+              path=_mac_entry_path('drop'),
+              fields=dict(_mac_entry_fields, drop=lambda row: True),
+              when=lambda row: row.get('disp_port', '').lower() == 'drop'),
+    ]
+
     cli_command = [
         'show mac address-table',
         'show mac address-table vlan {vlan}',
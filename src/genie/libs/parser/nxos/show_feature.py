@@ -43,11 +43,12 @@ class ShowFeature(ShowFeatureSchema):
             out = output
         f_dict = {}
 
+        # 1) bash-shell             1          disabled
+        p1 = re.compile(r'^(?P<name>[\w\-]+) +(?P<inst>\d+) '
+                         '+(?P<state>\w+)\(?(?P<run>not-running)?\)?$')
+
         for line in out.splitlines():
             line = line.strip()
-            # 1) bash-shell             1          disabled
-            p1 = re.compile(r'^(?P<name>[\w\-]+) +(?P<inst>\d+) '
-                             '+(?P<state>\w+)\(?(?P<run>not-running)?\)?$')
             m = p1.match(line)
             if m:
                 if 'feature' not in f_dict:
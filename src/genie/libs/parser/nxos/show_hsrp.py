@@ -67,13 +67,54 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
         hsrp_summary = {}
         
         
+        # Extended-hold (NSF) enabled, 10 seconds
+        # Extended-hold (NSF) disabled
+        p1 = re.compile(r'\s*Extended-hold +\(NSF\) +(?P<nsf>[a-zA-Z]+)'
+                         '(, +(?P<nsf_time>[0-9]+) seconds)?$')
+
+        # Global HSRP-BFD enabled
+        p2 = re.compile(r'\s*Global +HSRP-BFD'
+                         ' +(?P<global_hsrp_bfd>[a-zA-Z]+)$')
+
+        # Total Groups: 3
+        p3 = re.compile(r'\s*Total +Groups: +(?P<total_groups>[0-9]+)$')
+
+        # Version::    V1-IPV4: 0       V2-IPV4: 3      V2-IPV6: 0
+        p4 = re.compile(r'\s*Version:: +V1-IPV4: +(?P<v1_ipv4>[0-9]+)'
+                         ' +V2-IPV4: +(?P<v2_ipv4>[0-9]+) +V2-IPV6:'
+                         ' +(?P<v2_ipv6>[0-9]+)$')
+
+        # State::     Active: 0       Standby: 0       Listen: 0
+        p5 = re.compile(r'\s*State:: +Active: +(?P<active>[0-9]+)'
+                         ' +Standby: +(?P<standby>[0-9]+) +Listen:'
+                         ' +(?P<listen>[0-9]+)$')
+
+        # State::  V6-Active: 0    V6-Standby: 0    V6-Listen: 0
+        p6 = re.compile(r'\s*State:: +V6-Active: +(?P<v6_active>[0-9]+)'
+                         ' +V6-Standby: +(?P<v6_standby>[0-9]+)'
+                         ' +V6-Listen: +(?P<v6_listen>[0-9]+)$')
+
+        # Total HSRP Enabled interfaces: 1
+        p7 = re.compile(r'\s*Total +HSRP +Enabled +interfaces:'
+                         ' +(?P<intf_total>[0-9]+)$')
+
+        # Tx - Pass: 0       Fail: 0
+        p8 = re.compile(r'\s*Tx +\- +Pass: +(?P<tx_pass>[0-9]+) +Fail:'
+                         ' +(?P<tx_fail>[0-9]+)$')
+
+        # Rx - Good: 0
+        p9 = re.compile(r'\s*Rx +\- +Good: +(?P<rx_good>[0-9]+)$')
+
+        # Packet for unknown groups: 0
+        p10 = re.compile(r'\s*Packet +for +unknown +groups:'
+                          ' +(?P<pkt_unknown_groups>[0-9]+)$')
+
+        # Total MTS: Rx: 85
+        p11 = re.compile(r'\s*Total +MTS: +Rx: +(?P<total_mts_rx>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
             
-            # Extended-hold (NSF) enabled, 10 seconds
-            # Extended-hold (NSF) disabled
-            p1 = re.compile(r'\s*Extended-hold +\(NSF\) +(?P<nsf>[a-zA-Z]+)'
-                             '(, +(?P<nsf_time>[0-9]+) seconds)?$')
             m = p1.match(line)
             if m:
                 hsrp_summary['nsf'] = m.groupdict()['nsf']
@@ -81,17 +122,12 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     hsrp_summary['nsf_time'] = int(m.groupdict()['nsf_time'])
                 continue
 
-            # Global HSRP-BFD enabled
-            p2 = re.compile(r'\s*Global +HSRP-BFD'
-                             ' +(?P<global_hsrp_bfd>[a-zA-Z]+)$')
             m = p2.match(line)
             if m:
                 hsrp_summary['global_hsrp_bfd'] = \
                     m.groupdict()['global_hsrp_bfd']
                 continue
 
-            # Total Groups: 3
-            p3 = re.compile(r'\s*Total +Groups: +(?P<total_groups>[0-9]+)$')
             m = p3.match(line)
             if m:
                 if 'stats' not in hsrp_summary:
@@ -100,10 +136,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     int(m.groupdict()['total_groups'])
                 continue
 
-            # Version::    V1-IPV4: 0       V2-IPV4: 3      V2-IPV6: 0
-            p4 = re.compile(r'\s*Version:: +V1-IPV4: +(?P<v1_ipv4>[0-9]+)'
-                             ' +V2-IPV4: +(?P<v2_ipv4>[0-9]+) +V2-IPV6:'
-                             ' +(?P<v2_ipv6>[0-9]+)$')
             m = p4.match(line)
             if m:
                 hsrp_summary['stats']['v1_ipv4'] = int(m.groupdict()['v1_ipv4'])
@@ -111,10 +143,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 hsrp_summary['stats']['v2_ipv6'] = int(m.groupdict()['v2_ipv6'])
                 continue
 
-            # State::     Active: 0       Standby: 0       Listen: 0
-            p5 = re.compile(r'\s*State:: +Active: +(?P<active>[0-9]+)'
-                             ' +Standby: +(?P<standby>[0-9]+) +Listen:'
-                             ' +(?P<listen>[0-9]+)$')
             m = p5.match(line)
             if m:
                 hsrp_summary['stats']['active'] = int(m.groupdict()['active'])
@@ -122,10 +150,6 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 hsrp_summary['stats']['listen'] = int(m.groupdict()['listen'])
                 continue
 
-            # State::  V6-Active: 0    V6-Standby: 0    V6-Listen: 0
-            p6 = re.compile(r'\s*State:: +V6-Active: +(?P<v6_active>[0-9]+)'
-                             ' +V6-Standby: +(?P<v6_standby>[0-9]+)'
-                             ' +V6-Listen: +(?P<v6_listen>[0-9]+)$')
             m = p6.match(line)
             if m:
                 hsrp_summary['stats']['v6_active'] \
@@ -136,17 +160,11 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     = int(m.groupdict()['v6_listen'])
                 continue
 
-            # Total HSRP Enabled interfaces: 1
-            p7 = re.compile(r'\s*Total +HSRP +Enabled +interfaces:'
-                             ' +(?P<intf_total>[0-9]+)$')
             m = p7.match(line)
             if m:
                 hsrp_summary['intf_total'] = int(m.groupdict()['intf_total'])
                 continue
 
-            # Tx - Pass: 0       Fail: 0
-            p8 = re.compile(r'\s*Tx +\- +Pass: +(?P<tx_pass>[0-9]+) +Fail:'
-                             ' +(?P<tx_fail>[0-9]+)$')
             m = p8.match(line)
             if m:
                 if 'total_packets' not in hsrp_summary:
@@ -157,25 +175,18 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                     = int(m.groupdict()['tx_fail'])
                 continue
 
-            # Rx - Good: 0
-            p9 = re.compile(r'\s*Rx +\- +Good: +(?P<rx_good>[0-9]+)$')
             m = p9.match(line)
             if m:
                 hsrp_summary['total_packets']['rx_good'] \
                     = int(m.groupdict()['rx_good'])
                 continue
 
-            # Packet for unknown groups: 0
-            p10 = re.compile(r'\s*Packet +for +unknown +groups:'
-                              ' +(?P<pkt_unknown_groups>[0-9]+)$')
             m = p10.match(line)
             if m:
                 hsrp_summary['pkt_unknown_groups'] = \
                     int(m.groupdict()['pkt_unknown_groups'])
                 continue
 
-            # Total MTS: Rx: 85
-            p11 = re.compile(r'\s*Total +MTS: +Rx: +(?P<total_mts_rx>[0-9]+)$')
             m = p11.match(line)
             if m:
                 hsrp_summary['total_mts_rx'] = \
@@ -687,15 +698,16 @@ class ShowHsrpDelay(ShowHsrpDelaySchema):
         # Init vars
         hsrp_delay_dict = {}
 
+        # GigabitEthernet1   99      888
+        p1 = re.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
+            '(?P<reload_delay>\d+)')
+
         for line in out.splitlines():
             line = line.rstrip()
 
             # Interface          Minimum Reload
             # (no need to parse above because it's just header)
 
-            # GigabitEthernet1   99      888
-            p1 = re.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
-                '(?P<reload_delay>\d+)')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
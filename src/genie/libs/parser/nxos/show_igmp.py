@@ -102,69 +102,119 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
         active_ports = []
 
 
+        # Global IGMP Snooping Information:
+        #  IGMP Snooping enabled
+        p1 = re.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
+
+        #  IGMPv1/v2 Report Suppression enabled
+        p2 = re.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
+
+        #  IGMPv3 Report Suppression disabled
+        p3 = re.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
+
+        #  Link Local Groups Suppression enabled
+        p4 = re.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
+
+        #  VPC Multicast optimization disabled
+        p5 = re.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
+
+        # IGMP Snooping information for vlan 1
+        p6 = re.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
+
+        #  IGMP snooping enabled
+        p7 = re.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
+
+        #  Lookup mode: IP
+        p8 = re.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
+
+        #  IGMP querier none
+        #  IGMP querier present, address: 10.51.1.1, version: 2, i/f Vlan100
+        p9 = re.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
+                        '(, +address: +(?P<address>\S+))?'
+                        '(, +version: +(?P<version>\d))?'
+                        '(, +i\/f +(?P<vlan>\w+))?$')
+
+        # Querier interval: 125 secs
+        p9_1 = re.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
+
+        # Querier last member query interval: 1 secs
+        p9_2 = re.compile(r'^\s*Querier +last +member +query +interval:'
+                          ' +(?P<querier_last_member_query_interval>\d+) +secs$')
+
+        # Querier robustness: 2
+        p9_3 = re.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
+
+        #  Switch-querier disabled
+        p10 = re.compile(r'^\s*Switch\-querier +(?P<switch_querier>\S+)$')
+
+        #  IGMP Explicit tracking enabled
+        p11 = re.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
+
+        #  IGMPv2 Fast leave disabled
+        p12 = re.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
+
+        #  Number of router-ports: 1
+        p13 = re.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
+
+        #  Number of groups: 0
+        p14 = re.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
+
+        #  VLAN vPC function enabled
+        p14_1 = re.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
+
+        #  Active ports:
+        #    Po20        Po30
+        p15_1 = re.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
+
+        #  Report Flooding: Disabled
+        p16 = re.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
+
+        #  Interfaces for Report Flooding: n/a
+        p17 = re.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
+
+        #  Use Group Address for Proxy Leaves: no
+        p18 = re.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # Global IGMP Snooping Information:
-            #  IGMP Snooping enabled
-            p1 = re.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
             m = p1.match(line)
             if m:
                 global_configuration_enabled = m.groupdict()['enabled']
 
-            #  IGMPv1/v2 Report Suppression enabled
-            p2 = re.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
             m = p2.match(line)
             if m:
                 v1v2_report_suppression = m.groupdict()['v1v2_report_suppression_enabled']
 
-            #  IGMPv3 Report Suppression disabled
-            p3 = re.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
             m = p3.match(line)
             if m:
                 v3_report_suppression = m.groupdict()['v3_report_suppression_enabled']
 
-            #  Link Local Groups Suppression enabled
-            p4 = re.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
             m = p4.match(line)
             if m:
                 link_local_group_suppression_enabled = m.groupdict()['link_local_group_suppression_enabled']
 
-            #  VPC Multicast optimization disabled
-            p5 = re.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
             m = p5.match(line)
             if m:
                 vpc_multicast_optimization = m.groupdict()['vpc_multicast_optimization_enabled']
 
-            # IGMP Snooping information for vlan 1
-            p6 = re.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
             m = p6.match(line)
             if m:
                 configuration_vlan_id = m.groupdict()['vlan_id']
                 address = version = querier_robustness = querier_interval =\
                     querier_last_member_query_interval = igmp_querier = ""
 
-            #  IGMP snooping enabled
-            p7 = re.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
             m = p7.match(line)
             if m:
                 ip_igmp_snooping = m.groupdict()['ip_igmp_snooping']
 
-            #  Lookup mode: IP
-            p8 = re.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
             m = p8.match(line)
             if m:
                 lookup_mode = m.groupdict()['lookup_mode'].lower()
 
-            #  IGMP querier none
-            #  IGMP querier present, address: 10.51.1.1, version: 2, i/f Vlan100
-            p9 = re.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
-                            '(, +address: +(?P<address>\S+))?'
-                            '(, +version: +(?P<version>\d))?'
-                            '(, +i\/f +(?P<vlan>\w+))?$')
             m = p9.match(line)
             if m:
                 igmp_querier = m.groupdict()['igmp_querier']
@@ -173,83 +223,55 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
                 if m.groupdict()['version']:
                     version = m.groupdict()['version']
 
-            # Querier interval: 125 secs
-            p9_1 = re.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
             m = p9_1.match(line)
             if m:
                 querier_interval = m.groupdict()['querier_interval']
 
 
-            # Querier last member query interval: 1 secs
-            p9_2 = re.compile(r'^\s*Querier +last +member +query +interval:'
-                              ' +(?P<querier_last_member_query_interval>\d+) +secs$')
             m = p9_2.match(line)
             if m:
                 querier_last_member_query_interval = m.groupdict()['querier_last_member_query_interval']
 
-            # Querier robustness: 2
-            p9_3 = re.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
             m = p9_3.match(line)
             if m:
                 querier_robustness = m.groupdict()['querier_robustness']
 
-            #  Switch-querier disabled
-            p10 = re.compile(r'^\s*Switch\-querier +(?P<switch_querier>\S+)$')
             m = p10.match(line)
             if m:
                 switch_querier = m.groupdict()['switch_querier']
 
-            #  IGMP Explicit tracking enabled
-            p11 = re.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
             m = p11.match(line)
             if m:
                 igmp_explicit_tracking = m.groupdict()['igmp_explicit_tracking']
 
-            #  IGMPv2 Fast leave disabled
-            p12 = re.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
             m = p12.match(line)
             if m:
                 v2_fast_leave = m.groupdict()['v2_fast_leave']
 
-            #  Number of router-ports: 1
-            p13 = re.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
             m = p13.match(line)
             if m:
                 router_ports_count = m.groupdict()['router_ports_count']
 
-            #  Number of groups: 0
-            p14 = re.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
             m = p14.match(line)
             if m:
                 groups_count = m.groupdict()['groups_count']
 
-            #  VLAN vPC function enabled
-            p14_1 = re.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
             m = p14_1.match(line)
             if m:
                 vlan_vpc_function = m.groupdict()['vlan_vpc_function']
 
-            #  Active ports:
-            #    Po20        Po30
-            p15_1 = re.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
             m = p15_1.match(line)
             if m:
                 active_ports = m.groupdict()['active_ports'].split()
 
-            #  Report Flooding: Disabled
-            p16 = re.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
             m = p16.match(line)
             if m:
                 report_flooding = m.groupdict()['report_flooding'].lower()
 
-            #  Interfaces for Report Flooding: n/a
-            p17 = re.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
             m = p17.match(line)
             if m:
                 report_flooding_interfaces = m.groupdict()['report_flooding_interfaces']
 
-            #  Use Group Address for Proxy Leaves: no
-            p18 = re.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
             m = p18.match(line)
             if m:
                 group_address_for_proxy_leaves = m.groupdict()['group_address_for_proxy_leaves']
@@ -495,12 +517,122 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
         # initial variables
         ret_dict = {}
 
+        # IGMP Interfaces for VRF "default", count: 2
+        p1 = re.compile(r'^IGMP +Interfaces +for +VRF +\"(?P<vrf>\S+)\", +'
+                         'count: +(?P<groups_count>\d+)$')
+
+        # Ethernet2/1, Interface status: protocol-up/link-up/admin-up
+        p2 = re.compile(r'^(?P<intf>[\w\/\.\-]+), +'
+                         'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
+                         'link\-(?P<link_status>\w+)\/'
+                         'admin\-(?P<admin_status>\w+)$')
+
+        # IP address: 10.1.2.1, IP subnet: 10.1.2.0/24
+        p3 = re.compile(r'^IP +address: +(?P<ip>[\w\.\:]+), +'
+                         'IP +subnet: +(?P<subnet>[\w\.\:\/]+)$')
+
+        # Active querier: 10.1.2.1, version: 3, next query sent in: 00:00:47
+        # Active querier: 0.0.0.0
+        p4 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+)(, +'
+                         'version: +(?P<version>\d+), +'
+                         'next +query +sent +in: +(?P<in>[\w\.\:\.]+))?$')
+
+        # Active querier: 10.3.5.3, expires: 00:02:59, querier version: 2
+        p4_1 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+), +'
+                         'expires: +(?P<expires>[\w\.\:\.]+), +'
+                         'querier +version: +(?P<version>\d+)$')
+
+        # Membership count: 4
+        p5 = re.compile(r'^Membership +count: +(?P<count>\d+)$')
+
+        # Old Membership count 0
+        p6 = re.compile(r'^Old +Membership +count +(?P<count>\d+)$')
+
+        # IGMP version: 3, host version: 3
+        p7 = re.compile(r'^IGMP +version: +(?P<ver>\d+), +'
+                         'host +version: +(?P<host_ver>\d+)$')
+
+        # IGMP query interval: 133 secs, configured value: 133 secs
+        p8 = re.compile(r'^IGMP +query +interval: +(?P<intverval>\d+) +secs, +'
+                         'configured +value: +(?P<conf_intvl>\d+) +secs$')
+
+        # IGMP max response time: 15 secs, configured value: 15 secs
+        p9 = re.compile(r'^IGMP +max +response +time: +(?P<time>\d+) +secs, +'
+                         'configured +value: +(?P<conf_time>\d+) +secs$')
+
+        # IGMP startup query interval: 33 secs, configured value: 31 secs
+        p10 = re.compile(r'^IGMP +startup +query +interval: +(?P<intvl>\d+) +secs, +'
+                         'configured +value: +(?P<conf_intvl>\d+) +secs$')
+
+        # IGMP startup query count: 5
+        p11 = re.compile(r'^IGMP +startup +query +count: +(?P<count>\d+)$')
+
+        # IGMP last member mrt: 1 secs
+        p12 = re.compile(r'^IGMP +last +member +mrt: +(?P<mrt>\d+) +secs$')
+
+        # IGMP last member query count: 5
+        p13 = re.compile(r'^IGMP +last +member +query +count: +(?P<count>\d+)$')
+
+        # IGMP group timeout: 680 secs, configured value: 260 secs
+        p14 = re.compile(r'^IGMP +group +timeout: +(?P<timeout>\d+) +secs, +'
+                         'configured +value: +(?P<conf_timeout>\d+) +secs$')
+
+        # IGMP querier timeout: 672 secs, configured value: 255 secs
+        p15 = re.compile(r'^IGMP +querier +timeout: +(?P<timeout>\d+) +secs, +'
+                         'configured +value: +(?P<conf_timeout>\d+) +secs$')
+
+        # IGMP unsolicited report interval: 10 secs
+        p16 = re.compile(r'^IGMP +unsolicited +report +interval: +(?P<val>\d+) +secs$')
+
+        # IGMP robustness variable: 5, configured value: 5
+        p17 = re.compile(r'^IGMP +robustness +variable: +(?P<val1>\d+), +'
+                         'configured +value: +(?P<val2>\d+)$')
+
+        # IGMP reporting for link-local groups: disabled
+        p18 = re.compile(r'^IGMP +reporting +for +link\-local +groups: +(?P<status>\w+)$')
+
+        # IGMP interface enable refcount: 9
+        p19 = re.compile(r'^IGMP +interface +enable +refcount: +(?P<count>\d+)$')
+
+        # IGMP interface immediate leave: enabled
+        p20 = re.compile(r'^IGMP +interface +immediate +leave: +(?P<status>\w+)$')
+
+        # IGMP VRF name default (id 1)
+        p21 = re.compile(r'^IGMP +VRF +name +(?P<vrf>\S+) +\(id +(?P<id>\d+)\)$')
+
+        # IGMP Report Policy: access-group-filter
+        p22 = re.compile(r'^IGMP +Report +Policy: +(?P<policy>\S+)$')
+
+        # IGMP State Limit: 10,  Available States: 10
+        p23 = re.compile(r'^IGMP +State +Limit: +(?P<max_groups>\d+), +'
+                          'Available +States: +(?P<available_groups>\d+)$')
+
+        # IGMP interface statistics: (only non-zero values displayed)
+        p24 = re.compile(r'^IGMP +interface +statistics: +(?P<dummy>[\w\-\s\(\)]+)$')
+
+        # General (sent/received):
+        #   v2-queries: 5/5, v2-reports: 0/0, v2-leaves: 0/0
+        p25 = re.compile(r'^v2\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
+                          'v2\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+), +'
+                          'v2\-leaves: +(?P<sent3>\d+)\/(?P<received3>\d+)$')
+
+        #   v3-queries: 11/11, v3-reports: 56/56
+        p25_1 = re.compile(r'^v3\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
+                            'v3\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+)$')
+
+        # Errors:
+        #   Packets dropped due to router-alert check: 19
+        p26 = re.compile(r'^Packets +dropped +due +to +router\-alert +check: +(?P<count>\d+)$')
+
+        # Interface PIM DR: Yes
+        p27 = re.compile(r'^Interface +PIM +DR: +(?P<status>\w+)$')
+
+        # Interface vPC SVI: No
+        p28 = re.compile(r'^Interface +vPC +SVI: +(?P<status>\w+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # IGMP Interfaces for VRF "default", count: 2
-            p1 = re.compile(r'^IGMP +Interfaces +for +VRF +\"(?P<vrf>\S+)\", +'
-                             'count: +(?P<groups_count>\d+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -513,11 +645,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 ret_dict['vrfs'][vrf]['groups_count'] = int(m.groupdict()['groups_count'])
                 continue
 
-            # Ethernet2/1, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^(?P<intf>[\w\/\.\-]+), +'
-                             'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
-                             'link\-(?P<link_status>\w+)\/'
-                             'admin\-(?P<admin_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -534,20 +661,12 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     m.groupdict()['admin_status'].lower() == 'up' else False
                 continue
 
-            # IP address: 10.1.2.1, IP subnet: 10.1.2.0/24
-            p3 = re.compile(r'^IP +address: +(?P<ip>[\w\.\:]+), +'
-                             'IP +subnet: +(?P<subnet>[\w\.\:\/]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['address'] = m.groupdict()['ip']
                 ret_dict['vrfs'][vrf]['interface'][intf]['subnet'] = m.groupdict()['subnet']
                 continue
 
-            # Active querier: 10.1.2.1, version: 3, next query sent in: 00:00:47
-            # Active querier: 0.0.0.0
-            p4 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+)(, +'
-                             'version: +(?P<version>\d+), +'
-                             'next +query +sent +in: +(?P<in>[\w\.\:\.]+))?$')
             m = p4.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier'] = m.groupdict()['querier']
@@ -557,10 +676,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     ret_dict['vrfs'][vrf]['interface'][intf]['next_query_sent_in'] = m.groupdict()['in']
                 continue
 
-            # Active querier: 10.3.5.3, expires: 00:02:59, querier version: 2
-            p4_1 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+), +'
-                             'expires: +(?P<expires>[\w\.\:\.]+), +'
-                             'querier +version: +(?P<version>\d+)$')
             m = p4_1.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier'] = m.groupdict()['querier']
@@ -569,25 +684,18 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
 
-            # Membership count: 4
-            p5 = re.compile(r'^Membership +count: +(?P<count>\d+)$')
             m = p5.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['membership_count'] = \
                     int(m.groupdict()['count'])
                 continue
 
-            # Old Membership count 0
-            p6 = re.compile(r'^Old +Membership +count +(?P<count>\d+)$')
             m = p6.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['old_membership_count'] = \
                     int(m.groupdict()['count'])
                 continue
 
-            # IGMP version: 3, host version: 3
-            p7 = re.compile(r'^IGMP +version: +(?P<ver>\d+), +'
-                             'host +version: +(?P<host_ver>\d+)$')
             m = p7.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['version'] = \
@@ -596,9 +704,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['host_ver'])
                 continue
 
-            # IGMP query interval: 133 secs, configured value: 133 secs
-            p8 = re.compile(r'^IGMP +query +interval: +(?P<intverval>\d+) +secs, +'
-                             'configured +value: +(?P<conf_intvl>\d+) +secs$')
             m = p8.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['query_interval'] = \
@@ -607,9 +712,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['conf_intvl'])
                 continue
 
-            # IGMP max response time: 15 secs, configured value: 15 secs
-            p9 = re.compile(r'^IGMP +max +response +time: +(?P<time>\d+) +secs, +'
-                             'configured +value: +(?P<conf_time>\d+) +secs$')
             m = p9.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['query_max_response_time'] = \
@@ -618,9 +720,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['conf_time'])
                 continue
 
-            # IGMP startup query interval: 33 secs, configured value: 31 secs
-            p10 = re.compile(r'^IGMP +startup +query +interval: +(?P<intvl>\d+) +secs, +'
-                             'configured +value: +(?P<conf_intvl>\d+) +secs$')
             m = p10.match(line)
             if m:
                 if 'startup_query' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -631,8 +730,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['conf_intvl'])
                 continue
 
-            # IGMP startup query count: 5
-            p11 = re.compile(r'^IGMP +startup +query +count: +(?P<count>\d+)$')
             m = p11.match(line)
             if m:
                 if 'startup_query' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -641,8 +738,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['count'])
                 continue
 
-            # IGMP last member mrt: 1 secs
-            p12 = re.compile(r'^IGMP +last +member +mrt: +(?P<mrt>\d+) +secs$')
             m = p12.match(line)
             if m:
                 if 'last_member' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -651,8 +746,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['mrt'])
                 continue
 
-            # IGMP last member query count: 5
-            p13 = re.compile(r'^IGMP +last +member +query +count: +(?P<count>\d+)$')
             m = p13.match(line)
             if m:
                 if 'last_member' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -661,9 +754,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['count'])
                 continue
 
-            # IGMP group timeout: 680 secs, configured value: 260 secs
-            p14 = re.compile(r'^IGMP +group +timeout: +(?P<timeout>\d+) +secs, +'
-                             'configured +value: +(?P<conf_timeout>\d+) +secs$')
             m = p14.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['group_timeout'] = \
@@ -672,9 +762,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['conf_timeout'])
                 continue
 
-            # IGMP querier timeout: 672 secs, configured value: 255 secs
-            p15 = re.compile(r'^IGMP +querier +timeout: +(?P<timeout>\d+) +secs, +'
-                             'configured +value: +(?P<conf_timeout>\d+) +secs$')
             m = p15.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier_timeout'] = \
@@ -683,17 +770,12 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['conf_timeout'])
                 continue
 
-            # IGMP unsolicited report interval: 10 secs
-            p16 = re.compile(r'^IGMP +unsolicited +report +interval: +(?P<val>\d+) +secs$')
             m = p16.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['unsolicited_report_interval'] = \
                     int(m.groupdict()['val'])
                 continue
 
-            # IGMP robustness variable: 5, configured value: 5
-            p17 = re.compile(r'^IGMP +robustness +variable: +(?P<val1>\d+), +'
-                             'configured +value: +(?P<val2>\d+)$')
             m = p17.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['robustness_variable'] = \
@@ -702,40 +784,30 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['val2'])
                 continue
 
-            # IGMP reporting for link-local groups: disabled
-            p18 = re.compile(r'^IGMP +reporting +for +link\-local +groups: +(?P<status>\w+)$')
             m = p18.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['link_local_groups_reporting'] = True \
                     if 'enable' in m.groupdict()['status'].lower() else False
                 continue
 
-            # IGMP interface enable refcount: 9
-            p19 = re.compile(r'^IGMP +interface +enable +refcount: +(?P<count>\d+)$')
             m = p19.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['enable_refcount'] = \
                     int(m.groupdict()['count'])
                 continue
 
-            # IGMP interface immediate leave: enabled
-            p20 = re.compile(r'^IGMP +interface +immediate +leave: +(?P<status>\w+)$')
             m = p20.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['immediate_leave'] = True \
                     if 'enable' in m.groupdict()['status'].lower() else False
                 continue
 
-            # IGMP VRF name default (id 1)
-            p21 = re.compile(r'^IGMP +VRF +name +(?P<vrf>\S+) +\(id +(?P<id>\d+)\)$')
             m = p21.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['vrf_name'] = m.groupdict()['vrf']
                 ret_dict['vrfs'][vrf]['interface'][intf]['vrf_id'] = int(m.groupdict()['id'])
                 continue
 
-            # IGMP Report Policy: access-group-filter
-            p22 = re.compile(r'^IGMP +Report +Policy: +(?P<policy>\S+)$')
             m = p22.match(line)
             if m:
                 if m.groupdict()['policy'] != 'None':
@@ -743,9 +815,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                         m.groupdict()['policy']
                 continue
 
-            # IGMP State Limit: 10,  Available States: 10
-            p23 = re.compile(r'^IGMP +State +Limit: +(?P<max_groups>\d+), +'
-                              'Available +States: +(?P<available_groups>\d+)$')
             m = p23.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['max_groups'] = \
@@ -755,19 +824,12 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['available_groups'])
                 continue
 
-            # IGMP interface statistics: (only non-zero values displayed)
-            p24 = re.compile(r'^IGMP +interface +statistics: +(?P<dummy>[\w\-\s\(\)]+)$')
             m = p24.match(line)
             if m:
                 if 'statistics' not in ret_dict['vrfs'][vrf]['interface'][intf]:
                     ret_dict['vrfs'][vrf]['interface'][intf]['statistics'] = {}
                 continue
 
-            # General (sent/received):
-            #   v2-queries: 5/5, v2-reports: 0/0, v2-leaves: 0/0
-            p25 = re.compile(r'^v2\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
-                              'v2\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+), +'
-                              'v2\-leaves: +(?P<sent3>\d+)\/(?P<received3>\d+)$')
             m = p25.match(line)
             if m:
                 if 'general' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -793,9 +855,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['received3'])
                 continue
 
-            #   v3-queries: 11/11, v3-reports: 56/56
-            p25_1 = re.compile(r'^v3\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
-                                'v3\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+)$')
             m = p25_1.match(line)
             if m:
                 if 'general' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -816,9 +875,6 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['received2'])
                 continue
 
-            # Errors:
-            #   Packets dropped due to router-alert check: 19
-            p26 = re.compile(r'^Packets +dropped +due +to +router\-alert +check: +(?P<count>\d+)$')
             m = p26.match(line)
             if m:
                 if 'errors' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -828,16 +884,12 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                     int(m.groupdict()['count'])
                 continue
 
-            # Interface PIM DR: Yes
-            p27 = re.compile(r'^Interface +PIM +DR: +(?P<status>\w+)$')
             m = p27.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['pim_dr'] = True \
                     if 'yes' in m.groupdict()['status'].lower() else False
                 continue
                 
-            # Interface vPC SVI: No
-            p28 = re.compile(r'^Interface +vPC +SVI: +(?P<status>\w+)$')
             m = p28.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['vpc_svi'] = True \
@@ -916,12 +968,22 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
         ret_dict = {}
         source_flag = False
 
+        # IGMP Connected Group Membership for VRF "default" - 4 total entries
+        p1 = re.compile(r'^IGMP +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
+                         ' +\- +(?P<entries>\d+) +total +entries$')
+
+        # 239.7.7.7
+        p2 = re.compile(r'^(?P<group>[\w\.\:]+)$')
+
+        # 239.5.5.5          S    Ethernet2/1         00:21:00  never     10.1.2.1
+        # 234.1.1.2          L   loopback11             00:00:20  never     10.100.5.5
+        p3 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<type>[SDLTH\*]+) +(?P<intf>[\w\.\/\-]+)'
+                         ' +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+)'
+                         ' +(?P<last_reporter>[\w\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # IGMP Connected Group Membership for VRF "default" - 4 total entries
-            p1 = re.compile(r'^IGMP +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
-                             ' +\- +(?P<entries>\d+) +total +entries$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -934,19 +996,12 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
                 ret_dict['vrfs'][vrf]['total_entries'] = int(m.groupdict()['entries'])
                 continue
 
-            # 239.7.7.7
-            p2 = re.compile(r'^(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
                 source_flag = True
                 continue
 
-            # 239.5.5.5          S    Ethernet2/1         00:21:00  never     10.1.2.1
-            # 234.1.1.2          L   loopback11             00:00:20  never     10.100.5.5
-            p3 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<type>[SDLTH\*]+) +(?P<intf>[\w\.\/\-]+)'
-                             ' +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+)'
-                             ' +(?P<last_reporter>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 intf = m.groupdict()['intf'].capitalize()
@@ -1065,11 +1120,18 @@ class ShowIpIgmpLocalGroups(ShowIpIgmpLocalGroupsSchema):
         ret_dict = {}
         source_flag = False
 
+        # IGMP Locally Joined Group Membership for VRF "default"
+        p1 = re.compile(r'^IGMP +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
+
+        # 239.1.1.1        *                Local    Eth2/4      00:00:50
+        # 239.7.7.7        10.16.2.1          Static   Eth2/4      01:06:47
+        p2 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
+                         '(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
+                         ' +(?P<last_reporter>[\w\.\:]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # IGMP Locally Joined Group Membership for VRF "default"
-            p1 = re.compile(r'^IGMP +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -1080,11 +1142,6 @@ class ShowIpIgmpLocalGroups(ShowIpIgmpLocalGroupsSchema):
                     ret_dict['vrfs'][vrf] = {}
                 continue
 
-            # 239.1.1.1        *                Local    Eth2/4      00:00:50
-            # 239.7.7.7        10.16.2.1          Static   Eth2/4      01:06:47
-            p2 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
-                             '(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
-                             ' +(?P<last_reporter>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
@@ -24,6 +24,11 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, \
+                                                    Key, integer, boolean, \
+                                                    interface_name
+from genie.libs.parser.utils.blocks import BlockParser
+from genie.libs.parser.utils.fixed_width import FixedWidthTable, Column
 
 
 # ===========================
@@ -151,9 +156,131 @@ class ShowInterfaceSchema(MetaParser):
 # ===========================
 
 
-class ShowInterface(ShowInterfaceSchema):
+def _either(*fields):
+    """Value of the first of the fields in the row, ex: eth_mtu or svi_mtu"""
+    def get(row):
+        for field in fields:
+            value = row.get(field)
+            if value is not None:
+                return value
+    return get
+
+
+def _counters(**fields):
+    """Counters of 'show interface | json', by key of the schema"""
+    return {key: (field, integer) for key, field in fields.items()}
+
+
+class ShowInterface(ShowInterfaceSchema, NxosStructured, BlockParser):
     """Parser for show interface, show interface <interface>"""
 
+    json_mapping = [
+        Table('interface', path=[Key('interface')], fields={
+            'oper_status': _either('state', 'svi_line_proto'),
+            'link_state': 'state',
+            'line_protocol': 'svi_line_proto',
+            'admin_state': _either('admin_state', 'svi_admin_state'),
+            'enabled': lambda row: _either('admin_state', 'svi_admin_state')(
+                row) == 'up',
+            'description': _either('desc', 'svi_desc'),
+            'types': _either('eth_hw_desc', 'svi_hw_desc'),
+            'mac_address': _either('eth_hw_addr', 'svi_mac'),
+            'phys_address': 'eth_bia_addr',
+            'mtu': lambda row: integer(_either('eth_mtu', 'svi_mtu')(row)),
+            'bandwidth': lambda row: integer(_either('eth_bw', 'svi_bw')(row)),
+            'delay': lambda row: integer(_either('eth_dly', 'svi_delay')(row)),
+            'reliability': ('eth_reliability', '{}/255'.format),
+            'txload': ('eth_txload', '{}/255'.format),
+            'rxload': ('eth_rxload', '{}/255'.format),
+            'medium': 'medium',
+            'port_mode': 'eth_mode',
+            'duplex_mode': 'eth_duplex',
+            # 1000 Mb/s
+            'port_speed': ('eth_speed', lambda speed: speed.split()[0]),
+            'media_type': 'eth_media',
+            'beacon': 'eth_beacon',
+            'auto_negotiate': ('eth_autoneg', boolean),
+            'auto_mdix': 'eth_mdix',
+            'switchport_monitor': 'eth_swt_monitor',
+            'ethertype': 'eth_ethertype',
+            'efficient_ethernet': 'eth_eee_state',
+            'last_link_flapped': 'eth_link_flapped',
+            'interface_reset': ('eth_reset_cntr', integer),
+        }),
+        Table('interface', path=[Key('interface'), 'port_channel'], fields={
+            'port_channel_member': lambda row: bool(
+                row.get('eth_bundle') or row.get('eth_members')),
+            'port_channel_int': ('eth_bundle', interface_name),
+            # Eth1/15, Eth1/16
+            'port_channel_member_intfs': (
+                'eth_members', lambda members: [
+                    interface_name(member.strip())
+                    for member in members.split(',')]),
+        }, when=lambda row: 'eth_hw_desc' in row),
+        Table('interface', path=[Key('interface'), 'flow_control'], fields={
+            'receive': ('eth_in_flowctrl', boolean),
+            'send': ('eth_out_flowctrl', boolean),
+        }, when=lambda row: 'eth_in_flowctrl' in row),
+        Table('interface', path=[
+            Key('interface'), 'ipv4',
+            Key(lambda row: '{a}/{m}'.format(a=row['eth_ip_addr'],
+                                             m=row['eth_ip_mask']))], fields={
+            'ip': 'eth_ip_addr',
+            'prefix_length': ('eth_ip_mask', str),
+        }, when=lambda row: 'eth_ip_addr' in row),
+        Table('interface', path=[Key('interface'), 'counters'],
+              fields=dict(_counters(
+                  in_unicast_pkts='eth_inucast',
+                  in_multicast_pkts='eth_inmcast',
+                  in_broadcast_pkts='eth_inbcast',
+                  in_pkts='eth_inpkts',
+                  in_octets='eth_inbytes',
+                  in_jumbo_packets='eth_jumbo_inpkts',
+                  in_storm_suppression_packets='eth_storm_supp',
+                  in_runts='eth_runts',
+                  in_oversize_frame='eth_giants',
+                  in_crc_errors='eth_crc',
+                  in_no_buffer='eth_nobuf',
+                  in_errors='eth_inerr',
+                  in_short_frame='eth_frame',
+                  in_overrun='eth_overrun',
+                  in_underrun='eth_underrun',
+                  in_ignored='eth_ignored',
+                  in_watchdog='eth_watchdog',
+                  in_bad_etype_drop='eth_bad_eth',
+                  in_unknown_protos='eth_bad_proto',
+                  in_if_down_drop='eth_in_ifdown_drops',
+                  in_with_dribble='eth_dribble',
+                  in_discard='eth_indiscard',
+                  in_mac_pause_frames='eth_inpause',
+                  out_unicast_pkts='eth_outucast',
+                  out_multicast_pkts='eth_outmcast',
+                  out_broadcast_pkts='eth_outbcast',
+                  out_pkts='eth_outpkts',
+                  out_octets='eth_outbytes',
+                  out_jumbo_packets='eth_jumbo_outpkts',
+                  out_errors='eth_outerr',
+                  out_collision='eth_coll',
+                  out_deferred='eth_deferred',
+                  out_late_collision='eth_latecoll',
+                  out_lost_carrier='eth_lostcarrier',
+                  out_no_carrier='eth_nocarrier',
+                  out_babble='eth_babbles',
+                  out_discard='eth_outdiscard',
+                  out_mac_pause_frames='eth_outpause',
+              ), last_clear='eth_clear_counters'),
+              when=lambda row: 'eth_inpkts' in row),
+        Table('interface', path=[Key('interface'), 'counters', 'rate'],
+              fields=_counters(
+                  load_interval='eth_load_interval1_rx',
+                  in_rate='eth_inrate1_bits',
+                  in_rate_pkts='eth_inrate1_pkts',
+                  out_rate='eth_outrate1_bits',
+                  out_rate_pkts='eth_outrate1_pkts',
+              ),
+              when=lambda row: 'eth_inrate1_bits' in row),
+    ]
+
     cli_command = ['show interface', 'show interface {interface}']
     exclude = [
       'in_unicast_pkts',
@@ -187,6 +314,38 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
+    # Ethernet2/1.10 is down (Administratively down)
+    # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+    # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
+    # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+    # Ethernet2/2 is up
+    # Ethernet1/10 is down (Link not connected)
+    # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
+    # Ethernet1/3 is down (XCVR not inserted)
+    # Ethernet1/2 is down (SFP validation failed)
+    # Ethernet1/4 is down (SFP not inserted)
+    # Ethernet1/11 is down (inactive)
+    # Ethernet1/12 is down (Transceiver validation failed)
+    # Ethernet1/13 is down (SFP validation failed)
+    # Ethernet1/13 is down (Channel admin down)
+    block_start = [re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
+                              r'inactive|Transceiver +validation +failed|'
+                              r'SFP +validation +failed|Channel +admin +down))?'
+                              r'(administratively\s+(?P<admin_1>(down)))?\s*'
+                              r'(\(Administratively\s*(?P<admin_2>(down))\))?'
+                              r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+                              r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+                              r'(,\s+autostate\s+(?P<autostate>\S+))?'
+                              r'(\(No\s+operational\s+members\))?'
+                              r'(\(Link\s+not\s+connected\))?'
+                              r'(\(SFP\s+validation\s+failed\))?'
+                              r'(\(SFP\s+not\s+inserted\))?'
+                              r'(\(suspended\(.*\)\))?'
+                              r'(\(\S+ErrDisabled\))?'
+                              r'(\(XCVR\s+not\s+inserted\))?'
+                              r'(\(.*ACK.*\))?$')]
+    block_marker = ' is '
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -197,36 +356,7 @@ class ShowInterface(ShowInterfaceSchema):
         else:
             out = output
 
-        # Ethernet2/1.10 is down (Administratively down)
-        # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
-        # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
-        # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-        # Ethernet2/2 is up
-        # Ethernet1/10 is down (Link not connected)
-        # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-        # Ethernet1/3 is down (XCVR not inserted)
-        # Ethernet1/2 is down (SFP validation failed)
-        # Ethernet1/4 is down (SFP not inserted)
-        # Ethernet1/11 is down (inactive)
-        # Ethernet1/12 is down (Transceiver validation failed)
-        # Ethernet1/13 is down (SFP validation failed)
-        # Ethernet1/13 is down (Channel admin down)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
-                        r'inactive|Transceiver +validation +failed|'
-                        r'SFP +validation +failed|Channel +admin +down))?'
-                        r'(administratively\s+(?P<admin_1>(down)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(.*ACK.*\))?$')
+        p1 = self.block_start[0]
 
         # admin state is up
         # admin state is up,
@@ -1219,21 +1349,198 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
         temp_intf = []
         save_addr_for_route_tag_next_line = None
 
+        # IP Interface Status for VRF "VRF1"
+        p1 = re.compile(r'^\s*IP *Interface *Status *for *VRF'
+                         ' *(?P<vrf>\S+)$')
+
+        #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
+        p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
+                         ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
+                         ' *iod: *(?P<iod>[0-9]+),$')
+
+        # Unnumbered interfaces of loopback0: first iod 46
+        p2_1 = re.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
+                           'first +iod +(?P<first_iod>\d+)$')
+
+        # Ethernet2/11:
+        # mti18: tunnel-te11: tunnel-te12:
+        p2_2 = re.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
+                          r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
+
+        # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
+        # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
+        p3 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
+                         ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
+                         '(?P<prefix_length>[0-9]+)'
+                         ' *(?P<secondary>(secondary))?$')
+
+        # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
+        # IP address: 10.115.69.2, IP subnet: 10.115.69.0/24 secondary route-preference: 0, tag: 0
+        p3_1 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
+                          r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
+                          r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
+                          r'(?P<route_preference>[0-9]+),)?'
+                          r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$')
+
+        # IP address: none
+        p3_2 = re.compile('^\s*IP +address: +(?P<ip>\S+)$')
+
+        #   0
+        p3_3 = re.compile(r'^\s*(?P<route_tag>\d+)$')
+
+        #IP broadcast address: 255.255.255.255
+        p4 = re.compile(r'^\s*IP *broadcast *address:'
+                         ' *(?P<broadcast_address>[0-9\.]+)$')
+
+        #IP multicast groups locally joined: none
+        #224.0.0.6  224.0.0.5  224.0.0.2 
+        p5 = re.compile(r'^\s*IP *multicast *groups *locally *joined:'
+                         ' *(?P<multicast_groups_address>[a-z]+)$')
+
+        #     show ip interface vrf all
+        p5_0 = re.compile(r'^\s*show')
+
+        #224.0.0.6  224.0.0.5  224.0.0.2 
+        p5_1 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+
+        #IP MTU: 1600 bytes (using link MTU)
+        p6 = re.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
+                         ' *bytes *\(using *link *MTU\)$')
+
+        #IP primary address route-preference: 0, tag: 0
+        p7 = re.compile(r'^\s*IP *primary *address *route-preference:'
+                         ' *(?P<route_preference>[0-9]+), *tag:'
+                         ' *(?P<route_tag>[0-9]+)$')
+
+        #IP proxy ARP : disabled
+        p8 = re.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
+
+        #IP Local Proxy ARP : disabled
+        p9 = re.compile(r'^\s*IP *Local *Proxy *ARP *:'
+                         ' *(?P<local_proxy_arp>[a-z]+)$')
+
+        #IP multicast routing: disabled
+        p10 = re.compile(r'^\s*IP *multicast *routing:'
+                          ' *(?P<multicast_routing>[a-z]+)$')
+
+        #IP icmp redirects: disabled
+        p11 = re.compile(r'^\s*IP *icmp *redirects:'
+                          ' *(?P<icmp_redirects>[a-z]+)$')
+
+        #IP directed-broadcast: disabled
+        p12 = re.compile(r'^\s*IP directed-broadcast:'
+                          ' *(?P<directed_broadcast>[a-z]+)$')
+
+        #IP Forwarding: disabled
+        p13 = re.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$') 
+
+        #IP icmp unreachables (except port): disabled
+        p14 = re.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
+                          ' *(?P<icmp_unreachable>[a-z]+)$')
+
+        #IP icmp port-unreachable: enabled
+        p15 = re.compile(r'^\s*IP *icmp *port-unreachable:'
+                          ' *(?P<icmp_port_unreachable>[a-z]+)$')
+
+        #IP unicast reverse path forwarding: none
+        p16 = re.compile(r'^\s*IP *unicast *reverse *path *forwarding:'
+                          ' *(?P<unicast_reverse_path>\w+)$')
+
+        #IP load sharing: none 
+        p17 = re.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
+
+        #IP interface statistics last reset: never
+        # ip interface statistics last reset: never
+        p18 = re.compile(r'^\s*(IP|ip) *interface *statistics *last *reset:'
+                         r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
+
+        #Unicast packets    : 0/0/0/0/0
+        p20 = re.compile(r'^\s*Unicast *packets *:'
+                          ' *(?P<unicast_packets_sent>[0-9]+)\/'
+                          '(?P<unicast_packets_received>[0-9]+)\/'
+                          '(?P<unicast_packets_forwarded>[0-9]+)\/'
+                          '(?P<unicast_packets_originated>[0-9]+)\/'
+                          '(?P<unicast_packets_consumed>[0-9]+)$')
+
+        #Unicast bytes      : 0/0/0/0/0
+        p21 = re.compile(r'^\s*Unicast *bytes *:'
+                          ' *(?P<unicast_bytes_sent>[0-9]+)\/'
+                          '(?P<unicast_bytes_received>[0-9]+)\/'
+                          '(?P<unicast_bytes_forwarded>[0-9]+)\/'
+                          '(?P<unicast_bytes_originated>[0-9]+)\/'
+                          '(?P<unicast_bytes_consumed>[0-9]+)$')
+
+        #Multicast packets  : 0/0/0/0/0
+        p22 = re.compile(r'^\s*Multicast *packets *:'
+                          ' *(?P<multicast_packets_sent>[0-9]+)\/'
+                          '(?P<multicast_packets_received>[0-9]+)\/'
+                          '(?P<multicast_packets_forwarded>[0-9]+)\/'
+                          '(?P<multicast_packets_originated>[0-9]+)\/'
+                          '(?P<multicast_packets_consumed>[0-9]+)$')
+
+        #Multicast bytes    : 0/0/0/0/0
+        p23 = re.compile(r'^\s*Multicast *bytes *:'
+                          ' *(?P<multicast_bytes_sent>[0-9]+)\/'
+                          '(?P<multicast_bytes_received>[0-9]+)\/'
+                          '(?P<multicast_bytes_forwarded>[0-9]+)\/'
+                          '(?P<multicast_bytes_originated>[0-9]+)\/'
+                          '(?P<multicast_bytes_consumed>[0-9]+)$')
+
+        #Broadcast packets  : 0/0/0/0/0
+        p24 = re.compile(r'^\s*Broadcast *packets *:'
+                          ' *(?P<broadcast_packets_sent>[0-9]+)\/'
+                          '(?P<broadcast_packets_received>[0-9]+)\/'
+                          '(?P<broadcast_packets_forwarded>[0-9]+)\/'
+                          '(?P<broadcast_packets_originated>[0-9]+)\/'
+                          '(?P<broadcast_packets_consumed>[0-9]+)$')
+
+        #Broadcast bytes    : 0/0/0/0/0
+        p25 = re.compile(r'^\s*Broadcast *bytes *:'
+                          ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
+                          '(?P<broadcast_bytes_received>[0-9]+)\/'
+                          '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
+                          '(?P<broadcast_bytes_originated>[0-9]+)\/'
+                          '(?P<broadcast_bytes_consumed>[0-9]+)$')
+
+        #Labeled packets    : 0/0/0/0/0
+        p26 = re.compile(r'^\s*Labeled *packets *:'
+                          ' *(?P<labeled_packets_sent>[0-9]+)\/'
+                          '(?P<labeled_packets_received>[0-9]+)\/'
+                          '(?P<labeled_packets_forwarded>[0-9]+)\/'
+                          '(?P<labeled_packets_originated>[0-9]+)\/'
+                          '(?P<labeled_packets_consumed>[0-9]+)$')
+
+        #Labeled bytes      : 0/0/0/0/0
+        p27 = re.compile(r'^\s*Labeled *bytes *:'
+                          ' *(?P<labeled_bytes_sent>[0-9]+)\/'
+                          '(?P<labeled_bytes_received>[0-9]+)\/'
+                          '(?P<labeled_bytes_forwarded>[0-9]+)\/'
+                          '(?P<labeled_bytes_originated>[0-9]+)\/'
+                          '(?P<labeled_bytes_consumed>[0-9]+)$')
+
+        #WCCP Redirect outbound: disabled
+        p28 = re.compile(r'^\s*WCCP *Redirect *outbound:'
+                          ' *(?P<wccp_redirect_outbound>[a-z]+)$')
+
+        #WCCP Redirect inbound: disabled
+        p29 = re.compile(r'^\s*WCCP *Redirect *inbound:'
+                          ' *(?P<wccp_redirect_inbound>[a-z]+)$')
+
+        #WCCP Redirect exclude: disabled
+        p30 = re.compile(r'^\s*WCCP *Redirect *exclude:'
+                          ' *(?P<wccp_redirect_exclude>[a-z]+)$')
+
+        # IP unnumbered interface (loopback0)
+        p31 = re.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            # IP Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IP *Interface *Status *for *VRF'
-                             ' *(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf = vrf.replace('"',"")
                 continue
 
-            #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
-            p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
-                             ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
-                             ' *iod: *(?P<iod>[0-9]+),$')
             m = p2.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1261,18 +1568,11 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                             address = key
                 continue
 
-            # Unnumbered interfaces of loopback0: first iod 46
-            p2_1 = re.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
-                               'first +iod +(?P<first_iod>\d+)$')
             m = p2_1.match(line)
             if m:
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
                 continue
 
-            # Ethernet2/11:
-            # mti18: tunnel-te11: tunnel-te12:
-            p2_2 = re.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
-                              r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
             m = p2_2.findall(line)
             if m and unnumbered_intf:
                 temp_intf = []
@@ -1281,12 +1581,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     if intf not in ip_interface_vrf_all_dict:
                         ip_interface_vrf_all_dict[intf] = {}
                 continue
-            # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
-            # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
-            p3 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
-                             ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
-                             '(?P<prefix_length>[0-9]+)'
-                             ' *(?P<secondary>(secondary))?$')
             m = p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1324,13 +1618,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
                 continue
 
-            # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
-            # IP address: 10.115.69.2, IP subnet: 10.115.69.0/24 secondary route-preference: 0, tag: 0
-            p3_1 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
-                              r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
-                              r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
-                              r'(?P<route_preference>[0-9]+),)?'
-                              r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$')
             m = p3_1.match(line)
             
             if m:
@@ -1377,8 +1664,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                         ip_interface_vrf_all_dict[intf]['ipv4'][address]['secondary'] = True
                 continue
             
-            # IP address: none
-            p3_2 = re.compile('^\s*IP +address: +(?P<ip>\S+)$')
             m = p3_2.match(line)
             if m:
                 group = m.groupdict()
@@ -1391,8 +1676,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['ip'] = address
                 continue
 
-            #   0
-            p3_3 = re.compile(r'^\s*(?P<route_tag>\d+)$')
             m = p3_3.match(line)
             if m:
                 group = m.groupdict()
@@ -1411,9 +1694,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                         save_addr_for_route_tag_next_line = None
                 continue
 
-            #IP broadcast address: 255.255.255.255
-            p4 = re.compile(r'^\s*IP *broadcast *address:'
-                             ' *(?P<broadcast_address>[0-9\.]+)$')
             m = p4.match(line)
             if m:
                 broadcast_address = str(m.groupdict()['broadcast_address'])
@@ -1421,10 +1701,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ip_interface_vrf_all_dict[interface]['ipv4'][address]['broadcast_address'] = broadcast_address
                 continue
             
-            #IP multicast groups locally joined: none
-            #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5 = re.compile(r'^\s*IP *multicast *groups *locally *joined:'
-                             ' *(?P<multicast_groups_address>[a-z]+)$')
             m = p5.match(line)
             if m:
                 multicast_groups_address = m.groupdict()['multicast_groups_address']
@@ -1433,14 +1709,10 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 = multicast_groups_address
                 continue
             
-            #     show ip interface vrf all
-            p5_0 = re.compile(r'^\s*show')
             m = p5_0.match(line)
             if m:
                 continue
 
-            #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5_1 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
             m = p5_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1456,9 +1728,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 = sorted(multicast_groups)
                 continue
 
-            #IP MTU: 1600 bytes (using link MTU)
-            p6 = re.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
-                             ' *bytes *\(using *link *MTU\)$')
             m = p6.match(line)
             if m:
                 ip_mtu = int(m.groupdict()['ip_mtu'])
@@ -1466,10 +1735,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 ip_interface_vrf_all_dict[interface]['ip_mtu'] = ip_mtu
                 continue
 
-            #IP primary address route-preference: 0, tag: 0
-            p7 = re.compile(r'^\s*IP *primary *address *route-preference:'
-                             ' *(?P<route_preference>[0-9]+), *tag:'
-                             ' *(?P<route_tag>[0-9]+)$')
             m = p7.match(line)
             if m:
                 route_preference = m.groupdict()['route_preference']
@@ -1484,8 +1749,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['route_tag'] = route_tag
                 continue
 
-            #IP proxy ARP : disabled
-            p8 = re.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
             m = p8.match(line)
             if m:
                 proxy_arp = m.groupdict()['proxy_arp']
@@ -1493,9 +1756,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 ip_interface_vrf_all_dict[interface]['proxy_arp'] = proxy_arp
                 continue
 
-            #IP Local Proxy ARP : disabled
-            p9 = re.compile(r'^\s*IP *Local *Proxy *ARP *:'
-                             ' *(?P<local_proxy_arp>[a-z]+)$')
             m = p9.match(line)
             if m:
                 local_proxy_arp = m.groupdict()['local_proxy_arp']
@@ -1504,9 +1764,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = local_proxy_arp
                 continue
 
-            #IP multicast routing: disabled
-            p10 = re.compile(r'^\s*IP *multicast *routing:'
-                              ' *(?P<multicast_routing>[a-z]+)$')
             m = p10.match(line)
             if m:
                 multicast_routing = m.groupdict()['multicast_routing']
@@ -1515,9 +1772,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = multicast_routing
                 continue
 
-            #IP icmp redirects: disabled
-            p11 = re.compile(r'^\s*IP *icmp *redirects:'
-                              ' *(?P<icmp_redirects>[a-z]+)$')
             m = p11.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
@@ -1526,9 +1780,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = icmp_redirects
                 continue
 
-            #IP directed-broadcast: disabled
-            p12 = re.compile(r'^\s*IP directed-broadcast:'
-                              ' *(?P<directed_broadcast>[a-z]+)$')
             m = p12.match(line)
             if m:
                 directed_broadcast = m.groupdict()['directed_broadcast']
@@ -1537,8 +1788,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = directed_broadcast
                 continue
 
-            #IP Forwarding: disabled
-            p13 = re.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$') 
             m = p13.match(line)
             if m:
                 ip_forwarding = m.groupdict()['ip_forwarding']
@@ -1547,9 +1796,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = ip_forwarding
                 continue
 
-            #IP icmp unreachables (except port): disabled
-            p14 = re.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
-                              ' *(?P<icmp_unreachable>[a-z]+)$')
             m = p14.match(line)
             if m:
                 icmp_unreachable = m.groupdict()['icmp_unreachable']
@@ -1558,9 +1804,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = icmp_unreachable
                 continue
 
-            #IP icmp port-unreachable: enabled
-            p15 = re.compile(r'^\s*IP *icmp *port-unreachable:'
-                              ' *(?P<icmp_port_unreachable>[a-z]+)$')
             m = p15.match(line)
             if m:
                 icmp_port_unreachable = m.groupdict()['icmp_port_unreachable']
@@ -1569,9 +1812,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = icmp_port_unreachable
                 continue
 
-            #IP unicast reverse path forwarding: none
-            p16 = re.compile(r'^\s*IP *unicast *reverse *path *forwarding:'
-                              ' *(?P<unicast_reverse_path>\w+)$')
             m = p16.match(line)
             if m:
                 unicast_reverse_path = m.groupdict()['unicast_reverse_path']
@@ -1580,8 +1820,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = unicast_reverse_path
                 continue
 
-            #IP load sharing: none 
-            p17 = re.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
             m = p17.match(line)
             if m:
                 load_sharing = m.groupdict()['load_sharing']
@@ -1590,10 +1828,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = load_sharing
                 continue
 
-            #IP interface statistics last reset: never
-            # ip interface statistics last reset: never
-            p18 = re.compile(r'^\s*(IP|ip) *interface *statistics *last *reset:'
-                             r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
             m = p18.match(line)
             if m:
                 int_stat_last_reset = m.groupdict()['int_stat_last_reset']
@@ -1617,13 +1851,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
             
             if 'ipv4' in ip_interface_vrf_all_dict[interface]:
-                #Unicast packets    : 0/0/0/0/0
-                p20 = re.compile(r'^\s*Unicast *packets *:'
-                                  ' *(?P<unicast_packets_sent>[0-9]+)\/'
-                                  '(?P<unicast_packets_received>[0-9]+)\/'
-                                  '(?P<unicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_packets_originated>[0-9]+)\/'
-                                  '(?P<unicast_packets_consumed>[0-9]+)$')
                 m = p20.match(line)
                 if m:
                     if 'counters' not in ip_interface_vrf_all_dict[interface]['ipv4'][address]:
@@ -1641,13 +1868,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['unicast_packets_consumed']= int(m.groupdict()['unicast_packets_consumed'])
                     continue
 
-                #Unicast bytes      : 0/0/0/0/0
-                p21 = re.compile(r'^\s*Unicast *bytes *:'
-                                  ' *(?P<unicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<unicast_bytes_received>[0-9]+)\/'
-                                  '(?P<unicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<unicast_bytes_consumed>[0-9]+)$')
                 m = p21.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1662,13 +1882,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['unicast_bytes_consumed']= int(m.groupdict()['unicast_bytes_consumed'])
                     continue
 
-                #Multicast packets  : 0/0/0/0/0
-                p22 = re.compile(r'^\s*Multicast *packets *:'
-                                  ' *(?P<multicast_packets_sent>[0-9]+)\/'
-                                  '(?P<multicast_packets_received>[0-9]+)\/'
-                                  '(?P<multicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_packets_originated>[0-9]+)\/'
-                                  '(?P<multicast_packets_consumed>[0-9]+)$')
                 m = p22.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1683,13 +1896,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['multicast_packets_consumed']= int(m.groupdict()['multicast_packets_consumed'])
                     continue
 
-                #Multicast bytes    : 0/0/0/0/0
-                p23 = re.compile(r'^\s*Multicast *bytes *:'
-                                  ' *(?P<multicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<multicast_bytes_received>[0-9]+)\/'
-                                  '(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<multicast_bytes_consumed>[0-9]+)$')
                 m = p23.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1704,13 +1910,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['multicast_bytes_consumed']= int(m.groupdict()['multicast_bytes_consumed'])
                     continue
 
-                #Broadcast packets  : 0/0/0/0/0
-                p24 = re.compile(r'^\s*Broadcast *packets *:'
-                                  ' *(?P<broadcast_packets_sent>[0-9]+)\/'
-                                  '(?P<broadcast_packets_received>[0-9]+)\/'
-                                  '(?P<broadcast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_packets_originated>[0-9]+)\/'
-                                  '(?P<broadcast_packets_consumed>[0-9]+)$')
                 m = p24.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1725,13 +1924,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['broadcast_packets_consumed']= int(m.groupdict()['broadcast_packets_consumed'])
                     continue
 
-                #Broadcast bytes    : 0/0/0/0/0
-                p25 = re.compile(r'^\s*Broadcast *bytes *:'
-                                  ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_received>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_originated>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_consumed>[0-9]+)$')
                 m = p25.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1746,13 +1938,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['broadcast_bytes_consumed']= int(m.groupdict()['broadcast_bytes_consumed'])
                     continue
 
-                #Labeled packets    : 0/0/0/0/0
-                p26 = re.compile(r'^\s*Labeled *packets *:'
-                                  ' *(?P<labeled_packets_sent>[0-9]+)\/'
-                                  '(?P<labeled_packets_received>[0-9]+)\/'
-                                  '(?P<labeled_packets_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_packets_originated>[0-9]+)\/'
-                                  '(?P<labeled_packets_consumed>[0-9]+)$')
                 m = p26.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1767,13 +1952,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['labeled_packets_consumed']= int(m.groupdict()['labeled_packets_consumed'])
                     continue
 
-                #Labeled bytes      : 0/0/0/0/0
-                p27 = re.compile(r'^\s*Labeled *bytes *:'
-                                  ' *(?P<labeled_bytes_sent>[0-9]+)\/'
-                                  '(?P<labeled_bytes_received>[0-9]+)\/'
-                                  '(?P<labeled_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_bytes_originated>[0-9]+)\/'
-                                  '(?P<labeled_bytes_consumed>[0-9]+)$')
                 m = p27.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
@@ -1788,9 +1966,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     ['labeled_bytes_consumed']= int(m.groupdict()['labeled_bytes_consumed'])
                     continue
 
-            #WCCP Redirect outbound: disabled
-            p28 = re.compile(r'^\s*WCCP *Redirect *outbound:'
-                              ' *(?P<wccp_redirect_outbound>[a-z]+)$')
             m = p28.match(line)
             if m:
                 wccp_redirect_outbound = m.groupdict()['wccp_redirect_outbound']
@@ -1799,9 +1974,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = wccp_redirect_outbound
                 continue
 
-            #WCCP Redirect inbound: disabled
-            p29 = re.compile(r'^\s*WCCP *Redirect *inbound:'
-                              ' *(?P<wccp_redirect_inbound>[a-z]+)$')
             m = p29.match(line)
             if m:
                 wccp_redirect_inbound = m.groupdict()['wccp_redirect_inbound']
@@ -1810,9 +1982,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = wccp_redirect_inbound
                 continue
 
-            #WCCP Redirect exclude: disabled
-            p30 = re.compile(r'^\s*WCCP *Redirect *exclude:'
-                              ' *(?P<wccp_redirect_exclude>[a-z]+)$')
             m = p30.match(line)
             if m:
                 wccp_redirect_exclude = m.groupdict()['wccp_redirect_exclude']
@@ -1821,8 +1990,6 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                  = wccp_redirect_exclude
                 continue
 
-            # IP unnumbered interface (loopback0)
-            p31 = re.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
             m = p31.match(line)
             if m:
                 unnum_intf = m.groupdict()['unnum_intf']
@@ -1879,6 +2046,11 @@ class ShowVrfAllInterface(ShowVrfAllInterfaceSchema):
 
         vrf_all_interface_dict = {}
 
+        p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\.\/]+)'
+                         ' *(?P<vrf>[a-zA-Z0-9]+)'
+                         ' *(?P<vrf_id>[0-9]+)'
+                         ' *(?P<site_of_origin>[a-zA-Z\-]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
@@ -1891,11 +2063,6 @@ class ShowVrfAllInterface(ShowVrfAllInterfaceSchema):
             # Ethernet2/5               default                              1  --
             # Ethernet2/6               default                              1  --
             
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\.\/]+)'
-                             ' *(?P<vrf>[a-zA-Z0-9]+)'
-                             ' *(?P<vrf_id>[0-9]+)'
-                             ' *(?P<site_of_origin>[a-zA-Z\-]+)$')
-
             m = p1.match(line)
             if m:
 
@@ -1964,11 +2131,83 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
 
         interface_switchport_dict = {}
 
+        #Name: Ethernet2/2
+        p1 = re.compile(r'^\s*Name: *(?P<interface>[a-zA-Z0-9\/\-\.]+)$')
+
+        #Switchport: Enabled
+        p2 = re.compile(r'^\s*Switchport: *(?P<switchport_status>[a-zA-Z\s]+)$')
+
+        #Switchport Monitor: Not enabled
+        p3 = re.compile(r'^\s*Switchport *Monitor: *(?P<switchport_monitor>[a-zA-Z\s]+)$')
+
+        # Operational Mode: Private-vlan host
+        p4 = re.compile(r'^\s*Operational *Mode: *(?P<switchport_mode>[\w\s-]+)$')
+
+        # Access Mode VLAN: 1 (default)
+        # Access Mode VLAN: 7 (server-vlan7)
+        # Access Mode VLAN: 551 (Test_VM_192.168.1.0/24)
+        p5 = re.compile(r'^\s*Access *Mode *VLAN: *(?P<access_vlan>[0-9]+)'
+                         '(?: *\((?P<access_vlan_mode>[\S\s]+)\))?$')
+
+        # Trunking Native Mode VLAN: 1 (default)
+        # Trunking Native Mode VLAN: 200 (VLAN0200)
+        # Trunking Native Mode VLAN: 3967 (Vlan not created)
+        # Trunking Native Mode VLAN: 451 (VM_Machines_192.168.1.0/24)
+        p6 = re.compile(r'^\s*Trunking *Native *Mode *VLAN:'
+                         ' *(?P<native_vlan>[0-9]+)'
+                         ' *\((?P<native_vlan_mode>[\S\s]+)\)$')
+
+        #Trunking VLANs Allowed: 100,300
+        p7 = re.compile(r'^\s*Trunking *VLANs *Allowed: *(?P<trunk_vlans>[0-9\,\-]+)$')
+
+        # Administrative private-vlan primary host-association: 2000
+        p8 = re.compile(r'^\s*Administrative *private-vlan *primary'
+                         ' *host-association:'
+                         ' *(?P<admin_priv_vlan_primary_host_assoc>\w+)$')
+
+        # Administrative private-vlan secondary host-association: 110
+        p9 = re.compile(r'^\s*Administrative *private-vlan *secondary'
+                         ' *host-association:'
+                         ' *(?P<admin_priv_vlan_secondary_host_assoc>\w+)$')
+
+        #Administrative private-vlan primary mapping: none
+        p10 = re.compile(r'^\s*Administrative *private-vlan *primary'
+                         ' *mapping:'
+                         ' *(?P<admin_priv_vlan_primary_mapping>\w+)$')
+
+        #Administrative private-vlan secondary mapping: none
+        p11 = re.compile(r'^\s*Administrative *private-vlan *secondary'
+                         ' *mapping:'
+                         ' *(?P<admin_priv_vlan_secondary_mapping>\w+)$')
+
+        #Administrative private-vlan trunk native VLAN: 1
+        p12 = re.compile(r'^\s*Administrative *private-vlan *trunk *native'
+                         ' *VLAN:'
+                         ' *(?P<admin_priv_vlan_trunk_native_vlan>\w+)$')
+
+        #Administrative private-vlan trunk encapsulation: dot1q
+        p13 = re.compile(r'^\s*Administrative *private-vlan *trunk'
+                         ' *encapsulation:'
+                         ' *(?P<admin_priv_vlan_trunk_encapsulation>[a-z0-9]+)$')
+
+        #Administrative private-vlan trunk normal VLANs: none
+        p14 = re.compile(r'^\s*Administrative *private-vlan *trunk'
+                         ' *normal VLANs:'
+                         ' *(?P<admin_priv_vlan_trunk_normal_vlans>\w+)$')
+
+        # Administrative private-vlan trunk private VLANs: none
+        # Administrative private-vlan trunk private VLANs: none(0 none)
+        p15 = re.compile(r'^\s*Administrative *private-vlan *trunk'
+                         ' *private VLANs:'
+                         ' *(?P<admin_priv_vlan_trunk_private_vlans>\w+)(?P<dummy>.*)?$')
+
+        # Operational private-vlan: (2500,101)
+        p16 = re.compile(r'^\s*Operational *private-vlan:'
+                         ' *(?P<operational_private_vlan>\S+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            #Name: Ethernet2/2
-            p1 = re.compile(r'^\s*Name: *(?P<interface>[a-zA-Z0-9\/\-\.]+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1977,8 +2216,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                     interface_switchport_dict[interface] = {}
                     continue
 
-            #Switchport: Enabled
-            p2 = re.compile(r'^\s*Switchport: *(?P<switchport_status>[a-zA-Z\s]+)$')
             m = p2.match(line)
             if m:    
                 switchport_status = m.groupdict()['switchport_status'].lower()
@@ -1989,8 +2226,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
 
                 continue
 
-            #Switchport Monitor: Not enabled
-            p3 = re.compile(r'^\s*Switchport *Monitor: *(?P<switchport_monitor>[a-zA-Z\s]+)$')
             m = p3.match(line)
             if m:
                 switchport_monitor = m.groupdict()['switchport_monitor']
@@ -1998,18 +2233,11 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 interface_switchport_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
-            # Operational Mode: Private-vlan host
-            p4 = re.compile(r'^\s*Operational *Mode: *(?P<switchport_mode>[\w\s-]+)$')
             m = p4.match(line)
             if m:
                 interface_switchport_dict[interface]['switchport_mode'] = m.groupdict()['switchport_mode'] 
                 continue
 
-            # Access Mode VLAN: 1 (default)
-            # Access Mode VLAN: 7 (server-vlan7)
-            # Access Mode VLAN: 551 (Test_VM_192.168.1.0/24)
-            p5 = re.compile(r'^\s*Access *Mode *VLAN: *(?P<access_vlan>[0-9]+)'
-                             '(?: *\((?P<access_vlan_mode>[\S\s]+)\))?$')
             m = p5.match(line)
             if m:
                 access_vlan = int(m.groupdict()['access_vlan'])
@@ -2021,13 +2249,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['access_vlan_mode'] = access_vlan_mode
                 continue
 
-            # Trunking Native Mode VLAN: 1 (default)
-            # Trunking Native Mode VLAN: 200 (VLAN0200)
-            # Trunking Native Mode VLAN: 3967 (Vlan not created)
-            # Trunking Native Mode VLAN: 451 (VM_Machines_192.168.1.0/24)
-            p6 = re.compile(r'^\s*Trunking *Native *Mode *VLAN:'
-                             ' *(?P<native_vlan>[0-9]+)'
-                             ' *\((?P<native_vlan_mode>[\S\s]+)\)$')
             m = p6.match(line)
             if m:
                 native_vlan = int(m.groupdict()['native_vlan'])
@@ -2039,8 +2260,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['native_vlan_mode'] = native_vlan_mode
                 continue
 
-            #Trunking VLANs Allowed: 100,300
-            p7 = re.compile(r'^\s*Trunking *VLANs *Allowed: *(?P<trunk_vlans>[0-9\,\-]+)$')
             m = p7.match(line)
             if m:
                 trunk_vlans = m.groupdict()['trunk_vlans']
@@ -2048,10 +2267,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 interface_switchport_dict[interface]['trunk_vlans'] = trunk_vlans
                 continue
 
-            # Administrative private-vlan primary host-association: 2000
-            p8 = re.compile(r'^\s*Administrative *private-vlan *primary'
-                             ' *host-association:'
-                             ' *(?P<admin_priv_vlan_primary_host_assoc>\w+)$')
             m = p8.match(line)
             if m:
                 admin_priv_vlan_primary_host_assoc = m.groupdict()['admin_priv_vlan_primary_host_assoc']
@@ -2059,10 +2274,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 interface_switchport_dict[interface]['admin_priv_vlan_primary_host_assoc'] = admin_priv_vlan_primary_host_assoc
                 continue
 
-            # Administrative private-vlan secondary host-association: 110
-            p9 = re.compile(r'^\s*Administrative *private-vlan *secondary'
-                             ' *host-association:'
-                             ' *(?P<admin_priv_vlan_secondary_host_assoc>\w+)$')
             m = p9.match(line)
             if m:
                 admin_priv_vlan_secondary_host_assoc\
@@ -2072,10 +2283,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_secondary_host_assoc'] = admin_priv_vlan_secondary_host_assoc
                 continue
 
-            #Administrative private-vlan primary mapping: none
-            p10 = re.compile(r'^\s*Administrative *private-vlan *primary'
-                             ' *mapping:'
-                             ' *(?P<admin_priv_vlan_primary_mapping>\w+)$')
             m = p10.match(line)
             if m:
                 admin_priv_vlan_primary_mapping\
@@ -2086,10 +2293,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                  = admin_priv_vlan_primary_mapping
                 continue
 
-            #Administrative private-vlan secondary mapping: none
-            p11 = re.compile(r'^\s*Administrative *private-vlan *secondary'
-                             ' *mapping:'
-                             ' *(?P<admin_priv_vlan_secondary_mapping>\w+)$')
             m = p11.match(line)
             if m:
                 admin_priv_vlan_secondary_mapping = m.groupdict()['admin_priv_vlan_secondary_mapping']
@@ -2098,10 +2301,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_secondary_mapping'] = admin_priv_vlan_secondary_mapping
                 continue
 
-            #Administrative private-vlan trunk native VLAN: 1
-            p12 = re.compile(r'^\s*Administrative *private-vlan *trunk *native'
-                             ' *VLAN:'
-                             ' *(?P<admin_priv_vlan_trunk_native_vlan>\w+)$')
             m = p12.match(line)
             if m:
                 admin_priv_vlan_trunk_native_vlan = m.groupdict()['admin_priv_vlan_trunk_native_vlan']
@@ -2110,10 +2309,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_trunk_native_vlan'] = admin_priv_vlan_trunk_native_vlan
                 continue
 
-            #Administrative private-vlan trunk encapsulation: dot1q
-            p13 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             ' *encapsulation:'
-                             ' *(?P<admin_priv_vlan_trunk_encapsulation>[a-z0-9]+)$')
             m = p13.match(line)
             if m:
                 admin_priv_vlan_trunk_encapsulation = m.groupdict()['admin_priv_vlan_trunk_encapsulation']
@@ -2122,10 +2317,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_trunk_encapsulation'] = admin_priv_vlan_trunk_encapsulation
                 continue
 
-            #Administrative private-vlan trunk normal VLANs: none
-            p14 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             ' *normal VLANs:'
-                             ' *(?P<admin_priv_vlan_trunk_normal_vlans>\w+)$')
             m = p14.match(line)
             if m:
                 admin_priv_vlan_trunk_normal_vlans = m.groupdict()['admin_priv_vlan_trunk_normal_vlans']
@@ -2134,11 +2325,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_trunk_normal_vlans'] = admin_priv_vlan_trunk_normal_vlans
                 continue
 
-            # Administrative private-vlan trunk private VLANs: none
-            # Administrative private-vlan trunk private VLANs: none(0 none)
-            p15 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             ' *private VLANs:'
-                             ' *(?P<admin_priv_vlan_trunk_private_vlans>\w+)(?P<dummy>.*)?$')
             m = p15.match(line)
             if m:
                 admin_priv_vlan_trunk_private_vlans = m.groupdict()['admin_priv_vlan_trunk_private_vlans']
@@ -2147,9 +2333,6 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 ['admin_priv_vlan_trunk_private_vlans'] = admin_priv_vlan_trunk_private_vlans
                 continue
 
-            # Operational private-vlan: (2500,101)
-            p16 = re.compile(r'^\s*Operational *private-vlan:'
-                             ' *(?P<operational_private_vlan>\S+)$')
             m = p16.match(line)
             if m:
                 operational_private_vlan = m.groupdict()['operational_private_vlan']
@@ -2263,23 +2446,121 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
         virtual_add = False
         multicast_groups = False
 
+        #IPv6 Interface Status for VRF "VRF1"
+        p1 = re.compile(r'^\s*IPv6 *Interface *Status *for *VRF'
+                         ' *(?P<vrf>\S+)$')
+
+        #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36
+        #port-channel2.101, Interface status: protocol-down/link-down/admin-up, iod: 71
+        p2 = re.compile(r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
+                         ' *status: *(?P<interface_status>[a-z\-\/]+),'
+                         ' *iod: *(?P<iod>[0-9]+)$')
+
+        # IPv6 address:
+        p3_1 = re.compile(r'^\s*IPv6 address:$')
+
+        # Anycast configured addresses:
+        p3_2 = re.compile(r'^\s*Anycast configured addresses:$')
+
+        # 2001:db8:1:1::1/64 [VALID]
+        p3_3 = re.compile(r'^\s*(?P<ip>[a-z0-9\:]+)'
+                         '\/(?P<prefix_length>[0-9]+)'
+                         ' *\[(?P<status>[a-zA-Z]+)\]$')
+
+        #IPv6 subnet:  2001:db8:1:1::/64
+        p4 = re.compile(r'^\s*IPv6 *subnet:'
+                         ' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$')
+
+        #IPv6 link-local address: fe80::a8aa:bbff:febb:cccc (default) [VALID]
+        p5 = re.compile(r'^\s*IPv6 *link-local *address:'
+                         ' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
+                         ' *\((?P<ipv6_link_local_state>[a-z]+)\)'
+                         ' *\[(?P<ipv6_ll_state>[A-Z]+)\]$')
+
+        #IPv6 virtual addresses configured: none
+        p6 = re.compile(r'^\s*IPv6 *virtual *addresses *configured:'
+                         ' *(?P<ipv6_virtual_add>\w+)$')
+
+        #IPv6 virtual addresses configured:
+        #        fe80::5:73ff:fea0:2  2001:db8:7746:fa41::1
+        p6_1 = re.compile(r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$')
+
+        p6_2 = re.compile(r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$')
+
+        #IPv6 multicast routing: disabled
+        p7 = re.compile(r'^\s*IPv6 *multicast *routing:'
+                         ' *(?P<ipv6_multicast_routing>[a-z]+)$')
+
+        #IPv6 report link local: disabled
+        p8 = re.compile(r'^\s*IPv6 *report *link *local:'
+                          ' *(?P<ipv6_report_link_local>[a-z]+)$')
+
+        #IPv6 Forwarding feature: disabled
+        p9 = re.compile(r'^\s*IPv6 *Forwarding *feature:'
+                          ' *(?P<ipv6_forwarding_feature>[a-z]+)$')
+
+        #IPv6 multicast groups locally joined:
+        p10 = re.compile(r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$')
+
+        # ff02::1:ffbb:cccc  ff02::1:ff00:3  ff02::1:ff00:2  ff02::2   
+        # ff02::1  ff02::1:ff00:1  ff02::1:ffbb:cccc  ff02::1:ff00:0
+        # ff02::1:ffad:beef  ff02::1:ff00:1(2)  ff02::2(2)  ff02::1(2)
+        p11 = re.compile(r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$')
+
+        # IPv6 multicast (S,G) entries joined: none
+        # IPv6 multicast (S,G) entries joined: 
+        #  (2001:20:1:1::254, ff38::1)
+        p12 = re.compile(r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$')
+
+        #  (2001:20:1:1::254, ff38::1)
+        p12_1 = re.compile(r'^\s*\((?P<ip_list>.*)\)')
+
+        #IPv6 MTU: 1600 (using link MTU)
+        p13 = re.compile(r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
+                          ' *\(using *link *MTU\)$')
+
+        #IPv6 unicast reverse path forwarding: none
+        p14 = re.compile(r'^\s*IPv6 *unicast *reverse *path *forwarding:'
+                          ' *(?P<ipv6_unicast_rev_path_forwarding>\w+)$')
+
+        #IPv6 load sharing: none
+        p15 = re.compile(r'^\s*IPv6 *load *sharing:'
+                         ' *(?P<ipv6_load_sharing>\w+)$')
+
+        #IPv6 interface statistics last reset: never
+        p16 = re.compile(r'^\s*IPv6 *interface *statistics *last *reset:'
+                          ' *(?P<ipv6_last_reset>[a-z]+)$')
+
+        #Unicast packets:      0/0/0
+        p18 = re.compile(r'^\s*Unicast *packets:'
+                         ' *(?P<unicast_packets_forwarded>[0-9]+)\/'
+                         '(?P<unicast_packets_originated>[0-9]+)\/'
+                         '(?P<unicast_packets_consumed>[0-9]+)$')
+
+        #Unicast bytes:        0/0/0
+        p19 = re.compile(r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
+                          '\/(?P<unicast_bytes_originated>[0-9]+)\/'
+                          '(?P<unicast_bytes_consumed>[0-9]+)$')
+
+        #Multicast packets:    0/12/9
+        p20 = re.compile(r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
+                          '\/(?P<multicast_packets_originated>[0-9]+)\/'
+                          '(?P<multicast_packets_consumed>[0-9]+)$')
+
+        #Multicast bytes:      0/1144/640
+        p21 = re.compile(r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
+                          '(?P<multicast_bytes_originated>[0-9]+)\/'
+                          '(?P<multicast_bytes_consumed>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            #IPv6 Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IPv6 *Interface *Status *for *VRF'
-                             ' *(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf = vrf.replace('"',"")
                 continue
 
-            #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36
-            #port-channel2.101, Interface status: protocol-down/link-down/admin-up, iod: 71
-            p2 = re.compile(r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
-                             ' *status: *(?P<interface_status>[a-z\-\/]+),'
-                             ' *iod: *(?P<iod>[0-9]+)$')
             m = p2.match(line)
             if m:
 
@@ -2300,26 +2581,18 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_multicast_entries = multicast_groups = False
                 continue
 
-            # IPv6 address:
-            p3_1 = re.compile(r'^\s*IPv6 address:$')
             m = p3_1.match(line)
             if m:
                 ipv6_addresses = True
                 anycast_addresses = False
                 continue
 
-            # Anycast configured addresses:
-            p3_2 = re.compile(r'^\s*Anycast configured addresses:$')
             m = p3_2.match(line)
             if m:
                 anycast_addresses = True
                 ipv6_addresses = False
                 continue
 
-            # 2001:db8:1:1::1/64 [VALID]
-            p3_3 = re.compile(r'^\s*(?P<ip>[a-z0-9\:]+)'
-                             '\/(?P<prefix_length>[0-9]+)'
-                             ' *\[(?P<status>[a-zA-Z]+)\]$')
             m = p3_3.match(line)
             if m:
                 ip  = m.groupdict()['ip']
@@ -2346,9 +2619,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                         ['anycast'] = True
                 continue
 
-            #IPv6 subnet:  2001:db8:1:1::/64
-            p4 = re.compile(r'^\s*IPv6 *subnet:'
-                             ' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$')
             m = p4.match(line)
             if m:
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -2356,11 +2626,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_interface_dict[interface]['ipv6']['ipv6_subnet'] = ipv6_subnet
                 continue
 
-            #IPv6 link-local address: fe80::a8aa:bbff:febb:cccc (default) [VALID]
-            p5 = re.compile(r'^\s*IPv6 *link-local *address:'
-                             ' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
-                             ' *\((?P<ipv6_link_local_state>[a-z]+)\)'
-                             ' *\[(?P<ipv6_ll_state>[A-Z]+)\]$')
             m = p5.match(line)
             if m:
                 ipv6_link_local = m.groupdict()['ipv6_link_local']
@@ -2375,9 +2640,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_interface_dict[interface]['ipv6']['ipv6_ll_state'] = ipv6_ll_state
                 continue
 
-            #IPv6 virtual addresses configured: none
-            p6 = re.compile(r'^\s*IPv6 *virtual *addresses *configured:'
-                             ' *(?P<ipv6_virtual_add>\w+)$')
             m = p6.match(line)
             if m:
                 ipv6_virtual_add = m.groupdict()['ipv6_virtual_add']
@@ -2385,9 +2647,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_interface_dict[interface]['ipv6']['ipv6_virtual_add'] = ipv6_virtual_add
                 continue
 
-            #IPv6 virtual addresses configured:
-            #        fe80::5:73ff:fea0:2  2001:db8:7746:fa41::1
-            p6_1 = re.compile(r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$')
             m = p6_1.match(line)
             if m:
                 virtual_add = m.groupdict()['virtual_add']
@@ -2396,7 +2655,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             if virtual_add:
-                p6_2 = re.compile(r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$')
                 m = p6_2.match(line)
                 if m:
                     ipv6_virtual_addresses = str(m.groupdict()['ipv6_virtual_addresses'])
@@ -2412,9 +2670,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                     = sorted(ipv6_virtual_groups)
                     continue
 
-            #IPv6 multicast routing: disabled
-            p7 = re.compile(r'^\s*IPv6 *multicast *routing:'
-                             ' *(?P<ipv6_multicast_routing>[a-z]+)$')
             m = p7.match(line)
             if m:
                 ipv6_multicast_routing = m.groupdict()['ipv6_multicast_routing']
@@ -2422,9 +2677,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_interface_dict[interface]['ipv6']['ipv6_multicast_routing'] = ipv6_multicast_routing
                 continue
 
-            #IPv6 report link local: disabled
-            p8 = re.compile(r'^\s*IPv6 *report *link *local:'
-                              ' *(?P<ipv6_report_link_local>[a-z]+)$')
             m = p8.match(line)
             if m:
                 ipv6_report_link_local = m.groupdict()['ipv6_report_link_local']
@@ -2433,9 +2685,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_report_link_local
                 continue
 
-            #IPv6 Forwarding feature: disabled
-            p9 = re.compile(r'^\s*IPv6 *Forwarding *feature:'
-                              ' *(?P<ipv6_forwarding_feature>[a-z]+)$')
             m = p9.match(line)
             if m:
                 ipv6_forwarding_feature = m.groupdict()['ipv6_forwarding_feature']
@@ -2444,8 +2693,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_forwarding_feature
                 continue
 
-            #IPv6 multicast groups locally joined:
-            p10 = re.compile(r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$')
             m = p10.match(line)
             if m:
                 virtual_add = False
@@ -2454,10 +2701,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             if multicast_groups:
-                # ff02::1:ffbb:cccc  ff02::1:ff00:3  ff02::1:ff00:2  ff02::2   
-                # ff02::1  ff02::1:ff00:1  ff02::1:ffbb:cccc  ff02::1:ff00:0
-                # ff02::1:ffad:beef  ff02::1:ff00:1(2)  ff02::2(2)  ff02::1(2)
-                p11 = re.compile(r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$')
                 m = p11.match(line)
                 if m:
                     ipv6_multicast_group_addresses = str(m.groupdict()['ipv6_multicast_group_addresses'])
@@ -2473,17 +2716,11 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                      = sorted(ipv6_multicast_groups)
                     continue
 
-            # IPv6 multicast (S,G) entries joined: none
-            # IPv6 multicast (S,G) entries joined: 
-            #  (2001:20:1:1::254, ff38::1)
-            p12 = re.compile(r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$')
             m = p12.match(line)
             if m:
                 ipv6_multicast_entries = True
                 continue
 
-            #  (2001:20:1:1::254, ff38::1)
-            p12_1 = re.compile(r'^\s*\((?P<ip_list>.*)\)')
             m = p12_1.match(line)
             if m and ipv6_multicast_entries:
                 ipv6_multicast_entries = m.groupdict()['ip_list']
@@ -2491,9 +2728,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_multicast_entries
                 continue
 
-            #IPv6 MTU: 1600 (using link MTU)
-            p13 = re.compile(r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
-                              ' *\(using *link *MTU\)$')
             m = p13.match(line)
             if m:
                 ipv6_mtu = int(m.groupdict()['ipv6_mtu'])
@@ -2501,9 +2735,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ipv6_interface_dict[interface]['ipv6']['ipv6_mtu'] = ipv6_mtu
                 continue
 
-            #IPv6 unicast reverse path forwarding: none
-            p14 = re.compile(r'^\s*IPv6 *unicast *reverse *path *forwarding:'
-                              ' *(?P<ipv6_unicast_rev_path_forwarding>\w+)$')
             m = p14.match(line)
             if m:
                 ipv6_unicast_rev_path_forwarding = m.groupdict()\
@@ -2514,9 +2745,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_unicast_rev_path_forwarding
                 continue
 
-            #IPv6 load sharing: none
-            p15 = re.compile(r'^\s*IPv6 *load *sharing:'
-                             ' *(?P<ipv6_load_sharing>\w+)$')
             m = p15.match(line)
             if m:
                 ipv6_load_sharing = m.groupdict()['ipv6_load_sharing']
@@ -2525,9 +2753,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_load_sharing
                 continue
 
-            #IPv6 interface statistics last reset: never
-            p16 = re.compile(r'^\s*IPv6 *interface *statistics *last *reset:'
-                              ' *(?P<ipv6_last_reset>[a-z]+)$')
             m = p16.match(line)
             if m:
                 ipv6_last_reset = m.groupdict()['ipv6_last_reset']
@@ -2536,11 +2761,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                  = ipv6_last_reset
                 continue
 
-            #Unicast packets:      0/0/0
-            p18 = re.compile(r'^\s*Unicast *packets:'
-                             ' *(?P<unicast_packets_forwarded>[0-9]+)\/'
-                             '(?P<unicast_packets_originated>[0-9]+)\/'
-                             '(?P<unicast_packets_consumed>[0-9]+)$')
             m = p18.match(line)
             if m:
                 if 'counters' not in ipv6_interface_dict[interface]['ipv6']:
@@ -2555,10 +2775,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ['unicast_packets_consumed'] = int(m.groupdict()['unicast_packets_consumed'])
                 continue
 
-            #Unicast bytes:        0/0/0
-            p19 = re.compile(r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
-                              '\/(?P<unicast_bytes_originated>[0-9]+)\/'
-                              '(?P<unicast_bytes_consumed>[0-9]+)$')
             m = p19.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
@@ -2569,10 +2785,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ['unicast_bytes_consumed'] = int(m.groupdict()['unicast_bytes_consumed'])
                 continue
 
-            #Multicast packets:    0/12/9
-            p20 = re.compile(r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
-                              '\/(?P<multicast_packets_originated>[0-9]+)\/'
-                              '(?P<multicast_packets_consumed>[0-9]+)$')
             m = p20.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
@@ -2583,10 +2795,6 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 ['multicast_packets_consumed'] = int(m.groupdict()['multicast_packets_consumed'])
                 continue
 
-            #Multicast bytes:      0/1144/640
-            p21 = re.compile(r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                              '(?P<multicast_bytes_originated>[0-9]+)\/'
-                              '(?P<multicast_bytes_consumed>[0-9]+)$')
             m = p21.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
@@ -2652,14 +2860,19 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
             out = output
 
         interface_dict = {}
+
+        p1 = re.compile(r'^\s*Interface +IP Address +Interface Status$')
+
+        p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-z\-\/]+)$')
+
+        p3 = re.compile(r'^\s*(?P<ipaddress_extension>\([a-z0-9]+\))$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Interface +IP Address +Interface Status$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-z\-\/]+)$')
             m = p2.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -2684,7 +2897,6 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
                         m.groupdict()['interface_status']
                 continue
 
-            p3 = re.compile(r'^\s*(?P<ipaddress_extension>\([a-z0-9]+\))$')
             m = p3.match(line)
             if m:
                 ipaddress_extension = m.groupdict()['ipaddress_extension']
@@ -3008,12 +3220,63 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
         # Init vars
         ret_dict = {}
 
+        # interface nve1
+        # interface Ethernet1/1
+        p1 = re.compile(r'^interface +(?P<intf_name>\S+)$')
+
+        # no shutdown
+        p2 = re.compile(r'^\s*no shutdown$')
+
+        # host-reachability protocol bgp
+        p3 = re.compile(r'^\s*host-reachability protocol +(?P<protocol>[a-zA-Z]+)$')
+
+        # source-interface loopback1
+        p4 = re.compile(r'^\s*source-interface +(?P<src_intf>[a-zA-Z0-9\-]+)$')
+
+        # member vni 8100
+        # member vni 9100 associate-vrf
+        # member vni 2001201-2001300
+        p5 = re.compile(r'^\s*member vni +(?P<vni>[0-9\-]+)( +(?P<associate_vrf>[a-zA-Z\-]+))?$')
+
+        # mcast-group 225.0.1.25
+        p6 = re.compile(r'^\s*mcast-group +(?P<ip>[0-9\.]+)$')
+
+        # suppress-arp
+        p7 = re.compile(r'^\s*suppress-arp$')
+
+        # switchport
+        p8 = re.compile(r'^switchport$')
+
+        # switchport mode trunk
+        p9 = re.compile(r'^switchport +mode +(?P<mode>\S+)$')
+
+        # switchport trunk allowed vlan 1-99,101-199,201-1399,1401-4094
+        p10 = re.compile(r'^switchport +trunk +allowed +vlan +(?P<trunk_vlans>\S+)$')
+
+        # switchport trunk native vlan x
+        p10_1 = re.compile(r'^switchport +trunk +native +vlan +(?P<trunk_native_vlan>\S+)$')
+
+        # switchport access vlan x
+        p10_2 = re.compile(r'^switchport +access +vlan +(?P<access_vlan>\S+)$')
+
+        # channel-group 1 mode active
+        p11 = re.compile(r'^channel-group +(?P<port_channel_int>\d+) +mode +(?P<mode>\S+)$')
+
+        # speed 1000
+        p12 = re.compile(r'^speed +(?P<speed>\d+)$')
+
+        # duplex full
+        p13 = re.compile(r'^duplex +(?P<duplex>\S+)$')
+
+        # description DeviceA-description
+        p14 = re.compile(r'^description +(?P<description>.+)$')
+
+        # vpc
+        p15 = re.compile(r'^vpc +(?P<vpc>\S+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # interface nve1
-            # interface Ethernet1/1
-            p1 = re.compile(r'^interface +(?P<intf_name>\S+)$')
             m = p1.match(line)
             if m:
 
@@ -3024,8 +3287,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # no shutdown
-            p2 = re.compile(r'^\s*no shutdown$')
             m = p2.match(line)
             if m:
 
@@ -3033,8 +3294,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # host-reachability protocol bgp
-            p3 = re.compile(r'^\s*host-reachability protocol +(?P<protocol>[a-zA-Z]+)$')
             m = p3.match(line)
             if m:
 
@@ -3043,8 +3302,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # source-interface loopback1
-            p4 = re.compile(r'^\s*source-interface +(?P<src_intf>[a-zA-Z0-9\-]+)$')
             m = p4.match(line)
             if m:
 
@@ -3053,10 +3310,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # member vni 8100
-            # member vni 9100 associate-vrf
-            # member vni 2001201-2001300
-            p5 = re.compile(r'^\s*member vni +(?P<vni>[0-9\-]+)( +(?P<associate_vrf>[a-zA-Z\-]+))?$')
             m = p5.match(line)
             if m:
 
@@ -3080,8 +3333,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # mcast-group 225.0.1.25
-            p6 = re.compile(r'^\s*mcast-group +(?P<ip>[0-9\.]+)$')
             m = p6.match(line)
             if m:
 
@@ -3091,8 +3342,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
 
-            # suppress-arp
-            p7 = re.compile(r'^\s*suppress-arp$')
             m = p7.match(line)
             if m:
 
@@ -3102,39 +3351,29 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 
                 continue
             
-            # switchport
-            p8 = re.compile(r'^switchport$')
             m = p8.match(line)
             if m:
                 interface_dict.update({'switchport': True})
                 continue
             
-            # switchport mode trunk
-            p9 = re.compile(r'^switchport +mode +(?P<mode>\S+)$')
             m = p9.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict.update({'switchport_mode': group['mode']})
                 continue
             
-            # switchport trunk allowed vlan 1-99,101-199,201-1399,1401-4094
-            p10 = re.compile(r'^switchport +trunk +allowed +vlan +(?P<trunk_vlans>\S+)$')
             m = p10.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict.update({'trunk_vlans': group['trunk_vlans']})
                 continue
             
-            # switchport trunk native vlan x
-            p10_1 = re.compile(r'^switchport +trunk +native +vlan +(?P<trunk_native_vlan>\S+)$')
             m = p10_1.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict.update({'trunk_native_vlan': group['trunk_native_vlan']})
                 continue
 
-            # switchport access vlan x
-            p10_2 = re.compile(r'^switchport +access +vlan +(?P<access_vlan>\S+)$')
             m = p10_2.match(line)
             if m:
                 group = m.groupdict()
@@ -3142,8 +3381,6 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
                 interface_dict.update({'access_vlan': group['access_vlan']})
                 continue
 
-            # channel-group 1 mode active
-            p11 = re.compile(r'^channel-group +(?P<port_channel_int>\d+) +mode +(?P<mode>\S+)$')
             m = p11.match(line)
             if m:
                 group = m.groupdict()
@@ -3152,29 +3389,21 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
                 port_channel_dict.update({'port_channel_mode': group['mode']})
                 continue
 
-            # speed 1000
-            p12 = re.compile(r'^speed +(?P<speed>\d+)$')
             m = p12.match(line)
             if m:
                 interface_dict.update({'speed': int(m.groupdict()['speed'])})
                 continue
 
-            # duplex full
-            p13 = re.compile(r'^duplex +(?P<duplex>\S+)$')
             m = p13.match(line)
             if m:
                 interface_dict.update({'duplex': m.groupdict()['duplex']})
                 continue
 
-            # description DeviceA-description
-            p14 = re.compile(r'^description +(?P<description>.+)$')
             m = p14.match(line)
             if m:
                 interface_dict.update({'description': m.groupdict()['description']})
                 continue
 
-            # vpc
-            p15 = re.compile(r'^vpc +(?P<vpc>\S+)$')
             m = p15.match(line)
             if m:
                 group = m.groupdict()
@@ -3504,20 +3733,31 @@ class ShowInterfaceStatus(ShowInterfaceStatusSchema):
                         r'(?P<type>([\S\s]+))$')
 
 
-        for line in out.splitlines():
-            line = line.strip()
-
-            m = p1.match(line) or p1_1.match(line)
-            if m and m.groupdict()['name'] != 'Name':
+        # Port          Name               Status    Vlan      Duplex  Speed   Type
+        table = FixedWidthTable([Column('interface', 'Port'),
+                                 Column('name', 'Name', optional=True),
+                                 Column('status', 'Status'),
+                                 Column('vlan', 'Vlan'),
+                                 Column('duplex_code', 'Duplex'),
+                                 Column('port_speed', 'Speed'),
+                                 Column('type', 'Type', optional=True)])
+
+        for line, group in table.scan(out.splitlines()):
+            if group is None:
+                # Not aligned under the header
+                line = line.strip()
+                m = p1.match(line) or p1_1.match(line)
+                if not m or m.groupdict()['name'] == 'Name':
+                    continue
                 group = m.groupdict()
-                interface = Common.convert_intf_name(group['interface'])
-                intf_dict = result_dict.setdefault('interfaces', {}).setdefault(interface, {})
 
-                keys = ['name','status', 'vlan', 'duplex_code', 'port_speed', 'type']
+            interface = Common.convert_intf_name(group['interface'])
+            intf_dict = result_dict.setdefault('interfaces', {}).setdefault(interface, {})
 
-                for k in keys:
-                    if group[k] and group[k] != '--':
-                        intf_dict[k] = group[k]
-                continue
+            keys = ['name','status', 'vlan', 'duplex_code', 'port_speed', 'type']
+
+            for k in keys:
+                if group[k] and group[k] != '--':
+                    intf_dict[k] = group[k]
 
         return result_dict
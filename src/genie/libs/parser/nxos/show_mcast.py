@@ -17,6 +17,10 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
 
+# Parser
+from genie.libs.parser.utils.subcommand import subcommand_cache, \
+                                               subcommand_parse
+
 # ===================================
 # Parser for 'show ip mroute vrf all'
 # ===================================
@@ -80,13 +84,40 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
 
         mroute_dict = {}
 
+        # IP Multicast Routing Table for VRF "default" 
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                         ' +[rR]outing +[tT]able +for +VRF '
+                        '+(?P<vrf>[a-zA-Z0-9\"]+)$')
+
+        # (*, 232.0.0.0/8), uptime: 9w2d, pim ip 
+        # (*, 228.0.0.0/8), bidir, uptime: 10w5d, pim ip 
+        # (*, ff03:0:0:1::1/128), uptime: 3d23h, pim6 ipv6 
+        p2 = re.compile(r'^\s*\((?P<source_address>[0-9\.\*\/]+),'
+                        r' +(?P<multicast_group>[a-zA-Z0-9\.\/\:]+)\),'
+                        r' *(?P<bidir>(\S+))? *uptime:'
+                        r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
+                        r' *(?P<flag>[0-9a-zA-Z\(\)\s]+))?$')
+
+        # Incoming interface: Null, RPF nbr: 0.0.0.0 
+        # Incoming interface: Ethernet1/9, RPF nbr: 10.234.1.2, internal.
+        p3 = re.compile(r'^\s*Incoming +interface:'
+                         ' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
+                         ' +RPF +nbr: +(?P<rpf_nbr>[0-9\.]+)(, *(?P<internal>internal)\.?)?$')
+
+        # Outgoing interface list: (count: 0) 
+        p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
+                          ' +(?P<oil_count>[0-9]+)\)$')
+
+        # loopback2, uptime: 3d11h, igmp 
+        # port-channel80, uptime: 3d23h, pim6
+        # Vlan200, uptime: 03:01:01, mrib, (bridge-only)
+        p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),)?'
+                        r' +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                        r' +(?:(?P<oil_flags>[a-zA-Z0-9\,\.\(\)\s]+))?(, *\((?P<flag>[\S\s]+)\))?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # IP Multicast Routing Table for VRF "default" 
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                             ' +[rR]outing +[tT]able +for +VRF '
-                            '+(?P<vrf>[a-zA-Z0-9\"]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -104,14 +135,6 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
                     mroute_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
 
-            # (*, 232.0.0.0/8), uptime: 9w2d, pim ip 
-            # (*, 228.0.0.0/8), bidir, uptime: 10w5d, pim ip 
-            # (*, ff03:0:0:1::1/128), uptime: 3d23h, pim6 ipv6 
-            p2 = re.compile(r'^\s*\((?P<source_address>[0-9\.\*\/]+),'
-                            r' +(?P<multicast_group>[a-zA-Z0-9\.\/\:]+)\),'
-                            r' *(?P<bidir>(\S+))? *uptime:'
-                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
-                            r' *(?P<flag>[0-9a-zA-Z\(\)\s]+))?$')
             m = p2.match(line)
             if m:
                 source_address = m.groupdict()['source_address']
@@ -145,11 +168,6 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
 
                 continue
 
-            # Incoming interface: Null, RPF nbr: 0.0.0.0 
-            # Incoming interface: Ethernet1/9, RPF nbr: 10.234.1.2, internal.
-            p3 = re.compile(r'^\s*Incoming +interface:'
-                             ' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
-                             ' +RPF +nbr: +(?P<rpf_nbr>[0-9\.]+)(, *(?P<internal>internal)\.?)?$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
@@ -171,9 +189,6 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
                     [source_address]['incoming_interface_list'][incoming_interface]['internal'] = True
                 continue
 
-            # Outgoing interface list: (count: 0) 
-            p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
-                              ' +(?P<oil_count>[0-9]+)\)$')
             m = p4.match(line)
             if m:
                 oil_count = int(m.groupdict()['oil_count'])
@@ -181,12 +196,6 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
                 ['source_address'][source_address]['oil_count'] = oil_count
                 continue
 
-            # loopback2, uptime: 3d11h, igmp 
-            # port-channel80, uptime: 3d23h, pim6
-            # Vlan200, uptime: 03:01:01, mrib, (bridge-only)
-            p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),)?'
-                            r' +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<oil_flags>[a-zA-Z0-9\,\.\(\)\s]+))?(, *\((?P<flag>[\S\s]+)\))?$')
             m = p5.match(line)
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -277,13 +286,41 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
 
         ipv6_mroute_vrf_all_dict = {}
 
+        # IPv6 Multicast Routing Table for VRF "default
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                        r' +[rR]outing +[tT]able +for +VRF'
+                        r' +(?P<vrf>[a-zA-Z0-9\"]+)$')
+
+        # (*, ff30::/12), uptime: 3d11h, pim6 ipv6
+        # (*, ff03:3::/64), bidir, uptime: 10w5d, pim6 
+        p2 = re.compile(r'^\s*\((?P<source_address>(\S+)),'
+                        r' +(?P<multicast_group>(\S+))\),'
+                        r' *(?P<bidir>(\S+),)? *uptime:'
+                        r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
+                        r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
+
+        # Incoming interface: Null, RPF nbr: 0::
+        p3 =  re.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
+                         r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\,\s]+)$')
+
+        # Outgoing interface list: (count: 0)
+        p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
+                          ' +(?P<oil_count>[0-9]+)\)$')
+
+        # loopback2, uptime: 3d11h, igmp
+        # port-channel80, uptime: 3d23h, pim6
+        p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
+                        r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                        r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
+
+        p5_1 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
+                          r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                          r' +(?:(?P<oif_rpf>[a-zA-Z0-9\s]+),)?'
+                          r' +(?P<oil_flags>(\(RPF\))+)*$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # IPv6 Multicast Routing Table for VRF "default
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                            r' +[rR]outing +[tT]able +for +VRF'
-                            r' +(?P<vrf>[a-zA-Z0-9\"]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -299,13 +336,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                     ipv6_mroute_vrf_all_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
 
-            # (*, ff30::/12), uptime: 3d11h, pim6 ipv6
-            # (*, ff03:3::/64), bidir, uptime: 10w5d, pim6 
-            p2 = re.compile(r'^\s*\((?P<source_address>(\S+)),'
-                            r' +(?P<multicast_group>(\S+))\),'
-                            r' *(?P<bidir>(\S+),)? *uptime:'
-                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
-                            r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
             m = p2.match(line)
             if m:
                 source_address = m.groupdict()['source_address']
@@ -339,9 +369,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                     [multicast_group]['source_address'][source_address]['bidir'] = True
                 continue
 
-            # Incoming interface: Null, RPF nbr: 0::
-            p3 =  re.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
-                             r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\,\s]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
@@ -362,9 +389,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 ['incoming_interface_list'][incoming_interface]['rpf_nbr'] = rpf_nbr
                 continue
 
-            # Outgoing interface list: (count: 0)
-            p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
-                              ' +(?P<oil_count>[0-9]+)\)$')
             m = p4.match(line)
             if m:
                 oil_count = str(m.groupdict()['oil_count'])
@@ -372,11 +396,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 ['source_address'][source_address]['oil_count'] = oil_count
                 continue
 
-            # loopback2, uptime: 3d11h, igmp
-            # port-channel80, uptime: 3d23h, pim6
-            p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
-                            r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
             m = p5.match(line)
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -401,10 +420,6 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
                 [outgoing_interface]['oil_flags'] = oil_flags
                 continue
 
-            p5_1 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
-                              r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                              r' +(?:(?P<oif_rpf>[a-zA-Z0-9\s]+),)?'
-                              r' +(?P<oil_flags>(\(RPF\))+)*$')
             m = p5_1.match(line)
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -478,11 +493,28 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
 
         static_routemulticast_dict = {}
 
+        #Mstatic-route for VRF "default"(1) 
+        p1 = re.compile(r'^\s*(Static-route|Mstatic-route) +for +VRF'
+                         ' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
+
+        #IPv4 MStatic Routes:
+        p2 = re.compile(r'^\s*(?P<address_family>[a-zA-Z0-9]+)'
+                         ' +(MStatic|Unicast Static) +Routes:$')
+
+        #10.49.0.0/8, configured nh: 0.0.0.0/32 Null0 
+        p3 =  re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
+                          ' +(?P<neighbor_address>[a-zA-Z0-9\.\/]+)'
+                          ' +(?P<interface_name>[a-zA-Z0-9\.]+)$')
+
+        # 10.2.2.2/32, configured nh: 0.0.0.0/32%sanity1 Vlan2
+        p3_1 = re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
+                           ' +(?P<neighbor_address>[a-zA-Z0-9\.\/\%\s]+)$')
+
+        # (installed in urib) 
+        p4 = re.compile(r'^\s*(?P<urib>(\(installed in urib\))+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            #Mstatic-route for VRF "default"(1) 
-            p1 = re.compile(r'^\s*(Static-route|Mstatic-route) +for +VRF'
-                             ' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
                               
             m = p1.match(line)
             if m:
@@ -499,9 +531,6 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                     static_routemulticast_dict['vrf'][vrf] = {}
                 continue
 
-            #IPv4 MStatic Routes:
-            p2 = re.compile(r'^\s*(?P<address_family>[a-zA-Z0-9]+)'
-                             ' +(MStatic|Unicast Static) +Routes:$')
             m = p2.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -512,10 +541,6 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                     static_routemulticast_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
 
-            #10.49.0.0/8, configured nh: 0.0.0.0/32 Null0 
-            p3 =  re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
-                              ' +(?P<neighbor_address>[a-zA-Z0-9\.\/]+)'
-                              ' +(?P<interface_name>[a-zA-Z0-9\.]+)$')
             m = p3.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -552,9 +577,6 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 ['mroute'][mroute]['path'][path]['vrf_id'] = vrf_id
                 continue
 
-            # 10.2.2.2/32, configured nh: 0.0.0.0/32%sanity1 Vlan2
-            p3_1 = re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
-                               ' +(?P<neighbor_address>[a-zA-Z0-9\.\/\%\s]+)$')
             m = p3_1.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -584,8 +606,6 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 [address_family]['mroute'][mroute]['path'][path]['vrf_id'] = vrf_id
                 continue
 
-            # (installed in urib) 
-            p4 = re.compile(r'^\s*(?P<urib>(\(installed in urib\))+)$')
             m = p4.match(line)
             if m:
                 urib = bool(m.groupdict()['urib'])
@@ -644,12 +664,35 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
 
         ipv6_multicast_dict = {}
 
+        # IPv6 Configured Static Routes for VRF "default"(1) 
+        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) +Configured +Static +Routes +for +VRF'
+                         ' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
+
+        # 2001:db8:51a5::/16 -> Null0, preference: 1
+        p2 = re.compile(r'^\s*(?P<mroute>[a-zA-Z0-9\:\/]+) +->'
+                         ' +(?P<mroute_int>[\w\W]+), preference:'
+                         ' +(?P<preference>[0-9]+)$')
+
+        # nh_vrf(default) reslv_tid 80000001 
+        p3 = re.compile(r'^\s*nh_vrf *(?P<nh_vrf>[a-zA-Z0-9\(\)]+)'
+                         ' +reslv_tid +(?P<reslv_tid>[0-9]+)$')
+
+        # real-next-hop: 0::, interface: Null0 
+        p4 =  re.compile(r'^\s*real-next-hop: +(?P<neighbor_address>[a-zA-Z0-9\:]+),'
+                          ' +interface: +(?P<interface_name>[\w\W]+)$')
+
+        # rnh(not installed in u6rib) 
+        p5 = re.compile(r'^\s*rnh(?P<rnh_status>[a-zA-Z0-9\(\)\s]+)$')
+
+        # bfd_enabled no
+        p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(no)+)$')
+
+        # bfd_enabled yes
+        p6_1 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(yes)+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # IPv6 Configured Static Routes for VRF "default"(1) 
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) +Configured +Static +Routes +for +VRF'
-                             ' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -669,10 +712,6 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                     ipv6_multicast_dict['vrf'][vrf]['address_family'][address_family] = {}
                 continue
 
-            # 2001:db8:51a5::/16 -> Null0, preference: 1
-            p2 = re.compile(r'^\s*(?P<mroute>[a-zA-Z0-9\:\/]+) +->'
-                             ' +(?P<mroute_int>[\w\W]+), preference:'
-                             ' +(?P<preference>[0-9]+)$')
             m = p2.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -685,9 +724,6 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                     ipv6_multicast_dict['vrf'][vrf]['address_family'][address_family]['mroute'][mroute] = {}                
                 continue
 
-            # nh_vrf(default) reslv_tid 80000001 
-            p3 = re.compile(r'^\s*nh_vrf *(?P<nh_vrf>[a-zA-Z0-9\(\)]+)'
-                             ' +reslv_tid +(?P<reslv_tid>[0-9]+)$')
             m = p3.match(line)
             if m:
                 nh_vrf = m.groupdict()['nh_vrf']
@@ -696,9 +732,6 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 reslv_tid = m.groupdict()['reslv_tid']
                 continue
 
-            # real-next-hop: 0::, interface: Null0 
-            p4 =  re.compile(r'^\s*real-next-hop: +(?P<neighbor_address>[a-zA-Z0-9\:]+),'
-                              ' +interface: +(?P<interface_name>[\w\W]+)$')
             m = p4.match(line)
             if m:
                 neighbor_address = m.groupdict()['neighbor_address']
@@ -728,8 +761,6 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 ['path'][path]['reslv_tid'] = reslv_tid
                 continue
 
-            # rnh(not installed in u6rib) 
-            p5 = re.compile(r'^\s*rnh(?P<rnh_status>[a-zA-Z0-9\(\)\s]+)$')
             m = p5.match(line)
             if m:
                 rnh_status = str(m.groupdict()['rnh_status'])
@@ -740,8 +771,6 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 ['path'][path]['rnh_status'] = rnh_status
                 continue
 
-            # bfd_enabled no
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(no)+)$')
             m = p6.match(line)
             if m:
                 bfd_enable = m.groupdict()['bfd_enable']
@@ -754,9 +783,7 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 ['path'][path]['mroute_int'] = mroute_int
                 continue
 
-            # bfd_enabled yes
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(yes)+)$')
-            m = p6.match(line)
+            m = p6_1.match(line)
             if m:
                 bfd_enable = m.groupdict()['bfd_enable']
 
@@ -838,22 +865,35 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
         'num_of_oifs',
         'oifs']
 
+    def command_plan(self, outputs, vrf="", output=None):
+        """Return the commands of the parse, given the outputs collected"""
+        commands = [] if output is not None else [self._command(vrf)]
+        if vrf == 'all':
+            # independent of the route command, sent along with it
+            commands.append(ShowVrf.cli_command[0])
+        return commands
+
+    def _command(self, vrf=""):
+        if vrf:
+            return self.cli_command[0].format(vrf=vrf)
+        return self.cli_command[1]
+
+    @subcommand_cache
     def cli(self, vrf="", output=None):
         # finding vrf names
         vrf_dict = {}
 
         if vrf:
             if vrf == 'all':
-                showparser = ShowVrf(device=self.device)
-                vrfs_list = showparser.parse()
+                vrfs_list = subcommand_parse(ShowVrf, self.device)
                 for vrf_name in vrfs_list['vrfs'].keys():
                     vrf_id = vrfs_list['vrfs'][vrf_name]['vrf_id']
                     vrf_dict.update({vrf_id: vrf_name})
 
-            cmd = self.cli_command[0].format(vrf=vrf)
+            cmd = self._command(vrf)
         else:
             vrf = 'default'
-            cmd = self.cli_command[1]
+            cmd = self._command()
 
         if output is None:
             out = self.device.execute(cmd)
@@ -2,6 +2,8 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, \
+                                                    Key, integer, boolean
 
 
 # ====================================================
@@ -144,12 +146,160 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
             = jp_interval = passive = auto_enabled = genid = jp_outbound_policy = jp_inbound_policy = \
             nbr_count = neighbor_holdtime = neighbor_filter = vpc_svi =last_rest = ""
 
+        # PIM6 Interface Status for VRF "VRF1"
+        # PIM Interface Status for VRF "VRF1"
+        p1 = re.compile(r'^\s*PIM6? +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
+
+        # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
+        p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),'
+                        ' +Interface +status: +protocol\-(?P<oper_status>[\w]+)/'
+                        'link\-(?P<link_status>[\w]+)/'
+                        'admin\-(?P<admin_status>[\w]+)$')
+
+        # IPv6 address:
+        #   10.11.33.11, IP subnet: 10.11.33.0/24
+        p3 = re.compile(r'^\s*(?P<space>\s{4})'
+                        '(?P<address>[^Error:][\w\/\:]+)( +\[VALID\])?$')
+
+        # PIM6 DR: fe80::5054:ff:fe89:740c, DR's priority: 1
+        # PIM DR: fe80::5054:ff:fe89:740c, DR's priority: 1
+        p4 = re.compile(r'^\s*PIM6? +DR: +(?P<dr_address>[\w\:]+),'
+                        ' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
+
+        # PIM6 neighbor count: 1
+        # PIM neighbor count: 1
+        p5 = re.compile(r'^\s*PIM6? +neighbor +count: +(?P<nbr_count>[\d]+)$')
+
+        # PIM6 hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
+        # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
+        p6 = re.compile(r'^\s*PIM6? +hello +interval: +(?P<hello_interval>[\d]+) +secs'
+                        '( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
+                        ' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
+
+        # PIM6 neighbor holdtime: 159 secs
+        p7 = re.compile(r'^\s*PIM6? +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
+
+        # PIM6 configured DR priority: 144
+        # PIM configured DR priority: 144
+        p8 = re.compile(r'^\s*PIM6? +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
+
+        # PIM6 configured DR delay: 3 secs
+        # PIM configured DR delay: 3 secs
+        p9 = re.compile(r'^\s*PIM6? +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
+
+        # PIM6 border interface: yes
+        # PIM border interface: yes
+        p10 = re.compile(r'^\s*PIM6? +border +interface: +(?P<border_interface>[\w]+)$')
+
+        # PIM6 GenID sent in Hellos: 0x26fae674
+        # PIM GenID sent in Hellos: 0x26fae674
+        p11 = re.compile(r'^\s*PIM6? +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
+
+        # PIM6 Hello MD5-AH Authentication: disabled
+        # PIM Hello MD5-AH Authentication: disabled
+        p12 = re.compile(r'^\s*PIM6? +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
+
+        # PIM6 Neighbor policy: v4neighbor-policy
+        # PIM Neighbor policy: v4neighbor-policy
+        p13 = re.compile(r'^\s*PIM6? +Neighbor +policy: +(?P<nbr_policy>(?!none +configured)[\w\-\s]+)$')
+
+        # PIM6 Join-Prune inbound policy: v4jp-policy
+        # PIM Join-Prune inbound policy: v4jp-policy
+        p14 = re.compile(r'^\s*PIM6? +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
+
+        # PIM6 Join-Prune outbound policy: v4jp-policy
+        # PIM Join-Prune outbound policy: v4jp-policy
+        p15 = re.compile(r'^\s*PIM6? +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
+
+        # PIM6 Join-Prune interval: 1 minutes
+        # PIM Join-Prune interval: 1 minutes
+        p16 = re.compile(r'^\s*PIM6? +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
+
+        # PIM6 Join-Prune next sending: 1 minutes
+        # PIM Join-Prune next sending: 1 minutes
+        p17 = re.compile(r'^\s*PIM6? +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
+
+        # PIM6 BFD enabled: no
+        # PIM BFD enabled: no
+        p18 = re.compile(r'^\s*PIM6? +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
+
+        # PIM6 passive interface: no
+        # PIM passive interface: no
+        p19 = re.compile(r'^\s*PIM6? +passive +interface: +(?P<passive>[\w]+)$')
+
+        # PIM6 VPC SVI: no
+        # PIM VPC SVI: no
+        p20 = re.compile(r'^\s*PIM6? +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
+
+        # PIM6 Auto Enabled: no
+        # PIM Auto Enabled: no
+        p21 = re.compile(r'^\s*PIM6? +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
+
+        # PIM6 Interface Statistics, last reset: never
+        # PIM Interface Statistics, last reset: never
+        # PIM6 Interface Statistics
+        # PIM Interface Statistics
+        p22 = re.compile(r'^\s*PIM6? +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
+
+        # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
+        p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
+                         '( +\(early: +(?P<early>\d+)\))?,'
+                         ' +JPs: +(?P<jps>[\d\/]+),'
+                         ' +Asserts: +(?P<asserts>[\d\/]+)$')
+
+        # Grafts: 0/0, Graft-Acks: 0/0
+        p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
+                         ' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
+
+        # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
+        p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
+                         ' +DF-Winners: +(?P<df_winners>[\d\/]+),'
+                         ' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
+                         ' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
+
+        #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
+        p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
+                         ' +Invalid +packet +types\/DF +subtypes:'
+                         ' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
+
+        #    Authentication failed: 0
+        p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
+
+        #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
+        p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
+                         ' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
+                         ' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
+
+        #    Packets from non-neighbors: 0
+        p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
+
+        #    Packets received on passiveinterface: 0
+        p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
+                         ' +(?P<packets_received_on_passiveinterface>[\d]+)$')
+
+        #    JPs received on RPF-interface: 0
+        p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
+                         ' +(?P<jp_received_on_rpf_interface>[\d]+)$')
+
+        #    (*,G) Joins received with no/wrong RP: 0/0
+        p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
+                         ' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
+
+        #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
+        p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
+                         ' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
+
+        # JPs filtered by inbound policy: 0
+        p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
+                         ' +(?P<jps_filtered_by_inbound_policy>\d+)$')
+
+        # JPs filtered by outbound policy: 0
+        p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
+                         ' +(?P<jps_filtered_by_outbound_policy>\d+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # PIM6 Interface Status for VRF "VRF1"
-            # PIM Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM6? +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -167,11 +317,6 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 = jp_interval = passive = auto_enabled = genid = jp_outbound_policy = jp_inbound_policy = \
                 nbr_count = configured_dr_priority = neighbor_holdtime = neighbor_filter = vpc_svi =last_rest = ""
 
-            # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),'
-                            ' +Interface +status: +protocol\-(?P<oper_status>[\w]+)/'
-                            'link\-(?P<link_status>[\w]+)/'
-                            'admin\-(?P<admin_status>[\w]+)$')
             m = p2.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -180,180 +325,101 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 admin_status = m.groupdict()['admin_status']
                 address_list = []
 
-            # IPv6 address:
-            #   10.11.33.11, IP subnet: 10.11.33.0/24
-            p3 = re.compile(r'^\s*(?P<space>\s{4})'
-                            '(?P<address>[^Error:][\w\/\:]+)( +\[VALID\])?$')
             m = p3.match(line)
             if m:
                 address_list.append(m.groupdict()['address'])
 
-            # PIM6 DR: fe80::5054:ff:fe89:740c, DR's priority: 1
-            # PIM DR: fe80::5054:ff:fe89:740c, DR's priority: 1
-            p4 = re.compile(r'^\s*PIM6? +DR: +(?P<dr_address>[\w\:]+),'
-                            ' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
             m = p4.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
                 dr_priority = m.groupdict()['dr_priority']
 
-            # PIM6 neighbor count: 1
-            # PIM neighbor count: 1
-            p5 = re.compile(r'^\s*PIM6? +neighbor +count: +(?P<nbr_count>[\d]+)$')
-
             m = p5.match(line)
             if m:
                 nbr_count = m.groupdict()['nbr_count']
 
-            # PIM6 hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
-            # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
-            p6 = re.compile(r'^\s*PIM6? +hello +interval: +(?P<hello_interval>[\d]+) +secs'
-                            '( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
-                            ' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
             m = p6.match(line)
             if m:
                 hello_interval = m.groupdict()['hello_interval']
                 hello_expiration = m.groupdict()['hello_expiration']
 
-            # PIM6 neighbor holdtime: 159 secs
-            p7 = re.compile(r'^\s*PIM6? +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
             m = p7.match(line)
             if m:
                 neighbor_holdtime = m.groupdict()['holdtime']
 
-            # PIM6 configured DR priority: 144
-            # PIM configured DR priority: 144
-            p8 = re.compile(r'^\s*PIM6? +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
             m = p8.match(line)
             if m:
                 configured_dr_priority = m.groupdict()['configured_dr_priority']
 
-            # PIM6 configured DR delay: 3 secs
-            # PIM configured DR delay: 3 secs
-            p9 = re.compile(r'^\s*PIM6? +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
             m = p9.match(line)
             if m:
                 configured_dr_delay = m.groupdict()['configured_dr_delay']
 
-            # PIM6 border interface: yes
-            # PIM border interface: yes
-            p10 = re.compile(r'^\s*PIM6? +border +interface: +(?P<border_interface>[\w]+)$')
             m = p10.match(line)
             if m:
                 bsr_border = m.groupdict()['border_interface']
 
-            # PIM6 GenID sent in Hellos: 0x26fae674
-            # PIM GenID sent in Hellos: 0x26fae674
-            p11 = re.compile(r'^\s*PIM6? +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
             m = p11.match(line)
             if m:
                 genid = m.groupdict()['genid']
 
-            # PIM6 Hello MD5-AH Authentication: disabled
-            # PIM Hello MD5-AH Authentication: disabled
-            p12 = re.compile(r'^\s*PIM6? +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
             m = p12.match(line)
             if m:
                 hello_md5_ah_authentication = m.groupdict()['md5_authentication']
 
-            # PIM6 Neighbor policy: v4neighbor-policy
-            # PIM Neighbor policy: v4neighbor-policy
-            p13 = re.compile(r'^\s*PIM6? +Neighbor +policy: +(?P<nbr_policy>(?!none +configured)[\w\-\s]+)$')
             m = p13.match(line)
             if m:
                 neighbor_filter = m.groupdict()['nbr_policy']
 
-            # PIM6 Join-Prune inbound policy: v4jp-policy
-            # PIM Join-Prune inbound policy: v4jp-policy
-            p14 = re.compile(r'^\s*PIM6? +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
             m = p14.match(line)
             if m:
                 jp_inbound_policy = m.groupdict()['jp_inbound_policy']
 
-            # PIM6 Join-Prune outbound policy: v4jp-policy
-            # PIM Join-Prune outbound policy: v4jp-policy
-            p15 = re.compile(r'^\s*PIM6? +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
             m = p15.match(line)
             if m:
                 jp_outbound_policy = m.groupdict()['jp_outbound_policy']
 
-            # PIM6 Join-Prune interval: 1 minutes
-            # PIM Join-Prune interval: 1 minutes
-            p16 = re.compile(r'^\s*PIM6? +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
             m = p16.match(line)
             if m:
                 jp_interval = m.groupdict()['jp_interval']
 
-            # PIM6 Join-Prune next sending: 1 minutes
-            # PIM Join-Prune next sending: 1 minutes
-            p17 = re.compile(r'^\s*PIM6? +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
             m = p17.match(line)
             if m:
                 jp_next_sending = m.groupdict()['jp_next_sending']
 
-            # PIM6 BFD enabled: no
-            # PIM BFD enabled: no
-            p18 = re.compile(r'^\s*PIM6? +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
             m = p18.match(line)
             if m:
                 bfd = m.groupdict()['bfd_enabled']
 
-            # PIM6 passive interface: no
-            # PIM passive interface: no
-            p19 = re.compile(r'^\s*PIM6? +passive +interface: +(?P<passive>[\w]+)$')
             m = p19.match(line)
             if m:
                 passive = m.groupdict()['passive']
 
-            # PIM6 VPC SVI: no
-            # PIM VPC SVI: no
-            p20 = re.compile(r'^\s*PIM6? +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
             m = p20.match(line)
             if m:
                 vpc_svi = m.groupdict()['vpc_svi']
 
-            # PIM6 Auto Enabled: no
-            # PIM Auto Enabled: no
-            p21 = re.compile(r'^\s*PIM6? +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
             m = p21.match(line)
             if m:
                 auto_enabled = m.groupdict()['auto_enabled']
 
-            # PIM6 Interface Statistics, last reset: never
-            # PIM Interface Statistics, last reset: never
-            # PIM6 Interface Statistics
-            # PIM Interface Statistics
-            p22 = re.compile(r'^\s*PIM6? +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
             m = p22.match(line)
             if m:
                 statistic = True
                 if m.groupdict()['last_reset']:
                     last_rest = m.groupdict()['last_reset']
 
-            # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
-            p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
-                             '( +\(early: +(?P<early>\d+)\))?,'
-                             ' +JPs: +(?P<jps>[\d\/]+),'
-                             ' +Asserts: +(?P<asserts>[\d\/]+)$')
             m = p23.match(line)
             if m:
                 hellos = m.groupdict()['hellos']
                 jps = m.groupdict()['jps']
                 asserts = m.groupdict()['asserts']
 
-            # Grafts: 0/0, Graft-Acks: 0/0
-            p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
-                             ' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
             m = p24.match(line)
             if m:
                 grafts = m.groupdict()['grafts']
                 graft_acks = m.groupdict()['graft_acks']
 
-            # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
-            p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
-                             ' +DF-Winners: +(?P<df_winners>[\d\/]+),'
-                             ' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
-                             ' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
             m = p25.match(line)
             if m:
                 df_offers = m.groupdict()['df_offers']
@@ -361,78 +427,48 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 df_backoffs = m.groupdict()['df_backoffs']
                 df_passes = m.groupdict()['df_passes']
 
-            #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
-            p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
-                             ' +Invalid +packet +types\/DF +subtypes:'
-                             ' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
             m = p26.match(line)
             if m:
                 checksum = m.groupdict()['checksum']
                 invalid_packet_types = m.groupdict()['invalid_packet_types']
                 invalid_df_subtypes = m.groupdict()['invalid_df_subtypes']
 
-            #    Authentication failed: 0
-            p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
             m = p27.match(line)
             if m:
                 authentication_failed = m.groupdict()['authentication_failed']
 
-            #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
-            p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
-                             ' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
-                             ' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
             m = p28.match(line)
             if m:
                 packet_length_errors = m.groupdict()['packet_length_errors']
                 bad_version_packets = m.groupdict()['bad_version_packets']
                 packets_from_self = m.groupdict()['packets_from_self']
 
-            #    Packets from non-neighbors: 0
-            p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
             m = p29.match(line)
             if m:
                 packets_from_non_neighbors = m.groupdict()['packets_from_non_neighbors']
 
-            #    Packets received on passiveinterface: 0
-            p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
-                             ' +(?P<packets_received_on_passiveinterface>[\d]+)$')
             m = p30.match(line)
             if m:
                 packets_received_on_passiveinterface = m.groupdict()['packets_received_on_passiveinterface']
 
-            #    JPs received on RPF-interface: 0
-            p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
-                             ' +(?P<jp_received_on_rpf_interface>[\d]+)$')
             m = p31.match(line)
             if m:
                 jps_received_on_rpf_interface = m.groupdict()['jp_received_on_rpf_interface']
 
-            #    (*,G) Joins received with no/wrong RP: 0/0
-            p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
-                             ' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
             m = p32.match(line)
             if m:
                 joins_received_with_no_rp = m.groupdict()['joins_received_with_no_rp']
                 joins_received_with_wrong_rp = m.groupdict()['joins_received_with_wrong_rp']
 
-            #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
-            p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
-                             ' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
             m = p33.match(line)
             if m:
                 joins_received_with_ssm_groups = m.groupdict()['joins_received_with_ssm_groups']
                 joins_received_with_bidir_groups = m.groupdict()['joins_received_with_bidir_groups']
 
-            # JPs filtered by inbound policy: 0
-            p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
-                             ' +(?P<jps_filtered_by_inbound_policy>\d+)$')
             m = p34.match(line)
             if m:
                 jps_filtered_by_inbound_policy = m.groupdict()['jps_filtered_by_inbound_policy']
 
-            # JPs filtered by outbound policy: 0
-            p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
-                             ' +(?P<jps_filtered_by_outbound_policy>\d+)$')
             m = p35.match(line)
             if m:
                 jps_filtered_by_outbound_policy = m.groupdict()['jps_filtered_by_outbound_policy']
@@ -812,12 +848,95 @@ class ShowPimRp(ShowPimRpSchema):
         flag = False
         connection_flag = False
 
+        # PIM6 RP Status Information for VRF "VRF1"
+        # PIM RP Status Information for VRF "VRF1"
+        p1 = re.compile(r'^\s*(PIM6|PIM) +RP +Status +Information +for +VRF +\"(?P<vrf_name>[\w\S]+)\"$')
+
+        # BSR: Not Operational
+        # BSR: 10.1.5.1*, next Bootstrap message in: 00:00:01,
+        p2 = re.compile(r'^\s*BSR: +(?P<bsr>[\w\S]+)'
+                        '(, +next +Bootstrap +message +in: +(?P<next_bsr_message>[\w\S]+),)?$')
+
+        # BSR: 10.1.5.5, uptime: 18:04:20, expires: 00:01:50,
+        p2_1 = re.compile(r'^\s*BSR(\:)? +(?P<bsr_candidate>[\w\s\.\*\:]+)'
+                        ', +uptime: +(?P<bsr_uptime>[\w\.\:]+)'
+                        ', +expires: +(?P<bsr_expires>[\w\.\:]+),$')
+
+        # BSR RP Candidate policy: None
+        p4 = re.compile(r'^\s*BSR +RP +Candidate +policy: +(?P<bsr_rp_candidate_policy>[\w\S]+)$')
+
+        # BSR RP policy: None
+        p5 = re.compile(r'^\s*BSR +RP +policy: +(?P<bsr_rp_policy>[\w\S]+)$')
+
+        # Auto-RP Announce policy: None
+        p6 = re.compile(r'^\s*Auto\-RP +Announce +policy: +(?P<auto_rp_announce_policy>[\w\S]+)$')
+
+        # Auto-RP Discovery policy: None
+        p7 = re.compile(r'^\s*Auto\-RP +Discovery +policy: +(?P<auto_rp_discovery_policy>[\w\S]+)$')
+
+        # Anycast-RP 10.111.111.111 members:
+        p11 = re.compile(r'^\s*Anycast\-RP +(?P<anycast_rp>[\w\d\S]+) +members:$')
+
+        # 10.1.2.1*  10.1.5.1
+        p11_1 = re.compile(r'^(?P<anycast_rp_members>[\w\.\:\*\s]+)$')
+
+        # RP: 10.21.33.33, (0), uptime: 03:52:52, expires: never,
+        p8 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),'
+                        ' +uptime: +(?P<uptime>[\w\.\:]+),'
+                        ' +expires: +(?P<expires>[\w\d\S][^,]+)(?P<comma>[\,]+)?$')
+
+        # RP: 10.115.55.51, (0), 
+        p8_1 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),$')
+
+        # uptime: 1d13h   priority: 255, 
+        # uptime: 2d21h, (A) (B),  priority: 192
+        p8_2 = re.compile(r'^\s*uptime: +(?P<uptime>[\w\.\:]+),?'
+                           '( +(?P<modes>( *\(\w\)){0,3}),)? '
+                           '+priority: +(?P<priority>\d+),?$')
+
+        # RP-source: (local), 
+        # RP-source: (local), group-map: BIDIR_SPARSE1, 
+        p8_3 = re.compile(r'^\s*RP\-source:( +(?P<rp_source>\S+))? +\(+(?P<info_source_type>\w+)+\),'
+                           ' *(group-map: +(?P<route_map>[\w\-]+),)?$')
+
+        p = re.compile(r'(?P<rp_source>\S+) +(?P<info_source_type>[\w\(\)\,\s]+),')
+
+        #  priority: 0, RP-source: (local), group ranges:
+        #  priority: 92, RP-source: 10.1.5.1 (B), group ranges:
+        #  priority: 0, RP-source: (local), group-map: PIM6-STATIC-RP, group ranges:
+        p9 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
+                        ' +RP\-source:( +(?P<rp_source>[\w\S]+))? +\(+(?P<info_source_type>\w+)+\),'
+                        '( *group-map: +(?P<route_map>\S+),)?'
+                        ' +group +ranges:$')
+
+        #      224.0.0.0/4
+        #      233.0.0.0/24  (bidir)
+        #      ff1e::3002/128 ff1e::3001/128
+        # 226.0.0.0/8   (bidir)  ,  expires: 00:02:24 (A)
+        p10 = re.compile(r'^\s*(?P<group_ranges>[\w\/\.\:\s]+)'
+                         '( +\((?P<bidir>\w+)\))?'
+                         '( *, *expires: (?P<expires>[\w\.\:]+)( *\((?P<code>\w+)\))?)?$')
+
+        #    priority: 111, hash-length: 30
+        p13 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
+                         ' +hash-length: +(?P<hash_length>\d+)$')
+
+        # Auto-RP disabled
+        p3 = re.compile(r'^\s*Auto-RP +disabled$')
+
+        # Auto-RP RPA: 10.229.11.11*, next Discovery message in: 00:00:15
+        p3_1 = re.compile(r'^\s*Auto-RP RPA: +(?P<auto_rp_address>[\w\S]+),'
+                        ' +next +[d|D]iscovery +message +in: +(?P<next_discory_message>[\w\S]+)$')
+
+        # RP-source: 10.16.2.2 (A), 10.16.2.2 (B),
+        # RP-source: 10.144.6.6 (A), 10.16.2.2 (B), (local), 
+        p8_4 = re.compile(r'^\s*RP\-source: +(?P<rp_source>\S+) +\(+(?P<info_source_type>\w+)+\),')
+
+        p8_4_1 = re.compile(r'^group +ranges:$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # PIM6 RP Status Information for VRF "VRF1"
-            # PIM RP Status Information for VRF "VRF1"
-            p1 = re.compile(r'^\s*(PIM6|PIM) +RP +Status +Information +for +VRF +\"(?P<vrf_name>[\w\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -828,10 +947,6 @@ class ShowPimRp(ShowPimRpSchema):
                 auto_rp_address = None
                 continue
 
-            # BSR: Not Operational
-            # BSR: 10.1.5.1*, next Bootstrap message in: 00:00:01,
-            p2 = re.compile(r'^\s*BSR: +(?P<bsr>[\w\S]+)'
-                            '(, +next +Bootstrap +message +in: +(?P<next_bsr_message>[\w\S]+),)?$')
             m = p2.match(line)
             if m:
                 bsr = m.groupdict()['bsr'].replace('*','')
@@ -875,10 +990,6 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
 
-            # BSR: 10.1.5.5, uptime: 18:04:20, expires: 00:01:50,
-            p2_1 = re.compile(r'^\s*BSR(\:)? +(?P<bsr_candidate>[\w\s\.\*\:]+)'
-                            ', +uptime: +(?P<bsr_uptime>[\w\.\:]+)'
-                            ', +expires: +(?P<bsr_expires>[\w\.\:]+),$')
             m = p2_1.match(line)
             if m:
                 bsr_candidate = m.groupdict()['bsr_candidate'].replace('*', '')
@@ -924,16 +1035,11 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
 
-            # Auto-RP disabled
-            p3 = re.compile(r'^\s*Auto-RP +disabled$')
             m = p3.match(line)
             if m:
                 continue
 
-            # Auto-RP RPA: 10.229.11.11*, next Discovery message in: 00:00:15
-            p3 = re.compile(r'^\s*Auto-RP RPA: +(?P<auto_rp_address>[\w\S]+),'
-                            ' +next +[d|D]iscovery +message +in: +(?P<next_discory_message>[\w\S]+)$')
-            m = p3.match(line)
+            m = p3_1.match(line)
             if m:
                 auto_rp_address = m.groupdict()['auto_rp_address'].replace('*','')
 
@@ -958,8 +1064,6 @@ class ShowPimRp(ShowPimRpSchema):
                     ['autorp']['bsr_next_discovery'] = m.groupdict()['next_discory_message']
                 continue
 
-            # BSR RP Candidate policy: None
-            p4 = re.compile(r'^\s*BSR +RP +Candidate +policy: +(?P<bsr_rp_candidate_policy>[\w\S]+)$')
             m = p4.match(line)
             if m and bsr:
                 rp_candidate_policy = None if m.groupdict()['bsr_rp_candidate_policy'].lower() == 'none' \
@@ -970,8 +1074,6 @@ class ShowPimRp(ShowPimRpSchema):
                                 ['bsr']['rp_candidate_policy'] = rp_candidate_policy
                 continue
 
-            # BSR RP policy: None
-            p5 = re.compile(r'^\s*BSR +RP +policy: +(?P<bsr_rp_policy>[\w\S]+)$')
             m = p5.match(line)
             if m and bsr:
                 rp_policy = "" if m.groupdict()['bsr_rp_policy'].lower() == 'none' \
@@ -982,8 +1084,6 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
 
-            # Auto-RP Announce policy: None
-            p6 = re.compile(r'^\s*Auto\-RP +Announce +policy: +(?P<auto_rp_announce_policy>[\w\S]+)$')
             m = p6.match(line)
             if m and auto_rp_address:
                 announce_policy = "" if m.groupdict()['auto_rp_announce_policy'].lower() \
@@ -996,8 +1096,6 @@ class ShowPimRp(ShowPimRpSchema):
                         ['autorp']['announce_policy'] = announce_policy
                 continue
 
-            # Auto-RP Discovery policy: None
-            p7 = re.compile(r'^\s*Auto\-RP +Discovery +policy: +(?P<auto_rp_discovery_policy>[\w\S]+)$')
             m = p7.match(line)
             if m and auto_rp_address:
                 discovery_policy = "" if m.groupdict()['auto_rp_discovery_policy'].lower() == 'none' else \
@@ -1009,8 +1107,6 @@ class ShowPimRp(ShowPimRpSchema):
                         ['autorp']['discovery_policy'] = discovery_policy
                 continue
 
-            # Anycast-RP 10.111.111.111 members:
-            p11 = re.compile(r'^\s*Anycast\-RP +(?P<anycast_rp>[\w\d\S]+) +members:$')
             m = p11.match(line)
             if m:
                 anycast_rp = m.groupdict()['anycast_rp']
@@ -1026,8 +1122,6 @@ class ShowPimRp(ShowPimRpSchema):
                     parsed_output['vrf'][vrf_name]['address_family'][af_name] = {}
                 continue
 
-            # 10.1.2.1*  10.1.5.1
-            p11_1 = re.compile(r'^(?P<anycast_rp_members>[\w\.\:\*\s]+)$')
             m = p11_1.match(line)
             if m and flag:
                 anycast_rp_members_list = m.groupdict()['anycast_rp_members'].split()
@@ -1054,10 +1148,6 @@ class ShowPimRp(ShowPimRpSchema):
                 flag = False
                 continue
 
-            # RP: 10.21.33.33, (0), uptime: 03:52:52, expires: never,
-            p8 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),'
-                            ' +uptime: +(?P<uptime>[\w\.\:]+),'
-                            ' +expires: +(?P<expires>[\w\d\S][^,]+)(?P<comma>[\,]+)?$')
             m = p8.match(line)
             if m:
                 rp_dict = parsed_output.setdefault('vrf', {}).setdefault(vrf_name, {})\
@@ -1071,8 +1161,6 @@ class ShowPimRp(ShowPimRpSchema):
                 code = None
                 continue
 
-            # RP: 10.115.55.51, (0), 
-            p8_1 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),$')
             m = p8_1.match(line)
             if m:
                 rp_dict = parsed_output.setdefault('vrf', {}).setdefault(vrf_name, {})\
@@ -1084,21 +1172,12 @@ class ShowPimRp(ShowPimRpSchema):
                 code = None
                 continue
 
-            # uptime: 1d13h   priority: 255, 
-            # uptime: 2d21h, (A) (B),  priority: 192
-            p8_2 = re.compile(r'^\s*uptime: +(?P<uptime>[\w\.\:]+),?'
-                               '( +(?P<modes>( *\(\w\)){0,3}),)? '
-                               '+priority: +(?P<priority>\d+),?$')
             m = p8_2.match(line)
             if m:
                 uptime = m.groupdict()['uptime']
                 priority = int(m.groupdict()['priority'])
                 continue
 
-            # RP-source: (local), 
-            # RP-source: (local), group-map: BIDIR_SPARSE1, 
-            p8_3 = re.compile(r'^\s*RP\-source:( +(?P<rp_source>\S+))? +\(+(?P<info_source_type>\w+)+\),'
-                               ' *(group-map: +(?P<route_map>[\w\-]+),)?$')
             m = p8_3.match(line)
             if m:
                 code = None
@@ -1113,12 +1192,8 @@ class ShowPimRp(ShowPimRpSchema):
                     info_source_type_conversions = ['autorp']
                 continue 
 
-            # RP-source: 10.16.2.2 (A), 10.16.2.2 (B),
-            # RP-source: 10.144.6.6 (A), 10.16.2.2 (B), (local), 
-            p8_4 = re.compile(r'^\s*RP\-source: +(?P<rp_source>\S+) +\(+(?P<info_source_type>\w+)+\),')
             m = p8_4.match(line)
             if m:
-                p = re.compile(r'(?P<rp_source>\S+) +(?P<info_source_type>[\w\(\)\,\s]+),')
                 m = p.findall(line)
                 info_source_type_conversions = []
                 rp_sources = []
@@ -1138,20 +1213,12 @@ class ShowPimRp(ShowPimRpSchema):
 
             # group ranges:
             line = line.strip()
-            p8_4 = re.compile(r'^group +ranges:$')
-            m = p8_4.match(line)
+            m = p8_4_1.match(line)
             if m:
                 route_map = None
                 connection_flag = True
                 continue 
 
-            #  priority: 0, RP-source: (local), group ranges:
-            #  priority: 92, RP-source: 10.1.5.1 (B), group ranges:
-            #  priority: 0, RP-source: (local), group-map: PIM6-STATIC-RP, group ranges:
-            p9 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
-                            ' +RP\-source:( +(?P<rp_source>[\w\S]+))? +\(+(?P<info_source_type>\w+)+\),'
-                            '( *group-map: +(?P<route_map>\S+),)?'
-                            ' +group +ranges:$')
             m = p9.match(line)
             if m:
                 connection_flag = True
@@ -1171,13 +1238,6 @@ class ShowPimRp(ShowPimRpSchema):
                     code = 'autorp'
                 continue
 
-            #      224.0.0.0/4
-            #      233.0.0.0/24  (bidir)
-            #      ff1e::3002/128 ff1e::3001/128
-            # 226.0.0.0/8   (bidir)  ,  expires: 00:02:24 (A)
-            p10 = re.compile(r'^\s*(?P<group_ranges>[\w\/\.\:\s]+)'
-                             '( +\((?P<bidir>\w+)\))?'
-                             '( *, *expires: (?P<expires>[\w\.\:]+)( *\((?P<code>\w+)\))?)?$')
             m = p10.match(line)
             if m and connection_flag:
                 expire_dict = {}
@@ -1314,9 +1374,6 @@ class ShowPimRp(ShowPimRpSchema):
                         bsr_rp_dict['up_time'] = uptime
                 continue
 
-            #    priority: 111, hash-length: 30
-            p13 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
-                             ' +hash-length: +(?P<hash_length>\d+)$')
             m = p13.match(line)
             if m:
                 bsr_prioprity = int(m.groupdict()['priority'])
@@ -1440,23 +1497,36 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
         parsed_dict = dict()
         vrf = ordinal = df_uptime = df_address = interface = rp_address = ""
 
+        # Bidir-PIM6 Designated Forwarder Information for VRF "default"
+        p1 = re.compile(r'^\s*Bidir-PIM6 +Designated +Forwarder'
+                        ' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
+
+        # RP Address (ordinal)   RP Metric       Group Range
+        # 2001:db8:1:1::1 (8)
+        p2 = re.compile(r'^\s*(?P<rp_address>[\w\:\.]+) +\((?P<ordinal>\d+)\)$')
+
+        #           [0/0]           ff09::/16
+        p3 = re.compile(r'^\s*(?P<space>\s{23})'
+                        '\[(?P<metrics_pref>[\d\-]+)/(?P<metrics>[\d\-]+)\] +(?P<group_range>[\w\.\:\/]+)$')
+
+        # Interface     DF Address                 DF State DF Metric  DF Uptime
+        # Eth2/1        fe80::5054:ff:fe89:740c    Winner   [0/0]      00:00:48
+        p4 = re.compile(r'^\s*(?P<interface>[\w\-\/]+) +(?P<df_address>[\S]+)'
+                        ' +(?P<df_state>\w+)'
+                        ' +\[(?P<winner_metrics_pref>[\d\-]+)/(?P<winner_metrics>[\d\-]+)\]'
+                        ' +(?P<df_uptime>\S+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # Bidir-PIM6 Designated Forwarder Information for VRF "default"
-            p1 = re.compile(r'^\s*Bidir-PIM6 +Designated +Forwarder'
-                            ' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 ordinal = df_uptime = df_address = interface = rp_address = ""
 
-            # RP Address (ordinal)   RP Metric       Group Range
-            # 2001:db8:1:1::1 (8)
-            p2 = re.compile(r'^\s*(?P<rp_address>[\w\:\.]+) +\((?P<ordinal>\d+)\)$')
             m = p2.match(line)
             if m:
                 metrics_pref = metrics = group_range = interface = df_address = interface_state \
@@ -1464,9 +1534,6 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
                 rp_address = m.groupdict()['rp_address']
                 ordinal = m.groupdict()['ordinal']
 
-            #           [0/0]           ff09::/16
-            p3 = re.compile(r'^\s*(?P<space>\s{23})'
-                            '\[(?P<metrics_pref>[\d\-]+)/(?P<metrics>[\d\-]+)\] +(?P<group_range>[\w\.\:\/]+)$')
             m = p3.match(line)
             if m:
 
@@ -1474,12 +1541,6 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
                 metrics = m.groupdict()['metrics']
                 group_range = m.groupdict()['group_range']
 
-            # Interface     DF Address                 DF State DF Metric  DF Uptime
-            # Eth2/1        fe80::5054:ff:fe89:740c    Winner   [0/0]      00:00:48
-            p4 = re.compile(r'^\s*(?P<interface>[\w\-\/]+) +(?P<df_address>[\S]+)'
-                            ' +(?P<df_state>\w+)'
-                            ' +\[(?P<winner_metrics_pref>[\d\-]+)/(?P<winner_metrics>[\d\-]+)\]'
-                            ' +(?P<df_uptime>\S+)$')
             m = p4.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'])
@@ -1630,25 +1691,33 @@ class ShowIpPimDf(ShowIpPimDfSchema):
         parsed_dict = dict()
         vrf = ordinal = df_uptime = df_bits = df_address = interface = rp_address = is_rpf = ""
 
+        # Bidir-PIM Designated Forwarder Information for VRF "default"
+        p1 = re.compile(r'^\s*Bidir-PIM +Designated +Forwarder'
+                        ' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
+
+        # RP Address (ordinal)   DF-bits          RP Metric  Group Range
+        # 10.16.2.2 (2)            00000002 (1)     [0/0]      224.128.0.0/9
+        p2 = re.compile(r'^\s*(?P<rp_address>[\d\.]+) +\((?P<ordinal>\d+)\)'
+                        ' +(?P<df_bits>[\w\s\(\)]+)'
+                        ' +\[(?P<metrics_pref>\d+)/(?P<metrics>\d+)\] +(?P<group_range>[\d\.\/]+)$')
+
+        p3 = re.compile(r'^\s*(?P<interface>\S+) +(?P<df_address>\S+)'
+                        ' +(?P<df_state>\w+)'
+                        ' +\[(?P<winner_metrics_pref>\d+)/(?P<winner_metrics>\d+)\]'
+                        ' +(?P<df_uptime>\S+)'
+                        '( +\((?P<is_rpf>\S+)\))?$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # Bidir-PIM Designated Forwarder Information for VRF "default"
-            p1 = re.compile(r'^\s*Bidir-PIM +Designated +Forwarder'
-                            ' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 ordinal = df_uptime = df_bits = df_address = interface = rp_address = is_rpf = ""
 
-            # RP Address (ordinal)   DF-bits          RP Metric  Group Range
-            # 10.16.2.2 (2)            00000002 (1)     [0/0]      224.128.0.0/9
-            p2 = re.compile(r'^\s*(?P<rp_address>[\d\.]+) +\((?P<ordinal>\d+)\)'
-                            ' +(?P<df_bits>[\w\s\(\)]+)'
-                            ' +\[(?P<metrics_pref>\d+)/(?P<metrics>\d+)\] +(?P<group_range>[\d\.\/]+)$')
             m = p2.match(line)
             if m:
                 rp_address = m.groupdict()['rp_address']
@@ -1662,11 +1731,6 @@ class ShowIpPimDf(ShowIpPimDfSchema):
             #  Loopback0            10.4.1.1          Winner     [0/0]        00:28:14   (RPF)
             #  Ethernet2/2                 10.2.0.2         Lose       [0/0]        00:28:14
 
-            p3 = re.compile(r'^\s*(?P<interface>\S+) +(?P<df_address>\S+)'
-                            ' +(?P<df_state>\w+)'
-                            ' +\[(?P<winner_metrics_pref>\d+)/(?P<winner_metrics>\d+)\]'
-                            ' +(?P<df_uptime>\S+)'
-                            '( +\((?P<is_rpf>\S+)\))?$')
             m = p3.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'])
@@ -1842,26 +1906,52 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
         # Init dictionary
         parsed_output = dict()
 
+        # PIM6 Routing Table for VRF "VRF1" - 1 entries
+        p1 = re.compile(r'^\s*PIM6 +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
+                        ' +(?P<counter>\d+) +entries$')
+
+        # (*, ff08::/16), RP 2001:db8:12:12::12, bidir, expires 00:02:31 Route Fabric owned : FALSE, RP-bit
+        # (*, ff30::/12), expires 00:02:31 Route Fabric owned : FALSE
+        # (*, ff30::/12), expires 0.000000 Route Fabric owned : FALSE (00:00:02)
+        p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
+                        ', +(?P<group>[\S]+)\),'
+                        '( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
+                        ' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
+                        ' +Route +Fabric +owned +: ((?P<fabric_owned>[\w]+)( *(?P<dummy>\S+))?)'
+                        '(, +(?P<rp_bit>[\S]+))?$')
+
+        p2_1 = re.compile('^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
+
+        # Incoming interface: Null, RPF nbr 0.0.0.0
+        p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
+                       ' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
+
+        # Oif-list: (0) 00000000, timeout-list: (0) 00000000
+        p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
+                        ' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                        ' +(?P<timeout_bf_str>[\S]+)$')
+
+        # Timeout-interval: 3, JP-holdtime round-up: 3
+        p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
+                        ', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
+
+        # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
+        p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
+                        ' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                        ' +(?P<timeout_bf_str>[\S]+)$')
+
+        # Sgr-prune-list: (0) 00000000
+        p5_1 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
+                        ' +(?P<sgr_prune_str>[\S]+)$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
-            # PIM6 Routing Table for VRF "VRF1" - 1 entries
-            p1 = re.compile(r'^\s*PIM6 +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
-                            ' +(?P<counter>\d+) +entries$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
                 group = ""
 
-            # (*, ff08::/16), RP 2001:db8:12:12::12, bidir, expires 00:02:31 Route Fabric owned : FALSE, RP-bit
-            # (*, ff30::/12), expires 00:02:31 Route Fabric owned : FALSE
-            # (*, ff30::/12), expires 0.000000 Route Fabric owned : FALSE (00:00:02)
-            p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
-                            ', +(?P<group>[\S]+)\),'
-                            '( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
-                            ' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
-                            ' +Route +Fabric +owned +: ((?P<fabric_owned>[\w]+)( *(?P<dummy>\S+))?)'
-                            '(, +(?P<rp_bit>[\S]+))?$')
             m = p2.match(line)
             if m:
                 rp_bit = False
@@ -1882,7 +1972,6 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
 
                 expire_value = m.groupdict()['expires']
                 if '(' in expire_value:
-                    p2_1 = re.compile('^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
                     match_1 = p2_1.match(expire_value)
                     if match_1:
                         expires = match_1.groupdict()['expires_2']
@@ -1897,18 +1986,11 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
                     rp_address = m.groupdict()['rp'].replace('*','')
 
 
-            # Incoming interface: Null, RPF nbr 0.0.0.0
-            p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
-                           ' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
                 rpf_nbr = m.groupdict()['rpf_nbr']
 
-            # Oif-list: (0) 00000000, timeout-list: (0) 00000000
-            p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
-                            ' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            ' +(?P<timeout_bf_str>[\S]+)$')
             m = p4.match(line)
             if m:
                 oif_count = m.groupdict()['oif_count']
@@ -1916,10 +1998,6 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
                 oif_timeout_count = m.groupdict()['timeout_count']
                 oif_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
-            # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
-            p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
-                            ' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            ' +(?P<timeout_bf_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 imm_count = m.groupdict()['imm_count']
@@ -1927,17 +2005,11 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
                 imm_timeout_count = m.groupdict()['timeout_count']
                 imm_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
-            # Sgr-prune-list: (0) 00000000
-            p5 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
-                            ' +(?P<sgr_prune_str>[\S]+)$')
-            m = p5.match(line)
+            m = p5_1.match(line)
             if m:
                 sgr_count = m.groupdict()['sgr_count']
                 sgr_prune_str = m.groupdict()['sgr_prune_str']
 
-            # Timeout-interval: 3, JP-holdtime round-up: 3
-            p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
-                            ', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
             m = p6.match(line)
             if m:
                 timeout_interval = m.groupdict()['timeout_interval']
@@ -2099,12 +2171,32 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
         second_address_flag = False
         secondary_address = []
 
+        # PIM Neighbor Status for VRF "VRF1"
+        # PIM6 Neighbor Status for VRF "VRF1"
+        p1 = re.compile(r'^PIM6? +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+
+        # Neighbor                     Interface            Uptime    Expires   DR       Bidir-  BFD     ECMP Redirect
+        #                                                                       Priority Capable State   Capable
+        # fe80::282:eaff:feed:1b08     Ethernet1/1.10       00:12:53  00:01:38  1        yes     n/a     no
+        # fe80::282:eaff:feed:1b08        Eth2/2      07:31:36  00:01:28  1    yes     n/a
+        p2 = re.compile(r'^(?P<neighbor>[\S]+) +'
+                         '(?P<intf_name>[\S]+) +'
+                         '(?P<up_time>[\S]+) +'
+                         '(?P<expires>[\S]+) +'
+                         '(?P<dr_priority>\d+) +'
+                         '(?P<bidir_capable>\w+) +'
+                         '(?P<bfd_state>[\S]+) *'
+                         '(?:(?P<ecmp_redirect_capable>\S+))?')
+
+        #  Secondary addresses:
+        p3 = re.compile(r'^Secondary +addresses:$')
+
+        #    2001:db8:11:33::33
+        p4 = re.compile(r'^(?P<secondary_address>([a-zA-Z0-9\.\:]+))$')
+
         for line in output.splitlines():
             line = line.strip()
 
-            # PIM Neighbor Status for VRF "VRF1"
-            # PIM6 Neighbor Status for VRF "VRF1"
-            p1 = re.compile(r'^PIM6? +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2112,18 +2204,6 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
                 secondary_address = []
                 continue
                        
-            # Neighbor                     Interface            Uptime    Expires   DR       Bidir-  BFD     ECMP Redirect
-            #                                                                       Priority Capable State   Capable
-            # fe80::282:eaff:feed:1b08     Ethernet1/1.10       00:12:53  00:01:38  1        yes     n/a     no
-            # fe80::282:eaff:feed:1b08        Eth2/2      07:31:36  00:01:28  1    yes     n/a
-            p2 = re.compile(r'^(?P<neighbor>[\S]+) +'
-                             '(?P<intf_name>[\S]+) +'
-                             '(?P<up_time>[\S]+) +'
-                             '(?P<expires>[\S]+) +'
-                             '(?P<dr_priority>\d+) +'
-                             '(?P<bidir_capable>\w+) +'
-                             '(?P<bfd_state>[\S]+) *'
-                             '(?:(?P<ecmp_redirect_capable>\S+))?')
             m = p2.match(line)
             if m:
                 second_address_flag = False
@@ -2191,15 +2271,11 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
 
                     continue
 
-            #  Secondary addresses:
-            p3 = re.compile(r'^Secondary +addresses:$')
             m = p3.match(line)
             if m:
                 second_address_flag = True
                 continue
 
-            #    2001:db8:11:33::33
-            p4 = re.compile(r'^(?P<secondary_address>([a-zA-Z0-9\.\:]+))$')
             m = p4.match(line)
             if second_address_flag and m:
                 secondary_address.append(m.groupdict()['secondary_address'])
@@ -2282,13 +2358,52 @@ class ShowIpPimRouteSchema(MetaParser):
 #  parser for show ip pim route
 #  parser for show ip pim route vrf <word>
 # ==========================================================
-class ShowIpPimRoute(ShowIpPimRouteSchema):
+def _pim_route(index):
+    """Source (0) or group (1) of the route, ex: (*, 232.0.0.0/8)"""
+    return lambda row: row['mcast-addrs'].strip('()').split(',')[index].strip()
+
+
+class ShowIpPimRoute(ShowIpPimRouteSchema, NxosStructured):
     """Parser for:
         show ip pim route
         show ip pim route vrf <vrf>"""
     cli_command = ['show ip pim route','show ip pim route vrf {vrf}']
     exclude = ['expiration', 'timeout_interval']
 
+    json_mapping = [
+        Table('vrf', path=['vrf', Key('vrf-name'), 'address_family', 'ipv4',
+                           'topology_tree_info'], tables=[
+            Table('route', path=[
+                Key(lambda row: '{g} {s} {r}'.format(
+                    g=_pim_route(1)(row), s=_pim_route(0)(row),
+                    r=_pim_route(0)(row) == '*'))], fields={
+                'group': _pim_route(1),
+                'source_address': _pim_route(0),
+                'is_rpt': lambda row: _pim_route(0)(row) == '*',
+                'expiration': 'expires',
+                'mode': 'route-mode',
+                'rp_bit': lambda row: True if boolean(
+                    row.get('rp-bit', False)) else None,
+                'rp_address': 'rp-addr',
+                'incoming_interface': 'route-iif',
+                'rpf_neighbor': 'rpf-nbr',
+                'oif_count': ('oif-count', integer),
+                'oif': 'oif-list-bitfield',
+                'oif_timeout_count': ('timeout-count', integer),
+                'oif_timeout': 'timeout-bitfield',
+                'immediate_count': ('immediate-count', integer),
+                'immediate': 'immediate-bitfield',
+                'immediate_timeout_count': ('immediate-timeout-count',
+                                            integer),
+                'immediate_timeout': 'immediate-timeout-bitfield',
+                'sgr_prune_count': ('sgr-prune-list-count', integer),
+                'sgr_prune': 'sgr-prune-list-bitfield',
+                'timeout_interval': ('timeout-interval', integer),
+                'jp_holdtime_roundup': ('jp-holdtime-round-up', integer),
+            }),
+        ]),
+    ]
+
     def cli(self, vrf="",output=None):
         if output is None:
             if not vrf:
@@ -2310,24 +2425,50 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
         # Init dictionary
         parsed_output = dict()
 
+        # PIM Routing Table for VRF "VRF1" - 1 entries
+        p1 = re.compile(r'^\s*PIM +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
+                        ' +(?P<counter>\d+) +entries$')
+
+        # (*, 232.0.0.0/8), expires 0.000000 (00:00:01)
+        # (*, 233.0.0.0/24), RP 10.66.12.12, bidir, expires 00:01:58, RP-bit
+        p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
+                        ', +(?P<group>[\S]+)\),'
+                        '( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
+                        ' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
+                        '(, +(?P<rp_bit>[\S]+))?$')
+
+        p2_1 = re.compile('^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
+
+        # Incoming interface: Null, RPF nbr 0.0.0.0
+        p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
+                       ' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
+
+        # Oif-list: (0) 00000000, timeout-list: (0) 00000000
+        p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
+                        ' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                        ' +(?P<timeout_bf_str>[\S]+)$')
+
+        # Timeout-interval: 3, JP-holdtime round-up: 3
+        p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
+                        ', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
+
+        # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
+        p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
+                        ' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                        ' +(?P<timeout_bf_str>[\S]+)$')
+
+        # Sgr-prune-list: (0) 00000000
+        p5_1 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
+                        ' +(?P<sgr_prune_str>[\S]+)$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
-            # PIM Routing Table for VRF "VRF1" - 1 entries
-            p1 = re.compile(r'^\s*PIM +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
-                            ' +(?P<counter>\d+) +entries$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
                 group = ""
 
-            # (*, 232.0.0.0/8), expires 0.000000 (00:00:01)
-            # (*, 233.0.0.0/24), RP 10.66.12.12, bidir, expires 00:01:58, RP-bit
-            p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
-                            ', +(?P<group>[\S]+)\),'
-                            '( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
-                            ' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
-                            '(, +(?P<rp_bit>[\S]+))?$')
             m = p2.match(line)
             if m:
                 rp_bit = False
@@ -2345,7 +2486,6 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                     is_rpt = False
                 expire_value = m.groupdict()['expires']
                 if '(' in expire_value:
-                    p2_1 = re.compile('^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
                     match_1 = p2_1.match(expire_value)
                     if match_1:
                         expires = match_1.groupdict()['expires_2']
@@ -2360,18 +2500,11 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                     rp_address = m.groupdict()['rp'].replace('*','')
 
 
-            # Incoming interface: Null, RPF nbr 0.0.0.0
-            p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
-                           ' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
                 rpf_nbr = m.groupdict()['rpf_nbr']
 
-            # Oif-list: (0) 00000000, timeout-list: (0) 00000000
-            p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
-                            ' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            ' +(?P<timeout_bf_str>[\S]+)$')
             m = p4.match(line)
             if m:
                 oif_count = m.groupdict()['oif_count']
@@ -2379,10 +2512,6 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                 oif_timeout_count = m.groupdict()['timeout_count']
                 oif_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
-            # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
-            p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
-                            ' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            ' +(?P<timeout_bf_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 imm_count = m.groupdict()['imm_count']
@@ -2390,17 +2519,11 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                 imm_timeout_count = m.groupdict()['timeout_count']
                 imm_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
-            # Sgr-prune-list: (0) 00000000
-            p5 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
-                            ' +(?P<sgr_prune_str>[\S]+)$')
-            m = p5.match(line)
+            m = p5_1.match(line)
             if m:
                 sgr_count = m.groupdict()['sgr_count']
                 sgr_prune_str = m.groupdict()['sgr_prune_str']
 
-            # Timeout-interval: 3, JP-holdtime round-up: 3
-            p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
-                            ', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
             m = p6.match(line)
             if m:
                 timeout_interval = m.groupdict()['timeout_interval']
@@ -2549,24 +2672,26 @@ class ShowIpv6PimGroupRange(ShowIpv6PimGroupRangeSchema):
         if vrf:
             vrf_name = vrf
 
+        # PIM6 Group-Range Configuration for VRF "VRF1"
+        p1 = re.compile(r'^\s*PIM6 +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+
+        # Group-range               Mode      RP-address          Shared-tree-only range
+        # ff3x::/32                 SSM       -                   -
+        p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
+                        ' +(?P<mode>[\S]+)'
+                        ' +(?P<rp_address>[\S]+)'
+                        '( +(?P<shared_tree_only>[\S]+))?'
+                        '( +(?P<range>[\S]+))?$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
-            # PIM6 Group-Range Configuration for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM6 +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
                 mode = ""
                 continue
 
-            # Group-range               Mode      RP-address          Shared-tree-only range
-            # ff3x::/32                 SSM       -                   -
-            p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
-                            ' +(?P<mode>[\S]+)'
-                            ' +(?P<rp_address>[\S]+)'
-                            '( +(?P<shared_tree_only>[\S]+))?'
-                            '( +(?P<range>[\S]+))?$')
             m = p2.match(line)
             if m:
                 group_range = m.groupdict()['group_range']
@@ -2675,11 +2800,24 @@ class ShowIpPimNeighbor(ShowIpPimNeighborSchema):
         parsed_output = dict()
 
 
+        # PIM Neighbor Status for VRF "VRF1"
+        p1 = re.compile(r'^\s*PIM +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+
+        # Neighbor        Interface            Uptime    Expires   DR       Bidir-  BFD    ECMP Redirect
+        #                                                          Priority Capable State     Capable
+        # 10.2.3.3        Ethernet1/3.11       00:31:08  00:01:39  1        yes     n/a     no
+        p2 = re.compile(r'^\s*(?P<neighbor>[\S]+)'
+                        ' +(?P<intf_name>[\S]+)'
+                        ' +(?P<up_time>[\S]+)'
+                        ' +(?P<expires>[\S]+)'
+                        ' +(?P<dr_priority>\d+)'
+                        ' +(?P<bidir_capable>\w+)'
+                        ' +(?P<bfd_state>[\S]+)'
+                        '( +(?P<redict_capable>[\S]+))?$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
-            # PIM Neighbor Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2689,17 +2827,6 @@ class ShowIpPimNeighbor(ShowIpPimNeighborSchema):
             #                                              Priority Capable State
             # 10.11.33.33     Ethernet2/2          07:31:30  00:01:25  1        yes     n/a
             
-            # Neighbor        Interface            Uptime    Expires   DR       Bidir-  BFD    ECMP Redirect
-            #                                                          Priority Capable State     Capable
-            # 10.2.3.3        Ethernet1/3.11       00:31:08  00:01:39  1        yes     n/a     no
-            p2 = re.compile(r'^\s*(?P<neighbor>[\S]+)'
-                            ' +(?P<intf_name>[\S]+)'
-                            ' +(?P<up_time>[\S]+)'
-                            ' +(?P<expires>[\S]+)'
-                            ' +(?P<dr_priority>\d+)'
-                            ' +(?P<bidir_capable>\w+)'
-                            ' +(?P<bfd_state>[\S]+)'
-                            '( +(?P<redict_capable>[\S]+))?$')
             m = p2.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
@@ -2837,15 +2964,54 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
         expiry_timer_configured = sg_expiry_timer_infinity = False
         sg_expiry_timer = ""
 
+        #VRF Name              VRF      Table       Interface  BFD        MVPN
+        #          ID       ID          Count      Enabled    Enabled
+        # default               1        0x00000001  3          no          no
+        p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
+                        ' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
+                        ' +(?P<bfd>\w+)? +(?P<mvpn>\w+)?$')
+
+        # State Limit: None
+        p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
+
+        # Register Rate Limit: none
+        p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
+
+        # Register source  interface : loopback0 address : 10.4.1.1
+        p4 = re.compile(r'^\s*Register +source +interface +: +(?P<intf_name>[\w\d\S]+)'
+                        ' +address +: +(?P<address>[\w\d\S]+)$')
+
+        # Shared tree ranges: none
+        p5 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
+
+        # (S,G)-expiry timer: configured, infinity
+        # (S,G)-expiry timer: configured, 1200 secs
+        p7 = re.compile(r'^\s*\(S\,G\)\-expiry +timer: +(?P<expiry_timer_configured>\w+)'
+                        '(, +(?P<sg_expiry_timer_infinity>[\w]+))?'
+                        '(, +(?P<sg_expiry_timer>[\d]+) +secs)?$')
+
+        #  (S,G)-list policy: sg-expiry-timer-sg-list
+        p8 = re.compile(r'^\s*\(S\,G\)\-list +policy: +(?P<sg_list_policy>(?!none)[\w\S]+)$')
+
+        #  (S,G)-expiry timer config version 1, active version 1
+        p9 = re.compile(r'^\s*\(S\,G\)\-expiry +timer +config +version +(?P<expiry_timer_config_version>\d+)'
+                        '+, +active +version +(?P<expiry_timer_active_version>\d+)$')
+
+        # Pre-build SPT for all (S,G)s in VRF: disabled
+        p10 = re.compile(r'^\s*Pre\-build +SPT +for +all +\(S\,G\)s +in +VRF: +(?P<pre_build_spt>\w+)$')
+
+        # CLI vrf done: TRUE
+        p11 = re.compile(r'^\s*CLI +vrf +done: +(?P<cli_vrf_done>\w+)$')
+
+        # PIM cibtype Auto Enabled: yes
+        p12 = re.compile(r'^\s*PIM +cibtype +[a|A]uto +[e|E]nabled: +(?P<cibtype_auto_enabled>\w+)$')
+
+        # PIM VxLAN VNI ID: 0
+        p13 = re.compile(r'^\s*PIM +VxLAN +VNI +ID: +(?P<vxvlan_vni_id>\d+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            #VRF Name              VRF      Table       Interface  BFD        MVPN
-            #          ID       ID          Count      Enabled    Enabled
-            # default               1        0x00000001  3          no          no
-            p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
-                            ' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
-                            ' +(?P<bfd>\w+)? +(?P<mvpn>\w+)?$')
             m = p1.match(line)
             if m:
                 expiry_timer_configured = sg_expiry_timer_infinity = False
@@ -2889,8 +3055,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
                 continue
 
-            # State Limit: None
-            p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
             m = p2.match(line)
             if m:
                 state_limit = m.groupdict()['state_limit'].lower()
@@ -2903,8 +3067,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                     [af_name]['state_limit'] = state_limit
 
 
-            # Register Rate Limit: none
-            p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
             m = p3.match(line)
             if m:
                 register_rate_limit = m.groupdict()['register_rate_limit'].lower()
@@ -2917,9 +3079,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 parsed_dict['vrf'][vrf_name]['address_family'] \
                     [af_name]['register_rate_limit'] = register_rate_limit
 
-            # Register source  interface : loopback0 address : 10.4.1.1
-            p4 = re.compile(r'^\s*Register +source +interface +: +(?P<intf_name>[\w\d\S]+)'
-                            ' +address +: +(?P<address>[\w\d\S]+)$')
             m = p4.match(line)
             if m:
                 register_source = m.groupdict()['intf_name']
@@ -2953,8 +3112,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
                 continue
 
-            # Shared tree ranges: none
-            p5 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
             m = p5.match(line)
             if m:
                 shared_tree_ranges = m.groupdict()['shared_tree_ranges']
@@ -2968,11 +3125,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                     [af_name]['shared_tree_ranges'] = shared_tree_ranges
                 #continue
 
-            # (S,G)-expiry timer: configured, infinity
-            # (S,G)-expiry timer: configured, 1200 secs
-            p7 = re.compile(r'^\s*\(S\,G\)\-expiry +timer: +(?P<expiry_timer_configured>\w+)'
-                            '(, +(?P<sg_expiry_timer_infinity>[\w]+))?'
-                            '(, +(?P<sg_expiry_timer>[\d]+) +secs)?$')
             m = p7.match(line)
             if m:
                 if m.groupdict()['expiry_timer_configured']:
@@ -3012,8 +3164,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
                 continue
 
-            #  (S,G)-list policy: sg-expiry-timer-sg-list
-            p8 = re.compile(r'^\s*\(S\,G\)\-list +policy: +(?P<sg_list_policy>(?!none)[\w\S]+)$')
             m = p8.match(line)
             if m:
                 sg_list_policy = m.groupdict()['sg_list_policy']
@@ -3029,9 +3179,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                     ['sg_expiry_timer']['sg_list'] = sg_list_policy
                 continue
 
-            #  (S,G)-expiry timer config version 1, active version 1
-            p9 = re.compile(r'^\s*\(S\,G\)\-expiry +timer +config +version +(?P<expiry_timer_config_version>\d+)'
-                            '+, +active +version +(?P<expiry_timer_active_version>\d+)$')
             m = p9.match(line)
             if m:
                 expiry_timer_config_version = int(m.groupdict()['expiry_timer_config_version'])
@@ -3052,8 +3199,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
                 continue
 
-            # Pre-build SPT for all (S,G)s in VRF: disabled
-            p10 = re.compile(r'^\s*Pre\-build +SPT +for +all +\(S\,G\)s +in +VRF: +(?P<pre_build_spt>\w+)$')
             m = p10.match(line)
             if m:
                 pre_build_spt = m.groupdict()['pre_build_spt']
@@ -3061,8 +3206,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 [af_name]['pre_build_spt'] = pre_build_spt
                 continue
 
-            # CLI vrf done: TRUE
-            p11 = re.compile(r'^\s*CLI +vrf +done: +(?P<cli_vrf_done>\w+)$')
             m= p11.match(line)
             if m:
                 cli_vrf_done = True if m.groupdict()['cli_vrf_done'].lower() == 'true' else False
@@ -3071,8 +3214,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 [af_name]['cli_vrf_done'] = cli_vrf_done
                 continue
 
-            # PIM cibtype Auto Enabled: yes
-            p12 = re.compile(r'^\s*PIM +cibtype +[a|A]uto +[e|E]nabled: +(?P<cibtype_auto_enabled>\w+)$')
             m = p12.match(line)
             if m:
                 cibtype_auto_enabled = True if m.groupdict()['cibtype_auto_enabled'].lower() == 'yes' else False
@@ -3081,8 +3222,6 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 [af_name]['cibtype_auto_enabled'] = cibtype_auto_enabled
                 continue
 
-            # PIM VxLAN VNI ID: 0
-            p13 = re.compile(r'^\s*PIM +VxLAN +VNI +ID: +(?P<vxvlan_vni_id>\d+)$')
             m = p13.match(line)
             if m:
                 vxlan_vni_id = int(m.groupdict()['vxvlan_vni_id'])
@@ -3147,24 +3286,27 @@ class ShowIpPimGroupRange(ShowIpPimGroupRangeSchema):
         # Init dictionary
         parsed_output = dict()
         vrf_name = ""
+
+        # PIM Group-Range Configuration for VRF "VRF1"
+        p1 = re.compile(r'^\s*PIM +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+
+        # Group-range        Action    Mode      RP-address       Shared-tree-only range
+        # 232.0.0.0/8        Accept    SSM       -                -         Local
+        p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
+                        ' +(?P<action>[\S]+)'
+                        ' +(?P<mode>[\S]+)'
+                        ' +(?P<rp_address>[\S]+)'
+                        ' +(?P<shared_tree_only>[\S]+)'
+                        '( +(?P<range>[\S]+))?$')
+
         for line in output.splitlines():
             line = line.rstrip()
 
-            # PIM Group-Range Configuration for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
                 continue
 
-            # Group-range        Action    Mode      RP-address       Shared-tree-only range
-            # 232.0.0.0/8        Accept    SSM       -                -         Local
-            p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
-                            ' +(?P<action>[\S]+)'
-                            ' +(?P<mode>[\S]+)'
-                            ' +(?P<rp_address>[\S]+)'
-                            ' +(?P<shared_tree_only>[\S]+)'
-                            '( +(?P<range>[\S]+))?$')
             m = p2.match(line)
             if m:
                 group_range = m.groupdict()['group_range']
@@ -3274,19 +3416,22 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
         vrf_out = self.device.execute(cmd_vrf)
         parsed_data = {}
         vrf_name  = 'default'
+
+        # ip pim register-policy pim_register_p
+        p1 = re.compile(r'^\s*ip +pim +register-policy( +prefix-list)? +(?P<rg_policy_name>[\S]+)$')
+
+        # vrf context VRF1
+        p1_2 = re.compile(r'^\s*vrf +context +(?P<vrf_name>[\S]+)$')
+
         for each_line in vrf_out.splitlines():
             each_line = each_line.rstrip()
 
-            # ip pim register-policy pim_register_p
-            p1 = re.compile(r'^\s*ip +pim +register-policy( +prefix-list)? +(?P<rg_policy_name>[\S]+)$')
             m = p1.match(each_line)
             if m:
                 parsed_data[vrf_name] = m.groupdict()['rg_policy_name']
                 continue
 
-            # vrf context VRF1
-            p1 = re.compile(r'^\s*vrf +context +(?P<vrf_name>[\S]+)$')
-            m = p1.match(each_line)
+            m = p1_2.match(each_line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
                 continue
@@ -3303,22 +3448,42 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
         # Init dictionary
         parsed_dict = dict()
 
+        p0 = re.compile(r'^\s*C: +No. +of +comparisions, +M: +No. +of matches$')
+
+        # match ip multicast group 239.2.2.2/32                      C: 0      M: 0
+        p1_1 = re.compile(r'^\s*match +ip +multicast +group +(?P<group>[\w\.\/]+)'
+                          '( +[c|C]: +(?P<c>\d+))?'
+                          '( +[m|M]: +(?P<m>\d+))?$')
+
+        # ip prefix-list testprefixlist seq 5 permit 239.3.3.3/32      M: 0
+        p2_1 = re.compile(r'^\s*ip +prefix-list +(?P<prefix_list>[\S]+)'
+                          '( +seq +(?P<seq>\d+))?'
+                          '( +permit +(?P<permit>[\S]+))?'
+                          '( +[c|C]: +(?P<c>\d+))?'
+                          '( +[m|M]: +(?P<m>\d+))?$')
+
+        # Total accept count for policy: 0
+        p3 = re.compile(r'^\s*Total +accept +count +for +policy: +(?P<accept_policy_count>\d+)$')
+
+        # Total reject count for policy: 0
+        p4 = re.compile(r'^\s*Total +reject +count +for +policy: +(?P<reject_policy_count>\d+)$')
+
+        # route-map pim_register_vrf permit 10
+        p1_3 = re.compile(r'^\s*route-map +(?P<route_map>[\S]+)'
+                        ' +permit +(?P<route_map_permit>[\S]+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            p0 = re.compile(r'^\s*C: +No. +of +comparisions, +M: +No. +of matches$')
             m = p0.match(line)
             if m:
                 compare_count = match_count = accept_register = info = \
                     reject_policy_count = accept_policy_count = ""
 
-            # route-map pim_register_vrf permit 10
-            p1 = re.compile(r'^\s*route-map +(?P<route_map>[\S]+)'
-                            ' +permit +(?P<route_map_permit>[\S]+)$')
-            m = p1.match(line)
+            m = p1_3.match(line)
             if m:
                 accept_register = m.groupdict()['route_map']
                 route_map_permit = m.groupdict()['route_map_permit']
@@ -3327,10 +3492,6 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                     if accept_register == value:
                         vrf = key
 
-            # match ip multicast group 239.2.2.2/32                      C: 0      M: 0
-            p1_1 = re.compile(r'^\s*match +ip +multicast +group +(?P<group>[\w\.\/]+)'
-                              '( +[c|C]: +(?P<c>\d+))?'
-                              '( +[m|M]: +(?P<m>\d+))?$')
             m = p1_1.match(line)
             if m:
                 group = m.groupdict()['group'].rstrip()
@@ -3341,12 +3502,6 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                 match_count = m.groupdict()['m']
                 info = "match ip multicast group " + group
 
-            # ip prefix-list testprefixlist seq 5 permit 239.3.3.3/32      M: 0
-            p2_1 = re.compile(r'^\s*ip +prefix-list +(?P<prefix_list>[\S]+)'
-                              '( +seq +(?P<seq>\d+))?'
-                              '( +permit +(?P<permit>[\S]+))?'
-                              '( +[c|C]: +(?P<c>\d+))?'
-                              '( +[m|M]: +(?P<m>\d+))?$')
             m = p2_1.match(line)
             if m:
                 accept_register = m.groupdict()['prefix_list']
@@ -3363,14 +3518,10 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                 match_count = m.groupdict()['m']
                 info = 'ip prefix-list '+ accept_register +" seq "+ seq + " permit "+permit
 
-            # Total accept count for policy: 0
-            p3 = re.compile(r'^\s*Total +accept +count +for +policy: +(?P<accept_policy_count>\d+)$')
             m = p3.match(line)
             if m:
                 accept_policy_count = m.groupdict()['accept_policy_count']
 
-            # Total reject count for policy: 0
-            p4 = re.compile(r'^\s*Total +reject +count +for +policy: +(?P<reject_policy_count>\d+)$')
             m = p4.match(line)
             if m:
                 reject_policy_count = m.groupdict()['reject_policy_count']
@@ -3566,11 +3717,140 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
             = jp_interval = passive = auto_enabled = genid = jp_outbound_policy = jp_inbound_policy = \
             nbr_count = ip_subnet = neighbor_holdtime = neighbor_filter = vpc_svi = bad_version_packets = ""
 
+        #PIM Interface Status for VRF "VRF1"
+        p1 = re.compile(r'^\s*PIM +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
+
+        # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
+        p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),?'
+                        ' +Interface +status:'
+                        ' +protocol-(?P<oper_status>[\w]+)(/)?'
+                        'link\-(?P<link_status>[\w]+)(/)?'
+                        'admin\-(?P<admin_status>[\w]+)$')
+
+        # IP address: 10.11.33.11, IP subnet: 10.11.33.0/24
+        p3 = re.compile(r'^\s*IP +address: +(?P<address>[\w\.]+),'
+                        ' +IP +subnet: +(?P<ip_subnet>[\w\.\/]+)$')
+
+        # PIM DR: 10.11.33.11, DR's priority: 144
+        p4 = re.compile(r'^\s*PIM +DR: +(?P<dr_address>[\w\.]+),'
+                        ' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
+
+        # PIM neighbor count: 1
+        p5 = re.compile(r'^\s*PIM +neighbor +count: +(?P<nbr_count>[\d]+)$')
+
+        # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
+        p6 = re.compile(r'^\s*PIM +hello +interval: +(?P<hello_interval>[\d]+) +secs'
+                        '( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
+                        ' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
+
+        # PIM neighbor holdtime: 159 secs
+        p7 = re.compile(r'^\s*PIM +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
+
+        # PIM configured DR priority: 144
+        p8 = re.compile(r'^\s*PIM +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
+
+        # PIM configured DR delay: 3 secs
+        p9 = re.compile(r'^\s*PIM +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
+
+        # PIM border interface: yes
+        p10 = re.compile(r'^\s*PIM +border +interface: +(?P<border_interface>[\w]+)$')
+
+        # PIM GenID sent in Hellos: 0x26fae674
+        p11 = re.compile(r'^\s*PIM +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
+
+        # PIM Hello MD5-AH Authentication: disabled
+        p12 = re.compile(r'^\s*PIM +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
+
+        # PIM Neighbor policy: v4neighbor-policy
+        p13 = re.compile(r'^\s*PIM +Neighbor +policy: +(?P<nbr_policy>(?!none)[\w\-\s]+)$')
+
+        # PIM Join-Prune inbound policy: v4jp-policy
+        p14 = re.compile(r'^\s*PIM +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
+
+        # PIM Join-Prune outbound policy: v4jp-policy
+        p15 = re.compile(r'^\s*PIM +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
+
+        # PIM Join-Prune interval: 1 minutes
+        p16 = re.compile(r'^\s*PIM +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
+
+        # PIM Join-Prune next sending: 1 minutes
+        p17 = re.compile(r'^\s*PIM +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
+
+        # PIM BFD enabled: no
+        p18 = re.compile(r'^\s*PIM +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
+
+        # PIM passive interface: no
+        p19 = re.compile(r'^\s*PIM +passive +interface: +(?P<passive>[\w]+)$')
+
+        # PIM VPC SVI: no
+        p20 = re.compile(r'^\s*PIM +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
+
+        # PIM Auto Enabled: no
+        p21 = re.compile(r'^\s*PIM +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
+
+        # PIM Interface Statistics, last reset: never
+        # PIM Interface Statistics
+        p22 = re.compile(r'^\s*PIM +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
+
+        # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
+        p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
+                         ' +\(early: +(?P<early>\d+)\)?,'
+                         ' +JPs: +(?P<jps>[\d\/]+),'
+                         ' +Asserts: +(?P<asserts>[\d\/]+)$')
+
+        # Grafts: 0/0, Graft-Acks: 0/0
+        p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
+                         ' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
+
+        # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
+        p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
+                         ' +DF-Winners: +(?P<df_winners>[\d\/]+),'
+                         ' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
+                         ' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
+
+        #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
+        p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
+                         ' +Invalid +packet +types\/DF +subtypes:'
+                         ' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
+
+        #    Authentication failed: 0
+        p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
+
+        #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
+        p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
+                         ' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
+                         ' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
+
+        #    Packets from non-neighbors: 0
+        p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
+
+        #    Packets received on passiveinterface: 0
+        p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
+                         ' +(?P<packets_received_on_passiveinterface>[\d]+)$')
+
+        #    JPs received on RPF-interface: 0
+        p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
+                         ' +(?P<jp_received_on_rpf_interface>[\d]+)$')
+
+        #    (*,G) Joins received with no/wrong RP: 0/0
+        p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
+                         ' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
+
+        #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
+        p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
+                         ' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
+
+        # JPs filtered by inbound policy: 0
+        p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
+                         ' +(?P<jps_filtered_by_inbound_policy>\d+)$')
+
+        # JPs filtered by outbound policy: 0
+        p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
+                         ' +(?P<jps_filtered_by_outbound_policy>\d+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            #PIM Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -3587,12 +3867,6 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 = jp_interval = passive = auto_enabled = genid = jp_outbound_policy = jp_inbound_policy = \
                 nbr_count = configured_dr_priority = ip_subnet = neighbor_holdtime = neighbor_filter = vpc_svi = bad_version_packets = ""
 
-            # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),?'
-                            ' +Interface +status:'
-                            ' +protocol-(?P<oper_status>[\w]+)(/)?'
-                            'link\-(?P<link_status>[\w]+)(/)?'
-                            'admin\-(?P<admin_status>[\w]+)$')
             m = p2.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -3601,161 +3875,102 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 admin_status = m.groupdict()['admin_status']
                 jp_outbound_policy = jp_inbound_policy = neighbor_filter = ""
 
-            # IP address: 10.11.33.11, IP subnet: 10.11.33.0/24
-            p3 = re.compile(r'^\s*IP +address: +(?P<address>[\w\.]+),'
-                            ' +IP +subnet: +(?P<ip_subnet>[\w\.\/]+)$')
             m = p3.match(line)
             if m:
                 address = m.groupdict()['address']
                 ip_subnet = m.groupdict()['ip_subnet']
 
-            # PIM DR: 10.11.33.11, DR's priority: 144
-            p4 = re.compile(r'^\s*PIM +DR: +(?P<dr_address>[\w\.]+),'
-                            ' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
             m = p4.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
                 dr_priority = m.groupdict()['dr_priority']
 
-            # PIM neighbor count: 1
-            p5 = re.compile(r'^\s*PIM +neighbor +count: +(?P<nbr_count>[\d]+)$')
-
             m = p5.match(line)
             if m:
                 nbr_count = m.groupdict()['nbr_count']
 
-            # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
-            p6 = re.compile(r'^\s*PIM +hello +interval: +(?P<hello_interval>[\d]+) +secs'
-                            '( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
-                            ' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
             m = p6.match(line)
             if m:
                 hello_interval = m.groupdict()['hello_interval']
                 hello_expiration = m.groupdict()['hello_expiration']
 
-            # PIM neighbor holdtime: 159 secs
-            p7 = re.compile(r'^\s*PIM +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
             m = p7.match(line)
             if m:
                 neighbor_holdtime = m.groupdict()['holdtime']
 
-            # PIM configured DR priority: 144
-            p8 = re.compile(r'^\s*PIM +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
             m = p8.match(line)
             if m:
                 configured_dr_priority = m.groupdict()['configured_dr_priority']
 
-            # PIM configured DR delay: 3 secs
-            p9 = re.compile(r'^\s*PIM +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
             m = p9.match(line)
             if m:
                 configured_dr_delay = m.groupdict()['configured_dr_delay']
 
-            # PIM border interface: yes
-            p10 = re.compile(r'^\s*PIM +border +interface: +(?P<border_interface>[\w]+)$')
             m = p10.match(line)
             if m:
                 bsr_border = m.groupdict()['border_interface']
 
-            # PIM GenID sent in Hellos: 0x26fae674
-            p11 = re.compile(r'^\s*PIM +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
             m = p11.match(line)
             if m:
                 genid = m.groupdict()['genid']
 
-            # PIM Hello MD5-AH Authentication: disabled
-            p12 = re.compile(r'^\s*PIM +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
             m = p12.match(line)
             if m:
                 hello_md5_ah_authentication = m.groupdict()['md5_authentication']
 
-            # PIM Neighbor policy: v4neighbor-policy
-            p13 = re.compile(r'^\s*PIM +Neighbor +policy: +(?P<nbr_policy>(?!none)[\w\-\s]+)$')
             m = p13.match(line)
             if m:
                 neighbor_filter = m.groupdict()['nbr_policy']
 
-            # PIM Join-Prune inbound policy: v4jp-policy
-            p14 = re.compile(r'^\s*PIM +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
             m = p14.match(line)
             if m:
                 jp_inbound_policy = m.groupdict()['jp_inbound_policy']
 
-            # PIM Join-Prune outbound policy: v4jp-policy
-            p15 = re.compile(r'^\s*PIM +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
             m = p15.match(line)
             if m:
                 jp_outbound_policy = m.groupdict()['jp_outbound_policy']
 
-            # PIM Join-Prune interval: 1 minutes
-            p16 = re.compile(r'^\s*PIM +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
             m = p16.match(line)
             if m:
                 jp_interval = m.groupdict()['jp_interval']
 
-            # PIM Join-Prune next sending: 1 minutes
-            p17 = re.compile(r'^\s*PIM +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
             m = p17.match(line)
             if m:
                 jp_next_sending = m.groupdict()['jp_next_sending']
 
-            # PIM BFD enabled: no
-            p18 = re.compile(r'^\s*PIM +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
             m = p18.match(line)
             if m:
                 bfd = m.groupdict()['bfd_enabled']
 
-            # PIM passive interface: no
-            p19 = re.compile(r'^\s*PIM +passive +interface: +(?P<passive>[\w]+)$')
             m = p19.match(line)
             if m:
                 passive = m.groupdict()['passive']
 
-            # PIM VPC SVI: no
-            p20 = re.compile(r'^\s*PIM +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
             m = p20.match(line)
             if m:
                 vpc_svi = m.groupdict()['vpc_svi']
 
-            # PIM Auto Enabled: no
-            p21 = re.compile(r'^\s*PIM +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
             m = p21.match(line)
             if m:
                 auto_enabled = m.groupdict()['auto_enabled']
 
-            # PIM Interface Statistics, last reset: never
-            # PIM Interface Statistics
-            p22 = re.compile(r'^\s*PIM +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
             m = p22.match(line)
             if m:
                 statistic = True
                 if m.groupdict()['last_reset']:
                     last_rest = m.groupdict()['last_reset']
 
-            # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
-            p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
-                             ' +\(early: +(?P<early>\d+)\)?,'
-                             ' +JPs: +(?P<jps>[\d\/]+),'
-                             ' +Asserts: +(?P<asserts>[\d\/]+)$')
             m = p23.match(line)
             if m:
                 hellos = m.groupdict()['hellos']
                 jps = m.groupdict()['jps']
                 asserts = m.groupdict()['asserts']
 
-            # Grafts: 0/0, Graft-Acks: 0/0
-            p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
-                             ' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
             m = p24.match(line)
             if m:
                 grafts = m.groupdict()['grafts']
                 graft_acks = m.groupdict()['graft_acks']
 
-            # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
-            p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
-                             ' +DF-Winners: +(?P<df_winners>[\d\/]+),'
-                             ' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
-                             ' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
             m = p25.match(line)
             if m:
                 df_offers = m.groupdict()['df_offers']
@@ -3763,78 +3978,48 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 df_backoffs = m.groupdict()['df_backoffs']
                 df_passes = m.groupdict()['df_passes']
 
-            #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
-            p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
-                             ' +Invalid +packet +types\/DF +subtypes:'
-                             ' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
             m = p26.match(line)
             if m:
                 checksum = m.groupdict()['checksum']
                 invalid_packet_types = m.groupdict()['invalid_packet_types']
                 invalid_df_subtypes = m.groupdict()['invalid_df_subtypes']
 
-            #    Authentication failed: 0
-            p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
             m = p27.match(line)
             if m:
                 authentication_failed = m.groupdict()['authentication_failed']
 
-            #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
-            p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
-                             ' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
-                             ' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
             m = p28.match(line)
             if m:
                 packet_length_errors = m.groupdict()['packet_length_errors']
                 bad_version_packets = m.groupdict()['bad_version_packets']
                 packets_from_self = m.groupdict()['packets_from_self']
 
-            #    Packets from non-neighbors: 0
-            p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
             m = p29.match(line)
             if m:
                 packets_from_non_neighbors = m.groupdict()['packets_from_non_neighbors']
 
-            #    Packets received on passiveinterface: 0
-            p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
-                             ' +(?P<packets_received_on_passiveinterface>[\d]+)$')
             m = p30.match(line)
             if m:
                 packets_received_on_passiveinterface = m.groupdict()['packets_received_on_passiveinterface']
 
-            #    JPs received on RPF-interface: 0
-            p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
-                             ' +(?P<jp_received_on_rpf_interface>[\d]+)$')
             m = p31.match(line)
             if m:
                 jps_received_on_rpf_interface = m.groupdict()['jp_received_on_rpf_interface']
 
-            #    (*,G) Joins received with no/wrong RP: 0/0
-            p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
-                             ' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
             m = p32.match(line)
             if m:
                 joins_received_with_no_rp = m.groupdict()['joins_received_with_no_rp']
                 joins_received_with_wrong_rp = m.groupdict()['joins_received_with_wrong_rp']
 
-            #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
-            p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
-                             ' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
             m = p33.match(line)
             if m:
                 joins_received_with_ssm_groups = m.groupdict()['joins_received_with_ssm_groups']
                 joins_received_with_bidir_groups = m.groupdict()['joins_received_with_bidir_groups']
 
-            # JPs filtered by inbound policy: 0
-            p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
-                             ' +(?P<jps_filtered_by_inbound_policy>\d+)$')
             m = p34.match(line)
             if m:
                 jps_filtered_by_inbound_policy = m.groupdict()['jps_filtered_by_inbound_policy']
 
-            # JPs filtered by outbound policy: 0
-            p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
-                             ' +(?P<jps_filtered_by_outbound_policy>\d+)$')
             m = p35.match(line)
             if m:
                 jps_filtered_by_outbound_policy = m.groupdict()['jps_filtered_by_outbound_policy']
@@ -4116,15 +4301,31 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
         # Init dictionary
         parsed_dict = dict()
 
+        #VRF Name              VRF      Table       Interface  BFD
+        #          ID       ID          Count      Enabled
+        # default               1        0x80000001  3          no
+        p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
+                        ' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
+                        ' +(?P<bfd>\w+)$')
+
+        # State Limit: None
+        p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
+
+        # Register Rate Limit: none
+        p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
+
+        # Shared tree ranges: none
+        p6 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
+
+        # Shared tree route-map: v6spt-threshold-group-list
+        p4 = re.compile(r'^\s*Shared +tree +route-map: +(?P<route_map>[\w\d\S]+)$')
+
+        # route-ranges: xxxxx
+        p4_1 = re.compile(r'^\s*route-ranges:( +(?P<route_range>[\w\d\S]+))?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            #VRF Name              VRF      Table       Interface  BFD
-            #          ID       ID          Count      Enabled
-            # default               1        0x80000001  3          no
-            p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
-                            ' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
-                            ' +(?P<bfd>\w+)$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf']
@@ -4157,8 +4358,6 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
 
                 continue
 
-            # State Limit: None
-            p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
             m = p2.match(line)
             if m:
                 state_limit = m.groupdict()['state_limit'].lower()
@@ -4167,8 +4366,6 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                 continue
 
 
-            # Register Rate Limit: none
-            p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
             m = p3.match(line)
             if m:
                 register_rate_limit = m.groupdict()['register_rate_limit'].lower()
@@ -4176,8 +4373,6 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                     [af_name]['register_rate_limit'] = register_rate_limit
                 continue
 
-            # Shared tree route-map: v6spt-threshold-group-list
-            p4 = re.compile(r'^\s*Shared +tree +route-map: +(?P<route_map>[\w\d\S]+)$')
             m = p4.match(line)
             if m:
                 shared_tree_route_map = m.groupdict()['route_map']
@@ -4185,9 +4380,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                     [af_name]['shared_tree_route_map'] = shared_tree_route_map
                 continue
 
-            # route-ranges: xxxxx
-            p4 = re.compile(r'^\s*route-ranges:( +(?P<route_range>[\w\d\S]+))?$')
-            m = p4.match(line)
+            m = p4_1.match(line)
             if m:
                 if m.groupdict()['route_range']:
                     shared_tree_route_range = m.groupdict()['route_range']
@@ -4197,8 +4390,6 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
 
                 continue
 
-            # Shared tree ranges: none
-            p6 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
             m = p6.match(line)
             if m:
                 shared_tree_ranges = m.groupdict()['shared_tree_ranges']
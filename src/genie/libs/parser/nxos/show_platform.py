@@ -98,9 +98,65 @@ class ShowVersion(ShowVersionSchema):
 
         version_dict = {}
 
+        p1 = re.compile(r'^\s*Cisco +(?P<platform>[a-zA-Z]+) +Operating +System +\((?P<os>[A-Z\-]+)\)? +Software$')
+
+        p2 = re.compile(r'^\s*Software$')
+
+        p3 = re.compile(r'^\s*BIOS: +version +(?P<bios_version>[0-9\.]+)?$')
+
+        p4 = re.compile(r'^\s*kickstart: +version +(?P<kickstart_version>[\w\.\(\)\[\]\s]+)$')
+
+        p5 = re.compile(r'^\s*system: +version +(?P<system_version>[\w\.\(\)\[\]\s]+)$')
+
+        p6 = re.compile(r'^\s*NXOS: +version +(?P<system_version>[A-Za-z0-9\.\(\)\[\]\s]+)$')
+
+        p7 = re.compile(r'^\s*BIOS +compile +time: +(?P<bios_compile_time>[0-9\/]+)?$')
+
+        p8 = re.compile(r'^\s*kickstart +image +file +is: +(?P<kickstart_image_file>[\w\:\/\-\.]+)$')
+
+        p9 = re.compile(r'^\s*kickstart +compile +time: +(?P<kickstart_compile_time>[0-9\/\s\:\[\]]+)$')
+
+        p10 = re.compile(r'^\s*system +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
+
+        p11 = re.compile(r'^\s*system +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
+
+        p12 = re.compile(r'^\s*NXOS +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
+
+        p13 = re.compile(r'^\s*NXOS +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
+
+        p14 = re.compile(r'^\s*Hardware$')
+
+        # cisco NX-OSv chassis
+        # cisco Nexus7000 C7009 (9 Slot) Chassis ("Supervisor Module-2")
+        # cisco Nexus 5596 Chassis ("O2 48X10GE/Modular Supervisor")
+        # cisco N9K-C93180YC-EX ("supervisor")
+        p15 = re.compile(r'^\s*cisco +(?P<model>[a-zA-Z0-9\-\s]+)'
+        #r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)?( +\(\"(?P<rp>'
+        r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)( +\(\"(?P<rp>'
+        #r'( +\((?P<slot>[0-9]+) Slot\))? +[C|c]hassis( +\(\"(?P<rp>'
+        r'[a-zA-Z0-9\s\-\/\+]+)\"\))?(\s)?$')
+
+        # Intel(R) Xeon(R) CPU         with 32938744 kB of memory.
+        # Intel(R) Core(TM) i3- CPU @ 2.50GHz with 12345678 kB of memory.
+        # Intel(R) Celeron(R) M CPU with 2073416 kB of memory.
+        p16 = re.compile(r'^(?P<cpu>.*) +with +(?P<memory>[0-9a-zA-Z\s]+) +of +memory\.$')
+
+        p17 = re.compile(r'^\s*Processor +Board +ID +(?P<processor_board_id>[A-Z0-9]+)$')
+
+        p18 = re.compile(r'^\s*Device name: +(?P<device_name>[a-zA-Z0-9\-\_]+)$')
+
+        p19 = re.compile(r'^\s*bootflash: +(?P<bootflash>[a-zA-Z0-9\s]+)$')
+
+        p20 = re.compile(r'^\s*slot0: +(?P<slot0>[a-zA-Z0-9\s]+) +\(expansion flash\)$')
+
+        p21 = re.compile(r'^\s*Kernel +uptime +is +(?P<days>[0-9]+) +day\(s\), +(?P<hours>[0-9]+) +hour\(s\), +(?P<minutes>[0-9]+) +minute\(s\), +(?P<seconds>[0-9]+) +second\(s\)$')
+
+        p22 = re.compile(r'^\s*Reason: +(?P<reason>[a-zA-Z0-9\s]+)$')
+
+        p23 = re.compile(r'^\s*System version: +(?P<system_version>[0-9\(\)\.]+)?$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Cisco +(?P<platform>[a-zA-Z]+) +Operating +System +\((?P<os>[A-Z\-]+)\)? +Software$')
             m = p1.match(line)
             if m:
                 name = str(m.groupdict()['platform'])
@@ -114,7 +170,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['os'] = os
                 continue
 
-            p2 = re.compile(r'^\s*Software$')
             m = p2.match(line)
             if m:
 
@@ -122,7 +177,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software'] = {}
                 continue
 
-            p3 = re.compile(r'^\s*BIOS: +version +(?P<bios_version>[0-9\.]+)?$')
             m = p3.match(line)
             if m:
 
@@ -132,7 +186,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['bios_version'] = bios_version
                 continue
 
-            p4 = re.compile(r'^\s*kickstart: +version +(?P<kickstart_version>[\w\.\(\)\[\]\s]+)$')
             m = p4.match(line)
             if m:
                 kickstart_version = str(m.groupdict()['kickstart_version'])
@@ -141,7 +194,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['kickstart_version'] = kickstart_version
                 continue
 
-            p5 = re.compile(r'^\s*system: +version +(?P<system_version>[\w\.\(\)\[\]\s]+)$')
             m = p5.match(line)
             if m:
                 system_version = str(m.groupdict()['system_version'])
@@ -150,7 +202,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_version'] = system_version
                 continue
 
-            p6 = re.compile(r'^\s*NXOS: +version +(?P<system_version>[A-Za-z0-9\.\(\)\[\]\s]+)$')
             m = p6.match(line)
             if m:
                 system_version = str(m.groupdict()['system_version'])
@@ -159,7 +210,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_version'] = system_version
                 continue
 
-            p7 = re.compile(r'^\s*BIOS +compile +time: +(?P<bios_compile_time>[0-9\/]+)?$')
             m = p7.match(line)
             if m:
                 bios_compile_time = str(m.groupdict()['bios_compile_time'])
@@ -168,7 +218,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['bios_compile_time'] = bios_compile_time
                 continue
 
-            p8 = re.compile(r'^\s*kickstart +image +file +is: +(?P<kickstart_image_file>[\w\:\/\-\.]+)$')
             m = p8.match(line)
             if m:
                 kickstart_image_file = str(m.groupdict()['kickstart_image_file'])
@@ -177,7 +226,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['kickstart_image_file'] = kickstart_image_file
                 continue
 
-            p9 = re.compile(r'^\s*kickstart +compile +time: +(?P<kickstart_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p9.match(line)
             if m:
                 kickstart_compile_time = str(m.groupdict()['kickstart_compile_time'])
@@ -186,7 +234,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['kickstart_compile_time'] = kickstart_compile_time
                 continue
 
-            p10 = re.compile(r'^\s*system +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
             m = p10.match(line)
             if m:
                 system_image_file = str(m.groupdict()['system_image_file'])
@@ -195,7 +242,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_image_file'] = system_image_file
                 continue
 
-            p11 = re.compile(r'^\s*system +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p11.match(line)
             if m:
                 system_compile_time = str(m.groupdict()['system_compile_time'])
@@ -204,7 +250,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_compile_time'] = system_compile_time
                 continue
 
-            p12 = re.compile(r'^\s*NXOS +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
             m = p12.match(line)
             if m:
                 system_image_file = str(m.groupdict()['system_image_file'])
@@ -213,7 +258,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_image_file'] = system_image_file
                 continue
 
-            p13 = re.compile(r'^\s*NXOS +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p13.match(line)
             if m:
                 system_compile_time = str(m.groupdict()['system_compile_time'])
@@ -222,7 +266,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_compile_time'] = system_compile_time
                 continue
 
-            p14 = re.compile(r'^\s*Hardware$')
             m = p14.match(line)
             if m:
 
@@ -230,15 +273,6 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['hardware'] = {}
                 continue
 
-            # cisco NX-OSv chassis
-            # cisco Nexus7000 C7009 (9 Slot) Chassis ("Supervisor Module-2")
-            # cisco Nexus 5596 Chassis ("O2 48X10GE/Modular Supervisor")
-            # cisco N9K-C93180YC-EX ("supervisor")
-            p15 = re.compile(r'^\s*cisco +(?P<model>[a-zA-Z0-9\-\s]+)'
-            #r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)?( +\(\"(?P<rp>'
-            r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)( +\(\"(?P<rp>'
-            #r'( +\((?P<slot>[0-9]+) Slot\))? +[C|c]hassis( +\(\"(?P<rp>'
-            r'[a-zA-Z0-9\s\-\/\+]+)\"\))?(\s)?$')
             m = p15.match(line)
             if m:
                 model = chassis = str(m.groupdict()['model'])
@@ -257,10 +291,6 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
 
-            # Intel(R) Xeon(R) CPU         with 32938744 kB of memory.
-            # Intel(R) Core(TM) i3- CPU @ 2.50GHz with 12345678 kB of memory.
-            # Intel(R) Celeron(R) M CPU with 2073416 kB of memory.
-            p16 = re.compile(r'^(?P<cpu>.*) +with +(?P<memory>[0-9a-zA-Z\s]+) +of +memory\.$')
             m = p16.match(line)
             if m:
 
@@ -278,7 +308,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p17 = re.compile(r'^\s*Processor +Board +ID +(?P<processor_board_id>[A-Z0-9]+)$')
             m = p17.match(line)
             if m:
 
@@ -289,7 +318,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p18 = re.compile(r'^\s*Device name: +(?P<device_name>[a-zA-Z0-9\-\_]+)$')
             m = p18.match(line)
             if m:
 
@@ -300,7 +328,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p19 = re.compile(r'^\s*bootflash: +(?P<bootflash>[a-zA-Z0-9\s]+)$')
             m = p19.match(line)
             if m:
 
@@ -311,7 +338,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p20 = re.compile(r'^\s*slot0: +(?P<slot0>[a-zA-Z0-9\s]+) +\(expansion flash\)$')
             m = p20.match(line)
             if m:
 
@@ -322,7 +348,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p21 = re.compile(r'^\s*Kernel +uptime +is +(?P<days>[0-9]+) +day\(s\), +(?P<hours>[0-9]+) +hour\(s\), +(?P<minutes>[0-9]+) +minute\(s\), +(?P<seconds>[0-9]+) +second\(s\)$')
             m = p21.match(line)
             if m:
 
@@ -348,7 +373,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p22 = re.compile(r'^\s*Reason: +(?P<reason>[a-zA-Z0-9\s]+)$')
             m = p22.match(line)
             if m:
 
@@ -359,7 +383,6 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p23 = re.compile(r'^\s*System version: +(?P<system_version>[0-9\(\)\.]+)?$')
             m = p23.match(line)
             if m:
 
@@ -581,19 +604,42 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
 
         redundancy_dict = {}
         sup_number = None
+
+        p2 = re.compile(r'^\s*administrative: +(?P<administrative>[a-zA-z\s]+)$')
+
+        p3 = re.compile(r'^\s*operational: +(?P<operational>[a-zA-z\s]+)$')
+
+        p4 = re.compile(r'^\s*(This|Other) +supervisor +\(sup-(?P<sup_num>\d+)\)$')
+
+        p6 = re.compile(r'^\s*Redundancy state: +(?P<redundancy_state>[a-zA-z\W\s]+)$')
+
+        p7 = re.compile(r'^\s*Supervisor state: +(?P<supervisor_state>[a-zA-z\s]+)$')
+
+        p8 = re.compile(r'^\s*Internal state: +(?P<internal_state>[a-zA-z\s]+)$')
+
+        p9 = re.compile(r'^\s*System start time: +(?P<system_start_time>[a-zA-z0-9\:\s]+)$')
+
+        p10 = re.compile(r'^\s*System uptime: +(?P<system_uptime>[a-zA-z0-9\:\,\s]+)$')
+
+        p11 = re.compile(r'^\s*Kernel uptime: +(?P<kernel_uptime>[a-zA-z0-9\:\,\s]+)$')
+
+        p12 = re.compile(r'^\s*Active supervisor uptime: +(?P<active_supervisor_time>[a-zA-z0-9\:\,\s]+)$')
+
+        p1 = re.compile(r'^\s*Redundancy mode$')
+
+        # Redundancy information not available for this platform
+        p1_1 = re.compile(r'^\s*Redundancy +information +not +available +for +this +platform$')
+
         for line in out.splitlines():
             line = line.rstrip()
             line = line.replace('\t', '  ')
-            p1 = re.compile(r'^\s*Redundancy mode$')
             m = p1.match(line)
             if m:
                 if 'redundancy_mode' not in redundancy_dict:
                     redundancy_dict['redundancy_mode'] = {}
                 continue
 
-            # Redundancy information not available for this platform
-            p1 = re.compile(r'^\s*Redundancy +information +not +available +for +this +platform$')
-            m = p1.match(line)
+            m = p1_1.match(line)
             if m:
                 if 'redundancy_mode' not in redundancy_dict:
                     redundancy_dict['redundancy_mode'] = {}
@@ -601,19 +647,16 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
                     redundancy_dict['redundancy_mode']['operational'] = 'none'
                 continue
 
-            p2 = re.compile(r'^\s*administrative: +(?P<administrative>[a-zA-z\s]+)$')
             m = p2.match(line)
             if m:
                 redundancy_dict['redundancy_mode']['administrative'] = m.groupdict()['administrative']
                 continue
 
-            p3 = re.compile(r'^\s*operational: +(?P<operational>[a-zA-z\s]+)$')
             m = p3.match(line)
             if m:
                 redundancy_dict['redundancy_mode']['operational'] = m.groupdict()['operational']
                 continue
 
-            p4 = re.compile(r'^\s*(This|Other) +supervisor +\(sup-(?P<sup_num>\d+)\)$')
             m = p4.match(line)
             if m:
                 sup_num = m.groupdict()['sup_num']
@@ -622,40 +665,33 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
                     redundancy_dict[key] = {}
                 continue
 
-            p6 = re.compile(r'^\s*Redundancy state: +(?P<redundancy_state>[a-zA-z\W\s]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict[key]['redundancy_state'] = m.groupdict()['redundancy_state']
 
-            p7 = re.compile(r'^\s*Supervisor state: +(?P<supervisor_state>[a-zA-z\s]+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict[key]['supervisor_state'] = m.groupdict()['supervisor_state']
 
-            p8 = re.compile(r'^\s*Internal state: +(?P<internal_state>[a-zA-z\s]+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict[key]['internal_state'] = m.groupdict()['internal_state']
 
-            p9 = re.compile(r'^\s*System start time: +(?P<system_start_time>[a-zA-z0-9\:\s]+)$')
             m = p9.match(line)
             if m:
                 redundancy_dict['system_start_time'] = m.groupdict()['system_start_time']
                 continue
 
-            p10 = re.compile(r'^\s*System uptime: +(?P<system_uptime>[a-zA-z0-9\:\,\s]+)$')
             m = p10.match(line)
             if m:
                 redundancy_dict['system_uptime'] = m.groupdict()['system_uptime']
                 continue
 
-            p11 = re.compile(r'^\s*Kernel uptime: +(?P<kernel_uptime>[a-zA-z0-9\:\,\s]+)$')
             m = p11.match(line)
             if m:
                 redundancy_dict['kernel_uptime'] = m.groupdict()['kernel_uptime']
                 continue
 
-            p12 = re.compile(r'^\s*Active supervisor uptime: +(?P<active_supervisor_time>[a-zA-z0-9\:\,\s]+)$')
             m = p12.match(line)
             if m:
                 redundancy_dict['active_supervisor_time'] = m.groupdict()['active_supervisor_time']
@@ -719,9 +755,26 @@ class ShowBoot(ShowBootSchema):
         boot_dict = {}
         boot_variable = None
         sup_number = None
+
+        p1 = re.compile(r'^\s*Current Boot Variables:$')
+
+        p2 = re.compile(r'^\s*Boot Variables on next reload:$')
+
+        p3 = re.compile(r'^\s*sup-1$')
+
+        p4 = re.compile(r'^\s*sup-2$')
+
+        p5 = re.compile(r'^\s*kickstart variable = +(?P<kickstart_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
+
+        p6 = re.compile(r'^\s*system variable = +(?P<system_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
+
+        # NXOS variable = bootflash:/ISSUCleanGolden.system.gbin
+        p5_1 = re.compile(r'^\s*NXOS +variable += +(?P<image>[a-zA-z0-9\:\-\.\/\s]+)$')
+
+        p7 = re.compile(r'^\s*Boot POAP +(?P<boot_poap>[a-zA-z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Current Boot Variables:$')
             m = p1.match(line)
             if m:
                 boot_variable = 'current'
@@ -729,7 +782,6 @@ class ShowBoot(ShowBootSchema):
                     boot_dict['current_boot_variable'] = {}
                 continue
 
-            p2 = re.compile(r'^\s*Boot Variables on next reload:$')
             m = p2.match(line)
             if m:
                 boot_variable = 'next'
@@ -737,7 +789,6 @@ class ShowBoot(ShowBootSchema):
                     boot_dict['next_reload_boot_variable'] = {}
                 continue
 
-            p3 = re.compile(r'^\s*sup-1$')
             m = p3.match(line)
             if m:
                 sup_number = 'sup-1'
@@ -753,7 +804,6 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['sup_number']['sup-1'] = {}
                 continue
 
-            p4 = re.compile(r'^\s*sup-2$')
             m = p4.match(line)
             if m:
                 sup_number = 'sup-2'
@@ -770,7 +820,6 @@ class ShowBoot(ShowBootSchema):
                 continue
 
 
-            p5 = re.compile(r'^\s*kickstart variable = +(?P<kickstart_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p5.match(line)
             if m:
                 if boot_variable == 'current':
@@ -791,7 +840,6 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['kickstart_variable'] = m.groupdict()['kickstart_variable']
                 continue
 
-            p6 = re.compile(r'^\s*system variable = +(?P<system_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p6.match(line)
             if m:
                 if boot_variable == 'current':
@@ -813,8 +861,6 @@ class ShowBoot(ShowBootSchema):
                 continue
 
 
-            # NXOS variable = bootflash:/ISSUCleanGolden.system.gbin
-            p5_1 = re.compile(r'^\s*NXOS +variable += +(?P<image>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p5_1.match(line)
             if m:
                 if boot_variable == 'current':
@@ -835,7 +881,6 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['system_variable'] = m.groupdict()['image']
                 continue
 
-            p7 = re.compile(r'^\s*Boot POAP +(?P<boot_poap>[a-zA-z]+)$')
             m = p7.match(line)
             if m:
                 if boot_variable == 'current':
@@ -924,9 +969,23 @@ class ShowModule(ShowModuleSchema):
         header_type = None
         rp_list = []
         map_dic = {}
+
+        p1 = re.compile(r'^\s*Mod.*$')
+
+        p2 = re.compile(r'^\s*Xbar.*$')
+
+        p3 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<ports>[0-9]+) +(?P<module_type>[a-zA-Z0-9\/\-\s\+\(\)]+) +(?P<model>\S+) +(?P<status>[a-zA-Z\-\s]+) *\*?$')
+
+        p3_1 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<ports>[0-9]+) +(?P<module_type>[a-zA-Z0-9\/\-\s\+]+) +(?P<status>[a-zA-Z\-\s]+) *\*?$')
+
+        p4 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<software>[A-Z0-9\(\)\.]+) +(?P<hardware>[0-9\.]+)( +)?(?P<world_wide_name>[\w\-]+)?$')
+
+        p5 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<mac_address>[a-zA-Z0-9\.\-\s]+) +(?P<serial_number>[A-Z0-9]+)$')
+
+        p6 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<online_diag_status>[a-zA-Z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Mod.*$')
             m = p1.match(line)
             if m:
                 table_header = 'slot'
@@ -934,7 +993,6 @@ class ShowModule(ShowModuleSchema):
                     module_dict['slot'] = {}
                 continue
 
-            p2 = re.compile(r'^\s*Xbar.*$')
             m = p2.match(line)
             if m:
                 table_header = 'xbar'
@@ -942,8 +1000,6 @@ class ShowModule(ShowModuleSchema):
                     module_dict['xbar'] = {}
                 continue
 
-            p3 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<ports>[0-9]+) +(?P<module_type>[a-zA-Z0-9\/\-\s\+\(\)]+) +(?P<model>\S+) +(?P<status>[a-zA-Z\-\s]+) *\*?$')
-            p3_1 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<ports>[0-9]+) +(?P<module_type>[a-zA-Z0-9\/\-\s\+]+) +(?P<status>[a-zA-Z\-\s]+) *\*?$')
             m = p3.match(line)
             m1 = p3_1.match(line)
             m = m if m else m1
@@ -992,7 +1048,6 @@ class ShowModule(ShowModuleSchema):
                     module_dict['xbar'][header_number]['status'] = m.groupdict()['status'].strip()
                 continue
 
-            p4 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<software>[A-Z0-9\(\)\.]+) +(?P<hardware>[0-9\.]+)( +)?(?P<world_wide_name>[\w\-]+)?$')
             m = p4.match(line)
             if m:
                 header_number = m.groupdict()['number']
@@ -1018,7 +1073,6 @@ class ShowModule(ShowModuleSchema):
                         module_dict['xbar'][header_number]['slot/world_wide_name'] = m.groupdict()['world_wide_name']
                 continue
 
-            p5 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<mac_address>[a-zA-Z0-9\.\-\s]+) +(?P<serial_number>[A-Z0-9]+)$')
             m = p5.match(line)
             if m:
                 header_number = m.groupdict()['number']
@@ -1036,7 +1090,6 @@ class ShowModule(ShowModuleSchema):
                     module_dict['xbar'][header_number]['serial_number'] = m.groupdict()['serial_number'].strip()
                 continue
 
-            p6 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<online_diag_status>[a-zA-Z]+)$')
             m = p6.match(line)
             if m:
                 header_number = m.groupdict()['number']
@@ -1103,9 +1156,15 @@ class Dir(DirSchema):
         file = None
         disk_type = None
         date = None
+
+        p1 = re.compile(r'^\s*(?P<size>[0-9]+) +(?P<month>[a-zA-Z]+) +(?P<day>[0-9]+) +(?P<time>[0-9\:]+) +(?P<year>[0-9]+) +(?P<file>[a-zA-Z0-9\.\/\_\-\+]+)$')
+
+        p2 = re.compile(r'^\s*(?P<disk_space>[0-9]+) bytes +(?P<type>[a-z]+)$')
+
+        p3 = re.compile(r'^\s*Usage +for +(?P<directory_name>[a-z\:]+).*$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<size>[0-9]+) +(?P<month>[a-zA-Z]+) +(?P<day>[0-9]+) +(?P<time>[0-9\:]+) +(?P<year>[0-9]+) +(?P<file>[a-zA-Z0-9\.\/\_\-\+]+)$')
             m = p1.match(line)
             if m:
                 file = m.groupdict()['file']
@@ -1118,7 +1177,6 @@ class Dir(DirSchema):
                 dir_dict['files'][file]['date'] = date
                 continue
 
-            p2 = re.compile(r'^\s*(?P<disk_space>[0-9]+) bytes +(?P<type>[a-z]+)$')
             m = p2.match(line)
             if m:
                 disk_type = m.groupdict()['type']
@@ -1130,7 +1188,6 @@ class Dir(DirSchema):
                     dir_dict['disk_total_space'] = m.groupdict()['disk_space']
                 continue
 
-            p3 = re.compile(r'^\s*Usage +for +(?P<directory_name>[a-z\:]+).*$')
             m = p3.match(line)
             if m:
                 dir_dict['dir'] = m.groupdict()['directory_name']
@@ -1179,14 +1236,47 @@ class ShowVdcDetail(ShowVdcDetailSchema):
             out = output
 
         vdc_dict = {}
+
+        p1 = re.compile(r'^\s*Switchwide +mode +is +.*$')
+
+        p3 = re.compile(r'^\s*vdc +state: +(?P<state>[a-z]+)$')
+
+        p4 = re.compile(r'^\s*vdc +mac +address: +(?P<mac>[a-z0-9\:]+)$')
+
+        p5 = re.compile(r'^\s*vdc +ha +policy: +(?P<policy>[A-Z]+)$')
+
+        p6 = re.compile(r'^\s*vdc +dual-sup +ha +policy: +(?P<dual_policy>[A-Z]+)$')
+
+        p7 = re.compile(r'^\s*vdc +boot +Order: +(?P<boot_order>[0-9]+)$')
+
+        p8 = re.compile(r'^\s*CPU +Share: +(?P<cpu_share>[0-9]+)$')
+
+        p9 = re.compile(r'^\s*CPU +Share +Percentage: +(?P<cpu_share_percentage>[0-9\%]+)$')
+
+        p10 = re.compile(r'^\s*vdc +create +time: +(?P<vdc_create_time>[a-zA-Z0-9\:\s]+)$')
+
+        p11 = re.compile(r'^\s*vdc +reload +count: +(?P<reload_count>[0-9]+)$')
+
+        p12 = re.compile(r'^\s*vdc +uptime: +(?P<uptime>[a-z0-9\(\)\s\,]+)$')
+
+        p13 = re.compile(r'^\s*vdc +restart +count: +(?P<count>[0-9]+)$')
+
+        p14 = re.compile(r'^\s*vdc +restart +time: +(?P<restart_time>[a-zA-Z0-9\:\s]+)$')
+
+        p15 = re.compile(r'^\s*vdc +type: +(?P<type>[a-zA-Z]+)$')
+
+        p16 = re.compile(r'^\s*vdc +supported +linecards: +(?P<linecards>[a-zA-Z0-9\s]+)$')
+
+        p2 = re.compile(r'^\s*vdc +id: +(?P<id>[0-9]+)$')
+
+        p2_1 = re.compile(r'^\s*vdc +name: +(?P<name>\S+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Switchwide +mode +is +.*$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vdc +id: +(?P<id>[0-9]+)$')
             m = p2.match(line)
             if m:
                 identity = m.groupdict()['id']
@@ -1196,85 +1286,71 @@ class ShowVdcDetail(ShowVdcDetailSchema):
                     vdc_dict['vdc'][identity] = {}
                 continue
 
-            p2 = re.compile(r'^\s*vdc +name: +(?P<name>\S+)$')
-            m = p2.match(line)
+            m = p2_1.match(line)
             if m:
                 vdc_dict['vdc'][identity]['name'] = m.groupdict()['name']
                 continue
 
-            p3 = re.compile(r'^\s*vdc +state: +(?P<state>[a-z]+)$')
             m = p3.match(line)
             if m:
                 vdc_dict['vdc'][identity]['state'] = m.groupdict()['state']
                 continue
 
-            p4 = re.compile(r'^\s*vdc +mac +address: +(?P<mac>[a-z0-9\:]+)$')
             m = p4.match(line)
             if m:
                 vdc_dict['vdc'][identity]['mac_address'] = m.groupdict()['mac']
                 continue
 
-            p5 = re.compile(r'^\s*vdc +ha +policy: +(?P<policy>[A-Z]+)$')
             m = p5.match(line)
             if m:
                 vdc_dict['vdc'][identity]['ha_policy'] = m.groupdict()['policy']
                 continue
 
-            p6 = re.compile(r'^\s*vdc +dual-sup +ha +policy: +(?P<dual_policy>[A-Z]+)$')
             m = p6.match(line)
             if m:
                 vdc_dict['vdc'][identity]['dual_sup_ha_policy'] = m.groupdict()['dual_policy']
                 continue
 
-            p7 = re.compile(r'^\s*vdc +boot +Order: +(?P<boot_order>[0-9]+)$')
             m = p7.match(line)
             if m:
                 vdc_dict['vdc'][identity]['boot_order'] = m.groupdict()['boot_order']
                 continue
 
-            p8 = re.compile(r'^\s*CPU +Share: +(?P<cpu_share>[0-9]+)$')
             m = p8.match(line)
             if m:
                 vdc_dict['vdc'][identity]['cpu_share'] = m.groupdict()['cpu_share']
                 continue
 
-            p9 = re.compile(r'^\s*CPU +Share +Percentage: +(?P<cpu_share_percentage>[0-9\%]+)$')
             m = p9.match(line)
             if m:
                 vdc_dict['vdc'][identity]['cpu_share_percentage'] = m.groupdict()['cpu_share_percentage']
                 continue
 
-            p10 = re.compile(r'^\s*vdc +create +time: +(?P<vdc_create_time>[a-zA-Z0-9\:\s]+)$')
             m = p10.match(line)
             if m:
                 vdc_dict['vdc'][identity]['create_time'] = m.groupdict()['vdc_create_time']
                 continue
 
-            p11 = re.compile(r'^\s*vdc +reload +count: +(?P<reload_count>[0-9]+)$')
             m = p11.match(line)
             if m:
                 vdc_dict['vdc'][identity]['reload_count'] = m.groupdict()['reload_count']
                 continue
 
-            p12 = re.compile(r'^\s*vdc +uptime: +(?P<uptime>[a-z0-9\(\)\s\,]+)$')
             m = p12.match(line)
             if m:
                 vdc_dict['vdc'][identity]['uptime'] = m.groupdict()['uptime']
                 continue
 
-            p13 = re.compile(r'^\s*vdc +restart +count: +(?P<count>[0-9]+)$')
             m = p13.match(line)
             if m:
                 vdc_dict['vdc'][identity]['restart_count'] = m.groupdict()['count']
                 continue
 
-            p14 = re.compile(r'^\s*vdc +restart +time: +(?P<restart_time>[a-zA-Z0-9\:\s]+)$')
             m = p14.match(line)
             if m:
                 vdc_dict['vdc'][identity]['restart_time'] = m.groupdict()['restart_time']
                 continue
 
-            p15 = re.compile(r'^\s*vdc +type: +(?P<type>[a-zA-Z]+)$')
             m = p15.match(line)
             if m:
                 if 'vdc' not in vdc_dict:
@@ -1282,7 +1358,6 @@ class ShowVdcDetail(ShowVdcDetailSchema):
                 vdc_dict['vdc'][identity]['type'] = m.groupdict()['type']
                 continue
 
-            p16 = re.compile(r'^\s*vdc +supported +linecards: +(?P<linecards>[a-zA-Z0-9\s]+)$')
             m = p16.match(line)
             if m:
                 if 'vdc' not in vdc_dict:
@@ -1372,14 +1447,21 @@ class ShowVdcMembershipStatus(ShowVdcMembershipStatusSchema):
         member_status_vdc_dict = {}
         port_type = None
         port_number = None
+
+        p1 = re.compile(r'^\s*Flags : b - breakout port$')
+
+        p2 = re.compile(r'^\s*vdc_id: +(?P<id>[0-9]+) +vdc_name: +(?P<name>\S+) +interfaces:$')
+
+        p3 = re.compile(r'^\s*Port +Status$')
+
+        p4 = re.compile(r'^\s*(?P<port_type>[a-zA-Z]+)(?P<port_number>[0-9a-z/\\(\)]+) +(?P<status>[A-Z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Flags : b - breakout port$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vdc_id: +(?P<id>[0-9]+) +vdc_name: +(?P<name>\S+) +interfaces:$')
             m = p2.match(line)
             if m:
                 identity = m.groupdict()['id']
@@ -1394,12 +1476,10 @@ class ShowVdcMembershipStatus(ShowVdcMembershipStatusSchema):
                     member_status_vdc_dict['virtual_device'][identity]['membership'][vdc_name] = {}
                 continue
 
-            p3 = re.compile(r'^\s*Port +Status$')
             m = p3.match(line)
             if m:
                 continue
 
-            p4 = re.compile(r'^\s*(?P<port_type>[a-zA-Z]+)(?P<port_number>[0-9a-z/\\(\)]+) +(?P<status>[A-Z]+)$')
             m = p4.match(line)
             if m:
                 port_type = m.groupdict()['port_type']
@@ -62,13 +62,23 @@ class ShowIpPrefixList(ShowIpPrefixListSchema):
         # initial variables
         ret_dict = {}
 
+        # ip prefix-list test: 5 entries
+        # ipv6 prefix-list test6: 4 entries
+        p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\: +'
+                         '(?P<entries>\d+) +entries$')
+
+        # seq 5 permit 10.205.0.0/8
+        # seq 5 permit 2001:DB8:1::/64
+        # seq 20 permit 10.94.0.0/8 ge 24
+        # seq 25 permit 10.169.0.0/8 ge 16 le 24
+        # seq 10 permit 192.0.2.0/24 eq 25
+        p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
+                         '(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
+                         '( *(?P<range>[lgeq\d\s]+))?$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # ip prefix-list test: 5 entries
-            # ipv6 prefix-list test6: 4 entries
-            p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\: +'
-                             '(?P<entries>\d+) +entries$')
             m = p1.match(line)
             if m:
                 name = m.groupdict()['name']
@@ -83,14 +93,6 @@ class ShowIpPrefixList(ShowIpPrefixListSchema):
                 ret_dict['prefix_set_name'][name]['entries'] = int(m.groupdict()['entries'])
                 continue
 
-            # seq 5 permit 10.205.0.0/8
-            # seq 5 permit 2001:DB8:1::/64
-            # seq 20 permit 10.94.0.0/8 ge 24
-            # seq 25 permit 10.169.0.0/8 ge 16 le 24
-            # seq 10 permit 192.0.2.0/24 eq 25
-            p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
-                             '(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
-                             '( *(?P<range>[lgeq\d\s]+))?$')
             m = p3.match(line)
             if m:
                 prefixes = m.groupdict()['prefixes']
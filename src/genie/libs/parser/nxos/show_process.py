@@ -64,19 +64,20 @@ class ShowProcesses(ShowProcessesSchema):
         ret_dict = {}
         sub_dict = {}
 
+        # 1      S  b8dffed3            1     -     O  init
+        # 10      S         0            1     -     O  ksoftirqd/1
+        # -     NR         -            0     -     X  wwn
+        p1 = re.compile(r'^((?P<pid>\d+)|\-)'
+                         ' +(?P<state>\w+)'
+                         ' +((?P<pc>\w+)|\-)'
+                         ' +(?P<start_cnt>\d+)'
+                         ' +((?P<tty>\d+)|\-)'
+                         ' +(?P<type>\w+)'
+                         ' +(?P<process>[\w\/\:\-\.]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # 1      S  b8dffed3            1     -     O  init
-            # 10      S         0            1     -     O  ksoftirqd/1
-            # -     NR         -            0     -     X  wwn
-            p1 = re.compile(r'^((?P<pid>\d+)|\-)'
-                             ' +(?P<state>\w+)'
-                             ' +((?P<pc>\w+)|\-)'
-                             ' +(?P<start_cnt>\d+)'
-                             ' +((?P<tty>\d+)|\-)'
-                             ' +(?P<type>\w+)'
-                             ' +(?P<process>[\w\/\:\-\.]+)$')
             m = p1.match(line)
             if m:
                 process = m.groupdict()['process']
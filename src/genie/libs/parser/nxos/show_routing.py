@@ -51,6 +51,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, \
+                                                    Key, Index, integer, \
+                                                    boolean, interface_name
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -163,13 +166,40 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
         if ip and (':' in ip or ip == 'ipv6'):
             is_ipv6 = True
 
+        # IP Route Table for VRF "default"
+        # IPv6 Routing Table for VRF "default"
+        # IPv6 Routing Table for VRF "otv-vrf139"
+        p1 = re.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +"(?P<vrf>\S+)"$')
+
+        # 10.144.0.1/32, ubest/mbest: 1/0 time, attached
+        # 10.220.9.0/24, ubest/mbest: 1/0 time
+        p2 = re.compile(r'(?P<ip_mask>[\w\:\.\/]+), +ubest/mbest: +'
+                        r'(?P<ubest>\d+)/(?P<mbest>\d+)( +time)?'
+                        r'(, +(?P<attach>\w+))?$')
+
+        # *via 2001:db8:8b05::1002%default, Eth1/1, [200/4444], 15:57:39, bgp-333, internal, tag 333
+        # *via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
+        # *via 2001:db8::5054:ff:fed5:63f9, Eth1/1, [0/0], 00:15:46, direct,
+        # *via 2001:db8:2:2::2, Eth1/1, [0/0], 00:15:46, direct, , tag 222
+        # *via 10.55.130.2%default, [200/0], 3d07h, bgp-1, internal, tag 1 (evpn), segid: 50009 tunnelid: 0x64008202 encap: VXLAN
+        # via 10.13.110.1, Eth1/2.110, [110/41], 5d03h, ospf-1, intra
+        # via 10.4.1.1, [200/0], 5d03h, bgp-65000, internal, tag 65000 (hidden)
+        # *via 10.13.90.1, Eth1/2.90, [90/3072], 1w5d, eigrp-test, internal
+        p3 = re.compile(r'^(?P<cast>.*)via +(?P<nexthop>[\w\.\:\s]+)'
+                        r'(%(?P<table>[\w\:]+))?, *'
+                        r'((?P<int>[a-zA-Z0-9\./_]+),)? *'
+                        r'\[(?P<preference>\d+)/(?P<metric>\d+)\], *'
+                        r'(?P<up_time>[\w\:\.]+), *'
+                        r'(?P<protocol>\w+)(\-(?P<process>\w+))?,? *'
+                        r'(?P<attribute>\w+)?,? *'
+                        r'(tag *(?P<tag>\w+))?,? *(?P<vpn>[a-zA-Z\(\)\-]+)?'
+                        r',?( +segid: +(?P<segid>\d+))?,?( +tunnelid: +'
+                        r'(?P<tunnelid>[0-9x]+))?,?( +encap: +'
+                        r'(?P<encap>[a-zA-Z0-9]+))?$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # IP Route Table for VRF "default"
-            # IPv6 Routing Table for VRF "default"
-            # IPv6 Routing Table for VRF "otv-vrf139"
-            p1 = re.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +"(?P<vrf>\S+)"$')
             m = p1.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
@@ -183,11 +213,6 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
                     address_family = 'vpnv6 unicast'
                 continue
 
-            # 10.144.0.1/32, ubest/mbest: 1/0 time, attached
-            # 10.220.9.0/24, ubest/mbest: 1/0 time
-            p2 = re.compile(r'(?P<ip_mask>[\w\:\.\/]+), +ubest/mbest: +'
-                            r'(?P<ubest>\d+)/(?P<mbest>\d+)( +time)?'
-                            r'(, +(?P<attach>\w+))?$')
             m = p2.match(line)
             if m:
                 # Init af dict
@@ -205,25 +230,6 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
                     ip_dict['attach'] = m.groupdict()['attach']
                 continue
 
-            # *via 2001:db8:8b05::1002%default, Eth1/1, [200/4444], 15:57:39, bgp-333, internal, tag 333
-            # *via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
-            # *via 2001:db8::5054:ff:fed5:63f9, Eth1/1, [0/0], 00:15:46, direct,
-            # *via 2001:db8:2:2::2, Eth1/1, [0/0], 00:15:46, direct, , tag 222
-            # *via 10.55.130.2%default, [200/0], 3d07h, bgp-1, internal, tag 1 (evpn), segid: 50009 tunnelid: 0x64008202 encap: VXLAN
-            # via 10.13.110.1, Eth1/2.110, [110/41], 5d03h, ospf-1, intra
-            # via 10.4.1.1, [200/0], 5d03h, bgp-65000, internal, tag 65000 (hidden)
-            # *via 10.13.90.1, Eth1/2.90, [90/3072], 1w5d, eigrp-test, internal
-            p3 = re.compile(r'^(?P<cast>.*)via +(?P<nexthop>[\w\.\:\s]+)'
-                            r'(%(?P<table>[\w\:]+))?, *'
-                            r'((?P<int>[a-zA-Z0-9\./_]+),)? *'
-                            r'\[(?P<preference>\d+)/(?P<metric>\d+)\], *'
-                            r'(?P<up_time>[\w\:\.]+), *'
-                            r'(?P<protocol>\w+)(\-(?P<process>\w+))?,? *'
-                            r'(?P<attribute>\w+)?,? *'
-                            r'(tag *(?P<tag>\w+))?,? *(?P<vpn>[a-zA-Z\(\)\-]+)?'
-                            r',?( +segid: +(?P<segid>\d+))?,?( +tunnelid: +'
-                            r'(?P<tunnelid>[0-9x]+))?,?( +encap: +'
-                            r'(?P<encap>[a-zA-Z0-9]+))?$')
             m = p3.match(line)
             if m:
                 cast = m.groupdict()['cast']
@@ -547,7 +553,79 @@ class ShowIpRouteSchema(MetaParser):
 # show ip route vrf all
 # show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+def _route_prefix(row):
+    return row.get('ipprefix', row.get('ipv6prefix'))
+
+
+def _route_next_hop(row):
+    return row.get('ipnexthop', row.get('ipv6nexthop'))
+
+
+def _route_protocol(index):
+    """Source protocol (0) or process id (1) of the clientname, ex: ospf-1"""
+    def get(row):
+        client = row.get('clientname')
+        if client is None:
+            return None
+        client = client.split('-', 1)
+        return client[index] if index < len(client) else None
+    return get
+
+
+# Routes of 'show ip route | json' and 'show ipv6 route | json'
+_route_paths = [
+    # Best paths
+    Table('path', fields={
+        'metric': ('metric', integer),
+        'route_preference': ('pref', integer),
+    }, when=lambda row: boolean(row.get('ubest', False))),
+    Table('path', fields={
+        'source_protocol': _route_protocol(0),
+        'process_id': _route_protocol(1),
+        'source_protocol_status': 'type',
+        'tag': ('tag', integer),
+    }),
+    # Paths to a next hop
+    Table('path', path=['next_hop', 'next_hop_list', Index('index')], fields={
+        'next_hop': _route_next_hop,
+        'outgoing_interface': ('ifname', interface_name),
+        'updated': 'uptime',
+        'route_preference': ('pref', integer),
+        'metric': ('metric', integer),
+        'source_protocol': _route_protocol(0),
+        'source_protocol_status': 'type',
+        'best_ucast_nexthop': lambda row: True if boolean(
+            row.get('ubest', False)) else None,
+        'best_mcast_nexthop': lambda row: True if boolean(
+            row.get('mbest', False)) else None,
+        'segid': ('segid', integer),
+        'tunnelid': 'tunnelid',
+        'encap': ('encap', str.lower),
+    }, when=_route_next_hop),
+    # Paths to an interface only
+    Table('path', path=['next_hop', 'outgoing_interface',
+                        Key('ifname', interface_name,
+                            name='outgoing_interface')],
+          fields={'updated': 'uptime'},
+          when=lambda row: not _route_next_hop(row)),
+]
+
+_route_json_mapping = [
+    Table('vrf', path=['vrf', Key('vrf-name-out'), 'address_family'], tables=[
+        Table('addrf', path=[Key('addrf'), 'routes'], tables=[
+            Table('prefix', path=[Key(_route_prefix, name='route')], fields={
+                'active': lambda row: True,
+                'ubest': ('ucast-nhops', integer),
+                'mbest': ('mcast-nhops', integer),
+                'attached': lambda row: True if boolean(
+                    row.get('attached', False)) else None,
+            }, tables=_route_paths),
+        ]),
+    ]),
+]
+
+
+class ShowIpRoute(ShowIpRouteSchema, NxosStructured):
     """Parser for :
         'show ip route {route} {protocol} interface {interface} vrf {vrf}',
         'show ip route {route} {protocol} interface {interface}',
@@ -588,6 +666,8 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
+    json_mapping = _route_json_mapping
+
     def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
 
         # execute command to get output
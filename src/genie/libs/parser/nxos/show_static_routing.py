@@ -74,14 +74,31 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
         vrf = route = next_hop = ""
 
         result_dict = {}
+
+        # Static-route for VRF "default"(1)
+        p1 = re.compile(r'^\s*Static-route +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<number>[\d])\)$')
+
+        #  10.16.2.2/32, configured nh: 10.2.3.2/32 Ethernet1/4
+        #  10.16.2.2/32, configured nh: 10.229.3.2/32
+        # 192.168.205.1/32, configured nh: 0.0.0.0/32 tunnel-te12
+        p2 = re.compile(r'^\s*(?P<route>[\d\/\.]+),'
+                         ' +configured +nh: +(?P<nexthop>[\d\/\.]+)?( +(?P<interface>[a-zA-Z][\w\-\/\.]+))?$')
+
+        # (not installed in urib)
+        p3 = re.compile(r'^\s*\(not +installed +in +(?P<urib>[\w]+)\)$')
+
+        # (installed in urib)
+        p4 = re.compile(r'^\s*\(installed +in +(?P<urib>[\w]+)\)$')
+
+        #rnh(installed in urib)
+        p5 = re.compile(r'^\s*rnh\(installed +in +(?P<urib>[\w]+)\)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # Static-route for VRF "default"(1)
-            p1 = re.compile(r'^\s*Static-route +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<number>[\d])\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -98,11 +115,6 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                     result_dict['vrf'][vrf]['address_family'][af] = {}
                 continue
 
-            #  10.16.2.2/32, configured nh: 10.2.3.2/32 Ethernet1/4
-            #  10.16.2.2/32, configured nh: 10.229.3.2/32
-            # 192.168.205.1/32, configured nh: 0.0.0.0/32 tunnel-te12
-            p2 = re.compile(r'^\s*(?P<route>[\d\/\.]+),'
-                             ' +configured +nh: +(?P<nexthop>[\d\/\.]+)?( +(?P<interface>[a-zA-Z][\w\-\/\.]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -167,8 +179,6 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
 
                 continue
 
-            # (not installed in urib)
-            p3 = re.compile(r'^\s*\(not +installed +in +(?P<urib>[\w]+)\)$')
             m = p3.match(line)
             if m:
                 active = False
@@ -180,8 +190,6 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                         ['next_hop']['next_hop_list'][index]['active'] = active
                 continue
 
-            # (installed in urib)
-            p4 = re.compile(r'^\s*\(installed +in +(?P<urib>[\w]+)\)$')
             m = p4.match(line)
             if m:
                 active = True
@@ -193,8 +201,6 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                         ['next_hop']['next_hop_list'][index]['active'] = active
                 continue
 
-            #rnh(installed in urib)
-            p5 = re.compile(r'^\s*rnh\(installed +in +(?P<urib>[\w]+)\)$')
             m = p5.match(line)
             if m:
                 active = True
@@ -281,14 +287,36 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
         vrf = route = interface = next_hop = ""
 
         result_dict = {}
+
+        # IPv6 Configured Static Routes for VRF "default"(1)
+        p1 = re.compile(r'^\s*IPv6 +Configured +Static +Routes +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<index>\d)\)$')
+
+        # 2001:1:1:1::1/128 -> 2001:10:1:3::1/128, preference: 1
+        # 2001:1:1:1::1/128 -> Null0, preference: 1
+        p2 = re.compile(r'^\s*(?P<route>[\d\/\:]+)( +\-\> +(?P<nexthop>[\d\:\/]+), )?'
+                        '( \-\> +(?P<interface>[\w\.\/]+), )?'
+                        '(preference: +(?P<preference>[\d]+))?$')
+
+        #  nh_vrf(default) reslv_tid 0
+        p3 = re.compile(r'^\s*nh_vrf\((?P<next_vrf>[\w]+)\) +reslv_tid +(?P<resolved_tid>[\d]+)$')
+
+        # real-next-hop: 2001:10:2:3::2, interface: Ethernet1/4
+        p4 = re.compile(r'^\s*real-next-hop: +(?P<real_next_hop>[\d\:]+)'
+                        '(, +interface: +(?P<interface2>[\w\/\.]+))?$')
+
+        # rnh(installed in u6rib)
+        # rnh(not installed in u6rib)
+        p5 = re.compile(r'^\s*rnh\((?P<not>[not]+)? ?installed +in +(?P<urib>[\w]+)\)$')
+
+        #  bfd_enabled no
+        p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd>[\w]+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.strip()
             else:
                 continue
 
-            # IPv6 Configured Static Routes for VRF "default"(1)
-            p1 = re.compile(r'^\s*IPv6 +Configured +Static +Routes +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<index>\d)\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -306,11 +334,6 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                         result_dict['vrf'][vrf]['address_family'][af] = {}
                 continue
 
-            # 2001:1:1:1::1/128 -> 2001:10:1:3::1/128, preference: 1
-            # 2001:1:1:1::1/128 -> Null0, preference: 1
-            p2 = re.compile(r'^\s*(?P<route>[\d\/\:]+)( +\-\> +(?P<nexthop>[\d\:\/]+), )?'
-                            '( \-\> +(?P<interface>[\w\.\/]+), )?'
-                            '(preference: +(?P<preference>[\d]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -390,8 +413,6 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
 
                 continue
 
-            #  nh_vrf(default) reslv_tid 0
-            p3 = re.compile(r'^\s*nh_vrf\((?P<next_vrf>[\w]+)\) +reslv_tid +(?P<resolved_tid>[\d]+)$')
             m = p3.match(line)
             if m:
                 next_vrf = m.groupdict()['next_vrf']
@@ -410,9 +431,6 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
 
                 continue
 
-            # real-next-hop: 2001:10:2:3::2, interface: Ethernet1/4
-            p4 = re.compile(r'^\s*real-next-hop: +(?P<real_next_hop>[\d\:]+)'
-                            '(, +interface: +(?P<interface2>[\w\/\.]+))?$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['interface2']:
@@ -429,9 +447,6 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                             ['next_hop_list'][index]['outgoing_interface'] = interface2
                 continue
 
-            # rnh(installed in u6rib)
-            # rnh(not installed in u6rib)
-            p5 = re.compile(r'^\s*rnh\((?P<not>[not]+)? ?installed +in +(?P<urib>[\w]+)\)$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['not']:
@@ -446,8 +461,6 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                         ['next_hop']['next_hop_list'][index]['rnh_active'] = rnh_active
                 continue
 
-            #  bfd_enabled no
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd>[\w]+)$')
             m = p6.match(line)
             if m:
                 bfd_enabled = False if m.groupdict()['bfd'].lower() == 'no' else True
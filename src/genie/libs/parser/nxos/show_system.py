@@ -59,15 +59,57 @@ class ShowSystemInternalSysmgrServiceName(
 
         ret_dict = {}
 
+        # Service "bfdc" ("bfdc", 3):
+        # Service "__inst_012__isis" ("isis", 61):
+        # Service "feature-mgr" ("feature-mgr", 135):
+        p1 = re.compile(r'^Service +\"(?P<inst>[\w\-]+)\" *'
+                         '\(\"(?P<process_name>[\w\-]+)\", *'
+                         '(?P<internal_id>\d+)\):$')
+
+        # UUID = 0x2C7, PID = 6547, SAP = 1008
+        # UUID = 0x42000118, -- Currently not running --
+        p2 = re.compile(r'^UUID *= *(?P<uuid>\w+), *'
+                         '((PID *= *(?P<pid>\d+), *'
+                         'SAP *= *(?P<sap>\d+))'
+                         '|(-- Currently not running --))$')
+
+        # State: SRV_STATE_WAIT_SPAWN_CONDITION (entered at time Tue Mar 26 17:31:06 2013).
+        # State: SRV_STATE_HAP_FAILED [unstable] (entered at time Thu Oct 26 13:46:32 2017).
+        p3 = re.compile(r'^State: *(?P<state>[\w\s\[\]]+) *'
+                         '\(entered +at +time +'
+                         '(?P<state_start_date>[\w\s\:]+)\).$')
+
+        # Restart count: 1
+        p4 = re.compile(r'^Restart +count: +(?P<restart_count>\d+)$')
+
+        # Time of last restart: Sat Jul  1 14:49:10 2017.
+        p5 = re.compile(r'^Time +of +last +restart: +'
+                         '(?P<last_restart_date>[\w\s\:]+).$')
+
+        # The service never crashed since the last reboot.
+        # The service has never been started since the last reboot.
+        p6 = re.compile(r'The service never crashed since the last reboot.')
+
+        p6_1 = re.compile(r'The service has never been started since the last reboot.')
+
+        # Previous PID: 2176
+        p7 = re.compile(r'^Previous +PID: +(?P<previous_pid>\d+)$')
+
+        # Reason of last termination: SYSMGR_DEATH_REASON_FAILURE_SIGNAL
+        p8 = re.compile(r'^Reason +of +last +termination: +'
+                         '(?P<last_terminate_reason>\w+)$')
+
+        # Plugin ID: 0
+        p9 = re.compile(r'^Plugin +ID: +(?P<plugin_id>\d+)$')
+
+        # Tag = N/A
+        # Tag = 100
+        # Tag = l3vpn
+        p10 = re.compile(r'^Tag *= *(?P<tag>(N\/A)|(\S+))$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Service "bfdc" ("bfdc", 3):
-            # Service "__inst_012__isis" ("isis", 61):
-            # Service "feature-mgr" ("feature-mgr", 135):
-            p1 = re.compile(r'^Service +\"(?P<inst>[\w\-]+)\" *'
-                             '\(\"(?P<process_name>[\w\-]+)\", *'
-                             '(?P<internal_id>\d+)\):$')
             m = p1.match(line)
             if m:
                 if 'instance' not in ret_dict:
@@ -84,12 +126,6 @@ class ShowSystemInternalSysmgrServiceName(
                 last_restart_date = reboot_state = last_terminate_reason = None
                 continue
 
-            # UUID = 0x2C7, PID = 6547, SAP = 1008
-            # UUID = 0x42000118, -- Currently not running --
-            p2 = re.compile(r'^UUID *= *(?P<uuid>\w+), *'
-                             '((PID *= *(?P<pid>\d+), *'
-                             'SAP *= *(?P<sap>\d+))'
-                             '|(-- Currently not running --))$')
             m = p2.match(line)
             if m:
                 uuid = m.groupdict()['uuid']
@@ -103,19 +139,12 @@ class ShowSystemInternalSysmgrServiceName(
                     sap = None
                 continue
 
-            # State: SRV_STATE_WAIT_SPAWN_CONDITION (entered at time Tue Mar 26 17:31:06 2013).
-            # State: SRV_STATE_HAP_FAILED [unstable] (entered at time Thu Oct 26 13:46:32 2017).
-            p3 = re.compile(r'^State: *(?P<state>[\w\s\[\]]+) *'
-                             '\(entered +at +time +'
-                             '(?P<state_start_date>[\w\s\:]+)\).$')
             m = p3.match(line)
             if m:
                 state = m.groupdict()['state'].strip()
                 state_start_date = m.groupdict()['state_start_date']
                 continue
 
-            # Restart count: 1
-            p4 = re.compile(r'^Restart +count: +(?P<restart_count>\d+)$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['restart_count']:
@@ -124,55 +153,37 @@ class ShowSystemInternalSysmgrServiceName(
                     restart_count = None
                 continue
 
-            # Time of last restart: Sat Jul  1 14:49:10 2017.
-            p5 = re.compile(r'^Time +of +last +restart: +'
-                             '(?P<last_restart_date>[\w\s\:]+).$')
             m = p5.match(line)
             if m:
                 last_restart_date = m.groupdict()['last_restart_date']
                 continue
 
-            # The service never crashed since the last reboot.
-            # The service has never been started since the last reboot.
-            p6 = re.compile(r'The service never crashed since the last reboot.')
             m = p6.match(line)
             if m:
                 reboot_state = 'never_crashed'
                 continue
 
-            p6_1 = re.compile(r'The service has never been started since the last reboot.')
             m = p6_1.match(line)
             if m:
                 reboot_state = 'never_started'
                 continue
 
-            # Previous PID: 2176
-            p7 = re.compile(r'^Previous +PID: +(?P<previous_pid>\d+)$')
             m = p7.match(line)
             if m:
                 previous_pid = int(m.groupdict()['previous_pid'])
                 continue
 
-            # Reason of last termination: SYSMGR_DEATH_REASON_FAILURE_SIGNAL
-            p8 = re.compile(r'^Reason +of +last +termination: +'
-                             '(?P<last_terminate_reason>\w+)$')
             m = p8.match(line)
             if m:
                 last_terminate_reason = m.groupdict()['last_terminate_reason']
                 continue
 
-            # Plugin ID: 0
-            p9 = re.compile(r'^Plugin +ID: +(?P<plugin_id>\d+)$')
             m = p9.match(line)
             if m:
                 plugin_id = m.groupdict()['plugin_id']
                 ret_dict['instance'][inst]['tag'][tag]['plugin_id'] = plugin_id
                 continue
 
-            # Tag = N/A
-            # Tag = 100
-            # Tag = l3vpn
-            p10 = re.compile(r'^Tag *= *(?P<tag>(N\/A)|(\S+))$')
             m = p10.match(line)
             if m:
                 tag = m.groupdict()['tag']
@@ -259,14 +270,15 @@ class ShowSystemInternalL2fwderMac(ShowSystemInternalL2fwderMacSchema):
 
         ret_dict = {}
 
+        # G  1008    5e01.80ff.0007    static   -          F     F   sup-eth1(R)
+        p1 = re.compile(r'^\s*(?P<entry>[A-Z\*\(\+\)]+) +(?P<vlan>[0-9]+) '
+            '+(?P<mac_address>[0-9a-z\.]+) +(?P<mac_type>[a-z]+) '
+            '+(?P<age>[0-9\-\:]+) +(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
+            '+(?P<ports>[a-zA-Z0-9\-\(\)\s\.\/]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # G  1008    5e01.80ff.0007    static   -          F     F   sup-eth1(R)
-            p1 = re.compile(r'^\s*(?P<entry>[A-Z\*\(\+\)]+) +(?P<vlan>[0-9]+) '
-                '+(?P<mac_address>[0-9a-z\.]+) +(?P<mac_type>[a-z]+) '
-                '+(?P<age>[0-9\-\:]+) +(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
-                '+(?P<ports>[a-zA-Z0-9\-\(\)\s\.\/]+)$')
             m = p1.match(line)
             if m:
 
@@ -64,19 +64,39 @@ class ShowVlan(ShowVlanSchema):
             out = output
 
         vlan_dict = {}
+
+        # VLAN Name                             Status    Ports
+        # 1    default                          active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
+        # 105  VLAN0105                         act/lshut Po333
+        # 1    default                          active
+        # 1   1_192.168.0.0/1                   active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
+        p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<name>\S+)'
+                        ' +(?P<status>[active|suspended|act/unsup|sus|(.*)/lshut]+)( *(?P<interfaces>[\w\s\/\,]+))?$')
+
+        #                                                Gi1/0/19, Gi1/0/20, Gi1/0/21, Gi1/0/22
+        p2 = re.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)$')
+
+        # VLAN Type         Vlan-mode
+        # 1    enet         CE
+        p3 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_type>[\w]+)'
+                        ' +(?P<vlan_mode>[\w]+)?$')
+
+        # Remote SPAN VLANs
+        # -------------------------------------
+        # 201-202
+        # 201,202
+        # 201,204,201-220
+        p4 = re.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
+
+        p5 = re.compile(r'^\s*(?P<primary>\d+)? +(?P<secondary>\d+)'
+                        ' +(?P<type>[\w\-]+)( +(?P<interfaces>[\w\s\,\/]+))?$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # VLAN Name                             Status    Ports
-            # 1    default                          active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
-            # 105  VLAN0105                         act/lshut Po333
-            # 1    default                          active
-            # 1   1_192.168.0.0/1                   active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
-            p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<name>\S+)'
-                            ' +(?P<status>[active|suspended|act/unsup|sus|(.*)/lshut]+)( *(?P<interfaces>[\w\s\/\,]+))?$')
             m = p1.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -104,18 +124,12 @@ class ShowVlan(ShowVlanSchema):
                         [Common.convert_intf_name(i) for i in m.groupdict()['interfaces'].split(',')]
                 continue
 
-            #                                                Gi1/0/19, Gi1/0/20, Gi1/0/21, Gi1/0/22
-            p2 = re.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)$')
             m = p2.match(line)
             if m:
                 vlan_dict['vlans'][vlan_id]['interfaces'] = vlan_dict['vlans'][vlan_id]['interfaces']+\
                 [Common.convert_intf_name(i) for i in m.groupdict()['interfaces'].split(',')]
                 continue
 
-            # VLAN Type         Vlan-mode
-            # 1    enet         CE
-            p3 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_type>[\w]+)'
-                            ' +(?P<vlan_mode>[\w]+)?$')
             m = p3.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -125,12 +139,6 @@ class ShowVlan(ShowVlanSchema):
                 continue
 
 
-            # Remote SPAN VLANs
-            # -------------------------------------
-            # 201-202
-            # 201,202
-            # 201,204,201-220
-            p4 = re.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
             m = p4.match(line)
             if m:
                 remote_span_vlans = ""
@@ -165,8 +173,6 @@ class ShowVlan(ShowVlanSchema):
             #  2       302       community
             #          10        community
 
-            p5 = re.compile(r'^\s*(?P<primary>\d+)? +(?P<secondary>\d+)'
-                            ' +(?P<type>[\w\-]+)( +(?P<interfaces>[\w\s\,\/]+))?$')
             m = p5.match(line)
 
             if m:
@@ -240,16 +246,18 @@ class ShowVlanIdVnSegment(ShowVlanIdVnSegmentSchema):
             out = output
 
         vlan_dict = {}
+
+        # VLAN Segment-id
+        # ---- -----------
+        # 10   5010
+        p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<segment_id>[0-9]+)$')
+
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
             else:
                 continue
 
-            # VLAN Segment-id
-            # ---- -----------
-            # 10   5010
-            p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<segment_id>[0-9]+)$')
             m = p1.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -301,14 +309,17 @@ class ShowVlanInternalInfo(ShowVlanInternalInfoSchema):
 
         vlan_list = []
         vlan_configuration_dict = {}
+
+        p1 = re.compile(r'^\s*VLAN_INFO_GLOBAL$')
+
+        p2 = re.compile(r'^\s*vlan +configuration +(?P<vlan_ids>[0-9\-\,]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN_INFO_GLOBAL$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vlan +configuration +(?P<vlan_ids>[0-9\-\,]+)$')
             m = p2.match(line)
             if m:
                 vlan_ids = m.groupdict()['vlan_ids']
@@ -359,9 +370,13 @@ class ShowVlanFilter(ShowVlanFilterSchema):
             out = output
 
         vlan_dict = {}
+
+        p1 = re.compile(r'^\s*vlan +map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+):$')
+
+        p2 = re.compile(r'^\s*Configured +on +VLANs: +(?P<access_map_vlan_ids>[0-9\,\-]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*vlan +map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+):$')
             m = p1.match(line)
             if m:
                 if 'vlan_id' not in vlan_dict:
@@ -369,7 +384,6 @@ class ShowVlanFilter(ShowVlanFilterSchema):
                 tag = m.groupdict()['vlan_access_map_tag']
                 continue
 
-            p2 = re.compile(r'^\s*Configured +on +VLANs: +(?P<access_map_vlan_ids>[0-9\,\-]+)$')
             m = p2.match(line)
             if m:
                 access_map_vlan_ids = m.groupdict()['access_map_vlan_ids']
@@ -423,9 +437,15 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
             out = output
 
         access_map_dict = {}
+
+        p1 = re.compile(r'^\s*Vlan +access-map +(?P<access_map_id>[a-zA-Z0-9\"]+) +(?P<access_map_sequence>[0-9]+)$')
+
+        p2 = re.compile(r'^\s*match +(?P<access_map_match_protocol>[a-zA-Z0-9]+): +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
+
+        p3 = re.compile(r'^\s*action: +(?P<access_map_action_value>[a-zA-Z]+)$')
+
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Vlan +access-map +(?P<access_map_id>[a-zA-Z0-9\"]+) +(?P<access_map_sequence>[0-9]+)$')
             m = p1.match(line)
             if m:
                 access_map_id = m.groupdict()['access_map_id']
@@ -441,7 +461,6 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     access_map_dict['access_map_id'][map_id]['access_map_sequence'][access_map_sequence] = {}
                 continue
 
-            p2 = re.compile(r'^\s*match +(?P<access_map_match_protocol>[a-zA-Z0-9]+): +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
             m = p2.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]['access_map_sequence']\
@@ -450,7 +469,6 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     [access_map_sequence]['access_map_match_protocol_value'] = m.groupdict()['access_map_match_protocol_value']
                 continue
 
-            p3 = re.compile(r'^\s*action: +(?P<access_map_action_value>[a-zA-Z]+)$')
             m = p3.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]['access_map_sequence']\
@@ -493,11 +511,12 @@ class ShowVxlan(ShowVxlanSchema):
 
         ret_dict = {}
 
+        # 100             8100
+        p1 = re.compile(r'^\s*(?P<vlan>[0-9]+) +(?P<vn_segment>[0-9]+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # 100             8100
-            p1 = re.compile(r'^\s*(?P<vlan>[0-9]+) +(?P<vn_segment>[0-9]+)$')
             m = p1.match(line)
             if m:
 
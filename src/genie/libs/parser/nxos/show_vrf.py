@@ -15,6 +15,10 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.subcommand import subcommand_cache, \
+                                               subcommand_parse
+from genie.libs.parser.utils.running_config import running_config, \
+                                                   RUNNING_CONFIG_COMMAND
 
 # =====================
 # Parser for 'show vrf'
@@ -49,13 +53,14 @@ class ShowVrf(ShowVrfSchema):
         # Init vars
         vrf_dict = {}
 
+        # VRF2                                    4 Up      --
+        # default                                 1 Up      --
+        p1 = re.compile(r'^\s*(?P<vrf_name>(\S+)) +(?P<vrf_id>[0-9]+)'
+                         ' +(?P<vrf_state>(Up|Down)) +(?P<reason>(\S+))$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # VRF2                                    4 Up      --
-            # default                                 1 Up      --
-            p1 = re.compile(r'^\s*(?P<vrf_name>(\S+)) +(?P<vrf_id>[0-9]+)'
-                             ' +(?P<vrf_state>(Up|Down)) +(?P<reason>(\S+))$')
             m = p1.match(line)
             if m:
                 if 'vrfs' not in vrf_dict:
@@ -102,17 +107,19 @@ class ShowVrfInterface(ShowVrfInterfaceSchema):
         # Init vars
         vrf_interface_dict = {}
 
+        p1 = re.compile(r'^\s*Interface +VRF-Name +VRF-ID +Site-of-Origin$')
+
+        p2 = re.compile(r'^\s*(?P<intf_name>[a-zA-Z0-9\/]+)'
+            ' +(?P<vrf_name>[a-zA-Z0-9\-]+) +(?P<vrf_id>[0-9]+)'
+            ' +(?P<site_of_origin>[a-zA-Z0-9\-]+)?$')
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'^\s*Interface +VRF-Name +VRF-ID +Site-of-Origin$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<intf_name>[a-zA-Z0-9\/]+)'
-                ' +(?P<vrf_name>[a-zA-Z0-9\-]+) +(?P<vrf_id>[0-9]+)'
-                ' +(?P<site_of_origin>[a-zA-Z0-9\-]+)?$')
             m = p2.match(line)
             if m:
                 interface = m.groupdict()['intf_name']
@@ -172,13 +179,30 @@ class ShowVrfDetail(ShowVrfDetailSchema):
         # Init vars
         vrf_dict = {}
 
+        # VRF-Name: VRF1, VRF-ID: 3, State: Up
+        p1 = re.compile(r'^VRF\-Name: +(?P<vrf>[\w\-]+), +'
+                         'VRF-ID: +(?P<vrf_id>\d+), +'
+                         'State: +(?P<state>\w+)$')
+
+        # VPNID: unknown
+        p2 = re.compile(r'^VPNID: +(?P<vpn_id>\w+)$')
+
+        # RD: 300:1
+        p3 = re.compile(r'^RD: +(?P<rd>[\w\:\.]+)$')
+
+        # Max Routes: 20000  Mid-Threshold: 17000
+        p4 = re.compile(r'^Max +Routes: +(?P<max_routes>\d+) +'
+                         'Mid\-Threshold: +(?P<mid_threshold>\d+)$')
+
+        # Table-ID: 0x80000003, AF: IPv6, Fwd-ID: 0x80000003, State: Up
+        p5 = re.compile(r'^Table\-ID: +(?P<table_id>\w+), +'
+                         'AF: +(?P<af>\w+), +'
+                         'Fwd\-ID: (?P<fwd_id>\w+), +'
+                         'State: +(?P<state>\w+)$')
+
         for line in out.splitlines():
             line = line.strip()
 
-            # VRF-Name: VRF1, VRF-ID: 3, State: Up
-            p1 = re.compile(r'^VRF\-Name: +(?P<vrf>[\w\-]+), +'
-                             'VRF-ID: +(?P<vrf_id>\d+), +'
-                             'State: +(?P<state>\w+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -188,8 +212,6 @@ class ShowVrfDetail(ShowVrfDetailSchema):
                 vrf_dict[vrf]['state'] = m.groupdict()['state'].lower()
                 continue
 
-            # VPNID: unknown
-            p2 = re.compile(r'^VPNID: +(?P<vpn_id>\w+)$')
             m = p2.match(line)
             if m:
                 vpn_id = m.groupdict()['vpn_id']
@@ -197,27 +219,17 @@ class ShowVrfDetail(ShowVrfDetailSchema):
                     vrf_dict[vrf]['vpn_id'] = vpn_id
                 continue
 
-            # RD: 300:1
-            p3 = re.compile(r'^RD: +(?P<rd>[\w\:\.]+)$')
             m = p3.match(line)
             if m:
                 vrf_dict[vrf]['route_distinguisher'] = m.groupdict()['rd']
                 continue
 
-            # Max Routes: 20000  Mid-Threshold: 17000
-            p4 = re.compile(r'^Max +Routes: +(?P<max_routes>\d+) +'
-                             'Mid\-Threshold: +(?P<mid_threshold>\d+)$')
             m = p4.match(line)
             if m:
                 vrf_dict[vrf]['max_routes'] = int(m.groupdict()['max_routes'])
                 vrf_dict[vrf]['mid_threshold'] = int(m.groupdict()['mid_threshold'])
                 continue
 
-            # Table-ID: 0x80000003, AF: IPv6, Fwd-ID: 0x80000003, State: Up
-            p5 = re.compile(r'^Table\-ID: +(?P<table_id>\w+), +'
-                             'AF: +(?P<af>\w+), +'
-                             'Fwd\-ID: (?P<fwd_id>\w+), +'
-                             'State: +(?P<state>\w+)$')
             m = p5.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
@@ -271,6 +283,24 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
     """Parser for show running-config vrf <vrf> | sec '^vrf' """
 
     cli_command = "show running-config vrf {vrf} | sec '^vrf'"
+
+    def command_plan(self, outputs, vrf=None):
+        '''Return the commands of the parse, given the outputs collected'''
+        if vrf:
+            return [self.cli_command.format(vrf=vrf)]
+        show_vrf = ShowVrf.cli_command[0]
+        if show_vrf not in outputs:
+            return [show_vrf]
+        try:
+            vrf_list = list(ShowVrf(device=self.device).parse(
+                output=outputs[show_vrf])['vrfs'])
+        except Exception:
+            return []
+        if len(vrf_list) > 1:
+            return [RUNNING_CONFIG_COMMAND]
+        return [self.cli_command.format(vrf=vrf) for vrf in vrf_list]
+
+    @subcommand_cache
     def cli(self, vrf=None):
         # Init vars
         vrf_list = []
@@ -298,14 +328,18 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
             vrf_list.append(vrf)
 
         else:
-            showVrf = ShowVrf(device=self.device)
-            vrfs = showVrf.parse()
+            vrfs = subcommand_parse(ShowVrf, self.device)
             for vrf in vrfs['vrfs'].keys():
                 vrf_list.append(vrf)
 
 
+        # One show running-config for many vrfs, instead of one command each
+        config = running_config(self.device, build=len(vrf_list) > 1)
         for vrf in vrf_list:
-            out = self.device.execute(self.cli_command.format(vrf=vrf))
+            if config is not None:
+                out = config.block('vrf context {}'.format(vrf))
+            else:
+                out = self.device.execute(self.cli_command.format(vrf=vrf))
 
             for line in out.splitlines():
                 line = line.strip()
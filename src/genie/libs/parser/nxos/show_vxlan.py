@@ -27,6 +27,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.nxos_structured import NxosStructured, Table, Key
 
 
 class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
@@ -131,7 +132,7 @@ class ShowNvePeersSchema(MetaParser):
 # ====================================================
 #  parser for show nve peers
 # ====================================================
-class ShowNvePeers(ShowNvePeersSchema):
+class ShowNvePeers(ShowNvePeersSchema, NxosStructured):
     """Parser for :
        show nve peers"""
 
@@ -139,6 +140,17 @@ class ShowNvePeers(ShowNvePeersSchema):
     exclude = [
         'uptime']
 
+    json_mapping = [
+        Table('nve_peers',
+              path=[Key('if-name', name='nve_name'), 'peer_ip',
+                    Key('peer-ip')],
+              fields={'peer_state': ('peer-state', str.lower),
+                      'learn_type': 'learn-type',
+                      'uptime': 'uptime',
+                      # No router mac for the data plane peers
+                      'router_mac': lambda row: row.get('router-mac', 'n/a')}),
+    ]
+
     def cli(self, output=None):
         # excute command to get output
         if output is None:
@@ -8970,6 +8970,21 @@ BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index
         parsed_output = obj.parse(vrf='default')
         self.assertEqual(parsed_output,self.golden_parsed_output4)
 
+    def test_show_bgp_vrf_default_all_neighbors_fields(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output2)
+        obj = ShowBgpVrfAllNeighbors(device=self.device)
+        parsed_output = obj.parse(vrf='default', fields=['send_community'])
+        self.assertEqual(parsed_output, {
+            'neighbor':
+                {'10.16.2.2':
+                    {'address_family':
+                        {'vpnv4 unicast': {'send_community': 'both'},
+                         'vpnv6 unicast': {'send_community': 'both'}}},
+                 '10.16.2.5':
+                    {'address_family':
+                        {'ipv4 unicast': {'send_community': 'both'}}}}})
+
     def test_show_bgp_vrf_default_all_neighbors_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowBgpVrfAllNeighbors(device=self.device)
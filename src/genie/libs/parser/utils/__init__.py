@@ -1,3 +1,4 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands, \
+                    clear_parser_cache, get_parser_cache_info
+from .batch import parse_batch, BatchResult
 from . import entry_points
-
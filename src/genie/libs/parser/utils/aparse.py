@@ -0,0 +1,229 @@
+'''Parse from an asyncio event loop
+
+The parsers call the blocking ``device.execute(command)``, or
+``device.get(path)`` for the REST parsers: collecting from thousands of
+devices takes a thread each. ``aparse`` awaits the ``execute`` and ``get``
+coroutines of an asyncio device instead, and parses in an executor:
+
+    >>> parsed = await aparse(device, 'show version')
+    >>> results = await asyncio.gather(*[aparse(device, 'show vrf')
+    ...                                  for device in devices])
+
+The parser runs against a device replaying the outputs collected so far.
+The commands it issues which are not collected yet are recorded, ``execute``
+returning '' and ``get`` raising ``PendingCommand``, then awaited together
+and the parse is run again, until it issues no new command. The independent
+commands of a parser are so collected concurrently, ex: the address families
+of ``ShowBgpSummarySuperParser``.
+
+The parsers fetching their output by pages, ``paged = True``, would be run
+again for each page. They are parsed once instead, in a thread: each command
+is awaited on the loop as they issue it. Their own threads still collect
+concurrently, ex: the hostnames of the devices of dnac ``Interface``.
+
+The parse runs in ``executor``, the default executor of the loop if None. A
+``ProcessPoolExecutor`` parses on all the CPUs, the outputs of ``get`` must
+then be picklable. The ``execute`` and ``get`` of the device which are not
+coroutine functions are called in the default executor of the loop.
+'''
+
+# python
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .batch import BatchDevice, _picklable
+from .common import get_parser
+from .running_config import RUNNING_CONFIG_COMMAND
+
+# Parses of a parser issuing new commands, before giving up
+DEFAULT_MAX_ROUNDS = 64
+
+# Commands collected before the others of their round: the parsers answer
+# the others from their output when they have it
+PREFERRED = (('execute', RUNNING_CONFIG_COMMAND),)
+
+
+class PendingCommand(Exception):
+    '''Raised by ReplayDevice.get() for a path not collected yet'''
+
+
+class ReplayDevice(BatchDevice):
+    '''Device given to the parsers of aparse(), replaying collected outputs
+
+    Args:
+        os (`str`): os of the device
+        outputs (`dict`): output of each ('execute', command) and
+                          ('get', path), or the exception it raised
+        platform (`str`): platform of the device
+        model (`str`): model of the device
+        name (`str`): name of the device
+        custom (`dict`): custom attributes of the device
+    '''
+
+    def __init__(self, os, outputs, platform=None, model=None, name=None,
+                 custom=None):
+        super().__init__(os, platform=platform, model=model)
+        self.name = name or os
+        self.custom = custom or {}
+        self.outputs = outputs
+        # Commands issued and not collected, in order
+        self.pending = []
+        self._lock = threading.Lock()
+
+    def execute(self, command, **kwargs):
+        return self._replay(('execute', command), '')
+
+    def get(self, path, **kwargs):
+        return self._replay(('get', path), PendingCommand(path))
+
+    def _replay(self, key, missing):
+        try:
+            output = self.outputs[key]
+        except KeyError:
+            with self._lock:
+                self.pending.append(key)
+            output = missing
+        if isinstance(output, BaseException):
+            raise output
+        return output
+
+
+class AwaitingDevice(ReplayDevice):
+    '''Device given to the paged parsers of aparse(), awaiting each command
+    on the loop of the asyncio device
+
+    Args:
+        device (`Device`): asyncio device
+        loop (`asyncio.AbstractEventLoop`): loop running the coroutines of
+                                           device
+        attributes: attributes of the device, see ReplayDevice
+    '''
+
+    def __init__(self, device, loop, **attributes):
+        super().__init__(outputs={}, **attributes)
+        self._device = device
+        self._loop = loop
+
+    def _replay(self, key, missing):
+        method, argument = key
+        call = getattr(self._device, method)
+        if not asyncio.iscoroutinefunction(call):
+            # Already in a thread of its own
+            return call(argument)
+        return asyncio.run_coroutine_threadsafe(
+            call(argument), self._loop).result()
+
+
+async def aparse(device, command, executor=None, output=None,
+                 max_rounds=DEFAULT_MAX_ROUNDS):
+    '''Parse a command of an asyncio device
+
+    Args:
+        device (`Device`): device whose execute() and get() are coroutine
+                           functions
+        command (`str`): show command, as given to device.parse()
+        executor (`concurrent.futures.Executor`): executor of the parse, the
+                                                  default executor if None
+        output (`str`): output of the command, parsed without collecting
+        max_rounds (`int`): parses of a parser issuing new commands, before
+                            raising RuntimeError; the paged parsers are
+                            parsed once
+
+    Returns:
+        dict: the parsed output
+    '''
+    parser_cls, kwargs = get_parser(command, device)
+    if output is not None:
+        kwargs['output'] = output
+    return await aparse_parser(parser_cls, device, executor=executor,
+                               max_rounds=max_rounds, **kwargs)
+
+
+async def aparse_parser(parser_cls, device, executor=None,
+                        max_rounds=DEFAULT_MAX_ROUNDS, **kwargs):
+    '''Return parser_cls(device=device).parse(**kwargs), collected with the
+    coroutines of device and parsed in executor'''
+    loop = _running_loop()
+    attributes = _attributes(device)
+    if getattr(parser_cls, 'paged', False):
+        # Waits on the loop, in a thread rather than another process
+        if not isinstance(executor, ThreadPoolExecutor):
+            executor = None
+        return await loop.run_in_executor(
+            executor, functools.partial(
+                _parse, parser_cls, AwaitingDevice(device, loop,
+                                                   **attributes), kwargs))
+
+    # The exceptions are only sent back from other processes pickled
+    in_process = executor is None or isinstance(executor, ThreadPoolExecutor)
+    outputs = {}
+    for _ in range(max_rounds):
+        parsed, error, pending = await loop.run_in_executor(
+            executor, _replay_parse, parser_cls, attributes, outputs, kwargs,
+            in_process)
+        if not pending:
+            if error is not None:
+                raise error
+            return parsed
+
+        keys = [key for key in pending if key in PREFERRED] or pending
+        collected = await asyncio.gather(
+            *[_collect(loop, device, key) for key in keys],
+            return_exceptions=True)
+        # A new dict each round, the previous one may still be read
+        outputs = dict(outputs)
+        outputs.update(zip(keys, collected))
+
+    raise RuntimeError('{p} still issues new commands after {n} parses'
+                       .format(p=parser_cls.__name__, n=max_rounds))
+
+
+async def _collect(loop, device, key):
+    '''Return the output of ('execute', command) or ('get', path)'''
+    method, argument = key
+    call = getattr(device, method)
+    if asyncio.iscoroutinefunction(call):
+        return await call(argument)
+    return await loop.run_in_executor(None, functools.partial(call, argument))
+
+
+def _parse(parser_cls, device, kwargs):
+    return parser_cls(device=device).parse(**kwargs)
+
+
+def _replay_parse(parser_cls, attributes, outputs, kwargs, in_process=True):
+    '''Parse against the collected outputs, in the executor
+
+    Returns:
+        tuple: the parsed output, the exception parsing raised, and the keys
+               of the commands issued and not collected
+    '''
+    device = ReplayDevice(outputs=outputs, **attributes)
+    try:
+        parsed, error = parser_cls(device=device).parse(**kwargs), None
+    except Exception as e:
+        parsed, error = None, e if in_process else _picklable(e)
+    pending = list(dict.fromkeys(device.pending))
+    if pending:
+        return None, None, pending
+    return parsed, error, []
+
+
+def _running_loop():
+    # asyncio.get_running_loop() is python 3.7+
+    get_running_loop = getattr(asyncio, 'get_running_loop', None)
+    if get_running_loop is None:
+        return asyncio.get_event_loop()
+    return get_running_loop()
+
+
+def _attributes(device):
+    '''Return the attributes of device the parsers may read'''
+    custom = getattr(device, 'custom', None)
+    return {'os': getattr(device, 'os', None),
+            'platform': getattr(device, 'platform', None),
+            'model': getattr(device, 'model', None),
+            'name': getattr(device, 'name', None),
+            'custom': custom if isinstance(custom, dict) else {}}
@@ -0,0 +1,154 @@
+'''Parse the outputs of many devices in one call
+
+A snapshot of thousands of devices is thousands of ``device.parse(command)``
+in one process: parsing is pure python, bound to one core by the GIL.
+``parse_batch`` parses already collected outputs with a pool of processes:
+
+    >>> results = parse_batch([
+    ...     ('iosxe', 'c9300', 'show version', output1),
+    ...     ('nxos', None, 'show ip route vrf all', output2),
+    ... ])
+    >>> results[0].parsed['version']['version']
+    '16.9.1'
+    >>> results[1].error
+    SchemaEmptyParserError('Parser Output is empty')
+
+The parser of each distinct (os, platform, command) is resolved once, with
+``get_parser``, in the calling process. The outputs are then sent to the
+workers by chunks and parsed there. Results are returned in the order of the
+items; the exception raised by an item is returned in its result instead of
+being raised.
+'''
+
+# python
+import pickle
+from collections import namedtuple
+
+from .common import get_parser
+
+# Outcome of one item: the parsed output, or the exception parsing it raised
+BatchResult = namedtuple('BatchResult', ['parsed', 'error'])
+
+# Number of items sent to a worker at once
+DEFAULT_CHUNKSIZE = 32
+
+
+class BatchDevice(object):
+    '''Device given to the parsers of parse_batch()
+
+    Holds the attributes the parser lookup depends on, without any
+    connection: the outputs are already collected.
+    '''
+
+    def __init__(self, os, platform=None, model=None):
+        self.name = os
+        self.os = os
+        self.platform = platform
+        self.model = model
+        self.custom = {}
+
+    def execute(self, command, **kwargs):
+        raise Exception("'{c}' cannot be executed, parse_batch() only parses "
+                        "collected outputs".format(c=command))
+
+
+def parse_batch(items, max_workers=None, chunksize=DEFAULT_CHUNKSIZE,
+                executor=None, cache=None):
+    '''Parse (os, platform, command, output) items with a pool of processes
+
+    Args:
+        items (iterable): (os, platform, command, output) tuples, platform
+            may be None
+        max_workers (`int`): number of processes, defaults to the number of
+            CPUs. 1 parses in the current process, without a pool
+        chunksize (`int`): number of items sent to a worker at once
+        executor (`concurrent.futures.Executor`): executor to use instead of
+            creating a process pool, left running
+        cache (`ResultCache`): cache of the parsed outputs; the cached
+            outputs are not sent to the workers
+
+    Returns:
+        list of BatchResult, in the order of the items
+    '''
+    results = []
+    jobs = []
+    resolved = {}
+    for index, (os, platform, command, output) in enumerate(items):
+        key = (os, platform, command)
+        found = resolved.get(key)
+        if found is None:
+            try:
+                found = get_parser(command, BatchDevice(os, platform))
+            except Exception as e:
+                found = e
+            resolved[key] = found
+
+        if isinstance(found, Exception):
+            results.append(BatchResult(None, found))
+        else:
+            parser_cls, kwargs = found
+            parsed = None
+            if cache is not None:
+                parsed = cache.get(cache.key(parser_cls, output, kwargs))
+            if parsed is not None:
+                results.append(BatchResult(parsed, None))
+                continue
+            results.append(None)
+            jobs.append((index, parser_cls, kwargs, os, platform, output))
+
+    chunks = [jobs[start:start + chunksize]
+              for start in range(0, len(jobs), chunksize)]
+
+    if executor is None and max_workers == 1:
+        for chunk in chunks:
+            _store(results, chunk, _parse_chunk(chunk), cache)
+        return results
+
+    if executor is None:
+        # multiprocessing is slow to import, only when a pool is needed
+        from concurrent.futures import ProcessPoolExecutor
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [pool.submit(_parse_chunk, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                parsed = future.result()
+            except Exception as e:
+                # The chunk could not be sent or its worker died
+                parsed = [BatchResult(None, e)] * len(chunk)
+            _store(results, chunk, parsed, cache)
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return results
+
+
+def _store(results, chunk, parsed, cache=None):
+    for job, result in zip(chunk, parsed):
+        results[job[0]] = result
+        if cache is not None and result.error is None:
+            _, parser_cls, kwargs, _, _, output = job
+            cache.put(cache.key(parser_cls, output, kwargs), result.parsed)
+
+
+def _parse_chunk(chunk):
+    '''Parse the jobs of a chunk, in a worker process'''
+    parsed = []
+    for _, parser_cls, kwargs, os, platform, output in chunk:
+        try:
+            parser = parser_cls(device=BatchDevice(os, platform))
+            parsed.append(BatchResult(parser.parse(output=output, **kwargs),
+                                      None))
+        except Exception as e:
+            parsed.append(BatchResult(None, _picklable(e)))
+    return parsed
+
+
+def _picklable(error):
+    '''Return error, or a plain Exception describing it when it cannot be
+    sent back from the worker'''
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return Exception('{t}: {e}'.format(t=type(error).__name__, e=error))
+    return error
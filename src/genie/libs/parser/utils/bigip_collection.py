@@ -0,0 +1,142 @@
+'''Collections of the BigIP iControl REST API
+
+Each BigIP parser returns one iControl REST collection, ex:
+``/mgmt/tm/ltm/pool``. ``BigipCollection`` is their ``rest()``: it follows
+the ``nextLink`` of the collections returned by pages, and projects the
+items on the given fields with ``$select``:
+
+    >>> device.parse('/mgmt/tm/ltm/pool', select=['name', 'partition'])
+
+``iter_items()`` yields the items of a collection page by page, without
+holding the whole collection. ``rest_collections()`` fetches many
+collections concurrently, ex: the inventory of a box:
+
+    >>> collections = rest_collections(device, ['/mgmt/tm/ltm/pool',
+    ...                                         '/mgmt/tm/ltm/virtual'])
+    >>> collections['/mgmt/tm/ltm/pool']['items'][0]['name']
+    'pool1'
+
+The requests of the threads share the session of the REST connection, so
+its connections are reused.
+'''
+
+# python
+from urllib.parse import urlencode, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent requests of rest_collections(), within the default connection
+# pool of a requests session
+DEFAULT_MAX_WORKERS = 8
+
+# Fields of a page of a collection, describing the page
+PAGE_FIELDS = ('nextLink', 'previousLink', 'currentItemCount',
+               'itemsPerPage', 'pageIndex', 'startIndex', 'totalPages')
+
+
+class BigipCollection(object):
+    '''Mixin of the BigIP parsers of the collection at cli_command'''
+
+    def rest(self, select=None, top=None):
+        '''Return the collection, the items of all its pages
+
+        Args:
+            select (`list`): fields of the items to return, all by default
+            top (`int`): items fetched by request, the device default if
+                         None
+        '''
+        return get_collection(self.device, self.cli_command, select=select,
+                              top=top)
+
+    def iter_items(self, select=None, top=None):
+        '''Yield the items of the collection, fetching its pages as they
+        are consumed'''
+        for page in iter_pages(self.device, self.cli_command, select=select,
+                               top=top):
+            yield from page.get('items', [])
+
+
+def collection_path(path, select=None, top=None, skip=None):
+    '''Return the path of a collection with its query options
+
+    >>> collection_path('/mgmt/tm/ltm/pool', select=['name'], top=100)
+    '/mgmt/tm/ltm/pool?$select=name&$top=100'
+    '''
+    query = []
+    if select:
+        query.append(('$select', ','.join(select)))
+    if top is not None:
+        query.append(('$top', top))
+    if skip is not None:
+        query.append(('$skip', skip))
+    if not query:
+        return path
+    return '{p}{s}{q}'.format(p=path, s='&' if '?' in path else '?',
+                              q=urlencode(query, safe='$,'))
+
+
+def iter_pages(device, path, select=None, top=None):
+    '''Yield the pages of a collection, following their nextLink'''
+    path = collection_path(path, select=select, top=top)
+    while path:
+        page = device.get(path).json()
+        if not isinstance(page, dict):
+            return
+        yield page
+        path = _next_path(page.get('nextLink'))
+
+
+def get_collection(device, path, select=None, top=None):
+    '''Return a collection, the items of its pages in the first one
+
+    A collection returned in one page is returned as is.
+    '''
+    collection = None
+    for page in iter_pages(device, path, select=select, top=top):
+        if collection is None:
+            collection = page
+            continue
+        collection.setdefault('items', []).extend(page.get('items', []))
+        for field in PAGE_FIELDS:
+            collection.pop(field, None)
+
+    if not collection:
+        return {}
+    return collection
+
+
+def rest_collections(device, paths, select=None,
+                     max_workers=DEFAULT_MAX_WORKERS):
+    '''Fetch many collections concurrently
+
+    Args:
+        device (`Device`): device connected to its REST API
+        paths (`list`): paths of the collections, or parsers with their
+                        path as cli_command
+        select (`list`): fields of the items to return, all by default
+        max_workers (`int`): concurrent requests
+
+    Returns:
+        dict of the collection of each path; the exception raised fetching
+        a collection is returned instead of being raised
+    '''
+    paths = [getattr(path, 'cli_command', path) for path in paths]
+
+    def fetch(path):
+        try:
+            return get_collection(device, path, select=select)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(fetch, paths)))
+
+
+def _next_path(link):
+    '''Return the path of a nextLink, ex:
+    https://localhost/mgmt/tm/ltm/pool?$top=2&$skip=2'''
+    if not link:
+        return None
+    link = urlsplit(link)
+    if link.query:
+        return '{p}?{q}'.format(p=link.path, q=link.query)
+    return link.path
@@ -0,0 +1,255 @@
+'''Parsers of outputs made of one block per entry
+
+``show interfaces`` prints one block per interface, from its
+``<interface> is up, line protocol is up`` line to the next one. Parsers
+deriving from ``BlockParser`` declare the first line of their blocks:
+
+    class ShowInterfaces(ShowInterfacesSchema, BlockParser):
+
+        block_start = [re.compile(r'^(?P<interface>[\\w\\/\\.\\-]+) +is +...')]
+
+and can parse the output of a poll from the output and the parsed output of
+the previous one, ``parse_incremental()``: only the blocks which changed are
+parsed again, the entries of the other blocks are the previous ones.
+
+A block may change the entries of other blocks, ex: a port-channel sets the
+port_channel_int of its members. ``block_links()`` returns the blocks a block
+links with; linked blocks are parsed together.
+
+Very large outputs, ex: the thousands of subinterfaces of an aggregation
+router, are parsed by chunks of blocks in a pool of processes with
+``parse_blocks()``. The parsed chunks are merged by ``merge_blocks()``.
+'''
+
+# python
+import os
+
+# Below this number of blocks, parse_blocks() parses in the current process
+MIN_PARALLEL_BLOCKS = 256
+
+
+class BlockParser(object):
+    '''Mixin of the parsers of outputs made of one block per entry'''
+
+    # Patterns of the first line of a block, stripped
+    block_start = ()
+
+    # Group of the block_start patterns naming the block
+    block_group = 'interface'
+
+    # Substring of every first line of a block, if any: the other lines are
+    # not matched against block_start
+    block_marker = None
+
+    def block_links(self, text):
+        '''Return the names of the blocks the text of a block links the block
+        with, ex: the members of a port-channel'''
+        return ()
+
+    def split_blocks(self, output):
+        '''Split an output into its blocks
+
+        Returns:
+            tuple: the text before the first block, and the list of the
+                   (name, text) of the blocks
+        '''
+        lines = output.splitlines()
+        if self.block_marker is None:
+            candidates = range(len(lines))
+        else:
+            candidates = [index for index, line in enumerate(lines)
+                          if self.block_marker in line]
+        starts = []
+        for index in candidates:
+            stripped = lines[index].strip()
+            for pattern in self.block_start:
+                m = pattern.match(stripped)
+                if m:
+                    starts.append((index, m.group(self.block_group)))
+                    break
+        ends = [index for index, _ in starts[1:]] + [len(lines)]
+        header = lines[:starts[0][0]] if starts else lines
+        return '\n'.join(header), [
+            (name, '\n'.join(lines[start:end]))
+            for (start, name), end in zip(starts, ends)]
+
+    def link_blocks(self, blocks):
+        '''Return the names of the blocks linked with each block, both ways
+
+        Args:
+            blocks (`list`): (name, text) of the blocks
+        '''
+        links = {}
+        if type(self).block_links is BlockParser.block_links:
+            return links
+        for name, text in blocks:
+            for other in self.block_links(text):
+                links.setdefault(name, set()).add(other)
+                links.setdefault(other, set()).add(name)
+        return links
+
+    def parse_incremental(self, previous_output, previous_parsed, output,
+                          **kwargs):
+        '''Parse output, parsing again only the blocks which changed since
+        previous_output
+
+        Args:
+            previous_output (`str`): output of the previous poll
+            previous_parsed (`dict`): parsed output of previous_output
+            output (`str`): output to parse
+            kwargs: arguments of the parser, ex: interface
+
+        Returns:
+            dict: the parsed output. The entries of the unchanged blocks are
+                  the ones of previous_parsed, not copies.
+        '''
+        previous_header, previous_blocks = self.split_blocks(previous_output)
+        header, blocks = self.split_blocks(output)
+        previous = dict(previous_blocks)
+        current = dict(blocks)
+        if header != previous_header or not previous_parsed or \
+                len(previous) != len(previous_blocks) or \
+                len(current) != len(blocks) or \
+                set(previous_parsed) != set(previous):
+            # Entries of another origin than their block: parse it all
+            return self.parse(output=output, **kwargs)
+
+        changed = {name for name, text in blocks
+                   if previous.get(name) != text}
+        changed.update(name for name in previous if name not in current)
+        if changed:
+            changed = _linked(changed,
+                              self.link_blocks(previous_blocks + blocks))
+
+        parsed = {}
+        texts = [text for name, text in blocks if name in changed]
+        if texts:
+            try:
+                parsed = self.parse(output='\n'.join([header] + texts),
+                                    **kwargs)
+            except Exception:
+                parsed = {}
+            if any(name not in parsed for name, text in blocks
+                   if name in changed):
+                return self.parse(output=output, **kwargs)
+
+        result = {}
+        for name, _ in blocks:
+            result[name] = parsed[name] if name in changed \
+                else previous_parsed[name]
+        for name, entry in parsed.items():
+            result.setdefault(name, entry)
+        return result
+
+    def parse_blocks(self, output, max_workers=None, chunksize=None,
+                     executor=None, **kwargs):
+        '''Parse output by chunks of blocks, in a pool of processes
+
+        Args:
+            output (`str`): output to parse
+            max_workers (`int`): number of processes, defaults to the number
+                of CPUs
+            chunksize (`int`): number of blocks sent to a worker at once,
+                defaults to 4 chunks per worker
+            executor (`concurrent.futures.Executor`): executor to use instead
+                of creating a process pool, left running
+            kwargs: arguments of the parser, ex: interface
+
+        Returns:
+            dict: the parsed output, as parse() returns it
+        '''
+        workers = max_workers or os.cpu_count() or 1
+        if executor is None and workers == 1:
+            return self.parse(output=output, **kwargs)
+        header, blocks = self.split_blocks(output)
+        if len(blocks) < max(MIN_PARALLEL_BLOCKS, 2):
+            return self.parse(output=output, **kwargs)
+
+        chunks = self.chunk_blocks(blocks, chunksize or
+                                   -(-len(blocks) // (workers * 4)))
+        # The text before the first block is parsed once, with the first chunk
+        texts = ['\n'.join(([header] if index == 0 else []) +
+                           [text for _, text in chunk])
+                 for index, chunk in enumerate(chunks)]
+
+        if executor is None:
+            # multiprocessing is slow to import, only when a pool is needed
+            from concurrent.futures import ProcessPoolExecutor
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        # The device, and its connections, stay in this process
+        os_name = getattr(getattr(self, 'device', None), 'os', None)
+        if not isinstance(os_name, str):
+            os_name = None
+        try:
+            futures = [pool.submit(_parse_chunk, type(self), os_name, text,
+                                   kwargs) for text in texts]
+            parsed = [future.result() for future in futures]
+        except Exception:
+            # Raise the error of the whole output, as parse() would
+            return self.parse(output=output, **kwargs)
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        merged = self.merge_blocks(blocks, parsed)
+        if merged is None:
+            return self.parse(output=output, **kwargs)
+        return merged
+
+    def chunk_blocks(self, blocks, chunksize):
+        '''Split blocks into chunks of about chunksize blocks, keeping the
+        linked blocks in the same chunk'''
+        links = self.link_blocks(blocks)
+        chunks = []
+        chunk_of = {}
+        for name, text in blocks:
+            index = chunk_of.get(name)
+            if index is None:
+                if not chunks or len(chunks[-1]) >= chunksize:
+                    chunks.append([])
+                index = len(chunks) - 1
+                for other in _linked({name}, links):
+                    chunk_of.setdefault(other, index)
+            chunks[index].append((name, text))
+        return chunks
+
+    def merge_blocks(self, blocks, parsed):
+        '''Merge the parsed outputs of the chunks of blocks
+
+        Args:
+            blocks (`list`): (name, text) of the blocks of the output
+            parsed (`list`): parsed outputs of the chunks, in order
+
+        Returns:
+            dict: the parsed output, None when it must be parsed whole
+        '''
+        merged = {}
+        for chunk in parsed:
+            merged.update(chunk)
+        names = [name for name, _ in blocks]
+        if len(set(names)) != len(names) or \
+                any(name not in merged for name in names):
+            return None
+        result = {name: merged[name] for name in names}
+        for name, entry in merged.items():
+            result.setdefault(name, entry)
+        return result
+
+
+def _linked(names, links):
+    '''Return names and the names linked with them, recursively'''
+    names = set(names)
+    pending = list(names)
+    while pending:
+        for other in links.get(pending.pop(), ()):
+            if other not in names:
+                names.add(other)
+                pending.append(other)
+    return names
+
+
+def _parse_chunk(parser_cls, os_name, output, kwargs):
+    '''Parse a chunk of blocks, in a worker process'''
+    from .batch import BatchDevice
+    return parser_cls(device=BatchDevice(os_name)).parse(output=output,
+                                                         **kwargs)
@@ -0,0 +1,96 @@
+'''Caches used by genie.libs.parser utilities'''
+
+# python
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    '''Thread safe, bounded least recently used cache with counters.
+
+    Args:
+        maxsize (`int`): maximum number of entries, 0 disables the cache
+
+    Example:
+
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.put('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.info()
+        {'hits': 1, 'misses': 0, 'evictions': 0, 'invalidations': 0,
+         'size': 1, 'maxsize': 2}
+    '''
+
+    # Returned by get() when the key is not cached
+    MISSING = object()
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=MISSING):
+        '''Return the cached value of key and mark it as recently used'''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        '''Cache value under key, evicting the least recently used entries'''
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def resize(self, maxsize):
+        '''Change the maximum number of entries'''
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        '''Drop every entry, counted as one invalidation'''
+        with self._lock:
+            self._data.clear()
+            self.invalidations += 1
+
+    def reset_counters(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def info(self):
+        '''Return the cache counters as a dict'''
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'invalidations': self.invalidations,
+                    'size': len(self._data),
+                    'maxsize': self.maxsize}
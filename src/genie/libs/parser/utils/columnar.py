@@ -0,0 +1,349 @@
+'''Columnar output of the parsers of huge tables
+
+The NAT translations, MAC addresses or ARP entries parsed from a device are
+one small dict per entry: a few hundred bytes each, for outputs of hundreds
+of thousands of entries. ``ColumnarTable`` holds the entries of such a table
+column by column instead:
+
+    * int columns in ``array('q')``, bool columns in ``array('b')``
+    * str columns as lists of interned strings
+    * the keys of the entries in the output, ex: the vlan and the mac
+      address, as columns too
+
+Parsers deriving from ``ColumnarParser`` declare where their tables are in
+the parsed output, the keys of the path in braces being the key columns:
+
+    class ShowMacAddressTable(ShowMacAddressTableSchema, ColumnarParser):
+
+        columnar_tables = {
+            'interfaces': ('mac_table', 'vlans', '{vlan}', 'mac_addresses',
+                           '{mac_address}', 'interfaces', '{interface}'),
+        }
+
+    >>> tables = ShowMacAddressTable(device=device).parse_columnar()
+    >>> tables['interfaces']['mac_address'][:2]
+    ['aaaa.bbff.8888', '0000.deff.6c9d']
+
+A row is made of the key columns, the fields of the dicts of the keys along
+the path and the fields of the dict at the end of the path; the fields of the dicts
+within it are columns too, their names joined with '.', ex:
+'details.use_count'.
+
+``parse_columnar()`` goes through ``parse()``: the output is validated
+against the schema, and an empty output raises SchemaEmptyParserError. The
+dict tree of the output is built first and converted, so the peak memory of
+the parse is unchanged; the tables shrink the memory retained once it is
+converted.
+
+The int and bool columns are buffers numpy reads without copy.
+``to_numpy()`` and ``to_arrow()`` convert a table when numpy or pyarrow is
+installed. Two snapshots of a table are compared with ``diff()``.
+'''
+
+# python
+import sys
+from array import array
+
+# Missing value of the int and bool columns
+MISSING_INT = -2 ** 63
+MISSING_BOOL = -1
+
+
+class ColumnarParser(object):
+    '''Mixin of the parsers adding parse_columnar()
+
+    The parsers define the ``columnar_tables`` of their output, the path of
+    each table by name.
+    '''
+
+    columnar_tables = {}
+
+    def parse_columnar(self, **kwargs):
+        '''Parse the command, and return its tables as ColumnarTable
+
+        Args:
+            kwargs: arguments of parse(), ex: output
+
+        Returns:
+            dict of the ColumnarTable of each of columnar_tables
+        '''
+        return to_columnar(self.parse(**kwargs), self.columnar_tables)
+
+
+class ColumnarTable(object):
+    '''Rows of a table, column by column
+
+    Args:
+        keys (`list`): names of the key columns
+    '''
+
+    def __init__(self, keys=()):
+        self.keys = list(keys)
+        self.columns = {}
+        self._size = 0
+        self._frozen = False
+
+    def append(self, row):
+        '''Add a row, a dict of the values of its columns'''
+        if self._frozen:
+            raise ValueError('No row can be appended to a frozen table')
+        size = self._size
+        columns = self.columns
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * size
+            if isinstance(value, str):
+                value = sys.intern(value)
+            column.append(value)
+        self._size = size = size + 1
+        for column in columns.values():
+            if len(column) < size:
+                column.append(None)
+
+    def freeze(self):
+        '''Store the columns in their most compact form, no more rows can be
+        appended'''
+        for name, values in self.columns.items():
+            self.columns[name] = _compact(values)
+        self._frozen = True
+        return self
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __repr__(self):
+        return '<ColumnarTable {n} rows, columns {c}>'.format(
+            n=self._size, c=list(self.columns))
+
+    def row(self, index):
+        '''Return the row at index as a dict, without its missing values'''
+        row = {}
+        for name, column in self.columns.items():
+            value = _value(column, index)
+            if value is not None:
+                row[name] = value
+        return row
+
+    def rows(self):
+        '''Return an iterator on the rows, as dicts'''
+        return (self.row(index) for index in range(self._size))
+
+    def diff(self, other):
+        '''Compare the rows of two snapshots of a table by their keys
+
+        Args:
+            other (`ColumnarTable`): newer snapshot of the table
+
+        Returns:
+            dict: keys of the 'added', 'removed' and 'changed' rows, a tuple
+                  of the values of the key columns each
+        '''
+        names = sorted(set(self.columns).union(other.columns))
+        old_keys = self._keys()
+        new_keys = other._keys()
+        if old_keys == new_keys:
+            # Snapshots of the same rows in the same order, compared column
+            # by column; the equal columns are skipped at once
+            changed = set()
+            for name in names:
+                old = self.columns.get(name)
+                new = other.columns.get(name)
+                if old is not None and new is not None and old == new:
+                    continue
+                old = _values(old or (), self._size)
+                new = _values(new or (), other._size)
+                changed.update(index for index, (first, second)
+                               in enumerate(zip(old, new))
+                               if first != second)
+            return {'added': [], 'removed': [],
+                    'changed': sorted((old_keys[index] for index in changed),
+                                      key=str)}
+
+        old = self._keyed_rows(names)
+        new = other._keyed_rows(names)
+        return {
+            'added': sorted(new.keys() - old.keys(), key=str),
+            'removed': sorted(old.keys() - new.keys(), key=str),
+            'changed': sorted((key for key in old.keys() & new.keys()
+                               if old[key] != new[key]), key=str),
+        }
+
+    def _keys(self):
+        '''Return the tuples of the values of the key columns of the rows'''
+        return list(zip(*[_values(self.columns[name], self._size)
+                          for name in self.keys]))
+
+    def _keyed_rows(self, names):
+        '''Return the tuples of the values of the columns of names, by the
+        tuple of the values of the key columns'''
+        columns = [self.columns.get(name, ()) for name in names]
+        values = zip(*[_values(column, self._size) for column in columns])
+        return dict(zip(self._keys(), values))
+
+    def to_numpy(self):
+        '''Return the table as a numpy structured array
+
+        int and bool columns keep their missing values, ``MISSING_INT`` and
+        ``MISSING_BOOL``; the missing str are ''.
+        '''
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('numpy is required by ColumnarTable.to_numpy()')
+
+        self.freeze()
+        fields = []
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                fields.append((name, numpy.frombuffer(
+                    column, dtype='i8' if column.typecode == 'q' else 'i1')))
+            elif all(value is None or isinstance(value, str)
+                     for value in column):
+                fields.append((name, numpy.array(
+                    ['' if value is None else value for value in column],
+                    dtype=str)))
+            else:
+                values = numpy.empty(self._size, dtype=object)
+                for index, value in enumerate(column):
+                    values[index] = value
+                fields.append((name, values))
+
+        result = numpy.empty(self._size, dtype=[
+            (name, values.dtype) for name, values in fields])
+        for name, values in fields:
+            result[name] = values
+        return result
+
+    def to_arrow(self):
+        '''Return the table as a pyarrow Table, missing values being null'''
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError('pyarrow is required by '
+                              'ColumnarTable.to_arrow()')
+
+        self.freeze()
+        columns = {}
+        for name, column in self.columns.items():
+            values = list(_values(column, self._size))
+            if isinstance(column, array) and column.typecode == 'b':
+                columns[name] = pyarrow.array(values, type=pyarrow.bool_())
+            else:
+                columns[name] = pyarrow.array(values)
+        return pyarrow.table(columns)
+
+
+def to_columnar(parsed, tables):
+    '''Return the tables of a parsed output as ColumnarTable
+
+    Args:
+        parsed (`dict`): parsed output
+        tables (`dict`): path of each table by name, see ColumnarParser
+
+    Returns:
+        dict of the ColumnarTable of each table
+    '''
+    columnar = {}
+    for name, path in tables.items():
+        keys = [step[1:-1] for step in path if _is_key(step)]
+        table = columnar[name] = ColumnarTable(keys)
+        for row in _rows(parsed, path, 0, {}):
+            table.append(row)
+        table.freeze()
+    return columnar
+
+
+def _is_key(step):
+    return step.startswith('{') and step.endswith('}')
+
+
+def _rows(node, path, position, row):
+    '''Yield the rows below node, the steps of the path from position'''
+    if position == len(path):
+        leaf = dict(row)
+        _flatten(node, '', leaf)
+        yield leaf
+        return
+
+    step = path[position]
+    if _is_key(step):
+        name = step[1:-1]
+        for key, child in node.items():
+            # The dicts of keys hold the other fields too, ex: counters
+            if not isinstance(child, dict):
+                continue
+            child_row = dict(row)
+            child_row[name] = key
+            _scalars(child, path, position + 1, child_row)
+            yield from _rows(child, path, position + 1, child_row)
+    else:
+        child = node.get(step)
+        if isinstance(child, dict):
+            yield from _rows(child, path, position + 1, row)
+
+
+def _scalars(node, path, position, row):
+    '''Add the fields of the dict of a key of the path to row'''
+    if position == len(path):
+        # The fields of the dict at the end of the path are the row
+        return
+    for name, value in node.items():
+        if not isinstance(value, dict):
+            row[name] = value
+
+
+def _flatten(node, prefix, row):
+    for name, value in node.items():
+        if isinstance(value, dict):
+            _flatten(value, prefix + str(name) + '.', row)
+        else:
+            row[prefix + str(name)] = value
+
+
+def _compact(values):
+    '''Return the values of a column in an array when they fit one'''
+    present = [value for value in values if value is not None]
+    if present and all(type(value) is bool for value in present):
+        return array('b', (MISSING_BOOL if value is None else value
+                           for value in values))
+    if present and all(type(value) is int and
+                       MISSING_INT < value < 2 ** 63 for value in present):
+        return array('q', (MISSING_INT if value is None else value
+                           for value in values))
+    return values
+
+
+def _value(column, index):
+    '''Return the value at index of a column, None when it is missing'''
+    value = column[index]
+    if isinstance(column, array):
+        if column.typecode == 'b':
+            return None if value == MISSING_BOOL else bool(value)
+        return None if value == MISSING_INT else value
+    return value
+
+
+def _values(column, size):
+    '''Return an iterator on the values of a column, None when missing'''
+    if not column:
+        return iter([None] * size)
+    if isinstance(column, array):
+        if column.typecode == 'b':
+            if MISSING_BOOL not in column:
+                return map(bool, column)
+            return (None if value == MISSING_BOOL else bool(value)
+                    for value in column)
+        if MISSING_INT not in column:
+            return iter(column)
+        return (None if value == MISSING_INT else value for value in column)
+    return iter(column)
@@ -8,6 +8,7 @@ import json
 import math
 import logging
 import warnings
+import functools
 import importlib
 
 from genie.libs import parser
@@ -16,8 +17,16 @@ from genie.metaparser.util import merge_dict
 
 from pyats import configuration as cfg
 from .extension import ExtendParsers
+from .registry import ParserRegistry, load_registry_file
+from .cache import LRUCache
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
+PARSER_REGISTRY_CACHE = 'genie.libs.parser.registry_cache'
+PARSER_LOOKUP_CACHE_SIZE = 'genie.libs.parser.lookup_cache_size'
+
+# Device attributes used as abstraction tokens when the device
+# does not define its own abstraction order
+DEFAULT_ABSTRACTION_ATTRS = ('os', 'platform', 'model')
 
 log = logging.getLogger(__name__)
 
@@ -34,16 +43,22 @@ def _load_parser_json():
                     'genie.libs.parsers')
         parser_data = {}
     else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
+        # Open all the parsers in json file, through the pickled cache.
+        # The cache can be disabled or moved to another directory.
+        cache_dir = cfg.get(PARSER_REGISTRY_CACHE, None) or \
+            os.environ.get(PARSER_REGISTRY_CACHE.upper().replace('.', '_'))
+        cache = str(cache_dir).lower() not in ('0', 'false', 'no', 'off')
+        if not cache:
+            cache_dir = None
+        parser_data = load_registry_file(parsers, cache=cache,
+                                         cache_dir=cache_dir)
 
         # check if provided external parser packages
         ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
             os.environ.get(PYATS_EXT_PARSER.upper().replace('.', '_'))
         if ext_parser_package:
             ext = ExtendParsers(ext_parser_package)
-            ext.extend()
+            ext.extend(cache=cache, cache_dir=cache_dir)
 
             ext.output.pop('tokens', None)
             summary = ext.output.pop('extend_info', None)
@@ -54,14 +69,17 @@ def _load_parser_json():
 
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+# Parser within Genie, loaded on first use
+parser_data = ParserRegistry(_load_parser_json)
 
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    if isinstance(data, ParserRegistry):
+        return list(data.commands_for_os(device.os))
+
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -90,6 +108,38 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
+def _parser_lookup_cache_size():
+    size = cfg.get(PARSER_LOOKUP_CACHE_SIZE, None) or \
+        os.environ.get(PARSER_LOOKUP_CACHE_SIZE.upper().replace('.', '_'))
+    try:
+        return int(size) if size is not None else 1024
+    except ValueError:
+        log.warning("Invalid {k} '{s}', using 1024"
+                    .format(k=PARSER_LOOKUP_CACHE_SIZE, s=size))
+        return 1024
+
+# Resolved get_parser() results
+parser_lookup_cache = LRUCache(maxsize=_parser_lookup_cache_size())
+_parser_lookup_generation = parser_data.generation
+
+def clear_parser_cache():
+    '''Drop all the cached get_parser() results. Must be called when parsers
+       are added or changed at runtime without going through parser_data'''
+    parser_lookup_cache.clear()
+
+def get_parser_cache_info():
+    '''Return the get_parser() cache counters: hits, misses, evictions,
+       invalidations, size and maxsize'''
+    return parser_lookup_cache.info()
+
+def _parser_cache_key(command, device, fuzzy, order_list):
+    '''Build the get_parser() cache key from the normalized command and
+       the device attributes the abstraction lookup depends on'''
+    attrs = order_list or DEFAULT_ABSTRACTION_ATTRS
+    tokens = tuple(str(getattr(device, attr, None)) for attr in attrs)
+    return (' '.join(command.split()), bool(fuzzy), device.os,
+            tuple(order_list) if order_list else None, tokens)
+
 def get_parser(command, device, fuzzy=False):
     '''From a show command and device, return parser class and kwargs if any'''
 
@@ -98,6 +148,33 @@ def get_parser(command, device, fuzzy=False):
     except AttributeError:
         order_list = None
 
+    # Registry changed since the results were cached
+    global _parser_lookup_generation
+    if _parser_lookup_generation != parser_data.generation:
+        _parser_lookup_generation = parser_data.generation
+        parser_lookup_cache.clear()
+
+    try:
+        key = _parser_cache_key(command, device, fuzzy, order_list)
+        cached = parser_lookup_cache.get(key, None)
+    except TypeError:
+        # Unhashable device attributes, do not cache
+        key = cached = None
+
+    if cached is None:
+        cached = _get_parser(command, device, fuzzy, order_list)
+        if key is not None:
+            parser_lookup_cache.put(key, cached)
+
+    # Give a copy of the kwargs, callers are free to modify them
+    if not fuzzy:
+        return cached[0], dict(cached[1])
+    return [(found_command, parser_cls, dict(kwargs))
+            for found_command, parser_cls, kwargs in cached]
+
+def _get_parser(command, device, fuzzy, order_list):
+    '''Resolve the parser class and kwargs of a command, uncached'''
+
     lookup = Lookup.from_device(device, packages={'parser': parser})
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
@@ -109,13 +186,15 @@ def get_parser(command, device, fuzzy=False):
             continue
 
         # Check if all the tokens exists and take the farthest one
+        tokens = []
         for token in lookup._tokens:
             if token in data:
                 data = data[token]
+                tokens.append(token)
 
         try:
             valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+                                _find_parser_cls(device, data, tokens), kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
@@ -161,10 +240,22 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
-        # Tokens and kwargs parameter must be non reference
-        match_result = _matches_fuzzy(0, 0, tokens.copy(),
-                                                        command, {}, fuzzy)
+    # One matcher per search, it caches the regular token checks and
+    # compiled expressions shared by all the commands
+    matcher = FuzzyMatcher(fuzzy)
+
+    if not isinstance(parser_data, ParserRegistry):
+        commands = list(parser_data.keys())
+    else:
+        # Only the commands the trie allows can match the leading non
+        # regex tokens
+        leading = matcher.leading_regular_tokens(tokens)
+        commands = parser_data.search_candidates(
+            leading, prefix=len(leading) != len(tokens))
+
+    for command in commands:
+        source = parser_data[command]
+        match_result = matcher.match(tokens, command)
 
         if match_result: 
             kwargs, score = match_result
@@ -241,10 +332,35 @@ def _is_regular_token(token):
     
     return token_is_regular
 
-def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy, 
+def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                                             required_arguments=None, score=0):
     """ Compares between given tokens and command to see if they match.
 
+        Args:
+            i (`int`): current end of tokens
+            j (`int`): current index of command tokens
+            tokens (`list`): the search tokens
+            command (`str`): the command to be compared with
+            kwargs (`dict`): the collected arguments
+            fuzzy (`bool`): whether or not fuzzy should be used
+            required_arguments (`int`): number of arguments command has
+            score (`int`): the current similarity score between token and command
+
+            Returns:
+                tuple: (kwargs, score) if search matches the command else None
+
+    """
+    return FuzzyMatcher(fuzzy).match(tokens, command, i=i, j=j,
+                                     kwargs=kwargs, score=score,
+                                     required_arguments=required_arguments)
+
+def _matches_fuzzy_recursive(i, j, tokens, command, kwargs, fuzzy,
+                                            required_arguments=None, score=0):
+    """ Compares between given tokens and command to see if they match.
+
+        Recursive backtracking implementation, replaced by FuzzyMatcher and
+        kept as the reference the matcher is tested and benchmarked against.
+
         Args: 
             i (`int`): current end of tokens 
             j (`int`): current index of command tokens
@@ -367,8 +483,9 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                         kwargs_copy = kwargs.copy()
                         kwargs_copy.setdefault(argument_key, argument_value)
                         
-                        result = _matches_fuzzy(i, j, tokens_copy, command,
-                                kwargs_copy, fuzzy, required_arguments, score)
+                        result = _matches_fuzzy_recursive(i, j, tokens_copy,
+                                command, kwargs_copy, fuzzy,
+                                required_arguments, score)
                             
                         if result:
                             result_kwargs, score = result
@@ -459,7 +576,7 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                     # For matched range, perform submatches on next real token
                     for subindex in range(j + skipped, token_end + 1):
                         # Make sure items are passed by copies, not by reference
-                        submatch_result = _matches_fuzzy(i, subindex, 
+                        submatch_result = _matches_fuzzy_recursive(i, subindex,
                             tokens.copy(), command, kwargs.copy(),
                                             fuzzy, required_arguments, score)
                         
@@ -487,7 +604,350 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
         return None
 
 
-def _find_parser_cls(device, data):
+# Arguments which can only span one search token
+SINGLE_TOKEN_ARGUMENTS = frozenset(['vrf', 'rd', 'instance', 'vrf_type',
+                                    'feature', 'fileA', 'fileB'])
+
+
+class _CompiledCommand(object):
+    """ Command data used by FuzzyMatcher, computed once per command. """
+
+    __slots__ = ('command', 'tokens', 'required_arguments', 'arguments',
+                 'partials', 'offsets')
+
+    def __init__(self, command):
+        self.command = command
+        self.tokens = command.split()
+        self.required_arguments = len(re.findall('{.*?}', command))
+
+        # Per command token: argument key for '{key}' tokens and
+        # (start, end, key, regex) for arguments embedded in a token
+        self.arguments = []
+        self.partials = []
+        for token in self.tokens:
+            argument = partial = None
+            if '{' in token:
+                key = re.search('{(.*)}', token).groups()[0]
+                if token.startswith('{'):
+                    argument = key
+                else:
+                    start, end = re.match('(.*){.*?}(.*)', token).groups()
+                    partial = (start, end, key, re.compile('{}(.*){}'.format(
+                        re.escape(start), re.escape(end))))
+            self.arguments.append(argument)
+            self.partials.append(partial)
+
+        # offsets[j] is the length of the command up to the end of token j,
+        # spaces excluded
+        self.offsets = []
+        total = 0
+        for token in self.tokens:
+            total += len(token)
+            self.offsets.append(total)
+
+
+_compile_command = functools.lru_cache(maxsize=8192)(_CompiledCommand)
+
+
+class FuzzyMatcher(object):
+    """ Non recursive matcher of search tokens against commands.
+
+        It returns the same results as the recursive _matches_fuzzy_recursive
+        while avoiding its costs:
+
+            * Commands are split and their arguments extracted once
+              (_compile_command) instead of on every call.
+            * Regular token checks and span expressions are computed once per
+              search and shared by every command.
+            * The backtracking runs on an explicit stack of frames, and frames
+              known to fail are remembered so equivalent branches are not
+              explored twice.
+
+        Args:
+            fuzzy (`bool`): whether or not the search tokens can be regex
+    """
+
+    def __init__(self, fuzzy):
+        self.fuzzy = fuzzy
+        self._regular = {}
+        self._expressions = {}
+
+    def is_regular(self, token):
+        try:
+            return self._regular[token]
+        except KeyError:
+            regular = self._regular[token] = _is_regular_token(token)
+            return regular
+
+    def leading_regular_tokens(self, tokens):
+        """ Return the search tokens before the first regex token, as they
+            are compared to the command tokens """
+        if not self.fuzzy:
+            return list(tokens)
+
+        leading = []
+        for token in tokens:
+            if token != '*' and not self.is_regular(token):
+                break
+            leading.append(token.replace(r'\|', '|').replace(r'\.', '.'))
+        return leading
+
+    def _expression(self, pattern):
+        try:
+            return self._expressions[pattern]
+        except KeyError:
+            expression = self._expressions[pattern] = re.compile(pattern)
+            return expression
+
+    def match(self, tokens, command, i=0, j=0, kwargs=None, score=0,
+              required_arguments=None):
+        """ Compares between given tokens and command to see if they match.
+
+            Args:
+                tokens (`list`): the search tokens, not modified
+                command (`str`): the command to be compared with
+                i (`int`): current end of tokens
+                j (`int`): current index of command tokens
+                kwargs (`dict`): the collected arguments
+                score (`int`): the current similarity score
+                required_arguments (`int`): number of arguments command has
+
+            Returns:
+                tuple: (kwargs, score) if search matches the command else None
+        """
+        compiled = _compile_command(command)
+        if required_arguments is None:
+            required_arguments = compiled.required_arguments
+
+        # Frames known to fail, the outcome of a frame only depends on its
+        # positions, tokens and collected argument names
+        failed = set()
+
+        frames = [self._frame(compiled, required_arguments, i, j,
+                              list(tokens), dict(kwargs or {}), score)]
+        # The first frame is never explored twice, no need for its state
+        states = [None]
+        result = None
+
+        while frames:
+            try:
+                child = frames[-1].send(result)
+            except StopIteration as e:
+                frames.pop()
+                result = e.value
+                finished = states.pop()
+                if result is None and finished is not None:
+                    failed.add(finished)
+                continue
+
+            child_i, child_j, child_tokens, child_kwargs, _ = child
+            child_state = (child_i, child_j, tuple(child_tokens),
+                           frozenset(child_kwargs))
+            if child_state in failed:
+                result = None
+                continue
+
+            frames.append(self._frame(compiled, required_arguments, *child))
+            states.append(child_state)
+            result = None
+
+        return result
+
+    def _frame(self, compiled, required_arguments, i, j, tokens, kwargs,
+               score):
+        """ One level of the backtracking. Sub matches are yielded as
+            (i, j, tokens, kwargs, score) and their result is sent back. """
+        fuzzy = self.fuzzy
+        command = compiled.command
+        command_tokens = compiled.tokens
+
+        while i < len(tokens):
+            # If command token index is greater than its length, stop
+            if j >= len(command_tokens):
+                return None
+
+            token = tokens[i]
+            command_token = command_tokens[j]
+            token_is_regular = True
+
+            if fuzzy:
+                # Special case for `show lldp entry *`
+                if token != '*':
+                    token_is_regular = self.is_regular(token)
+
+                if token_is_regular:
+                    # Special cases for `:\|Swap:` and
+                    # `vim-cmd vmsvc/snapshot.get {vmid}`
+                    token = token.replace(r'\|', '|').replace(r'\.', '.')
+
+            if token_is_regular:
+                argument_key = compiled.arguments[j]
+                partial = compiled.partials[j]
+
+                if partial:
+                    # Argument embedded in the token, need to have perfect
+                    # match with the rest of the token
+                    start, end, key, expression = partial
+                    if not (token.startswith(start) and token.endswith(end)):
+                        return None
+                    found = expression.match(token)
+                    if not found:
+                        return None
+                    kwargs[key] = found.groups()[0]
+                    score += 103
+
+                elif argument_key is not None:
+                    i += 1
+                    j += 1
+                    score += 100
+
+                    # Argument can span one token or up to two tokens
+                    endpoint = i + 1 \
+                        if argument_key in SINGLE_TOKEN_ARGUMENTS else i + 2
+                    keep_quotes = 'match' in tokens or 'include' in tokens
+
+                    for index in range(i, endpoint):
+                        if index > len(tokens):
+                            return None
+
+                        # Make sure not to use regex expression as argument
+                        if index > i and fuzzy and \
+                                not self.is_regular(tokens[index - 1]):
+                            return None
+
+                        argument_value = ' '.join(tokens[i - 1:index])
+                        if not keep_quotes:
+                            argument_value = argument_value.rstrip('"')
+                        argument_value = argument_value.replace('\\', '')
+
+                        # Delete the extra tokens if spanning more than one
+                        tokens_copy = tokens[:i] + tokens[index:]
+                        tokens_copy[i - 1] = command_token
+                        kwargs_copy = kwargs.copy()
+                        kwargs_copy.setdefault(argument_key, argument_value)
+
+                        result = yield (i, j, tokens_copy, kwargs_copy, score)
+
+                        if result:
+                            result_kwargs, score = result
+
+                            if len(result_kwargs) == required_arguments:
+                                return result_kwargs, score
+
+                    return None
+
+                elif token == command_token:
+                    # Same token, assign higher score
+                    score += 102
+
+                elif command_token.startswith(token):
+                    # The two tokens are similar to each other, replace
+                    tokens[i] = command_token
+                    score += 100
+
+                else:
+                    return None
+
+                # Matches current, go to next token
+                i += 1
+                j += 1
+                continue
+
+            # Not a token, should be a regex expression. Keep eating if
+            # next token is also regex
+            skipped = 1
+            while i + 1 < len(tokens) and not self.is_regular(tokens[i + 1]):
+                i += 1
+                skipped += 1
+
+            # Match current span with command
+            test = self._expression(' '.join(tokens[:i + 1])).match(command)
+            if not test:
+                return None
+
+            _, end = test.span()
+
+            # Expression matches command to end
+            if i + 1 == len(tokens) and end == len(command):
+                # Match if there are no arguments left in the command
+                if all(argument is None and partial is None
+                       for argument, partial in zip(compiled.arguments[j:],
+                                                    compiled.partials[j:])):
+                    return kwargs, score
+                return None
+
+            # If regex matched nothing, we stop because
+            # expression = "d? a b c" search in "a b c"
+            # expression = "a b d? c" search in "a b c"
+            if end == 0:
+                return None
+
+            # Span single command token
+            if abs(end - compiled.offsets[j] - j) <= 1:
+                if '{' in command_token:
+                    # Faulty match
+                    return None
+                i += 1
+                j += 1
+                continue
+
+            # Span multiple command tokens, find which command token
+            # it spans up to
+            current_sum = 0
+            token_end = 0
+            while current_sum + len(command_tokens[token_end]) <= end:
+                current_sum += len(command_tokens[token_end])
+
+                if current_sum < end:
+                    # Account for space
+                    current_sum += 1
+                    token_end += 1
+
+                    # Expression ends past the last command token
+                    if token_end == len(command_tokens):
+                        return None
+                else:
+                    break
+
+            i += 1
+
+            # For matched range, perform submatches on next real token
+            for subindex in range(j + skipped, token_end + 1):
+                result = yield (i, subindex, tokens.copy(), kwargs.copy(),
+                                score)
+
+                if result:
+                    result_kwargs, score = result
+
+                    # Result kwargs must match number of arguments
+                    # this command requires
+                    if required_arguments == len(result_kwargs):
+                        return result_kwargs, score
+
+            # Fail to match
+            return None
+
+        # Reached end of tokens, match if command pointer is at end
+        if len(command_tokens) == j:
+            return kwargs, score
+        return None
+
+
+def _find_parser_cls(device, data, tokens=None):
+    '''Return the parser class of a registry entry
+
+    The entry found under tokens is the class of the module
+    package.<tokens>.module_name: that module alone is imported. The class
+    is looked up through the abstraction when it is not there.
+    '''
+    if tokens is not None:
+        module = '.'.join([data['package']] + list(tokens) +
+                          [data['module_name']])
+        try:
+            return getattr(importlib.import_module(module), data['class'])
+        except (ImportError, AttributeError):
+            pass
+
     lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
 
     return getattr(getattr(lookup.parser, data['module_name']), data['class'])
@@ -0,0 +1,305 @@
+'''Compact storage of the parsed records of huge tables
+
+A parsed route is a dict of dicts of str: around 2KB of memory for a line
+of 80 characters of output. ``CompactTable`` stores the records column by
+column instead:
+
+    * int and bool fields in ``array`` columns
+    * str fields as interned strings, shared by all the records
+    * dict fields in a child CompactTable, ex: the 'next_hop' of the routes
+
+Records are read through ``CompactRecord`` views, which behave like the
+read-only dicts they replace:
+
+    >>> table = CompactTable()
+    >>> table.add('10.1.1.0/24', {'metric': 2, 'next_hop': {'next_hop': '10.4.1.1'}})
+    >>> table['10.1.1.0/24']['next_hop']['next_hop']
+    '10.4.1.1'
+    >>> table['10.1.1.0/24'] == {'metric': 2, 'next_hop': {'next_hop': '10.4.1.1'}}
+    True
+
+``compact_output`` builds such tables from the records of a parser
+``parse_iter()``, validating each record against the parser schema.
+'''
+
+# python
+import sys
+from array import array
+from collections.abc import Mapping
+
+# metaparser
+from genie.metaparser.util import merge_dict
+from genie.metaparser.util.schemaengine import Schema
+
+# Value of a field missing from a record
+_MISSING = object()
+
+# Missing value of the array columns
+_MISSING_INT = -2 ** 63
+_MISSING_BOOL = -1
+
+
+class _Column(object):
+    '''Values of a field, any type'''
+
+    __slots__ = ('values',)
+
+    def __init__(self, size):
+        self.values = [_MISSING] * size
+
+    def append(self, value):
+        self.values.append(value)
+        return True
+
+    def get(self, row):
+        return self.values[row]
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+class _StrColumn(_Column):
+    '''Values of a str field, interned'''
+
+    __slots__ = ()
+
+    def append(self, value):
+        if value is _MISSING:
+            self.values.append(value)
+        elif isinstance(value, str):
+            self.values.append(sys.intern(value))
+        else:
+            return False
+        return True
+
+
+class _IntColumn(object):
+    '''Values of an int field, in an array'''
+
+    __slots__ = ('values',)
+
+    def __init__(self, size):
+        self.values = array('q', [_MISSING_INT]) * size
+
+    def append(self, value):
+        if value is _MISSING:
+            self.values.append(_MISSING_INT)
+        elif type(value) is int and _MISSING_INT < value < 2 ** 63:
+            self.values.append(value)
+        else:
+            return False
+        return True
+
+    def get(self, row):
+        value = self.values[row]
+        return _MISSING if value == _MISSING_INT else value
+
+    def __iter__(self):
+        return (_MISSING if value == _MISSING_INT else value
+                for value in self.values)
+
+
+class _BoolColumn(object):
+    '''Values of a bool field, in an array'''
+
+    __slots__ = ('values',)
+
+    def __init__(self, size):
+        self.values = array('b', [_MISSING_BOOL]) * size
+
+    def append(self, value):
+        if value is _MISSING:
+            self.values.append(_MISSING_BOOL)
+        elif type(value) is bool:
+            self.values.append(value)
+        else:
+            return False
+        return True
+
+    def get(self, row):
+        value = self.values[row]
+        return _MISSING if value == _MISSING_BOOL else bool(value)
+
+    def __iter__(self):
+        return (_MISSING if value == _MISSING_BOOL else bool(value)
+                for value in self.values)
+
+
+class _TableColumn(object):
+    '''Values of a dict field, stored as rows of a child CompactTable'''
+
+    __slots__ = ('table', 'rows')
+
+    def __init__(self, size):
+        self.table = CompactTable()
+        self.rows = array('q', [-1]) * size
+
+    def append(self, value):
+        if value is _MISSING:
+            self.rows.append(-1)
+        elif type(value) is dict:
+            self.rows.append(self.table._append_row(value))
+        else:
+            return False
+        return True
+
+    def get(self, row):
+        row = self.rows[row]
+        return _MISSING if row < 0 else CompactRecord(self.table, row)
+
+    def __iter__(self):
+        return (self.get(row) for row in range(len(self.rows)))
+
+
+def _new_column(value, size):
+    '''Return the most compact column for the values of the type of value'''
+    if type(value) is bool:
+        return _BoolColumn(size)
+    if type(value) is int:
+        return _IntColumn(size)
+    if type(value) is str:
+        return _StrColumn(size)
+    if type(value) is dict:
+        return _TableColumn(size)
+    return _Column(size)
+
+
+class CompactRecord(Mapping):
+    '''Read-only dict view of one record of a CompactTable'''
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key):
+        column = self._table._columns.get(key)
+        if column is not None:
+            value = column.get(self._row)
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        row = self._row
+        for name, column in self._table._columns.items():
+            if column.get(row) is not _MISSING:
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        '''Return the record as a dict of dicts'''
+        return {key: value.to_dict() if isinstance(value, CompactRecord)
+                else value for key, value in self.items()}
+
+
+class CompactTable(Mapping):
+    '''Read-only dict of records, stored column by column
+
+    Records are added with ``add(key, record)`` and read back as
+    ``CompactRecord`` views. Adding a record under an existing key merges
+    both records.
+    '''
+
+    def __init__(self):
+        self._columns = {}
+        self._index = {}
+        self._size = 0
+
+    def _append_row(self, record):
+        row = self._size
+        columns = self._columns
+        for name, column in columns.items():
+            value = record.get(name, _MISSING)
+            if not column.append(value):
+                # value does not fit the column, fall back to a generic one
+                values = list(column)
+                column = columns[name] = _Column(0)
+                column.values = values
+                column.append(value)
+
+        for name, value in record.items():
+            if name not in columns:
+                column = columns[name] = _new_column(value, row)
+                column.append(value)
+
+        self._size += 1
+        return row
+
+    def add(self, key, record):
+        '''Add record, a dict of dicts, under key'''
+        if isinstance(key, str):
+            key = sys.intern(key)
+        if key in self._index:
+            record = merge_dict(self[key].to_dict(), record, update=True)
+        self._index[key] = self._append_row(record)
+
+    def __getitem__(self, key):
+        return CompactRecord(self, self._index[key])
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        '''Return the table as a dict of dicts'''
+        return {key: self[key].to_dict() for key in self._index}
+
+
+def compact_output(records, result_dict, path, schema=None):
+    '''Store the records of a parser parse_iter() in CompactTable
+
+    Args:
+        records (iterator): (context, record) yielded by parse_iter(), the
+            last item of context being the key of the record
+        result_dict (`dict`): parsed output the records belong to, the
+            tables are added to it once every record is stored
+        path (`tuple`): keys of the tables in result_dict, an int being the
+            index of the key in context, ex: ('vrf', 0, 'address_family', 1,
+            'routes') for (vrf, address_family, route) contexts
+        schema (`dict`): when given, each record is validated against it,
+            under its path
+
+    Returns:
+        dict: result_dict
+    '''
+    validator = Schema(schema) if schema else None
+    tables = {}
+    for context, record in records:
+        if validator is not None:
+            validator.validate(_nest(path, context, {context[-1]: record}))
+        table = tables.get(context[:-1])
+        if table is None:
+            table = tables[context[:-1]] = CompactTable()
+        table.add(context[-1], record)
+
+    for context, table in tables.items():
+        container = result_dict
+        for item in path[:-1]:
+            if isinstance(item, int):
+                item = context[item]
+            container = container.setdefault(item, {})
+        container[path[-1]] = table
+    return result_dict
+
+
+def _nest(path, context, value):
+    for item in reversed(path):
+        if isinstance(item, int):
+            item = context[item]
+        value = {item: value}
+    return value
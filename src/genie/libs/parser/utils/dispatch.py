@@ -0,0 +1,450 @@
+'''Line dispatch engine for the cli parsers
+
+A cli parser usually tries its patterns one after the other on every line of
+the output until one of them matches:
+
+    for line in out.splitlines():
+        m = p1.match(line)
+        if m:
+            ...
+            continue
+
+        m = p2.match(line)
+        ...
+
+With 50 patterns, most lines go through dozens of failing matches.
+``LineDispatcher`` keeps the same first match wins order but only tries the
+patterns which can match the line. The literal text a pattern requires is
+extracted once from the pattern itself:
+
+    * its literal prefix, ex: 'Description:' for r'^Description: *(?P<d>.*)$'
+      (the pattern is only tried on lines starting with it)
+    * otherwise its longest required literal, ex: ' runts,' for
+      r'^(?P<in_runts>[0-9]+) *runts,' (only tried on lines containing it)
+
+Example:
+
+    dispatcher = LineDispatcher()
+
+    # Description: desc
+    @dispatcher.rule(p3)
+    def handle_p3(m):
+        interface_dict[interface]['description'] = m.groupdict()['description']
+
+    for line in out.splitlines():
+        dispatcher.dispatch(line.strip())
+
+A handler returning ``FALLTHROUGH`` lets the following rules try the line,
+like a parser block which does not ``continue``. A handler returning ``STOP``
+takes the line, and ``dispatch()`` returns ``STOP`` for the parser to stop.
+
+The rules may declare the keys of the schema their handler sets, for the
+parses of a few fields, see genie.libs.parser.utils.projection:
+
+    @dispatcher.rule(p3, keys=['description'])
+    def handle_p3(m):
+        ...
+
+    dispatcher = dispatcher.project(projection)
+'''
+
+# python
+import re
+import functools
+
+try:
+    from re import _parser as sre_parse
+    from re import _compiler as sre_compile
+    from re import _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_compile
+    import sre_constants
+
+# Returned by a handler to let the following rules try the line
+FALLTHROUGH = object()
+
+# Returned by a handler to stop the dispatch of the following lines
+STOP = object()
+
+_LITERAL = sre_constants.LITERAL
+_SUBPATTERN = sre_constants.SUBPATTERN
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_BEGINNINGS = (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING)
+_ENDS = (sre_constants.AT_END, sre_constants.AT_END_STRING)
+
+# re.Pattern is only available from python 3.7, and re.compile() may be
+# wrapped, ex: by the parser telemetry
+_PATTERN_TYPE = type(sre_compile.compile('', 0))
+
+# Shorter required literals are not worth the substring check
+MIN_NEEDLE_LENGTH = 3
+
+
+def _repeated_literal(op, av):
+    '''Character repeated at least once by ``av``, ex: ' ' for ' +' '''
+    if op in _REPEATS and av[0] >= 1 and len(av[2]) == 1 \
+            and av[2][0][0] is _LITERAL:
+        return chr(av[2][0][1])
+    return None
+
+
+def _scan(items, runs):
+    '''Collect in runs the literal texts every match of items contains.
+
+    Returns:
+        (str, bool): the literal prefix of items and whether items only
+                     consist of literals
+    '''
+    prefix = []
+    run = []
+    complete = True
+    for op, av in items:
+        if op is _LITERAL:
+            run.append(chr(av))
+            if complete:
+                prefix.append(chr(av))
+            continue
+
+        char = _repeated_literal(op, av)
+        if char is not None:
+            # ' +' ends the run with one space and starts the next one
+            # with one space
+            run.append(char)
+            runs.append(''.join(run))
+            run = [char]
+            if complete:
+                prefix.append(char)
+            complete = False
+            continue
+
+        # (group, add_flags, del_flags, items), (group, items) before 3.6
+        if op is _SUBPATTERN and not (len(av) == 4 and av[1] & re.IGNORECASE):
+            # Capturing or non capturing group, its content is required
+            sub_runs = []
+            sub_prefix, sub_complete = _scan(av[-1], sub_runs)
+            if sub_complete:
+                run.append(sub_prefix)
+                if complete:
+                    prefix.append(sub_prefix)
+                continue
+            run.append(sub_runs[0])
+            runs.append(''.join(run))
+            runs.extend(sub_runs[1:-1])
+            run = [sub_runs[-1]]
+            if complete:
+                prefix.append(sub_prefix)
+            complete = False
+            continue
+
+        runs.append(''.join(run))
+        run = []
+        complete = False
+
+    runs.append(''.join(run))
+    return ''.join(prefix), complete
+
+
+@functools.lru_cache(maxsize=8192)
+def _literal_keys(pattern, flags):
+    if not isinstance(pattern, str) or flags & re.IGNORECASE:
+        return '', ''
+    try:
+        items = list(sre_parse.parse(pattern, flags))
+    except Exception:
+        return '', ''
+
+    if items and items[0][0] is sre_constants.AT \
+            and items[0][1] in _BEGINNINGS:
+        items = items[1:]
+
+    runs = []
+    prefix, _ = _scan(items, runs)
+    if prefix:
+        return prefix, ''
+    needle = max(runs, key=len, default='')
+    if len(needle) < MIN_NEEDLE_LENGTH:
+        needle = ''
+    return '', needle
+
+
+def _is_space(op, av):
+    '''Return True if the item only matches whitespace, ex: ' ', '\\s*' '''
+    if op is _LITERAL:
+        return chr(av).isspace()
+    if op is sre_constants.IN:
+        return list(av) == [(sre_constants.CATEGORY,
+                             sre_constants.CATEGORY_SPACE)]
+    if op in _REPEATS and len(av[2]) == 1:
+        return _is_space(*av[2][0])
+    return False
+
+
+def _first(items):
+    '''Characters the text matched by items may start with, None when
+    unknown. '' stands for the end of the line.'''
+    if not items:
+        return None
+    op, av = items[0]
+    if op is _LITERAL:
+        chars = {chr(av)}
+    elif op is sre_constants.IN:
+        chars = set()
+        for in_op, in_av in av:
+            if in_op is _LITERAL:
+                chars.add(chr(in_av))
+            elif in_op is sre_constants.RANGE and in_av[1] - in_av[0] < 256:
+                chars.update(chr(c) for c in range(in_av[0], in_av[1] + 1))
+            else:
+                # Negated sets and categories, ex: \d also matches the
+                # digits of the other scripts
+                return None
+    elif op in _REPEATS and av[0] >= 1:
+        return _first(av[2])
+    elif op is _SUBPATTERN and not (len(av) == 4 and av[1] & re.IGNORECASE):
+        return _first(av[-1])
+    elif op is sre_constants.AT and av in _ENDS:
+        return frozenset([''])
+    else:
+        return None
+    if any(char.isspace() for char in chars):
+        return None
+    return frozenset(chars)
+
+
+@functools.lru_cache(maxsize=8192)
+def _lead_keys(pattern, flags):
+    if not isinstance(pattern, str) or flags & re.IGNORECASE:
+        return '', None
+    try:
+        items = list(sre_parse.parse(pattern, flags))
+    except Exception:
+        return '', None
+
+    if items and items[0][0] is sre_constants.AT \
+            and items[0][1] in _BEGINNINGS:
+        items = items[1:]
+    while items and _is_space(*items[0]):
+        items = items[1:]
+
+    lead, _ = _scan(items, [])
+    if lead[:1].isspace():
+        lead = ''
+    return lead, _first(items)
+
+
+def lead_keys(pattern):
+    '''Return what follows the leading whitespace of the lines matching a
+    pattern, ex: ('Description:', {'D'}) for r'^\\s*Description: *(?P<d>.*)$'
+
+    Args:
+        pattern (`re.Pattern`): pattern used with ``pattern.match(line)``
+
+    Returns:
+        tuple: ``lead``, the text following the leading whitespace, '' when
+               unknown, and ``first``, the set of its possible first
+               characters, '' for blank lines, None when unknown.
+    '''
+    pattern = getattr(pattern, 'compiled', pattern)
+    if not isinstance(pattern, _PATTERN_TYPE):
+        return '', None
+    return _lead_keys(pattern.pattern, pattern.flags)
+
+
+def literal_keys(pattern):
+    '''Return the (prefix, needle) literals required by a pattern match
+
+    Args:
+        pattern (`re.Pattern`): pattern used with ``pattern.match(line)``
+
+    Returns:
+        tuple: ``prefix``, the text any matching line starts with, and when
+               there is none, ``needle``, a text any matching line contains.
+               Both are '' when nothing is known about the matching lines.
+    '''
+    return _literal_keys(pattern.pattern, pattern.flags)
+
+
+class _Rule(object):
+
+    __slots__ = ('pattern', 'test', 'handler', 'prefix', 'needle', 'keys')
+
+    def __init__(self, pattern, test, handler, prefix, needle, keys=None):
+        self.pattern = pattern
+        self.test = test
+        self.handler = handler
+        self.prefix = prefix
+        self.needle = needle
+        self.keys = keys
+
+    def disjoint(self, other):
+        '''Return True if no line can match both rules'''
+        if self.prefix and other.prefix and \
+                not self.prefix.startswith(other.prefix) and \
+                not other.prefix.startswith(self.prefix):
+            return True
+        # The patterns starting with '^\\s*', once past the whitespace
+        lead, first = lead_keys(self.pattern)
+        other_lead, other_first = lead_keys(other.pattern)
+        if lead and other_lead:
+            return not lead.startswith(other_lead) and \
+                not other_lead.startswith(lead)
+        return first is not None and other_first is not None and \
+            first.isdisjoint(other_first)
+
+
+def _ignore(m):
+    '''Handler of the rules setting no projected key'''
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _layout(firsts):
+    '''Per first character cache of the candidate rule indexes, shared by
+       the dispatchers having the same rules'''
+    return {}
+
+
+class LineDispatcher(object):
+    '''Route each output line to the first (pattern, handler) rule matching it
+
+    Rules are tried in the order they were added, only the rules whose
+    literal prefix or required literal is in the line are tried.
+
+    Args:
+        rules (`list`): optional (pattern, handler) pairs
+    '''
+
+    # Set to False to try every rule on every line, ex: for benchmarks
+    prefilter = True
+
+    def __init__(self, rules=None):
+        self._rules = []
+        self._by_first = {}
+        self._layout = None
+        for pattern, handler in rules or ():
+            self.add(pattern, handler)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def add(self, pattern, handler, keys=None):
+        '''Add a rule, tried after the rules already added
+
+        Args:
+            pattern (`re.Pattern` or `callable`): compiled pattern, tried with
+                ``pattern.match(line)``, or a callable returning a true value
+                when the handler must be called for the line
+            handler (`callable`): called with the match object (or the value
+                returned by the callable), may return ``FALLTHROUGH`` or
+                ``STOP``
+            keys (`list`): keys of the schema the handler sets, containers
+                included; None for the handlers which must always run, ex:
+                the handlers keeping the state of the parser
+        '''
+        if isinstance(pattern, _PATTERN_TYPE) or \
+                isinstance(getattr(pattern, 'compiled', None), _PATTERN_TYPE):
+            # Compiled, or wrapping a compiled pattern, ex: CountingPattern
+            prefix, needle = literal_keys(pattern)
+            test = pattern.match
+        elif callable(pattern):
+            prefix = needle = ''
+            test = pattern
+        else:
+            raise TypeError('pattern must be a compiled regex or a callable, '
+                            'not {!r}'.format(pattern))
+        self._rules.append(_Rule(pattern, test, handler, prefix, needle,
+                                 frozenset(keys) if keys is not None
+                                 else None))
+        self._by_first = {}
+        self._layout = None
+
+    def rule(self, *patterns, keys=None):
+        '''Decorator adding the decorated function as handler of each of
+           the patterns, in the given order'''
+        def decorator(handler):
+            for pattern in patterns:
+                self.add(pattern, handler, keys=keys)
+            return handler
+        return decorator
+
+    def project(self, projection):
+        '''Return a dispatcher of the rules setting keys of projection
+
+        The rules setting none of its keys are left out, or kept with a
+        handler ignoring their lines when a following rule could match them
+        too. Their handlers must not return ``FALLTHROUGH``.
+
+        Args:
+            projection (`Projection`): fields of the parse, None for all
+        '''
+        if projection is None:
+            return self
+        rules = []
+        kept = []
+        for rule in reversed(self._rules):
+            if rule.keys is None or projection.wants(rule.keys):
+                kept.append(rule)
+                rules.append(rule)
+            elif not all(rule.disjoint(other) for other in kept):
+                rules.append(_Rule(rule.pattern, rule.test, _ignore,
+                                   rule.prefix, rule.needle, rule.keys))
+        dispatcher = LineDispatcher()
+        dispatcher._rules = rules[::-1]
+        return dispatcher
+
+    def _candidates(self, first):
+        try:
+            return self._by_first[first]
+        except KeyError:
+            pass
+
+        if self._layout is None:
+            self._layout = _layout(tuple(rule.prefix[:1]
+                                         for rule in self._rules))
+        try:
+            indexes = self._layout[first]
+        except KeyError:
+            indexes = self._layout[first] = tuple(
+                index for index, rule in enumerate(self._rules)
+                if not rule.prefix or rule.prefix[0] == first)
+
+        candidates = self._by_first[first] = \
+            tuple(self._rules[index] for index in indexes)
+        return candidates
+
+    def candidates(self, line):
+        '''Return the handlers of the rules which could match line'''
+        if not self.prefilter:
+            return [rule.handler for rule in self._rules]
+        return [rule.handler for rule in self._candidates(line[:1])
+                if line.startswith(rule.prefix) and rule.needle in line]
+
+    def dispatch(self, line):
+        '''Call the handler of the first rule matching line
+
+        Returns:
+            bool: True if a handler took the line, or ``STOP`` if the handler
+                  returned it
+        '''
+        if self.prefilter:
+            rules = self._candidates(line[:1])
+        else:
+            rules = self._rules
+
+        for rule in rules:
+            if self.prefilter:
+                if rule.prefix:
+                    if not line.startswith(rule.prefix):
+                        continue
+                elif rule.needle and rule.needle not in line:
+                    continue
+            m = rule.test(line)
+            if m:
+                result = rule.handler(m)
+                if result is STOP:
+                    return STOP
+                if result is not FALLTHROUGH:
+                    return True
+        return False
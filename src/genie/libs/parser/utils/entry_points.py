@@ -34,7 +34,6 @@ example 'nxos', and the value is a list of MetaParser class definitions.
 """
 
 import sys
-import pkg_resources
 import logging
 
 from .common import parser_data
@@ -79,8 +78,15 @@ def add_parser(parser, os_name):
             'class': parser.__name__
         }
 
+    # Nested entries were changed in place, refresh the registry indexes.
+    # This also drops the cached get_parser() results.
+    parser_data.invalidate()
+
 
 def load_entry_points():
+    # pkg_resources is slow to import, only when the parsers are needed
+    import pkg_resources
+
     for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
         loader_function = ep.load()
         if not callable(loader_function):
@@ -94,4 +100,5 @@ def load_entry_points():
                 add_parser(parser=parser, os_name=os_name)
 
 
-load_entry_points()
+# The parsers of the entry points are added when the registry is loaded
+parser_data.add_load_hook(load_entry_points)
@@ -1,3 +1,4 @@
+import os
 import logging
 import pathlib
 import inspect
@@ -5,8 +6,13 @@ import itertools
 import importlib
 from genie.metaparser import MetaParser
 
+from .registry import _registry_cache_path, read_cache, write_cache
+
 log = logging.getLogger(__name__)
 
+# Bump whenever the layout of the output changes
+EXTEND_CACHE_VERSION = 1
+
 class ExtendParsers(object):
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
@@ -94,6 +100,47 @@ class ExtendParsers(object):
                 # item is a python file. Find all parsers in file.
                 self._add_parsers(item, token)
 
-    def extend(self):
-        # Walk all file in there and go through the parsers
-        self._recursive_find(pathlib.Path(self.module_loc), [])
+    def _module_stats(self):
+        '''Size and modification time of the modules _recursive_find()
+        walks'''
+        stats = []
+        for root, dirs, files in os.walk(self.module_loc):
+            dirs[:] = sorted(d for d in dirs if d not in self.IGNORE_DIR)
+            for name in sorted(files):
+                if name in self.IGNORE_FILE or not name.endswith('.py'):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                stats.append((os.path.relpath(os.path.join(root, name),
+                                              self.module_loc),
+                              stat.st_size, stat.st_mtime_ns))
+        return stats
+
+    def extend(self, cache=False, cache_dir=None):
+        '''Find the parsers of the package
+
+        Args:
+            cache (`bool`): reuse the parsers found by a previous process
+                            while the modules are unchanged, without
+                            importing them; the modules are then imported
+                            when their parsers are used
+            cache_dir (`str`): directory of the cache, see
+                               load_registry_file()
+        '''
+        if cache:
+            header = (EXTEND_CACHE_VERSION, self.package,
+                      self._module_stats())
+            cache_path = _registry_cache_path(self.module_loc, cache_dir,
+                                              name='extend')
+            output = read_cache(cache_path, header)
+            if output is None:
+                self._recursive_find(pathlib.Path(self.module_loc), [])
+                write_cache(cache_path, header, self.output)
+            else:
+                self.output = output
+        else:
+            # Walk all file in there and go through the parsers
+            self._recursive_find(pathlib.Path(self.module_loc), [])
+
+        # Parsers resolved by get_parser() may now be overridden
+        from .common import clear_parser_cache
+        clear_parser_cache()
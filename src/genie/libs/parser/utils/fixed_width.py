@@ -0,0 +1,320 @@
+'''Fixed-width table engine for the column aligned cli outputs
+
+Tables such as 'show interface status' align their values under the titles
+of a header line:
+
+    Port          Name               Status    Vlan      Duplex  Speed   Type
+    Eth1/1        KeepAlive          connected routed    full    10G     10g
+    mgmt0         --                 connected routed    full    1000    --
+
+A regex per row tries every split of the line in the fields, backtracking
+when a value is empty or holds a space. ``FixedWidthTable`` learns the span
+of each column from the header line once, then cuts the rows at these
+offsets:
+
+    table = FixedWidthTable([
+        Column('interface', 'Port'),
+        Column('name', 'Name', optional=True),
+        Column('status', 'Status'),
+        ...
+        Column('type', 'Type', optional=True),
+    ])
+
+    for line, row in table.scan(out.splitlines()):
+        if row is None:
+            # not a row of the table, or not aligned under its header
+            m = p1.match(line.strip())
+            ...
+            continue
+
+        intf_dict['status'] = row['status']
+
+A value is aligned under the start of its title, or under its end for the
+columns with ``align='right'``, ex: the counters of 'show ip bgp summary'.
+The values aligned with ``align='any'`` may start anywhere from the start
+of their title. The last column takes the rest of the line. A value longer
+than its column overflows into the next one when the next value is empty or
+right aligned.
+The rows which do not fit, ex: misaligned or holding an empty required
+value, are returned as None: the parser falls back to its regex for them.
+
+A table with ``wrap=True`` joins the rows whose first value is alone on its
+line with the next line, ex: the long device ids of 'show cdp neighbors':
+
+    Device ID        Local Intrfce     Holdtme    Capability  Platform  Port ID
+    ott-bgp-laas(JAF1429BAKA)
+                     Eth1/39/1         159        R S I s     N9K-C9348 Eth1/3
+'''
+
+from operator import itemgetter
+
+# Alignments of the values of a column under its title
+LEFT = 'left'
+RIGHT = 'right'
+# Anywhere from the start of the title to the next column
+ANY = 'any'
+
+
+class Column(object):
+    '''Column of a FixedWidthTable
+
+    Args:
+        key (`str`): key of its value in the rows
+        title (`str`): title of the column in the header line
+        align (`str`): 'left' for the values starting under the start of the
+                       title, 'right' for the values ending under its end, or
+                       'any' for the values anywhere from the start of the
+                       title, ex: the capabilities of 'show cdp neighbors'
+        optional (`bool`): the value may be empty, '' in the rows
+        check (callable): check(value) returning False for the values of the
+                          rows the parser falls back to its regex for,
+                          ex: str.isdigit
+    '''
+
+    __slots__ = ('key', 'title', 'align', 'optional', 'check')
+
+    def __init__(self, key, title, align=LEFT, optional=False, check=None):
+        if align not in (LEFT, RIGHT, ANY):
+            raise ValueError("align is 'left', 'right' or 'any', not "
+                             "'{a}'".format(a=align))
+        self.key = key
+        self.title = title
+        self.align = align
+        self.optional = optional
+        self.check = check
+
+    def __repr__(self):
+        return 'Column({k!r}, {t!r})'.format(k=self.key, t=self.title)
+
+
+class FixedWidthTable(object):
+    '''Table of a cli output, sliced at the column offsets of its header
+
+    Args:
+        columns (list): Column of the table, in order
+        wrap (`bool`): join the lines holding only the first value with the
+                       next line, whose first value is empty
+    '''
+
+    def __init__(self, columns, wrap=False):
+        self.columns = list(columns)
+        if not self.columns:
+            raise ValueError('A table has at least one column')
+        self.wrap = wrap
+        self._words = ' '.join(column.title
+                               for column in self.columns).split()
+        self._first = self.columns[0].title
+        # (key, start, end, align, optional, check, offset of the following
+        # cut) of each column, learnt from the header
+        self._layout = None
+        self._fast = None
+
+    @property
+    def spans(self):
+        '''(start, end) offsets of each title in the header, None before it
+        is seen'''
+        if self._layout is None:
+            return None
+        return [column[1:3] for column in self._layout]
+
+    def header(self, line):
+        '''Learn the column offsets from line if it is the header
+
+        Returns:
+            bool: True if line is the header of the table
+        '''
+        if self._first not in line or line.split() != self._words:
+            return False
+        layout = []
+        position = 0
+        for column in self.columns:
+            start = line.index(column.title, position)
+            position = end = start + len(column.title)
+            layout.append((column.key, start, end, column.align,
+                           column.optional, column.check))
+
+        # Offset of the cut before each column: a left aligned value starts
+        # under the start of its title, a right aligned one after the end of
+        # the previous title
+        cuts = [0 if layout[0][3] == RIGHT else layout[0][1]]
+        cuts.extend(start if align != RIGHT else previous[2]
+                    for previous, (_, start, _, align, _, _)
+                    in zip(layout, layout[1:]))
+        self._start = cuts[0]
+        self._layout = [column + (following,) for column, following
+                        in zip(layout, cuts[1:] + [None])]
+        self._fast = self._compile()
+        return True
+
+    def _compile(self):
+        '''Return the getters slicing the rows which fit the layout without
+        overflowing, in C, or None for the layouts _row() is left to'''
+        layout = self._layout
+        if len(layout) < 2 or layout[-1][3] == RIGHT:
+            return None
+        # Offsets which are blank in the rows: the indentation, the last
+        # offset before each left aligned value and the first offset after
+        # each right aligned one
+        blanks = list(range(self._start))
+        # Offset of the first character of the left aligned values and of the
+        # last one of the right aligned values, blank when the value is empty
+        anchors = []
+        anchored = []
+        slices = []
+        cut = self._start
+        for index, (_, start, end, align, _, _, following) in \
+                enumerate(layout):
+            slices.append(slice(cut, following))
+            if index and align != RIGHT:
+                blanks.append(cut - 1)
+            elif index:
+                blanks.append(cut)
+            if align == LEFT:
+                anchors.append(cut)
+                anchored.append(index)
+            elif align == RIGHT:
+                anchors.append(end - 1)
+                anchored.append(index)
+                if following > end:
+                    blanks.append(end)
+            cut = following
+        if not anchors:
+            return None
+        required = [index for index, column in enumerate(layout)
+                    if not column[4]]
+        checks = [(index, column[5]) for index, column in enumerate(layout)
+                  if column[5] is not None]
+        return (max(blanks + anchors) + 1, _getter(blanks),
+                (' ',) * len(blanks) if len(blanks) > 1 else (' ', ' '),
+                itemgetter(*slices), _getter(anchors), _getter(anchored),
+                _getter(required), checks,
+                [column[0] for column in layout])
+
+    def row(self, line):
+        '''Return the values of line, a row of the table
+
+        Returns:
+            dict: the stripped value of each column, None if line does not
+                  fit the table or before its header
+        '''
+        return self._row(line, None)
+
+    def scan(self, lines):
+        '''Yield (line, row) of each line, row being None for the header and
+        the lines which are not rows of the table
+
+        The line holding only the first value of a wrapping table is held,
+        then yielded with the row of the next line, or alone if the next line
+        does not continue it.
+        '''
+        held = value = None
+        for line in lines:
+            if held is not None:
+                row = self._row(line, value)
+                if row is not None:
+                    held = None
+                    yield line, row
+                    continue
+                yield held, None
+                held = None
+
+            if self.header(line):
+                yield line, None
+                continue
+            row = self._row(line, None)
+            if row is None and self.wrap:
+                value = self._alone(line)
+                if value is not None:
+                    held = line
+                    continue
+            yield line, row
+
+        if held is not None:
+            yield held, None
+
+    def _row(self, line, first):
+        '''Return the values of line, whose first value is first and blank
+        in line if it is not None'''
+        fast = self._fast
+        if fast is not None and first is None:
+            width, blank, blanks, slices, anchors, anchored, required, \
+                checks, keys = fast
+            line_ = line.ljust(width)
+            if blank(line_) == blanks:
+                values = tuple(map(str.strip, slices(line_)))
+                # Each non empty value is under its anchor
+                if anchored(values).count('') == anchors(line_).count(' ') \
+                        and (required is None or '' not in required(values)) \
+                        and all(check(values[index]) for index, check
+                                in checks if values[index]):
+                    return dict(zip(keys, values))
+
+        layout = self._layout
+        if layout is None:
+            return None
+        length = len(line)
+        cut = self._start
+        if cut and line[:cut].strip():
+            return None
+
+        row = {}
+        for key, start, end, align, optional, check, following in layout:
+            if following is None:
+                following = length
+            elif following < cut:
+                # The previous value overflowed up to this cut
+                following = cut
+            elif 0 < following < length and line[following] != ' ' \
+                    and line[following - 1] != ' ':
+                # The value overflows into the next column
+                following = line.find(' ', following)
+                if following < 0:
+                    following = length
+
+            segment = line[cut:following]
+            value = segment.strip()
+            if first is not None:
+                if value:
+                    return None
+                value = first
+                first = None
+            elif not value:
+                if not optional:
+                    return None
+            elif align == LEFT:
+                if segment[0] == ' ':
+                    return None
+            elif align == RIGHT:
+                if cut + len(segment.rstrip()) != end:
+                    return None
+            elif cut > start and line[cut - 1] != ' ':
+                # The value follows an overflowing one
+                return None
+            if check is not None and value and not check(value):
+                return None
+            row[key] = value
+            cut = following
+        return row
+
+    def _alone(self, line):
+        '''Return the first value of line if it holds nothing else'''
+        layout = self._layout
+        if layout is None or len(layout) < 2:
+            return None
+        value = line.strip()
+        start = self._start
+        if not value or ' ' in value or \
+                line[start:start + len(value)] != value or \
+                line[:start].strip():
+            return None
+        return value
+
+
+def _getter(items):
+    '''Return itemgetter(*items), returning a tuple even for one item, or
+    None for no item'''
+    if not items:
+        return None
+    if len(items) == 1:
+        items = items * 2
+    return itemgetter(*items)
@@ -0,0 +1,302 @@
+'''Structured output of the Junos parsers
+
+The Junos schemas mirror the XML output of the commands: 'route-information',
+'rt-entry', '@junos:seconds'... Junos prints this output itself with
+``| display json`` or ``| display xml``. Mapping it into the schema skips
+the regular expressions of ``cli()`` and does not depend on the layout of
+the text output. Whether it is faster depends on the parser: the json output
+is larger than the text one, see tools/benchmarks/bench_junos_structured.py.
+
+Parsers deriving from ``JunosStructured`` have two more contexts:
+
+    class ShowRoute(ShowRouteSchema, JunosStructured):
+        ...
+
+    >>> device.parse('show route protocol bgp extensive', context='json')
+    >>> device.parse('show route protocol bgp extensive', context='xml')
+
+The command of ``cli()`` is run with ``| display json`` (or xml) and its
+output is mapped into the schema of the parser:
+
+    * elements and attributes the schema does not know are dropped
+    * lists of the schema are lists, even of one element; lists validated
+      with ``ListValidator(..., allow_dict=True)`` are a dict when they hold
+      one element, as parsed by ``cli()``
+    * an element with attributes is a dict of its '@' attributes and '#text'
+
+When the command or the mapping fails, ex: an older release, or an output
+missing a key the schema requires, the parser falls back to ``cli()``.
+
+The translation of the keys of each dict of a schema is built once and
+shared by all the parsers using that schema.
+'''
+
+# metaparser
+from genie.metaparser.util.schemaengine import Optional, Any, Use
+
+# parser utils
+from .validation import ListValidator
+from .structured import StructuredParser, StructuredOutputError, load_json
+
+# Kinds of schema node
+_DICT, _LIST, _LEAF, _USE, _GENERIC = range(5)
+
+# Translator of each schema node, by id of the node. The node is kept with
+# its translator so that its id is not reused
+_translators = {}
+
+
+class JunosStructured(StructuredParser):
+    '''Mixin of the Junos parsers adding the 'json' and 'xml' contexts'''
+
+    def json(self, output=None, **kwargs):
+        '''Parse the command with '| display json', or fall back to cli()'''
+        return self.structured_parse(
+            'display json', lambda out: json_to_schema(self.schema, out),
+            output=output, **kwargs)
+
+    def xml(self, output=None, **kwargs):
+        '''Parse the command with '| display xml', or fall back to cli()'''
+        return self.structured_parse(
+            'display xml', lambda out: xml_to_schema(self.schema, out),
+            output=output, **kwargs)
+
+
+def json_to_schema(schema, output):
+    '''Map the output of '| display json' into the schema
+
+    Args:
+        schema (`dict`): schema of the parser
+        output (`str`): output of the command
+
+    Returns:
+        dict following the schema
+
+    Raises:
+        StructuredOutputError: the output does not fit the schema
+    '''
+    return _root(schema, load_json(output))
+
+
+def xml_to_schema(schema, output):
+    '''Map the output of '| display xml' into the schema
+
+    Args:
+        schema (`dict`): schema of the parser
+        output (`str`): output of the command
+
+    Returns:
+        dict following the schema
+
+    Raises:
+        StructuredOutputError: the output does not fit the schema
+    '''
+    import xmltodict
+
+    try:
+        document = xmltodict.parse(output[output.index('<'):])
+    except Exception as e:
+        raise StructuredOutputError('Invalid xml output: {e}'.format(e=e))
+
+    # <rpc-reply xmlns:junos="..."> holds the output, its attributes go
+    # to the top of the schema, ex: '@xmlns:junos'
+    root = document.get('rpc-reply', document)
+    element = _xml_elements(root)[0]
+    return _root(schema, element)
+
+
+def _root(schema, element):
+    parsed = _element(_translator(schema), element)
+    if not any(key for key in parsed if not key.startswith('@')):
+        raise StructuredOutputError('No element of the output is in the '
+                                    'schema')
+    return parsed
+
+
+def _translator(schema):
+    '''Return the (kind, ...) translator of a schema node, built once
+
+    The translator of a dict holds the translators of its keys, mapping an
+    output does not go back to the schema.
+    '''
+    found = _translators.get(id(schema))
+    if found is not None and found[0] is schema:
+        return found[1]
+
+    node = schema
+    if isinstance(node, Use):
+        node = node.schema
+    if isinstance(node, dict):
+        keys = {}
+        required = set()
+        wildcard = None
+        for key, value in node.items():
+            if isinstance(key, Any):
+                wildcard = _translator(value)
+                continue
+            if isinstance(key, Optional):
+                key = key.schema
+            else:
+                required.add(key)
+            keys[key] = _translator(value)
+        translator = (_DICT, keys, frozenset(required), wildcard)
+    elif isinstance(node, ListValidator):
+        translator = (_LIST, _translator(node.schema.schema), node.allow_dict)
+    elif isinstance(node, list) and len(node) == 1:
+        translator = (_LIST, _translator(node[0]), False)
+    elif node in (str, int, float, bool):
+        translator = (_LEAF, node)
+    elif node is not schema and callable(node):
+        # Validation function the schema does not describe
+        translator = (_USE, node)
+    else:
+        translator = (_GENERIC,)
+
+    _translators[id(schema)] = (schema, translator)
+    return translator
+
+
+def _value(translator, elements):
+    '''Map the list of elements of a key'''
+    kind = translator[0]
+    if kind == _LIST:
+        items = [_element(translator[1], element) for element in elements]
+        if translator[2] and len(items) == 1:
+            return items[0]
+        return items
+    if kind == _GENERIC:
+        return _generic(elements)
+    if kind == _USE:
+        return _checked(translator[1], _generic(elements))
+    if len(elements) != 1:
+        raise StructuredOutputError('{n} elements where the schema expects '
+                                    'one'.format(n=len(elements)))
+    return _element(translator, elements[0])
+
+
+def _element(translator, element):
+    '''Map one element'''
+    kind = translator[0]
+
+    if kind == _DICT:
+        _, keys, required, wildcard = translator
+        parsed = {}
+        for name, value in element.items():
+            child = keys.get(name)
+            if child is not None:
+                # Most keys are text, mapped here without more calls
+                if child[0] == _LEAF and child[1] is str and \
+                        len(value) == 1:
+                    data = value[0].get('data')
+                    if data.__class__ is str:
+                        parsed[name] = data
+                        continue
+                parsed[name] = _value(child, value)
+            elif name == 'attributes':
+                for attribute, text in value.items():
+                    key = '@' + attribute
+                    if key in keys:
+                        parsed[key] = text
+            elif name == 'data':
+                if '#text' in keys and value != [None]:
+                    parsed['#text'] = value
+            elif wildcard is not None:
+                parsed[name] = _value(wildcard, value)
+        if not required.issubset(parsed):
+            raise StructuredOutputError('Missing {k}'.format(
+                k=sorted(required.difference(parsed))))
+        return parsed
+
+    if kind == _LEAF:
+        data = element.get('data')
+        if data == [None]:
+            # Empty element, a flag or an empty text
+            if translator[1] is bool:
+                return True
+            if translator[1] is str:
+                return ''
+        if not isinstance(data, str):
+            raise StructuredOutputError('No text where the schema expects '
+                                        '{t}'.format(t=translator[1].__name__))
+        if translator[1] is str:
+            return data
+        try:
+            return translator[1](data)
+        except ValueError:
+            raise StructuredOutputError('{d!r} is not {t}'.format(
+                d=data, t=translator[1].__name__))
+
+    if kind == _LIST:
+        raise StructuredOutputError('One element where the schema expects a '
+                                    'list')
+    return _generic([element])
+
+
+def _checked(function, value):
+    '''Return the value, or the list of the value, the validation function
+    accepts'''
+    try:
+        function(value)
+        return value
+    except Exception:
+        if not isinstance(value, dict):
+            raise StructuredOutputError('The output does not validate')
+    try:
+        function([value])
+    except Exception:
+        raise StructuredOutputError('The output does not validate')
+    return [value]
+
+
+def _generic(elements):
+    '''Map elements the schema does not describe, like xmltodict does'''
+    values = []
+    for element in elements:
+        data = element.get('data')
+        if data == [None]:
+            data = None
+        if len(element) == 1 and 'data' in element:
+            values.append(data)
+            continue
+        value = {}
+        for name, children in element.items():
+            if name == 'attributes':
+                for attribute, text in children.items():
+                    value['@' + attribute] = text
+            elif name == 'data':
+                if data is not None:
+                    value['#text'] = data
+            else:
+                value[name] = _generic(children)
+        values.append(value)
+    return values[0] if len(values) == 1 else values
+
+
+def _xml_elements(value):
+    '''Return the json form of an xmltodict value:
+    [{'attributes': {...}, 'data': text, child: [...]}]'''
+    if not isinstance(value, list):
+        value = [value]
+    elements = []
+    for item in value:
+        if item is None:
+            elements.append({'data': [None]})
+        elif not isinstance(item, dict):
+            elements.append({'data': item})
+        else:
+            element = {}
+            attributes = {}
+            for name, child in item.items():
+                if name.startswith('@'):
+                    attributes[name[1:]] = child
+                elif name == '#text':
+                    element['data'] = child
+                else:
+                    element[name] = _xml_elements(child)
+            if attributes:
+                element['attributes'] = attributes
+            if len(element) == 0:
+                element['data'] = [None]
+            elements.append(element)
+    return elements
+
@@ -0,0 +1,268 @@
+'''Structured output of the NX-OS parsers
+
+NX-OS prints the output of most commands as json with ``| json``, the
+format of NX-API. Each table of the output is a 'TABLE_<name>' dict holding
+its rows in 'ROW_<name>', a list, or a dict when the table has one row:
+
+    {"TABLE_vrf": {"ROW_vrf": [
+        {"vrf-name-out": "default",
+         "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4", ...}}},
+    ]}}
+
+Parsing it does not depend on the layout of the text output. It is about as
+fast as ``cli()`` or faster, see tools/benchmarks/bench_nxos_structured.py.
+
+The NX-OS schemas do not mirror this output. Parsers deriving from
+``NxosStructured`` declare how the rows map into their schema instead of
+walking the json tree by hand:
+
+    class ShowNvePeers(ShowNvePeersSchema, NxosStructured):
+
+        json_mapping = [
+            Table('nve_peers',
+                  path=[Key('if-name', name='nve_name'), 'peer_ip',
+                        Key('peer-ip')],
+                  fields={'peer_state': ('peer-state', str.lower),
+                          'learn_type': 'learn-type',
+                          ...}),
+        ]
+
+    >>> device.parse('show nve peers', context='json')
+
+Each row of a ``Table`` is merged into the output at its path, below the
+dict of its parent row. The path is made of literal keys, ``Key`` (a
+field of the row) and ``Index`` (the position of the row in its table).
+The fields of a table map the keys of that dict to:
+
+    * the name of a field of the row, copied as is
+    * a (name, convert) tuple, the field converted by convert()
+    * a function of the row, returning the value or None
+
+Rows see the fields of their parent rows, ex: the vrf name of the prefix
+rows of 'show ip route'. A missing field is skipped; a missing key, or a
+conversion raising an exception, makes the parser fall back to ``cli()``.
+
+NX-OS prints numbers and flags as json numbers or strings depending on the
+command and the release: ``integer`` and ``boolean`` convert both.
+``interface_name`` is ``Common.convert_intf_name`` of the interfaces of the
+rows, the same few interfaces in most of the rows.
+'''
+
+# python
+from functools import lru_cache
+
+# parser utils
+from .common import Common
+from .structured import StructuredParser, StructuredOutputError, load_json
+
+
+class NxosStructured(StructuredParser):
+    '''Mixin of the NX-OS parsers adding the 'json' context
+
+    The parsers define the ``json_mapping`` of their output, a list of
+    ``Table``.
+    '''
+
+    json_mapping = []
+
+    def json(self, output=None, **kwargs):
+        '''Parse the command with '| json', or fall back to cli()'''
+        return self.structured_parse(
+            'json', lambda out: json_to_schema(self.json_mapping, out),
+            output=output, **kwargs)
+
+
+class Key(object):
+    '''Key of the output taken from the row
+
+    Args:
+        field (`str` or callable): name of the field of the row, or function
+            of the row returning the key
+        convert (callable): conversion of the field value
+        name (`str`): key of the dict of the key set to the key, ex:
+            'nve_name' of 'show nve peers'
+        fields (`dict`): fields set in the dict of the key, as the fields
+            of ``Table``
+    '''
+
+    def __init__(self, field, convert=None, name=None, fields=None):
+        self.field = field
+        self.convert = convert
+        self.name = name
+        self.fields = _compile(fields)
+
+    def key(self, row, index):
+        if callable(self.field):
+            key = self.field(row)
+        else:
+            key = row.get(self.field)
+        if key is None:
+            raise StructuredOutputError('No key in the row {r}'.format(r=row))
+        if self.convert is not None:
+            try:
+                key = self.convert(key)
+            except Exception as e:
+                raise StructuredOutputError('{k}: {e!r}'.format(
+                    k=self.field, e=e))
+        return key
+
+
+class Index(Key):
+    '''Key of the output: the position of the row in its table, from 1'''
+
+    def __init__(self, name=None, fields=None):
+        self.name = name
+        self.fields = _compile(fields)
+
+    def key(self, row, index):
+        return index
+
+
+class Table(object):
+    '''Mapping of the rows of a 'TABLE_<name>' into the output
+
+    Args:
+        name (`str`): name of the table, without 'TABLE_'
+        path (`list`): keys of the dict of a row, below the dict of its
+            parent: literal keys, ``Key`` and ``Index``
+        fields (`dict`): values of the dict of a row
+        tables (`list`): ``Table`` of the tables within the rows
+        when (callable): function of the row, the rows it returns false for
+            are skipped
+    '''
+
+    def __init__(self, name, path=(), fields=None, tables=(), when=None):
+        self.table = 'TABLE_' + name
+        self.row = 'ROW_' + name
+        self.path = list(path)
+        self.fields = _compile(fields)
+        self.tables = list(tables)
+        self.when = when
+
+
+def integer(value):
+    '''Convert a number of the output, None when it is empty'''
+    if value == '':
+        return None
+    return int(value)
+
+
+def boolean(value):
+    '''Convert a flag of the output: true, 'true', 'enabled'...'''
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ('true', 'yes', 'enabled', 'on', '1')
+
+
+@lru_cache(maxsize=4096)
+def interface_name(name):
+    '''Return the full name of an interface, ex: Ethernet1/2 of Eth1/2'''
+    return Common.convert_intf_name(name)
+
+
+def json_to_schema(mapping, output):
+    '''Map the output of '| json' with the tables of a json_mapping
+
+    Args:
+        mapping (`list`): ``Table`` of the output
+        output (`str`): output of the command
+
+    Returns:
+        dict of the mapped rows
+
+    Raises:
+        StructuredOutputError: the output does not fit the mapping
+    '''
+    parsed = {}
+    _merge(mapping, load_json(output), {}, parsed)
+    if not parsed:
+        raise StructuredOutputError('No table of the mapping in the output')
+    return parsed
+
+
+def _merge(tables, item, parent, parsed):
+    '''Merge the rows of the tables of item into parsed
+
+    The rows are dicts of their own fields over the fields of parent, the
+    fields of the rows holding them. They are built once for all the
+    ``Table`` of the same table.
+    '''
+    built = {}
+    for table in tables:
+        rows = built.get(table.table)
+        if rows is None:
+            rows = built[table.table] = _rows(item, table, parent)
+        when = table.when
+        for index, entry, row in rows:
+            if when is not None and not when(row):
+                continue
+            node = parsed
+            for step in table.path:
+                if step.__class__ is str:
+                    node = node.setdefault(step, {})
+                    continue
+                key = step.key(row, index)
+                node = node.setdefault(key, {})
+                if step.name is not None:
+                    node[step.name] = key
+                if step.fields:
+                    _set(step.fields, row, node)
+            _set(table.fields, row, node)
+            if table.tables:
+                # The tables within see the fields of this row
+                _merge(table.tables, entry, {
+                    name: value for name, value in row.items()
+                    if not name.startswith('TABLE_')}, node)
+
+
+def _rows(item, table, parent):
+    '''Return the (index, entry, row) of the rows of a table of item'''
+    rows = item.get(table.table)
+    if not rows:
+        return ()
+    rows = rows.get(table.row)
+    if isinstance(rows, dict):
+        rows = [rows]
+    if not parent:
+        return [(index, entry, entry)
+                for index, entry in enumerate(rows or (), 1)]
+    built = []
+    for index, entry in enumerate(rows or (), 1):
+        row = parent.copy()
+        row.update(entry)
+        built.append((index, entry, row))
+    return built
+
+
+def _set(fields, row, node):
+    '''Set the fields of a row in node'''
+    for key, name, convert in fields:
+        try:
+            if name is None:
+                value = convert(row)
+            else:
+                value = row.get(name)
+                if value is None:
+                    continue
+                if convert is not None:
+                    value = convert(value)
+        except StructuredOutputError:
+            raise
+        except Exception as e:
+            raise StructuredOutputError('{k}: {e!r}'.format(k=key, e=e))
+        if value is not None:
+            node[key] = value
+
+
+def _compile(fields):
+    '''Return the (key, name, convert) of the fields of a Table, name is
+    None when convert is a function of the row'''
+    compiled = []
+    for key, field in (fields or {}).items():
+        if callable(field):
+            compiled.append((key, None, field))
+        elif isinstance(field, tuple):
+            compiled.append((key,) + field)
+        else:
+            compiled.append((key, field, None))
+    return compiled
@@ -0,0 +1,192 @@
+'''Command plans of the parsers issuing several commands
+
+Parsers such as ShowRunningConfigVrf complete their output with commands
+computed from the output of another one, ex: the configuration of each VRF
+listed by 'show vrf'. These commands are only known by running cli(), and
+reach the device one at a time. A parser may expose its command plan
+instead:
+
+    class ShowRunningConfigVrf(...):
+
+        def command_plan(self, outputs, vrf=None):
+            if vrf:
+                return [self.cli_command.format(vrf=vrf)]
+            if 'show vrf' not in outputs:
+                return ['show vrf']
+            ...
+
+``command_plan(outputs, **kwargs)`` returns the commands the parse issues
+given ``outputs``, the output of each command collected so far. The commands
+depending on an output not collected yet are left out: it is called again
+once they are collected, until it returns no new command.
+
+``collect_plans()`` collects the commands of many parsers of a device stage
+by stage. The commands of a stage are deduplicated across the parsers, and
+with the outputs already collected for the snapshot, then sent at once with
+``device.execute([...])``. ``parse_planned()`` then parses each parser from
+the collected outputs:
+
+    >>> outputs = {}
+    >>> results = parse_planned(device, [(ShowRunningConfigVrf, {}),
+    ...                                  (ShowIpBgpAllSummary, {})],
+    ...                         outputs=outputs)
+
+The commands of the parsers without ``command_plan`` are learnt by parsing
+against the outputs collected so far, as ``aparse()`` does. The commands a
+plan missed are executed by the parse as before.
+'''
+
+# python
+import logging
+
+from .aparse import ReplayDevice, PREFERRED, _attributes, _replay_parse
+from .batch import BatchResult
+
+log = logging.getLogger(__name__)
+
+# Stages of commands collected before parsing anyway
+DEFAULT_MAX_STAGES = 16
+
+
+class PlannedDevice(object):
+    '''Device given to the parsers of parse_planned()
+
+    Returns the collected outputs, and executes the other commands on the
+    device, recorded in ``unplanned``. The other attributes are those of the
+    device.
+    '''
+
+    def __init__(self, device, outputs):
+        self._device = device
+        self._outputs = outputs
+        self.unplanned = []
+
+    def execute(self, command, **kwargs):
+        if not kwargs and isinstance(command, str) and \
+                command in self._outputs:
+            output = self._outputs[command]
+            if isinstance(output, BaseException):
+                raise output
+            return output
+        self.unplanned.append(command)
+        return self._device.execute(command, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+
+def plan_commands(parser_cls, device, outputs, **kwargs):
+    '''Return the commands parser_cls issues which are not in outputs
+
+    Args:
+        parser_cls (`type`): parser class
+        device (`Device`): device parsed, read for its attributes only
+        outputs (`dict`): output of each command collected so far
+        kwargs: arguments of the parse
+
+    Returns:
+        list: the commands, in order
+    '''
+    attributes = _attributes(device)
+    replayed = {('execute', command): output
+                for command, output in outputs.items()}
+    if hasattr(parser_cls, 'command_plan'):
+        parser = parser_cls(device=ReplayDevice(outputs=replayed,
+                                                **attributes))
+        commands = parser.command_plan(outputs, **kwargs)
+    else:
+        _, _, pending = _replay_parse(parser_cls, attributes, replayed,
+                                      kwargs)
+        pending = [key for key in pending if key in PREFERRED] or pending
+        commands = [command for method, command in pending
+                    if method == 'execute']
+    return [command for command in dict.fromkeys(commands)
+            if command not in outputs]
+
+
+def execute_commands(device, commands):
+    '''Return the output of each command, sent to the device at once
+
+    The device is given the list of the commands, as the unicon execute()
+    takes them. The commands are executed one at a time when it does not
+    return an output for each. The exception executing a command raised is
+    returned as its output.
+    '''
+    if len(commands) > 1:
+        try:
+            outputs = device.execute(list(commands))
+        except Exception as e:
+            log.debug('Could not send the commands at once: {e}'.format(e=e))
+        else:
+            if isinstance(outputs, dict) and \
+                    all(command in outputs for command in commands):
+                return {command: outputs[command] for command in commands}
+
+    outputs = {}
+    for command in commands:
+        try:
+            outputs[command] = device.execute(command)
+        except Exception as e:
+            outputs[command] = e
+    return outputs
+
+
+def collect_plans(device, parsers, outputs=None, execute=execute_commands,
+                  max_stages=DEFAULT_MAX_STAGES):
+    '''Collect the commands of the plans of parsers, stage by stage
+
+    Args:
+        device (`Device`): device to collect from
+        parsers (list): (parser class, kwargs) of the parses
+        outputs (`dict`): outputs already collected, ex: by the other
+                          parsers of the snapshot; completed in place
+        execute (callable): execute(device, commands) returning the output of
+                            each command, execute_commands by default
+        max_stages (`int`): stages collected at most
+
+    Returns:
+        dict: the output of each command
+    '''
+    if outputs is None:
+        outputs = {}
+    for _ in range(max_stages):
+        commands = []
+        for parser_cls, kwargs in parsers:
+            commands.extend(plan_commands(parser_cls, device, outputs,
+                                          **kwargs))
+        commands = list(dict.fromkeys(commands))
+        if not commands:
+            break
+        outputs.update(execute(device, commands))
+    return outputs
+
+
+def parse_planned(device, parsers, outputs=None, execute=execute_commands,
+                  max_stages=DEFAULT_MAX_STAGES):
+    '''Parse parsers on device from the outputs of their command plans
+
+    Args:
+        device (`Device`): device to collect from
+        parsers (list): (parser class, kwargs) of the parses
+        outputs (`dict`): outputs already collected, completed in place
+        execute (callable): execute(device, commands) returning the output of
+                            each command, execute_commands by default
+        max_stages (`int`): stages collected at most
+
+    Returns:
+        list of BatchResult, in the order of the parsers
+    '''
+    outputs = collect_plans(device, parsers, outputs=outputs,
+                            execute=execute, max_stages=max_stages)
+    results = []
+    for parser_cls, kwargs in parsers:
+        planned = PlannedDevice(device, outputs)
+        try:
+            results.append(BatchResult(
+                parser_cls(device=planned).parse(**kwargs), None))
+        except Exception as e:
+            results.append(BatchResult(None, e))
+        if planned.unplanned:
+            log.debug('{p} executed commands out of its plan: {c}'.format(
+                p=parser_cls.__name__, c=planned.unplanned))
+    return results
@@ -0,0 +1,254 @@
+'''Field projection of the parser outputs
+
+Most callers read a few keys of an output, ex: the oper_status and in_errors
+of each interface of 'show interfaces', yet cli() runs every pattern and
+builds the whole tree. The parsers supporting the projection take
+``fields``, the keys to parse:
+
+    >>> device.parse('show interfaces', fields=['oper_status', 'in_errors'])
+    {'GigabitEthernet1': {'oper_status': 'up', 'counters': {'in_errors': 0}},
+     ...}
+
+A field is a key of the schema, or a path of keys for the keys found at
+several places, ex: ('counters', 'in_errors'). At an ``Any()`` level of the
+schema, the field selects an entry: ('GigabitEthernet1', 'oper_status').
+A field holding a dict, ex: 'counters', selects all of its keys.
+
+The parsers built on a ``LineDispatcher`` declare the keys set by each rule:
+
+    @dispatcher.rule(p25, keys=['counters', 'in_errors', 'in_crc_errors'])
+    def handle_p25(m):
+        ...
+
+    projection = project(self, fields)
+    dispatcher = dispatcher.project(projection)
+
+The rules setting none of the fields are left out of the dispatch, and
+the output is pruned to the fields with ``projection.prune()``. When each
+field selects an entry, the parser may stop at the start of the next entry
+once ``projection.complete()``.
+
+The parsers taking fields inherit ``ProjectedParser`` first. Given fields,
+its parse() runs cli() and validates the output against the projected
+schema itself; the parser instance and its schema are left as is:
+
+    class ShowInterfaces(ProjectedParser, ShowInterfacesSchema):
+
+The projection of the fields is built once per schema, the last
+PROJECTION_CACHE_SIZE are kept.
+'''
+
+# metaparser
+from genie.metaparser.util.schemaengine import Schema, Optional, Any
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# parser utils
+from genie.libs.parser.utils.cache import LRUCache
+
+# Key of an Any() level in the paths of the projection
+ANY = object()
+
+# Projections kept, the fields of the callers vary
+PROJECTION_CACHE_SIZE = 256
+
+# Projection of each schema, by id of the schema and fields. The schema is
+# kept with its projections so that its id is not reused
+_projections = LRUCache(maxsize=PROJECTION_CACHE_SIZE)
+
+
+class Projection(object):
+    '''Fields of a parse, resolved against the schema of the parser
+
+    Args:
+        schema (`dict`): schema of the parser
+        fields (`list`): keys, or tuples of keys, to parse
+
+    Raises:
+        ValueError: a field is not in the schema
+    '''
+
+    def __init__(self, schema, fields):
+        self.fields = fields
+        # Path of each selected key, ANY at the Any() levels the fields do
+        # not select an entry of
+        self.paths = []
+        # Keys of the schema on the selected paths or under them
+        self.keys = set()
+        for field in fields:
+            paths = []
+            _resolve(schema, (), field, paths)
+            if not paths:
+                raise ValueError('{f!r} is not a key of the schema'.format(
+                    f=field))
+            self.paths.extend(path for path in paths
+                              if path not in self.paths)
+        for path in self.paths:
+            self.keys.update(path)
+            _subkeys(_node(schema, path), self.keys)
+        self.keys.discard(ANY)
+        self.schema = _project(schema, self.paths)
+        self.validator = Schema(self.schema)
+        self.bounded = all(ANY not in path for path in self.paths)
+
+    def __repr__(self):
+        return 'Projection({f!r})'.format(f=self.fields)
+
+    def wants(self, keys):
+        '''Return True if one of keys is on a selected path or under it'''
+        return any(key in self.keys for key in keys)
+
+    def complete(self, parsed):
+        '''Return True when each field selects an entry, and parsed holds
+        them all'''
+        if not self.bounded:
+            return False
+        for path in self.paths:
+            node = parsed
+            for key in path:
+                if not isinstance(node, dict) or key not in node:
+                    return False
+                node = node[key]
+        return True
+
+    def prune(self, parsed):
+        '''Return parsed reduced to the selected paths'''
+        return _prune(parsed, self.paths)
+
+    def validate(self, parsed):
+        '''Validate parsed against the projected schema, and return it
+
+        Raises:
+            SchemaEmptyParserError: parsed is empty
+        '''
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        self.validator.validate(parsed)
+        return parsed
+
+
+class ProjectedParser(object):
+    '''Mixin of the parsers taking fields
+
+    Given fields, parse() runs cli() and validates its output against the
+    projected schema. The schema is not set on the instance, which may be
+    shared by threads.
+    '''
+
+    def parse(self, *args, fields=None, **kwargs):
+        projection = project(self, fields)
+        if projection is None:
+            return super().parse(*args, **kwargs)
+        return projection.validate(self.cli(*args, fields=fields, **kwargs))
+
+
+def project(parser, fields):
+    '''Return the Projection of fields on the schema of parser, None for no
+    fields'''
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    fields = tuple(tuple(field) if isinstance(field, (list, tuple))
+                   else (field,) for field in fields)
+    if not fields:
+        raise ValueError('fields holds no key')
+
+    schema = type(parser).schema
+    found = _projections.get((id(schema), fields), None)
+    if found is not None and found[0] is schema:
+        return found[1]
+    projection = Projection(schema, fields)
+    _projections.put((id(schema), fields), (schema, projection))
+    return projection
+
+
+def _key(key):
+    '''Return the key of a schema dict, ANY for Any() and Optional(Any())'''
+    # Any is an Optional
+    if isinstance(key, Any):
+        return ANY
+    if isinstance(key, Optional):
+        key = key.schema
+    if isinstance(key, Any):
+        return ANY
+    return key
+
+
+def _resolve(node, path, field, paths):
+    '''Collect in paths the paths of node matching field, at any depth'''
+    if not isinstance(node, dict):
+        return
+    for key, value in node.items():
+        here = path + (_key(key),)
+        matched = _match(here, field)
+        if matched is not None:
+            paths.append(matched)
+        _resolve(value, here, field, paths)
+
+
+def _match(path, field):
+    '''Return path with the entries selected by field, if field matches the
+    end of path with at least one of the keys of the schema'''
+    if len(field) > len(path):
+        return None
+    end = path[len(path) - len(field):]
+    if not any(key == name for key, name in zip(end, field)):
+        return None
+    if any(key is not ANY and key != name for key, name in zip(end, field)):
+        return None
+    return path[:len(path) - len(field)] + field
+
+
+def _node(schema, path):
+    '''Return the schema node at path'''
+    node = schema
+    for name in path:
+        for key, value in node.items():
+            key = _key(key)
+            if key == name or key is ANY and name not in _literals(node):
+                node = value
+                break
+    return node
+
+
+def _literals(node):
+    return [_key(key) for key in node if _key(key) is not ANY]
+
+
+def _subkeys(node, keys):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            keys.add(_key(key))
+            _subkeys(value, keys)
+
+
+def _project(node, paths):
+    '''Return the schema node reduced to paths'''
+    if not isinstance(node, dict) or any(not path for path in paths):
+        return node
+    projected = {}
+    for key, value in node.items():
+        name = _key(key)
+        sub = [path[1:] for path in paths
+               if path[0] == name or name is ANY and path[0] not in
+               _literals(node)]
+        if sub:
+            projected[key] = _project(value, sub)
+    return projected
+
+
+def _prune(node, paths):
+    if any(not path for path in paths):
+        return node
+    if not isinstance(node, dict):
+        return None
+    pruned = {}
+    for key, value in node.items():
+        sub = [path[1:] for path in paths
+               if path[0] == key or path[0] is ANY]
+        if not sub:
+            continue
+        value = _prune(value, sub)
+        if value is not None and value != {}:
+            pruned[key] = value
+    return pruned
@@ -0,0 +1,416 @@
+'''Indexed, lazily loaded command registry for genie.libs.parser
+
+The command registry (``parsers.json``) maps every supported show command to
+the parser class implementing it for each os/platform token. Loading it used
+to happen at import time and every non exact lookup scanned all commands.
+
+This module provides:
+
+    * ``ParserRegistry``: a ``dict`` which only loads its content on first use
+      and keeps a token trie of the registered commands to find lookup
+      candidates in roughly O(command length).
+    * ``load_registry_file``: loads a registry json file through a pickled
+      cache stored in the user cache directory, so following processes skip
+      the json decoding.
+'''
+
+# python
+import os
+import json
+import pickle
+import bisect
+import hashlib
+import logging
+import tempfile
+
+log = logging.getLogger(__name__)
+
+# Bump whenever the pickled cache layout changes
+REGISTRY_CACHE_VERSION = 1
+
+
+class _TrieNode(object):
+    '''One command token position in the ``CommandTrie``'''
+
+    __slots__ = ('literals', 'keys', 'argument', 'partials', 'commands')
+
+    def __init__(self):
+        # literal token -> child node
+        self.literals = {}
+        # sorted literal tokens, used for prefix range lookup
+        self.keys = []
+        # child node for an argument token, ex: {vrf}
+        self.argument = None
+        # (start, end, child) for arguments embedded in a token,
+        # ex: /dna/intent/api/v1/interface/{interface}
+        self.partials = []
+        # commands ending at this node
+        self.commands = []
+
+
+class CommandTrie(object):
+    '''Token trie of the registered cli commands.
+
+    The trie is only used to narrow down the commands a search can match;
+    the final matching and scoring is still done by ``_matches_fuzzy`` so the
+    results are identical to a full scan. A literal search token follows
+    every child it is a prefix of (``sh`` -> ``show``) and an argument
+    token consumes one or two search tokens like ``_matches_fuzzy`` does.
+    '''
+
+    def __init__(self, commands=()):
+        self.root = _TrieNode()
+        # command -> registration order, results keep the registry order
+        self.order = {}
+        for command in commands:
+            self.add(command)
+        self.finalize()
+
+    def add(self, command):
+        '''Insert command into the trie'''
+        if command in self.order:
+            return
+        self.order[command] = len(self.order)
+
+        node = self.root
+        for token in command.split():
+            if token.startswith('{'):
+                if node.argument is None:
+                    node.argument = _TrieNode()
+                node = node.argument
+            elif '{' in token:
+                start, _, rest = token.partition('{')
+                end = rest.partition('}')[2]
+                for partial_start, partial_end, child in node.partials:
+                    if (partial_start, partial_end) == (start, end):
+                        node = child
+                        break
+                else:
+                    child = _TrieNode()
+                    node.partials.append((start, end, child))
+                    node = child
+            else:
+                if token not in node.literals:
+                    node.literals[token] = _TrieNode()
+                    node.keys = None
+                node = node.literals[token]
+        node.commands.append(command)
+
+    def finalize(self):
+        '''Sort the literal keys of every node, required before searching'''
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.keys is None or len(node.keys) != len(node.literals):
+                node.keys = sorted(node.literals)
+            stack.extend(node.literals.values())
+            stack.extend(child for _, _, child in node.partials)
+            if node.argument is not None:
+                stack.append(node.argument)
+
+    def candidates(self, tokens, prefix=False):
+        '''Return the commands that the search tokens could match
+
+        Args:
+            tokens (`list`): the (non regex) search tokens
+            prefix (`bool`): tokens are only the start of the search, return
+                             every command continuing after them
+
+        Returns:
+            list: candidate commands, in registration order
+        '''
+        found = set()
+        length = len(tokens)
+        stack = [(self.root, 0)]
+        seen = set()
+
+        while stack:
+            node, i = stack.pop()
+            key = (id(node), i)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if i == length:
+                if prefix:
+                    found.update(self._subtree_commands(node))
+                else:
+                    found.update(node.commands)
+                continue
+
+            token = tokens[i]
+
+            # Literal tokens the search token is a prefix of
+            keys = node.keys
+            index = bisect.bisect_left(keys, token)
+            while index < len(keys) and keys[index].startswith(token):
+                stack.append((node.literals[keys[index]], i + 1))
+                index += 1
+
+            # Arguments span one or two search tokens
+            if node.argument is not None:
+                stack.append((node.argument, i + 1))
+                if i + 1 < length:
+                    stack.append((node.argument, i + 2))
+
+            for start, end, child in node.partials:
+                if token.startswith(start) and token.endswith(end):
+                    stack.append((child, i + 1))
+
+        return sorted(found, key=self.order.__getitem__)
+
+    @staticmethod
+    def _subtree_commands(node):
+        commands = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            commands.extend(node.commands)
+            stack.extend(node.literals.values())
+            stack.extend(child for _, _, child in node.partials)
+            if node.argument is not None:
+                stack.append(node.argument)
+        return commands
+
+
+class ParserRegistry(dict):
+    '''Command registry which loads on first use and indexes its commands.
+
+    It behaves like the plain ``dict`` that ``parsers.json`` used to be
+    loaded into, so existing code reading or extending ``parser_data`` keeps
+    working. Code changing a nested entry in place (ex: adding an os to an
+    existing command) must call ``invalidate()`` afterward.
+
+    Args:
+        loader (`callable`): returns the registry content as a dict
+    '''
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+        self._loaded = False
+        self._load_hooks = []
+        self._trie = None
+        self._os_commands = {}
+        # incremented on every change, lets caches built on top of the
+        # registry know when they are stale
+        self.generation = 0
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._loaded = True
+            dict.update(self, self._loader())
+            for hook in self._load_hooks:
+                hook()
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    def add_load_hook(self, hook):
+        '''Call hook once the registry is loaded, ex: to register more
+        parsers; at once when it already is'''
+        if self._loaded:
+            hook()
+        else:
+            self._load_hooks.append(hook)
+
+    def invalidate(self):
+        '''Drop the indexes, to be called after the registry changed'''
+        self._trie = None
+        self._os_commands = {}
+        self.generation += 1
+
+    @property
+    def trie(self):
+        '''``CommandTrie`` of all the registered commands'''
+        self._ensure_loaded()
+        if self._trie is None:
+            self._trie = CommandTrie(dict.keys(self))
+        return self._trie
+
+    def search_candidates(self, tokens, prefix=False):
+        '''Commands which the non regex search tokens could match'''
+        return self.trie.candidates(tokens, prefix=prefix)
+
+    def commands_for_os(self, os):
+        '''Commands supported by os which do not require any argument'''
+        self._ensure_loaded()
+        try:
+            return self._os_commands[os]
+        except KeyError:
+            pass
+        commands = [command for command, values in dict.items(self)
+                    if '{' not in command and command != 'tokens'
+                    and os in values]
+        self._os_commands[os] = commands
+        return commands
+
+    # Read access
+    def __getitem__(self, key):
+        self._ensure_loaded()
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        self._ensure_loaded()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._ensure_loaded()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._ensure_loaded()
+        return dict.__len__(self)
+
+    def __repr__(self):
+        self._ensure_loaded()
+        return dict.__repr__(self)
+
+    def __eq__(self, other):
+        self._ensure_loaded()
+        return dict.__eq__(self, other)
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        self._ensure_loaded()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        self._ensure_loaded()
+        return dict.keys(self)
+
+    def values(self):
+        self._ensure_loaded()
+        return dict.values(self)
+
+    def items(self):
+        self._ensure_loaded()
+        return dict.items(self)
+
+    def copy(self):
+        self._ensure_loaded()
+        return dict(dict.items(self))
+
+    # Write access
+    def __setitem__(self, key, value):
+        self._ensure_loaded()
+        dict.__setitem__(self, key, value)
+        self.invalidate()
+
+    def __delitem__(self, key):
+        self._ensure_loaded()
+        dict.__delitem__(self, key)
+        self.invalidate()
+
+    def setdefault(self, key, default=None):
+        self._ensure_loaded()
+        if not dict.__contains__(self, key):
+            self.invalidate()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        self._ensure_loaded()
+        self.invalidate()
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._ensure_loaded()
+        self.invalidate()
+        return dict.popitem(self)
+
+    def update(self, *args, **kwargs):
+        self._ensure_loaded()
+        dict.update(self, *args, **kwargs)
+        self.invalidate()
+
+    def clear(self):
+        self._ensure_loaded()
+        dict.clear(self)
+        self.invalidate()
+
+    def __reduce__(self):
+        self._ensure_loaded()
+        return (dict, (dict(dict.items(self)),))
+
+
+def _registry_cache_dir(cache_dir=None):
+    '''Directory where the pickled registries are stored'''
+    if cache_dir:
+        return cache_dir
+    base = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'genie', 'parser_registry')
+
+
+def _registry_cache_path(path, cache_dir=None, name='parsers'):
+    digest = hashlib.sha1(os.path.realpath(path).encode()).hexdigest()
+    return os.path.join(_registry_cache_dir(cache_dir),
+                        '{}_{}.pickle'.format(name, digest))
+
+
+def load_registry_file(path, cache=True, cache_dir=None):
+    '''Load a registry json file, through a pickled cache when possible
+
+    The cache file is keyed on the real path of the json file and is only
+    used while the json file size and modification time are unchanged.
+
+    Args:
+        path (`str`): path to the registry json file
+        cache (`bool`): use and refresh the pickled cache
+        cache_dir (`str`): directory of the cache, defaults to
+                           ``$XDG_CACHE_HOME/genie/parser_registry``
+
+    Returns:
+        dict: the registry content
+    '''
+    stat = os.stat(path)
+    header = (REGISTRY_CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+
+    if not cache:
+        with open(path) as f:
+            return json.load(f)
+
+    cache_path = _registry_cache_path(path, cache_dir)
+    data = read_cache(cache_path, header)
+    if data is None:
+        with open(path) as f:
+            data = json.load(f)
+        write_cache(cache_path, header, data)
+
+    return data
+
+
+def read_cache(cache_path, header):
+    '''Return the data of a pickled cache, None when it is missing or its
+    header is not header'''
+    try:
+        with open(cache_path, 'rb') as f:
+            if pickle.load(f) == header:
+                return pickle.load(f)
+    except Exception:
+        # Missing, outdated or corrupted cache
+        pass
+    return None
+
+
+def write_cache(cache_path, header, data):
+    '''Store data and its header in a pickled cache, read by read_cache()'''
+    try:
+        directory = os.path.dirname(cache_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Write to a temporary file first so concurrent processes never
+        # read a partially written cache
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        log.debug('Could not write parser registry cache {p}: {e}'
+                  .format(p=cache_path, e=e))
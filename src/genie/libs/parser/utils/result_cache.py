@@ -0,0 +1,320 @@
+'''Cache of the parsed outputs, keyed on the raw output
+
+Devices polled every few seconds mostly return the same output as on the
+previous poll. ``ResultCache`` keeps the parsed output of each (parser
+class, arguments, output) so an identical output is not parsed, nor
+validated against the schema, again:
+
+    >>> cache = ResultCache(maxbytes=64 * 2 ** 20, path='/tmp/parsed.db')
+    >>> parsed = cache.parse(ShowVersion, output, device=device)
+    >>> parse_command(device, 'show version', cache=cache)
+    >>> parse_batch(items, cache=cache)
+
+The outputs are keyed on their sha1 digest. The parsed outputs are held
+pickled: in memory, by least recently used up to ``maxbytes``, and in an
+optional sqlite database at ``path`` shared by processes, up to
+``disk_maxbytes``. Each hit returns a copy, callers are free to modify it.
+
+The key holds the modification time of the module of the parser, so a
+changed parser does not return the results cached by its previous code.
+'''
+
+# python
+import os
+import time
+import pickle
+import sqlite3
+import hashlib
+import inspect
+import logging
+import functools
+import threading
+from collections import OrderedDict
+
+from pyats import configuration as cfg
+
+from .common import get_parser
+
+log = logging.getLogger(__name__)
+
+PARSER_RESULT_CACHE_SIZE = 'genie.libs.parser.result_cache_size'
+PARSER_RESULT_CACHE_PATH = 'genie.libs.parser.result_cache_path'
+
+# Bump whenever the layout of the keys or of the values changes
+RESULT_CACHE_VERSION = 1
+
+
+class SqliteStore(object):
+    '''Pickled parsed outputs in a sqlite database, by least recently used
+
+    Args:
+        path (`str`): path of the database, created if missing
+        maxbytes (`int`): size of the stored values, beyond which the least
+                          recently used ones are evicted
+    '''
+
+    def __init__(self, path, maxbytes=2 ** 30):
+        self.path = path
+        self.maxbytes = maxbytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False,
+                                   isolation_level=None, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS results ('
+                         'key BLOB PRIMARY KEY, value BLOB NOT NULL, '
+                         'size INTEGER NOT NULL, used REAL NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS results_used '
+                         'ON results (used)')
+        self._bytes = self._size()
+
+    def _size(self):
+        return self._db.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def get(self, key):
+        '''Return the value of key, None when it is not stored'''
+        with self._lock:
+            row = self._db.execute('SELECT value FROM results WHERE key = ?',
+                                   (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE results SET used = ? WHERE key = ?',
+                             (time.time(), key))
+            return row[0]
+
+    def put(self, key, value):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO results '
+                             '(key, value, size, used) VALUES (?, ?, ?, ?)',
+                             (key, value, len(value), time.time()))
+            self._bytes += len(value)
+            if self._bytes > self.maxbytes:
+                # Other processes write in the database too
+                self._bytes = self._size()
+                self._evict()
+
+    def _evict(self):
+        '''Drop the least recently used values, down to 90% of maxbytes'''
+        excess = self._bytes - self.maxbytes * 0.9
+        if excess <= 0:
+            return
+        keys = []
+        for key, size in self._db.execute(
+                'SELECT key, size FROM results ORDER BY used'):
+            keys.append((key,))
+            excess -= size
+            self._bytes -= size
+            if excess <= 0:
+                break
+        self._db.executemany('DELETE FROM results WHERE key = ?', keys)
+        self.evictions += len(keys)
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM results')
+            self._bytes = 0
+
+    def close(self):
+        self._db.close()
+
+
+class ResultCache(object):
+    '''Parsed outputs by parser class, arguments and raw output
+
+    Args:
+        maxsize (`int`): maximum number of parsed outputs held in memory,
+                         0 disables the memory cache
+        maxbytes (`int`): maximum size of the pickled parsed outputs held in
+                          memory
+        path (`str`): path of the sqlite database of the cache, not stored
+                      on disk if None
+        disk_maxbytes (`int`): maximum size of the parsed outputs stored on
+                               disk
+    '''
+
+    def __init__(self, maxsize=1024, maxbytes=64 * 2 ** 20, path=None,
+                 disk_maxbytes=2 ** 30):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.store = SqliteStore(path, disk_maxbytes) if path else None
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.reset_counters()
+
+    def key(self, parser_cls, output, kwargs=None):
+        '''Return the key of the output of parser_cls for the arguments'''
+        digest = hashlib.sha1()
+        digest.update(repr((RESULT_CACHE_VERSION, _parser_id(parser_cls),
+                            sorted((kwargs or {}).items()))).encode())
+        digest.update(output.encode(errors='surrogateescape'))
+        return digest.digest()
+
+    def get(self, key):
+        '''Return a copy of the parsed output of key, None when not cached'''
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return pickle.loads(value)
+
+        value = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._put_memory(key, value)
+        return pickle.loads(value)
+
+    def put(self, key, parsed):
+        '''Cache the parsed output of key'''
+        value = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self.stores += 1
+            self._put_memory(key, value)
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def _put_memory(self, key, value):
+        if self.maxsize <= 0 or len(value) > self.maxbytes:
+            return
+        previous = self._data.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._data[key] = value
+        self._bytes += len(value)
+        while len(self._data) > self.maxsize or self._bytes > self.maxbytes:
+            _, evicted = self._data.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def parse(self, parser_cls, output, device=None, **kwargs):
+        '''Return the parsed output, parsing it only when it is not cached
+
+        Args:
+            parser_cls (`class`): parser of the output
+            output (`str`): raw output of the command
+            device (`Device`): device given to the parser on a miss
+            kwargs: arguments of the parser, ex: vrf
+
+        Returns:
+            dict: the parsed output, a copy on a hit
+        '''
+        key = self.key(parser_cls, output, kwargs)
+        parsed = self.get(key)
+        if parsed is None:
+            parsed = parser_cls(device=device).parse(output=output, **kwargs)
+            self.put(key, parsed)
+        return parsed
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        '''Drop every parsed output, in memory and on disk'''
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+        if self.store is not None:
+            self.store.clear()
+
+    def reset_counters(self):
+        self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+        self.stores = self.evictions = 0
+
+    def info(self):
+        '''Return the cache counters as a dict'''
+        with self._lock:
+            lookups = self.hits + self.misses
+            info = {'hits': self.hits,
+                    'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'memory_hits': self.memory_hits,
+                    'disk_hits': self.disk_hits,
+                    'stores': self.stores,
+                    'evictions': self.evictions,
+                    'size': len(self._data),
+                    'bytes': self._bytes,
+                    'maxsize': self.maxsize,
+                    'maxbytes': self.maxbytes}
+        if self.store is not None:
+            info.update({'disk_size': len(self.store),
+                         'disk_bytes': self.store.bytes,
+                         'disk_evictions': self.store.evictions})
+        return info
+
+
+def parse_command(device, command, cache=None, output=None):
+    '''Parse the output of a command through a ResultCache
+
+    Args:
+        device (`Device`): device the command runs on
+        command (`str`): show command, as given to device.parse()
+        cache (`ResultCache`): defaults to default_result_cache()
+        output (`str`): output of the command, executed on device if None
+
+    Returns:
+        dict: the parsed output
+    '''
+    if cache is None:
+        cache = default_result_cache()
+    parser_cls, kwargs = get_parser(command, device)
+    if output is None:
+        output = device.execute(command)
+    return cache.parse(parser_cls, output, device=device, **kwargs)
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_result_cache():
+    '''Return the ResultCache shared by the process
+
+    Its size and the path of its database are configured by
+    genie.libs.parser.result_cache_size and
+    genie.libs.parser.result_cache_path, in the pyats configuration or in
+    the environment, ex: GENIE_LIBS_PARSER_RESULT_CACHE_PATH.
+    '''
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            size = _config(PARSER_RESULT_CACHE_SIZE)
+            try:
+                size = int(size) if size is not None else 1024
+            except ValueError:
+                log.warning('Invalid {k} value {s}, using 1024'.format(
+                    k=PARSER_RESULT_CACHE_SIZE, s=size))
+                size = 1024
+            _default_cache = ResultCache(
+                maxsize=size, path=_config(PARSER_RESULT_CACHE_PATH))
+        return _default_cache
+
+
+def _config(name):
+    return cfg.get(name, None) or \
+        os.environ.get(name.upper().replace('.', '_'))
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_id(parser_cls):
+    '''Identify the parser class and the version of its code'''
+    try:
+        mtime = os.stat(inspect.getsourcefile(parser_cls)).st_mtime_ns
+    except (TypeError, OSError):
+        mtime = None
+    return (parser_cls.__module__, parser_cls.__qualname__, mtime)
@@ -0,0 +1,213 @@
+'''Index of the running configuration of the devices
+
+Parsers completing their output from the configuration executed a filtered
+``show running-config`` for each entry, ex: ``show running-config vrf
+{vrf} | sec '^vrf'`` for each VRF. On a PE with 2000 VRFs, that is 2000
+round trips to the device. ``RunningConfig`` indexes a single ``show
+running-config`` by indentation and returns its sections as the device
+filters print them:
+
+    >>> config = RunningConfig(device.execute('show running-config'))
+    >>> config.section('address-family ipv4 vrf')    # | section
+    >>> config.include('peer-session')               # | include
+    >>> config.block('vrf context VRF1')             # one top level block
+
+``running_config(device)`` executes ``show running-config`` at most once
+per parse opened by a ``@subcommand_cache`` decorated ``cli()``. With
+genie.libs.parser.running_config_ttl set to a number of seconds, in the
+pyats configuration or as GENIE_LIBS_PARSER_RUNNING_CONFIG_TTL, it is also
+kept for that long across the parses. Call ``clear_running_config()`` after
+configuring a device.
+
+``config_section()`` and ``config_include()`` read the index when there is
+one, and otherwise execute the filtered command as before.
+'''
+
+# python
+import os
+import re
+import time
+import logging
+import threading
+import weakref
+
+from pyats import configuration as cfg
+
+from .dispatch import literal_keys
+from .subcommand import subcommand_cached, subcommand_result, \
+                        subcommand_execute
+
+log = logging.getLogger(__name__)
+
+PARSER_RUNNING_CONFIG_TTL = 'genie.libs.parser.running_config_ttl'
+RUNNING_CONFIG_COMMAND = 'show running-config'
+
+
+class RunningConfig(object):
+    '''Running configuration, indexed by indentation
+
+    Each line holds the lines indented below it, up to the next line
+    indented as much or less. Blank lines close no section.
+
+    Args:
+        output (`str`): output of show running-config
+    '''
+
+    def __init__(self, output):
+        self.lines = [line.rstrip() for line in output.splitlines()]
+        self._ends = ends = [0] * len(self.lines)
+        self._top = {}
+        stack = []
+        for index, line in enumerate(self.lines):
+            stripped = line.lstrip()
+            if not stripped:
+                ends[index] = index + 1
+                continue
+            indent = len(line) - len(stripped)
+            while stack and stack[-1][0] >= indent:
+                ends[stack.pop()[1]] = index
+            stack.append((indent, index))
+            if not indent:
+                self._top.setdefault(line, index)
+        for _, index in stack:
+            ends[index] = len(self.lines)
+
+    def section(self, pattern):
+        '''Return the lines matching pattern with the lines below them, as
+        ``| section pattern``'''
+        regex = re.compile(pattern)
+        needle = ''.join(literal_keys(regex))
+        lines, ends = self.lines, self._ends
+        out = []
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            if line and (not needle or needle in line) and regex.search(line):
+                out.extend(lines[index:ends[index]])
+                index = ends[index]
+            else:
+                index += 1
+        return '\n'.join(out)
+
+    def include(self, pattern):
+        '''Return the lines matching pattern, as ``| include pattern``'''
+        regex = re.compile(pattern)
+        needle = ''.join(literal_keys(regex))
+        return '\n'.join(line for line in self.lines
+                         if (not needle or needle in line) and
+                         regex.search(line))
+
+    def block(self, header):
+        '''Return the top level line header with the lines below it, '' when
+        the configuration has no such line'''
+        index = self._top.get(header.rstrip())
+        if index is None:
+            return ''
+        return '\n'.join(self.lines[index:self._ends[index]])
+
+
+_configs = weakref.WeakKeyDictionary()
+_configs_lock = threading.Lock()
+
+
+def running_config(device, build=True, ttl=None):
+    '''Return the RunningConfig of device
+
+    Args:
+        device (`Device`): device to read the configuration of
+        build (`bool`): execute show running-config when it is not cached
+        ttl (`float`): seconds the configuration is kept across the parses,
+                       genie.libs.parser.running_config_ttl by default
+
+    Returns:
+        RunningConfig, None when it is not cached and not built, or when the
+        device does not return it
+    '''
+    key = (id(device), RUNNING_CONFIG_COMMAND)
+    config = subcommand_cached(key)
+    if config is not None:
+        return config or None
+
+    if ttl is None:
+        ttl = running_config_ttl()
+    if ttl > 0:
+        with _configs_lock:
+            try:
+                cached = _configs.get(device)
+            except TypeError:
+                cached = None
+        if cached is not None and time.monotonic() - cached[0] <= ttl:
+            return subcommand_result(key, lambda: cached[1])
+    if not build and ttl <= 0:
+        return None
+
+    config = subcommand_result(key, lambda: _read(device))
+    if config and ttl > 0:
+        with _configs_lock:
+            try:
+                _configs[device] = (time.monotonic(), config)
+            except TypeError:
+                pass
+    return config or None
+
+
+def clear_running_config(device=None):
+    '''Forget the configuration kept for device, or for all the devices'''
+    with _configs_lock:
+        if device is None:
+            _configs.clear()
+        else:
+            try:
+                _configs.pop(device, None)
+            except TypeError:
+                pass
+
+
+def running_config_ttl():
+    '''Return genie.libs.parser.running_config_ttl, in seconds'''
+    ttl = cfg.get(PARSER_RUNNING_CONFIG_TTL, None) or os.environ.get(
+        PARSER_RUNNING_CONFIG_TTL.upper().replace('.', '_'))
+    try:
+        return float(ttl) if ttl is not None else 0
+    except ValueError:
+        log.warning('Invalid {k} value {t}, using 0'.format(
+            k=PARSER_RUNNING_CONFIG_TTL, t=ttl))
+        return 0
+
+
+def config_section(device, pattern, command, build=False):
+    '''Return ``| section pattern`` of the configuration of device
+
+    Read from the RunningConfig when there is one, or when build is set,
+    otherwise from the output of command.
+    '''
+    config = running_config(device, build=build)
+    if config is None:
+        return subcommand_execute(device, command)
+    return config.section(pattern)
+
+
+def config_include(device, pattern, command, build=False):
+    '''Return ``| include pattern`` of the configuration of device
+
+    Read from the RunningConfig when there is one, or when build is set,
+    otherwise from the output of command.
+    '''
+    config = running_config(device, build=build)
+    if config is None:
+        return subcommand_execute(device, command)
+    return config.include(pattern)
+
+
+def _read(device):
+    '''Return the RunningConfig of device, False when it cannot be read'''
+    try:
+        output = device.execute(RUNNING_CONFIG_COMMAND)
+    except Exception as e:
+        log.debug('Could not read the running configuration: {e}'.format(
+            e=e))
+        return False
+    if not isinstance(output, str) or not output.strip() or \
+            output.lstrip().startswith('%'):
+        return False
+    return RunningConfig(output)
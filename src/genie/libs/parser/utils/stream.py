@@ -0,0 +1,113 @@
+'''Streaming helpers for the parsers of huge outputs
+
+A full BGP or route table holds hundreds of thousands of prefixes; building
+the whole parsed dictionary of such an output takes gigabytes. The parsers
+supporting it also provide ``parse_iter(output_stream)`` which reads the
+output line by line and yields one record (ex: one route) as soon as it is
+complete, without keeping it.
+
+Both ``cli()`` and ``parse_iter()`` share the same parsing code, the records
+being kept in the parsed output or handed over by ``RecordStream``:
+
+    def _iter_parse(self, lines, ret_dict, records):
+        for line in lines:
+            ...
+            # 10.1.1.0/24 ...
+            route_dict = records.start(routes_dict, route, (vrf, route))
+            ...
+            if records.completed:
+                yield from records.pop_completed()
+
+        records.close()
+        yield from records.pop_completed()
+'''
+
+# Key of RecordStream.start() adding the record at the end of a list
+APPEND = object()
+
+
+def iter_lines(output_stream):
+    '''Return an iterator on the lines of a device output
+
+    Args:
+        output_stream (`str`, file object or iterable of `str`): the output,
+            read lazily unless given as a str
+
+    Returns:
+        iterator of `str`: the lines, without their end of line
+    '''
+    if isinstance(output_stream, str):
+        return iter(output_stream.splitlines())
+    return (line.rstrip('\r\n') for line in output_stream)
+
+
+class RecordStream(object):
+    '''Track the record being parsed and hand over the completed ones
+
+    A record is complete when the next record starts or when the stream is
+    closed. With ``streaming`` False, records stay in the parsed output and
+    are never handed over.
+
+    Args:
+        streaming (`bool`): remove the completed records from the parsed
+                            output and hand them over
+    '''
+
+    def __init__(self, streaming=False):
+        self.streaming = streaming
+        self.completed = []
+        self._current = None
+
+    def start(self, container, key, context):
+        '''Return the record container[key], created as {} when missing
+
+        Args:
+            container (`dict` or `list`): where the record is in the parsed
+                output
+            key: key of the record in container, or ``APPEND`` to add a new
+                record at the end of a list
+            context (`tuple`): keys identifying the record, ex: (vrf, route),
+                handed over with it
+
+        Returns:
+            dict: the record
+        '''
+        if key is APPEND:
+            record = {}
+            container.append(record)
+        else:
+            record = container.get(key)
+            if record is None:
+                record = container[key] = {}
+
+        if self.streaming:
+            current = self._current
+            if current is None or current[2] is not record:
+                self._complete()
+                self._current = (container, key, record, context)
+        return record
+
+    def _complete(self):
+        if self._current is None:
+            return
+        container, key, record, context = self._current
+        self._current = None
+        # Detach the record from the parsed output to bound the memory used
+        if key is APPEND:
+            for index in range(len(container) - 1, -1, -1):
+                if container[index] is record:
+                    del container[index]
+                    break
+        elif container.get(key) is record:
+            del container[key]
+        self.completed.append((context, record))
+
+    def close(self):
+        '''Complete the record being parsed, at the end of the output'''
+        if self.streaming:
+            self._complete()
+
+    def pop_completed(self):
+        '''Return the (context, record) completed since the last call'''
+        completed, self.completed = self.completed, []
+        return completed
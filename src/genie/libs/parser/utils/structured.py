@@ -0,0 +1,84 @@
+'''Base of the parsers parsing the structured output of their command
+
+The devices print the output of most commands as json or xml too, ex:
+``| display json`` on Junos, ``| json`` on NX-OS. The mixins of the os
+(``JunosStructured``, ``NxosStructured``) add a context per structured
+format to the parsers; the context runs the command of ``cli()`` piped to
+the format, maps the output into the schema, and falls back to ``cli()``
+when that fails.
+'''
+
+# python
+import json
+import string
+import inspect
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class StructuredOutputError(Exception):
+    '''The structured output cannot be mapped into the schema'''
+
+
+class StructuredParser(object):
+    '''Mixin of the parsers parsing a structured output of their command'''
+
+    def structured_command(self, pipe, **kwargs):
+        '''Return the cli_command for the arguments, piped to pipe
+
+        The command is the first of cli_command with exactly the given
+        arguments as fields, like cli() picks it. The arguments not given
+        take the default of cli(), ex: vrf='all'.
+        '''
+        commands = self.cli_command
+        if not isinstance(commands, (list, tuple)):
+            commands = [commands]
+        for name, parameter in inspect.signature(
+                self.cli).parameters.items():
+            if parameter.default is not parameter.empty:
+                kwargs.setdefault(name, parameter.default)
+        kwargs.pop('output', None)
+        given = {name for name, value in kwargs.items() if value}
+        for command in commands:
+            fields = {field for _, field, _, _ in
+                      string.Formatter().parse(command) if field}
+            if fields == given:
+                return '{c} | {p}'.format(c=command.format(**kwargs), p=pipe)
+        raise StructuredOutputError('No command for the arguments {a}'.format(
+            a=sorted(given)))
+
+    def structured_parse(self, pipe, convert, output=None, **kwargs):
+        '''Return convert() of the output of the command piped to pipe, or
+        the cli() parsed output when that fails'''
+        try:
+            out = output
+            if out is None:
+                out = self.device.execute(
+                    self.structured_command(pipe, **kwargs))
+            return convert(out)
+        except Exception as e:
+            log.debug("'| {p}' of {c} failed, parsing the cli output: "
+                      "{e}".format(p=pipe, c=type(self).__name__, e=e))
+
+        if output is not None and not _is_structured(output):
+            # The given output is the cli output
+            return self.cli(output=output, **kwargs)
+        return self.cli(**kwargs)
+
+
+def load_json(output):
+    '''Return the json object of an output, without the prompt or the banner
+    around it'''
+    try:
+        root, _ = json.JSONDecoder().raw_decode(output, output.index('{'))
+    except ValueError as e:
+        raise StructuredOutputError('Invalid json output: {e}'.format(e=e))
+    if not isinstance(root, dict):
+        raise StructuredOutputError('The json output is not an object')
+    return root
+
+
+def _is_structured(output):
+    text = output.lstrip()
+    return text.startswith('{') or text.startswith('<')
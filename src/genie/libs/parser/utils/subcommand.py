@@ -0,0 +1,84 @@
+'''Run the auxiliary commands of a parser at most once per parse
+
+Some parsers complete their output with other commands, ex: the transit
+area of the OSPF virtual links, parsed from 'show ospf vrf all-inclusive
+virtual-links' for each virtual link interface. On a scaled router, running
+these commands again for each entry turns a 2 second parse into minutes.
+
+Within a parse opened by a ``@subcommand_cache`` decorated ``cli()``,
+``subcommand_parse`` and ``subcommand_execute`` run each command once and
+return the same result on the next calls:
+
+    class ShowOspfVrfAllInclusiveInterface(...):
+
+        @subcommand_cache
+        def cli(self, vrf='', interface='', output=None):
+            ...
+            for line in out.splitlines():
+                ...
+                vl_out = subcommand_parse(ShowOspfVrfAllInclusiveVirtualLinks,
+                                          self.device)
+
+The cache lives until the outermost decorated ``cli()`` returns: parsers
+called by the parse share it. Outside of such a parse, the commands are
+not cached. Cached results are shared, they must not be modified.
+'''
+
+# python
+import functools
+import threading
+
+_scope = threading.local()
+
+
+def subcommand_cache(cli):
+    '''Decorator of a parser cli(), caching the sub commands of the parse'''
+
+    @functools.wraps(cli)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_scope, 'cache', None) is not None:
+            # Called within another parse, use its cache
+            return cli(self, *args, **kwargs)
+
+        _scope.cache = {}
+        try:
+            return cli(self, *args, **kwargs)
+        finally:
+            _scope.cache = None
+
+    return wrapper
+
+
+def subcommand_parse(parser_cls, device, **kwargs):
+    '''Return parser_cls(device=device).parse(**kwargs), parsed once per
+    parse'''
+    key = (parser_cls, id(device), tuple(sorted(kwargs.items())))
+    return _cached(key, lambda: parser_cls(device=device).parse(**kwargs))
+
+
+def subcommand_execute(device, command):
+    '''Return device.execute(command), executed once per parse'''
+    return _cached((id(device), command), lambda: device.execute(command))
+
+
+def subcommand_result(key, run):
+    '''Return run(), run once per parse for the hashable key'''
+    return _cached(key, run)
+
+
+def subcommand_cached(key, default=None):
+    '''Return the result cached for key in the current parse, default when
+    there is none'''
+    cache = getattr(_scope, 'cache', None)
+    if cache is None:
+        return default
+    return cache.get(key, default)
+
+
+def _cached(key, run):
+    cache = getattr(_scope, 'cache', None)
+    if cache is None:
+        return run()
+    if key not in cache:
+        cache[key] = run()
+    return cache[key]
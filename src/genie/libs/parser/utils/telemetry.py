@@ -0,0 +1,656 @@
+'''Telemetry of the parsers: time, size and regex cost of each parse
+
+Which parser, which pattern or which schema validation is slow only shows on
+the outputs of the fleet. Once enabled, every parse() of the parsers of
+genie.libs.parser is measured:
+
+    * wall time of parse(), and of its context, ex: cli(); the rest of
+      parse() is mostly the schema validation
+    * lines and bytes of the parsed output
+    * with 'regex': attempts, matches and time of each pattern the parser
+      tries
+    * with 'memory': peak of the memory allocated, through tracemalloc
+
+Telemetry costs nothing when it is off: parse() and the re module are only
+wrapped by enable(). disable() puts the compiled patterns back in place of
+the counting ones handed out meanwhile, in the dicts, lists, tuples and
+attributes holding them, ex: the module globals and the dispatcher rules. GENIE_LIBS_PARSER_TELEMETRY enables it on the import of
+genie.libs.parser, with the measures to take:
+
+    GENIE_LIBS_PARSER_TELEMETRY=time               # or 1
+    GENIE_LIBS_PARSER_TELEMETRY=time,regex,memory  # or all
+    GENIE_LIBS_PARSER_TELEMETRY_PATH=/tmp/parsers.jsonl
+
+Each parse is an event, a dict sent to the listeners, add_listener(), and
+appended as a json line to GENIE_LIBS_PARSER_TELEMETRY_PATH. The totals by
+parser are returned by counters(), and by prometheus_text() in the text
+exposition format of Prometheus:
+
+    >>> telemetry.enable(['time', 'regex'])
+    >>> device.parse('show interfaces')
+    >>> print(telemetry.prometheus_text())
+
+The patterns compiled before enable() are not counted, except the ones
+compiled by cli() on each call: enabling from the environment wraps the
+patterns of every parser module.
+'''
+
+# python
+import gc
+import os
+import re
+import sys
+import json
+import time
+import logging
+import functools
+import threading
+import weakref
+import types
+
+log = logging.getLogger(__name__)
+
+TELEMETRY_ENV = 'GENIE_LIBS_PARSER_TELEMETRY'
+TELEMETRY_PATH_ENV = 'GENIE_LIBS_PARSER_TELEMETRY_PATH'
+
+MEASURES = ('time', 'regex', 'memory')
+
+# Modules whose parsers and patterns are measured
+PACKAGE = 'genie.libs.parser.'
+
+# Functions of re, and methods of the compiled patterns, counted as attempts
+_RE_FUNCTIONS = ('match', 'search', 'fullmatch', 'findall', 'finditer',
+                 'sub', 'subn', 'split')
+# Attempts whose result tells whether the pattern matched
+_MATCHING = ('match', 'search', 'fullmatch')
+
+_local = threading.local()
+_telemetry = None
+_originals = []
+# CountingPattern handed out by re.compile(), by id
+_patterns = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+_tracing = False
+
+
+class ParseCall(object):
+    '''Measures of one parse() call'''
+
+    def __init__(self, parser, depth):
+        self.parser = parser
+        self.depth = depth
+        self.lines = 0
+        self.bytes = 0
+        self.context_calls = 0
+        self.context_seconds = 0.0
+        self.in_context = False
+        self.regex_attempts = 0
+        self.regex_matches = 0
+        self.regex_seconds = 0.0
+        self.patterns = {}
+
+    def add_output(self, output):
+        if output:
+            self.lines += output.count('\n') + 1
+            self.bytes += len(output.encode(errors='surrogateescape'))
+
+    def add_attempt(self, pattern, matched, seconds):
+        self.regex_attempts += 1
+        self.regex_matches += matched
+        self.regex_seconds += seconds
+        counts = self.patterns.get(pattern)
+        if counts is None:
+            counts = self.patterns[pattern] = [0, 0, 0.0]
+        counts[0] += 1
+        counts[1] += matched
+        counts[2] += seconds
+
+
+class ParserTelemetry(object):
+    '''Measures parse() calls, and keeps their totals by parser
+
+    Args:
+        measures (`list`): measures to take, among MEASURES
+    '''
+
+    def __init__(self, measures=('time',)):
+        unknown = set(measures) - set(MEASURES)
+        if unknown:
+            raise ValueError('Unknown telemetry measures {m}, expected some '
+                             'of {e}'.format(m=sorted(unknown), e=MEASURES))
+        self.measures = frozenset(measures) | {'time'}
+        self.listeners = []
+        self._counters = {}
+        self._patterns = {}
+        self._lock = threading.Lock()
+
+    def measure(self, parser, parse, args, kwargs):
+        '''Call parse(parser, *args, **kwargs) and record its measures'''
+        calls = _calls()
+        call = ParseCall(_name(type(parser)), len(calls))
+        output = kwargs.get('output')
+        if isinstance(output, str):
+            call.add_output(output)
+
+        # Time the context as parse() calls it, ex: cli(). MetaParser keeps
+        # the contexts in a list, ex: ['cli']
+        context = getattr(parser, 'context', None) or 'cli'
+        if isinstance(context, (list, tuple)):
+            context = context[0]
+        if not isinstance(context, str) or context in vars(parser) or \
+                not callable(getattr(parser, context, None)):
+            context = None
+        else:
+            setattr(parser, context,
+                    _timed_context(getattr(parser, context), call))
+
+        # Count the output the parser executes
+        device = getattr(parser, 'device', None)
+        if output is None and device is not None and \
+                hasattr(device, 'execute'):
+            parser.device = _CountingDevice(device, call)
+
+        memory = 'memory' in self.measures and not calls
+        if memory:
+            memory_base = _memory_start()
+
+        calls.append(call)
+        started = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            return parse(parser, *args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            calls.pop()
+            if context is not None:
+                vars(parser).pop(context, None)
+            if isinstance(getattr(parser, 'device', None), _CountingDevice):
+                parser.device = device
+            self.record(call, {
+                'parser': call.parser,
+                'os': _os_name(device),
+                'context': context,
+                'depth': call.depth,
+                'time': started,
+                'seconds': seconds,
+                'peak_bytes': _memory_peak(memory_base) if memory else None,
+                'error': type(error).__name__ if error is not None else None})
+
+    def record(self, call, event):
+        '''Add the event of a call to the totals and send it to the
+        listeners'''
+        event.update({'lines': call.lines, 'bytes': call.bytes})
+        if call.context_calls:
+            event['context_seconds'] = call.context_seconds
+            event['schema_seconds'] = max(
+                event['seconds'] - call.context_seconds, 0.0)
+        else:
+            event['context_seconds'] = event['schema_seconds'] = None
+        if 'regex' in self.measures:
+            event.update({'regex_attempts': call.regex_attempts,
+                          'regex_matches': call.regex_matches,
+                          'regex_seconds': call.regex_seconds,
+                          'patterns': call.patterns})
+
+        with self._lock:
+            counters = self._counters.get(call.parser)
+            if counters is None:
+                counters = self._counters[call.parser] = dict.fromkeys(
+                    ('calls', 'errors', 'seconds', 'context_seconds',
+                     'schema_seconds', 'lines', 'bytes', 'regex_attempts',
+                     'regex_matches', 'regex_seconds', 'peak_bytes'), 0)
+            counters['calls'] += 1
+            counters['errors'] += event['error'] is not None
+            for key in ('seconds', 'context_seconds', 'schema_seconds',
+                        'lines', 'bytes', 'regex_attempts', 'regex_matches',
+                        'regex_seconds'):
+                counters[key] += event.get(key) or 0
+            counters['peak_bytes'] = max(counters['peak_bytes'],
+                                         event['peak_bytes'] or 0)
+            for pattern, (attempts, matches, seconds) in \
+                    call.patterns.items():
+                counts = self._patterns.setdefault((call.parser, pattern),
+                                                   [0, 0, 0.0])
+                counts[0] += attempts
+                counts[1] += matches
+                counts[2] += seconds
+            listeners = list(self.listeners)
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                log.exception('Parser telemetry listener {l} '
+                              'failed'.format(l=listener))
+
+    def counters(self):
+        '''Return the totals by parser, and by parser and pattern'''
+        with self._lock:
+            return {'parsers': {parser: dict(counters) for parser, counters
+                                in self._counters.items()},
+                    'patterns': {key: {'attempts': attempts,
+                                       'matches': matches,
+                                       'seconds': seconds}
+                                 for key, (attempts, matches, seconds)
+                                 in self._patterns.items()}}
+
+    def prometheus_text(self):
+        '''Return the totals in the text exposition format of Prometheus'''
+        counters = self.counters()
+        lines = []
+        for name, key, kind, text in _METRICS:
+            lines.append('# HELP {n} {t}'.format(n=name, t=text))
+            lines.append('# TYPE {n} {k}'.format(n=name, k=kind))
+            for parser, values in sorted(counters['parsers'].items()):
+                lines.append('{n}{{parser="{p}"}} {v}'.format(
+                    n=name, p=_label(parser), v=values[key]))
+        for name, key, text in _PATTERN_METRICS:
+            lines.append('# HELP {n} {t}'.format(n=name, t=text))
+            lines.append('# TYPE {n} counter'.format(n=name))
+            for (parser, pattern), values in sorted(
+                    counters['patterns'].items()):
+                lines.append('{n}{{parser="{p}",pattern="{r}"}} {v}'.format(
+                    n=name, p=_label(parser), r=_label(pattern),
+                    v=values[key]))
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        '''Drop the totals'''
+        with self._lock:
+            self._counters.clear()
+            self._patterns.clear()
+
+
+_METRICS = [
+    ('genie_parser_calls_total', 'calls', 'counter', 'Calls of parse()'),
+    ('genie_parser_errors_total', 'errors', 'counter',
+     'Calls of parse() which raised'),
+    ('genie_parser_seconds_total', 'seconds', 'counter',
+     'Wall time of parse()'),
+    ('genie_parser_context_seconds_total', 'context_seconds', 'counter',
+     'Wall time of the context of parse(), ex: cli()'),
+    ('genie_parser_schema_seconds_total', 'schema_seconds', 'counter',
+     'Wall time of parse() out of its context, mostly schema validation'),
+    ('genie_parser_lines_total', 'lines', 'counter', 'Lines parsed'),
+    ('genie_parser_bytes_total', 'bytes', 'counter', 'Bytes parsed'),
+    ('genie_parser_regex_attempts_total', 'regex_attempts', 'counter',
+     'Patterns tried'),
+    ('genie_parser_regex_matches_total', 'regex_matches', 'counter',
+     'Patterns tried which matched'),
+    ('genie_parser_regex_seconds_total', 'regex_seconds', 'counter',
+     'Wall time of the patterns tried'),
+    ('genie_parser_peak_bytes', 'peak_bytes', 'gauge',
+     'Largest peak of memory allocated by parse()'),
+]
+
+_PATTERN_METRICS = [
+    ('genie_parser_pattern_attempts_total', 'attempts',
+     'Attempts of a pattern'),
+    ('genie_parser_pattern_matches_total', 'matches',
+     'Attempts of a pattern which matched'),
+    ('genie_parser_pattern_seconds_total', 'seconds',
+     'Wall time of the attempts of a pattern'),
+]
+
+
+class JsonLinesWriter(object):
+    '''Listener appending the events to a file, one json object per line
+
+    Args:
+        path (`str`): path of the file, created if missing
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        line = json.dumps(event, sort_keys=True, default=str)
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+
+
+class CountingPattern(object):
+    '''Compiled pattern counting its attempts in the current parse()'''
+
+    __slots__ = ('compiled', 'pattern', 'flags', 'groups', 'groupindex',
+                 '__weakref__')
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+        self.groups = compiled.groups
+        self.groupindex = compiled.groupindex
+
+    def __getattr__(self, name):
+        return getattr(self.compiled, name)
+
+    def __repr__(self):
+        return repr(self.compiled)
+
+    def __eq__(self, other):
+        return self.compiled == getattr(other, 'compiled', other)
+
+    def __hash__(self):
+        return hash(self.compiled)
+
+    def __reduce__(self):
+        return (re.compile, (self.pattern, self.flags))
+
+
+def _counting_method(name):
+    def method(self, *args, **kwargs):
+        calls = getattr(_local, 'calls', None)
+        if not calls:
+            return getattr(self.compiled, name)(*args, **kwargs)
+        start = time.perf_counter()
+        result = getattr(self.compiled, name)(*args, **kwargs)
+        calls[-1].add_attempt(self.pattern,
+                              name in _MATCHING and result is not None,
+                              time.perf_counter() - start)
+        return result
+    method.__name__ = name
+    return method
+
+
+for _function in _RE_FUNCTIONS:
+    setattr(CountingPattern, _function, _counting_method(_function))
+
+
+class _CountingDevice(object):
+    '''Device counting the outputs it returns to the parser'''
+
+    def __init__(self, device, call):
+        self._device = device
+        self._call = call
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def execute(self, *args, **kwargs):
+        output = self._device.execute(*args, **kwargs)
+        if isinstance(output, str):
+            self._call.add_output(output)
+        return output
+
+
+def enable(measures=('time',), path=None):
+    '''Measure the parse() calls of the parsers from now on
+
+    Args:
+        measures (`list`): measures to take, among MEASURES
+        path (`str`): file the events are appended to, as json lines
+
+    Returns:
+        ParserTelemetry: the telemetry recording the calls
+    '''
+    global _telemetry
+    telemetry = ParserTelemetry(measures)
+    if path:
+        telemetry.listeners.append(JsonLinesWriter(path))
+    with _lock:
+        if _telemetry is not None:
+            telemetry.listeners.extend(
+                listener for listener in _telemetry.listeners
+                if not isinstance(listener, JsonLinesWriter))
+        _unpatch()
+        if 'regex' not in telemetry.measures:
+            _unwrap_patterns()
+        _telemetry = telemetry
+        _patch_parse()
+        if 'regex' in telemetry.measures:
+            _patch_re()
+    return telemetry
+
+
+def disable():
+    '''Stop measuring the parse() calls, and restore parse() and re'''
+    global _telemetry, _tracing
+    with _lock:
+        _unpatch()
+        _unwrap_patterns()
+        _telemetry = None
+        if _tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            _tracing = False
+
+
+def enable_from_environment():
+    '''Enable the telemetry as GENIE_LIBS_PARSER_TELEMETRY and
+    GENIE_LIBS_PARSER_TELEMETRY_PATH configure it, if they do'''
+    value = os.environ.get(TELEMETRY_ENV)
+    if not value or value.lower() in ('0', 'false', 'no', 'off'):
+        return None
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        measures = ('time',)
+    elif value.lower() == 'all':
+        measures = MEASURES
+    else:
+        measures = [measure.strip() for measure in value.split(',')
+                    if measure.strip()]
+    try:
+        return enable(measures, path=os.environ.get(TELEMETRY_PATH_ENV))
+    except ValueError as e:
+        log.warning('Invalid {k} value {v}: {e}'.format(
+            k=TELEMETRY_ENV, v=value, e=e))
+        return None
+
+
+def get_telemetry():
+    '''Return the enabled ParserTelemetry, None when it is off'''
+    return _telemetry
+
+
+def add_listener(listener):
+    '''Call listener(event) after each measured parse() call'''
+    _enabled().listeners.append(listener)
+
+
+def remove_listener(listener):
+    _enabled().listeners.remove(listener)
+
+
+def counters():
+    '''Return the totals by parser, and by parser and pattern'''
+    return _enabled().counters()
+
+
+def prometheus_text():
+    '''Return the totals in the text exposition format of Prometheus'''
+    return _enabled().prometheus_text()
+
+
+def _enabled():
+    if _telemetry is None:
+        raise RuntimeError('Parser telemetry is not enabled, see '
+                           'genie.libs.parser.utils.telemetry.enable()')
+    return _telemetry
+
+
+def _patch(owner, name, value):
+    _originals.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, value)
+
+
+def _unpatch():
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def _patch_parse():
+    from genie.metaparser import MetaParser
+    original = MetaParser.parse
+
+    @functools.wraps(original)
+    def parse(self, *args, **kwargs):
+        telemetry = _telemetry
+        if telemetry is None or \
+                not type(self).__module__.startswith(PACKAGE):
+            return original(self, *args, **kwargs)
+        return telemetry.measure(self, original, args, kwargs)
+
+    _patch(MetaParser, 'parse', parse)
+
+
+def _patch_re():
+    compile_ = re.compile
+
+    @functools.wraps(compile_)
+    def compile(pattern, flags=0):
+        compiled = compile_(_compiled(pattern), flags)
+        if _from_parser(sys._getframe(1)):
+            counting = CountingPattern(compiled)
+            _patterns[id(counting)] = counting
+            return counting
+        return compiled
+
+    _patch(re, 'compile', compile)
+    for name in _RE_FUNCTIONS:
+        _patch(re, name, _counting_function(name, getattr(re, name)))
+
+
+def _unwrap_patterns():
+    '''Replace the CountingPattern handed out by their compiled pattern'''
+    patterns = list(_patterns.values())
+    _patterns.clear()
+    if patterns:
+        _replace(patterns, {id(pattern): pattern.compiled
+                            for pattern in patterns})
+        # Class dicts were updated in place
+        sys._clear_type_cache()
+
+
+def _replace(objects, replacements):
+    '''Replace objects in the containers and attributes referring to them,
+    replacements being the new object by id of the old one'''
+    # Tuples and bound methods of the objects, replaced in their referrers
+    olds = {}
+    news = {}
+    for referrer in gc.get_referrers(*objects):
+        if referrer is objects or referrer is olds:
+            continue
+        if isinstance(referrer, dict):
+            for key, value in list(referrer.items()):
+                if id(value) in replacements:
+                    referrer[key] = replacements[id(value)]
+        elif isinstance(referrer, list):
+            for index, value in enumerate(referrer):
+                if id(value) in replacements:
+                    referrer[index] = replacements[id(value)]
+        elif isinstance(referrer, tuple):
+            olds[id(referrer)] = referrer
+            news[id(referrer)] = tuple(replacements.get(id(value), value)
+                                       for value in referrer)
+        elif isinstance(referrer, types.MethodType):
+            # Ex: the pattern.match of the dispatcher rules
+            if id(referrer.__self__) in replacements:
+                olds[id(referrer)] = referrer
+                news[id(referrer)] = getattr(
+                    replacements[id(referrer.__self__)],
+                    referrer.__func__.__name__)
+        else:
+            for name in _slots(type(referrer)):
+                value = getattr(referrer, name, None)
+                if id(value) in replacements:
+                    setattr(referrer, name, replacements[id(value)])
+    if olds:
+        _replace(list(olds.values()), news)
+
+
+def _slots(cls):
+    for klass in cls.__mro__:
+        slots = vars(klass).get('__slots__', ())
+        yield from (slots,) if isinstance(slots, str) else slots
+
+
+def _counting_function(name, function):
+    @functools.wraps(function)
+    def counting(pattern, *args, **kwargs):
+        pattern = _compiled(pattern)
+        calls = getattr(_local, 'calls', None)
+        if not calls or not _from_parser(sys._getframe(1)):
+            return function(pattern, *args, **kwargs)
+        start = time.perf_counter()
+        result = function(pattern, *args, **kwargs)
+        calls[-1].add_attempt(getattr(pattern, 'pattern', pattern),
+                              name in _MATCHING and result is not None,
+                              time.perf_counter() - start)
+        return result
+    return counting
+
+
+def _compiled(pattern):
+    return pattern.compiled if isinstance(pattern, CountingPattern) \
+        else pattern
+
+
+def _from_parser(frame):
+    module = frame.f_globals.get('__name__', '')
+    return module.startswith(PACKAGE) and module != __name__
+
+
+def _timed_context(method, call):
+    @functools.wraps(method)
+    def context(*args, **kwargs):
+        if call.in_context:
+            return method(*args, **kwargs)
+        call.in_context = True
+        call.context_calls += 1
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            call.context_seconds += time.perf_counter() - start
+            call.in_context = False
+    return context
+
+
+def _calls():
+    calls = getattr(_local, 'calls', None)
+    if calls is None:
+        calls = _local.calls = []
+    return calls
+
+
+def _memory_start():
+    global _tracing
+    # tracemalloc slows every allocation down, only when measuring memory
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracing = True
+    # The peak of a call needs reset_peak(), python >= 3.9
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
+
+def _memory_peak(base):
+    import tracemalloc
+    if base is None or not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[1] - base
+
+
+def _name(parser_cls):
+    return '{m}.{c}'.format(m=parser_cls.__module__,
+                            c=parser_cls.__qualname__)
+
+
+def _os_name(device):
+    os_name = getattr(device, 'os', None)
+    return os_name if isinstance(os_name, str) else None
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
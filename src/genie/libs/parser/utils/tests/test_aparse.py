@@ -0,0 +1,208 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.aparse import aparse, aparse_parser
+from genie.libs.parser.utils.common import clear_parser_cache
+from genie.libs.parser.dnac.interface import Interface
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAllSummary
+from genie.libs.parser.nxos.show_vrf import ShowVrf, ShowRunningConfigVrf
+
+BGP_SUMMARY = '''\
+BGP router identifier 10.169.197.254, local AS number 65109
+BGP table version is 263, main routing table version 263
+126 network entries using 32256 bytes of memory
+BGP using 92688 total bytes of memory
+BGP activity 226/0 prefixes, 4035/3696 paths, scan interval 60 secs
+
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+192.168.10.253  4        65555   10112   10107      263    0    0 3d05h          13
+192.168.36.119  4        65109   10293   10213      263    0    0 3d05h          62
+'''
+
+BGP_IPV4_VRF = '''\
+ address-family ipv4 vrf VRF1
+  neighbor 192.168.10.253 remote-as 65555
+  neighbor 192.168.10.253 activate
+'''
+
+NXOS_VRF = '''\
+VRF-Name                           VRF-ID State   Reason
+default                                 1 Up      --
+vni_10100                               3 Up      --
+vni_10200                               4 Up      --
+'''
+
+NXOS_CONFIG = '''\
+vrf context vni_10100
+  vni 10100
+  rd auto
+vrf context vni_10200
+  vni 10200
+  rd auto
+'''
+
+
+class AsyncDevice(object):
+    '''Device whose execute() and get() are coroutines'''
+
+    def __init__(self, outputs, os='iosxe'):
+        self.os = os
+        self.custom = {}
+        self.outputs = outputs
+        self.calls = []
+        self.in_flight = self.max_in_flight = 0
+
+    async def execute(self, command):
+        return await self._call(command)
+
+    async def get(self, path):
+        return await self._call(path)
+
+    async def _call(self, command):
+        self.calls.append(command)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        output = self.outputs(command) if callable(self.outputs) \
+            else self.outputs[command]
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+def sync_device(outputs, os='iosxe'):
+    device = Mock(os=os)
+    device.execute.side_effect = lambda command: outputs[command]
+    return device
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAparse(unittest.TestCase):
+
+    def test_concurrent_commands(self):
+        outputs = {'show ip bgp all summary': BGP_SUMMARY,
+                   'show run | sec address-family ipv4 vrf': BGP_IPV4_VRF,
+                   'show run | sec address-family ipv6 vrf': ''}
+        device = AsyncDevice(outputs)
+        parsed = run(aparse_parser(ShowIpBgpAllSummary, device))
+
+        self.assertEqual(parsed, ShowIpBgpAllSummary(
+            device=sync_device(outputs)).parse())
+        self.assertEqual(sorted(device.calls), sorted(outputs))
+        # The summary and both address families in one round
+        self.assertEqual(device.max_in_flight, 3)
+
+    def test_dependent_commands(self):
+        outputs = {'show vrf': NXOS_VRF, 'show running-config': NXOS_CONFIG}
+        device = AsyncDevice(outputs, os='nxos')
+        parsed = run(aparse_parser(ShowRunningConfigVrf, device))
+
+        self.assertEqual(sorted(parsed['vrf']), ['vni_10100', 'vni_10200'])
+        # The running configuration is read instead of a command per vrf
+        self.assertEqual(device.calls, ['show vrf', 'show running-config'])
+
+    def dnac_get(self, count):
+        '''Return the get() of a dnac of count interfaces, on 3 devices'''
+        interface = {'portName': 'GigabitEthernet0/0/{}', 'pid': 'C9300',
+                     'deviceId': 'device{}', 'adminStatus': 'UP',
+                     'ospfSupport': 'false', 'portMode': 'access',
+                     'serialNo': 'FCW', 'series': 'Catalyst',
+                     'status': 'up', 'className': 'Endpoint',
+                     'description': '', 'duplex': 'FullDuplex',
+                     'id': 'id{}', 'ifIndex': '{}', 'instanceTenantId': 't',
+                     'instanceUuid': 'u{}', 'interfaceType': 'Physical',
+                     'isisSupport': 'false', 'lastUpdated': '',
+                     'macAddress': '', 'portType': 'Ethernet Port'}
+        interfaces = [{key: value.format(index) for key, value in
+                       interface.items()} for index in range(count)]
+        for index, intf in enumerate(interfaces):
+            intf['deviceId'] = 'device{}'.format(index % 3)
+
+        def get(path):
+            if path.startswith('/dna/intent/api/v1/network-device/'):
+                device_id = path.rsplit('/', 1)[1]
+                response = {'hostname': 'host-' + device_id}
+            else:
+                offset = int(path.split('offset=')[1].split('&')[0])
+                response = interfaces[offset - 1:offset + 1]
+            return Mock(json=Mock(return_value={'response': response}))
+        return get
+
+    def test_get(self):
+        get = self.dnac_get(5)
+
+        class SmallPages(Interface):
+            page_size = 2
+
+        device = AsyncDevice(get, os='dnac')
+        parsed = run(aparse_parser(SmallPages, device))
+
+        self.assertEqual(parsed, SmallPages(
+            device=Mock(get=Mock(side_effect=get))).parse())
+        self.assertEqual(len(device.calls), 6)
+        # The hostnames of the devices of the first page together
+        self.assertEqual(device.max_in_flight, 2)
+
+    def test_many_pages(self):
+        get = self.dnac_get(201)
+
+        class SmallPages(Interface):
+            page_size = 2
+
+        device = AsyncDevice(get, os='dnac')
+        with patch.object(SmallPages, 'cli', autospec=True,
+                          side_effect=Interface.cli) as cli:
+            parsed = run(aparse_parser(SmallPages, device, max_rounds=1))
+        # Parsed once, each page and hostname fetched once
+        self.assertEqual(cli.call_count, 1)
+        self.assertEqual(len(parsed['hostname']), 3)
+        self.assertEqual(len(device.calls), 101 + 3)
+
+    @patch.object(common, '_get_parser', return_value=(ShowVrf, {}))
+    def test_command(self, _):
+        clear_parser_cache()
+        self.addCleanup(clear_parser_cache)
+        device = AsyncDevice({'show vrf': NXOS_VRF}, os='nxos')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parsed = run(aparse(device, 'show vrf', executor=executor))
+        self.assertEqual(parsed, ShowVrf(
+            device=sync_device({'show vrf': NXOS_VRF})).parse())
+
+        device = AsyncDevice({})
+        self.assertEqual(run(aparse(device, 'show vrf', output=NXOS_VRF)),
+                         parsed)
+        self.assertEqual(device.calls, [])
+
+    def test_errors(self):
+        device = AsyncDevice({'show vrf': ''}, os='nxos')
+        with patch.object(ShowVrf, 'cli',
+                          side_effect=SchemaEmptyParserError('')):
+            with self.assertRaises(SchemaEmptyParserError):
+                run(aparse_parser(ShowVrf, device))
+
+        # Raised by the device, as by its execute()
+        device = AsyncDevice({'show vrf': ConnectionError('closed')},
+                             os='nxos')
+        with self.assertRaises(ConnectionError):
+            run(aparse_parser(ShowVrf, device))
+
+        device = AsyncDevice(lambda command: '', os='nxos')
+        with self.assertRaises(RuntimeError):
+            run(aparse_parser(ShowRunningConfigVrf, device, max_rounds=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
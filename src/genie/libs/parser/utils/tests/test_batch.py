@@ -0,0 +1,68 @@
+import pathlib
+import unittest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.batch import parse_batch, BatchResult
+from genie.libs.parser.utils.common import clear_parser_cache
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+FOLDER = PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpRoute' / 'cli' / 'equal'
+
+
+def resolve(command, device, fuzzy, order_list):
+    if command == 'show ip route':
+        return ShowIpRoute, {}
+    if command == 'show ip route bad':
+        # cli() does not take that argument
+        return ShowIpRoute, {'bad': 1}
+    raise Exception("Could not find parser for '{}'".format(command))
+
+
+@patch.object(common, '_get_parser', side_effect=resolve)
+class TestParseBatch(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.outputs = [path.read_text()
+                        for path in sorted(FOLDER.glob('*_output.txt'))[:3]]
+        self.items = [('iosxe', None, 'show ip route', output)
+                      for output in self.outputs]
+        self.items.insert(1, ('iosxe', None, 'show unknown', ''))
+        self.items.append(('iosxe', None, 'show ip route bad', ''))
+
+    def check(self, results):
+        self.assertEqual(len(results), len(self.items))
+        self.assertTrue(all(isinstance(result, BatchResult)
+                            for result in results))
+
+        expected = [ShowIpRoute(device=None).cli(output=output)
+                    for output in self.outputs]
+        routes = results[:1] + results[2:-1]
+        self.assertEqual([result.parsed for result in routes], expected)
+        self.assertEqual([result.error for result in routes],
+                         [None] * len(expected))
+
+        self.assertIsNone(results[1].parsed)
+        self.assertIn('Could not find parser', str(results[1].error))
+        self.assertIsNone(results[-1].parsed)
+        self.assertIsInstance(results[-1].error, TypeError)
+
+    def test_in_process(self, get):
+        self.check(parse_batch(self.items, max_workers=1, chunksize=2))
+        # resolved once per distinct command
+        self.assertEqual(get.call_count, 3)
+
+    def test_executor(self, get):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.check(parse_batch(self.items, chunksize=1,
+                                   executor=executor))
+
+    def test_process_pool(self, get):
+        self.check(parse_batch(self.items, max_workers=2, chunksize=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
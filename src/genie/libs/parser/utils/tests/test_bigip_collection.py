@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.bigip_collection import collection_path, \
+                                                    rest_collections
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+
+
+POOLS = [{'name': 'pool{}'.format(index), 'partition': 'Common'}
+         for index in range(5)]
+
+
+def get(path):
+    '''get() of a device returning the pools by pages of 2'''
+    response = Mock()
+    if not path.startswith('/mgmt/tm/ltm/pool'):
+        response.json.return_value = {'kind': path, 'items': []}
+        return response
+    skip = int(path.split('$skip=')[1].split('&')[0]) \
+        if '$skip=' in path else 0
+    page = {'kind': 'tm:ltm:pool:poolcollectionstate',
+            'items': POOLS[skip:skip + 2],
+            'currentItemCount': 2, 'pageIndex': skip // 2 + 1}
+    if skip + 2 < len(POOLS):
+        page['nextLink'] = 'https://localhost/mgmt/tm/ltm/pool?$top=2&' \
+                           '$skip={}&ver=15.1.0'.format(skip + 2)
+    response.json.return_value = page
+    return response
+
+
+class TestBigipCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock()
+        self.device.get.side_effect = get
+
+    def test_pages(self):
+        collection = LtmPool(device=self.device).rest()
+        self.assertEqual(collection, {'kind': 'tm:ltm:pool:poolcollectionstate',
+                                      'items': POOLS})
+        self.assertEqual(self.device.get.call_args_list[-1][0][0],
+                         '/mgmt/tm/ltm/pool?$top=2&$skip=4&ver=15.1.0')
+
+    def test_one_page(self):
+        self.device.get.side_effect = None
+        self.device.get.return_value.json.return_value = {
+            'kind': 'tm:ltm:pool:poolcollectionstate', 'items': []}
+        self.assertEqual(LtmPool(device=self.device).rest(),
+                         {'kind': 'tm:ltm:pool:poolcollectionstate',
+                          'items': []})
+
+    def test_empty(self):
+        self.device.get.side_effect = None
+        self.device.get.return_value.json.return_value = None
+        self.assertEqual(LtmPool(device=self.device).rest(), {})
+
+    def test_iter_items(self):
+        items = LtmPool(device=self.device).iter_items(select=['name'])
+        self.assertEqual(next(items), POOLS[0])
+        self.assertEqual(self.device.get.call_count, 1)
+        self.assertEqual(list(items), POOLS[1:])
+        self.assertEqual(self.device.get.call_args_list[0][0][0],
+                         '/mgmt/tm/ltm/pool?$select=name')
+
+    def test_collection_path(self):
+        self.assertEqual(collection_path('/mgmt/tm/ltm/pool'),
+                         '/mgmt/tm/ltm/pool')
+        self.assertEqual(
+            collection_path('/mgmt/tm/ltm/pool', select=['name', 'partition'],
+                            top=100, skip=200),
+            '/mgmt/tm/ltm/pool?$select=name,partition&$top=100&$skip=200')
+
+    def test_rest_collections(self):
+        collections = rest_collections(
+            self.device, [LtmPool, '/mgmt/tm/net/wccp', '/mgmt/tm/sys/none'])
+        self.assertEqual(list(collections), ['/mgmt/tm/ltm/pool',
+                                             '/mgmt/tm/net/wccp',
+                                             '/mgmt/tm/sys/none'])
+        self.assertEqual(collections['/mgmt/tm/ltm/pool']['items'], POOLS)
+        self.assertEqual(collections['/mgmt/tm/net/wccp'],
+                         {'kind': '/mgmt/tm/net/wccp', 'items': []})
+
+    def test_rest_collections_error(self):
+        def failing(path):
+            if path == '/mgmt/tm/sys/none':
+                raise ValueError('404')
+            return get(path)
+        self.device.get.side_effect = failing
+        collections = rest_collections(
+            self.device, ['/mgmt/tm/ltm/pool', '/mgmt/tm/sys/none'])
+        self.assertIsInstance(collections['/mgmt/tm/sys/none'], ValueError)
+        self.assertEqual(collections['/mgmt/tm/ltm/pool']['items'], POOLS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import re
+import pathlib
+import unittest
+from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.utils import blocks
+from genie.libs.parser.utils.blocks import _linked
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.junos.show_interface import ShowInterfacesExtensive
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+FOLDER = PARSER_ROOT / 'iosxe' / 'tests' / 'ShowInterfaces' / 'cli' / 'equal'
+JUNOS_FOLDER = PARSER_ROOT / 'junos' / 'tests' / 'ShowInterfacesExtensive' / \
+    'cli' / 'equal'
+
+# Port-channel12 of member Gi1/0/2, GigabitEthernet3 unnumbered to Loopback0
+OUTPUT = (FOLDER / 'golden_output_output.txt').read_text()
+
+
+class TestBlockParser(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = ShowInterfaces(device=Mock())
+
+    def test_split_blocks(self):
+        header, blocks = self.parser.split_blocks(OUTPUT)
+        self.assertEqual(header, '')
+        self.assertEqual([name for name, _ in blocks],
+                         ['GigabitEthernet1/0/1', 'GigabitEthernet1/0/2',
+                          'GigabitEthernet3', 'Loopback0', 'Vlan100',
+                          'Port-channel12', 'GigabitEthernet0/0/4'])
+        self.assertTrue(blocks[3][1].startswith(
+            'Loopback0 is up, line protocol is up \n  Hardware is Loopback'))
+
+    def test_link_blocks(self):
+        _, blocks = self.parser.split_blocks(OUTPUT)
+        links = self.parser.link_blocks(blocks)
+        self.assertEqual(links['GigabitEthernet1/0/2'], {'Port-channel12'})
+        self.assertEqual(_linked({'GigabitEthernet1/0/2'}, links),
+                         {'Port-channel12', 'GigabitEthernet1/0/2'})
+        self.assertEqual(_linked({'Loopback0'}, links),
+                         {'GigabitEthernet3', 'Loopback0'})
+        self.assertEqual(_linked({'Vlan100'}, links), {'Vlan100'})
+
+    def test_parse_incremental(self):
+        for path in sorted(FOLDER.glob('*_output.txt')):
+            previous = path.read_text()
+            try:
+                parsed = self.parser.parse(output=previous)
+            except Exception:
+                continue
+            # One more input packet on the first block
+            output = re.sub(r'(\d+) packets input',
+                            lambda m: '{} packets input'.format(
+                                int(m.group(1)) + 1), previous, count=1)
+            with self.subTest(path.name):
+                self.assertEqual(self.parser.parse_incremental(
+                    previous, parsed, output),
+                    self.parser.parse(output=output))
+
+    def test_unchanged_blocks_reused(self):
+        parsed = self.parser.parse(output=OUTPUT)
+        output = OUTPUT.replace('Hardware is Loopback',
+                                'Hardware is Loopback\n'
+                                '  Description: changed')
+        incremental = self.parser.parse_incremental(OUTPUT, parsed, output)
+        self.assertEqual(incremental, self.parser.parse(output=output))
+        self.assertIs(incremental['Port-channel12'], parsed['Port-channel12'])
+        self.assertIsNot(incremental['Loopback0'], parsed['Loopback0'])
+
+    def test_linked_blocks_parsed_together(self):
+        parsed = self.parser.parse(output=OUTPUT)
+        # Gi1/0/1 joins Port-channel12, its own block is unchanged
+        output = OUTPUT.replace('Members in this channel: Gi1/0/2 ',
+                                'Members in this channel: Gi1/0/2 Gi1/0/1 ')
+        incremental = self.parser.parse_incremental(OUTPUT, parsed, output)
+        self.assertEqual(incremental, self.parser.parse(output=output))
+        self.assertTrue(incremental['GigabitEthernet1/0/1']
+                        ['port_channel']['port_channel_member'])
+
+    def test_new_block(self):
+        parsed = self.parser.parse(output=OUTPUT)
+        _, blocks = self.parser.split_blocks(OUTPUT)
+        output = OUTPUT + dict(blocks)['Loopback0'].replace(
+            'Loopback0', 'Loopback1', 1) + '\n'
+        incremental = self.parser.parse_incremental(OUTPUT, parsed, output)
+        self.assertEqual(incremental, self.parser.parse(output=output))
+        self.assertIn('Loopback1', incremental)
+
+
+@patch.object(blocks, 'MIN_PARALLEL_BLOCKS', 0)
+class TestParseBlocks(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_chunk_blocks(self):
+        parser = ShowInterfaces(device=Mock())
+        _, parts = parser.split_blocks(OUTPUT)
+        chunks = parser.chunk_blocks(parts, 1)
+        # The members go with their port-channel
+        self.assertEqual([[name for name, _ in chunk] for chunk in chunks],
+                         [['GigabitEthernet1/0/1'],
+                          ['GigabitEthernet1/0/2', 'Port-channel12'],
+                          ['GigabitEthernet3', 'Loopback0'], ['Vlan100'],
+                          ['GigabitEthernet0/0/4']])
+
+    def test_parse_blocks(self):
+        for path in sorted(FOLDER.glob('*_output.txt')):
+            output = path.read_text()
+            parser = ShowInterfaces(device=Mock())
+            try:
+                parsed = parser.parse(output=output)
+            except Exception:
+                continue
+            with self.subTest(path.name):
+                self.assertEqual(parser.parse_blocks(
+                    output, chunksize=2, executor=self.executor), parsed)
+
+    def test_parse_blocks_junos(self):
+        for path in sorted(JUNOS_FOLDER.glob('*_output.txt')):
+            output = path.read_text()
+            parser = ShowInterfacesExtensive(device=Mock())
+            with self.subTest(path.name):
+                self.assertEqual(parser.parse_blocks(
+                    output, chunksize=1, executor=self.executor),
+                    parser.parse(output=output))
+
+    def test_small_output(self):
+        parser = ShowInterfaces(device=Mock())
+        with patch.object(blocks, 'MIN_PARALLEL_BLOCKS', 10), \
+                patch.object(parser, 'chunk_blocks') as chunk_blocks:
+            parsed = parser.parse_blocks(OUTPUT, executor=self.executor)
+        self.assertFalse(chunk_blocks.called)
+        self.assertEqual(parsed, parser.parse(output=OUTPUT))
+
+
+if __name__ == '__main__':
+    unittest.main()
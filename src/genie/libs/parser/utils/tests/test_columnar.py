@@ -0,0 +1,174 @@
+import json
+import pathlib
+import unittest
+from array import array
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.columnar import ColumnarTable, to_columnar, \
+                                            MISSING_INT
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_device_tracking import \
+    ShowDeviceTrackingDatabase
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def golden(os_name, class_name):
+    '''Yield the (output, arguments) of the golden outputs of a parser'''
+    folder = PARSER_ROOT / os_name / 'tests' / class_name / 'cli' / 'equal'
+    for output in sorted(folder.glob('*_output.txt')):
+        arguments = output.with_name(
+            output.name.replace('_output.txt', '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) if arguments.exists() \
+            else {}
+        yield output.read_text(), kwargs
+
+
+class TestColumnarTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ColumnarTable(keys=['vlan', 'mac_address'])
+        self.table.append({'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+                           'interface': 'Gi1/0/1', 'age': 10})
+        self.table.append({'vlan': 20, 'mac_address': 'aaaa.bbff.8888',
+                           'drop': True})
+        self.table.freeze()
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(list(self.table),
+                         ['vlan', 'mac_address', 'interface', 'age', 'drop'])
+        self.assertIsInstance(self.table['vlan'], array)
+        self.assertEqual(self.table['age'].tolist(), [10, MISSING_INT])
+        self.assertEqual(self.table['drop'].typecode, 'b')
+        self.assertEqual(self.table['interface'], ['Gi1/0/1', None])
+
+    def test_rows(self):
+        self.assertEqual(list(self.table.rows()), [
+            {'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+             'interface': 'Gi1/0/1', 'age': 10},
+            {'vlan': 20, 'mac_address': 'aaaa.bbff.8888', 'drop': True},
+        ])
+
+    def test_frozen(self):
+        with self.assertRaises(ValueError):
+            self.table.append({'vlan': 30})
+
+    def test_diff(self):
+        newer = ColumnarTable(keys=['vlan', 'mac_address'])
+        newer.append({'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+                      'interface': 'Gi1/0/2', 'age': 10})
+        newer.append({'vlan': 30, 'mac_address': 'aaaa.bbff.9999',
+                      'interface': 'Gi1/0/3', 'age': 0})
+        self.assertEqual(self.table.diff(newer.freeze()), {
+            'added': [(30, 'aaaa.bbff.9999')],
+            'removed': [(20, 'aaaa.bbff.8888')],
+            'changed': [(10, 'aaaa.bbff.8888')],
+        })
+        self.assertEqual(self.table.diff(self.table),
+                         {'added': [], 'removed': [], 'changed': []})
+
+    def test_diff_same_keys(self):
+        newer = ColumnarTable(keys=['vlan', 'mac_address'])
+        newer.append({'vlan': 10, 'mac_address': 'aaaa.bbff.8888',
+                      'interface': 'Gi1/0/1', 'age': 10})
+        newer.append({'vlan': 20, 'mac_address': 'aaaa.bbff.8888'})
+        self.assertEqual(self.table.diff(newer.freeze()), {
+            'added': [], 'removed': [],
+            'changed': [(20, 'aaaa.bbff.8888')],
+        })
+
+
+class TestToColumnar(unittest.TestCase):
+
+    def test_to_columnar(self):
+        parsed = {'vrf': {
+            'default': {'index': {
+                1: {'protocol': 'tcp', 'inside_global': '10.1.1.1:80',
+                    'details': {'use_count': 1, 'timeout': '00:01:00'}},
+                2: {'protocol': 'udp', 'inside_global': '10.1.1.2:53'},
+            }},
+            'number_of_translations': 2,
+        }}
+        tables = to_columnar(
+            parsed, {'translations': ('vrf', '{vrf}', 'index', '{index}')})
+        table = tables['translations']
+        self.assertEqual(table.keys, ['vrf', 'index'])
+        self.assertEqual(list(table.rows()), [
+            {'vrf': 'default', 'index': 1, 'protocol': 'tcp',
+             'inside_global': '10.1.1.1:80', 'details.use_count': 1,
+             'details.timeout': '00:01:00'},
+            {'vrf': 'default', 'index': 2, 'protocol': 'udp',
+             'inside_global': '10.1.1.2:53'},
+        ])
+
+    def test_fields_along_the_path(self):
+        parsed = {'vlans': {'10': {'vlan': '10', 'macs': {
+            'aaaa.bbff.8888': {'secure': 'F'}}}}}
+        table = to_columnar(
+            parsed, {'macs': ('vlans', '{id}', 'macs', '{mac}')})['macs']
+        self.assertEqual(table.row(0), {'id': '10', 'vlan': '10',
+                                        'mac': 'aaaa.bbff.8888',
+                                        'secure': 'F'})
+
+    def test_missing_table(self):
+        table = to_columnar({}, {'device': ('device', '{index}')})['device']
+        self.assertEqual(len(table), 0)
+
+
+class TestParseColumnar(unittest.TestCase):
+    '''parse_columnar() holds the entries parsed by parse()'''
+
+    def assert_columnar(self, cls, table, leaves):
+        for output, kwargs in golden('iosxe', cls.__name__):
+            parser = cls(device=Mock())
+            parsed = parser.cli(output=output, **kwargs)
+            tables = parser.parse_columnar(output=output, **kwargs)
+            rows = list(tables[table].rows())
+            entries = list(leaves(parsed))
+            self.assertEqual(len(rows), len(entries))
+            for row, entry in zip(rows, entries):
+                for name, value in entry.items():
+                    if not isinstance(value, dict):
+                        self.assertEqual(row[name], value)
+
+    def test_nat_translations(self):
+        self.assert_columnar(
+            ShowIpNatTranslations, 'translations',
+            lambda parsed: (entry
+                            for vrf in parsed.get('vrf', {}).values()
+                            if isinstance(vrf, dict)
+                            for entry in vrf['index'].values()))
+
+    def test_mac_address_table(self):
+        self.assert_columnar(
+            ShowMacAddressTable, 'interfaces',
+            lambda parsed: (entry
+                            for vlan in parsed['mac_table']['vlans'].values()
+                            for mac in vlan['mac_addresses'].values()
+                            for entry in mac.get('interfaces', {}).values()))
+
+    def test_ip_arp(self):
+        self.assert_columnar(
+            ShowIpArp, 'neighbors',
+            lambda parsed: (entry
+                            for intf in parsed.get('interfaces', {}).values()
+                            for entry in intf['ipv4']['neighbors'].values()))
+
+    def test_device_tracking_database(self):
+        self.assert_columnar(
+            ShowDeviceTrackingDatabase, 'device',
+            lambda parsed: parsed['device'].values())
+
+    def test_empty_output(self):
+        # Validated by parse()
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowIpArp(device=Mock()).parse_columnar(output='')
+
+
+if __name__ == '__main__':
+    unittest.main()
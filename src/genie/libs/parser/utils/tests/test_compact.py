@@ -0,0 +1,102 @@
+import json
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.compact import CompactTable, CompactRecord, \
+                                           compact_output
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAll
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def golden(os_name, class_name):
+    '''Yield the (output, arguments) of the golden outputs of a parser'''
+    folder = PARSER_ROOT / os_name / 'tests' / class_name / 'cli' / 'equal'
+    for output in sorted(folder.glob('*_output.txt')):
+        arguments = output.with_name(
+            output.name.replace('_output.txt', '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) if arguments.exists() \
+            else {}
+        yield output.read_text(), kwargs
+
+
+class TestCompactTable(unittest.TestCase):
+
+    def setUp(self):
+        self.routes = {
+            '10.1.1.0/24': {
+                'active': True,
+                'metric': 2,
+                'source_protocol': 'ospf',
+                'next_hop': {'next_hop_list': {1: {'index': 1,
+                                                   'next_hop': '10.4.1.1'}}}},
+            '10.1.2.0/24': {
+                'metric': 'unknown',
+                'next_hop': {'outgoing_interface': {
+                    'Null0': {'outgoing_interface': 'Null0'}}}},
+        }
+        self.table = CompactTable()
+        for key, record in self.routes.items():
+            self.table.add(key, record)
+
+    def test_dict_view(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertIn('10.1.1.0/24', self.table)
+        self.assertEqual(self.table, self.routes)
+        self.assertEqual(self.table.to_dict(), self.routes)
+
+        record = self.table['10.1.1.0/24']
+        self.assertIsInstance(record, CompactRecord)
+        self.assertEqual(set(record), {'active', 'metric', 'source_protocol',
+                                       'next_hop'})
+        self.assertIs(record['active'], True)
+        self.assertEqual(record.get('route_preference'), None)
+        self.assertEqual(
+            record['next_hop']['next_hop_list'][1]['next_hop'], '10.4.1.1')
+        with self.assertRaises(KeyError):
+            record['mask']
+
+    def test_columns(self):
+        columns = self.table._columns
+        # 'unknown' does not fit in an int array
+        self.assertEqual(type(columns['metric']).__name__, '_Column')
+        self.assertEqual(type(columns['active']).__name__, '_BoolColumn')
+        self.assertEqual(type(columns['next_hop']).__name__, '_TableColumn')
+
+    def test_merge(self):
+        self.table.add('10.1.1.0/24', {'route_preference': 110})
+        self.assertEqual(self.table['10.1.1.0/24']['route_preference'], 110)
+        self.assertEqual(self.table['10.1.1.0/24']['metric'], 2)
+        self.assertEqual(len(self.table), 2)
+
+    def test_compact_output(self):
+        records = [(('default', 'ipv4', key), record)
+                   for key, record in self.routes.items()]
+        output = compact_output(iter(records), {},
+                                ('vrf', 0, 'address_family', 1, 'routes'))
+        routes = output['vrf']['default']['address_family']['ipv4']['routes']
+        self.assertIsInstance(routes, CompactTable)
+        self.assertEqual(routes, self.routes)
+
+
+class TestParseCompact(unittest.TestCase):
+    '''parse_compact() returns the output of cli()'''
+
+    def test_iosxe_show_ip_route(self):
+        for output, kwargs in golden('iosxe', 'ShowIpRoute'):
+            parser = ShowIpRoute(device=Mock())
+            self.assertEqual(
+                parser.parse_compact(output, vrf=kwargs.get('vrf')),
+                parser.cli(output=output, **kwargs))
+
+    def test_iosxe_show_ip_bgp_all(self):
+        for output, kwargs in golden('iosxe', 'ShowIpBgpAll'):
+            parser = ShowIpBgpAll(device=Mock())
+            self.assertEqual(parser.parse_compact(output, **kwargs),
+                             parser.cli(output=output, **kwargs))
+
+
+if __name__ == '__main__':
+    unittest.main()
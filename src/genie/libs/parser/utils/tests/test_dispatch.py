@@ -0,0 +1,213 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.dispatch import LineDispatcher, FALLTHROUGH, \
+                                            STOP, literal_keys, lead_keys
+from genie.libs.parser.utils.projection import Projection
+
+
+class TestLiteralKeys(unittest.TestCase):
+
+    def test_prefix(self):
+        p = re.compile(r'^Description: *(?P<description>.*)$')
+        self.assertEqual(literal_keys(p), ('Description:', ''))
+
+    def test_prefix_group(self):
+        p = re.compile(r'^\(Link +ID\) +(?P<id>\S+)$')
+        self.assertEqual(literal_keys(p), ('(Link ', ''))
+
+    def test_needle(self):
+        p = re.compile(r'^(?P<in_runts>[0-9]+) *runts, +(?P<giants>\d+) giants')
+        self.assertEqual(literal_keys(p), ('', 'runts, '))
+
+    def test_needle_repeated_space(self):
+        # ' +' is one or more spaces: ' address ' is always in the line
+        p = re.compile(r'^\s*For +address +family: +(?P<af>[\S\s]+)$')
+        self.assertEqual(literal_keys(p), ('', ' address '))
+
+    def test_ignorecase(self):
+        p = re.compile(r'^Description: *(?P<description>.*)$', re.IGNORECASE)
+        self.assertEqual(literal_keys(p), ('', ''))
+
+    def test_no_literal(self):
+        p = re.compile(r'^(?P<code>\w+) +(?P<network>\S+)$')
+        self.assertEqual(literal_keys(p), ('', ''))
+
+
+class TestLeadKeys(unittest.TestCase):
+
+    def test_lead(self):
+        p = re.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))')
+        self.assertEqual(lead_keys(p), ('BGP ', frozenset('B')))
+        p = re.compile(r'^ +Description: *(?P<description>.*)$')
+        self.assertEqual(lead_keys(p), ('Description:', frozenset('D')))
+
+    def test_first(self):
+        p = re.compile(r'^\s*(?P<seq>[0-9]+) +(?P<name>\S+)$')
+        self.assertEqual(lead_keys(p), ('', frozenset('0123456789')))
+        # Blank lines
+        self.assertEqual(lead_keys(re.compile(r'^\s*$')),
+                         ('', frozenset([''])))
+
+    def test_unknown(self):
+        for pattern in [r'^\s*(?P<stat>[a-zA-Z\s]+) *: +(?P<sent>\d+)$',
+                        r'^\s*(?P<num>\d+) +sent +paths$', r'^\s*\S+']:
+            self.assertEqual(lead_keys(re.compile(pattern)), ('', None))
+        p = re.compile(r'^\s*BGP', re.IGNORECASE)
+        self.assertEqual(lead_keys(p), ('', None))
+        self.assertEqual(lead_keys(lambda line: True), ('', None))
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.dispatcher = LineDispatcher()
+
+        @self.dispatcher.rule(re.compile(r'^Description: *(?P<desc>.*)$'))
+        def description(m):
+            self.calls.append(('description', m.groupdict()['desc']))
+
+        @self.dispatcher.rule(re.compile(r'^(?P<mtu>\d+) +bytes$'),
+                              re.compile(r'^MTU +(?P<mtu>\d+)$'))
+        def mtu(m):
+            self.calls.append(('mtu', m.groupdict()['mtu']))
+            if m.groupdict()['mtu'] == '0':
+                return FALLTHROUGH
+
+        @self.dispatcher.rule(re.compile(r'^(?P<word>\w+)'))
+        def word(m):
+            self.calls.append(('word', m.groupdict()['word']))
+
+    def test_first_match_wins(self):
+        self.assertTrue(self.dispatcher.dispatch('Description: uplink'))
+        self.assertEqual(self.calls, [('description', 'uplink')])
+
+    def test_multiple_patterns(self):
+        self.dispatcher.dispatch('1500 bytes')
+        self.dispatcher.dispatch('MTU 9000')
+        self.assertEqual(len(self.dispatcher), 4)
+        self.assertEqual(self.calls, [('mtu', '1500'), ('mtu', '9000')])
+
+    def test_fallthrough(self):
+        self.assertTrue(self.dispatcher.dispatch('MTU 0'))
+        self.assertEqual(self.calls, [('mtu', '0'), ('word', 'MTU')])
+
+    def test_no_match(self):
+        self.assertFalse(self.dispatcher.dispatch('  '))
+        self.assertFalse(self.dispatcher.dispatch(''))
+        self.assertEqual(self.calls, [])
+
+    def test_candidates(self):
+        self.assertEqual(
+            [h.__name__ for h in self.dispatcher.candidates('Description: x')],
+            ['description', 'word'])
+        self.assertEqual(
+            [h.__name__ for h in self.dispatcher.candidates('MTU 1500')],
+            ['mtu', 'word'])
+
+    def test_prefilter_disabled(self):
+        lines = ['Description: uplink', 'MTU 0', '1500 bytes', 'other']
+        for line in lines:
+            self.dispatcher.dispatch(line)
+        expected = self.calls
+        self.calls = []
+        LineDispatcher.prefilter = False
+        try:
+            for line in lines:
+                self.dispatcher.dispatch(line)
+        finally:
+            LineDispatcher.prefilter = True
+        self.assertEqual(self.calls, expected)
+
+    def test_predicate(self):
+        dispatcher = LineDispatcher()
+        dispatcher.add(lambda line: 'Capabilities' in line,
+                       lambda m: self.calls.append('capabilities'))
+        self.assertTrue(dispatcher.dispatch('Router Capabilities:'))
+        self.assertFalse(dispatcher.dispatch('Router'))
+        self.assertEqual(self.calls, ['capabilities'])
+
+    def test_bad_pattern(self):
+        with self.assertRaises(TypeError):
+            self.dispatcher.add(r'^MTU', lambda m: None)
+
+    def test_stop(self):
+        dispatcher = LineDispatcher()
+        dispatcher.add(re.compile(r'^end$'), lambda m: STOP)
+        self.assertIs(dispatcher.dispatch('end'), STOP)
+        self.assertFalse(dispatcher.dispatch('other'))
+
+
+class TestProjectedDispatcher(unittest.TestCase):
+
+    schema = {'description': str, 'mtu': int, 'counters': {'in_errors': int}}
+
+    def setUp(self):
+        self.calls = []
+        self.dispatcher = LineDispatcher()
+
+        @self.dispatcher.rule(re.compile(r'^Description: *(?P<desc>.*)$'),
+                              keys=['description'])
+        def description(m):
+            self.calls.append('description')
+
+        @self.dispatcher.rule(re.compile(r'^MTU +(?P<mtu>\d+)'),
+                              keys=['mtu'])
+        def mtu(m):
+            self.calls.append('mtu')
+
+        @self.dispatcher.rule(re.compile(r'^(?P<errors>\d+) input errors'),
+                              keys=['counters', 'in_errors'])
+        def errors(m):
+            self.calls.append('errors')
+
+        @self.dispatcher.rule(re.compile(r'^(?P<word>\w+)'))
+        def word(m):
+            self.calls.append('word')
+
+    def test_no_projection(self):
+        self.assertIs(self.dispatcher.project(None), self.dispatcher)
+
+    def test_projected(self):
+        dispatcher = self.dispatcher.project(
+            Projection(self.schema, [('in_errors',)]))
+        for line in ['Description: uplink', 'MTU 1500', '0 input errors',
+                     'other']:
+            dispatcher.dispatch(line)
+        # The lines of the rules left out are still kept from the rules
+        # following them
+        self.assertEqual(self.calls, ['errors', 'word'])
+        self.assertEqual(len(self.dispatcher), 4)
+
+    def test_disjoint_rules_removed(self):
+        dispatcher = LineDispatcher()
+        dispatcher.add(re.compile(r'^Description: *(?P<desc>.*)$'),
+                       lambda m: self.calls.append('description'),
+                       keys=['description'])
+        dispatcher.add(re.compile(r'^MTU +(?P<mtu>\d+)'),
+                       lambda m: self.calls.append('mtu'), keys=['mtu'])
+        projected = dispatcher.project(Projection(self.schema, [('mtu',)]))
+        self.assertEqual(len(projected), 1)
+        self.assertFalse(projected.dispatch('Description: uplink'))
+        self.assertTrue(projected.dispatch('MTU 1500'))
+        self.assertEqual(self.calls, ['mtu'])
+
+    def test_disjoint_indented_rules_removed(self):
+        dispatcher = LineDispatcher()
+        dispatcher.add(re.compile(r'^\s*Description: *(?P<desc>.*)$'),
+                       lambda m: None, keys=['description'])
+        dispatcher.add(re.compile(r'^\s*(?P<errors>\d+) input errors'),
+                       lambda m: None, keys=['counters', 'in_errors'])
+        dispatcher.add(re.compile(r'^\s*$'), lambda m: None)
+        dispatcher.add(re.compile(r'^\s*(?P<mtu>[0-9]+) +bytes'),
+                       lambda m: None, keys=['mtu'])
+        projected = dispatcher.project(Projection(self.schema, [('mtu',)]))
+        # The input errors could be matched by the mtu rule
+        self.assertEqual([rule.handler.__name__
+                          for rule in projected._rules],
+                         ['_ignore', '<lambda>', '<lambda>'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import os
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 from genie.libs.parser.utils.extension import ExtendParsers
 from genie.libs.parser.utils.tests.dummy_parser import package_path
 
@@ -49,6 +52,29 @@ class TestExtendParser(unittest.TestCase):
                 }
             })
 
+    def test_extend_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        package = 'genie.libs.parser.utils.tests.dummy_parser'
+
+        ext = ExtendParsers(package)
+        ext.extend(cache=True, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # The modules are not walked again while they are unchanged
+        cached = ExtendParsers(package)
+        with patch.object(ExtendParsers, '_recursive_find') as walk:
+            cached.extend(cache=True, cache_dir=cache_dir)
+        self.assertFalse(walk.called)
+        self.assertEqual(cached.output, ext.output)
+
+        # A changed module invalidates the cache
+        with patch.object(ExtendParsers, '_module_stats',
+                          return_value=[('iosxe/show_clock.py', 0, 0)]), \
+             patch.object(ExtendParsers, '_recursive_find') as walk:
+            ExtendParsers(package).extend(cache=True, cache_dir=cache_dir)
+        self.assertTrue(walk.called)
+
 
 if __name__ == '__main__':
     unittest.main()
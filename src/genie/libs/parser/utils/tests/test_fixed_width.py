@@ -0,0 +1,147 @@
+import unittest
+
+from genie.libs.parser.utils.fixed_width import FixedWidthTable, Column, \
+                                                RIGHT, ANY
+
+STATUS = '''\
+  Port          Name               Status    Vlan      Duplex  Speed   Type
+  --------------------------------------------------------------------------------
+  Eth1/1        KeepAlive          connected routed    full    10G     10g
+  Eth1/5        *** L2 L3-CIS-N    connected trunk     full    a-1000  Fabric Exte
+  Eth1/6                           sfpAbsent 1         auto    auto
+  Eth1/7 *** N7K-2-FLEXP connected trunk full a-10G SFP-H10GB-C
+'''
+
+SUMMARY = '''\
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+192.168.10.253  4        65555   10112   10107      263    0    0 3d05h          13
+192.168.36.119  4        65109       0       0        1    0    0 never    Idle (Admin)
+192.168.36.120  4   65109            0       0        1    0    0 never    Idle
+'''
+
+CDP = '''\
+Device ID        Local Intrfce     Holdtme    Capability  Platform  Port ID
+R5.cisco.com     Gig 0/0           125              R B   CSR1000V  Gig 0/0
+Device_With_A_Particularly_Long_Name
+                 Gig 1             134             R S C  N9K-9000v Eth 0/0
+RX-SWV.cisco.com Fas 0/1           167         T S        WS-C3524-XFas 0/13
+lonely
+Total cdp entries displayed : 3
+'''
+
+
+def status_table():
+    return FixedWidthTable([Column('interface', 'Port'),
+                            Column('name', 'Name', optional=True),
+                            Column('status', 'Status'),
+                            Column('vlan', 'Vlan'),
+                            Column('duplex_code', 'Duplex'),
+                            Column('port_speed', 'Speed'),
+                            Column('type', 'Type', optional=True)])
+
+
+def summary_table():
+    counters = [Column(key, title, align=RIGHT, check=str.isdigit)
+                for key, title in [('as', 'AS'), ('msg_rcvd', 'MsgRcvd'),
+                                   ('msg_sent', 'MsgSent'),
+                                   ('tbl_ver', 'TblVer'), ('inq', 'InQ'),
+                                   ('outq', 'OutQ')]]
+    return FixedWidthTable([Column('neighbor', 'Neighbor'),
+                            Column('version', 'V')] + counters +
+                           [Column('up_down', 'Up/Down'),
+                            Column('state', 'State/PfxRcd', align=ANY)])
+
+
+def cdp_table():
+    return FixedWidthTable([Column('device_id', 'Device ID'),
+                            Column('local_interface', 'Local Intrfce'),
+                            Column('hold_time', 'Holdtme'),
+                            Column('capability', 'Capability', align=ANY),
+                            Column('platform', 'Platform', optional=True),
+                            Column('port_id', 'Port ID', align=ANY)],
+                           wrap=True)
+
+
+class TestFixedWidthTable(unittest.TestCase):
+
+    def test_header(self):
+        table = status_table()
+        self.assertIsNone(table.spans)
+        self.assertIsNone(table.row('  Eth1/1        KeepAlive'))
+        self.assertFalse(table.header('  Port  Name  Status'))
+        self.assertTrue(table.header(STATUS.splitlines()[0]))
+        self.assertEqual(table.spans, [(2, 6), (16, 20), (35, 41), (45, 49),
+                                       (55, 61), (63, 68), (71, 75)])
+
+    def test_left_aligned(self):
+        rows = [row for _, row in status_table().scan(STATUS.splitlines())]
+        self.assertEqual(rows[:2], [None, None])
+        self.assertEqual(rows[2], {'interface': 'Eth1/1', 'name': 'KeepAlive',
+                                   'status': 'connected', 'vlan': 'routed',
+                                   'duplex_code': 'full', 'port_speed': '10G',
+                                   'type': '10g'})
+        # Values holding spaces, and the last one taking the rest of the line
+        self.assertEqual(rows[3]['name'], '*** L2 L3-CIS-N')
+        self.assertEqual(rows[3]['type'], 'Fabric Exte')
+        # Empty optional values
+        self.assertEqual((rows[4]['name'], rows[4]['type']), ('', ''))
+        # Not aligned under the header, left to the regex of the parser
+        self.assertIsNone(rows[5])
+
+    def test_right_aligned(self):
+        table = summary_table()
+        rows = [row for _, row in table.scan(SUMMARY.splitlines())]
+        self.assertEqual(rows[1], {'neighbor': '192.168.10.253',
+                                   'version': '4', 'as': '65555',
+                                   'msg_rcvd': '10112', 'msg_sent': '10107',
+                                   'tbl_ver': '263', 'inq': '0', 'outq': '0',
+                                   'up_down': '3d05h', 'state': '13'})
+        self.assertEqual(rows[2]['state'], 'Idle (Admin)')
+        # The AS is not under the end of its title
+        self.assertIsNone(rows[3])
+        # Nor the values failing their check
+        self.assertIsNone(table.row(SUMMARY.splitlines()[1]
+                                    .replace('10112', '1011x')))
+
+    def test_overflow(self):
+        table = status_table()
+        table.header(STATUS.splitlines()[0])
+        # Into an empty column
+        row = table.row('  {:<33}connected 101       full    a-1000'.format(
+            'Ethernet101/1/10'))
+        self.assertEqual((row['interface'], row['name']),
+                         ('Ethernet101/1/10', ''))
+        # Into a value
+        self.assertIsNone(table.row('  Eth1/1        LongerThanItsColumnName '
+                                    'connected routed    full    10G     10g'))
+
+    def test_wrap(self):
+        table = cdp_table()
+        scanned = list(table.scan(CDP.splitlines()))
+        rows = [row for _, row in scanned]
+        self.assertEqual(rows[1]['capability'], 'R B')
+        # The device id on its own line
+        self.assertEqual(rows[2], {'device_id':
+                                       'Device_With_A_Particularly_Long_Name',
+                                   'local_interface': 'Gig 1',
+                                   'hold_time': '134', 'capability': 'R S C',
+                                   'platform': 'N9K-9000v',
+                                   'port_id': 'Eth 0/0'})
+        self.assertEqual(scanned[2][0], CDP.splitlines()[3])
+        # Platform and port id concatenated
+        self.assertIsNone(rows[3])
+        # Held lines which are not continued are yielded alone
+        self.assertEqual(scanned[4:], [('lonely', None),
+                                       ('Total cdp entries displayed : 3',
+                                        None)])
+        self.assertEqual(list(table.scan(['lonely'])), [('lonely', None)])
+
+    def test_columns(self):
+        with self.assertRaises(ValueError):
+            Column('port', 'Port', align='center')
+        with self.assertRaises(ValueError):
+            FixedWidthTable([])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.common import (
+    FuzzyMatcher,
+    _matches_fuzzy_recursive,
+    _fuzzy_search_command,
+    parser_data
+)
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+
+    def assertSameAsRecursive(self, search, command, fuzzy):
+        tokens = search.split()
+        try:
+            expected = _matches_fuzzy_recursive(0, 0, tokens.copy(), command,
+                                                {}, fuzzy)
+        except IndexError:
+            expected = None
+        self.assertEqual(FuzzyMatcher(fuzzy).match(tokens, command), expected,
+                         '{!r} / {!r}'.format(search, command))
+
+    def test_registry_commands(self):
+        commands = [c for c in parser_data.keys() if c != 'tokens'][::10]
+        for command in commands:
+            filled = re.sub('{.*?}', 'argument', command)
+            wildcard = ' '.join(filled.split()[:-1] + ['.*'])
+            for other in commands[:50]:
+                self.assertSameAsRecursive(filled, other, False)
+                self.assertSameAsRecursive(re.escape(filled).replace(
+                    '\\ ', ' '), other, True)
+                self.assertSameAsRecursive(wildcard, other, True)
+
+    def test_arguments(self):
+        self.assertSameAsRecursive('sh red blu abc arg bg w w',
+                                   'show {one} blue abc {arg} bgp {a} {b}',
+                                   False)
+        self.assertSameAsRecursive('sh red blu abc arg bg w w',
+                                   'show {one} blue abc {arg} bgp {a} {b}',
+                                   True)
+        self.assertSameAsRecursive('show ip route vrf VRF1 1.1.1.1',
+                                   'show ip route vrf {vrf} {route}', False)
+        self.assertSameAsRecursive('sh bgp vpnv4 unicast all summary',
+                                   'show bgp {address_family} all summary',
+                                   False)
+
+    def test_regex(self):
+        self.assertSameAsRecursive('show .* summary',
+                                   'show ip bgp summary', True)
+        self.assertSameAsRecursive('show ip .* summary',
+                                   'show ip ospf database summary', True)
+        self.assertSameAsRecursive('sh.* ver.*', 'show version', True)
+        self.assertSameAsRecursive('show .* {vrf}',
+                                   'show ip route vrf {vrf}', True)
+
+    def test_regex_past_end_of_command(self):
+        # The recursive matcher raised IndexError on this one
+        self.assertIsNone(FuzzyMatcher(True).match(
+            'show .* bgp .*'.split(), 'show ip bgp'))
+
+    def test_tokens_not_modified(self):
+        tokens = 'sh ver'.split()
+        FuzzyMatcher(False).match(tokens, 'show version')
+        self.assertEqual(tokens, ['sh', 'ver'])
+
+    def test_search_uses_matcher(self):
+        results = _fuzzy_search_command('sh.* ver.*', True)
+        self.assertIn('show version', [r[0] for r in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
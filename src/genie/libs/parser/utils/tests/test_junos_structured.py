@@ -0,0 +1,238 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.junos_structured import json_to_schema, \
+                                                    xml_to_schema, \
+                                                    StructuredOutputError
+from genie.libs.parser.junos.show_route import ShowRouteProtocolExtensive
+
+
+class TestJunosStructured(unittest.TestCase):
+
+    json_output = '''\
+        show route protocol static extensive | display json
+        {
+            "route-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/19.2R1/junos-routing"},
+                "route-table" : [
+                {
+                    "table-name" : [{"data" : "inet.0"}],
+                    "destination-count" : [{"data" : "16"}],
+                    "total-route-count" : [{"data" : "16"}],
+                    "active-route-count" : [{"data" : "16"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}],
+                    "rt" : [
+                    {
+                        "attributes" : {"junos:style" : "detail"},
+                        "rt-destination" : [{"data" : "10.16.2.2/32"}],
+                        "rt-entry-count" : [
+                        {
+                            "data" : "1",
+                            "attributes" : {"junos:format" : "1 entry"}
+                        }
+                        ],
+                        "rt-announced-count" : [{"data" : "1"}],
+                        "tsi" : [
+                        {
+                            "data" : "KRT in-kernel 10.16.2.2/32 -> {10.145.0.2}",
+                            "attributes" : {"junos:indent" : "0"}
+                        }
+                        ],
+                        "rt-entry" : [
+                        {
+                            "active-tag" : [{"data" : "*"}],
+                            "protocol-name" : [{"data" : "Static"}],
+                            "preference" : [{"data" : "5"}],
+                            "nh-type" : [{"data" : "Router"}],
+                            "nh-index" : [{"data" : "590"}],
+                            "nh" : [
+                            {
+                                "to" : [{"data" : "10.145.0.2"}],
+                                "via" : [{"data" : "ge-0/0/1.0"}],
+                                "selected-next-hop" : [{"data" : [null]}]
+                            }
+                            ],
+                            "age" : [
+                            {
+                                "data" : "1:06",
+                                "attributes" : {"junos:seconds" : "66"}
+                            }
+                            ],
+                            "rt-entry-state" : [{"data" : "Active Int Ext"}],
+                            "task-name" : [{"data" : "RT"}],
+                            "instance-name" : [{"data" : "master"}]
+                        }
+                        ]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+        {master}
+    '''
+
+    xml_output = '''\
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/19.2R1/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/19.2R1/junos-routing">
+                <route-table>
+                    <table-name>inet.0</table-name>
+                    <destination-count>16</destination-count>
+                    <total-route-count>16</total-route-count>
+                    <active-route-count>16</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="detail">
+                        <rt-destination>10.16.2.2/32</rt-destination>
+                        <rt-entry-count junos:format="1 entry">1</rt-entry-count>
+                        <rt-announced-count>1</rt-announced-count>
+                        <tsi junos:indent="0">KRT in-kernel 10.16.2.2/32 -> {10.145.0.2}</tsi>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <protocol-name>Static</protocol-name>
+                            <preference>5</preference>
+                            <nh-type>Router</nh-type>
+                            <nh-index>590</nh-index>
+                            <nh>
+                                <to>10.145.0.2</to>
+                                <via>ge-0/0/1.0</via>
+                                <selected-next-hop/>
+                            </nh>
+                            <age junos:seconds="66">1:06</age>
+                            <rt-entry-state>Active Int Ext</rt-entry-state>
+                            <task-name>RT</task-name>
+                            <instance-name>master</instance-name>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+    '''
+
+    cli_output = '''\
+        inet.0: 16 destinations, 16 routes (16 active, 0 holddown, 0 hidden)
+        10.16.2.2/32 (1 entry, 1 announced)
+        TSI:
+        KRT in-kernel 10.16.2.2/32 -> {10.145.0.2}
+            *Static Preference: 5
+                    Next hop type: Router, Next hop index: 590
+                    Next hop: 10.145.0.2 via ge-0/0/1.0, selected
+                    State: <Active Int Ext>
+                    Age: 1:06
+                    Task: RT
+    '''
+
+    route_table = {
+        'active-route-count': '16',
+        'destination-count': '16',
+        'hidden-route-count': '0',
+        'holddown-route-count': '0',
+        'rt': [{
+            '@junos:style': 'detail',
+            'rt-announced-count': '1',
+            'rt-destination': '10.16.2.2/32',
+            'rt-entry': {
+                'active-tag': '*',
+                'age': {'#text': '1:06', '@junos:seconds': '66'},
+                'nh': [{
+                    'selected-next-hop': '',
+                    'to': '10.145.0.2',
+                    'via': 'ge-0/0/1.0',
+                }],
+                'nh-index': '590',
+                'nh-type': 'Router',
+                'preference': '5',
+                'protocol-name': 'Static',
+                'rt-entry-state': 'Active Int Ext',
+                'task-name': 'RT',
+            },
+            'rt-entry-count': {'#text': '1', '@junos:format': '1 entry'},
+            'tsi': {'#text': 'KRT in-kernel 10.16.2.2/32 -> {10.145.0.2}',
+                    '@junos:indent': '0'},
+        }],
+        'table-name': 'inet.0',
+        'total-route-count': '16',
+    }
+
+    def test_json(self):
+        parsed = json_to_schema(ShowRouteProtocolExtensive.schema,
+                                self.json_output)
+        self.assertEqual(parsed, {'route-information': {
+            '@xmlns': 'http://xml.juniper.net/junos/19.2R1/junos-routing',
+            'route-table': [self.route_table],
+        }})
+
+    def test_xml(self):
+        parsed = xml_to_schema(ShowRouteProtocolExtensive.schema,
+                               self.xml_output)
+        self.assertEqual(parsed, {
+            '@xmlns:junos': 'http://xml.juniper.net/junos/19.2R1/junos',
+            'route-information': {
+                '@xmlns': 'http://xml.juniper.net/junos/19.2R1/junos-routing',
+                'route-table': [self.route_table],
+            }})
+
+    def test_missing_key(self):
+        output = self.json_output.replace(
+            '"table-name" : [{"data" : "inet.0"}],', '')
+        with self.assertRaisesRegex(StructuredOutputError, 'table-name'):
+            json_to_schema(ShowRouteProtocolExtensive.schema, output)
+
+    def test_invalid_output(self):
+        with self.assertRaises(StructuredOutputError):
+            json_to_schema(ShowRouteProtocolExtensive.schema,
+                           self.cli_output)
+
+    def test_command(self):
+        parser = ShowRouteProtocolExtensive(device=Mock())
+        self.assertEqual(
+            parser.structured_command('display json', protocol='bgp'),
+            'show route protocol bgp extensive | display json')
+        self.assertEqual(
+            parser.structured_command('display xml', protocol='bgp',
+                                      table='inet.0'),
+            'show route protocol bgp table inet.0 extensive | display xml')
+        self.assertEqual(parser.structured_command('display json'),
+                         'show route extensive | display json')
+
+    def test_parse_json(self):
+        device = Mock()
+        device.execute.return_value = self.json_output
+        parsed = ShowRouteProtocolExtensive(device=device).json(
+            protocol='static')
+        device.execute.assert_called_once_with(
+            'show route protocol static extensive | display json')
+        self.assertEqual(parsed['route-information']['route-table'],
+                         [self.route_table])
+
+    def test_fallback(self):
+        outputs = {
+            'show route protocol static extensive | display json':
+                "error: syntax error, expecting <command>: json",
+            'show route protocol static extensive': self.cli_output,
+        }
+        device = Mock()
+        device.execute.side_effect = lambda command: outputs[command]
+        parsed = ShowRouteProtocolExtensive(device=device).json(
+            protocol='static')
+        self.assertEqual(device.execute.call_count, 2)
+        self.assertEqual(
+            parsed['route-information']['route-table'][0]['table-name'],
+            'inet.0')
+
+    def test_cli_output(self):
+        parsed = ShowRouteProtocolExtensive(device=Mock()).json(
+            output=self.cli_output)
+        self.assertEqual(
+            parsed['route-information']['route-table'][0]['table-name'],
+            'inet.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,303 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.nxos_structured import json_to_schema, Table, \
+                                                    Key, Index, \
+                                                    StructuredOutputError
+from genie.libs.parser.nxos.show_vxlan import ShowNvePeers
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.show_routing import ShowIpRoute
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+
+
+class TestNxosStructured(unittest.TestCase):
+
+    output = '''\
+        {"TABLE_vrf": {"ROW_vrf": [
+            {"vrf-name": "default",
+             "TABLE_route": {"ROW_route": [
+                {"prefix": "10.1.1.0/24", "pref": "1",
+                 "TABLE_hop": {"ROW_hop": [
+                    {"hop": "10.0.0.1"}, {"hop": "10.0.0.2"}]}},
+                {"prefix": "10.2.2.0/24", "pref": ""}]}},
+            {"vrf-name": "VRF1",
+             "TABLE_route": {"ROW_route":
+                {"prefix": "10.3.3.0/24", "pref": "2",
+                 "TABLE_hop": {"ROW_hop": {"hop": "10.0.0.3"}}}}}]}}
+        switch#
+    '''
+
+    mapping = [
+        Table('vrf', path=['vrf', Key('vrf-name', name='name')], tables=[
+            Table('route', path=['routes', Key('prefix')], fields={
+                'pref': ('pref', lambda pref: int(pref) if pref else None),
+            }, tables=[
+                Table('hop', path=['hops', Index('index')], fields={
+                    'hop': 'hop',
+                    'vrf': 'vrf-name',
+                }),
+            ]),
+        ]),
+    ]
+
+    def test_json_to_schema(self):
+        self.assertEqual(json_to_schema(self.mapping, self.output), {'vrf': {
+            'default': {
+                'name': 'default',
+                'routes': {
+                    '10.1.1.0/24': {'pref': 1, 'hops': {
+                        1: {'index': 1, 'hop': '10.0.0.1', 'vrf': 'default'},
+                        2: {'index': 2, 'hop': '10.0.0.2', 'vrf': 'default'},
+                    }},
+                    '10.2.2.0/24': {},
+                },
+            },
+            'VRF1': {
+                'name': 'VRF1',
+                'routes': {
+                    '10.3.3.0/24': {'pref': 2, 'hops': {
+                        1: {'index': 1, 'hop': '10.0.0.3', 'vrf': 'VRF1'},
+                    }},
+                },
+            },
+        }})
+
+    def test_when(self):
+        mapping = [Table('vrf', path=[Key('vrf-name')],
+                         when=lambda row: row['vrf-name'] != 'default')]
+        self.assertEqual(json_to_schema(mapping, self.output), {'VRF1': {}})
+
+    def test_missing_key(self):
+        mapping = [Table('vrf', path=[Key('vrf-id')])]
+        with self.assertRaisesRegex(StructuredOutputError, 'No key'):
+            json_to_schema(mapping, self.output)
+
+    def test_invalid_field(self):
+        mapping = [Table('vrf', path=[Key('vrf-name')], tables=[
+            Table('route', fields={'pref': ('pref', int)})])]
+        with self.assertRaisesRegex(StructuredOutputError, 'pref'):
+            json_to_schema(mapping, self.output)
+
+    def test_invalid_output(self):
+        with self.assertRaises(StructuredOutputError):
+            json_to_schema(self.mapping, 'Invalid command at \'^\' marker.')
+        with self.assertRaises(StructuredOutputError):
+            json_to_schema(self.mapping, '{"TABLE_interface": {}}')
+
+
+class TestShowNvePeersJson(unittest.TestCase):
+
+    json_output = '''\
+        {"TABLE_nve_peers": {"ROW_nve_peers": [
+            {"if-name": "nve1", "peer-ip": "192.168.16.1",
+             "peer-state": "Up", "learn-type": "CP", "uptime": "01:15:09"},
+            {"if-name": "nve1", "peer-ip": "192.168.106.1",
+             "peer-state": "Up", "learn-type": "CP", "uptime": "00:03:05",
+             "router-mac": "5e00.00ff.0209"}]}}
+    '''
+
+    cli_output = '''\
+        Interface Peer-IP          State LearnType Uptime   Router-Mac
+        --------- ---------------  ----- --------- -------- -----------------
+        nve1      192.168.16.1      Up    CP        01:15:09 n/a
+        nve1      192.168.106.1        Up    CP        00:03:05 5e00.00ff.0209
+    '''
+
+    def test_json(self):
+        device = Mock()
+        device.execute.return_value = self.json_output
+        parser = ShowNvePeers(device=device)
+        parsed = parser.json()
+        device.execute.assert_called_once_with('show nve peers | json')
+        self.assertEqual(parsed, parser.cli(output=self.cli_output))
+
+    def test_fallback(self):
+        outputs = {
+            'show nve peers | json': "% Invalid command at '^' marker.",
+            'show nve peers': self.cli_output,
+        }
+        device = Mock()
+        device.execute.side_effect = lambda command: outputs[command]
+        parsed = ShowNvePeers(device=device).json()
+        self.assertEqual(device.execute.call_count, 2)
+        self.assertEqual(parsed['nve1']['peer_ip']['192.168.16.1']
+                         ['router_mac'], 'n/a')
+
+    def test_cli_output(self):
+        parser = ShowNvePeers(device=Mock())
+        self.assertEqual(parser.json(output=self.cli_output),
+                         parser.cli(output=self.cli_output))
+
+
+class TestShowMacAddressTableJson(unittest.TestCase):
+
+    json_output = '''\
+        {"TABLE_mac_address": {"ROW_mac_address": [
+            {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "* ",
+             "disp_vlan": "10", "disp_is_static": "enabled", "disp_age": "-",
+             "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+             "disp_port": "Ethernet1/2"},
+            {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "* ",
+             "disp_vlan": "20", "disp_is_static": "enabled", "disp_age": "-",
+             "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+             "disp_port": "Drop"},
+            {"disp_mac_addr": "5e00.c0ff.0007", "disp_type": "G",
+             "disp_vlan": "-", "disp_is_static": "enabled", "disp_age": "-",
+             "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+             "disp_port": "sup-eth1(R)"},
+            {"disp_mac_addr": "000f.53ff.1f1d", "disp_type": "+",
+             "disp_vlan": "390", "disp_is_static": "disabled",
+             "disp_age": "0", "disp_is_secure": "disabled",
+             "disp_is_ntfy": "disabled", "disp_port": "Po125"}]}}
+    '''
+
+    cli_output = '''\
+        *   10     aaaa.bbff.8888   static   -         F      F    Eth1/2
+        *   20     aaaa.bbff.8888   static   -         F      F    Drop
+        G    -     5e00.c0ff.0007   static   -         F      F    sup-eth1(R)
+        +  390     000f.53ff.1f1d   dynamic  0         F      F    Po125
+    '''
+
+    def test_json(self):
+        device = Mock()
+        device.execute.return_value = self.json_output
+        parser = ShowMacAddressTable(device=device)
+        parsed = parser.json(vlan='10')
+        device.execute.assert_called_once_with(
+            'show mac address-table vlan 10 | json')
+        self.assertEqual(parsed, parser.cli(output=self.cli_output))
+
+
+class TestShowIpRouteJson(unittest.TestCase):
+
+    json_output = '''\
+        {"TABLE_vrf": {"ROW_vrf": {"vrf-name-out": "default",
+         "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+          "TABLE_prefix": {"ROW_prefix": [
+            {"ipprefix": "10.4.1.1/32", "ucast-nhops": "2",
+             "mcast-nhops": "0", "attached": "false",
+             "TABLE_path": {"ROW_path": [
+                {"ipnexthop": "10.2.3.2", "ifname": "Eth1/4",
+                 "uptime": "P1DT1H1M30S", "pref": "1", "metric": "0",
+                 "clientname": "static", "ubest": "true"},
+                {"ipnexthop": "10.1.3.1", "ifname": "Eth1/2",
+                 "uptime": "P1DT1H1M18S", "pref": "110", "metric": "41",
+                 "clientname": "ospf-1", "type": "intra", "tag": "100",
+                 "ubest": "false"}]}},
+            {"ipprefix": "10.36.3.3/32", "ucast-nhops": "1",
+             "mcast-nhops": "0", "attached": "true",
+             "TABLE_path": {"ROW_path":
+                {"ifname": "Null0", "uptime": "PT5M", "pref": "220",
+                 "metric": "0", "clientname": "discard", "ubest": "true"}}}
+          ]}}}}}}
+    '''
+
+    def test_json(self):
+        device = Mock()
+        device.execute.return_value = self.json_output
+        parsed = ShowIpRoute(device=device).json(vrf='all')
+        device.execute.assert_called_once_with(
+            'show ip route vrf all | json')
+        self.assertEqual(parsed, {'vrf': {'default': {'address_family': {
+            'ipv4': {'routes': {
+                '10.4.1.1/32': {
+                    'route': '10.4.1.1/32',
+                    'active': True,
+                    'ubest': 2,
+                    'mbest': 0,
+                    'metric': 0,
+                    'route_preference': 1,
+                    'source_protocol': 'ospf',
+                    'source_protocol_status': 'intra',
+                    'process_id': '1',
+                    'tag': 100,
+                    'next_hop': {'next_hop_list': {
+                        1: {'index': 1,
+                            'next_hop': '10.2.3.2',
+                            'outgoing_interface': 'Ethernet1/4',
+                            'updated': 'P1DT1H1M30S',
+                            'route_preference': 1,
+                            'metric': 0,
+                            'source_protocol': 'static',
+                            'best_ucast_nexthop': True},
+                        2: {'index': 2,
+                            'next_hop': '10.1.3.1',
+                            'outgoing_interface': 'Ethernet1/2',
+                            'updated': 'P1DT1H1M18S',
+                            'route_preference': 110,
+                            'metric': 41,
+                            'source_protocol': 'ospf',
+                            'source_protocol_status': 'intra'},
+                    }},
+                },
+                '10.36.3.3/32': {
+                    'route': '10.36.3.3/32',
+                    'active': True,
+                    'ubest': 1,
+                    'mbest': 0,
+                    'attached': True,
+                    'metric': 0,
+                    'route_preference': 220,
+                    'source_protocol': 'discard',
+                    'next_hop': {'outgoing_interface': {
+                        'Null0': {'outgoing_interface': 'Null0',
+                                  'updated': 'PT5M'},
+                    }},
+                },
+            }},
+        }}}})
+
+
+class TestShowBgpVrfAllAllJson(unittest.TestCase):
+
+    json_output = '''\
+        {"TABLE_vrf": {"ROW_vrf": {"vrf-name-out": "default",
+         "vrf-router-id": "10.229.11.11", "vrf-local-as": "100",
+         "TABLE_afi": {"ROW_afi": {"afi": "1",
+          "TABLE_safi": {"ROW_safi": {"safi": "1",
+           "af-name": "IPv4 Unicast", "table-version": "35",
+           "TABLE_rd": {"ROW_rd": {
+            "TABLE_prefix": {"ROW_prefix": {"ipprefix": "10.111.8.3/32",
+             "TABLE_path": {"ROW_path": [
+                {"pathnr": "0", "statuscode": "*", "bestcode": ">",
+                 "typecode": "i", "ipnexthop": "10.84.66.66",
+                 "metric": "2000", "localpref": "100", "weight": "0",
+                 "aspath": "200", "origin": "i"},
+                {"pathnr": "1", "statuscode": "*", "bestcode": "",
+                 "typecode": "e", "ipnexthop": "10.70.2.2", "metric": "",
+                 "localpref": "", "weight": "0", "aspath": "100 300",
+                 "origin": "?"}]}}}}}}}}}}}}
+    '''
+
+    def test_json(self):
+        device = Mock()
+        device.execute.return_value = self.json_output
+        parsed = ShowBgpVrfAllAll(device=device).json()
+        # The arguments not given are the defaults of cli()
+        device.execute.assert_called_once_with('show bgp vrf all all | json')
+        self.assertEqual(parsed, {'vrf': {'default': {'address_family': {
+            'ipv4 unicast': {
+                'bgp_table_version': 35,
+                'local_router_id': '10.229.11.11',
+                'prefixes': {'10.111.8.3/32': {'index': {
+                    1: {'status_codes': '*>',
+                        'path_type': 'i',
+                        'next_hop': '10.84.66.66',
+                        'metric': 2000,
+                        'localprf': 100,
+                        'weight': 0,
+                        'path': '200',
+                        'origin_codes': 'i'},
+                    2: {'status_codes': '*',
+                        'path_type': 'e',
+                        'next_hop': '10.70.2.2',
+                        'weight': 0,
+                        'path': '100 300',
+                        'origin_codes': '?'},
+                }}},
+            },
+        }}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import LRUCache
+from genie.libs.parser.utils.common import (
+    get_parser,
+    parser_data,
+    clear_parser_cache,
+    get_parser_cache_info,
+    parser_lookup_cache
+)
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        # 'b' is the least recently used
+        self.assertIs(cache.get('b'), LRUCache.MISSING)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.info(), {'hits': 2, 'misses': 1,
+                                        'evictions': 1, 'invalidations': 0,
+                                        'size': 2, 'maxsize': 2})
+
+    def test_disabled(self):
+        cache = LRUCache(maxsize=0)
+        cache.put('a', 1)
+        self.assertEqual(len(cache), 0)
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        parser_lookup_cache.reset_counters()
+        self.device = Mock(os='iosxe', platform='c9300', model=None,
+                           custom={})
+
+    @patch.object(common, '_get_parser')
+    def test_hit(self, resolve):
+        parser_cls = Mock()
+        resolve.return_value = (parser_cls, {'vrf': 'VRF1'})
+
+        cls, kwargs = get_parser('show ip route vrf VRF1', self.device)
+        kwargs['vrf'] = 'changed'
+        cls, kwargs = get_parser('show  ip route vrf VRF1', self.device)
+
+        self.assertIs(cls, parser_cls)
+        self.assertEqual(kwargs, {'vrf': 'VRF1'})
+        self.assertEqual(resolve.call_count, 1)
+        info = get_parser_cache_info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+
+    @patch.object(common, '_get_parser')
+    def test_key_tokens(self, resolve):
+        resolve.return_value = (Mock(), {})
+
+        get_parser('show version', self.device)
+        get_parser('show version', Mock(os='iosxe', platform='asr1k',
+                                        model=None, custom={}))
+        get_parser('show version', Mock(os='nxos', platform=None,
+                                        model=None, custom={}))
+        self.assertEqual(resolve.call_count, 3)
+
+    @patch.object(common, '_get_parser')
+    def test_invalidate(self, resolve):
+        resolve.return_value = (Mock(), {})
+
+        get_parser('show version', self.device)
+        parser_data.invalidate()
+        get_parser('show version', self.device)
+        self.assertEqual(resolve.call_count, 2)
+
+        clear_parser_cache()
+        get_parser('show version', self.device)
+        self.assertEqual(resolve.call_count, 3)
+        self.assertEqual(get_parser_cache_info()['invalidations'], 2)
+
+
+class TestFindParserCls(unittest.TestCase):
+
+    @patch.object(common, 'Lookup')
+    def test_module(self, lookup):
+        from genie.libs.parser.iosxe.show_platform import ShowVersion
+        data = {'package': 'genie.libs.parser', 'module_name': 'show_platform',
+                'class': 'ShowVersion'}
+        self.assertIs(common._find_parser_cls(Mock(), data, ['iosxe']),
+                      ShowVersion)
+        self.assertFalse(lookup.from_device.called)
+
+    @patch.object(common, 'Lookup')
+    def test_lookup(self, lookup):
+        data = {'package': 'genie.libs.parser', 'module_name': 'show_none',
+                'class': 'ShowNone'}
+        common._find_parser_cls(Mock(), data, ['iosxe'])
+        self.assertTrue(lookup.from_device.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
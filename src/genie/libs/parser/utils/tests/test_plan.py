@@ -0,0 +1,153 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.plan import plan_commands, execute_commands, \
+    collect_plans, parse_planned
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAllSummary
+from genie.libs.parser.iosxr.show_ospf import \
+    ShowOspfVrfAllInclusiveInterface
+from genie.libs.parser.nxos.show_vrf import ShowVrf, ShowRunningConfigVrf
+from genie.libs.parser.nxos.show_mcast import \
+    ShowForwardingDistributionMulticastRoute
+from genie.libs.parser.nxos.tests import test_show_mcast
+
+NXOS_VRF = '''\
+VRF-Name                           VRF-ID State   Reason
+default                                 1 Up      --
+vni_10100                               3 Up      --
+vni_10200                               4 Up      --
+'''
+
+NXOS_CONFIG = '''\
+vrf context vni_10100
+  vni 10100
+  rd auto
+vrf context vni_10200
+  vni 10200
+  rd auto
+'''
+
+# Golden output of the parser, table-id 1 is the default vrf
+NXOS_MCAST = test_show_mcast.test_show_forwarding_distribution_multicast_route\
+    .golden_output['execute.return_value']
+
+BGP_SUMMARY = '''\
+BGP router identifier 10.169.197.254, local AS number 65109
+BGP table version is 263, main routing table version 263
+
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+192.168.10.253  4        65555   10112   10107      263    0    0 3d05h          13
+'''
+
+NXOS_OUTPUTS = {
+    'show vrf': NXOS_VRF,
+    'show running-config': NXOS_CONFIG,
+    'show forwarding distribution multicast route vrf all': NXOS_MCAST,
+}
+
+
+class BatchDevice(object):
+    '''Device executing a list of commands at once, as unicon does'''
+
+    def __init__(self, outputs, os='nxos'):
+        self.os = os
+        self.custom = {}
+        self.outputs = outputs
+        self.writes = []
+
+    def execute(self, command):
+        self.writes.append(command)
+        if isinstance(command, list):
+            return {cmd: self.outputs[cmd] for cmd in command}
+        return self.outputs[command]
+
+
+def mapped_device(outputs, os='nxos'):
+    device = Mock(os=os)
+    device.execute.side_effect = lambda command: outputs[command]
+    return device
+
+
+class TestCommandPlan(unittest.TestCase):
+
+    def test_dependent_commands(self):
+        device = BatchDevice(NXOS_OUTPUTS)
+        result, = parse_planned(device, [(ShowRunningConfigVrf, {})])
+
+        self.assertEqual(result.parsed, ShowRunningConfigVrf(
+            device=mapped_device(NXOS_OUTPUTS)).parse())
+        self.assertEqual(device.writes, ['show vrf', 'show running-config'])
+
+    def test_snapshot(self):
+        device = BatchDevice(NXOS_OUTPUTS)
+        parsers = [(ShowRunningConfigVrf, {}),
+                   (ShowForwardingDistributionMulticastRoute, {'vrf': 'all'}),
+                   (ShowVrf, {})]
+        outputs = {}
+        results = parse_planned(device, parsers, outputs=outputs)
+
+        # show vrf once for the three parsers, with the independent command
+        self.assertEqual(device.writes, [
+            ['show vrf',
+             'show forwarding distribution multicast route vrf all'],
+            'show running-config'])
+        for (parser_cls, kwargs), result in zip(parsers, results):
+            self.assertEqual(result, (parser_cls(
+                device=mapped_device(NXOS_OUTPUTS)).parse(**kwargs), None))
+
+        # Already collected for the snapshot
+        parse_planned(device, parsers[:1], outputs=outputs)
+        self.assertEqual(len(device.writes), 2)
+
+    def test_independent_commands(self):
+        outputs = {'show ip bgp all summary': BGP_SUMMARY,
+                   'show run | sec address-family ipv4 vrf': '',
+                   'show run | sec address-family ipv6 vrf': ''}
+        device = BatchDevice(outputs, os='iosxe')
+        self.assertEqual(collect_plans(device, [(ShowIpBgpAllSummary, {})]),
+                         outputs)
+        self.assertEqual(device.writes, [list(outputs)])
+        self.assertEqual(plan_commands(ShowIpBgpAllSummary, device, {},
+                                       address_family='ipv4 unicast'),
+                         ['show ip bgp ipv4 unicast all summary'])
+
+    def test_virtual_links(self):
+        device = Mock(os='iosxr')
+        command = 'show ospf vrf all-inclusive interface'
+        self.assertEqual(plan_commands(ShowOspfVrfAllInclusiveInterface,
+                                       device, {}), [command])
+        self.assertEqual(plan_commands(
+            ShowOspfVrfAllInclusiveInterface, device,
+            {command: 'OSPF_VL0 is unknown, line protocol is up\n'}),
+            ['show ospf vrf all-inclusive virtual-links'])
+        self.assertEqual(plan_commands(
+            ShowOspfVrfAllInclusiveInterface, device,
+            {command: 'Loopback0 is up, line protocol is up\n'}), [])
+
+    def test_discovered(self):
+        # Without command_plan, the commands are learnt by parsing
+        self.assertEqual(plan_commands(ShowVrf, Mock(os='nxos'), {}),
+                         ['show vrf'])
+        self.assertEqual(plan_commands(ShowVrf, Mock(os='nxos'), {},
+                                       vrf='red'), ['show vrf red'])
+
+    def test_execute_commands(self):
+        # Devices which do not take a list, one command at a time
+        device = mapped_device({'show vrf': NXOS_VRF,
+                                'show bad': ValueError('% Invalid')})
+        outputs = execute_commands(device, ['show vrf', 'show bad'])
+        self.assertEqual(outputs['show vrf'], NXOS_VRF)
+        self.assertIsInstance(outputs['show bad'], ValueError)
+
+    def test_unplanned(self):
+        device = mapped_device(NXOS_OUTPUTS)
+        # A plan missing commands: the parse executes them
+        result, = parse_planned(device, [(ShowRunningConfigVrf, {})],
+                                execute=lambda device, commands: {},
+                                max_stages=1)
+        self.assertEqual(sorted(result.parsed['vrf']),
+                         ['vni_10100', 'vni_10200'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Optional
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import projection as projection_module
+from genie.libs.parser.utils.projection import Projection, project, ANY
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+SCHEMA = {
+    Any(): {
+        'oper_status': str,
+        Optional('description'): str,
+        Optional('counters'): {
+            'in_errors': int,
+            Optional('rate'): {
+                'in_rate': int,
+            },
+        },
+    },
+}
+
+PARSED = {
+    'Gi1': {'oper_status': 'up', 'description': 'uplink',
+            'counters': {'in_errors': 1, 'rate': {'in_rate': 100}}},
+    'Gi2': {'oper_status': 'down'},
+}
+
+OUTPUT = '''\
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.5ef6 (bia 0050.56ff.5ef6)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     1 packets input, 64 bytes, 0 no buffer
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+GigabitEthernet2 is administratively down, line protocol is down
+  Hardware is CSR vNIC, address is 0050.56ff.c9b0 (bia 0050.56ff.c9b0)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     9 packets input, 576 bytes, 0 no buffer
+     3 input errors, 1 CRC, 0 frame, 0 overrun, 0 ignored
+'''
+
+
+class TestProjection(unittest.TestCase):
+
+    def test_paths(self):
+        projection = Projection(SCHEMA, [('in_errors',), ('oper_status',)])
+        self.assertEqual(projection.paths, [(ANY, 'counters', 'in_errors'),
+                                            (ANY, 'oper_status')])
+        self.assertFalse(projection.bounded)
+        # The entries of an Any() level
+        projection = Projection(SCHEMA, [('Gi1', 'counters', 'in_errors')])
+        self.assertEqual(projection.paths, [('Gi1', 'counters', 'in_errors')])
+        self.assertTrue(projection.bounded)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            Projection(SCHEMA, [('out_errors',)])
+        # Not a path of the schema
+        with self.assertRaises(ValueError):
+            Projection(SCHEMA, [('Gi1', 'in_errors')])
+
+    def test_wants(self):
+        projection = Projection(SCHEMA, [('rate',)])
+        self.assertTrue(projection.wants(['counters']))
+        self.assertTrue(projection.wants(['in_rate']))
+        self.assertFalse(projection.wants(['in_errors', 'oper_status']))
+
+    def test_schema(self):
+        projection = Projection(SCHEMA, [('description',)])
+        (key, value), = projection.schema.items()
+        self.assertIsInstance(key, Any)
+        (key, value), = value.items()
+        self.assertIsInstance(key, Optional)
+        self.assertEqual(value, str)
+
+    def test_prune(self):
+        projection = Projection(SCHEMA, [('in_errors',), ('description',)])
+        self.assertEqual(projection.prune(PARSED), {
+            'Gi1': {'description': 'uplink', 'counters': {'in_errors': 1}}})
+        projection = Projection(SCHEMA, [('counters',)])
+        self.assertEqual(projection.prune(PARSED),
+                         {'Gi1': {'counters': PARSED['Gi1']['counters']}})
+
+    def test_complete(self):
+        projection = Projection(SCHEMA, [('Gi2', 'oper_status')])
+        self.assertFalse(projection.complete({'Gi1': {}}))
+        self.assertTrue(projection.complete(PARSED))
+        # Not bounded, every entry is wanted
+        projection = Projection(SCHEMA, [('oper_status',)])
+        self.assertFalse(projection.complete(PARSED))
+
+
+class Parser(object):
+    schema = SCHEMA
+
+
+class TestProject(unittest.TestCase):
+
+    def test_project(self):
+        parser = Parser()
+        self.assertIsNone(project(parser, None))
+        projection = project(parser, 'oper_status')
+        self.assertEqual(projection.fields, (('oper_status',),))
+        # Built once per schema, the parser is left as is
+        self.assertIs(parser.schema, SCHEMA)
+        self.assertIs(project(Parser(), ['oper_status']), projection)
+        with self.assertRaises(ValueError):
+            project(Parser(), [])
+
+    def test_parse(self):
+        parser = ShowInterfaces(device=Mock())
+        parsed = parser.parse(output=OUTPUT, fields=[('GigabitEthernet2',
+                                                      'mtu')])
+        self.assertEqual(parsed, {'GigabitEthernet2': {'mtu': 1500}})
+        # Validated against the projected schema, the instance left as is
+        self.assertNotIn('schema', parser.__dict__)
+        self.assertIs(parser.schema, ShowInterfaces.schema)
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output='', fields=['mtu'])
+
+    def test_cache(self):
+        cache = projection_module._projections
+        self.addCleanup(cache.resize, projection_module.PROJECTION_CACHE_SIZE)
+        cache.resize(2)
+        for field in ['oper_status', 'description', 'in_errors']:
+            project(Parser(), field)
+        self.assertEqual(len(cache), 2)
+
+
+class TestShowInterfacesFields(unittest.TestCase):
+
+    def test_fields(self):
+        parsed = ShowInterfaces(device=Mock()).cli(
+            output=OUTPUT, fields=['oper_status', 'in_errors'])
+        self.assertEqual(parsed, {
+            'GigabitEthernet1': {'oper_status': 'up',
+                                 'counters': {'in_errors': 0}},
+            'GigabitEthernet2': {'oper_status': 'down',
+                                 'counters': {'in_errors': 3}}})
+
+    def test_entry(self):
+        parser = ShowInterfaces(device=Mock())
+        parsed = parser.cli(output=OUTPUT,
+                            fields=[('GigabitEthernet1', 'mtu')])
+        self.assertEqual(parsed, {'GigabitEthernet1': {'mtu': 1500}})
+
+    def test_all_fields(self):
+        parser = ShowInterfaces(device=Mock())
+        full = parser.cli(output=OUTPUT)
+        projection = project(parser, ['counters', 'mtu'])
+        self.assertEqual(parser.cli(output=OUTPUT, fields=['counters', 'mtu']),
+                         projection.prune(full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.common import (
+    _matches_fuzzy,
+    parser_data
+)
+from genie.libs.parser.utils.registry import (
+    CommandTrie,
+    ParserRegistry,
+    load_registry_file
+)
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    commands = ['show version',
+                'show vrf',
+                'show vrf {vrf} interface',
+                'show ip route',
+                'show ip route vrf {vrf}',
+                'show bgp {address_family} summary',
+                '/dna/intent/api/v1/interface/{interface}']
+
+    def setUp(self):
+        self.trie = CommandTrie(self.commands)
+
+    def test_prefix_tokens(self):
+        self.assertEqual(self.trie.candidates('sh ver'.split()),
+                         ['show version'])
+        self.assertEqual(self.trie.candidates('sh v'.split()),
+                         ['show version', 'show vrf'])
+
+    def test_arguments(self):
+        self.assertEqual(self.trie.candidates('sh ip ro vrf VRF1'.split()),
+                         ['show ip route vrf {vrf}'])
+        self.assertEqual(
+            self.trie.candidates('show bgp ipv4 unicast summary'.split()),
+            ['show bgp {address_family} summary'])
+        self.assertEqual(self.trie.candidates(
+            ['/dna/intent/api/v1/interface/abc']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_no_candidates(self):
+        self.assertEqual(self.trie.candidates('show xyz'.split()), [])
+        self.assertEqual(self.trie.candidates([]), [])
+
+    def test_superset_of_full_scan(self):
+        # Every command matched by a full scan must be a candidate
+        for command in list(parser_data.keys())[::25]:
+            search = command.replace('{', '').replace('}', '').split()
+            expected = [c for c in parser_data.keys()
+                        if _matches_fuzzy(0, 0, search.copy(), c, {}, False)]
+            candidates = parser_data.search_candidates(search)
+            for found in expected:
+                self.assertIn(found, candidates, ' '.join(search))
+
+
+class TestParserRegistry(unittest.TestCase):
+
+    def test_lazy_load(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {'show version': {'iosxe': {}}}
+
+        registry = ParserRegistry(loader)
+        self.assertFalse(registry.loaded)
+        self.assertEqual(calls, [])
+
+        self.assertIn('show version', registry)
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(calls, [1])
+
+    def test_invalidate(self):
+        registry = ParserRegistry(lambda: {'show version': {'iosxe': {}}})
+        self.assertEqual(registry.commands_for_os('nxos'), [])
+        generation = registry.generation
+
+        registry['show vrf'] = {'nxos': {}}
+        self.assertEqual(registry.commands_for_os('nxos'), ['show vrf'])
+        self.assertEqual(registry.search_candidates(['sh', 'vr']),
+                         ['show vrf'])
+
+        registry['show version']['nxos'] = {}
+        registry.invalidate()
+        self.assertEqual(registry.commands_for_os('nxos'),
+                         ['show version', 'show vrf'])
+        self.assertGreater(registry.generation, generation)
+
+    def test_load_hook(self):
+        registry = ParserRegistry(lambda: {'show version': {'iosxe': {}}})
+        registry.add_load_hook(
+            lambda: registry.__setitem__('show vrf', {'nxos': {}}))
+        self.assertFalse(registry.loaded)
+
+        self.assertEqual(sorted(registry), ['show version', 'show vrf'])
+
+        # Registered after the load, called at once
+        registry.add_load_hook(
+            lambda: registry.__setitem__('show clock', {'nxos': {}}))
+        self.assertIn('show clock', registry)
+
+
+class TestLoadRegistryFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'parsers.json')
+        self.cache_dir = os.path.join(self.tmp, 'cache')
+        with open(self.path, 'w') as f:
+            json.dump({'show version': {'iosxe': {'class': 'ShowVersion'}}}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_cache(self):
+        data = load_registry_file(self.path, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(
+            load_registry_file(self.path, cache_dir=self.cache_dir), data)
+
+        # Changing the json file refreshes the cache
+        with open(self.path, 'w') as f:
+            json.dump({'show vrf': {'nxos': {'class': 'ShowVrf'}}}, f)
+        os.utime(self.path, ns=(0, 0))
+        self.assertIn('show vrf',
+                      load_registry_file(self.path, cache_dir=self.cache_dir))
+
+    def test_no_cache(self):
+        data = load_registry_file(self.path, cache=False,
+                                  cache_dir=self.cache_dir)
+        self.assertIn('show version', data)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
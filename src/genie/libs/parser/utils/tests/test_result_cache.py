@@ -0,0 +1,132 @@
+import os
+import shutil
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.batch import parse_batch
+from genie.libs.parser.utils.common import clear_parser_cache
+from genie.libs.parser.utils.result_cache import ResultCache, parse_command
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+FOLDER = PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpRoute' / 'cli' / 'equal'
+
+
+class Parser(object):
+    '''Parser counting its parses'''
+
+    parses = 0
+
+    def __init__(self, device=None):
+        self.device = device
+
+    def parse(self, output=None, vrf=''):
+        Parser.parses += 1
+        return {'vrf': vrf, 'lines': output.splitlines()}
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        Parser.parses = 0
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_hit(self):
+        cache = ResultCache()
+        parsed = cache.parse(Parser, 'a\nb', vrf='VRF1')
+        parsed['lines'].append('changed')
+
+        self.assertEqual(cache.parse(Parser, 'a\nb', vrf='VRF1'),
+                         {'vrf': 'VRF1', 'lines': ['a', 'b']})
+        self.assertEqual(Parser.parses, 1)
+
+        # Another output or other arguments are parsed
+        cache.parse(Parser, 'a\nc', vrf='VRF1')
+        cache.parse(Parser, 'a\nb', vrf='VRF2')
+        self.assertEqual(Parser.parses, 3)
+
+        info = cache.info()
+        self.assertEqual((info['hits'], info['misses'], info['size']),
+                         (1, 3, 3))
+        self.assertEqual(info['hit_rate'], 0.25)
+
+    def test_eviction(self):
+        cache = ResultCache(maxsize=2)
+        for output in ['a', 'b', 'c']:
+            cache.parse(Parser, output)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.info()['evictions'], 1)
+
+        cache = ResultCache(maxbytes=len(cache._data[next(iter(
+            cache._data))]) * 2)
+        for output in ['a', 'b', 'c']:
+            cache.parse(Parser, output)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.info()['bytes'], cache.maxbytes)
+
+    def test_disk(self):
+        path = os.path.join(self.tmp, 'cache', 'results.db')
+        ResultCache(path=path).parse(Parser, 'a\nb')
+
+        # Another process finds it on disk
+        cache = ResultCache(path=path)
+        self.assertEqual(cache.parse(Parser, 'a\nb'),
+                         {'vrf': '', 'lines': ['a', 'b']})
+        self.assertEqual(Parser.parses, 1)
+        self.assertEqual(cache.info()['disk_hits'], 1)
+        # and keeps it in memory
+        cache.parse(Parser, 'a\nb')
+        self.assertEqual(cache.info()['memory_hits'], 1)
+
+        cache.clear()
+        self.assertEqual(cache.info()['disk_size'], 0)
+
+    def test_disk_eviction(self):
+        cache = ResultCache(path=os.path.join(self.tmp, 'results.db'),
+                            disk_maxbytes=200)
+        for index in range(10):
+            cache.parse(Parser, 'line {}'.format(index))
+        info = cache.info()
+        self.assertLessEqual(info['disk_bytes'], 200)
+        self.assertGreater(info['disk_evictions'], 0)
+
+    def test_parse_command(self):
+        device = Mock(os='iosxe', platform=None, model=None, custom={})
+        device.execute.return_value = 'a\nb'
+        cache = ResultCache()
+        with patch('genie.libs.parser.utils.result_cache.get_parser',
+                   return_value=(Parser, {'vrf': 'VRF1'})):
+            parse_command(device, 'show ip route vrf VRF1', cache=cache)
+            parsed = parse_command(device, 'show ip route vrf VRF1',
+                                   cache=cache)
+        self.assertEqual(parsed, {'vrf': 'VRF1', 'lines': ['a', 'b']})
+        self.assertEqual(Parser.parses, 1)
+        self.assertEqual(device.execute.call_count, 2)
+
+
+@patch.object(common, '_get_parser', return_value=(ShowIpRoute, {}))
+class TestParseBatchCache(unittest.TestCase):
+
+    def test_parse_batch(self, get):
+        clear_parser_cache()
+        outputs = [path.read_text()
+                   for path in sorted(FOLDER.glob('*_output.txt'))[:2]]
+        items = [('iosxe', None, 'show ip route', output)
+                 for output in outputs]
+        cache = ResultCache()
+
+        first = parse_batch(items, max_workers=1, cache=cache)
+        self.assertEqual(cache.info()['stores'], 2)
+        with patch.object(ShowIpRoute, 'cli') as cli:
+            second = parse_batch(items, max_workers=1, cache=cache)
+        self.assertFalse(cli.called)
+        self.assertEqual(second, first)
+        self.assertEqual(cache.info()['hits'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
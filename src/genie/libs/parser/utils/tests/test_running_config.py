@@ -0,0 +1,203 @@
+import pathlib
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import running_config as rc
+from genie.libs.parser.utils.running_config import RunningConfig, \
+    running_config, clear_running_config, config_section, config_include
+from genie.libs.parser.utils.subcommand import subcommand_cache
+from genie.libs.parser.iosxe.show_isis import ShowRunSectionIsis
+from genie.libs.parser.nxos.show_vrf import ShowRunningConfigVrf
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+ISIS = PARSER_ROOT / 'iosxe' / 'tests' / 'ShowRunSectionIsis' / 'cli' / \
+    'equal' / 'golden_output_output.txt'
+
+IOSXE_CONFIG = '''\
+hostname R2
+!
+interface GigabitEthernet1
+ ip address 10.1.1.2 255.255.255.0
+ ip router isis test
+ ipv6 router isis test
+!
+interface GigabitEthernet2
+ description isis uplink
+ ip router isis test1
+!
+router isis test
+ net 49.0001.11ff.2211.2222.00
+ metric-style wide
+ !
+ address-family ipv6
+  multi-topology
+ exit-address-family
+router isis test1
+ vrf VRF1
+!
+router bgp 65000
+ template peer-session PS1
+  remote-as 65001
+ exit-peer-session
+ !
+ address-family ipv4 vrf VRF1
+  neighbor 10.4.1.1 remote-as 65001
+ exit-address-family
+!
+end
+'''
+
+NXOS_VRF = '''\
+VRF-Name                           VRF-ID State   Reason
+default                                 1 Up      --
+vni_10100                               3 Up      --
+vni_10200                               4 Up      --
+'''
+
+NXOS_CONFIG = '''\
+vrf context vni_10100
+  vni 10100
+  rd auto
+  address-family ipv4 unicast
+    route-target both auto
+vrf context vni_10200
+  vni 10200
+  rd auto
+interface Ethernet1/1
+  vrf member vni_10100
+router bgp 100
+  vrf vni_10100
+    address-family ipv4 unicast
+'''
+
+
+def mapped_device(outputs):
+    device = Mock()
+    device.execute.side_effect = lambda command: outputs[command]
+    return device
+
+
+class TestRunningConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.config = RunningConfig(IOSXE_CONFIG)
+
+    def test_section(self):
+        self.assertEqual(self.config.section('address-family ipv4 vrf'),
+                         ' address-family ipv4 vrf VRF1\n'
+                         '  neighbor 10.4.1.1 remote-as 65001')
+        self.assertEqual(self.config.section('^router isis test1'),
+                         'router isis test1\n vrf VRF1')
+        self.assertEqual(self.config.section('^router ospf'), '')
+
+    def test_section_golden(self):
+        # The matching lines at any depth, with the lines below them
+        section = self.config.section('isis')
+        self.assertEqual(section.splitlines()[:4],
+                         [' ip router isis test', ' ipv6 router isis test',
+                          ' description isis uplink',
+                          ' ip router isis test1'])
+        self.assertEqual(
+            ShowRunSectionIsis(device=Mock()).parse(output=section),
+            ShowRunSectionIsis(device=Mock()).parse(output=ISIS.read_text()))
+
+    def test_include(self):
+        self.assertEqual(self.config.include('peer-session'),
+                         ' template peer-session PS1\n exit-peer-session')
+        self.assertEqual(self.config.include(r'^interface \S+1$'),
+                         'interface GigabitEthernet1')
+
+    def test_block(self):
+        self.assertEqual(self.config.block('router isis test1'),
+                         'router isis test1\n vrf VRF1')
+        self.assertEqual(self.config.block('router isis'), '')
+
+
+class TestRunningConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = mapped_device({
+            'show running-config': IOSXE_CONFIG,
+            'show run | sec isis': 'isis from the device'})
+        self.addCleanup(clear_running_config)
+
+    def test_fallback(self):
+        # Not built: the filtered command is executed, as before
+        self.assertEqual(config_section(self.device, 'isis',
+                                        'show run | sec isis'),
+                         'isis from the device')
+        self.assertIsNone(running_config(self.device, build=False))
+
+    def test_parse_scope(self):
+
+        @subcommand_cache
+        def cli(parser):
+            config_section(self.device, 'isis', '', build=True)
+            return config_include(self.device, 'peer-session', '')
+
+        self.assertIn('peer-session PS1', cli(None))
+        self.device.execute.assert_called_once_with('show running-config')
+        # Not kept after the parse
+        self.assertIsNone(running_config(self.device, build=False))
+
+    def test_ttl(self):
+        with patch.object(rc, 'running_config_ttl', return_value=60):
+            config = running_config(self.device)
+            self.assertIs(running_config(self.device), config)
+            self.assertIn('router isis test', config_section(
+                self.device, 'isis', 'show run | sec isis'))
+            self.assertEqual(self.device.execute.call_count, 1)
+
+            clear_running_config(self.device)
+            self.assertIsNot(running_config(self.device), config)
+            self.assertEqual(self.device.execute.call_count, 2)
+
+            # Read again once expired
+            config = running_config(self.device)
+            with patch.object(rc.time, 'monotonic', return_value=10 ** 9):
+                self.assertIsNot(running_config(self.device), config)
+            self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_unreadable(self):
+        for output in ['', '% Invalid input detected', KeyError]:
+            device = Mock()
+            device.execute.side_effect = [output, 'filtered']
+            self.assertEqual(config_section(device, 'isis', 'show run | sec '
+                                            'isis', build=True), 'filtered')
+
+    def test_ttl_config(self):
+        with patch.dict(rc.os.environ,
+                        {'GENIE_LIBS_PARSER_RUNNING_CONFIG_TTL': '30'}):
+            self.assertEqual(rc.running_config_ttl(), 30)
+        with patch.dict(rc.os.environ,
+                        {'GENIE_LIBS_PARSER_RUNNING_CONFIG_TTL': 'soon'}):
+            self.assertEqual(rc.running_config_ttl(), 0)
+
+
+class TestShowRunningConfigVrf(unittest.TestCase):
+
+    def test_one_command_for_all_vrfs(self):
+        device = mapped_device({'show vrf': NXOS_VRF,
+                                'show running-config': NXOS_CONFIG})
+        parsed = ShowRunningConfigVrf(device=device).parse()
+        self.assertEqual([call[0][0] for call in
+                          device.execute.call_args_list],
+                         ['show vrf', 'show running-config'])
+        self.assertEqual({vrf: values['vni'] for vrf, values in
+                          parsed['vrf'].items()},
+                         {'vni_10100': 10100, 'vni_10200': 10200})
+        self.assertEqual(
+            parsed['vrf']['vni_10100']['address_family']['ipv4 unicast']
+            ['route_target']['auto']['rt_type'], 'both')
+
+    def test_one_vrf(self):
+        command = "show running-config vrf vni_10200 | sec '^vrf'"
+        device = mapped_device({
+            command: 'vrf context vni_10200\n  vni 10200\n  rd auto\n'})
+        parsed = ShowRunningConfigVrf(device=device).parse(vrf='vni_10200')
+        self.assertEqual(parsed['vrf']['vni_10200']['vni'], 10200)
+        device.execute.assert_called_once_with(command)
+
+
+if __name__ == '__main__':
+    unittest.main()
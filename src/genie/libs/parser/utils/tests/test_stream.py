@@ -0,0 +1,111 @@
+import io
+import json
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.stream import RecordStream, APPEND, iter_lines
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAll
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.junos.show_route import ShowRoute
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def golden(os_name, class_name):
+    '''Yield the (output, arguments) of the golden outputs of a parser'''
+    folder = PARSER_ROOT / os_name / 'tests' / class_name / 'cli' / 'equal'
+    for output in sorted(folder.glob('*_output.txt')):
+        arguments = output.with_name(
+            output.name.replace('_output.txt', '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) if arguments.exists() \
+            else {}
+        yield output.read_text(), kwargs
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_str(self):
+        self.assertEqual(list(iter_lines('a\r\nb\n')), ['a', 'b'])
+
+    def test_file(self):
+        self.assertEqual(list(iter_lines(io.StringIO('a\nb\n'))), ['a', 'b'])
+
+    def test_iterable(self):
+        self.assertEqual(list(iter_lines(['a\n', 'b'])), ['a', 'b'])
+
+
+class TestRecordStream(unittest.TestCase):
+
+    def test_dict_mode(self):
+        records = RecordStream()
+        routes = {}
+        records.start(routes, 'a', ('a',))['x'] = 1
+        records.start(routes, 'b', ('b',))
+        records.start(routes, 'a', ('a',))['y'] = 2
+        records.close()
+        self.assertEqual(routes, {'a': {'x': 1, 'y': 2}, 'b': {}})
+        self.assertEqual(records.pop_completed(), [])
+
+    def test_streaming(self):
+        records = RecordStream(streaming=True)
+        routes = {}
+        records.start(routes, 'a', ('a',))['x'] = 1
+        records.start(routes, 'a', ('a',))['y'] = 2
+        self.assertEqual(records.completed, [])
+        records.start(routes, 'b', ('b',))
+        self.assertEqual(records.pop_completed(), [(('a',), {'x': 1, 'y': 2})])
+        self.assertEqual(routes, {'b': {}})
+        records.close()
+        self.assertEqual(records.pop_completed(), [(('b',), {})])
+        self.assertEqual(routes, {})
+
+    def test_streaming_list(self):
+        records = RecordStream(streaming=True)
+        rt_list = []
+        records.start(rt_list, APPEND, ('inet.0',))['x'] = 1
+        records.start(rt_list, APPEND, ('inet.0',))['x'] = 2
+        self.assertEqual(records.pop_completed(), [(('inet.0',), {'x': 1})])
+        self.assertEqual(rt_list, [{'x': 2}])
+
+
+class TestParseIter(unittest.TestCase):
+    '''parse_iter() yields the routes cli() returns'''
+
+    def test_iosxe_show_ip_route(self):
+        for output, kwargs in golden('iosxe', 'ShowIpRoute'):
+            parser = ShowIpRoute(device=Mock())
+            parsed = parser.cli(output=output, **kwargs)
+            streamed = {}
+            for (vrf, af, route), record in parser.parse_iter(
+                    io.StringIO(output), vrf=kwargs.get('vrf')):
+                streamed.setdefault('vrf', {}).setdefault(vrf, {})\
+                    .setdefault('address_family', {}).setdefault(af, {})\
+                    .setdefault('routes', {})[route] = record
+            self.assertEqual(streamed, parsed)
+
+    def test_iosxe_show_ip_bgp_all(self):
+        for output, kwargs in golden('iosxe', 'ShowIpBgpAll'):
+            parser = ShowIpBgpAll(device=Mock())
+            parsed = parser.cli(output=output, **kwargs)
+            expected = {
+                (vrf, af, prefix): record
+                for vrf, vrf_dict in parsed['vrf'].items()
+                for af, af_dict in vrf_dict['address_family'].items()
+                for prefix, record in af_dict.get('routes', {}).items()}
+            streamed = dict(parser.parse_iter(output.splitlines(), **kwargs))
+            self.assertEqual(streamed, expected)
+
+    def test_junos_show_route(self):
+        for output, _ in golden('junos', 'ShowRoute'):
+            parser = ShowRoute(device=Mock())
+            parsed = parser.cli(output=output)
+            expected = [
+                ((table['table-name'],), rt)
+                for table in parsed['route-information']['route-table']
+                for rt in table.get('rt', [])]
+            self.assertEqual(list(parser.parse_iter(output)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.subcommand import subcommand_cache, \
+                                               subcommand_parse, \
+                                               subcommand_execute
+from genie.libs.parser.iosxr.show_ospf import \
+    ShowOspfVrfAllInclusiveNeighborDetail
+from genie.libs.parser.iosxr.tests import test_show_ospf
+
+
+class Parser(object):
+    '''Parser running an auxiliary command twice'''
+
+    def __init__(self, device):
+        self.device = device
+
+    @subcommand_cache
+    def cli(self, nested=False):
+        outputs = [subcommand_execute(self.device, 'show vrf'),
+                   subcommand_execute(self.device, 'show vrf')]
+        if nested:
+            outputs.append(Parser(self.device).cli())
+        return outputs
+
+    def parse(self, **kwargs):
+        return self.cli()
+
+
+class TestSubcommandCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock()
+        self.device.execute.return_value = 'vrf output'
+
+    def test_cached_within_parse(self):
+        self.assertEqual(Parser(self.device).cli(), ['vrf output'] * 2)
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_nested_parse(self):
+        Parser(self.device).cli(nested=True)
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_once_per_parse(self):
+        Parser(self.device).cli()
+        Parser(self.device).cli()
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_outside_parse(self):
+        subcommand_execute(self.device, 'show vrf')
+        subcommand_execute(self.device, 'show vrf')
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_parse(self):
+        parser_cls = Mock()
+        parser_cls.return_value.parse.return_value = {'vrf': {}}
+
+        @subcommand_cache
+        def cli(self):
+            return [subcommand_parse(parser_cls, self.device, vrf='all'),
+                    subcommand_parse(parser_cls, self.device, vrf='all'),
+                    subcommand_parse(parser_cls, self.device)]
+
+        cli(Parser(self.device))
+        self.assertEqual(parser_cls.return_value.parse.call_count, 2)
+
+
+class TestIosxrVirtualLinks(unittest.TestCase):
+    ''''show ospf vrf all-inclusive virtual-links' runs once per parse'''
+
+    neighbors = '''\
+        Neighbors for OSPF 1
+
+         Neighbor 10.16.2.2, interface address 10.229.4.4
+            In the area 0.0.0.0 via interface OSPF_VL0
+            Neighbor priority is 1, State is FULL, 7 state changes
+            DR is 0.0.0.0 BDR is 0.0.0.0
+            Options is 0x72
+            Neighbor is up for 04:58:24
+
+         Neighbor 10.100.5.5, interface address 10.229.3.3
+            In the area 0.0.0.0 via interface OSPF_VL1
+            Neighbor priority is 1, State is FULL, 7 state changes
+            DR is 0.0.0.0 BDR is 0.0.0.0
+            Options is 0x72
+            Neighbor is up for 04:58:24
+
+        Total neighbor count: 2
+    '''
+
+    # Golden output of the virtual-links parser, OSPF_VL0 and OSPF_VL1
+    virtual_links = test_show_ospf.test_show_ospf_vrf_all_inclusive_virtual_links\
+        .golden_output1['execute.return_value']
+
+    def test_neighbor_detail(self):
+        outputs = {
+            'show ospf vrf all-inclusive neighbor detail': self.neighbors,
+            'show ospf vrf all-inclusive virtual-links': self.virtual_links,
+        }
+        device = Mock()
+        device.execute.side_effect = lambda command: outputs[command]
+
+        parsed = ShowOspfVrfAllInclusiveNeighborDetail(device=device).cli()
+        areas = parsed['vrf']['default']['address_family']['ipv4'][
+            'instance']['1']['areas']
+        self.assertEqual(sorted(areas['0.0.0.1']['virtual_links']),
+                         ['0.0.0.1 10.100.5.5', '0.0.0.1 10.16.2.2'])
+        commands = [call[0][0] for call in device.execute.call_args_list]
+        self.assertEqual(
+            commands.count('show ospf vrf all-inclusive virtual-links'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import re
+import json
+import shutil
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import telemetry
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+FOLDER = PARSER_ROOT / 'iosxe' / 'tests' / 'ShowInterfaces' / 'cli' / 'equal'
+PARSER = 'genie.libs.parser.iosxe.show_interface.ShowInterfaces'
+
+
+class TestTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        self.output = (FOLDER / 'golden_interface_output_1_output.txt')\
+            .read_text()
+        self.events = []
+        self.addCleanup(telemetry.disable)
+
+    def parse(self, **kwargs):
+        return ShowInterfaces(device=Mock(os='iosxe')).parse(
+            output=self.output, **kwargs)
+
+    def test_off(self):
+        parse = MetaParser.parse
+        telemetry.enable()
+        self.assertIsNot(MetaParser.parse, parse)
+        telemetry.disable()
+        self.assertIs(MetaParser.parse, parse)
+        self.assertIsNone(telemetry.get_telemetry())
+        with self.assertRaises(RuntimeError):
+            telemetry.counters()
+
+    def test_time(self):
+        telemetry.enable()
+        telemetry.add_listener(self.events.append)
+        parsed = self.parse()
+
+        telemetry.disable()
+        self.assertEqual(parsed, self.parse())
+        event, = self.events
+        self.assertEqual((event['parser'], event['os'], event['context'],
+                          event['depth'], event['error']),
+                         (PARSER, 'iosxe', 'cli', 0, None))
+        self.assertEqual(event['lines'], len(self.output.splitlines()))
+        self.assertEqual(event['bytes'], len(self.output.encode()))
+        self.assertGreater(event['seconds'], 0)
+        # The cli() of ShowInterfaces is timed, then put back
+        self.assertGreater(event['context_seconds'], 0)
+        self.assertLessEqual(event['context_seconds'], event['seconds'])
+        self.assertEqual(event['schema_seconds'],
+                         event['seconds'] - event['context_seconds'])
+        self.assertNotIn('regex_attempts', event)
+
+    def test_counters(self):
+        telemetry.enable()
+        self.parse()
+        self.parse()
+        counters = telemetry.counters()['parsers'][PARSER]
+        self.assertEqual(counters['calls'], 2)
+        self.assertEqual(counters['lines'], len(self.output.splitlines()) * 2)
+        self.assertGreater(counters['context_seconds'], 0)
+
+    def test_executed_output(self):
+        telemetry.enable()
+        telemetry.add_listener(self.events.append)
+        device = Mock(os='iosxe')
+        device.execute.return_value = self.output
+        parser = ShowInterfaces(device=device)
+        parser.parse()
+        self.assertIs(parser.device, device)
+        self.assertEqual(self.events[0]['lines'],
+                         len(self.output.splitlines()))
+
+    def test_error(self):
+        telemetry.enable()
+        telemetry.add_listener(self.events.append)
+        with patch.object(ShowInterfaces, 'cli', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                self.parse()
+        self.assertEqual(self.events[0]['error'], 'ValueError')
+        self.assertEqual(telemetry.counters()['parsers'][PARSER]['errors'], 1)
+
+    def test_regex(self):
+        telemetry.enable(['time', 'regex'])
+        telemetry.add_listener(self.events.append)
+        self.assertIsInstance(re.compile('a'), telemetry.CountingPattern)
+        parsed = self.parse()
+
+        telemetry.disable()
+        self.assertEqual(parsed, self.parse())
+        event = self.events[0]
+        self.assertGreater(event['regex_attempts'], 0)
+        self.assertGreater(event['regex_matches'], 0)
+        self.assertEqual(sum(attempts for attempts, _, _ in
+                             event['patterns'].values()),
+                         event['regex_attempts'])
+        # The patterns of other modules are left alone
+        self.assertNotIsInstance(re.compile('a'), telemetry.CountingPattern)
+
+    def test_regex_disabled(self):
+        telemetry.enable(['regex'])
+        # Patterns of a parser module, compiled while enabled
+        module = {'__name__': 'genie.libs.parser.iosxe.telemetry_test',
+                  're': re, 'LineDispatcher': LineDispatcher}
+        exec('p1 = re.compile("a")\n'
+             'patterns = [(re.compile("b"), 1)]\n'
+             'class Parser(object):\n'
+             '    p2 = re.compile("c")\n'
+             'dispatcher = LineDispatcher()\n'
+             'dispatcher.rule(re.compile("d"))(lambda m: None)\n', module)
+        self.assertIsInstance(module['p1'], telemetry.CountingPattern)
+
+        telemetry.disable()
+        pattern = type(re.compile('a'))
+        self.assertIs(type(module['p1']), pattern)
+        self.assertIs(type(module['patterns'][0][0]), pattern)
+        self.assertIs(type(module['Parser'].p2), pattern)
+        self.assertTrue(re.match(module['p1'], 'a'))
+        self.assertEqual(re.sub(module['patterns'][0][0], 'x', 'b'), 'x')
+        test = module['dispatcher']._rules[0].test
+        self.assertIs(test.__self__, re.compile('d'))
+
+    def test_memory(self):
+        telemetry.enable(['memory'])
+        telemetry.add_listener(self.events.append)
+        self.parse()
+        if self.events[0]['peak_bytes'] is not None:
+            self.assertGreater(self.events[0]['peak_bytes'], 0)
+
+    def test_prometheus_text(self):
+        telemetry.enable(['regex'])
+        self.parse()
+        text = telemetry.prometheus_text()
+        self.assertIn('# TYPE genie_parser_calls_total counter', text)
+        self.assertIn('genie_parser_calls_total{{parser="{p}"}} 1'.format(
+            p=PARSER), text)
+        self.assertRegex(text, r'genie_parser_pattern_attempts_total\{parser='
+                               r'"[^"]+",pattern="\^.*"\} \d+')
+
+    def test_environment(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, 'events.jsonl')
+        with patch.dict(os.environ, {
+                telemetry.TELEMETRY_ENV: 'time,memory',
+                telemetry.TELEMETRY_PATH_ENV: path}):
+            enabled = telemetry.enable_from_environment()
+        self.assertEqual(enabled.measures, {'time', 'memory'})
+        self.parse()
+        self.parse()
+        with open(path) as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([event['parser'] for event in events],
+                         [PARSER, PARSER])
+
+        with patch.dict(os.environ, {telemetry.TELEMETRY_ENV: 'size'}):
+            self.assertIsNone(telemetry.enable_from_environment())
+        with patch.dict(os.environ, {telemetry.TELEMETRY_ENV: '0'}):
+            self.assertIsNone(telemetry.enable_from_environment())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Optional
+from genie.metaparser.util.exceptions import SchemaMissingKeyError
+
+from genie.libs.parser.utils.validation import ListValidator, list_validation
+from genie.libs.parser.junos.show_route import ShowRoute
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+class TestListValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = ListValidator({
+            'to': str,
+            Optional('via'): str,
+        }, 'nh is not a list')
+
+    def test_valid(self):
+        value = [{'to': '10.1.1.1'}, {'to': '10.1.1.2', 'via': 'ge-0/0/0.0'}]
+        self.assertIs(self.validator(value), value)
+
+    def test_not_a_list(self):
+        with self.assertRaisesRegex(SchemaError, 'nh is not a list'):
+            self.validator({'to': '10.1.1.1'})
+
+    def test_invalid_item(self):
+        # Raised by the Schema of the items, as is
+        with self.assertRaises(SchemaMissingKeyError):
+            self.validator([{'to': '10.1.1.1'}, {'via': 'ge-0/0/0.0'}])
+
+    def test_allow_dict(self):
+        validator = ListValidator({'to': str}, 'nh is not a list/dict',
+                                  allow_dict=True)
+        self.assertEqual(validator({'to': '10.1.1.1'}), [{'to': '10.1.1.1'}])
+        with self.assertRaisesRegex(SchemaError, 'nh is not a list/dict'):
+            validator('10.1.1.1')
+
+
+class TestListValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = ListValidator({'to': str}, 'nh is not a list')
+        self.validator.schema = Mock()
+        self.value = [{'to': str(index)} for index in range(100)]
+
+    def validated(self):
+        return [call[0][0] for call in
+                self.validator.schema.validate.call_args_list]
+
+    def test_full(self):
+        self.validator(self.value)
+        self.assertEqual(self.validated(), self.value)
+
+    def test_sample(self):
+        with list_validation(sample=5):
+            self.validator(self.value)
+        self.assertEqual([item['to'] for item in self.validated()],
+                         ['0', '25', '50', '74', '99'])
+
+        # back to full validation once out of the block
+        self.validator.schema.reset_mock()
+        self.validator(self.value)
+        self.assertEqual(len(self.validated()), 100)
+
+    def test_sample_short_list(self):
+        with list_validation(sample=500):
+            self.validator(self.value)
+        self.assertEqual(self.validated(), self.value)
+
+    def test_skip(self):
+        with list_validation(skip=True):
+            self.assertIs(self.validator(self.value), self.value)
+            with self.assertRaises(SchemaError):
+                self.validator('10.1.1.1')
+        self.assertEqual(self.validated(), [])
+
+    def test_invalid_sample(self):
+        with self.assertRaises(ValueError):
+            list_validation(sample=0)
+
+
+class TestJunosSchema(unittest.TestCase):
+    '''The golden outputs validate in every mode'''
+
+    def test_show_route(self):
+        folder = PARSER_ROOT / 'junos' / 'tests' / 'ShowRoute' / 'cli' / \
+            'equal'
+        outputs = sorted(folder.glob('*_output.txt'))
+        self.assertTrue(outputs)
+        for output in outputs:
+            parsed = ShowRoute(device=Mock()).cli(output=output.read_text())
+            Schema(ShowRoute.schema).validate(parsed)
+            with list_validation(sample=2):
+                Schema(ShowRoute.schema).validate(parsed)
+            with list_validation(skip=True):
+                Schema(ShowRoute.schema).validate(parsed)
+
+
+if __name__ == '__main__':
+    unittest.main()
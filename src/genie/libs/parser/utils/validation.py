@@ -0,0 +1,104 @@
+'''Cached validation of the list of dicts of the parser schemas
+
+The Junos schemas hold lists of dicts, validated by a ``Use()`` function
+per list. These functions used to build the ``Schema`` of the items on each
+call, for each list of the output: validating a route table rebuilt the
+next-hop schema once per route. ``ListValidator`` builds it once, with the
+schema class:
+
+    class ShowRouteSchema(MetaParser):
+        validate_nh_list = ListValidator({
+            Optional("to"): str,
+            Optional("via"): str
+        }, 'nh list is not a list')
+
+        schema = {
+            ...
+            "nh": Use(validate_nh_list),
+        }
+
+Validating every item of a huge list is still costly; trusted runs can
+validate a sample of the items, or none of them:
+
+    with list_validation(sample=50):
+        output = device.parse('show route')
+
+    with list_validation(skip=True):
+        output = device.parse('show route')
+
+The mode applies to the current thread only.
+'''
+
+# python
+import threading
+
+# metaparser
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema
+
+_settings = threading.local()
+
+
+class list_validation(object):
+    '''Context manager setting how ListValidator validates the list items
+
+    Args:
+        sample (`int`): validate at most this number of items of each list,
+            evenly spread over the list
+        skip (`bool`): do not validate the items at all, only that the
+            values are lists
+    '''
+
+    def __init__(self, sample=None, skip=False):
+        if sample is not None and sample < 1:
+            raise ValueError('sample must be a positive number of items')
+        self.sample = 0 if skip else sample
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = getattr(_settings, 'sample', None)
+        _settings.sample = self.sample
+        return self
+
+    def __exit__(self, *exc_info):
+        _settings.sample = self.previous
+
+
+class ListValidator(object):
+    '''Validate a list of dicts against the schema of its items
+
+    Instances are used as ``Use()`` callables of a schema, ex:
+    ``Use(validate_nh_list)``.
+
+    Args:
+        schema (`dict`): schema of the items of the list
+        error (`str`): message of the SchemaError raised when the value is
+            not a list
+        allow_dict (`bool`): a dict value is validated as a list of one
+            item, and returned as such
+    '''
+
+    def __init__(self, schema, error, allow_dict=False):
+        self.schema = Schema(schema)
+        self.error = error
+        self.allow_dict = allow_dict
+
+    def __call__(self, value):
+        if self.allow_dict and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError(self.error)
+
+        sample = getattr(_settings, 'sample', None)
+        items = value
+        if sample is not None and len(value) > sample:
+            if not sample:
+                return value
+            # evenly spread, the first and the last items included
+            step = (len(value) - 1) / max(sample - 1, 1)
+            items = [value[round(index * step)] for index in range(sample)]
+
+        validate = self.schema.validate
+        for item in items:
+            validate(item)
+        return value
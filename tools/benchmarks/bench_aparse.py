@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+'''Benchmark of the parse of many devices from an asyncio event loop
+
+Parses show ip bgp all summary on many fake devices: the summary and the
+address families of its VRFs, three commands each costing --latency
+seconds, as a round trip to the device. Compares a pool of --threads
+threads, one device each at a time, with aparse() on a single event loop.
+Reports the commands executed, the total time and the parses per second.
+
+Usage:
+
+    python bench_aparse.py [--devices N] [--latency S] [--threads N]
+'''
+
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAllSummary
+from genie.libs.parser.utils.aparse import aparse_parser
+
+SUMMARY = '''\
+BGP router identifier 10.169.197.254, local AS number 65109
+BGP table version is 263, main routing table version 263
+126 network entries using 32256 bytes of memory
+BGP using 92688 total bytes of memory
+
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+192.168.10.253  4        65555   10112   10107      263    0    0 3d05h          13
+192.168.36.119  4        65109   10293   10213      263    0    0 3d05h          62
+'''
+
+OUTPUTS = {
+    'show ip bgp all summary': SUMMARY,
+    'show run | sec address-family ipv4 vrf': ''' address-family ipv4 vrf VRF1
+  neighbor 192.168.10.253 remote-as 65555
+''',
+    'show run | sec address-family ipv6 vrf': '',
+}
+
+
+class FakeDevice(object):
+    '''Device answering OUTPUTS after latency seconds, blocking'''
+
+    os = 'iosxe'
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.commands = 0
+
+    def execute(self, command):
+        self.commands += 1
+        time.sleep(self.latency)
+        return OUTPUTS[command]
+
+
+class FakeAsyncDevice(FakeDevice):
+    '''Device answering OUTPUTS after latency seconds, from the event loop'''
+
+    async def execute(self, command):
+        self.commands += 1
+        await asyncio.sleep(self.latency)
+        return OUTPUTS[command]
+
+
+def threaded(devices, threads):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(
+            lambda device: ShowIpBgpAllSummary(device=device).parse(),
+            devices))
+
+
+async def concurrent(devices):
+    return await asyncio.gather(*[aparse_parser(ShowIpBgpAllSummary, device)
+                                  for device in devices])
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--devices', type=int, default=10000)
+    argparser.add_argument('--latency', type=float, default=0.05,
+                           help='Seconds of each command')
+    argparser.add_argument('--threads', type=int, default=100)
+    args = argparser.parse_args()
+
+    print('{:>8} {:>12} {:>10} {:>10} {:>10}'.format(
+        'devices', 'mode', 'commands', 's', 'parses/s'))
+    results = {}
+    for mode in ['threads', 'aparse']:
+        if mode == 'threads':
+            devices = [FakeDevice(args.latency) for _ in range(args.devices)]
+            start = time.perf_counter()
+            results[mode] = threaded(devices, args.threads)
+        else:
+            devices = [FakeAsyncDevice(args.latency)
+                       for _ in range(args.devices)]
+            loop = asyncio.new_event_loop()
+            start = time.perf_counter()
+            try:
+                results[mode] = loop.run_until_complete(concurrent(devices))
+            finally:
+                loop.close()
+        seconds = time.perf_counter() - start
+        print('{:>8} {:>12} {:>10} {:>10.1f} {:>10.0f}'.format(
+            args.devices, mode if mode == 'aparse' else
+            '{} threads'.format(args.threads),
+            sum(device.commands for device in devices), seconds,
+            args.devices / seconds))
+    assert results['threads'] == results['aparse']
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
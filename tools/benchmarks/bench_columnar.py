@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+'''Benchmark of the columnar output of the parsers of huge tables
+
+Builds outputs of N NAT translations and N MAC addresses. For each output it
+reports the memory held by the cli() parsed output and by the
+parse_columnar() tables, and the time it takes to diff two snapshots of the
+output. The second snapshot has 1% of its entries changed.
+
+Usage:
+
+    python bench_columnar.py [--entries N]
+'''
+
+import sys
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+
+
+def ip(index):
+    return '10.{}.{}.{}'.format(index // 65536 % 256, index // 256 % 256,
+                                index % 256)
+
+
+def nat_translations(entries, changed=0):
+    '''Return the output of 'show ip nat translations' '''
+    lines = ['Pro Inside global      Inside local       Outside local      '
+             'Outside global']
+    for index in range(entries):
+        port = 80 if index % 100 >= changed else 8080
+        lines.append('tcp {}:{} 192.168.1.1:{} 172.16.1.1:23 '
+                     '172.16.1.1:23'.format(ip(index), port, port))
+    lines.append('Total number of translations: {}'.format(entries))
+    return '\n'.join(lines)
+
+
+def mac_address_table(entries, changed=0):
+    '''Return the output of 'show mac address-table' '''
+    lines = ['          Mac Address Table',
+             '-------------------------------------------',
+             '',
+             'Vlan    Mac Address       Type        Ports',
+             '----    -----------       --------    -----']
+    for index in range(entries):
+        port = index % 48 + 1 if index % 100 >= changed else 48
+        lines.append(' {:>4}    0000.{:04x}.{:04x}    DYNAMIC     '
+                     'Gi1/0/{}'.format(index % 100 + 1, index // 65536,
+                                       index % 65536, port))
+    return '\n'.join(lines)
+
+
+def held(func):
+    '''Return the result of func and the memory it holds, in MB'''
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size / 2 ** 20
+
+
+def diff_dicts(old, new):
+    '''Return the changed keys of two dicts of dicts, as a script would'''
+    return [key for key in old.keys() | new.keys()
+            if old.get(key) != new.get(key)]
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--entries', type=int, default=100000)
+    args = argparser.parse_args()
+
+    print('{:25} {:>8} {:>10} {:>12} {:>10} {:>12}'.format(
+        'parser', 'entries', 'dict MB', 'columnar MB', 'diff ms',
+        'columnar ms'))
+    for cls, outputs, table, entries in [
+            (ShowIpNatTranslations, nat_translations, 'translations',
+             lambda parsed: parsed['vrf']['default']['index']),
+            (ShowMacAddressTable, mac_address_table, 'interfaces',
+             lambda parsed: {
+                 (vlan, mac): entry
+                 for vlan, vlan_dict in parsed['mac_table']['vlans'].items()
+                 for mac, entry in vlan_dict['mac_addresses'].items()})]:
+        parser = cls(device=Mock())
+        old, new = outputs(args.entries), outputs(args.entries, changed=1)
+
+        parsed, dict_size = held(lambda: parser.cli(output=old))
+        columnar, columnar_size = held(
+            lambda: parser.parse_columnar(output=old))
+
+        newer = parser.cli(output=new)
+        start = time.perf_counter()
+        diff_dicts(entries(parsed), entries(newer))
+        dict_time = (time.perf_counter() - start) * 1000
+
+        newer = parser.parse_columnar(output=new)
+        start = time.perf_counter()
+        columnar[table].diff(newer[table])
+        columnar_time = (time.perf_counter() - start) * 1000
+
+        print('{:25} {:>8} {:>10.1f} {:>12.1f} {:>10.1f} {:>12.1f}'.format(
+            cls.__name__, args.entries, dict_size, columnar_size, dict_time,
+            columnar_time))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+'''Memory benchmark of cli() against parse_compact() on huge route tables
+
+Parses the generated outputs of bench_parse_iter.py with cli() and with
+parse_compact(), and reports the time and the memory held by the parsed
+output (tracemalloc) of both.
+
+Usage:
+
+    python bench_compact_output.py [--prefixes N] [--no-validate]
+'''
+
+import sys
+import time
+import pathlib
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from bench_parse_iter import show_ip_route, show_ip_bgp_all
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAll
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+
+def measure(func):
+    '''Return the time taken by func and the memory held by its result'''
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, held / 2 ** 20
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--prefixes', type=int, default=50000)
+    argparser.add_argument('--no-validate', action='store_true',
+                           help='Do not validate the routes of '
+                                'parse_compact() against the schema')
+    args = argparser.parse_args()
+
+    print('{:30} {:>10} {:>10} {:>12} {:>12}'.format(
+        'parser', 'cli s', 'compact s', 'cli MB', 'compact MB'))
+    for cls, generate in ((ShowIpRoute, show_ip_route),
+                          (ShowIpBgpAll, show_ip_bgp_all)):
+        parser = cls(device=Mock())
+        output = '\n'.join(generate(args.prefixes))
+        cli_time, cli_held = measure(lambda: parser.cli(output=output))
+        compact_time, compact_held = measure(lambda: parser.parse_compact(
+            output, validate=not args.no_validate))
+        print('{:30} {:>10.2f} {:>10.2f} {:>12.2f} {:>12.2f}'.format(
+            cls.__name__, cli_time, compact_time, cli_held, compact_held))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+'''Benchmark of the command search used by get_parser() and device.parse()
+
+Compares, for every command of the registry, the results and the run time of
+the current _fuzzy_search_command (token trie + FuzzyMatcher) against a full
+scan of the registry with the recursive _matches_fuzzy_recursive matcher.
+
+Searches run for every command:
+
+    * the command with its arguments filled in         (fuzzy=False)
+    * the same search, regex escaped                   (fuzzy=True)
+    * a wildcard search: last keyword replaced by .*   (fuzzy=True)
+
+Usage:
+
+    python bench_fuzzy_search.py [--limit N] [--os iosxe]
+'''
+
+import re
+import sys
+import math
+import time
+import argparse
+
+from genie.libs.parser.utils.common import (
+    parser_data,
+    _fuzzy_search_command,
+    _matches_fuzzy_recursive
+)
+
+
+def reference_search(search, fuzzy, os=None):
+    '''Previous _fuzzy_search_command: full registry scan with the
+       recursive matcher'''
+    if search in parser_data:
+        return [(search, parser_data[search], {})]
+
+    if fuzzy:
+        search = search.lstrip('^').rstrip('$').replace(r'\ ', ' ').replace(
+            r'\-', '-').replace('\\"', '"').replace('\\,', ',').replace(
+            '\\\'', '\'').replace('\\*', '*').replace('\\:', ':').replace(
+            '\\^', '^').replace('\\/', '/')
+
+    search = ' '.join(filter(None, search.split()))
+    tokens = search.split()
+    best_score = -math.inf
+    result = []
+
+    for command, source in parser_data.items():
+        match_result = _matches_fuzzy_recursive(0, 0, tokens.copy(),
+                                                command, {}, fuzzy)
+        if not match_result or (os and os not in source):
+            continue
+
+        kwargs, score = match_result
+        entry = (command, source, kwargs)
+        if score > best_score:
+            result = [entry]
+            best_score = score
+        elif score == best_score:
+            result.append(entry)
+
+    if not fuzzy and len(result) > 1:
+        for instance in result:
+            if re.compile(re.sub('{.*?}', '(.*)', instance[0])).match(search):
+                return [instance]
+
+        if len(set(re.sub('{.*?}', '---', instance[0])
+                   for instance in result)) == 1:
+            return [result[0]]
+        raise Exception("Search for '{}' is ambiguous".format(search))
+
+    return result
+
+
+def run_search(function, search, fuzzy, os):
+    '''Return the (command, kwargs) found, or the exception name'''
+    try:
+        return [(command, kwargs)
+                for command, _, kwargs in function(search, fuzzy, os)]
+    except Exception as e:
+        return type(e).__name__
+
+
+def build_searches(commands):
+    for command in commands:
+        filled = re.sub('{.*?}', 'argument', command)
+        yield filled, False
+        yield re.escape(filled), True
+
+        tokens = filled.split()
+        if len(tokens) > 1:
+            yield ' '.join(tokens[:-1] + ['.*']), True
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--limit', type=int, default=None,
+                           help='Number of registry commands to use')
+    argparser.add_argument('--os', default=None,
+                           help='Limit the searches to one os')
+    args = argparser.parse_args()
+
+    commands = [c for c in parser_data.keys() if c != 'tokens']
+    if args.limit:
+        commands = commands[:args.limit]
+
+    reference_time = current_time = 0.0
+    mismatches = []
+    count = 0
+
+    fixed = 0
+
+    for search, fuzzy in build_searches(commands):
+        start = time.perf_counter()
+        expected = run_search(reference_search, search, fuzzy, args.os)
+        reference_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = run_search(_fuzzy_search_command, search, fuzzy, args.os)
+        current_time += time.perf_counter() - start
+
+        count += 1
+        if expected == 'IndexError':
+            # The recursive matcher crashed on a regex spanning past the end
+            # of a command, the new matcher treats it as not matching
+            fixed += 1
+        elif expected != found:
+            mismatches.append((search, fuzzy, expected, found))
+
+    print('Searches              : {}'.format(count))
+    print('Recursive full scan   : {:.3f}s ({:.3f}ms/search)'.format(
+        reference_time, reference_time / count * 1000))
+    print('Trie + FuzzyMatcher   : {:.3f}s ({:.3f}ms/search)'.format(
+        current_time, current_time / count * 1000))
+    print('Speedup               : {:.1f}x'.format(
+        reference_time / current_time if current_time else math.inf))
+    print('Recursive IndexError  : {}'.format(fixed))
+    print('Mismatches            : {}'.format(len(mismatches)))
+    for search, fuzzy, expected, found in mismatches[:20]:
+        print('  {!r} (fuzzy={}):\n    expected {}\n    found    {}'.format(
+            search, fuzzy, expected, found))
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
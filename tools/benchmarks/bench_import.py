@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+'''Benchmark of the import time of the parsers
+
+Each scenario runs in a new interpreter, as a short-lived worker would:
+reports the median time of its statement and the modules it imported.
+
+    * import of the package and of the get_parser() utilities
+    * import of the modules of some large parsers
+    * ExtendParsers walking the bigip package, without and with its cache
+
+Usage:
+
+    python bench_import.py [--repeat N] [--python PATH]
+'''
+
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+CHILD = '''
+import sys, json, time
+{setup}
+modules = len(sys.modules)
+start = time.perf_counter()
+{statement}
+print(json.dumps([(time.perf_counter() - start) * 1000,
+                  len(sys.modules) - modules]))
+'''
+
+EXTEND = ('from genie.libs.parser.utils.extension import ExtendParsers',
+          "ExtendParsers('genie.libs.parser.bigip').extend({})")
+
+SCENARIOS = [
+    ('import genie.libs.parser', '', 'import genie.libs.parser'),
+    ('import utils', 'import genie.libs.parser',
+     'import genie.libs.parser.utils'),
+    ('iosxe show_platform', 'import genie.libs.parser.utils',
+     'import genie.libs.parser.iosxe.show_platform'),
+    ('ios show_platform', 'import genie.libs.parser.utils',
+     'import genie.libs.parser.ios.show_platform'),
+    ('iosxe show_ospf', 'import genie.libs.parser.utils',
+     'import genie.libs.parser.iosxe.show_ospf'),
+    ('nxos show_bgp', 'import genie.libs.parser.utils',
+     'import genie.libs.parser.nxos.show_bgp'),
+    ('extend bigip', EXTEND[0], EXTEND[1].format('')),
+    ('extend bigip, cached', EXTEND[0],
+     EXTEND[1].format('cache=True, cache_dir={cache_dir!r}')),
+]
+
+
+def run(python, setup, statement):
+    '''Return the time and the modules of statement in a new interpreter'''
+    output = subprocess.check_output(
+        [python, '-c', CHILD.format(setup=setup, statement=statement)])
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--repeat', type=int, default=5)
+    argparser.add_argument('--python', default=sys.executable,
+                           help='Interpreter running the scenarios')
+    args = argparser.parse_args()
+
+    cache_dir = tempfile.mkdtemp()
+    print('{:25} {:>10} {:>8}'.format('scenario', 'ms', 'modules'))
+    for name, setup, statement in SCENARIOS:
+        statement = statement.format(cache_dir=cache_dir)
+        results = [run(args.python, setup, statement)
+                   for _ in range(args.repeat)]
+        print('{:25} {:>10.1f} {:>8}'.format(
+            name, statistics.median(time for time, _ in results),
+            results[-1][1]))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+'''Benchmark of the incremental parse of show interfaces
+
+Builds the output of a device with many subinterfaces, then changes the
+counters of a share of them, as between two polls. Reports the mean time of
+a full parse and of parse_incremental() from the previous poll, in ms.
+
+Usage:
+
+    python bench_incremental.py [--interfaces N] [--changed RATIO]
+                                [--repeat N]
+'''
+
+import sys
+import time
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+BLOCK = '''\
+GigabitEthernet0/0/0.{index} is up, line protocol is up
+  Hardware is BUILT-IN-EPA-8x1G, address is 0057.d2ff.{mac:04x} (bia 0057.d2ff.{mac:04x})
+  Description: customer {index}
+  Internet address is 10.{high}.{low}.1/30
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation 802.1Q Virtual LAN, Vlan ID  {index}.
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Keepalive not supported
+  Last clearing of "show interface" counters never
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  5 minute input rate {rate} bits/sec, 1 packets/sec
+  5 minute output rate {rate} bits/sec, 1 packets/sec
+     {packets} packets input, {octets} bytes, 0 no buffer
+     {packets} packets output, {octets} bytes, 0 underruns
+'''
+
+
+def build(interfaces, counters):
+    '''Return the output of show interfaces with counters[index] packets'''
+    return ''.join(BLOCK.format(index=index, mac=index, high=index // 256,
+                                low=index % 256, rate=counters[index] % 1000,
+                                packets=counters[index],
+                                octets=counters[index] * 100)
+                   for index in range(1, interfaces + 1))
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--interfaces', type=int, default=1000)
+    argparser.add_argument('--changed', type=float, default=0.05,
+                           help='Share of the interfaces whose counters change')
+    argparser.add_argument('--repeat', type=int, default=5)
+    args = argparser.parse_args()
+
+    random.seed(0)
+    counters = {index: random.randint(1, 10 ** 6)
+                for index in range(1, args.interfaces + 1)}
+    previous = build(args.interfaces, counters)
+    for index in random.sample(sorted(counters),
+                               int(args.interfaces * args.changed)):
+        counters[index] += random.randint(1, 100)
+    output = build(args.interfaces, counters)
+
+    parser = ShowInterfaces(device=Mock())
+    previous_parsed = parser.parse(output=previous)
+    full = timed(lambda: parser.parse(output=output), args.repeat)
+    incremental = timed(lambda: parser.parse_incremental(
+        previous, previous_parsed, output), args.repeat)
+    assert parser.parse_incremental(previous, previous_parsed, output) == \
+        parser.parse(output=output)
+
+    print('{:>10} {:>8} {:>10} {:>14}'.format(
+        'interfaces', 'changed', 'full ms', 'incremental ms'))
+    print('{:>10} {:>8.0%} {:>10.1f} {:>14.1f}'.format(
+        args.interfaces, args.changed, full, incremental))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
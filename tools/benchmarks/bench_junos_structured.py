@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+'''Benchmark of the json and xml contexts of the Junos parsers
+
+Parses the folder based golden outputs of the parsers with cli(), then
+rebuilds from each parsed output the output Junos prints with
+'| display json' and '| display xml', and maps these into the schema with
+json_to_schema() and xml_to_schema(). Reports the mean time of each, and
+the speedup of json over cli.
+
+With --scale N, every golden output is repeated N times to get closer to the
+size of a real device output.
+
+Usage:
+
+    python bench_junos_structured.py [--repeat N] [--scale N]
+                                     [<os>.<module>.<class> ...]
+
+    ex: python bench_junos_structured.py --scale 50 \\
+            junos.show_route.ShowRouteProtocolExtensive
+'''
+
+import sys
+import json
+import time
+import pathlib
+import argparse
+from unittest.mock import Mock
+
+import xmltodict
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from bench_parser_regex import load_parser
+from bench_line_dispatch import golden_cases
+
+from genie.libs.parser.utils.junos_structured import json_to_schema, \
+                                                    xml_to_schema
+
+DEFAULT_PARSERS = [
+    'junos.show_route.ShowRouteProtocolExtensive',
+    'junos.show_route.ShowRoute',
+    'junos.show_interface.ShowInterfacesExtensive',
+    'junos.show_ospf.ShowOspfDatabaseExtensive',
+    'junos.show_chassis.ShowChassisHardwareDetail',
+]
+
+
+def junos_json(value):
+    '''Return the '| display json' elements of a parsed value'''
+    if isinstance(value, list):
+        return [junos_json(item)[0] for item in value]
+    if value is None or value is True:
+        return [{'data': [None]}]
+    if not isinstance(value, dict):
+        return [{'data': value}]
+    element = {}
+    for key, child in value.items():
+        if key.startswith('@'):
+            element.setdefault('attributes', {})[key[1:]] = child
+        elif key == '#text':
+            element['data'] = child
+        else:
+            element[key] = junos_json(child)
+    return [element]
+
+
+def xml_value(value):
+    '''Return the xmltodict form of a parsed value, flags as empty elements'''
+    if value is True:
+        return None
+    if isinstance(value, dict):
+        return {key: xml_value(child) for key, child in value.items()}
+    if isinstance(value, list):
+        return [xml_value(item) for item in value]
+    return value
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                           help='Parsers to benchmark, <os>.<module>.<class>')
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--scale', type=int, default=1,
+                           help='Repeat each golden output N times')
+    args = argparser.parse_args()
+
+    print('{:50} {:>8} {:>10} {:>10} {:>10} {:>8}'.format(
+        'parser', 'outputs', 'cli ms', 'json ms', 'xml ms', 'speedup'))
+    for name in args.parsers:
+        cls, _ = load_parser(name)
+        cases = golden_cases(name, args.scale)
+        if not cases:
+            print('{:50} no golden output found'.format(name))
+            continue
+
+        parser = cls(device=Mock())
+        cli = json_time = xml_time = 0
+        for output, kwargs in cases:
+            cli += timed(lambda: parser.cli(output=output, **kwargs),
+                         args.repeat)
+            parsed = parser.cli(output=output, **kwargs)
+            top = {key: value for key, value in parsed.items()
+                   if not key.startswith('@')}
+            json_output = json.dumps(junos_json(top)[0])
+            xml_output = xmltodict.unparse({'rpc-reply': xml_value(parsed)})
+            json_time += timed(lambda: json_to_schema(cls.schema,
+                                                      json_output),
+                               args.repeat)
+            xml_time += timed(lambda: xml_to_schema(cls.schema, xml_output),
+                              args.repeat)
+
+        count = len(cases)
+        print('{:50} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>7.1f}x'.format(
+            name, count, cli / count, json_time / count, xml_time / count,
+            cli / json_time))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
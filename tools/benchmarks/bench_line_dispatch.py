@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+'''Benchmark of the parsers using genie.libs.parser.utils.dispatch
+
+Parses the folder based golden outputs of the parsers with the literal
+prefilter of LineDispatcher enabled, then disabled (every pattern tried on
+every line, in order, like the former if/continue chains) and reports both
+parse times.
+
+With --scale N, every golden output is repeated N times to get closer to the
+size of a real device output.
+
+Usage:
+
+    python bench_line_dispatch.py [--repeat N] [--scale N]
+                                  [<os>.<module>.<class> ...]
+
+    ex: python bench_line_dispatch.py --scale 50 iosxe.show_interface.ShowInterfaces
+'''
+
+import sys
+import json
+import time
+import pathlib
+import argparse
+from unittest.mock import Mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from bench_parser_regex import PARSER_ROOT, load_parser
+
+from genie.libs.parser.utils.dispatch import LineDispatcher
+
+DEFAULT_PARSERS = [
+    'iosxe.show_interface.ShowInterfaces',
+    'iosxe.show_routing.ShowIpRoute',
+    'iosxe.show_bgp.ShowIpBgpAll',
+    'iosxe.show_ospf.ShowIpOspfDatabaseRouter',
+]
+
+
+def golden_cases(name, scale):
+    '''Return the (output, arguments) of the golden outputs of a parser'''
+    os_name, _, class_name = name.split('.')
+    folder = PARSER_ROOT / os_name / 'tests' / class_name / 'cli' / 'equal'
+    cases = []
+    for output in sorted(folder.glob('*_output.txt')):
+        arguments = output.with_name(
+            output.name.replace('_output.txt', '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) if arguments.exists() \
+            else {}
+        cases.append((output.read_text() * scale, kwargs))
+    return cases
+
+
+def bench(cls, cases, repeat, prefilter):
+    '''Return the mean time of one parse of every output, in ms'''
+    parser = cls(device=Mock())
+    LineDispatcher.prefilter = prefilter
+    total = 0
+    try:
+        for _ in range(repeat):
+            for output, kwargs in cases:
+                start = time.perf_counter()
+                parser.cli(output=output, **kwargs)
+                total += time.perf_counter() - start
+    finally:
+        LineDispatcher.prefilter = True
+    return total * 1000 / (repeat * len(cases))
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                           help='Parsers to benchmark, <os>.<module>.<class>')
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--scale', type=int, default=1,
+                           help='Repeat each golden output N times')
+    args = argparser.parse_args()
+
+    print('{:50} {:>8} {:>12} {:>12} {:>8}'.format(
+        'parser', 'outputs', 'ms/parse', 'no prefilter', 'speedup'))
+    for name in args.parsers:
+        cls, _ = load_parser(name)
+        cases = golden_cases(name, args.scale)
+        if not cases:
+            print('{:50} no golden output found'.format(name))
+            continue
+        fast = bench(cls, cases, args.repeat, prefilter=True)
+        slow = bench(cls, cases, args.repeat, prefilter=False)
+        print('{:50} {:>8} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(
+            name, len(cases), fast, slow, slow / fast))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+'''Benchmark of the json context of the NX-OS parsers
+
+The NX-OS parsers have no folder based golden outputs: builds the text
+output and the '| json' output of N entries for some parsers, parses the
+text with cli() and maps the json with json_to_schema(). Reports the mean
+time of each, and the speedup of json over cli.
+
+Usage:
+
+    python bench_nxos_structured.py [--repeat N] [--entries N]
+'''
+
+import sys
+import json
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.nxos_structured import json_to_schema
+from genie.libs.parser.nxos.show_vxlan import ShowNvePeers
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.show_routing import ShowIpRoute
+
+
+def table(name, rows):
+    return {'TABLE_' + name: {'ROW_' + name: rows}}
+
+
+def ip(index):
+    return '10.{}.{}.{}'.format(index // 65536 % 256, index // 256 % 256,
+                                index % 256)
+
+
+def mac(index):
+    return '0000.{:04x}.{:04x}'.format(index // 65536, index % 65536)
+
+
+def nve_peers(entries):
+    '''Return the text and json outputs of 'show nve peers' '''
+    lines = ['Interface Peer-IP          State LearnType Uptime   Router-Mac',
+             '--------- ---------------  ----- --------- -------- ----------']
+    rows = []
+    for index in range(entries):
+        lines.append('nve1      {:16} Up    CP        01:15:09 {}'.format(
+            ip(index), mac(index)))
+        rows.append({'if-name': 'nve1', 'peer-ip': ip(index),
+                     'peer-state': 'Up', 'learn-type': 'CP',
+                     'uptime': '01:15:09', 'router-mac': mac(index)})
+    return '\n'.join(lines), json.dumps(table('nve_peers', rows))
+
+
+def mac_address_table(entries):
+    '''Return the text and json outputs of 'show mac address-table' '''
+    lines = []
+    rows = []
+    for index in range(entries):
+        vlan = str(index % 100 + 1)
+        port = 'Eth1/{}'.format(index % 48 + 1)
+        lines.append('*  {:>4}     {}   dynamic  0         F      F    '
+                     '{}'.format(vlan, mac(index), port))
+        rows.append({'disp_mac_addr': mac(index), 'disp_type': '* ',
+                     'disp_vlan': vlan, 'disp_is_static': 'disabled',
+                     'disp_age': '0', 'disp_is_secure': 'disabled',
+                     'disp_is_ntfy': 'disabled',
+                     'disp_port': 'Ethernet1/{}'.format(index % 48 + 1)})
+    return '\n'.join(lines), json.dumps(table('mac_address', rows))
+
+
+def ip_route(entries):
+    '''Return the text and json outputs of 'show ip route' '''
+    lines = ['IP Route Table for VRF "default"']
+    prefixes = []
+    for index in range(entries):
+        prefix = ip(index) + '/32'
+        lines.extend([
+            '{}, ubest/mbest: 1/0'.format(prefix),
+            '    *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra'])
+        prefixes.append(dict(
+            {'ipprefix': prefix, 'ucast-nhops': '1', 'mcast-nhops': '0',
+             'attached': 'false'},
+            **table('path', [{'ipnexthop': '10.1.3.1', 'ifname': 'Eth1/2',
+                              'uptime': 'PT1H1M18S', 'pref': '110',
+                              'metric': '41', 'clientname': 'ospf-1',
+                              'type': 'intra', 'ubest': 'true'}])))
+    output = table('vrf', [dict(
+        {'vrf-name-out': 'default'},
+        **table('addrf', [dict({'addrf': 'ipv4'},
+                               **table('prefix', prefixes))]))])
+    return '\n'.join(lines), json.dumps(output)
+
+
+PARSERS = [
+    (ShowNvePeers, nve_peers),
+    (ShowMacAddressTable, mac_address_table),
+    (ShowIpRoute, ip_route),
+]
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--entries', type=int, default=1000,
+                           help='Entries of each output')
+    args = argparser.parse_args()
+
+    print('{:25} {:>8} {:>10} {:>10} {:>8}'.format(
+        'parser', 'entries', 'cli ms', 'json ms', 'speedup'))
+    for cls, outputs in PARSERS:
+        cli_output, json_output = outputs(args.entries)
+        parser = cls(device=Mock())
+        cli = timed(lambda: parser.cli(output=cli_output), args.repeat)
+        json_time = timed(lambda: json_to_schema(cls.json_mapping,
+                                                 json_output), args.repeat)
+        print('{:25} {:>8} {:>10.3f} {:>10.3f} {:>7.1f}x'.format(
+            cls.__name__, args.entries, cli, json_time, cli / json_time))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
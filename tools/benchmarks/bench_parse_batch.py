@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+'''Benchmark of parse_batch() against parsing the outputs one by one
+
+Builds a batch of (os, platform, command, output) items from the folder
+based golden outputs of the parsers, each repeated --copies times like the
+same command collected on many devices, then parses the batch:
+
+    * one by one in this process, get_parser() and parse() for each item
+    * with parse_batch(), for each number of workers of --workers
+
+Usage:
+
+    python bench_parse_batch.py [--copies N] [--workers N [N ...]]
+                                [<os>.<module>.<class> ...]
+'''
+
+import sys
+import time
+import pathlib
+import argparse
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from bench_parser_regex import load_parser
+from bench_line_dispatch import golden_cases
+
+from genie.libs.parser.utils import get_parser
+from genie.libs.parser.utils.batch import parse_batch, BatchDevice
+
+DEFAULT_PARSERS = [
+    'iosxe.show_interface.ShowInterfaces',
+    'iosxe.show_bgp.ShowIpBgpAll',
+    'nxos.show_interface.ShowInterface',
+    'junos.show_route.ShowRoute',
+]
+
+
+def batch_items(names, copies):
+    '''Return the (os, platform, command, output) items of the parsers'''
+    items = []
+    for name in names:
+        cls, _ = load_parser(name)
+        commands = getattr(cls, 'cli_command', [])
+        if not isinstance(commands, list):
+            commands = [commands]
+        # golden outputs of the command without arguments only
+        command = next((c for c in commands if '{' not in c), None)
+        if command is None:
+            print('{}: no command without arguments, skipped'.format(name))
+            continue
+        for output, kwargs in golden_cases(name, 1):
+            if not kwargs:
+                items.append((name.split('.')[0], None, command, output))
+    return items * copies
+
+
+def one_by_one(items):
+    results = []
+    for os, platform, command, output in items:
+        device = BatchDevice(os, platform)
+        parser_cls, kwargs = get_parser(command, device)
+        try:
+            results.append(parser_cls(device=device).parse(output=output,
+                                                           **kwargs))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                           help='Parsers to benchmark, <os>.<module>.<class>')
+    argparser.add_argument('--copies', type=int, default=200)
+    argparser.add_argument('--workers', type=int, nargs='+',
+                           default=[1, 2, 4, 8])
+    argparser.add_argument('--chunksize', type=int, default=32)
+    args = argparser.parse_args()
+
+    items = batch_items(args.parsers, args.copies)
+    print('{} items'.format(len(items)))
+
+    start = time.perf_counter()
+    one_by_one(items)
+    sequential = time.perf_counter() - start
+    print('{:20} {:>10.2f} s'.format('one by one', sequential))
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = parse_batch(items, max_workers=workers,
+                              chunksize=args.chunksize)
+        elapsed = time.perf_counter() - start
+        errors = sum(1 for result in results if result.error is not None)
+        print('{:20} {:>10.2f} s {:>7.2f}x {:>6} errors'.format(
+            'parse_batch({})'.format(workers), elapsed,
+            sequential / elapsed, errors))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
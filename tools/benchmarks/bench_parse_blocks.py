@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+'''Benchmark of the parse of show interfaces by chunks of blocks
+
+Builds the output of an aggregation router with many subinterfaces, then
+parses it whole and with parse_blocks() in pools of processes of several
+sizes. Reports the mean time of each, in ms, the pool start included.
+
+Usage:
+
+    python bench_parse_blocks.py [--interfaces N] [--workers N [N ...]]
+                                 [--repeat N]
+'''
+
+import sys
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+from bench_incremental import build
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--interfaces', type=int, default=8000)
+    argparser.add_argument('--workers', type=int, nargs='+',
+                           default=[2, 4, 8])
+    argparser.add_argument('--repeat', type=int, default=3)
+    args = argparser.parse_args()
+
+    output = build(args.interfaces, {index: index * 1000 for index in
+                                     range(1, args.interfaces + 1)})
+    parser = ShowInterfaces(device=Mock(os='iosxe'))
+    parsed = parser.parse(output=output)
+
+    print('{:>10} {:>8} {:>10}'.format('interfaces', 'workers', 'ms'))
+    print('{:>10} {:>8} {:>10.1f}'.format(
+        args.interfaces, 'parse', timed(lambda: parser.parse(output=output),
+                                        args.repeat)))
+    for workers in args.workers:
+        assert parser.parse_blocks(output, max_workers=workers) == parsed
+        print('{:>10} {:>8} {:>10.1f}'.format(
+            args.interfaces, workers, timed(
+                lambda: parser.parse_blocks(output, max_workers=workers),
+                args.repeat)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+'''Memory benchmark of cli() against parse_iter() on huge route tables
+
+Generates a "show ip route" and a "show ip bgp all" output with N prefixes,
+then parses each with cli(), which returns the whole parsed dictionary, and
+with parse_iter(), consuming the routes one by one. Reports the time and the
+peak memory allocated (tracemalloc) of both.
+
+Usage:
+
+    python bench_parse_iter.py [--prefixes N]
+'''
+
+import sys
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAll
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+
+def prefixes(count):
+    for index in range(count):
+        yield '10.{}.{}.0/24'.format(index // 256 % 256, index % 256)
+
+
+def show_ip_route(count):
+    yield 'Routing Table: VRF1'
+    yield '      10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks'
+    for prefix in prefixes(count):
+        yield 'O        {} [110/2] via 10.1.2.2, 06:46:59, ' \
+              'GigabitEthernet0/0'.format(prefix)
+        yield '                   [110/2] via 10.1.3.2, 06:46:59, ' \
+              'GigabitEthernet0/1'
+
+
+def show_ip_bgp_all(count):
+    yield 'For address family: IPv4 Unicast'
+    yield 'BGP table version is 25, Local Router ID is 10.186.101.1'
+    yield '     Network          Next Hop            Metric LocPrf Weight Path'
+    for prefix in prefixes(count):
+        yield ' *>i {:<16} 10.4.1.1               2219    100      0 200 ' \
+              '33299 51178 47751 {{27016}} e'.format(prefix)
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--prefixes', type=int, default=50000)
+    args = argparser.parse_args()
+
+    print('{:30} {:>10} {:>10} {:>12} {:>12}'.format(
+        'parser', 'cli s', 'iter s', 'cli MB', 'iter MB'))
+    for cls, generate in ((ShowIpRoute, show_ip_route),
+                          (ShowIpBgpAll, show_ip_bgp_all)):
+        parser = cls(device=Mock())
+        output = '\n'.join(generate(args.prefixes))
+        cli_time, cli_peak = measure(lambda: parser.cli(output=output))
+        del output
+
+        def consume():
+            for _ in parser.parse_iter(generate(args.prefixes)):
+                pass
+
+        iter_time, iter_peak = measure(consume)
+        print('{:30} {:>10.2f} {:>10.2f} {:>12.2f} {:>12.2f}'.format(
+            cls.__name__, cli_time, iter_time, cli_peak, iter_peak))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+'''Micro benchmark of parsers regular expression handling
+
+Parses the folder based golden outputs of a few parsers and reports, for
+each of them, the parse time and the number of static re.compile() still
+made inside the loops of the parser class (see tools/regex_lint.py).
+
+With --cold, re.purge() is called before every parse. This is what happens
+on a real run: the thousands of patterns of the package keep evicting each
+other from the 512 entries cache of the re module, so every re.compile()
+inside a loop compiles its pattern again.
+
+Usage:
+
+    python bench_parser_regex.py [--cold] [--repeat N] [--fail-on-loop]
+                                 [<os>.<module>.<class> ...]
+
+    ex: python bench_parser_regex.py --cold iosxe.show_interface.ShowInterfacesSwitchport
+'''
+
+import re
+import ast
+import sys
+import time
+import pathlib
+import argparse
+import importlib
+from unittest.mock import Mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from regex_lint import find_compiles_in_loops
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2] / \
+    'src' / 'genie' / 'libs' / 'parser'
+
+DEFAULT_PARSERS = [
+    'iosxe.show_interface.ShowInterfacesSwitchport',
+    'iosxe.show_interface.ShowInterfaces',
+    'iosxe.show_routing.ShowIpRoute',
+    'nxos.show_interface.ShowInterface',
+    'iosxr.show_interface.ShowInterfacesDetail',
+    'junos.show_interface.ShowInterfacesExtensive',
+]
+
+
+def load_parser(name):
+    '''Return (parser class, module file) for "<os>.<module>.<class>"'''
+    os_name, module_name, class_name = name.split('.')
+    module = importlib.import_module(
+        'genie.libs.parser.{}.{}'.format(os_name, module_name))
+    return getattr(module, class_name), pathlib.Path(module.__file__)
+
+
+def compiles_in_loops(cls, path):
+    '''Number of static re.compile() inside the loops of the class methods'''
+    tree = ast.parse(path.read_text())
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == cls.__name__:
+            start, end = node.lineno, node.end_lineno
+            break
+    else:
+        return 0
+    return sum(1 for line, _, static in find_compiles_in_loops(path)
+               if static and start <= line <= end)
+
+
+def golden_outputs(name):
+    os_name, _, class_name = name.split('.')
+    folder = PARSER_ROOT / os_name / 'tests' / class_name / 'cli' / 'equal'
+    return [f.read_text() for f in sorted(folder.glob('*_output.txt'))]
+
+
+def bench(cls, outputs, repeat, cold):
+    '''Return the mean time of one parse of every output, in ms'''
+    parser = cls(device=Mock())
+    total = 0
+    for _ in range(repeat):
+        for output in outputs:
+            if cold:
+                re.purge()
+            start = time.perf_counter()
+            parser.cli(output=output)
+            total += time.perf_counter() - start
+    return total * 1000 / (repeat * len(outputs))
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                           help='Parsers to benchmark, <os>.<module>.<class>')
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--cold', action='store_true',
+                           help='Empty the re module cache before each parse')
+    argparser.add_argument('--fail-on-loop', action='store_true',
+                           help='Exit with 1 when a parser still compiles a '
+                                'static pattern inside a loop')
+    args = argparser.parse_args()
+
+    failed = False
+    print('{:60} {:>8} {:>10} {:>6}'.format('parser', 'outputs', 'ms/parse',
+                                            'loops'))
+    for name in args.parsers:
+        cls, path = load_parser(name)
+        outputs = golden_outputs(name)
+        if not outputs:
+            print('{:60} no golden output found'.format(name))
+            continue
+        in_loops = compiles_in_loops(cls, path)
+        failed |= bool(in_loops)
+        print('{:60} {:>8} {:>10.3f} {:>6}'.format(
+            name, len(outputs), bench(cls, outputs, args.repeat, args.cold),
+            in_loops))
+
+    return 1 if failed and args.fail_on_loop else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
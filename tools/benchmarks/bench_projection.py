@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+'''Benchmark of the parses projected to a few fields
+
+Builds an output of --entries interfaces or neighbors for each parser
+supporting the fields, then parses it in full and with the fields of each
+case. The projected parse is checked against the full one pruned to its
+fields. Reports the mean time of each, in ms, and the speedup.
+
+Usage:
+
+    python bench_projection.py [--entries N] [--repeat N]
+'''
+
+import sys
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllNeighbors
+from genie.libs.parser.utils.projection import project
+
+INTERFACE = '''\
+GigabitEthernet{index} is up, line protocol is up
+  Hardware is CSR vNIC, address is 5e00.00ff.{index:04x} (bia 5e00.00ff.{index:04x})
+  Internet address is 10.{high}.{low}.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+  Full Duplex, 1000Mbps, link type is auto, media type is Virtual
+  output flow-control is unsupported, input flow-control is unsupported
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input 00:00:02, output 00:00:25, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 32000 bits/sec, 28 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     7658 packets input, 1125842 bytes, 0 no buffer
+     Received 0 broadcasts (0 IP multicasts)
+     0 runts, 0 giants, 0 throttles
+     {index} input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 0 multicast, 0 pause input
+     44 packets output, 4324 bytes, 0 underruns
+     0 output errors, 0 collisions, 1 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+'''
+
+NEIGHBOR = '''\
+BGP neighbor is 10.{high}.{low}.2,  remote AS 100, ibgp link,  Peer index {index}
+  Description: nei_desc
+  BGP version 4, remote router ID 10.{high}.{low}.2
+  BGP state = Established, up for 02:20:02
+  Using loopback0 as update source for this peer
+  Last read 00:00:15, hold time = 99, keepalive interval is 33 seconds
+  Last written 00:00:13, keepalive timer expiry due 00:00:19
+  Received 261 messages, 0 notifications, 0 bytes in queue
+  Sent 263 messages, 0 notifications, 0 bytes in queue
+  Connections established 1, dropped 0
+  Last reset by us never, due to No error
+
+  Neighbor capabilities:
+  Dynamic capability: advertised (mp, refresh, gr) received (mp, refresh, gr)
+  Route refresh capability (new): advertised received
+  Address family VPNv4 Unicast: advertised received
+  Graceful Restart capability: advertised received
+
+  Graceful Restart Parameters:
+  Restart time advertised to peer: 240 seconds
+  Stale time for routes advertised by peer: 600 seconds
+
+  Message statistics:
+                              Sent               Rcvd
+  Opens:                         1                  1
+  Updates:                       6                  4
+  Keepalives:                  256                256
+  Total:                       263                261
+
+  For address family: VPNv4 Unicast
+  BGP table version 11, neighbor version 11
+  1 accepted paths consume 48 bytes of memory
+  2 sent paths
+  Community attribute sent to this neighbor
+  Extended community attribute sent to this neighbor
+  Maximum prefixes allowed 300000
+  Inbound route-map configured is genie_redistribution, handle obtained
+
+  Local host: 10.4.1.1, Local port: 57144
+  Foreign host: 10.{high}.{low}.2, Foreign port: 179
+  fd = 44
+'''
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def build(template, entries):
+    return ''.join(template.format(index=index + 1,
+                                   high=(index + 1) // 256 % 256,
+                                   low=(index + 1) % 256)
+                   for index in range(entries))
+
+
+CASES = [('show interfaces', ShowInterfaces, INTERFACE,
+          [['oper_status', 'in_errors'], ['mtu'],
+           [('GigabitEthernet1', 'oper_status')]]),
+         ('show bgp vrf all all neighbors', ShowBgpVrfAllNeighbors, NEIGHBOR,
+          [['session_state'], ['send_community'], ['bgp_neighbor_counters']])]
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--entries', type=int, default=2000)
+    argparser.add_argument('--repeat', type=int, default=5)
+    args = argparser.parse_args()
+
+    print('{:<32} {:<40} {:>10} {:>8}'.format(
+        'command', 'fields', 'ms', 'speedup'))
+    for name, parser_cls, template, fields_list in CASES:
+        output = build(template, args.entries)
+        parser = parser_cls(device=Mock())
+        full = parser.cli(output=output)
+        full_ms = timed(lambda: parser.cli(output=output), args.repeat)
+        print('{:<32} {:<40} {:>10.1f} {:>8}'.format(
+            name, '(all)', full_ms, ''))
+
+        for fields in fields_list:
+            # The same result as the full parse pruned to the fields
+            expected = project(parser, fields).prune(full)
+            assert parser.cli(output=output, fields=fields) == expected, \
+                (name, fields)
+            ms = timed(lambda: parser.cli(output=output, fields=fields),
+                       args.repeat)
+            print('{:<32} {:<40} {:>10.1f} {:>7.1f}x'.format(
+                name, str(fields), ms, full_ms / ms))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
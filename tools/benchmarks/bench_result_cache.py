@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+'''Benchmark of the cache of the parsed outputs
+
+Parses the golden outputs of the polled parsers: without cache, on a hit of
+the memory cache, and on a hit of the sqlite cache from a new ResultCache,
+as another process would. Reports the mean time of each, in ms.
+
+Usage:
+
+    python bench_result_cache.py [--repeat N]
+'''
+
+import os
+import sys
+import time
+import shutil
+import pathlib
+import argparse
+import tempfile
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.result_cache import ResultCache
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_ospf import ShowIpOspfNeighbor
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllSummary
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2] / 'src' / \
+    'genie' / 'libs' / 'parser'
+
+PARSERS = [ShowInterfaces, ShowIpOspfNeighbor, ShowBgpAllSummary]
+
+
+def largest_output(cls):
+    '''Return the largest golden output of a parser which parses'''
+    folder = PARSER_ROOT / 'iosxe' / 'tests' / cls.__name__ / 'cli' / 'equal'
+    outputs = sorted((path.read_text() for path in
+                      folder.glob('*_output.txt')), key=len, reverse=True)
+    for output in outputs:
+        try:
+            cls(device=Mock()).parse(output=output)
+            return output
+        except Exception:
+            continue
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--repeat', type=int, default=100)
+    args = argparser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, 'results.db')
+    print('{:20} {:>8} {:>10} {:>10} {:>10}'.format(
+        'parser', 'lines', 'parse ms', 'memory ms', 'sqlite ms'))
+    try:
+        for cls in PARSERS:
+            output = largest_output(cls)
+            device = Mock()
+            parse = timed(lambda: cls(device=device).parse(output=output),
+                          args.repeat)
+
+            cache = ResultCache(path=path)
+            cache.parse(cls, output, device=device)
+            memory = timed(lambda: cache.parse(cls, output, device=device),
+                           args.repeat)
+
+            def disk():
+                ResultCache(path=path).parse(cls, output, device=device)
+            sqlite = timed(disk, args.repeat)
+
+            print('{:20} {:>8} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+                cls.__name__, len(output.splitlines()), parse, memory,
+                sqlite))
+    finally:
+        shutil.rmtree(tmp)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
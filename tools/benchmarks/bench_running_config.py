@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+'''Benchmark of the running configuration index
+
+Builds the show vrf and show running-config outputs of a PE with many
+VRFs, then parses show running-config vrf with one filtered command per VRF,
+as before, and from the index of a single show running-config. Each command
+costs --latency seconds, as a round trip to the device. Reports the commands
+executed and the mean time of each, in ms.
+
+Usage:
+
+    python bench_running_config.py [--vrfs N] [--latency S] [--repeat N]
+'''
+
+import sys
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.nxos.show_vrf import ShowRunningConfigVrf
+
+VRF = '''\
+vrf context VRF{index}
+  vni {vni}
+  rd auto
+  address-family ipv4 unicast
+    route-target both auto
+    route-target both auto evpn
+'''
+
+INTERFACE = '''\
+interface Vlan{index}
+  vrf member VRF{index}
+  ip address 10.{high}.{low}.1/24
+'''
+
+
+def outputs(vrfs):
+    '''Return the outputs of the commands of a PE with vrfs VRFs'''
+    indexes = range(1, vrfs + 1)
+    show_vrf = 'VRF-Name                           VRF-ID State   Reason\n' + \
+        ''.join('VRF{i:<33} {i:>5} Up      --\n'.format(i=index)
+                for index in indexes)
+    blocks = {index: VRF.format(index=index, vni=10000 + index)
+              for index in indexes}
+    config = ''.join(blocks.values()) + ''.join(
+        INTERFACE.format(index=index, high=index // 256, low=index % 256)
+        for index in indexes)
+    commands = {"show running-config vrf VRF{} | sec '^vrf'".format(index):
+                block for index, block in blocks.items()}
+    commands['show vrf'] = show_vrf
+    return commands, config
+
+
+def device(commands, latency):
+    '''Return a device executing commands, each in latency seconds'''
+
+    def execute(command):
+        time.sleep(latency)
+        return commands[command]
+
+    return Mock(execute=Mock(side_effect=execute))
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--vrfs', type=int, default=2000)
+    argparser.add_argument('--latency', type=float, default=0.001,
+                           help='Seconds of each command')
+    argparser.add_argument('--repeat', type=int, default=3)
+    args = argparser.parse_args()
+
+    commands, config = outputs(args.vrfs)
+    # Without show running-config, the parser executes one command per vrf
+    per_vrf = device(commands, args.latency)
+    indexed = device(dict(commands, **{'show running-config': config}),
+                     args.latency)
+
+    parsed = ShowRunningConfigVrf(device=per_vrf).parse()
+    assert ShowRunningConfigVrf(device=indexed).parse() == parsed
+    print('{:>6} {:>10} {:>10} {:>10}'.format('vrfs', 'mode', 'commands',
+                                              'ms'))
+    for mode, dev in [('per vrf', per_vrf), ('index', indexed)]:
+        dev.execute.reset_mock()
+        ms = timed(lambda: ShowRunningConfigVrf(device=dev).parse(),
+                   args.repeat)
+        print('{:>6} {:>10} {:>10} {:>10.1f}'.format(
+            args.vrfs, mode, dev.execute.call_count // args.repeat, ms))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+'''Benchmark of the schema validation of the Junos parsers
+
+Parses the folder based golden outputs of the parsers, then validates the
+parsed outputs against the parser schema, validating every item of the
+lists, a sample of them (list_validation(sample=N)) and none of them
+(list_validation(skip=True)). Reports the parse time and the three
+validation times.
+
+With --scale N, every golden output is repeated N times to get closer to the
+size of a real device output.
+
+Usage:
+
+    python bench_schema_validation.py [--repeat N] [--scale N] [--sample N]
+                                      [<os>.<module>.<class> ...]
+
+    ex: python bench_schema_validation.py --scale 50 junos.show_route.ShowRoute
+'''
+
+import sys
+import time
+import pathlib
+import argparse
+from unittest.mock import Mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from bench_parser_regex import load_parser
+from bench_line_dispatch import golden_cases
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema
+from genie.libs.parser.utils.validation import list_validation
+
+DEFAULT_PARSERS = [
+    'junos.show_route.ShowRoute',
+    'junos.show_route.ShowRouteProtocolExtensive',
+    'junos.show_interface.ShowInterfaces',
+    'junos.show_ospf.ShowOspfDatabaseExtensive',
+    'junos.show_chassis.ShowChassisHardwareDetail',
+]
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('parsers', nargs='*', default=DEFAULT_PARSERS,
+                           help='Parsers to benchmark, <os>.<module>.<class>')
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--scale', type=int, default=1,
+                           help='Repeat each golden output N times')
+    argparser.add_argument('--sample', type=int, default=10,
+                           help='Items validated per list in sample mode')
+    args = argparser.parse_args()
+
+    print('{:50} {:>8} {:>10} {:>10} {:>10} {:>10}'.format(
+        'parser', 'outputs', 'parse ms', 'full ms', 'sample ms', 'skip ms'))
+    for name in args.parsers:
+        cls, _ = load_parser(name)
+        cases = golden_cases(name, args.scale)
+        if not cases:
+            print('{:50} no golden output found'.format(name))
+            continue
+
+        parser = cls(device=Mock())
+        parsed = []
+        parse = 0
+        for output, kwargs in cases:
+            parse += timed(lambda: parser.cli(output=output, **kwargs),
+                           args.repeat)
+            parsed.append(parser.cli(output=output, **kwargs))
+
+        def validate():
+            for output in parsed:
+                Schema(cls.schema).validate(output)
+
+        try:
+            validate()
+        except SchemaError as e:
+            print('{:50} schema error: {}'.format(name, e))
+            continue
+
+        full = timed(validate, args.repeat)
+        with list_validation(sample=args.sample):
+            sample = timed(validate, args.repeat)
+        with list_validation(skip=True):
+            skip = timed(validate, args.repeat)
+
+        count = len(cases)
+        print('{:50} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+            name, count, parse / count, full / count, sample / count,
+            skip / count))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+'''Benchmark of the parser telemetry
+
+Parses the golden outputs of some large parsers with the telemetry off, then
+with each of its measures, and reports the mean time of each, in ms. Off,
+parse() is not wrapped at all.
+
+The patterns compiled at the import of the parsers are only counted when
+the telemetry is enabled before, run with GENIE_LIBS_PARSER_TELEMETRY=regex
+to count them:
+
+    python bench_telemetry.py [--repeat N] [--top N]
+'''
+
+import sys
+import time
+import pathlib
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import telemetry
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllSummary
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parents[2] / 'src' / \
+    'genie' / 'libs' / 'parser'
+
+PARSERS = [ShowInterfaces, ShowIpRoute, ShowBgpAllSummary]
+
+SCENARIOS = [('off', None), ('time', ['time']), ('regex', ['regex']),
+             ('memory', ['memory'])]
+
+
+def outputs(cls):
+    '''Return the golden outputs of a parser which parse'''
+    folder = PARSER_ROOT / 'iosxe' / 'tests' / cls.__name__ / 'cli' / 'equal'
+    parsed = []
+    for path in sorted(folder.glob('*_output.txt')):
+        output = path.read_text()
+        try:
+            cls(device=Mock()).parse(output=output)
+        except Exception:
+            continue
+        parsed.append(output)
+    return parsed
+
+
+def timed(func, repeat):
+    '''Return the mean time of func, in ms'''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--repeat', type=int, default=20)
+    argparser.add_argument('--top', type=int, default=5,
+                           help='Number of the costliest patterns to list')
+    args = argparser.parse_args()
+
+    enabled = telemetry.get_telemetry()
+    measures = enabled.measures if enabled is not None else None
+    device = Mock(os='iosxe')
+    print('{:20} {:>8} {:>10} {:>10} {:>10} {:>10}'.format(
+        'parser', 'outputs', *[name + ' ms' for name, _ in SCENARIOS]))
+    for cls in PARSERS:
+        texts = outputs(cls)
+
+        def parse():
+            for output in texts:
+                cls(device=device).parse(output=output)
+
+        times = []
+        for _, scenario in SCENARIOS:
+            if scenario is None:
+                telemetry.disable()
+            else:
+                telemetry.enable(scenario)
+            times.append(timed(parse, args.repeat))
+        print('{:20} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+            cls.__name__, len(texts), *times))
+
+    telemetry.enable(['regex'])
+    for cls in PARSERS:
+        for output in outputs(cls):
+            cls(device=device).parse(output=output)
+    patterns = sorted(telemetry.counters()['patterns'].items(),
+                      key=lambda item: item[1]['seconds'], reverse=True)
+    print('\n{:>10} {:>8} {:>8}  pattern'.format('ms', 'tries', 'matches'))
+    for (parser, pattern), counts in patterns[:args.top]:
+        print('{:>10.3f} {:>8} {:>8}  {}: {}'.format(
+            counts['seconds'] * 1000, counts['attempts'], counts['matches'],
+            parser.rsplit('.', 1)[-1], pattern[:60]))
+
+    if measures is None:
+        telemetry.disable()
+    else:
+        telemetry.enable(measures)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
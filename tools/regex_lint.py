@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+'''Flag parsers compiling regular expressions inside their per-line loops
+
+Parsers must compile their patterns once, before looping over the output
+lines. A re.compile() inside a for/while loop runs once per line and, with
+the thousands of patterns of the package, keeps evicting entries from the
+512 entries cache of the re module.
+
+Each re.compile() found inside a loop is reported as:
+
+    * static:  the pattern is a literal, it must be moved before the loop
+    * dynamic: the pattern depends on values computed in the loop, it is
+               reported for information only
+
+Usage:
+
+    python regex_lint.py [--all] [--baseline <file>] <path> [<path> ...]
+
+Exits with 1 when a static pattern is compiled inside a loop. With
+--baseline, only the files having more static patterns in loops than
+recorded in the baseline file fail the check; --write-baseline records the
+current counts.
+'''
+
+import ast
+import sys
+import json
+import pathlib
+import argparse
+
+LOOPS = (ast.For, ast.AsyncFor, ast.While)
+SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+IGNORE_DIR = ['tests', 'template', '__pycache__']
+
+
+def _is_re_compile(node):
+    return isinstance(node, ast.Call) \
+        and isinstance(node.func, ast.Attribute) \
+        and node.func.attr == 'compile' \
+        and isinstance(node.func.value, ast.Name) \
+        and node.func.value.id == 're'
+
+
+def _is_static(node):
+    '''Literal pattern or flags, ex: r'^Name: +(?P<intf>\\S+)$', re.I'''
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, (str, int))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add,
+                                                            ast.BitOr)):
+        return _is_static(node.left) and _is_static(node.right)
+    if isinstance(node, ast.Attribute):
+        return isinstance(node.value, ast.Name) and node.value.id == 're'
+    return False
+
+
+def _walk(node, in_loop=False):
+    '''Yield (node, in_loop) for the nodes of a function body, without
+       entering nested functions and classes'''
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, SCOPES):
+            continue
+        yield child, in_loop
+        yield from _walk(child, in_loop or isinstance(child, LOOPS))
+
+
+def find_compiles_in_loops(path):
+    '''Return the re.compile() calls made inside loops of a python file
+
+    Args:
+        path (`str`): python file to check
+
+    Returns:
+        list: (line, function, static) tuples
+    '''
+    tree = ast.parse(pathlib.Path(path).read_text())
+    found = []
+    for function in ast.walk(tree):
+        if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for node, in_loop in _walk(function):
+            if in_loop and _is_re_compile(node):
+                static = all(_is_static(arg) for arg in node.args) and \
+                    all(_is_static(kw.value) for kw in node.keywords)
+                found.append((node.lineno, function.name, static))
+    return sorted(found)
+
+
+def iter_parser_files(paths):
+    for path in paths:
+        path = pathlib.Path(path)
+        if path.is_file():
+            yield path
+            continue
+        for item in sorted(path.rglob('*.py')):
+            if not any(part in IGNORE_DIR for part in item.parts):
+                yield item
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('paths', nargs='+',
+                           help='Parser files or directories to check')
+    argparser.add_argument('--all', action='store_true',
+                           help='Also report the dynamic patterns')
+    argparser.add_argument('--baseline',
+                           help='Json file of the accepted static counts '
+                                'per file')
+    argparser.add_argument('--write-baseline', action='store_true',
+                           help='Write the current counts to --baseline')
+    args = argparser.parse_args()
+
+    baseline = {}
+    if args.baseline and not args.write_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    static_count = dynamic_count = 0
+    counts = {}
+    failed = []
+    for path in iter_parser_files(args.paths):
+        for line, function, static in find_compiles_in_loops(path):
+            if static:
+                static_count += 1
+                counts[path.as_posix()] = counts.get(path.as_posix(), 0) + 1
+            else:
+                dynamic_count += 1
+                if not args.all:
+                    continue
+            print('{}:{}: re.compile() in loop of {}() ({})'.format(
+                path, line, function, 'static' if static else 'dynamic'))
+
+    print('{} static, {} dynamic re.compile() inside loops'.format(
+        static_count, dynamic_count))
+
+    if args.write_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(counts, f, indent=4, sort_keys=True)
+            f.write('\n')
+        return 0
+
+    if not args.baseline:
+        return 1 if static_count else 0
+
+    for path, count in sorted(counts.items()):
+        if count > baseline.get(path, 0):
+            failed.append(path)
+            print('{}: {} static re.compile() inside loops, {} allowed by '
+                  'the baseline'.format(path, count, baseline.get(path, 0)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())